@@ -26,17 +26,24 @@ bl_info = {
 import bpy
 import re
 import math
+import hashlib
+import numpy as np
 from bpy.types import Camera, Context
-from .action_utils import action_to_python_data_text, python_data_to_loop_action, action_frame_range
-from .shake_data import SHAKE_LIST
+from .action_utils import action_to_python_data_text, python_data_to_loop_action, action_frame_range, ActionCache, ActionSampler, sample_fcurve, write_fcurve_samples
+from . import shake_bake
+from .shake_noise import NOISE_FPS, NOISE_OCTAVES_MAX, noise_shake_clip
+from .shake_spectrum import analyze_clip, resample_clip, synthesize_clip
+from .shake_export import EXPORT_FORMATS, export_shake
+from .shake_index import SORT_KEYS, ShakeIndex
+from .shake_preview import PreviewCache
+from .shake_rig_index import SHAKE_CAMERA_PROP, SHAKE_POOL_KEY_PROP, SHAKE_POOL_USERS_PROP, SHAKE_SLOT_PROP, SHAKE_UID_PROP, ShakeRigIndex
+from . import shake_metrics
+from .shake_metrics import count, timed_function
+from .shake_library import MANIFEST_NAME, ShakeCache, ShakeClip, ShakeLibraryError, ShakeStore, read_shake_list_sources
 import bpy.utils.previews
 import os
 from bpy_extras.io_utils import ImportHelper, ExportHelper
-import pprint
-import ast
 from bpy.app.handlers import persistent
-import importlib.util
-import webbrowser
 
 BASE_NAME = "CameraShakifyRework.v2"
 COLLECTION_NAME = BASE_NAME
@@ -49,6 +56,236 @@ SCALE_MAX = 100.0
 # The maximum supported world unit scale.
 UNIT_SCALE_MAX = 1000.0
 
+# NLA rig mode: frames before the scene's start and after its end that
+# shake strips cover, the most repeats Blender allows on a strip, and the
+# slowest speed that's still played by a strip.
+NLA_PADDING = 1000
+NLA_REPEAT_MAX = 1000
+NLA_SPEED_MIN = 0.001
+
+# The shake library that ships with the addon, and its prebuilt index,
+# see shake_index.py.
+SHAKE_LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shake_data.shklib")
+SHAKE_LIBRARY_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shake_data.index.json")
+
+# Default memory budget of the decoded shake cache, in megabytes.
+SHAKE_CACHE_SIZE_DEFAULT = 64
+
+# Default memory budget for shake actions that are kept around unused for
+# reuse, in megabytes.
+SHAKE_ACTION_CACHE_SIZE_DEFAULT = 16
+
+# Default largest error of reduced shake keys, in scene units and radians,
+# see shake_reduce.py.
+SHAKE_LOCATION_TOLERANCE_DEFAULT = 0.0005
+SHAKE_ROTATION_TOLERANCE_DEFAULT = math.radians(0.05)
+
+
+#========================================================
+
+# The shake store is opened in register(), which only reads its
+# manifest.  Channel data is loaded on first use by get_shake_clip()
+# and kept in an LRU cache.  The store is seeded with the bundled library
+# and holds the shakes the user adds.  It's kept in the extension's user
+# directory, not the addon's own, so it survives updates of the addon.
+SHAKE_STORE_PATH = None
+SHAKE_LIBRARY = None
+SHAKE_CACHE = ShakeCache(SHAKE_CACHE_SIZE_DEFAULT * 2**20, lambda clip: clip.nbytes)
+
+# Statistics of the library's shakes for searching and sorting, updated
+# whenever the library changes, see shake_index.py.
+SHAKE_INDEX = None
+
+# Filters that derive variants of a shake's clip for its loop action, by
+# the name of the ensure_shake_action() parameter that selects them.  Each
+# is called as filter(clip, value) and returns a new ShakeClip.
+SHAKE_CLIP_FILTERS = {}
+
+# Items of the CameraShakeInstance.shake_type enum.  Blender requires
+# a reference to dynamic enum items to be kept around on the Python side.
+_shake_type_items = []
+
+# The procedural shake type, generated from the shake item's noise_*
+# settings rather than stored in the library.  Its enum value is fixed
+# well above the library's, so it doesn't shift when shakes are added.
+NOISE_SHAKE_TYPE = "PROCEDURAL_NOISE"
+NOISE_SHAKE_TYPE_ITEM = (NOISE_SHAKE_TYPE, "Procedural Noise", "Seamlessly looping fractal noise, generated from the settings below", 100000)
+
+
+@timed_function()
+def load_shake_library():
+    global SHAKE_STORE_PATH, SHAKE_LIBRARY, SHAKE_INDEX
+    if SHAKE_LIBRARY is not None:
+        SHAKE_LIBRARY.close()
+    SHAKE_STORE_PATH = os.path.join(bpy.utils.extension_path_user(__package__, create=True), "shake_store")
+    index_path = os.path.join(SHAKE_STORE_PATH, "index.json")
+    if os.path.isfile(os.path.join(SHAKE_STORE_PATH, MANIFEST_NAME)):
+        SHAKE_LIBRARY = ShakeStore(SHAKE_STORE_PATH)
+        SHAKE_INDEX = ShakeIndex(index_path)
+    else:
+        SHAKE_LIBRARY = ShakeStore.create(SHAKE_STORE_PATH, SHAKE_LIBRARY_PATH)
+        SHAKE_INDEX = ShakeIndex(index_path)
+        SHAKE_INDEX.seed(SHAKE_LIBRARY_INDEX_PATH, SHAKE_LIBRARY, SHAKE_LIBRARY.payload_name)
+    shake_library_changed()
+
+
+# Drops what was derived from the library's shakes, after it changed.
+def shake_library_changed():
+    global _shake_type_items
+    SHAKE_CACHE.clear()
+    _shake_spectra.clear()
+    _shake_type_items = [
+        (id, SHAKE_LIBRARY.info(id).name, "", i)
+        for i, id in enumerate(SHAKE_LIBRARY.keys())
+    ] + [NOISE_SHAKE_TYPE_ITEM]
+    SHAKE_INDEX.update(SHAKE_LIBRARY, SHAKE_LIBRARY.payload_name)
+
+
+def unload_shake_library():
+    global SHAKE_LIBRARY
+    SHAKE_CACHE.clear()
+    if SHAKE_LIBRARY is not None:
+        SHAKE_LIBRARY.close()
+        SHAKE_LIBRARY = None
+
+
+# Adds ShakeClips to the library, replacing shakes with the same ids.
+def add_shakes(clips):
+    try:
+        SHAKE_LIBRARY.add(clips)
+    finally:
+        shake_library_changed()
+
+
+def remove_shakes(shake_ids):
+    try:
+        SHAKE_LIBRARY.remove(shake_ids)
+    finally:
+        shake_library_changed()
+
+
+# Packs the library into one payload file, see ShakeStore.compact().
+def compact_shake_library():
+    try:
+        SHAKE_LIBRARY.compact()
+    finally:
+        shake_library_changed()
+
+
+# Returns a shake from the library as a ShakeClip, loading it on first use.
+def get_shake_clip(shake_id) -> ShakeClip:
+    return SHAKE_CACHE.get(shake_id, SHAKE_LIBRARY.clip)
+
+
+# Searches the shake library without loading any shake, see
+# ShakeIndex.query() for the filters.  Returns a list of ShakeStats.
+def query_shakes(text="", **filters) -> list:
+    return SHAKE_INDEX.query(text, **filters)
+
+
+# Parameters of noise_shake_clip() taken from the shake item, by name.
+NOISE_PARAMS = (
+    "seed", "duration", "frequency", "octaves", "roughness",
+    "location_amplitude", "rotation_amplitude", "location_weights", "rotation_weights",
+)
+
+
+# Spectra of clips that variants were synthesized from, by clip id, fps
+# and length.  Each is only analyzed once.
+_shake_spectra = {}
+
+
+# SHAKE_CLIP_FILTERS entry: replaces a clip with a non-repeating variant of
+# the given (seed, length in seconds), see shake_spectrum.
+def resynthesize_clip(clip, value):
+    seed, seconds = value
+    key = (clip.id, clip.fps, clip.frame_count)
+    if key not in _shake_spectra:
+        _shake_spectra[key] = analyze_clip(clip)
+    frame_count = max(int(round(seconds * clip.fps)), 2)
+    return synthesize_clip(_shake_spectra[key], seed, frame_count, clip.id, clip.name)
+
+
+SHAKE_CLIP_FILTERS["variant"] = resynthesize_clip
+
+# Resamples clips to the scene's frame rate, see shake_item_params().
+SHAKE_CLIP_FILTERS["fps"] = resample_clip
+
+
+# The parameters that select which variant of its shake type's clip a
+# shake item plays, for shake_clip() and ensure_shake_action().  Clips are
+# resampled to the scene's frame rate, so that the loop action has a key
+# on every scene frame and plays back one frame per frame.
+def shake_item_params(shake, context):
+    params = _shake_type_params(shake)
+    scene_fps = context.scene.render.fps / context.scene.render.fps_base
+    if not math.isclose(scene_fps, shake_clip_fps(shake.shake_type, params), rel_tol=1e-6):
+        params["fps"] = scene_fps
+    return params
+
+
+def _shake_type_params(shake):
+    if shake.shake_type != NOISE_SHAKE_TYPE:
+        if shake.use_variant:
+            return {"variant": (shake.variant_seed, shake.variant_length)}
+        return {}
+    return {
+        "seed": shake.noise_seed,
+        "duration": shake.noise_duration,
+        "frequency": shake.noise_frequency,
+        "octaves": shake.noise_octaves,
+        "roughness": shake.noise_roughness,
+        "location_amplitude": shake.noise_location_amplitude,
+        "rotation_amplitude": shake.noise_rotation_amplitude,
+        "location_weights": tuple(shake.noise_location_weights),
+        "rotation_weights": tuple(shake.noise_rotation_weights),
+    }
+
+
+# Returns the clip of a shake type as selected by `params`: from the
+# library or generated, then run through SHAKE_CLIP_FILTERS.  Derived
+# clips are kept in SHAKE_CACHE along with the library's.
+def shake_clip(shake_type, params) -> ShakeClip:
+    def derive(key):
+        if shake_type == NOISE_SHAKE_TYPE:
+            clip = noise_shake_clip(**{name: params[name] for name in NOISE_PARAMS})
+            filters = [name for name in sorted(params) if name not in NOISE_PARAMS]
+        else:
+            clip = get_shake_clip(shake_type)
+            filters = sorted(params)
+        for name in filters:
+            clip = SHAKE_CLIP_FILTERS[name](clip, params[name])
+        return clip
+
+    if shake_type != NOISE_SHAKE_TYPE and len(params) == 0:
+        return get_shake_clip(shake_type)
+    return SHAKE_CACHE.get(shake_action_key(shake_type, params), derive)
+
+
+# Frame rate of the clip shake_clip() returns, without loading it.
+def shake_clip_fps(shake_type, params):
+    if "fps" in params:
+        return params["fps"]
+    if shake_type == NOISE_SHAKE_TYPE:
+        return NOISE_FPS
+    return SHAKE_LIBRARY.info(shake_type).fps
+
+
+def shake_type_items(self, context):
+    return _shake_type_items
+
+
+def on_shake_cache_size_update(prefs, context):
+    SHAKE_CACHE.set_max_bytes(prefs.shake_cache_size * 2**20)
+
+
+def on_shake_action_cache_size_update(prefs, context):
+    SHAKE_ACTION_CACHE.set_max_bytes(prefs.shake_action_cache_size * 2**20)
+
+
+def on_shake_key_tolerance_update(prefs, context):
+    set_shake_key_tolerances(prefs)
+
 
 #========================================================
 
@@ -71,7 +308,14 @@ class CameraShakifyPanel(bpy.types.Panel):
 
         camera = context.active_object
 
+        if camera.camera_shakes_baked:
+            box = layout.box()
+            row = box.row()
+            row.label(text="Shakes are baked to keyframes", icon='KEYTYPE_KEYFRAME_VEC')
+            row.operator("object.camera_shakes_unbake", text="Unbake")
+
         row = layout.row()
+        row.enabled = not camera.camera_shakes_baked
         row.template_list(
             listtype_name="OBJECT_UL_camera_shake_items",
             list_id="Camera Shakes",
@@ -85,6 +329,9 @@ class CameraShakifyPanel(bpy.types.Panel):
         col.operator("object.camera_shake_remove", text="", icon='REMOVE')
         col.operator("object.camera_shake_move", text="", icon='TRIA_UP').type = 'UP'
         col.operator("object.camera_shake_move", text="", icon='TRIA_DOWN').type = 'DOWN'
+        row = layout.row()
+        row.enabled = not camera.camera_shakes_baked
+        row.prop(camera, "camera_shakes_rig_mode", expand=True)
         if camera.camera_shakes_active_index < len(camera.camera_shakes):
             shake = camera.camera_shakes[camera.camera_shakes_active_index]
             row = layout.row()
@@ -102,6 +349,21 @@ class CameraShakifyPanel(bpy.types.Panel):
             col.alignment = 'RIGHT'
             col.use_property_split = True
             col.prop(shake, "shake_type", text="Shake")
+            if shake.shake_type == NOISE_SHAKE_TYPE:
+                col.prop(shake, "noise_seed")
+                col.prop(shake, "noise_duration")
+                col.prop(shake, "noise_frequency")
+                col.prop(shake, "noise_octaves")
+                col.prop(shake, "noise_roughness", slider=True)
+                col.prop(shake, "noise_location_amplitude")
+                col.prop(shake, "noise_location_weights")
+                col.prop(shake, "noise_rotation_amplitude")
+                col.prop(shake, "noise_rotation_weights")
+            else:
+                col.prop(shake, "use_variant")
+                if shake.use_variant:
+                    col.prop(shake, "variant_seed")
+                    col.prop(shake, "variant_length")
             col.separator()
             col.prop(shake, "influence", slider=True)
             col.separator()
@@ -128,6 +390,38 @@ class CameraShakifyPanel(bpy.types.Panel):
         col = layout.column()
         if wm.camera_shake_show_utils:
             col.operator("object.camera_shakes_fix_global")
+            col.operator("object.camera_shakes_bake")
+            col.separator()
+            col.prop(wm, "camera_shake_metrics_enabled")
+            if wm.camera_shake_metrics_enabled:
+                draw_shake_metrics(col.box())
+
+
+# Lists the recorded timings and counters, see shake_metrics.py.
+def draw_shake_metrics(layout):
+    metrics = shake_metrics.snapshot()
+    if len(metrics["timers"]) == 0 and len(metrics["counters"]) == 0:
+        layout.label(text="Nothing recorded yet")
+    else:
+        col = layout.column(align=True)
+        for name, timer in metrics["timers"].items():
+            row = col.row()
+            row.label(text=name)
+            row.label(text="{}x".format(timer["calls"]))
+            row.label(text="{:.1f} ms".format(timer["seconds"] * 1000.0))
+            row.label(text="max {:.1f} ms".format(timer["max_seconds"] * 1000.0))
+        col.separator()
+        for name, value in metrics["counters"].items():
+            row = col.row()
+            row.label(text=name)
+            row.label(text="{:,}".format(value))
+    row = layout.row(align=True)
+    row.operator("object.camera_shake_metrics_reset", icon='X')
+    row.operator("object.camera_shake_metrics_export", icon='EXPORT')
+
+
+def on_shake_metrics_enabled_update(wm, context):
+    shake_metrics.set_enabled(wm.camera_shake_metrics_enabled)
 
 
 class OBJECT_UL_camera_shake_items(bpy.types.UIList):
@@ -152,82 +446,237 @@ class OBJECT_UL_camera_shake_items(bpy.types.UIList):
 
 #========================================================
 
-# Creates a camera shake setup for the given camera and
-# shake item index, using the given collection to store
-# shake empties.
-def build_single_shake(camera, shake_item_index, collection, context):
-    shake = camera.camera_shakes[shake_item_index]
-    shake_data = SHAKE_LIST[shake.shake_type]
+_SHAKE_INDEX_PATTERN = re.compile(r"^camera_shakes\[[0-9]+\]")
 
-    action_name = BASE_NAME + "_" + shake.shake_type.lower()
-    shake_object_name = BASE_NAME + "_" + camera.name + "_" + str(shake_item_index)
+# Shake empties by camera and pool key, see shake_rig_index.py.
+SHAKE_RIG_INDEX = ShakeRigIndex(lambda: bpy.data, BASE_NAME)
 
-    # Ensure the needed action exists, and fetch it.
-    action = None
-    if action_name in bpy.data.actions:
-        action = bpy.data.actions[action_name]
-    else:
-        action = python_data_to_loop_action(
-            shake_data[2],
+
+def shake_object_name(camera, shake_item_index):
+    return BASE_NAME + "_" + camera.name + "_" + str(shake_item_index)
+
+
+def pooled_shake_object_name(pool_key):
+    return BASE_NAME + "_pool_" + hashlib.sha1(pool_key.encode("utf-8")).hexdigest()[:12]
+
+
+def shake_constraint_names(shake_item_index):
+    return (
+        BASE_NAME + "_loc_" + str(shake_item_index),
+        BASE_NAME + "_rot_" + str(shake_item_index),
+    )
+
+
+# Custom property on shake actions holding their SHAKE_ACTION_CACHE key.
+SHAKE_ACTION_KEY_PROP = "camera_shakify_action_key"
+
+# Loop actions of shakes and their variants, shared by every shake rig
+# that needs them.  Keyed by shake type and derivation parameters, so
+# rigs reuse variants instead of regenerating them.
+SHAKE_ACTION_CACHE = ActionCache(SHAKE_ACTION_CACHE_SIZE_DEFAULT * 2**20, SHAKE_ACTION_KEY_PROP)
+_shake_actions_adopted = False
+
+
+# (location, rotation) tolerances shake actions are reduced with, set from
+# the addon preferences.  Changing them only affects actions built
+# afterwards, like after Fix All Camera Shakes.
+SHAKE_KEY_TOLERANCES = (SHAKE_LOCATION_TOLERANCE_DEFAULT, SHAKE_ROTATION_TOLERANCE_DEFAULT)
+
+
+def set_shake_key_tolerances(prefs):
+    global SHAKE_KEY_TOLERANCES
+    SHAKE_KEY_TOLERANCES = (prefs.shake_location_tolerance, prefs.shake_rotation_tolerance)
+
+
+# The tolerances are part of the key, so actions reduced with other
+# tolerances aren't reused for new rigs.
+def shake_action_key(shake_type, params):
+    key = shake_type + "".join("|{}={!r}".format(name, params[name]) for name in sorted(params))
+    if any(SHAKE_KEY_TOLERANCES):
+        key += "|keys={!r}".format(SHAKE_KEY_TOLERANCES)
+    return key
+
+
+# Variants get the plain action's name with a hash of their key appended.
+def shake_action_name(shake_type, params):
+    name = BASE_NAME + "_" + shake_type.lower()
+    if len(params) == 0 and not any(SHAKE_KEY_TOLERANCES):
+        return name
+    return name + "_" + hashlib.sha1(shake_action_key(shake_type, params).encode("utf-8")).hexdigest()[:8]
+
+
+# Makes SHAKE_ACTION_CACHE track the shake actions already in the file,
+# so the ones that go unused are evicted like any other.  Done once per
+# session, instead of scanning bpy.data.actions on every rebuild.
+def adopt_shake_actions():
+    global _shake_actions_adopted
+    if _shake_actions_adopted:
+        return
+    for action in bpy.data.actions:
+        if action.name.startswith(BASE_NAME):
+            SHAKE_ACTION_CACHE.adopt(action, action.get(SHAKE_ACTION_KEY_PROP, action.name))
+    _shake_actions_adopted = True
+
+
+# Forgets every shake action reference, which don't survive loading a
+# file, undo or redo.
+def reset_shake_actions():
+    global _shake_actions_adopted
+    SHAKE_ACTION_CACHE.clear()
+    _shake_actions_adopted = False
+
+
+# Ensures the loop action for the given shake type exists, and fetches it.
+# Keyword arguments select a variant, see shake_clip().
+def ensure_shake_action(shake_type, **params):
+    adopt_shake_actions()
+
+    def build(action_name):
+        return python_data_to_loop_action(
+            shake_clip(shake_type, params),
             action_name,
             INFLUENCE_MAX,
-            INFLUENCE_MAX * SCALE_MAX * UNIT_SCALE_MAX
+            INFLUENCE_MAX * SCALE_MAX * UNIT_SCALE_MAX,
+            *SHAKE_KEY_TOLERANCES
         )
 
-    # Ensure the needed shake object exists, fetch it.
-    shake_object = None
-    if shake_object_name in bpy.data.objects:
-        shake_object = bpy.data.objects[shake_object_name]
-    else:
-        shake_object = bpy.data.objects.new(shake_object_name, None)
-
-    # Make sure the shake object is linked into our collection.
-    if shake_object.name not in collection.objects:
-        collection.objects.link(shake_object)
-
-    #----------------
-    # Set up the constraints and drivers on the shake object.
-    #----------------
+    return SHAKE_ACTION_CACHE.get(
+        shake_action_key(shake_type, params),
+        shake_action_name(shake_type, params),
+        build,
+        legacy_key=shake_type,
+    )
 
-    # Clear out all constraints and drivers, and fetch animation data block.
-    shake_object.constraints.clear()
-    shake_object.animation_data_clear()
-    anim_data = shake_object.animation_data_create()
 
-    # Some weird gymnastics needed because of a Blender bug.
-    # Without first assigning an action to the animation data,
-    # then on a fresh scene we won't be able to assign an action
-    # to the action constraint (below).
-    anim_data.action = action
-    shake_object.location = (0,0,0)
-    shake_object.rotation_euler = (0,0,0)
-    shake_object.rotation_quaternion = (0,0,0,0)
-    shake_object.rotation_axis_angle = (0,0,0,0)
-    shake_object.scale = (1,1,1)
+# Returns the driver F-Curve on `id` for the given data path, if any.
+def find_driver(id, data_path):
+    if id.animation_data is None:
+        return None
+    return id.animation_data.drivers.find(data_path)
+
+
+# Gives every shake item on the camera a uid that's unique on that
+# camera.  Items from older files, and items copied by duplicating the
+# list, have no or clashing uids.
+def ensure_shake_uids(camera):
+    used = set()
+    next_uid = max([shake.uid for shake in camera.camera_shakes], default=0) + 1
+    for shake in camera.camera_shakes:
+        if shake.uid <= 0 or shake.uid in used:
+            shake.uid = next_uid
+            next_uid += 1
+        used.add(shake.uid)
+
+
+# Whether a property of a shake item is animated or driven on its camera.
+def is_shake_prop_animated(camera, shake_item_index, prop_name):
+    anim = camera.animation_data
+    if anim is None:
+        return False
+    data_path = "camera_shakes[{}].{}".format(shake_item_index, prop_name)
+    if anim.action is not None and anim.action.fcurves.find(data_path) is not None:
+        return True
+    return anim.drivers.find(data_path) is not None
+
+
+# Whether a shake's timing is played by an NLA strip on its shake object
+# rather than by a driver on an Action constraint.  Only plain speed and
+# offset timing can be expressed as a strip, so manual timing, a stopped
+# or reversed shake and animated timing fall back to the driver, as do
+# loops too short for a strip of NLA_REPEAT_MAX repeats to cover the
+# scene.
+def uses_nla_timing(camera, shake_item_index, context):
+    if camera.camera_shakes_rig_mode != 'NLA':
+        return False
+    shake = camera.camera_shakes[shake_item_index]
+    if shake.use_manual_timing or shake.speed < NLA_SPEED_MIN:
+        return False
+    if is_shake_prop_animated(camera, shake_item_index, "use_manual_timing") \
+            or is_shake_prop_animated(camera, shake_item_index, "speed") \
+            or is_shake_prop_animated(camera, shake_item_index, "offset"):
+        return False
+    _, repeat = shake_strip_span(shake_loop_period(shake, context), shake.offset, context.scene)
+    return repeat <= NLA_REPEAT_MAX
+
+
+# The length of a shake's loop, in scene frames.
+def shake_loop_period(shake, context):
+    params = shake_item_params(shake, context)
+    action_range = action_frame_range(ensure_shake_action(shake.shake_type, **params))
+    scene_fps = context.scene.render.fps / context.scene.render.fps_base
+    rate = shake.speed * shake_clip_fps(shake.shake_type, params) / scene_fps
+    return (math.ceil(action_range[1]) - math.floor(action_range[0])) / rate
+
+
+# Where a strip looping every `period` scene frames, and at the start of
+# its loop at frame `offset`, starts, and how many repeats it needs to
+# cover the scene's frame range plus NLA_PADDING frames on either side.
+def shake_strip_span(period, offset, scene):
+    cover_start = scene.frame_start - NLA_PADDING
+    cover_end = scene.frame_end + NLA_PADDING
+    start = offset - math.ceil((offset - cover_start) / period) * period
+    return start, max(math.ceil((cover_end - start) / period), 1)
+
+
+# Whether the influences of a shake's camera constraints are plain values
+# rather than drivers.  Animated influence, scale or unit scale fall back
+# to the drivers.
+def uses_static_influence(camera, shake_item_index, context):
+    if camera.camera_shakes_rig_mode != 'NLA':
+        return False
+    if is_shake_prop_animated(camera, shake_item_index, "influence") \
+            or is_shake_prop_animated(camera, shake_item_index, "scale"):
+        return False
+    return not is_unit_scale_animated(context.scene)
+
+
+# Whether the scene's unit scale is animated or driven.
+def is_unit_scale_animated(scene):
+    anim = scene.animation_data
+    if anim is None:
+        return False
+    if anim.action is not None and anim.action.fcurves.find("unit_settings.scale_length") is not None:
+        return True
+    return anim.drivers.find("unit_settings.scale_length") is not None
+
+
+# The key under which a shake's empty is pooled, or None if the shake
+# needs an empty of its own.  Shakes whose timing only depends on their
+# type, speed and offset (and the scene's frame rate) play identically,
+# so they can all share one empty.  Manual or animated timing reads the
+# shake item's own properties, so those shakes aren't pooled.
+def shake_pool_key(camera, shake_item_index, context):
+    shake = camera.camera_shakes[shake_item_index]
+    if shake.use_manual_timing \
+            or is_shake_prop_animated(camera, shake_item_index, "use_manual_timing") \
+            or is_shake_prop_animated(camera, shake_item_index, "speed") \
+            or is_shake_prop_animated(camera, shake_item_index, "offset"):
+        return None
+    timing = 'NLA' if uses_nla_timing(camera, shake_item_index, context) else 'DRIVER'
+    fps = context.scene.render.fps / context.scene.render.fps_base
+    return "{}|{!r}|{!r}|{}|{!r}".format(
+        shake_action_key(shake.shake_type, shake_item_params(shake, context)), shake.speed, shake.offset, timing, fps
+    )
 
-    # Get action info for calculations below.
-    action_fps = shake_data[1]
-    action_range = action_frame_range(action)
-    action_length = action_range[1] - action_range[0]
 
-    # Create the action constraint.
+# Creates the Action constraint on a shake object, with the driver on
+# its eval time.  The driver's expression and the constraint's action
+# are filled in by set_shake_object_timing().  Without a camera the
+# driver has no variables, as on pooled shake objects whose speed and
+# offset are baked into the expression.
+def add_eval_time_constraint(shake_object, camera=None, shake_item_index=None):
     constraint = shake_object.constraints.new('ACTION')
     try:
         constraint.use_eval_time = True
     except AttributeError as exc:
         raise Exception("Camera Shakify addon requires a minimum Blender version of 2.91") from exc
     constraint.mix_mode = 'BEFORE'
-    constraint.action = action
-    constraint.frame_start = math.floor(action_range[0])
-    constraint.frame_end = math.ceil(action_range[1])
 
-    # Create the driver for the constraint's eval time.
     driver = constraint.driver_add("eval_time").driver
+    count("drivers_added")
     driver.type = 'SCRIPTED'
-    fps_factor = 1.0 / ((context.scene.render.fps / context.scene.render.fps_base) / action_fps)
-    driver.expression = \
-        "((time if manual else ((-frame_offset + frame) * speed)) * {}) % 1.0" \
-        .format(fps_factor / action_length)
+    if camera is None:
+        return constraint
 
     manual_timing_var = driver.variables.new()
     manual_timing_var.name = "manual"
@@ -256,36 +705,116 @@ def build_single_shake(camera, shake_item_index, collection, context):
     offset_var.targets[0].id_type = 'OBJECT'
     offset_var.targets[0].id = camera
     offset_var.targets[0].data_path = 'camera_shakes[{}].offset'.format(shake_item_index)
+    return constraint
+
+
+# Plays `action` on the shake object with a single repeating NLA strip,
+# so that it's at the same point of its loop on every frame as the
+# eval_time driver would put it.  `rate` is how many action frames
+# pass per scene frame.  The strip covers the scene's frame range plus
+# NLA_PADDING frames on either side, see shake_strip_span();
+# uses_nla_timing() makes sure that takes at most NLA_REPEAT_MAX repeats.
+def set_shake_strip(shake_object, action, frame_start, frame_end, rate, offset, scene):
+    start, repeat = shake_strip_span((frame_end - frame_start) / rate, offset, scene)
+    repeat = float(repeat)
+    scale = 1.0 / rate
+
+    tracks = shake_object.animation_data.nla_tracks
+    track = tracks.get(BASE_NAME)
+    if track is None:
+        track = tracks.new()
+        track.name = BASE_NAME
+    if len(track.strips) == 1:
+        strip = track.strips[0]
+        if strip.action == action \
+                and math.isclose(strip.scale, scale, rel_tol=1e-6) \
+                and strip.repeat == repeat \
+                and math.isclose(strip.frame_start, start, abs_tol=1e-3):
+            return
+    for strip in list(track.strips):
+        track.strips.remove(strip)
+
+    strip = track.strips.new(BASE_NAME, math.floor(start), action)
+    strip.action_frame_start = frame_start
+    strip.action_frame_end = frame_end
+    strip.scale = scale
+    strip.repeat = repeat
+    strip.frame_start_ui = start
+    strip.extrapolation = 'HOLD'
+    strip.blend_type = 'REPLACE'
+
+
+# Sets up how a shake object plays the action of `shake_type` (the
+# variant selected by `action_params`, see shake_clip()): with a
+# driven Action constraint, or with an NLA strip when `use_nla` is set.
+# The driver reads its timing from shake item `shake_item_index` of
+# `camera`, or, without a camera, uses the given speed and offset as
+# constants.  Switches between strip and driver as needed, and otherwise
+# only touches what actually differs, so calling it on an up-to-date
+# shake object is cheap.
+@timed_function("build_shake_object")
+def set_shake_object_timing(shake_object, shake_type, context, camera=None, shake_item_index=None, speed=1.0, offset=0.0, use_nla=False, action_params=None):
+    if action_params is None:
+        action_params = {}
+    action = ensure_shake_action(shake_type, **action_params)
+    anim_data = shake_object.animation_data_create()
 
-    #----------------
-    # Set up the constraints and drivers on the camera object.
-    #----------------
-
-    loc_constraint_name = BASE_NAME + "_loc_" + str(shake_item_index)
-    rot_constraint_name = BASE_NAME + "_rot_" + str(shake_item_index)
-
-    # Create the new constraints.
-    loc_constraint = camera.constraints.new(type='COPY_LOCATION')
-    rot_constraint = camera.constraints.new(type='COPY_ROTATION')
-    loc_constraint.name = loc_constraint_name
-    rot_constraint.name = rot_constraint_name
-    loc_constraint.show_expanded = False
-    rot_constraint.show_expanded = False
+    # Get action info for calculations below.
+    action_fps = shake_clip_fps(shake_type, action_params)
+    action_range = action_frame_range(action)
+    action_length = action_range[1] - action_range[0]
+    fps_factor = 1.0 / ((context.scene.render.fps / context.scene.render.fps_base) / action_fps)
 
-    # Set up location constraint.
-    loc_constraint.target = shake_object
-    loc_constraint.target_space = 'WORLD'
-    loc_constraint.owner_space = 'LOCAL'
-    loc_constraint.use_offset = True
+    if use_nla:
+        if len(shake_object.constraints) > 0:
+            shake_object.constraints[0].driver_remove("eval_time")
+            shake_object.constraints.clear()
+        if anim_data.action is not None:
+            anim_data.action = None
+        set_shake_strip(
+            shake_object, action,
+            math.floor(action_range[0]), math.ceil(action_range[1]),
+            speed * fps_factor, offset, context.scene,
+        )
+        return
+
+    track = anim_data.nla_tracks.get(BASE_NAME)
+    if track is not None:
+        anim_data.nla_tracks.remove(track)
+    if len(shake_object.constraints) == 0:
+        add_eval_time_constraint(shake_object, camera, shake_item_index)
+    constraint = shake_object.constraints[0]
+
+    if constraint.action != action:
+        # Some weird gymnastics needed because of a Blender bug.
+        # Without first assigning an action to the animation data,
+        # then on a fresh scene we won't be able to assign an action
+        # to the action constraint (below).
+        anim_data.action = action
+        constraint.action = action
+
+    if constraint.frame_start != math.floor(action_range[0]):
+        constraint.frame_start = math.floor(action_range[0])
+    if constraint.frame_end != math.ceil(action_range[1]):
+        constraint.frame_end = math.ceil(action_range[1])
+
+    driver = find_driver(shake_object, constraint.path_from_id("eval_time")).driver
+    if camera is not None:
+        expression = \
+            "((time if manual else ((-frame_offset + frame) * speed)) * {}) % 1.0" \
+            .format(fps_factor / action_length)
+    else:
+        expression = "((frame - {!r}) * {!r}) % 1.0".format(offset, speed * fps_factor / action_length)
+    if driver.expression != expression:
+        driver.expression = expression
 
-    # Set up rotation constraint.
-    rot_constraint.target = shake_object
-    rot_constraint.target_space = 'WORLD'
-    rot_constraint.owner_space = 'LOCAL'
-    rot_constraint.mix_mode = 'AFTER'
 
+# Creates the drivers on the influences of a shake's camera constraints,
+# or completes them if they're already there.
+def add_influence_drivers(camera, loc_constraint, rot_constraint, shake_item_index, context):
     # Set up the location constraint driver.
     driver = loc_constraint.driver_add("influence").driver
+    count("drivers_added")
     driver.type = 'SCRIPTED'
     driver.expression = "{} * influence * location_scale / unit_scale".format(1.0 / (UNIT_SCALE_MAX * INFLUENCE_MAX * SCALE_MAX))
     if "influence" not in driver.variables:
@@ -312,6 +841,7 @@ def build_single_shake(camera, shake_item_index, collection, context):
 
     # Set up the rotation constraint driver.
     driver = rot_constraint.driver_add("influence").driver
+    count("drivers_added")
     driver.type = 'SCRIPTED'
     driver.expression = "influence * {}".format(1.0 / INFLUENCE_MAX)
     if "influence" not in driver.variables:
@@ -323,113 +853,748 @@ def build_single_shake(camera, shake_item_index, collection, context):
         var.targets[0].data_path = 'camera_shakes[{}].influence'.format(shake_item_index)
 
 
-# The main function that actually does the real work of this addon.
-# It's called whenever anything relevant in the shake list on a
-# camera is changed, and just tears down and completely rebuilds
-# the camera-shake setup for it.
-def rebuild_camera_shakes(camera, context):
-    # Ensure that our camera shakify collection exists and fetch it.
-    collection = None
+# The values the influence drivers of a shake's camera constraints would
+# have, as (location influence, rotation influence).
+def static_shake_influences(shake, context):
+    unit_scale = context.scene.unit_settings.scale_length
+    loc_influence = shake.influence * shake.scale / (UNIT_SCALE_MAX * INFLUENCE_MAX * SCALE_MAX * unit_scale)
+    rot_influence = shake.influence / INFLUENCE_MAX
+    return min(max(loc_influence, 0.0), 1.0), min(max(rot_influence, 0.0), 1.0)
+
+
+# Sets up the influences of a shake's camera constraints: driven by the
+# shake item's influence and scale, or in NLA rig mode set to plain
+# values where possible (see uses_static_influence()).
+def set_shake_influence(camera, loc_constraint, rot_constraint, shake_item_index, context):
+    loc_driver = find_driver(camera, loc_constraint.path_from_id("influence"))
+    rot_driver = find_driver(camera, rot_constraint.path_from_id("influence"))
+    if not uses_static_influence(camera, shake_item_index, context):
+        if loc_driver is None or rot_driver is None:
+            add_influence_drivers(camera, loc_constraint, rot_constraint, shake_item_index, context)
+        return
+
+    if loc_driver is not None:
+        loc_constraint.driver_remove("influence")
+    if rot_driver is not None:
+        rot_constraint.driver_remove("influence")
+    loc_influence, rot_influence = static_shake_influences(camera.camera_shakes[shake_item_index], context)
+    # Influences are stored as single precision floats.
+    if not math.isclose(loc_constraint.influence, loc_influence, rel_tol=1e-6):
+        loc_constraint.influence = loc_influence
+    if not math.isclose(rot_constraint.influence, rot_influence, rel_tol=1e-6):
+        rot_constraint.influence = rot_influence
+
+
+# Points every `camera_shakes[i]` variable of a driver at the given index.
+def retarget_driver(driver, shake_item_index):
+    prefix = "camera_shakes[{}]".format(shake_item_index)
+    for var in driver.variables:
+        for target in var.targets:
+            data_path = _SHAKE_INDEX_PATTERN.sub(prefix, target.data_path)
+            if data_path != target.data_path:
+                target.data_path = data_path
+
+
+# Moves the empty of a camera shake to a new index in the shake list:
+# renames it and retargets its driver.
+def reindex_shake_object(camera, shake_object, shake_item_index):
+    shake_object.name = shake_object_name(camera, shake_item_index)
+    shake_object[SHAKE_SLOT_PROP] = shake_item_index
+    if len(shake_object.constraints) > 0:
+        driver = find_driver(shake_object, shake_object.constraints[0].path_from_id("eval_time"))
+        if driver is not None:
+            retarget_driver(driver.driver, shake_item_index)
+
+
+# Moves the camera constraints of a camera shake to a new index in the
+# shake list: renames them and retargets their drivers.
+def reindex_camera_constraints(camera, loc_constraint, rot_constraint, shake_item_index):
+    loc_constraint.name, rot_constraint.name = shake_constraint_names(shake_item_index)
+    for constraint in (loc_constraint, rot_constraint):
+        driver = find_driver(camera, constraint.path_from_id("influence"))
+        if driver is not None:
+            retarget_driver(driver.driver, shake_item_index)
+
+
+# Whether a shake object still has the driven constraint, or the NLA
+# strip, that set_shake_object_timing() gave it.
+def is_complete_shake_object(obj):
+    if len(obj.constraints) == 0:
+        if obj.animation_data is None:
+            return False
+        track = obj.animation_data.nla_tracks.get(BASE_NAME)
+        return track is not None and len(track.strips) == 1
+    if len(obj.constraints) != 1 or obj.constraints[0].type != 'ACTION':
+        return False
+    return find_driver(obj, obj.constraints[0].path_from_id("eval_time")) is not None
+
+
+# The shake object the camera constraints of a shake item target, if
+# they're complete.
+def shake_item_target(camera, shake_item_index):
+    loc_name, rot_name = shake_constraint_names(shake_item_index)
+    loc_constraint = camera.constraints.get(loc_name)
+    rot_constraint = camera.constraints.get(rot_name)
+    if loc_constraint is None or rot_constraint is None or loc_constraint.target != rot_constraint.target:
+        return None
+    return loc_constraint.target
+
+
+# Whether the rig of a camera's shakes is pooled, and uses drivers,
+# exactly where shake_pool_key(), uses_nla_timing() and
+# uses_static_influence() say it should, its strips cover the scene, and
+# its plain influences are up to date.  This goes stale when a shake
+# property gets keyframed, or the unit scale or frame range changes.
+def is_shake_rig_mode_current(camera, context):
+    if camera.camera_shakes_baked:
+        return True
+    for shake_item_index, shake in enumerate(camera.camera_shakes):
+        shake_object = shake_item_target(camera, shake_item_index)
+        if shake_object is None:
+            return False
+        if shake_object.get(SHAKE_POOL_KEY_PROP) != shake_pool_key(camera, shake_item_index, context):
+            return False
+        use_nla = uses_nla_timing(camera, shake_item_index, context)
+        if (len(shake_object.constraints) == 0) != use_nla:
+            return False
+        if use_nla and not is_shake_strip_current(shake_object, shake, context):
+            return False
+        loc_constraint = camera.constraints.get(shake_constraint_names(shake_item_index)[0])
+        if loc_constraint is None:
+            return False
+        static = uses_static_influence(camera, shake_item_index, context)
+        if (find_driver(camera, loc_constraint.path_from_id("influence")) is None) != static:
+            return False
+        if static and not math.isclose(loc_constraint.influence, static_shake_influences(shake, context)[0], rel_tol=1e-6):
+            return False
+    return True
+
+
+# Whether the NLA strip of a shake object still starts and repeats as
+# set_shake_strip() would set it, which changes with the frame range.
+def is_shake_strip_current(shake_object, shake, context):
+    track = shake_object.animation_data.nla_tracks.get(BASE_NAME) if shake_object.animation_data else None
+    if track is None or len(track.strips) != 1:
+        return False
+    start, repeat = shake_strip_span(shake_loop_period(shake, context), shake.offset, context.scene)
+    strip = track.strips[0]
+    return strip.repeat == float(repeat) and math.isclose(strip.frame_start, start, abs_tol=1e-3)
+
+
+def remove_shake_object(obj):
+    SHAKE_RIG_INDEX.discard(obj)
+    if len(obj.constraints) > 0:
+        obj.constraints[0].driver_remove("eval_time")
+    obj.animation_data_clear()
+    bpy.data.objects.remove(obj)
+
+
+def remove_camera_constraint(camera, constraint):
+    constraint.driver_remove("influence")
+    camera.constraints.remove(constraint)
+
+
+# Ensures that our camera shakify collection exists in the scene and fetches it.
+def ensure_shake_collection(context):
     if BASE_NAME in context.scene.collection.children:
-        collection = context.scene.collection.children[BASE_NAME]
+        return context.scene.collection.children[BASE_NAME]
+
+    if BASE_NAME not in bpy.data.collections:
+        collection = bpy.data.collections.new(BASE_NAME)
+        collection.hide_viewport = True
+        collection.hide_render = True
+        collection.hide_select = True
     else:
-        if BASE_NAME not in bpy.data.collections:
-            collection = bpy.data.collections.new(BASE_NAME)
-            collection.hide_viewport = True
-            collection.hide_render = True
-            collection.hide_select = True
-        else:
-            collection = bpy.data.collections[BASE_NAME]
-        context.scene.collection.children.link(bpy.data.collections[BASE_NAME])
-        for layer in context.scene.view_layers:
-            if collection.name in layer.layer_collection.children:
-                layer.layer_collection.children[collection.name].exclude = True
+        collection = bpy.data.collections[BASE_NAME]
+    context.scene.collection.children.link(bpy.data.collections[BASE_NAME])
+    for layer in context.scene.view_layers:
+        if collection.name in layer.layer_collection.children:
+            layer.layer_collection.children[collection.name].exclude = True
+    return collection
+
+
+# Creates a fresh, empty shake object with the given name in the given
+# collection, or clears out the one that already has that name.
+def new_shake_object(name, collection):
+    # Ensure the needed shake object exists, fetch it.
+    shake_object = None
+    if name in bpy.data.objects:
+        shake_object = bpy.data.objects[name]
+    else:
+        shake_object = bpy.data.objects.new(name, None)
+        count("empties_created")
+
+    # Make sure the shake object is linked into our collection.
+    if shake_object.name not in collection.objects:
+        collection.objects.link(shake_object)
+
+    # Clear out all constraints and drivers, and fetch animation data block.
+    shake_object.constraints.clear()
+    shake_object.animation_data_clear()
+    shake_object.animation_data_create()
+
+    shake_object.location = (0,0,0)
+    shake_object.rotation_euler = (0,0,0)
+    shake_object.rotation_quaternion = (0,0,0,0)
+    shake_object.rotation_axis_angle = (0,0,0,0)
+    shake_object.scale = (1,1,1)
+    return shake_object
+
+
+# Sets up the timing of the shake object of a camera's shake item, for a
+# shake object of its own.
+def set_private_shake_timing(shake_object, camera, shake_item_index, context):
+    shake = camera.camera_shakes[shake_item_index]
+    set_shake_object_timing(
+        shake_object, shake.shake_type, context,
+        camera=camera, shake_item_index=shake_item_index,
+        speed=shake.speed, offset=shake.offset,
+        use_nla=uses_nla_timing(camera, shake_item_index, context),
+        action_params=shake_item_params(shake, context),
+    )
+
+
+# Creates the shake object for the given camera and shake item index,
+# when the shake can't be pooled.
+def build_private_shake_object(camera, shake_item_index, collection, context):
+    shake = camera.camera_shakes[shake_item_index]
+    shake_object = new_shake_object(shake_object_name(camera, shake_item_index), collection)
+    shake_object[SHAKE_UID_PROP] = shake.uid
+    shake_object[SHAKE_CAMERA_PROP] = camera.camera_shakes_uid
+    shake_object[SHAKE_SLOT_PROP] = shake_item_index
+    SHAKE_RIG_INDEX.add(shake_object)
+    set_private_shake_timing(shake_object, camera, shake_item_index, context)
+    return shake_object
+
+
+# Ensures the pooled shake object for the given pool key exists, and
+# fetches it.  Its timing only depends on the shake item's type, speed
+# and offset, which are all part of the key.
+def ensure_pooled_shake_object(pool_key, camera, shake_item_index, collection, context):
+    shake_object = SHAKE_RIG_INDEX.pooled_object(pool_key)
+    if shake_object is not None and shake_object.name in collection.objects and is_complete_shake_object(shake_object):
+        return shake_object
+
+    name = pooled_shake_object_name(pool_key) if shake_object is None else shake_object.name
+    shake = camera.camera_shakes[shake_item_index]
+    shake_object = new_shake_object(name, collection)
+    shake_object[SHAKE_POOL_KEY_PROP] = pool_key
+    shake_object[SHAKE_POOL_USERS_PROP] = []
+    SHAKE_RIG_INDEX.add(shake_object)
+    set_shake_object_timing(
+        shake_object, shake.shake_type, context,
+        speed=shake.speed, offset=shake.offset,
+        use_nla=uses_nla_timing(camera, shake_item_index, context),
+        action_params=shake_item_params(shake, context),
+    )
+    return shake_object
+
+
+# Creates the camera constraints for the given shake item index,
+# targeting the given shake object.
+def build_camera_constraints(camera, shake_item_index, shake_object, context):
+    loc_constraint_name, rot_constraint_name = shake_constraint_names(shake_item_index)
+
+    # Create the new constraints.
+    loc_constraint = camera.constraints.new(type='COPY_LOCATION')
+    rot_constraint = camera.constraints.new(type='COPY_ROTATION')
+    loc_constraint.name = loc_constraint_name
+    rot_constraint.name = rot_constraint_name
+    loc_constraint.show_expanded = False
+    rot_constraint.show_expanded = False
+
+    # Set up location constraint.
+    loc_constraint.target = shake_object
+    loc_constraint.target_space = 'WORLD'
+    loc_constraint.owner_space = 'LOCAL'
+    loc_constraint.use_offset = True
+
+    # Set up rotation constraint.
+    rot_constraint.target = shake_object
+    rot_constraint.target_space = 'WORLD'
+    rot_constraint.owner_space = 'LOCAL'
+    rot_constraint.mix_mode = 'AFTER'
+    return loc_constraint, rot_constraint
+
+
+# Brings the user list of every pooled shake object in line with which of
+# them the camera's shakes use now, and deletes pooled shake objects that
+# nobody uses anymore.  `used` maps pooled shake objects to the set of
+# "<camera uid>:<uid>" entries of this camera that use them.
+def update_pool_users(camera, used):
+    own = str(camera.camera_shakes_uid)
+    for obj in SHAKE_RIG_INDEX.pooled_objects():
+        users = []
+        for entry in obj.get(SHAKE_POOL_USERS_PROP, []):
+            camera_uid = entry.rpartition(":")[0]
+            if camera_uid != own and camera_uid.isdigit() and SHAKE_RIG_INDEX.camera(int(camera_uid)) is not None:
+                users += [entry]
+        users += sorted(used.get(obj, ()))
+        if len(users) == 0 and is_pooled_shake_object_targeted(obj):
+            # Used by a camera that was duplicated or appended since its
+            # last rebuild; it registers itself when it's rebuilt.
+            continue
+        if len(users) == 0:
+            remove_shake_object(obj)
+        elif list(obj.get(SHAKE_POOL_USERS_PROP, [])) != users:
+            obj[SHAKE_POOL_USERS_PROP] = users
+
+
+# Whether any camera constraint still targets a pooled shake object.  Only
+# needed as a safety net when its user count drops to zero.
+def is_pooled_shake_object_targeted(shake_object):
+    for obj in bpy.data.objects:
+        if obj.type != 'CAMERA':
+            continue
+        for constraint in obj.constraints:
+            if constraint.name.startswith(BASE_NAME) and getattr(constraint, "target", None) == shake_object:
+                return True
+    return False
+
+
+# The main function that actually does the real work of this addon.
+# It's called whenever anything relevant in the shake list on a
+# camera is changed.  It compares the shake list against the rig that
+# exists for the camera, and only creates, removes, retargets or
+# re-indexes the parts that changed.  E.g. moving a shake in the list
+# just renames its parts and swaps the data paths of their drivers,
+# and changing a shake's type just swaps the action its empty plays.
+#
+# Shakes with the same type, speed and offset share one pooled empty
+# across all cameras (see shake_pool_key()); the empty is reference
+# counted and deleted when its last user goes away.  Shakes with manual
+# or animated timing get an empty of their own.
+#
+# The camera's shake objects are found through SHAKE_RIG_INDEX.  With a
+# ShakeRigBatch, the camera's rig is known to have been torn down already,
+# so nothing is looked up, and the pool user lists and the final cleanup
+# are left to the batch.
+@timed_function()
+def rebuild_camera_shakes(camera, context, batch=None):
+    collection = ensure_shake_collection(context)
+    ensure_shake_uids(camera)
+    camera_uid = SHAKE_RIG_INDEX.ensure_camera_uid(camera)
+
+    # Baked cameras have their shakes in their own F-curves, and no rig.
+    shakes = [] if camera.camera_shakes_baked else list(camera.camera_shakes)
+
+    # Where each shake item should end up, by uid, and the pool its
+    # shake object belongs to, if any.
+    desired = {shake.uid: i for i, shake in enumerate(shakes)}
+    pool_keys = {shake.uid: shake_pool_key(camera, i, context) for i, shake in enumerate(shakes)}
 
     #----------------
-    # First, completely tear down the current setup, if any.
+    # First, find the rig that currently exists for the camera, and
+    # tear down whatever of it isn't wanted anymore or is broken.
     #----------------
 
-    # Remove shake constraints from the camera.
-    remove_list = []
-    for constraint in camera.constraints:
-        if constraint.name.startswith(BASE_NAME):
-            constraint.driver_remove("influence")
-            remove_list += [constraint]
-    for constraint in remove_list:
-        camera.constraints.remove(constraint)
-
-    # Remove shake empties for this camera.
-    name_match = re.compile("{}_[0-9]+".format(re.escape(BASE_NAME + "_" + camera.name)))
-    for obj in collection.objects:
-        if name_match.fullmatch(obj.name) != None:
-            obj.constraints[0].driver_remove("eval_time")
-            obj.animation_data_clear()
-            bpy.data.objects.remove(obj)
+    # The camera's own shake empties, by uid of their shake item.
+    existing = {}
+    stale_objects = []
+    private_objects = SHAKE_RIG_INDEX.private_objects(camera_uid) if batch is None else {}
+    for uid, obj in private_objects.items():
+        if uid not in desired or pool_keys[uid] is not None or not is_complete_shake_object(obj):
+            stale_objects += [obj]
+        else:
+            existing[uid] = (obj, obj.get(SHAKE_SLOT_PROP, -1))
+
+    # Shake constraints on the camera, by uid of their shake item.  A
+    # shake item's constraints are named after the index it had when
+    # they were last built, which it remembers in rig_index.
+    shake_constraints = {c.name: c for c in camera.constraints if c.name.startswith(BASE_NAME)}
+    camera_constraints = {}
+    for shake in shakes:
+        if shake.rig_index < 0:
+            continue
+        loc_name, rot_name = shake_constraint_names(shake.rig_index)
+        loc_constraint = shake_constraints.pop(loc_name, None)
+        rot_constraint = shake_constraints.pop(rot_name, None)
+        if loc_constraint is None or rot_constraint is None \
+                or loc_constraint.type != 'COPY_LOCATION' or rot_constraint.type != 'COPY_ROTATION':
+            shake_constraints.update((c.name, c) for c in (loc_constraint, rot_constraint) if c is not None)
+            continue
+        camera_constraints[shake.uid] = (loc_constraint, rot_constraint, shake.rig_index)
+
+    for constraint in shake_constraints.values():
+        remove_camera_constraint(camera, constraint)
+    for obj in stale_objects:
+        remove_shake_object(obj)
 
     #----------------
-    # Then build the new setup.
+    # Then update the shakes that are kept, and build the missing ones.
     #----------------
 
-    for shake_item_index in range(0, len(camera.camera_shakes)):
-        build_single_shake(camera, shake_item_index, collection, context)
+    # Parts that moved in the list.  They're first renamed out of the
+    # way, so that swapping two shakes doesn't produce ".001" names.
+    moved_objects = [
+        uid for uid, (obj, index) in existing.items()
+        if desired[uid] != index or obj.name != shake_object_name(camera, desired[uid])
+    ]
+    moved_constraints = [uid for uid, (loc, rot, index) in camera_constraints.items() if desired[uid] != index]
+    for uid in moved_objects:
+        existing[uid][0].name += "_moving"
+    for uid in moved_constraints:
+        camera_constraints[uid][0].name += "_moving"
+        camera_constraints[uid][1].name += "_moving"
+    for uid in moved_objects:
+        reindex_shake_object(camera, existing[uid][0], desired[uid])
+    for uid in moved_constraints:
+        loc_constraint, rot_constraint, _ = camera_constraints[uid]
+        reindex_camera_constraints(camera, loc_constraint, rot_constraint, desired[uid])
+
+    pool_used = {}
+    for shake_item_index, shake in enumerate(shakes):
+        pool_key = pool_keys[shake.uid]
+        if pool_key is not None:
+            shake_object = ensure_pooled_shake_object(pool_key, camera, shake_item_index, collection, context)
+            pool_used.setdefault(shake_object, set()).add("{}:{}".format(camera_uid, shake.uid))
+        elif shake.uid in existing:
+            shake_object = existing[shake.uid][0]
+            set_private_shake_timing(shake_object, camera, shake_item_index, context)
+        else:
+            shake_object = build_private_shake_object(camera, shake_item_index, collection, context)
+
+        if shake.uid in camera_constraints:
+            loc_constraint, rot_constraint, _ = camera_constraints[shake.uid]
+            if loc_constraint.target != shake_object:
+                loc_constraint.target = shake_object
+            if rot_constraint.target != shake_object:
+                rot_constraint.target = shake_object
+        else:
+            loc_constraint, rot_constraint = build_camera_constraints(camera, shake_item_index, shake_object, context)
+        set_shake_influence(camera, loc_constraint, rot_constraint, shake_item_index, context)
+        if shake.rig_index != shake_item_index:
+            shake.rig_index = shake_item_index
+
+    if batch is not None:
+        batch.add_pool_users(pool_used)
+    else:
+        update_pool_users(camera, pool_used)
+
+    # Keep the shake constraints stacked in the order of the shake list.
+    order = []
+    for shake_item_index in range(len(shakes)):
+        order += shake_constraint_names(shake_item_index)
+    current = [c.name for c in camera.constraints if c.name.startswith(BASE_NAME)]
+    if current != order:
+        for name in order:
+            camera.constraints.move(camera.constraints.find(name), len(camera.constraints) - 1)
 
     #----------------
-    # Finally, clean up any data that's no longer needed, up to and
-    # including removing the collection itself if there no shakes left.
+    # Finally, clean up any data that's no longer needed.
     #----------------
-
-    # If there's nothing left in the collection, delete it.
-    if len(collection.objects) == 0:
-        context.scene.collection.children.unlink(collection)
+    if batch is None:
+        remove_unused_shake_data(context.scene)
+
+
+# Removes the shake collection from the scene if there are no shakes left
+# in it, up to and including deleting the collection itself, and evicts
+# shake actions nobody uses anymore beyond the cache's budget.
+def remove_unused_shake_data(scene):
+    collection = bpy.data.collections.get(BASE_NAME)
+    if collection is not None and len(collection.objects) == 0:
+        if collection.name in scene.collection.children:
+            scene.collection.children.unlink(collection)
         if collection.users == 0:
             bpy.data.collections.remove(collection)
 
-    # Delete unused actions.
-    to_remove = []
-    for action in bpy.data.actions:
-        if action.name.startswith(BASE_NAME):
-            if action.users == 0:
-                to_remove += [action]
-    for action in to_remove:
-        bpy.data.actions.remove(action)
+    adopt_shake_actions()
+    SHAKE_ACTION_CACHE.evict()
+
+
+class ShakeRigBatch:
+    """Shared lookups for rebuilding the shake rigs of many cameras at once"""
 
+    def __init__(self):
+        self.pool_users = {} # User entries of each pooled shake object.
+        self.scenes = set()
 
-# Fixes camera shake setups across the whole scene.
+    def add_pool_users(self, used):
+        for shake_object, users in used.items():
+            self.pool_users.setdefault(shake_object, set()).update(users)
+
+    # Writes the pool user lists, and cleans up after all the rebuilds.
+    def finish(self):
+        for shake_object, users in self.pool_users.items():
+            shake_object[SHAKE_POOL_USERS_PROP] = sorted(users)
+        for scene in self.scenes:
+            remove_unused_shake_data(scene)
+
+
+# Fixes camera shake setups across every scene in the file.
 # This can be necessary if e.g. a user has duplicated cameras
 # around, etc.
+#
+# All shake empties, shake actions and camera shake constraints are torn
+# down in one pass, with a single batch_remove() for the IDs, and then
+# every camera's rig is rebuilt from scratch through one ShakeRigBatch.
+# Rebuilding camera by camera would rescan the collection and the
+# actions for each of them.
+@timed_function()
 def fix_camera_shakes_globally(context):
-    # Delete the collection and everything in it.
-    if BASE_NAME in context.scene.collection.children:
-        collection = context.scene.collection.children[BASE_NAME]
-
+    # Each camera is rebuilt for the first scene it's found in, which
+    # decides the frame rate and unit scale its rig is set up for.
+    cameras = {}
+    for scene in bpy.data.scenes:
+        for obj in scene.objects:
+            if obj.type == 'CAMERA' and obj not in cameras:
+                cameras[obj] = scene
+
+    # Tear everything down.
+    doomed = [action for action in bpy.data.actions if action.name.startswith(BASE_NAME)]
+    collection = bpy.data.collections.get(BASE_NAME)
+    if collection is not None:
         for obj in collection.objects:
-            obj.constraints[0].driver_remove("eval_time")
-            obj.animation_data_clear()
-            bpy.data.objects.remove(obj)
+            if obj.animation_data is not None:
+                obj.animation_data_clear()
+        doomed += list(collection.objects) + [collection]
+    for camera in cameras:
+        for constraint in [c for c in camera.constraints if c.name.startswith(BASE_NAME)]:
+            remove_camera_constraint(camera, constraint)
+        for shake in camera.camera_shakes:
+            shake.rig_index = -1
+    if len(doomed) > 0:
+        bpy.data.batch_remove(doomed)
+    SHAKE_RIG_INDEX.invalidate()
+    reset_shake_actions()
+
+    # Rebuild.
+    batch = ShakeRigBatch()
+    for camera, scene in cameras.items():
+        if len(camera.camera_shakes) == 0:
+            continue
+        batch.scenes.add(scene)
+        with context.temp_override(scene=scene):
+            rebuild_camera_shakes(camera, context, batch)
+    batch.finish()
+
+
+# Per-frame values of an animatable property of `id` over
+# frame_start..frame_end, from its action if it's animated there.
+def sample_property(id, data_path, index, frame_start, frame_end, default):
+    anim = id.animation_data
+    curve = None
+    if anim is not None and anim.action is not None:
+        curve = anim.action.fcurves.find(data_path, index=index)
+    if curve is None:
+        return np.full(frame_end - frame_start + 1, float(default))
+    return sample_fcurve(curve, frame_start, frame_end)
+
+
+# Bakes the shake stack of `camera` over frame_start..frame_end (the
+# scene's frame range by default) into plain keyframes on its location and
+# rotation, and removes its shake rig.  The camera's action is copied
+# first, and the original is kept so unbake_camera_shakes() can restore
+# the live rig.  Rendering a baked camera needs no drivers or empties.
+def bake_camera_shakes(camera, context, frame_start=None, frame_end=None):
+    if camera.camera_shakes_baked:
+        raise ValueError("Camera '{}' is already baked".format(camera.name))
+    if camera.rotation_mode == 'AXIS_ANGLE':
+        raise ValueError("Baking cameras with Axis Angle rotation isn't supported")
+    scene = context.scene
+    if frame_start is None:
+        frame_start = scene.frame_start
+    if frame_end is None:
+        frame_end = scene.frame_end
+    if frame_end < frame_start:
+        raise ValueError("Bake frame range is empty")
+
+    frames = np.arange(frame_start, frame_end + 1, dtype=np.float64)
+    scene_fps = scene.render.fps / scene.render.fps_base
+    unit_scale = scene.unit_settings.scale_length
+
+    def prop(data_path, index=0, default=0.0):
+        return sample_property(camera, data_path, index, frame_start, frame_end, default)
+
+    # The camera's own transform, before any shake.
+    location = np.stack([prop("location", i, camera.location[i]) for i in range(3)], axis=-1)
+    if camera.rotation_mode == 'QUATERNION':
+        rotation = np.stack([prop("rotation_quaternion", i, camera.rotation_quaternion[i]) for i in range(4)], axis=-1)
+    else:
+        euler = np.stack([prop("rotation_euler", i, camera.rotation_euler[i]) for i in range(3)], axis=-1)
+        rotation = shake_bake.euler_to_quat(euler, camera.rotation_mode)
+
+    layers = []
+    for i, shake in enumerate(camera.camera_shakes):
+        item_path = "camera_shakes[{}].".format(i)
+        clip = shake_clip(shake.shake_type, shake_item_params(shake, context))
+        influence = prop(item_path + "influence", default=shake.influence)
+        time = shake_bake.clip_time(
+            clip, frames, scene_fps,
+            prop(item_path + "use_manual_timing", default=shake.use_manual_timing),
+            prop(item_path + "time", default=shake.time),
+            shake.speed,
+            prop(item_path + "offset", default=shake.offset),
+        )
+        # The same influences and factors the rig's drivers and loop
+        # actions use, so the bake matches it including clamping.
+        loc_influence = influence * prop(item_path + "scale", default=shake.scale) \
+            / (UNIT_SCALE_MAX * INFLUENCE_MAX * SCALE_MAX * unit_scale)
+        layers += [shake_bake.ShakeLayer(
+            clip, time,
+            loc_influence, influence / INFLUENCE_MAX,
+            INFLUENCE_MAX * SCALE_MAX * UNIT_SCALE_MAX, INFLUENCE_MAX,
+        )]
+    location, rotation = shake_bake.evaluate_shake_stack(location, rotation, layers)
+
+    # Write the result into a copy of the camera's action.
+    camera.animation_data_create()
+    original = camera.animation_data.action
+    if original is not None:
+        baked = original.copy()
+        baked.name = original.name + "_shake_baked"
+    else:
+        baked = bpy.data.actions.new(camera.name + "Action_shake_baked")
+    for i in range(3):
+        write_fcurve_samples(baked, "location", i, frame_start, location[:, i], "Object Transforms")
+    if camera.rotation_mode == 'QUATERNION':
+        for i in range(4):
+            write_fcurve_samples(baked, "rotation_quaternion", i, frame_start, rotation[:, i], "Object Transforms")
+    else:
+        euler = shake_bake.quat_to_euler(rotation, camera.rotation_mode)
+        for i in range(3):
+            write_fcurve_samples(baked, "rotation_euler", i, frame_start, euler[:, i], "Object Transforms")
+
+    camera.camera_shakes_baked_from = original
+    camera.animation_data.action = baked
+    camera.camera_shakes_baked = True
+    rebuild_camera_shakes(camera, context)
+    return baked
+
+
+# Restores the camera's action from before bake_camera_shakes(), and
+# rebuilds its live shake rig.
+def unbake_camera_shakes(camera, context):
+    if not camera.camera_shakes_baked:
+        return
+    baked = camera.animation_data.action if camera.animation_data is not None else None
+    if camera.animation_data is not None:
+        camera.animation_data.action = camera.camera_shakes_baked_from
+    camera.camera_shakes_baked_from = None
+    camera.camera_shakes_baked = False
+    if baked is not None and baked.users == 0:
+        bpy.data.actions.remove(baked)
+    rebuild_camera_shakes(camera, context)
+
+
+# Adds a shake item to `camera`, makes it the active one and rebuilds the
+# camera's rig.  Keyword arguments set properties of the new item, e.g.
+# add_camera_shake(camera, context, shake_type='HANDYCAM_RUN', scale=0.5).
+def add_camera_shake(camera, context, **settings):
+    shake = camera.camera_shakes.add()
+    shake.uid = max([s.uid for s in camera.camera_shakes], default=0) + 1
+    for name, value in settings.items():
+        setattr(shake, name, value)
+    camera.camera_shakes_active_index = len(camera.camera_shakes) - 1
+    rebuild_camera_shakes(camera, context)
+    return shake
 
-        context.scene.collection.children.unlink(collection)
-        if collection.users == 0:
-            bpy.data.collections.remove(collection)
 
-    # Delete unused actions.
-    to_remove = []
-    for action in bpy.data.actions:
-        if action.name.startswith(BASE_NAME):
-            if action.users == 0:
-                to_remove += [action]
-    for action in to_remove:
-        bpy.data.actions.remove(action)
+def on_shake_type_update(shake_instance, context):
+    rebuild_camera_shakes(shake_instance.id_data, context)
 
-    # Loop through all cameras and re-build their camera shakes.
-    for obj in context.scene.objects:
-        if obj.type == 'CAMERA':
-            rebuild_camera_shakes(obj, context)
 
+# In NLA rig mode the rig holds copies of the shake parameters (strip
+# timing, constraint influences), so it's updated whenever they change.
+def on_shake_param_update(shake_instance, context):
+    camera = shake_instance.id_data
+    if camera.camera_shakes_rig_mode == 'NLA':
+        rebuild_camera_shakes(camera, context)
 
-def on_shake_type_update(shake_instance, context):
+
+# Shakes with the same timing share one empty, so changing the timing of
+# a shake moves it to another empty in either rig mode.
+def on_shake_timing_update(shake_instance, context):
     rebuild_camera_shakes(shake_instance.id_data, context)
 
 
+def on_shake_rig_mode_update(camera, context):
+    rebuild_camera_shakes(camera, context)
+
+
+# Keyframing or driving a shake parameter doesn't call its update
+# function, so the rig is checked after action and driver edits, and
+# e.g. a shake whose offset got animated is moved off its shared empty,
+# or in NLA rig mode switched over to drivers.
+#
+# The depsgraph handler runs after every edit, so it only compares a few
+# numbers per updated camera (see shake_animation_signature()) and queues
+# the cameras whose animation changed.  They're checked, and rebuilt if
+# needed, by a timer, since rebuilding from within the handler would
+# trigger another depsgraph update.
+
+# Animation signatures of shaken cameras, and rig signatures of scenes,
+# by name, as the depsgraph handler last saw them.
+_shake_animation_signatures = {}
+_scene_rig_signatures = {}
+
+# Names of the cameras check_shake_rig_modes() checks next.
+_pending_rig_checks = set()
+
+
+# Changes whenever an F-curve or driver is added to or removed from the
+# camera, its action is swapped or shake items are added or removed,
+# which is all that can make a shake item animated.
+def shake_animation_signature(camera):
+    anim = camera.animation_data
+    if anim is None:
+        return (len(camera.camera_shakes),)
+    action = anim.action
+    return (
+        len(camera.camera_shakes),
+        action.as_pointer() if action is not None else 0,
+        len(action.fcurves) if action is not None else 0,
+        len(anim.drivers),
+    )
+
+
+# Changes whenever the scene's unit scale is set or gets animated, which
+# is what the plain influences of NLA rig mode depend on, or its frame
+# range changes, which decides whether strips can cover it.
+def scene_rig_signature(scene):
+    unit_scale = None if is_unit_scale_animated(scene) else scene.unit_settings.scale_length
+    return (unit_scale, scene.frame_start, scene.frame_end)
+
+
+def queue_shake_rig_check(camera):
+    _pending_rig_checks.add(camera.name)
+    if not bpy.app.timers.is_registered(check_shake_rig_modes):
+        bpy.app.timers.register(check_shake_rig_modes, first_interval=0.0)
+
+
+@persistent
+def shake_rig_mode_depsgraph_handler(scene, depsgraph):
+    for update in depsgraph.updates:
+        id = update.id.original
+        if isinstance(id, bpy.types.Object):
+            if id.type != 'CAMERA' or len(id.camera_shakes) == 0:
+                continue
+            signature = shake_animation_signature(id)
+            if _shake_animation_signatures.get(id.name) != signature:
+                _shake_animation_signatures[id.name] = signature
+                queue_shake_rig_check(id)
+        elif isinstance(id, bpy.types.Scene):
+            signature = scene_rig_signature(id)
+            if _scene_rig_signatures.get(id.name, signature) != signature:
+                for obj in id.objects:
+                    if obj.type == 'CAMERA' and obj.camera_shakes_rig_mode == 'NLA' and len(obj.camera_shakes) > 0:
+                        queue_shake_rig_check(obj)
+            _scene_rig_signatures[id.name] = signature
+
+
+# Timer that rebuilds the rigs of the queued cameras that are out of date.
+def check_shake_rig_modes():
+    names = list(_pending_rig_checks)
+    _pending_rig_checks.clear()
+    for name in names:
+        camera = bpy.data.objects.get(name)
+        if camera is None or camera.type != 'CAMERA' or len(camera.camera_shakes) == 0:
+            continue
+        if not is_shake_rig_mode_current(camera, bpy.context):
+            rebuild_camera_shakes(camera, bpy.context)
+    return None
+
+
 #class ActionToPythonData(bpy.types.Operator):
 #    """Writes the action on the currently selected object to a text block as Python data"""
 #    bl_idname = "object.action_to_python_data"
@@ -443,7 +1608,7 @@ def on_shake_type_update(shake_instance, context):
 #               and context.active_object.animation_data.action is not None
 #
 #    def execute(self, context):
-#        action_to_python_data_text(context.active_object.animation_data.action, "action_output.txt")
+#        action_to_python_data_text(context.active_object.animation_data.action, "action_output.txt", context.scene.render.fps / context.scene.render.fps_base)
 #        return {'FINISHED'}
 
 
@@ -458,10 +1623,7 @@ class CameraShakeAdd(bpy.types.Operator):
         return context.active_object is not None and context.active_object.type == 'CAMERA'
 
     def execute(self, context):
-        camera = context.active_object
-        shake = camera.camera_shakes.add()
-        camera.camera_shakes_active_index = len(camera.camera_shakes) - 1
-        rebuild_camera_shakes(camera, context)
+        add_camera_shake(context.active_object, context)
         return {'FINISHED'}
 
 
@@ -516,7 +1678,7 @@ class CameraShakeMove(bpy.types.Operator):
 
 
 class CameraShakesFixGlobal(bpy.types.Operator):
-    """Ensures that all camera shakes in the scene are set up properly. This generally shouldn't be necessary, but if things are behaving strangely this should fix it"""
+    """Ensures that all camera shakes in every scene are set up properly. This generally shouldn't be necessary, but if things are behaving strangely this should fix it"""
     bl_idname = "object.camera_shakes_fix_global"
     bl_label = "Fix All Camera Shakes"
     bl_options = {'UNDO'}
@@ -530,11 +1692,97 @@ class CameraShakesFixGlobal(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class CameraShakesBake(bpy.types.Operator):
+    """Bakes the camera's shakes into keyframes on its location and rotation, and removes the shake rig. Baked cameras render without drivers"""
+    bl_idname = "object.camera_shakes_bake"
+    bl_label = "Bake Shakes to Camera"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    frame_start: bpy.props.IntProperty(name="Start Frame", default=1)
+    frame_end: bpy.props.IntProperty(name="End Frame", default=250)
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'CAMERA' and len(obj.camera_shakes) > 0 \
+            and not obj.camera_shakes_baked
+
+    def invoke(self, context, event):
+        if not self.properties.is_property_set("frame_start"):
+            self.frame_start = context.scene.frame_start
+        if not self.properties.is_property_set("frame_end"):
+            self.frame_end = context.scene.frame_end
+        return self.execute(context)
+
+    def execute(self, context):
+        try:
+            bake_camera_shakes(context.active_object, context, self.frame_start, self.frame_end)
+        except ValueError as exc:
+            self.report({'ERROR'}, str(exc))
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+
+class CameraShakeMetricsReset(bpy.types.Operator):
+    """Clears the recorded timings and counters"""
+    bl_idname = "object.camera_shake_metrics_reset"
+    bl_label = "Reset"
+
+    def execute(self, context):
+        shake_metrics.reset()
+        return {'FINISHED'}
+
+
+class CameraShakeMetricsExport(bpy.types.Operator, ExportHelper):
+    """Writes the recorded timings and counters to a JSON file"""
+    bl_idname = "object.camera_shake_metrics_export"
+    bl_label = "Export JSON"
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default='*.json', options={'HIDDEN'})
+
+    def execute(self, context):
+        shake_metrics.write_json(self.filepath)
+        self.report({'INFO'}, "Wrote timings to {}".format(self.filepath))
+        return {'FINISHED'}
+
+
+class CameraShakesUnbake(bpy.types.Operator):
+    """Restores the camera's animation from before baking, and rebuilds its live shakes"""
+    bl_idname = "object.camera_shakes_unbake"
+    bl_label = "Unbake Shakes"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'CAMERA' and obj.camera_shakes_baked
+
+    def execute(self, context):
+        unbake_camera_shakes(context.active_object, context)
+        return {'FINISHED'}
+
+
 # An actual instance of Camera shake added to a camera.
 class CameraShakeInstance(bpy.types.PropertyGroup):
+    # Identifies the shake item on its camera, so that its rig can be
+    # found again after the item is moved in the list.
+    uid: bpy.props.IntProperty(
+        name = "Shake UID",
+        default = 0,
+        options = {'HIDDEN'},
+        override = set(),
+    )
+    # The index the shake item had when its camera constraints were last
+    # built, which they're named after.  -1 when they haven't been built.
+    rig_index: bpy.props.IntProperty(
+        name = "Shake Rig Index",
+        default = -1,
+        options = {'HIDDEN'},
+        override = set(),
+    )
     shake_type: bpy.props.EnumProperty(
         name = "Shake Type",
-        items = [(id, SHAKE_LIST[id][0], "") for id in SHAKE_LIST.keys()],
+        items = shake_type_items,
         options = set(), # Not animatable.
         override = set(), # Not library overridable.
         update = on_shake_type_update,
@@ -545,6 +1793,7 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0, max=INFLUENCE_MAX,
         soft_min=0.0, soft_max=1.0,
+        update=on_shake_param_update,
     )
     scale: bpy.props.FloatProperty(
         name="Scale",
@@ -552,11 +1801,13 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=1.0,
         min=0.0, max=SCALE_MAX,
         soft_min=0.0, soft_max=2.0,
+        update=on_shake_param_update,
     )
     use_manual_timing: bpy.props.BoolProperty(
         name="Manual Timing",
         description="Manually animate the progression of time through the camera shake animation",
         default=False,
+        update=on_shake_timing_update,
     )
     time: bpy.props.FloatProperty(
         name="Time",
@@ -571,6 +1822,7 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=1.0,
         soft_min=0.0, soft_max=4.0,
         options = set(), # Not animatable.
+        update=on_shake_timing_update,
     )
     offset: bpy.props.FloatProperty(
         name="Frame Offset",
@@ -578,6 +1830,113 @@ class CameraShakeInstance(bpy.types.PropertyGroup):
         default=0.0,
         precision=1,
         step=100.0,
+        update=on_shake_timing_update,
+    )
+    # Plays a non-repeating resynthesis of a library shake instead of the
+    # capture itself, see shake_spectrum.
+    use_variant: bpy.props.BoolProperty(
+        name="Non-Repeating Variant",
+        description="Play a generated variant with the character of this shake, as long as the shot, instead of looping the capture",
+        default=False,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    variant_seed: bpy.props.IntProperty(
+        name="Variant Seed",
+        description="Picks one of the endless variants of the shake",
+        default=0,
+        min=0,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    variant_length: bpy.props.FloatProperty(
+        name="Variant Length",
+        description="How long the variant runs before it repeats, in seconds",
+        default=60.0,
+        min=1.0, soft_max=600.0,
+        subtype='TIME_ABSOLUTE',
+        options = set(),
+        update = on_shake_type_update,
+    )
+    # Settings of the Procedural Noise shake type.  Changing any of them
+    # generates a different shake, so they aren't animatable.
+    noise_seed: bpy.props.IntProperty(
+        name="Seed",
+        description="Picks one of the endless different shakes the other settings describe",
+        default=0,
+        min=0,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_duration: bpy.props.IntProperty(
+        name="Loop Length",
+        description="How many frames (at 24 fps) the shake runs for before it repeats",
+        default=240,
+        min=2, soft_max=2400,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_frequency: bpy.props.FloatProperty(
+        name="Frequency",
+        description="How many times per second the slowest motion changes direction, roughly",
+        default=0.75,
+        min=0.0, soft_max=10.0,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_octaves: bpy.props.IntProperty(
+        name="Octaves",
+        description="How many layers of ever faster and finer detail are added on top",
+        default=3,
+        min=1, max=NOISE_OCTAVES_MAX,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_roughness: bpy.props.FloatProperty(
+        name="Roughness",
+        description="Strength of each layer of detail relative to the one before",
+        default=0.5,
+        min=0.0, max=1.0,
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_location_amplitude: bpy.props.FloatProperty(
+        name="Location Amplitude",
+        description="Typical distance the camera moves",
+        default=0.01,
+        min=0.0, soft_max=0.1,
+        subtype='DISTANCE',
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_rotation_amplitude: bpy.props.FloatProperty(
+        name="Rotation Amplitude",
+        description="Typical angle the camera turns",
+        default=math.radians(0.5),
+        min=0.0, soft_max=math.radians(5.0),
+        subtype='ANGLE',
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_location_weights: bpy.props.FloatVectorProperty(
+        name="Location Axes",
+        description="Scales the location amplitude per axis",
+        default=(1.0, 1.0, 0.5),
+        min=0.0, soft_max=1.0,
+        size=3,
+        subtype='XYZ',
+        options = set(),
+        update = on_shake_type_update,
+    )
+    noise_rotation_weights: bpy.props.FloatVectorProperty(
+        name="Rotation Axes",
+        description="Scales the rotation amplitude per axis",
+        default=(1.0, 1.0, 0.25),
+        min=0.0, soft_max=1.0,
+        size=3,
+        subtype='XYZ',
+        options = set(),
+        update = on_shake_type_update,
     )
 
 
@@ -598,6 +1957,46 @@ def string_to_icon(value):
 addon_keymaps = {}
 _icons = None
 
+# Waveform thumbnails of the library's shakes, rendered in the background
+# and loaded into _icons as they're done, see shake_preview.py.  Kept in
+# the store's "previews" directory from register() on.
+SHAKE_PREVIEWS = None
+SHAKE_PREVIEW_POLL_INTERVAL = 0.2
+
+
+# Returns the icon of a library shake's thumbnail, or a generic icon while
+# it's being rendered.
+def shake_preview_icon(shake_id):
+    stats = SHAKE_INDEX.get(shake_id) if SHAKE_INDEX is not None else None
+    if stats is None or _icons is None:
+        return string_to_icon('CON_CAMERASOLVER')
+    preview = _icons.get(stats.content_hash)
+    if preview is not None:
+        return preview.icon_id
+    path = SHAKE_PREVIEWS.request(stats.content_hash, lambda: SHAKE_LIBRARY.clip(shake_id))
+    if path is not None:
+        return _icons.load(stats.content_hash, path, 'IMAGE').icon_id
+    if not bpy.app.timers.is_registered(poll_shake_previews):
+        bpy.app.timers.register(poll_shake_previews, first_interval=SHAKE_PREVIEW_POLL_INTERVAL)
+    return string_to_icon('CON_CAMERASOLVER')
+
+
+# Timer that loads finished thumbnails and redraws the 3D views showing
+# the library list.  Runs until no thumbnail is pending.
+def poll_shake_previews():
+    if _icons is None:
+        return None
+    finished = SHAKE_PREVIEWS.take_finished()
+    for key, path in finished:
+        if path is not None and key not in _icons:
+            _icons.load(key, path, 'IMAGE')
+    if len(finished) > 0:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    return SHAKE_PREVIEW_POLL_INTERVAL if SHAKE_PREVIEWS.pending else None
+
 
 def display_collection_id(uid, vars):
     id = f"coll_{uid}"
@@ -608,24 +2007,59 @@ def display_collection_id(uid, vars):
 
 
 class SNA_UL_display_collection_list_B4700(bpy.types.UIList):
+    filter_shake_type: bpy.props.EnumProperty(
+        name="Type",
+        description="Only show shakes of this type",
+        items=[('ALL', "All Types", ""), ('Handheld', "Handheld", ""), ('Cinematic', "Cinematic", "")],
+    )
+    filter_dimensions: bpy.props.EnumProperty(
+        name="Motion",
+        description="Only show shakes that move the camera (3D) or only turn it (2D)",
+        items=[('ALL', "2D and 3D", ""), ('2D', "2D", "Rotation only"), ('3D', "3D", "Moves the camera")],
+    )
+    sort_by: bpy.props.EnumProperty(
+        name="Sort By",
+        items=[(key.upper(), key.replace("_", " ").title().replace("Rms", "Amplitude"), "") for key in SORT_KEYS],
+    )
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, 'filter_name', text='')
+        row.prop(self, 'use_filter_sort_reverse', text='', icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+        row = layout.row(align=True)
+        row.prop(self, 'filter_shake_type', text='')
+        row.prop(self, 'filter_dimensions', text='')
+        row.prop(self, 'sort_by', text='')
 
     def draw_item(self, context, layout, data, item_B4700, icon, active_data, active_propname, index_B4700):
         row = layout
-        layout.prop(item_B4700, 'shake_name', text='', icon_value=string_to_icon('CON_CAMERASOLVER'), emboss=False)
+        layout.prop(item_B4700, 'shake_name', text='', icon_value=shake_preview_icon(item_B4700.shake_id), emboss=False)
         op = layout.operator('sna.uninstall_shake_88f90', text='', icon_value=string_to_icon('CANCEL'), emboss=False, depress=False)
         op.sna_item_index = index_B4700
 
+    # Filters and sorts with the shake index, which keeps the result of
+    # a query until the library changes.
     def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        if SHAKE_INDEX is None:
+            return [self.bitflag_filter_item] * len(items), []
+        ranks = SHAKE_INDEX.ranks(
+            self.filter_name,
+            type=None if self.filter_shake_type == 'ALL' else self.filter_shake_type,
+            dimensions=None if self.filter_dimensions == 'ALL' else self.filter_dimensions,
+            sort=self.sort_by.lower(),
+            reverse=self.use_filter_sort_reverse,
+        )
         flt_flags = []
-        for item in getattr(data, propname):
-            if not self.filter_name or self.filter_name.lower() in item.name.lower():
-                if True:
-                    flt_flags.append(self.bitflag_filter_item)
-                else:
-                    flt_flags.append(0)
-            else:
-                flt_flags.append(0)
-        return flt_flags, []
+        positions = []
+        for i, item in enumerate(items):
+            rank = ranks.get(item.shake_id)
+            flt_flags.append(0 if rank is None else self.bitflag_filter_item)
+            positions.append(len(items) + i if rank is None else rank)
+        flt_neworder = [0] * len(items)
+        for new_index, i in enumerate(sorted(range(len(items)), key=positions.__getitem__)):
+            flt_neworder[i] = new_index
+        return flt_flags, flt_neworder
 
 
 def sna_update_sna_imported_shake_index_126B9(self, context):
@@ -718,8 +2152,19 @@ class SNA_OT_Export_Shake_54408(bpy.types.Operator, ExportHelper):
     bl_label = "Export Shake."
     bl_description = "Exports Custom Shake out of Super Shakify"
     bl_options = {"REGISTER", "UNDO"}
-    filter_glob: bpy.props.StringProperty( default='*.py', options={'HIDDEN'} )
+    filter_glob: bpy.props.StringProperty( default=';'.join('*' + writer.extension for writer in EXPORT_FORMATS.values()), options={'HIDDEN'} )
     filename_ext = '.py'
+    export_format: bpy.props.EnumProperty(
+        name="Format",
+        description="File format to export the shake to",
+        items=[(format_id, writer.label, "") for format_id, writer in EXPORT_FORMATS.items()],
+        default='PY',
+    )
+    reduce_keys: bpy.props.BoolProperty(
+        name="Reduce Keys",
+        description="Write only the keys needed to stay within the key reduction tolerances of the addon preferences. Only the Python format can hold reduced keys",
+        default=True,
+    )
 
     @classmethod
     def poll(cls, context):
@@ -727,54 +2172,77 @@ class SNA_OT_Export_Shake_54408(bpy.types.Operator, ExportHelper):
             cls.poll_message_set('')
         return not False
 
+    # Keeps the file extension in sync with the chosen format.
+    def check(self, context):
+        filepath = export_filepath(self.filepath, self.export_format)
+        if filepath == self.filepath:
+            return False
+        self.filepath = filepath
+        return True
+
     def execute(self, context):
         shake_namer = bpy.context.scene.sna_shake_name
         frame_starts = bpy.context.scene.sna_frame_begin
         frame_ends = bpy.context.scene.sna_frame_end
-        pathe = self.filepath
-        success = None
-        from bpy.types import Action
-
-        def action_to_python_data_text(frame_start, frame_end, shake_name, export_path):
-            obj = bpy.context.object
-            if not obj or not obj.animation_data or not obj.animation_data.action:
-                raise ValueError("No active object with an action found.")
-            act = obj.animation_data.action
-            # Convert the shake_name to the desired format (uppercase with underscores)
-            shake_id = shake_name.upper().replace(" ", "_")
-            # Collect channel data
-            channels = {}
-            for curve in act.fcurves:
-                baked_keys = []
-                for frame in range(frame_start, frame_end + 1):
-                    baked_keys.append((frame, curve.evaluate(frame)))
-                channels[(curve.data_path, curve.array_index)] = baked_keys
-            # Generate Python data text
-            text = "SHAKE_LIST = {\n"
-            text += f"    '{shake_id}': ('{shake_name}', 24.0, {{\n"
-            for (data_path, array_index), points in channels.items():
-                text += f"        ('{data_path}', {array_index}): ["
-                text += ", ".join(f"({frame}, {value:.6f})" for frame, value in points)
-                text += "],\n"
-            text += "    })\n"
-            text += "}\n"
-            # Write to file
-            with open(export_path, "w") as f:
-                f.write(text)
-                success = True
-            print(f"Shake data exported to {export_path}")
-        # Execute the function
-        action_to_python_data_text(frame_starts, frame_ends, shake_namer, pathe)
-        print(bpy.context.scene.sna_shake_name + ' was exported :0')
+        pathe = export_filepath(self.filepath, self.export_format)
+        obj = bpy.context.object
+        if not obj or not obj.animation_data or not obj.animation_data.action:
+            self.report({'ERROR'}, "No active object with an action found")
+            return {'CANCELLED'}
+        # Convert the shake_name to the desired format (uppercase with underscores)
+        shake_id = shake_namer.upper().replace(" ", "_")
+        sampler = ActionSampler(obj.animation_data.action, frame_starts, frame_ends)
+        scene_fps = context.scene.render.fps / context.scene.render.fps_base
+        tolerances = None
+        if self.reduce_keys:
+            tolerances = {"location": SHAKE_KEY_TOLERANCES[0], "rotation_euler": SHAKE_KEY_TOLERANCES[1]}
+        tags = {"type": context.scene.sna_shake_type}
+        if context.scene.sna_shake_author:
+            tags["author"] = context.scene.sna_shake_author
+        key_count, sample_count = export_shake(pathe, self.export_format, sampler, shake_id, shake_namer, scene_fps, tolerances=tolerances, tags=tags)
+        message = "Exported {} to {}".format(shake_namer, pathe)
+        if key_count < sample_count:
+            message += ", {} keys for {} samples ({:.1f}:1)".format(key_count, sample_count, sample_count / max(key_count, 1))
+        self.report({'INFO'}, message)
         return {"FINISHED"}
 
 
+# `filepath` with its extension replaced by the one of `format_id`, if it
+# has one of the export extensions (or none at all).
+def export_filepath(filepath, format_id):
+    if not os.path.basename(filepath):
+        return filepath
+    root, ext = os.path.splitext(filepath)
+    if ext.lower() not in [writer.extension for writer in EXPORT_FORMATS.values()]:
+        root = filepath
+    return root + EXPORT_FORMATS[format_id].extension
+
+
+# The files the import operator should read: the selected files, or every
+# .py file of the directory when it's picked with no file selected.
+def import_filepaths(filepath, directory, names):
+    names = [name for name in names if name]
+    if directory and len(names) > 0:
+        return [os.path.join(directory, name) for name in names]
+    if os.path.isfile(filepath):
+        return [filepath]
+    directory = directory or filepath
+    if not os.path.isdir(directory):
+        return []
+    return [
+        os.path.join(directory, name) for name in sorted(os.listdir(directory))
+        if name.lower().endswith(".py") and os.path.isfile(os.path.join(directory, name))
+    ]
+
+
 class SNA_OT_Import_Shakes_743F2(bpy.types.Operator, ImportHelper):
     bl_idname = "sna.import_shakes_743f2"
     bl_label = "Import Shake(s)"
-    bl_description = "Imports a shake into Super Shakify"
+    bl_description = "Imports shakes into Super Shakify, from one or more files or every file of a directory"
     bl_options = {"REGISTER", "UNDO"}
     filter_glob: bpy.props.StringProperty( default='*.py', options={'HIDDEN'} )
+    files: bpy.props.CollectionProperty(type=bpy.types.OperatorFileListElement, options={'HIDDEN', 'SKIP_SAVE'})
+    directory: bpy.props.StringProperty(subtype='DIR_PATH', options={'HIDDEN', 'SKIP_SAVE'})
 
     @classmethod
     def poll(cls, context):
@@ -783,50 +2251,49 @@ class SNA_OT_Import_Shakes_743F2(bpy.types.Operator, ImportHelper):
         return not False
 
     def execute(self, context):
-        pathi = self.filepath
-        import os
-        # Define `filepath` based on `pathi` (already defined outside the script)
-        filepath = pathi
-        print("Current working directory:", os.getcwd())
-
-        def load_shake_list(filepath):
-            """Load the SHAKE_LIST from the given Python file."""
-            shake_list = None
-            with open(filepath, 'r') as file:
-                file_content = file.read()
-                # Check if SHAKE_LIST is defined
-                if "SHAKE_LIST" in file_content:
-                    # Execute the file to get the SHAKE_LIST into a local scope
-                    exec(file_content, globals())
-                    shake_list = globals().get("SHAKE_LIST")
-            return shake_list
-
-        def save_shake_list(filepath, shake_list):
-            """Overwrite the SHAKE_LIST in the target Python file with Python dictionary formatting."""
-            with open(filepath, 'w') as file:
-                file.write("SHAKE_LIST = {\n")
-                for key, value in shake_list.items():
-                    file.write(f'    "{key}": ')
-                    pprint.pprint(value, stream=file, indent=4, width=120)
-                    file.write(", ")
-                file.write("}\n")
-        # Ensure the target file exists and resolve its path
-        addon_directory = os.path.dirname(__file__)
-        target_file = os.path.join(addon_directory, "shake_data.py")
-        if not os.path.exists(target_file):
-            raise FileNotFoundError(f"shake_data.py not found at: {target_file}")
-        # Load the SHAKE_LIST from the defined filepath and target file
-        source_shake_list = load_shake_list(filepath)
-        if source_shake_list is None:
-            raise ValueError(f"No SHAKE_LIST found in the source file: {filepath}")
-        target_shake_list = load_shake_list(target_file)
-        if target_shake_list is None:
-            raise ValueError(f"No SHAKE_LIST found in the target file: {target_file}")
-        # Merge the lists
-        target_shake_list = target_shake_list | source_shake_list
-        # Save the updated list back to the target file, fully overwriting it with formatting
-        save_shake_list(target_file, target_shake_list)
-        print("Shake List successfully updated and overwritten in formatted style!")
+        paths = import_filepaths(self.filepath, self.directory, [f.name for f in self.files])
+        if len(paths) == 0:
+            self.report({'ERROR'}, "No shake files selected")
+            return {'CANCELLED'}
+
+        # Read all files at once, then write the library a single time.
+        wm = context.window_manager
+        wm.progress_begin(0, len(paths))
+        try:
+            sources = read_shake_list_sources(paths, progress=lambda done, total: wm.progress_update(done))
+        finally:
+            wm.progress_end()
+        failed = [source for source in sources if source.error is not None]
+        for source in failed:
+            print("Couldn't import {}: {}".format(source.path, source.error))
+        if len(failed) == len(sources):
+            self.report({'ERROR'}, "Couldn't import {}: {}".format(os.path.basename(failed[0].path), failed[0].error))
+            return {'CANCELLED'}
+
+        # Merge the lists.  Later files win over earlier ones.
+        target_clips = {}
+        shake_count = 0
+        key_count = 0
+        sample_count = 0
+        for source in sources:
+            for clip in source.clips:
+                target_clips[clip.id] = clip
+                sample_count += clip.frame_count * len(clip.channels)
+            shake_count += len(source.clips)
+            key_count += source.key_count
+        # Only the new shakes are written, each to a file of its own.
+        try:
+            add_shakes(target_clips.values())
+        except (OSError, ShakeLibraryError) as exc:
+            self.report({'ERROR'}, "Couldn't add the shakes to the library: {}".format(exc))
+            return {'CANCELLED'}
+        if key_count < sample_count:
+            self.report({'INFO'}, "Expanded {} keys to {} samples ({:.1f}:1)".format(key_count, sample_count, sample_count / max(key_count, 1)))
+        if len(failed) > 0:
+            self.report({'WARNING'}, "Imported {} shakes from {} files, {} files failed (see the console)".format(
+                shake_count, len(sources) - len(failed), len(failed)))
+        else:
+            self.report({'INFO'}, "Imported {} shakes from {} files".format(shake_count, len(sources)))
         prev_context = bpy.context.area.type
         bpy.context.area.type = 'VIEW_3D'
         bpy.ops.sna.list_shakes_1252f('INVOKE_DEFAULT', )
@@ -885,22 +2352,9 @@ class SNA_OT_Uninstall_Shake_88F90(bpy.types.Operator):
 
     def execute(self, context):
         item_to_remove = bpy.context.scene.sna_all_shakes[self.sna_item_index].shake_id
-        # Importing necessary module
-        # Define the variable with the value to delete
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        file_name = "shake_data.py"
-        file_path = os.path.join(current_dir, file_name)
-        # Read the original file content
-        with open(file_path, "r") as file:
-            data = file.read()
-        # Parse the file content into a Python dictionary
-        parsed_data = ast.literal_eval(data[data.index('=') + 1:].strip())
-        # Remove the value from the dictionary
-        if item_to_remove in parsed_data:
-            del parsed_data[item_to_remove]
-        # Write the updated data back to the file
-        with open(file_path, "w") as file:
-            file.write(f"SHAKE_LIST = {parsed_data}")
+        # Drops the shake from the library's manifest and deletes its file
+        if item_to_remove in SHAKE_LIBRARY:
+            remove_shakes([item_to_remove])
         if (self.sna_item_index == int(len(bpy.context.scene.sna_all_shakes) - 1.0)):
             if len(bpy.context.scene.sna_all_shakes) > self.sna_item_index:
                 bpy.context.scene.sna_all_shakes.remove(self.sna_item_index)
@@ -913,6 +2367,33 @@ class SNA_OT_Uninstall_Shake_88F90(bpy.types.Operator):
         return context.window_manager.invoke_confirm(self, event)
 
 
+class SNA_OT_Compact_Shake_Library_3C1E5(bpy.types.Operator):
+    """Packs the shake library into a single file and deletes the files of removed and replaced shakes"""
+    bl_idname = "sna.compact_shake_library_3c1e5"
+    bl_label = "Compact Shake Library"
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context):
+        return SHAKE_LIBRARY is not None
+
+    def execute(self, context):
+        compact_shake_library()
+        self.report({'INFO'}, "Compacted {} shakes into one file".format(len(SHAKE_LIBRARY)))
+        return {"FINISHED"}
+
+
+# Python references into the file don't survive loading it, nor undo and
+# redo, which reload it from memory.
+@persistent
+def shake_rig_index_reset_handler(dummy):
+    SHAKE_RIG_INDEX.invalidate()
+    reset_shake_actions()
+    _shake_animation_signatures.clear()
+    _scene_rig_signatures.clear()
+    _pending_rig_checks.clear()
+
+
 @persistent
 def load_pre_handler_59087(dummy):
     prev_context = bpy.context.area.type
@@ -940,34 +2421,16 @@ class SNA_OT_List_Shakes_1252F(bpy.types.Operator):
         import os
 
         def load_shake_data():
-            # Get the directory of the currently loaded addon
-            addon_dir = os.path.dirname(os.path.abspath(__file__))
-            # Construct the path to shake_data.py
-            file_name = "shake_data.py"
-            file_path = os.path.join(addon_dir, file_name)
-            # Check if the file exists
-            if not os.path.isfile(file_path):
-                print(f"Error: {file_name} not found in the addon directory.")
-                return None, None
-            # Dynamically load the shake_data.py file
-            spec = importlib.util.spec_from_file_location("shake_data", file_path)
-            shake_data = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(shake_data)
-            # Extract SHAKE_LIST from the loaded module
-            SHAKE_LIST = getattr(shake_data, "SHAKE_LIST", None)
-            if SHAKE_LIST is None:
-                print("Error: SHAKE_LIST not found in shake_data.py.")
-                return None, None
-            # Extract shake names and IDs
-            shake_names = [value[0] for value in SHAKE_LIST.values()]
-            shake_ids = list(SHAKE_LIST.keys())
+            # Check if the library is open
+            if SHAKE_LIBRARY is None:
+                print("Error: the shake library isn't loaded.")
+                return [], []
+            # Only the library manifest is read here, not the channel data
+            shake_ids = list(SHAKE_LIBRARY.keys())
+            shake_names = [SHAKE_LIBRARY.info(id).name for id in shake_ids]
             return shake_names, shake_ids
         # Use the function within the addon
         shake_names, shake_ids = load_shake_data()
-        # Print results for debugging
-        if shake_names and shake_ids:
-            print("Shake Names:", shake_names)
-            print("Shake IDs:", shake_ids)
         for i_CF8A3 in range(len(shake_names)):
             item_6F9F2 = bpy.context.scene.sna_all_shakes.add()
             item_6F9F2.shake_id = shake_ids[i_CF8A3]
@@ -981,6 +2444,39 @@ class SNA_OT_List_Shakes_1252F(bpy.types.Operator):
 class SNA_AddonPreferences_80B3B(bpy.types.AddonPreferences):
     bl_idname = __package__
 
+    shake_cache_size: bpy.props.IntProperty(
+        name="Shake Cache Size (MB)",
+        description="Memory budget for decoded shake data. Least recently used shakes are dropped beyond it",
+        default=SHAKE_CACHE_SIZE_DEFAULT,
+        min=0,
+        update=on_shake_cache_size_update,
+    )
+    shake_action_cache_size: bpy.props.IntProperty(
+        name="Unused Shake Action Budget (MB)",
+        description="Memory kept for shake actions no camera uses anymore, so they can be reused. Least recently used ones are deleted beyond it",
+        default=SHAKE_ACTION_CACHE_SIZE_DEFAULT,
+        min=0,
+        update=on_shake_action_cache_size_update,
+    )
+    shake_location_tolerance: bpy.props.FloatProperty(
+        name="Location Key Tolerance",
+        description="Largest location error allowed when reducing shake keys, at full scale and influence. 0 keeps a key on every frame",
+        default=SHAKE_LOCATION_TOLERANCE_DEFAULT,
+        min=0.0,
+        precision=4,
+        subtype='DISTANCE',
+        update=on_shake_key_tolerance_update,
+    )
+    shake_rotation_tolerance: bpy.props.FloatProperty(
+        name="Rotation Key Tolerance",
+        description="Largest rotation error allowed when reducing shake keys, at full scale and influence. 0 keeps a key on every frame",
+        default=SHAKE_ROTATION_TOLERANCE_DEFAULT,
+        min=0.0,
+        precision=3,
+        subtype='ANGLE',
+        update=on_shake_key_tolerance_update,
+    )
+
     def draw(self, context):
         if not (False):
             layout = self.layout 
@@ -998,6 +2494,11 @@ class SNA_AddonPreferences_80B3B(bpy.types.AddonPreferences):
             if not True: split_29DDD.operator_context = "EXEC_DEFAULT"
             split_29DDD.label(text='PLEASE REPORT ANY BUG TO', icon_value=707)
             op = split_29DDD.operator('sna.open_report_cf637', text='Google Forms', icon_value=100, emboss=True, depress=False)
+            layout.prop(self, 'shake_cache_size')
+            layout.prop(self, 'shake_action_cache_size')
+            layout.prop(self, 'shake_location_tolerance')
+            layout.prop(self, 'shake_rotation_tolerance')
+            layout.operator('sna.compact_shake_library_3c1e5', icon_value=string_to_icon('FILE_REFRESH'))
 
 
 class SNA_OT_Open_Report_Cf637(bpy.types.Operator):
@@ -1013,6 +2514,7 @@ class SNA_OT_Open_Report_Cf637(bpy.types.Operator):
         return not False
 
     def execute(self, context):
+        import webbrowser
         webbrowser.open('https://docs.google.com/forms/d/e/1FAIpQLSe6kpkTUCDTfEn1czsim7gFjbwI1S7Wq4n-jjdENwfrngPpOg/viewform?usp=dialog')  # Go to example.com
         return {"FINISHED"}
 
@@ -1116,7 +2618,9 @@ def sna_shakes_enum_items(self, context):
 
 
 def register():
-    global _icons
+    global _icons, SHAKE_PREVIEWS
+    load_shake_library()
+    SHAKE_PREVIEWS = PreviewCache(os.path.join(SHAKE_STORE_PATH, "previews"))
     _icons = bpy.utils.previews.new()
     bpy.utils.register_class(SNA_GROUP_sna_property_groups)
     bpy.types.Scene.sna_camera = bpy.props.PointerProperty(name='Camera', description='', type=bpy.types.Camera)
@@ -1138,9 +2642,19 @@ def register():
     bpy.utils.register_class(SNA_OT_Import_Shakes_743F2)
     bpy.utils.register_class(SNA_PT_CAMERA_SHAKIFY_2_9D90B)
     bpy.utils.register_class(SNA_OT_Uninstall_Shake_88F90)
+    bpy.utils.register_class(SNA_OT_Compact_Shake_Library_3C1E5)
     bpy.app.handlers.load_pre.append(load_pre_handler_59087)
+    bpy.app.handlers.depsgraph_update_post.append(shake_rig_mode_depsgraph_handler)
+    bpy.app.handlers.load_post.append(shake_rig_index_reset_handler)
+    bpy.app.handlers.undo_post.append(shake_rig_index_reset_handler)
+    bpy.app.handlers.redo_post.append(shake_rig_index_reset_handler)
     bpy.utils.register_class(SNA_OT_List_Shakes_1252F)
     bpy.utils.register_class(SNA_AddonPreferences_80B3B)
+    prefs = bpy.context.preferences.addons.get(__package__)
+    if prefs is not None:
+        SHAKE_CACHE.set_max_bytes(prefs.preferences.shake_cache_size * 2**20)
+        SHAKE_ACTION_CACHE.set_max_bytes(prefs.preferences.shake_action_cache_size * 2**20)
+        set_shake_key_tolerances(prefs.preferences)
     bpy.utils.register_class(SNA_OT_Open_Report_Cf637)
     bpy.utils.register_class(SNA_PT_EXPORT_SHAKE_AD9A3)
     bpy.utils.register_class(CameraShakifyPanel)
@@ -1150,6 +2664,10 @@ def register():
     bpy.utils.register_class(CameraShakeRemove)
     bpy.utils.register_class(CameraShakeMove)
     bpy.utils.register_class(CameraShakesFixGlobal)
+    bpy.utils.register_class(CameraShakesBake)
+    bpy.utils.register_class(CameraShakesUnbake)
+    bpy.utils.register_class(CameraShakeMetricsReset)
+    bpy.utils.register_class(CameraShakeMetricsExport)
     #bpy.utils.register_class(ActionToPythonData)
     #bpy.types.VIEW3D_MT_object.append(
     #    lambda self, context : self.layout.operator(ActionToPythonData.bl_idname)
@@ -1158,15 +2676,47 @@ def register():
     # The list of camera shakes active on an camera, along with each shake's parameters.
     bpy.types.Object.camera_shakes = bpy.props.CollectionProperty(type=CameraShakeInstance)
     bpy.types.Object.camera_shakes_active_index = bpy.props.IntProperty(name="Camera Shake List Active Item Index")
+    # Identifies the camera to its shake empties, see ShakeRigIndex.ensure_camera_uid().
+    bpy.types.Object.camera_shakes_uid = bpy.props.IntProperty(name="Camera Shakes UID", default=0, options={'HIDDEN'}, override=set())
+    bpy.types.Object.camera_shakes_rig_mode = bpy.props.EnumProperty(
+        name="Rig Mode",
+        description="How the camera's live shakes are evaluated",
+        items=[
+            ('DRIVERS', "Drivers", "Time and scale every shake with Python drivers"),
+            ('NLA', "NLA", "Play shakes with NLA strips and fixed constraint influences, falling back to drivers only where needed"),
+        ],
+        default='DRIVERS',
+        options=set(),
+        override=set(),
+        update=on_shake_rig_mode_update,
+    )
+    # Set while a camera's shakes are baked into its own action, along with
+    # the action it had before baking.
+    bpy.types.Object.camera_shakes_baked = bpy.props.BoolProperty(name="Camera Shakes Baked", default=False, options={'HIDDEN'})
+    bpy.types.Object.camera_shakes_baked_from = bpy.props.PointerProperty(name="Camera Shakes Unbaked Action", type=bpy.types.Action, options={'HIDDEN'})
     
 
     bpy.types.WindowManager.camera_shake_show_utils = bpy.props.BoolProperty(name="Show Camera Shake Utils UI", default=False)
+    bpy.types.WindowManager.camera_shake_metrics_enabled = bpy.props.BoolProperty(
+        name="Record Timings",
+        description="Record how long rebuilds, action builds, library loads and exports take, and count what they create",
+        default=False,
+        update=on_shake_metrics_enabled_update,
+    )
     
 
 
 def unregister():
-    global _icons
+    global _icons, SHAKE_PREVIEWS
+    if bpy.app.timers.is_registered(poll_shake_previews):
+        bpy.app.timers.unregister(poll_shake_previews)
+    if bpy.app.timers.is_registered(check_shake_rig_modes):
+        bpy.app.timers.unregister(check_shake_rig_modes)
+    SHAKE_PREVIEWS.close()
+    SHAKE_PREVIEWS = None
+    shake_metrics.set_enabled(False)
     bpy.utils.previews.remove(_icons)
+    _icons = None
     wm = bpy.context.window_manager
     kc = wm.keyconfigs.addon
     for km, kmi in addon_keymaps.values():
@@ -1192,7 +2742,12 @@ def unregister():
     bpy.utils.unregister_class(SNA_OT_Import_Shakes_743F2)
     bpy.utils.unregister_class(SNA_PT_CAMERA_SHAKIFY_2_9D90B)
     bpy.utils.unregister_class(SNA_OT_Uninstall_Shake_88F90)
+    bpy.utils.unregister_class(SNA_OT_Compact_Shake_Library_3C1E5)
     bpy.app.handlers.load_pre.remove(load_pre_handler_59087)
+    bpy.app.handlers.depsgraph_update_post.remove(shake_rig_mode_depsgraph_handler)
+    bpy.app.handlers.load_post.remove(shake_rig_index_reset_handler)
+    bpy.app.handlers.undo_post.remove(shake_rig_index_reset_handler)
+    bpy.app.handlers.redo_post.remove(shake_rig_index_reset_handler)
     bpy.utils.unregister_class(SNA_OT_List_Shakes_1252F)
     bpy.utils.unregister_class(SNA_AddonPreferences_80B3B)
     bpy.utils.unregister_class(SNA_OT_Open_Report_Cf637)
@@ -1204,7 +2759,12 @@ def unregister():
     bpy.utils.unregister_class(CameraShakeRemove)
     bpy.utils.unregister_class(CameraShakeMove)
     bpy.utils.unregister_class(CameraShakesFixGlobal)
+    bpy.utils.unregister_class(CameraShakesBake)
+    bpy.utils.unregister_class(CameraShakesUnbake)
+    bpy.utils.unregister_class(CameraShakeMetricsReset)
+    bpy.utils.unregister_class(CameraShakeMetricsExport)
     #bpy.utils.unregister_class(ActionToPythonData)
+    unload_shake_library()
 
 
 if __name__ == "__main__":
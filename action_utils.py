@@ -17,47 +17,210 @@
 #======================= END GPL LICENSE BLOCK ========================
 
 
+import io
+from collections import OrderedDict
+
 import bpy
+import numpy as np
 from bpy.types import Action, Context
+from .shake_export import write_shake
+from .shake_metrics import count, timed_function
+from .shake_reduce import bezier_handles, key_slopes, reduce_channel
+
+
+# Approximate memory Blender uses per keyframe (one BezTriple).
+KEYFRAME_BYTES = 72
+
+
+class ActionSampler:
+    """Samples the F-curves of an action once per frame, for shake_export"""
+
+    # Curves without modifiers that have a keyframe on every frame of
+    # frame_start..frame_end are read straight from their keyframes with one
+    # foreach_get(), which is what captured and exported shakes look like.
+    # Their values are kept as float32, 4 of the 72 bytes Blender itself
+    # holds per keyframe.  Anything else goes through curve.evaluate(), one
+    # requested window at a time.
+    def __init__(self, act: Action, frame_start, frame_end):
+        self.frame_start = frame_start
+        self.frame_end = frame_end
+        self.curves = list(act.fcurves)
+        self.keys = [(curve.data_path, curve.array_index) for curve in self.curves]
+        self.keyed = [_dense_keyframe_values(curve, frame_start, frame_end) for curve in self.curves]
+
+    def sample(self, frame_start, frame_end, columns=None):
+        if columns is None:
+            columns = range(len(self.curves))
+        out = np.empty((frame_end - frame_start + 1, len(columns)), dtype=np.float32)
+        for out_column, column in enumerate(columns):
+            keyed = self.keyed[column]
+            if keyed is not None:
+                out[:, out_column] = keyed[frame_start - self.frame_start:frame_end - self.frame_start + 1]
+            else:
+                curve = self.curves[column]
+                out[:, out_column] = [curve.evaluate(frame) for frame in range(frame_start, frame_end + 1)]
+        return out
+
+
+# Values of `curve` at `frames` taken from its keyframes, or None when the
+# curve has to be evaluated to get them.
+def _keyframe_samples(curve, frames):
+    count = len(curve.keyframe_points)
+    if count == 0 or len(curve.modifiers) > 0 or len(frames) == 0:
+        return None
+    co = np.empty(count * 2, dtype=np.float64)
+    curve.keyframe_points.foreach_get("co", co)
+    key_frames = co[0::2]
+    if np.any(np.diff(key_frames) <= 0.0):
+        return None
+    positions = np.searchsorted(key_frames, frames)
+    if positions[-1] >= count or not np.array_equal(key_frames[positions], frames):
+        return None
+    return co[1::2][positions]
+
+
+# Values of the keyframes of `curve` on frame_start..frame_end as float32,
+# or None unless it has a keyframe on every frame from its first to its
+# last, covering that range.  The keyframes are read as float32 too, so
+# the only copy of the whole curve that's made takes 8 bytes per key.
+def _dense_keyframe_values(curve, frame_start, frame_end):
+    count = len(curve.keyframe_points)
+    if count == 0 or len(curve.modifiers) > 0:
+        return None
+    co = np.empty(count * 2, dtype=np.float32)
+    curve.keyframe_points.foreach_get("co", co)
+    first = co[0]
+    if first != int(first) or first > frame_start or first + count - 1 < frame_end:
+        return None
+    if not np.array_equal(co[0::2], np.arange(first, first + count, dtype=np.float32)):
+        return None
+    first = int(first)
+    return co[2 * (frame_start - first) + 1:2 * (frame_end - first) + 2:2].copy()
 
 
-def action_to_python_data_text(act: Action, text_block_name):
-    channels = {}
+# Values of `curve` at every frame of frame_start..frame_end, as float64.
+def sample_fcurve(curve, frame_start, frame_end):
+    frames = np.arange(frame_start, frame_end + 1, dtype=np.float64)
+    values = _keyframe_samples(curve, frames)
+    if values is None:
+        values = np.array([curve.evaluate(frame) for frame in range(frame_start, frame_end + 1)], dtype=np.float64)
+    return values
+
+
+# Replaces the F-curve for data_path[index] in `act` with one auto-handled
+# keyframe per value, on consecutive frames from frame_start.
+def write_fcurve_samples(act: Action, data_path, index, frame_start, values, group=""):
+    curve = act.fcurves.find(data_path, index=index)
+    if curve is not None:
+        act.fcurves.remove(curve)
+    curve = act.fcurves.new(data_path, index=index, action_group=group)
+    count = len(values)
+    co = np.empty((count, 2), dtype=np.float32)
+    co[:, 0] = np.arange(frame_start, frame_start + count)
+    co[:, 1] = values
+    curve.keyframe_points.add(count)
+    curve.keyframe_points.foreach_set("co", co.ravel())
+    _set_auto_handles(curve, count)
+    curve.update()
+    return curve
+
+
+# Writes `act`, over its frame range, to a new text block as a SHAKE_LIST
+# for the shake library importer, at `fps` frames per second.
+def action_to_python_data_text(act: Action, text_block_name, fps):
     act_range = action_frame_range(act)
-    for curve in act.fcurves:
-        baked_keys = []
-        for frame in range(int(act_range[0]), int(act_range[1]) + 1):
-            baked_keys += [(frame, curve.evaluate(frame))]
-        channels[(curve.data_path, curve.array_index)] = baked_keys
-
-    text = "{\n"
-    for k in channels:
-        text += "  {}: [".format(k)
-        for point in channels[k]:
-            text += "({}, {:.6f}), ".format(point[0], point[1])
-        text += "],\n"
-    text += "}\n"
-    
-    return bpy.data.texts.new(text_block_name).from_string(text)
+    sampler = ActionSampler(act, int(act_range[0]), int(act_range[1]))
+    f = io.StringIO()
+    write_shake(f, "PY", sampler, act.name.upper().replace(" ", "_"), act.name, fps)
+    return bpy.data.texts.new(text_block_name).from_string(f.getvalue())
+
+
+# Enum value of a keyframe handle type, for use with foreach_set().
+def _handle_type_value(handle_type):
+    prop = bpy.types.Keyframe.bl_rna.properties["handle_left_type"]
+    return prop.enum_items[handle_type].value
+
+
+# Sets the handle types of all keyframes of `curve`.  Goes through
+# foreach_set() when the enum can be written that way, else one key at a time.
+def _set_handle_types(curve, count, handle_type):
+    try:
+        types = np.full(count, _handle_type_value(handle_type), dtype=np.int32)
+        curve.keyframe_points.foreach_set("handle_left_type", types)
+        curve.keyframe_points.foreach_set("handle_right_type", types)
+    except (TypeError, RuntimeError, KeyError):
+        for point in curve.keyframe_points:
+            point.handle_left_type = handle_type
+            point.handle_right_type = handle_type
+
+
+def _set_auto_handles(curve, count):
+    _set_handle_types(curve, count, 'AUTO')
 
+
+# Writes keys `co` (shape (count, 2)) with free handles that make the curve
+# the one shake_reduce describes through them.
+def _write_reduced_keys(curve, co, cyclic):
+    count = len(co)
+    slopes = key_slopes(co[:, 0], co[:, 1], cyclic)
+    left, right = bezier_handles(co[:, 0], co[:, 1], slopes)
+    curve.keyframe_points.add(count)
+    curve.keyframe_points.foreach_set("co", co.astype(np.float32).ravel())
+    _set_handle_types(curve, count, 'FREE')
+    curve.keyframe_points.foreach_set("handle_left", left.astype(np.float32).ravel())
+    curve.keyframe_points.foreach_set("handle_right", right.astype(np.float32).ravel())
+
+
+# `data` is a ShakeClip, or a {(data_path, array_index): [(frame, value), ...]}
+# dict in the legacy SHAKE_LIST layout.
+#
 # rot_factor and loc_factor are scaling factors for rotation and
 # location values, respectively.
-def python_data_to_loop_action(data, action_name, rot_factor=1.0, loc_factor=1.0) -> Action:
+#
+# With a location or rotation tolerance (in the clip's units, before
+# scaling), those channels are reduced to the keys shake_reduce picks
+# instead of one key per frame.
+#
+# The keyframes of each F-curve are written in one go with foreach_set(),
+# since setting them one at a time costs several RNA calls per key.
+@timed_function()
+def python_data_to_loop_action(data, action_name, rot_factor=1.0, loc_factor=1.0, location_tolerance=0.0, rotation_tolerance=0.0) -> Action:
+    if not isinstance(data, ShakeClip):
+        data = ShakeClip.from_channel_points(data, action_name)
     act = bpy.data.actions.new(action_name)
-    for k in data:
+    frames = np.arange(data.frame_start, data.frame_start + data.frame_count, dtype=np.float32)
+    for k, samples in data.channels.items():
+        count = len(samples)
+        if count == 0:
+            continue
+        factor = 1.0
+        tolerance = 0.0
+        if k[0].startswith("rotation"):
+            factor = rot_factor
+            tolerance = rotation_tolerance
+        elif k[0].startswith("location"):
+            factor = loc_factor
+            tolerance = location_tolerance
+
         curve = act.fcurves.new(k[0], index=k[1])
-        curve.keyframe_points.add(len(data[k]))
-        for i in range(len(data[k])):
-            co = [data[k][i][0], data[k][i][1]]
-            if k[0].startswith("rotation"):
-                co[1] *= rot_factor
-            if k[0].startswith("location"):
-                co[1] *= loc_factor
-
-            curve.keyframe_points[i].co = co
-            curve.keyframe_points[i].handle_left_type = 'AUTO'
-            curve.keyframe_points[i].handle_right_type = 'AUTO'
-        curve.keyframe_points[-1].co[1] = curve.keyframe_points[0].co[1] # Ensure looping.
+        if tolerance > 0.0:
+            values = np.frombuffer(samples, dtype=np.float32, count=count).astype(np.float64)
+            values[-1] = values[0] # Ensure looping.
+            keep = reduce_channel(values, tolerance, cyclic=True)
+            co = np.empty((len(keep), 2), dtype=np.float64)
+            co[:, 0] = frames[keep]
+            co[:, 1] = values[keep] * factor
+            _write_reduced_keys(curve, co, cyclic=True)
+        else:
+            co = np.empty((count, 2), dtype=np.float32)
+            co[:, 0] = frames[:count]
+            co[:, 1] = np.frombuffer(samples, dtype=np.float32, count=count)
+            if factor != 1.0:
+                co[:, 1] *= factor
+            co[-1, 1] = co[0, 1] # Ensure looping.
+            curve.keyframe_points.add(count)
+            curve.keyframe_points.foreach_set("co", co.ravel())
+            _set_auto_handles(curve, count)
         curve.modifiers.new('CYCLES')
         curve.update()
     act.use_fake_user = False
@@ -72,3 +235,104 @@ def action_frame_range(act: Action):
         r[0] = min(r[0], cr[0])
         r[1] = max(r[1], cr[1])
     return r
+
+
+# Approximate memory used by the keyframes of `act`.
+def action_nbytes(act: Action):
+    return sum(len(curve.keyframe_points) for curve in act.fcurves) * KEYFRAME_BYTES
+
+
+def _is_alive(id):
+    try:
+        id.name
+    except ReferenceError:
+        return False
+    return True
+
+
+class ActionCache:
+    """Generated actions in bpy.data keyed by what they were generated from, with LRU eviction of unused ones"""
+
+    # Every cached action records its key in the custom property
+    # `key_prop`, so actions that come with a file are recognized when
+    # they're first looked up.  Actions in use are never evicted.  The
+    # ones nobody uses anymore are kept around for reuse, up to
+    # `max_bytes` of them (see action_nbytes()), least recently used
+    # first to go.  Blender doesn't save actions without users, so those
+    # never end up in the .blend file either way.
+    def __init__(self, max_bytes, key_prop):
+        self.max_bytes = max_bytes
+        self.key_prop = key_prop
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # Returns the action for `key`, calling `build(name)` to generate it
+    # on a miss.  `name` is what it's looked up by in bpy.data, and
+    # `legacy_key` what an action of that name without a key counts as.
+    def get(self, key, name, build, legacy_key=None):
+        entry = self._entries.get(key)
+        if entry is not None and _is_alive(entry[0]):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            count("actions_reused")
+            return entry[0]
+
+        act = bpy.data.actions.get(name)
+        if act is not None and act.get(self.key_prop, legacy_key) == key:
+            self.hits += 1
+            count("actions_reused")
+        else:
+            self.misses += 1
+            count("actions_built")
+            act = build(name)
+        act[self.key_prop] = key
+        self._entries[key] = (act, action_nbytes(act))
+        self._entries.move_to_end(key)
+        return act
+
+    # Starts tracking an action generated earlier, e.g. one that came with
+    # the file, as the least recently used one.
+    def adopt(self, act, key):
+        if key not in self._entries:
+            self._entries[key] = (act, action_nbytes(act))
+            self._entries.move_to_end(key, last=False)
+
+    # Memory used by cached actions that nobody uses.
+    @property
+    def unused_bytes(self):
+        return sum(size for act, size in self._entries.values() if _is_alive(act) and act.users == 0)
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.evict()
+
+    # Deletes the least recently used actions without users until the
+    # remaining unused ones fit in the budget.
+    def evict(self):
+        unused = []
+        for key, (act, size) in list(self._entries.items()):
+            if not _is_alive(act):
+                del self._entries[key]
+            elif act.users == 0:
+                unused += [(key, act, size)]
+        excess = sum(size for _, _, size in unused) - self.max_bytes
+        doomed = []
+        for key, act, size in unused:
+            if excess <= 0:
+                break
+            doomed += [act]
+            del self._entries[key]
+            excess -= size
+        if len(doomed) > 0:
+            self.evictions += len(doomed)
+            bpy.data.batch_remove(doomed)
+
+    # Forgets every action, e.g. because references into bpy.data went
+    # stale.  The actions themselves are left alone.
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,107 @@
+# Times building shake actions with python_data_to_loop_action(), against
+# the old approach of setting every keyframe one at a time.
+#
+# Runs inside Blender, since it creates real actions:
+#
+#   blender --background --factory-startup --python benchmarks/bench_action_build.py
+#   blender --background --factory-startup --python benchmarks/bench_action_build.py -- --frames 100000
+#
+# Every bundled shake is built, plus one synthetic capture that is
+# --frames long (100k frames by default).
+
+import argparse
+import importlib
+import math
+import os
+import sys
+import time
+import types
+from array import array
+
+import bpy
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "camera_shakify_bench"
+
+
+# Imports the addon's submodules without running its __init__.py.
+def import_addon_module(name):
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(PACKAGE + "." + name)
+
+
+# The keyframe loop python_data_to_loop_action() used before it
+# switched to foreach_set().
+def per_key_loop_action(data, action_name, rot_factor=1.0, loc_factor=1.0):
+    act = bpy.data.actions.new(action_name)
+    frames = data.frames
+    for k, samples in data.channels.items():
+        curve = act.fcurves.new(k[0], index=k[1])
+        curve.keyframe_points.add(len(samples))
+        for i in range(len(samples)):
+            co = [frames[i], samples[i]]
+            if k[0].startswith("rotation"):
+                co[1] *= rot_factor
+            if k[0].startswith("location"):
+                co[1] *= loc_factor
+
+            curve.keyframe_points[i].co = co
+            curve.keyframe_points[i].handle_left_type = 'AUTO'
+            curve.keyframe_points[i].handle_right_type = 'AUTO'
+        curve.keyframe_points[-1].co[1] = curve.keyframe_points[0].co[1]
+        curve.modifiers.new('CYCLES')
+        curve.update()
+    act.use_fake_user = False
+    act.user_clear()
+    return act
+
+
+def synthetic_clip(shake_library, frame_count):
+    channels = {}
+    for path in ("location", "rotation_euler"):
+        for index in range(3):
+            phase = index + (3 if path == "location" else 0)
+            channels[(path, index)] = array("f", (
+                math.sin(frame * 0.05 + phase) * 0.01 for frame in range(frame_count)
+            ))
+    return shake_library.ShakeClip("SYNTHETIC", "Synthetic", 24.0, 1, channels)
+
+
+def time_build(build, clips):
+    t0 = time.perf_counter()
+    for clip in clips:
+        act = build(clip, "bench_" + clip.id, 1.0, 1.0)
+        bpy.data.actions.remove(act)
+    return time.perf_counter() - t0
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_action_build.py")
+    parser.add_argument("--frames", type=int, default=100000, help="Length of the synthetic capture")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    shake_library = import_addon_module("shake_library")
+    action_utils = import_addon_module("action_utils")
+    with shake_library.ShakeLibrary(os.path.join(ADDON_DIR, "shake_data.shklib")) as lib:
+        bundled = list(lib.clips())
+    cases = [
+        ("all bundled shakes ({})".format(len(bundled)), bundled),
+        ("synthetic capture ({:,} frames)".format(args.frames), [synthetic_clip(shake_library, args.frames)]),
+    ]
+
+    for label, clips in cases:
+        keys = sum(clip.frame_count * len(clip.channels) for clip in clips)
+        per_key = min(time_build(per_key_loop_action, clips) for _ in range(args.repeat))
+        bulk = min(time_build(action_utils.python_data_to_loop_action, clips) for _ in range(args.repeat))
+        print("{}: {:,} keys".format(label, keys))
+        print("  per key:     {:9.1f} ms".format(per_key * 1000.0))
+        print("  foreach_set: {:9.1f} ms ({:.1f}x)".format(bulk * 1000.0, per_key / bulk))
+
+
+if __name__ == "__main__":
+    main()
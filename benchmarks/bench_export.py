@@ -0,0 +1,96 @@
+# Times exporting a long captured shake to every export format, against
+# the old exporter that evaluated each curve frame by frame and grew the
+# text with string concatenation.
+#
+# Runs inside Blender, since it needs real F-curves:
+#
+#   blender --background --factory-startup --python benchmarks/bench_export.py
+#   blender --background --factory-startup --python benchmarks/bench_export.py -- --frames 20000
+
+import argparse
+import importlib
+import math
+import os
+import sys
+import tempfile
+import time
+import types
+
+import bpy
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "camera_shakify_bench"
+
+
+# Imports the addon's submodules without running its __init__.py.
+def import_addon_module(name):
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(PACKAGE + "." + name)
+
+
+# The exporter as it was before ActionSampler.
+def per_frame_export(act, frame_start, frame_end):
+    channels = {}
+    for curve in act.fcurves:
+        baked_keys = []
+        for frame in range(frame_start, frame_end + 1):
+            baked_keys += [(frame, curve.evaluate(frame))]
+        channels[(curve.data_path, curve.array_index)] = baked_keys
+    text = "{\n"
+    for k in channels:
+        text += "  {}: [".format(k)
+        for point in channels[k]:
+            text += "({}, {:.6f}), ".format(point[0], point[1])
+        text += "],\n"
+    text += "}\n"
+    return text
+
+
+# A handheld-style capture: one key per frame on every transform channel.
+def captured_action(frame_count):
+    act = bpy.data.actions.new("bench_capture")
+    for path in ("location", "rotation_euler"):
+        for index in range(3):
+            phase = index + (3 if path == "location" else 0)
+            curve = act.fcurves.new(path, index=index)
+            curve.keyframe_points.add(frame_count)
+            co = []
+            for frame in range(1, frame_count + 1):
+                co += (frame, math.sin(frame * 0.05 + phase) * 0.01)
+            curve.keyframe_points.foreach_set("co", co)
+            curve.update()
+    return act
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_export.py")
+    parser.add_argument("--frames", type=int, default=20000)
+    parser.add_argument("--skip-old", action="store_true", help="Don't time the old exporter")
+    args = parser.parse_args(argv)
+
+    action_utils = import_addon_module("action_utils")
+    shake_export = import_addon_module("shake_export")
+    act = captured_action(args.frames)
+
+    print("{:,} frames x {} curves".format(args.frames, len(act.fcurves)))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for format_id, writer in shake_export.EXPORT_FORMATS.items():
+            path = os.path.join(tmp_dir, "bench" + writer.extension)
+            t0 = time.perf_counter()
+            sampler = action_utils.ActionSampler(act, 1, args.frames)
+            shake_export.export_shake(path, format_id, sampler, "BENCH", "Bench", 24.0)
+            seconds = time.perf_counter() - t0
+            print("  {:<20} {:9.1f} ms {:12,} bytes".format(writer.label, seconds * 1000.0, os.path.getsize(path)))
+    if not args.skip_old:
+        t0 = time.perf_counter()
+        per_frame_export(act, 1, args.frames)
+        old = time.perf_counter() - t0
+        print("  {:<20} {:9.1f} ms".format("old exporter", old * 1000.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# Compares loading the legacy `shake_data.py` module against the binary
+# shake library, for libraries of 13, 500 and 5,000 shakes.
+#
+# Every measurement runs in a fresh interpreter so load time and resident
+# memory aren't skewed by earlier runs.  Larger libraries are made by
+# repeating the bundled shakes under new ids.
+#
+#   python benchmarks/bench_library_format.py [--sizes 13,500,5000]
+#
+# Runs with plain Python, Blender isn't needed.  Note that importing the
+# 5,000 shake legacy module needs roughly 18 GiB of memory, since every
+# sample becomes a boxed tuple of Python objects.
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_shake_library_module():
+    spec = importlib.util.spec_from_file_location(
+        "shake_library", os.path.join(ADDON_DIR, "shake_library.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Child process snippets.  Each prints a JSON dict with the load time
+# and the resident/shared memory growth caused by the load.
+_CHILD_PRELUDE = """
+import json, os, sys, time
+def rss():
+    try:
+        with open("/proc/self/statm") as f:
+            fields = f.read().split()
+        page = os.sysconf("SC_PAGE_SIZE")
+        return int(fields[1]) * page, int(fields[2]) * page
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024, 0
+"""
+
+_CHILD_LEGACY = _CHILD_PRELUDE + """
+sys.path.insert(0, {dir!r})
+rss0, shared0 = rss()
+t0 = time.perf_counter()
+from {module} import SHAKE_LIST
+t1 = time.perf_counter()
+rss1, shared1 = rss()
+print(json.dumps({{"seconds": t1 - t0, "rss": rss1 - rss0, "shared": shared1 - shared0, "shakes": len(SHAKE_LIST)}}))
+"""
+
+_CHILD_BINARY = _CHILD_PRELUDE + """
+import importlib.util
+spec = importlib.util.spec_from_file_location("shake_library", {module!r})
+shake_library = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(shake_library)
+rss0, shared0 = rss()
+t0 = time.perf_counter()
+lib = shake_library.ShakeLibrary({path!r})
+if {touch}:
+    total = 0.0
+    for shake_id in lib:
+        for samples in lib.channels(shake_id).values():
+            total += sum(samples)
+t1 = time.perf_counter()
+rss1, shared1 = rss()
+print(json.dumps({{"seconds": t1 - t0, "rss": rss1 - rss0, "shared": shared1 - shared0, "shakes": len(lib)}}))
+"""
+
+
+def run_child(code):
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def make_clips(base, size):
+    clips = []
+    for i in range(size):
+        clip = base[i % len(base)]
+        clips.append(clip if i < len(base) else clip.renamed("{}_{}".format(clip.id, i)))
+    return clips
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="13,500,5000")
+    args = parser.parse_args()
+
+    shake_library = load_shake_library_module()
+    with shake_library.ShakeLibrary(os.path.join(ADDON_DIR, "shake_data.shklib")) as lib:
+        base = list(lib.clips())
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            clips = make_clips(base, size)
+            module = "shake_data_{}".format(size)
+            with open(os.path.join(tmp, module + ".py"), "w") as f:
+                f.write("SHAKE_LIST = {")
+                for clip in clips:
+                    f.write("{!r}: {!r}, ".format(clip.id, clip.to_shake_list_entry()))
+                f.write("}\n")
+            lib_path = os.path.join(tmp, "{}.shklib".format(size))
+            shake_library.write_library(lib_path, clips)
+            del clips
+
+            row = {
+                "shakes": size,
+                "py_bytes": os.path.getsize(os.path.join(tmp, module + ".py")),
+                "shklib_bytes": os.path.getsize(lib_path),
+            }
+            # First import compiles the source, the second one hits the .pyc.
+            row["py_cold"] = run_child(_CHILD_LEGACY.format(dir=tmp, module=module))
+            row["py_warm"] = run_child(_CHILD_LEGACY.format(dir=tmp, module=module))
+            binary_module = os.path.join(ADDON_DIR, "shake_library.py")
+            row["shklib_index"] = run_child(
+                _CHILD_BINARY.format(module=binary_module, path=lib_path, touch=False)
+            )
+            row["shklib_all_data"] = run_child(
+                _CHILD_BINARY.format(module=binary_module, path=lib_path, touch=True)
+            )
+            results.append(row)
+
+    print("{:>7} {:>12} {:>12}  {:>22} {:>22} {:>22} {:>22}".format(
+        "shakes", "py size", "shklib size",
+        "py import (cold)", "py import (.pyc)", "shklib index", "shklib + all data",
+    ))
+    for row in results:
+        cells = []
+        for key in ("py_cold", "py_warm", "shklib_index", "shklib_all_data"):
+            m = row[key]
+            cells.append("{:8.1f} ms {:7.1f} MiB".format(m["seconds"] * 1000.0, m["rss"] / 2**20))
+        print("{:>7} {:>10.1f}MB {:>10.1f}MB  {:>22} {:>22} {:>22} {:>22}".format(
+            row["shakes"], row["py_bytes"] / 1e6, row["shklib_bytes"] / 1e6, *cells
+        ))
+    print()
+    print("Memory columns are resident set growth.  Library pages are file-backed")
+    print("and shared between processes mapping the same file:")
+    for row in results:
+        print("  {} shakes: {:.1f} MiB of {:.1f} MiB resident growth is shared".format(
+            row["shakes"],
+            row["shklib_all_data"]["shared"] / 2**20,
+            row["shklib_all_data"]["rss"] / 2**20,
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# Compares reading SHAKE_LIST files with shake_parse against exec() and
+# ast.literal_eval(), the ways they used to be read, on the bundled shakes
+# and on a synthetic file of about 50 MB.
+#
+# Every reader turns the file into ShakeClips, as importing does, and runs
+# in a fresh interpreter so peak memory isn't skewed by earlier runs.
+#
+#   python benchmarks/bench_parse.py [--synthetic-mb 50] [--methods exec,literal_eval,shake_parse]
+#
+# Runs with plain Python, Blender isn't needed.  exec() and literal_eval()
+# build a syntax tree of the whole file first, which for the 50 MB file
+# takes several GiB of memory.
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "camera_shakify_bench"
+
+
+# Imports the addon's submodules without running its __init__.py.
+def import_addon_module(name):
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(PACKAGE + "." + name)
+
+
+# Child process snippets.  Each prints a JSON dict with the read time and
+# the peak resident memory growth during the read.
+_CHILD_PRELUDE = """
+import importlib, json, resource, sys, time, types
+package = types.ModuleType({package!r})
+package.__path__ = [{addon_dir!r}]
+sys.modules[{package!r}] = package
+shake_library = importlib.import_module({package!r} + ".shake_library")
+shake_parse = importlib.import_module({package!r} + ".shake_parse")
+
+def peak():
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+def entries_to_clips(shake_list):
+    return [shake_library.ShakeClip.from_shake_list_entry(shake_id, entry) for shake_id, entry in shake_list.items()]
+
+peak0 = peak()
+t0 = time.perf_counter()
+"""
+
+_CHILD_EPILOGUE = """
+t1 = time.perf_counter()
+print(json.dumps({{"seconds": t1 - t0, "peak": peak() - peak0, "shakes": len(clips)}}))
+"""
+
+READERS = {
+    # The import operator before the streaming parser.
+    "exec": """
+namespace = {{}}
+with open({path!r}, "r", encoding="utf-8") as f:
+    exec(f.read(), namespace)
+clips = entries_to_clips(namespace["SHAKE_LIST"])
+""",
+    # The uninstall path and shake_library.py before the streaming parser.
+    "literal_eval": """
+import ast
+with open({path!r}, "r", encoding="utf-8") as f:
+    text = f.read()
+clips = entries_to_clips(ast.literal_eval(text[text.index("=") + 1:].strip()))
+""",
+    "shake_parse": """
+clips, key_count = shake_parse.read_shake_file({path!r})
+""",
+}
+
+
+# Returns None if the reader failed, e.g. was killed for running out of
+# memory.
+def run_child(method, path):
+    code = _CHILD_PRELUDE + READERS[method] + _CHILD_EPILOGUE
+    code = code.format(package=PACKAGE, addon_dir=ADDON_DIR, path=path)
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    if proc.returncode != 0:
+        return None
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# Writes the bundled shakes, repeated under new ids until the file is at
+# least `size` bytes.
+def write_synthetic(shake_library, base, path, size):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("SHAKE_LIST = {\n")
+        i = 0
+        while f.tell() < size:
+            clip = base[i % len(base)]
+            text = shake_library.format_shake_list([clip.renamed("{}_{}".format(clip.id, i))])
+            f.write(text[len("SHAKE_LIST = {\n"):-len("}\n")])
+            i += 1
+        f.write("}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--synthetic-mb", type=float, default=50.0)
+    parser.add_argument("--methods", default=",".join(READERS))
+    args = parser.parse_args()
+    methods = args.methods.split(",")
+
+    shake_library = import_addon_module("shake_library")
+    with shake_library.ShakeLibrary(os.path.join(ADDON_DIR, "shake_data.shklib")) as lib:
+        base = list(lib.clips())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundled = os.path.join(tmp, "bundled.py")
+        with open(bundled, "w", encoding="utf-8") as f:
+            f.write(shake_library.format_shake_list(base))
+        synthetic = os.path.join(tmp, "synthetic.py")
+        write_synthetic(shake_library, base, synthetic, int(args.synthetic_mb * 1e6))
+
+        print("{:>10} {:>8} {:>7}  {}".format("file", "size", "shakes", "  ".join("{:>24}".format(m) for m in methods)))
+        for name, path in (("bundled", bundled), ("synthetic", synthetic)):
+            cells = []
+            shakes = 0
+            for method in methods:
+                m = run_child(method, path)
+                if m is None:
+                    cells.append("{:>24}".format("failed"))
+                    continue
+                shakes = m["shakes"]
+                cells.append("{:9.1f} ms {:8.1f} MiB".format(m["seconds"] * 1000.0, m["peak"] / 2**20))
+            print("{:>10} {:>6.1f}MB {:>7}  {}".format(name, os.path.getsize(path) / 1e6, shakes, "  ".join(cells)))
+    print()
+    print("Memory columns are peak resident set growth while reading.  Failed")
+    print("readers usually ran out of memory.")
+
+
+if __name__ == "__main__":
+    main()
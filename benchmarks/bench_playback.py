@@ -0,0 +1,80 @@
+# Measures animation playback speed of shaken cameras in both rig modes
+# (Drivers and NLA), for 1, 10 and 100 cameras.
+#
+# Runs inside Blender with the addon installed.  Python drivers only run
+# with auto-run scripts enabled, hence -y:
+#
+#   blender -y --background --factory-startup --python benchmarks/bench_playback.py -- \
+#       --module bl_ext.user_default.camera_shakify_rework
+#
+# Background Blender has no viewport, so this times scene.frame_set(),
+# which evaluates the same depsgraph (drivers, constraints, NLA) that
+# viewport playback does, minus drawing.  Treat the result as an upper
+# bound on viewport FPS.
+
+import argparse
+import sys
+import time
+
+import addon_utils
+import bpy
+
+
+def make_cameras(addon, count, shakes_per_camera, rig_mode):
+    shake_types = list(addon.SHAKE_LIBRARY.keys())
+    cameras = []
+    for i in range(count):
+        camera = bpy.data.objects.new("BenchCamera{}".format(i), bpy.data.cameras.new("BenchCamera{}".format(i)))
+        bpy.context.scene.collection.objects.link(camera)
+        camera.camera_shakes_rig_mode = rig_mode
+        for j in range(shakes_per_camera):
+            shake = camera.camera_shakes.add()
+            shake.uid = j + 1
+            shake.offset = i * 7.0 + j
+            shake.shake_type = shake_types[(i + j) % len(shake_types)]
+        cameras.append(camera)
+    return cameras
+
+
+def remove_cameras(addon, cameras):
+    for camera in cameras:
+        camera.camera_shakes.clear()
+        addon.rebuild_camera_shakes(camera, bpy.context)
+        data = camera.data
+        bpy.data.objects.remove(camera)
+        bpy.data.cameras.remove(data)
+
+
+def playback_fps(frames):
+    scene = bpy.context.scene
+    scene.frame_set(scene.frame_start)
+    t0 = time.perf_counter()
+    for frame in range(scene.frame_start, scene.frame_start + frames):
+        scene.frame_set(frame)
+    return frames / (time.perf_counter() - t0)
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_playback.py")
+    parser.add_argument("--module", required=True, help="Addon module name")
+    parser.add_argument("--cameras", default="1,10,100", help="Comma separated camera counts")
+    parser.add_argument("--shakes", type=int, default=2, help="Shakes per camera")
+    parser.add_argument("--frames", type=int, default=250)
+    args = parser.parse_args(argv)
+
+    addon = addon_utils.enable(args.module, default_set=False, handle_error=None)
+    if addon is None:
+        sys.exit("Couldn't enable " + args.module)
+    print("{:>8} {:>10} {:>10}".format("cameras", "Drivers", "NLA"))
+    for count in (int(c) for c in args.cameras.split(",")):
+        results = []
+        for rig_mode in ('DRIVERS', 'NLA'):
+            cameras = make_cameras(addon, count, args.shakes, rig_mode)
+            results.append(playback_fps(args.frames))
+            remove_cameras(addon, cameras)
+        print("{:>8} {:>8.1f} fps {:>6.1f} fps".format(count, *results))
+
+
+if __name__ == "__main__":
+    main()
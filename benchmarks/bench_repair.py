@@ -0,0 +1,92 @@
+# Times Fix All Camera Shakes on files with 10, 100 and 1,000 shaken
+# cameras, against repairing the same file camera by camera (removing the
+# shake empties one at a time and rebuilding each camera on its own, as
+# the repair used to).
+#
+# Runs inside Blender with the addon installed:
+#
+#   blender --background --factory-startup --python benchmarks/bench_repair.py -- \
+#       --module bl_ext.user_default.camera_shakify_rework
+#
+# Cameras are spread over two scenes, and every third shake uses manual
+# timing so that both pooled and private shake empties are repaired.
+
+import argparse
+import sys
+import time
+
+import addon_utils
+import bpy
+
+
+def make_file(addon, count, shakes_per_camera):
+    shake_types = list(addon.SHAKE_LIBRARY.keys())
+    scenes = [bpy.context.scene, bpy.data.scenes.new("BenchScene")]
+    cameras = []
+    for i in range(count):
+        camera = bpy.data.objects.new("BenchCamera{}".format(i), bpy.data.cameras.new("BenchCamera{}".format(i)))
+        scene = scenes[i % len(scenes)]
+        scene.collection.objects.link(camera)
+        for j in range(shakes_per_camera):
+            shake = camera.camera_shakes.add()
+            shake.uid = j + 1
+            shake.shake_type = shake_types[(i + j) % len(shake_types)]
+            shake.use_manual_timing = (i + j) % 3 == 0
+        with bpy.context.temp_override(scene=scene):
+            addon.rebuild_camera_shakes(camera, bpy.context)
+        cameras.append(camera)
+    return scenes, cameras
+
+
+def clear_file(addon, scenes, cameras):
+    for camera in cameras:
+        camera.camera_shakes.clear()
+    addon.fix_camera_shakes_globally(bpy.context)
+    for camera in cameras:
+        data = camera.data
+        bpy.data.objects.remove(camera)
+        bpy.data.cameras.remove(data)
+    for scene in scenes[1:]:
+        bpy.data.scenes.remove(scene)
+
+
+def repair_per_camera(addon, scenes):
+    for scene in scenes:
+        with bpy.context.temp_override(scene=scene):
+            collection = bpy.data.collections.get(addon.BASE_NAME)
+            if collection is not None:
+                for obj in list(collection.objects):
+                    addon.remove_shake_object(obj)
+            for obj in scene.objects:
+                if obj.type == 'CAMERA':
+                    addon.rebuild_camera_shakes(obj, bpy.context)
+
+
+def timed(function):
+    t0 = time.perf_counter()
+    function()
+    return time.perf_counter() - t0
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="bench_repair.py")
+    parser.add_argument("--module", required=True, help="Addon module name")
+    parser.add_argument("--cameras", default="10,100,1000", help="Comma separated camera counts")
+    parser.add_argument("--shakes", type=int, default=3, help="Shakes per camera")
+    args = parser.parse_args(argv)
+
+    addon = addon_utils.enable(args.module, default_set=False, handle_error=None)
+    if addon is None:
+        sys.exit("Couldn't enable " + args.module)
+    print("{:>8} {:>12} {:>12} {:>9}".format("cameras", "per camera", "batch", "speedup"))
+    for count in (int(c) for c in args.cameras.split(",")):
+        scenes, cameras = make_file(addon, count, args.shakes)
+        per_camera = timed(lambda: repair_per_camera(addon, scenes))
+        batch = timed(lambda: addon.fix_camera_shakes_globally(bpy.context))
+        clear_file(addon, scenes, cameras)
+        print("{:>8} {:>10.3f} s {:>10.3f} s {:>8.1f}x".format(count, per_camera, batch, per_camera / batch))
+
+
+if __name__ == "__main__":
+    main()
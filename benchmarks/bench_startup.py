@@ -0,0 +1,70 @@
+# Measures how long enabling the addon takes at Blender startup.
+#
+# Run it with plain Python and point it at a Blender executable; every
+# sample is taken in a fresh `blender --background --factory-startup`
+# process, so the addon modules are never already imported:
+#
+#   python benchmarks/bench_startup.py --blender /path/to/blender \
+#       --module bl_ext.user_default.camera_shakify_rework --repeat 5
+#
+# To compare two versions of the addon, install each one and run the
+# benchmark against it, or pass both module names with --module.
+
+import argparse
+import json
+import statistics
+import subprocess
+
+# Runs inside Blender.  Prints the time spent importing the addon's
+# modules and calling its register() function.
+_BLENDER_SNIPPET = """
+import json, sys, time
+import addon_utils
+t0 = time.perf_counter()
+mod = addon_utils.enable({module!r}, default_set=False, handle_error=None)
+t1 = time.perf_counter()
+if mod is None:
+    sys.exit(2)
+print("STARTUP_RESULT " + json.dumps({{"seconds": t1 - t0}}))
+"""
+
+
+def run_once(blender, module):
+    out = subprocess.run(
+        [
+            blender, "--background", "--factory-startup", "--python-exit-code", "1",
+            "--python-expr", _BLENDER_SNIPPET.format(module=module),
+        ],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    for line in out.splitlines():
+        if line.startswith("STARTUP_RESULT "):
+            return json.loads(line[len("STARTUP_RESULT "):])["seconds"]
+    raise RuntimeError("No result from Blender:\n" + out)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blender", required=True, help="Path to the Blender executable")
+    parser.add_argument("--module", action="append", required=True, help="Addon module name, can be repeated")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Also write the raw samples to this file")
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.module:
+        samples = [run_once(args.blender, module) for _ in range(args.repeat)]
+        results[module] = samples
+        print("{}: median {:.1f} ms, min {:.1f} ms over {} runs".format(
+            module,
+            statistics.median(samples) * 1000.0,
+            min(samples) * 1000.0,
+            len(samples),
+        ))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
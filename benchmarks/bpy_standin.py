@@ -0,0 +1,121 @@
+# A minimal stand-in for the parts of bpy that action_utils uses to build
+# and sample actions, so benchmarks/suite.py can time those paths with
+# plain Python.
+#
+# Keyframes are kept in numpy arrays, so foreach_set() and foreach_get()
+# cost about what copying the data costs.  Timings taken with it cover the
+# addon's own Python and numpy work, not Blender's.  Nothing here is meant
+# to behave like Blender beyond what the benchmarks call.
+
+import sys
+import types
+
+import numpy as np
+
+_HANDLE_TYPES = {"FREE": 0, "ALIGNED": 1, "VECTOR": 2, "AUTO": 3, "AUTO_CLAMPED": 4}
+
+
+class _KeyframePoints:
+    _WIDTHS = {"co": 2, "handle_left": 2, "handle_right": 2, "handle_left_type": 1, "handle_right_type": 1}
+
+    def __init__(self):
+        self._data = {name: np.zeros((0, width), dtype=np.float64) for name, width in self._WIDTHS.items()}
+
+    def __len__(self):
+        return len(self._data["co"])
+
+    def add(self, count):
+        for name, values in self._data.items():
+            self._data[name] = np.concatenate([values, np.zeros((count, values.shape[1]))])
+
+    def foreach_set(self, attr, seq):
+        values = self._data[attr]
+        values[...] = np.asarray(seq, dtype=np.float64).reshape(values.shape)
+
+    def foreach_get(self, attr, seq):
+        seq[:] = self._data[attr].ravel()
+
+
+class _Modifiers(list):
+    def new(self, type):
+        modifier = types.SimpleNamespace(type=type)
+        self.append(modifier)
+        return modifier
+
+
+class FCurve:
+    def __init__(self, data_path, index, group):
+        self.data_path = data_path
+        self.array_index = index
+        self.group = group
+        self.keyframe_points = _KeyframePoints()
+        self.modifiers = _Modifiers()
+
+    def update(self):
+        pass
+
+    def range(self):
+        co = self.keyframe_points._data["co"]
+        return (co[0, 0], co[-1, 0]) if len(co) > 0 else (0.0, 0.0)
+
+    def evaluate(self, frame):
+        co = self.keyframe_points._data["co"]
+        return float(np.interp(frame, co[:, 0], co[:, 1]))
+
+
+class _FCurves(list):
+    def new(self, data_path, index=0, action_group=""):
+        curve = FCurve(data_path, index, action_group)
+        self.append(curve)
+        return curve
+
+    def find(self, data_path, index=0):
+        for curve in self:
+            if (curve.data_path, curve.array_index) == (data_path, index):
+                return curve
+        return None
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+        self.fcurves = _FCurves()
+        self.use_fake_user = False
+        self.users = 0
+
+    def user_clear(self):
+        self.users = 0
+
+
+class _Actions(list):
+    def new(self, name):
+        action = Action(name)
+        self.append(action)
+        return action
+
+
+class Context:
+    pass
+
+
+class Keyframe:
+    bl_rna = types.SimpleNamespace(properties={
+        "handle_left_type": types.SimpleNamespace(enum_items={
+            name: types.SimpleNamespace(value=value) for name, value in _HANDLE_TYPES.items()
+        }),
+    })
+
+
+# Registers the stand-in as `bpy` and `bpy.types`.
+def install():
+    bpy = types.ModuleType("bpy")
+    bpy_types = types.ModuleType("bpy.types")
+    bpy_types.Action = Action
+    bpy_types.Context = Context
+    bpy_types.Keyframe = Keyframe
+    bpy.types = bpy_types
+    bpy.data = types.SimpleNamespace(actions=_Actions())
+    bpy.app = types.SimpleNamespace(version=(0, 0, 0), version_string="stand-in")
+    sys.modules["bpy"] = bpy
+    sys.modules["bpy.types"] = bpy_types
+    return bpy
@@ -0,0 +1,74 @@
+# Reports how much memory each bundled shake takes in the legacy
+# SHAKE_LIST layout ({key: [(frame, value), ...]}) compared to a ShakeClip.
+#
+#   python benchmarks/report_clip_memory.py
+#
+# Sizes are deep sizes from sys.getsizeof, counting every object once.
+# Small ints are cached by CPython and shared, so they're left out.
+# Runs with plain Python, Blender isn't needed.
+
+import importlib.util
+import os
+import sys
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_shake_library_module():
+    spec = importlib.util.spec_from_file_location(
+        "shake_library", os.path.join(ADDON_DIR, "shake_library.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def deep_size(obj, seen=None):
+    if seen is None:
+        seen = set()
+    if id(obj) in seen or (type(obj) is int and -5 <= obj <= 256):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_size(getattr(obj, name), seen) for name in obj.__slots__)
+    return size
+
+
+def main():
+    shake_library = load_shake_library_module()
+    with shake_library.ShakeLibrary(os.path.join(ADDON_DIR, "shake_data.shklib")) as lib:
+        clips = list(lib.clips())
+
+    print("{:<22} {:>8} {:>14} {:>14} {:>10}".format("shake", "samples", "legacy bytes", "clip bytes", "ratio"))
+    total_legacy = 0
+    total_clip = 0
+    total_samples = 0
+    for clip in clips:
+        legacy = deep_size(clip.to_shake_list_entry())
+        compact = deep_size(clip)
+        samples = clip.frame_count * len(clip.channels)
+        total_legacy += legacy
+        total_clip += compact
+        total_samples += samples
+        print("{:<22} {:>8} {:>14,} {:>14,} {:>9.1f}x".format(
+            clip.id, samples, legacy, compact, legacy / compact
+        ))
+    print("{:<22} {:>8} {:>14,} {:>14,} {:>9.1f}x".format(
+        "total", total_samples, total_legacy, total_clip, total_legacy / total_clip
+    ))
+    print()
+    print("Per shake: {:,.0f} bytes legacy, {:,.0f} bytes as ShakeClip".format(
+        total_legacy / len(clips), total_clip / len(clips)
+    ))
+    print("Per sample: {:.1f} bytes legacy, {:.1f} bytes as ShakeClip".format(
+        total_legacy / total_samples, total_clip / total_samples
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+# Benchmark suite for the addon's hot paths, writing its results as JSON so
+# that runs of different versions can be compared.
+#
+# In Blender, with the addon installed, every case runs.  Python drivers
+# only run with auto-run scripts enabled, hence -y:
+#
+#   blender -y --background --factory-startup --python benchmarks/suite.py -- \
+#       --module bl_ext.user_default.camera_shakify_rework --output results.json
+#
+# With plain Python, bpy is replaced by the stand-in of bpy_standin.py.
+# Loading, action building and export run against it, and the cases that
+# need a real scene are recorded as skipped:
+#
+#   python benchmarks/suite.py --output results.json
+#
+# To compare two result files, case by case:
+#
+#   python benchmarks/suite.py --compare old.json new.json
+#
+# Cases:
+#
+#   library_load            open the bundled library and decode every shake
+#   shake_list_parse        read the bundled shakes from a SHAKE_LIST file
+#   action_build            python_data_to_loop_action() for each shake
+#   export                  export_shake() of 1k/10k/100k frames, per format
+#   rebuild_camera_shakes   1/10/100/1,000 cameras, from scratch and with
+#                           nothing to change (Blender only)
+#   fix_camera_shakes       fix_camera_shakes_globally() (Blender only)
+#   depsgraph_eval          scene.frame_set() per frame with shaken cameras
+#                           (Blender only)
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import types
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "camera_shakify_bench"
+SUITE_VERSION = 1
+
+try:
+    import bpy
+    IN_BLENDER = True
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import bpy_standin
+    bpy = bpy_standin.install()
+    IN_BLENDER = False
+
+
+# Imports the addon's submodules without running its __init__.py.
+def import_addon_module(name):
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [ADDON_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(PACKAGE + "." + name)
+
+
+class Suite:
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = []
+
+    # Times `function` `repeat` times, calling `setup` untimed before each
+    # run and `teardown` after it.  Records the fastest run and all of them.
+    def time(self, case, params, function, setup=None, teardown=None, repeat=None):
+        samples = []
+        for _ in range(repeat or self.repeat):
+            if setup is not None:
+                setup()
+            t0 = time.perf_counter()
+            function()
+            samples.append(time.perf_counter() - t0)
+            if teardown is not None:
+                teardown()
+        self.results.append({"case": case, "params": params, "seconds": min(samples), "samples": samples})
+        print("  {:<24} {:<44} {:10.2f} ms".format(case, _format_params(params), min(samples) * 1000.0))
+
+    def skip(self, case, params, reason):
+        self.results.append({"case": case, "params": params, "skipped": reason})
+        print("  {:<24} {:<44} skipped: {}".format(case, _format_params(params), reason))
+
+
+def _format_params(params):
+    return ", ".join("{}={}".format(k, v) for k, v in params.items())
+
+
+def bench_library(suite, modules, clips):
+    shake_library = modules("shake_library")
+    shake_parse = modules("shake_parse")
+    path = os.path.join(ADDON_DIR, "shake_data.shklib")
+
+    def load():
+        with shake_library.ShakeLibrary(path) as lib:
+            list(lib.clips())
+
+    suite.time("library_load", {"shakes": len(clips)}, load)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "shakes.py")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(shake_library.format_shake_list(clips))
+        suite.time("shake_list_parse", {"shakes": len(clips), "bytes": os.path.getsize(source)},
+                   lambda: shake_parse.read_shake_file(source))
+
+
+def bench_action_build(suite, modules, clips):
+    action_utils = modules("action_utils")
+    for clip in clips:
+        built = []
+        suite.time(
+            "action_build", {"shake": clip.id, "keys": clip.frame_count * len(clip.channels)},
+            lambda: built.append(action_utils.python_data_to_loop_action(clip, "BenchAction")),
+            teardown=lambda: bpy.data.actions.remove(built.pop()),
+        )
+
+
+# An action with a key on every frame of six sine curves, like a capture.
+def captured_action(action_utils, np, frame_count):
+    act = bpy.data.actions.new("BenchCapture")
+    frames = np.arange(frame_count, dtype=np.float64)
+    for i, data_path in enumerate(("location",) * 3 + ("rotation_euler",) * 3):
+        values = np.sin(frames * 0.05 + i) * 0.01
+        action_utils.write_fcurve_samples(act, data_path, i % 3, 1, values)
+    return act
+
+
+def bench_export(suite, modules, frame_counts):
+    import numpy as np
+    action_utils = modules("action_utils")
+    shake_export = modules("shake_export")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for frame_count in frame_counts:
+            act = captured_action(action_utils, np, frame_count)
+            for format_id, writer in shake_export.EXPORT_FORMATS.items():
+                path = os.path.join(tmp_dir, "bench" + writer.extension)
+
+                def export():
+                    sampler = action_utils.ActionSampler(act, 1, frame_count)
+                    shake_export.export_shake(path, format_id, sampler, "BENCH", "Bench", 24.0)
+
+                suite.time("export", {"frames": frame_count, "format": format_id}, export)
+            bpy.data.actions.remove(act)
+
+
+def make_cameras(addon, count, shakes_per_camera):
+    shake_types = list(addon.SHAKE_LIBRARY.keys())
+    cameras = []
+    for i in range(count):
+        camera = bpy.data.objects.new("BenchCamera{}".format(i), bpy.data.cameras.new("BenchCamera{}".format(i)))
+        bpy.context.scene.collection.objects.link(camera)
+        for j in range(shakes_per_camera):
+            shake = camera.camera_shakes.add()
+            shake.uid = j + 1
+            shake.offset = i * 7.0 + j
+            shake.shake_type = shake_types[(i + j) % len(shake_types)]
+        cameras.append(camera)
+    return cameras
+
+
+def remove_cameras(addon, cameras):
+    for camera in cameras:
+        camera.camera_shakes.clear()
+    addon.fix_camera_shakes_globally(bpy.context)
+    for camera in cameras:
+        data = camera.data
+        bpy.data.objects.remove(camera)
+        bpy.data.cameras.remove(data)
+
+
+# Removes every shake empty, constraint and action, as if the file had
+# never had its rigs built.  The same teardown fix_camera_shakes_globally()
+# starts with.
+def tear_down_rigs(addon, cameras):
+    doomed = [action for action in bpy.data.actions if action.name.startswith(addon.BASE_NAME)]
+    collection = bpy.data.collections.get(addon.BASE_NAME)
+    if collection is not None:
+        doomed += list(collection.objects) + [collection]
+    for camera in cameras:
+        for constraint in [c for c in camera.constraints if c.name.startswith(addon.BASE_NAME)]:
+            addon.remove_camera_constraint(camera, constraint)
+        for shake in camera.camera_shakes:
+            shake.rig_index = -1
+    if len(doomed) > 0:
+        bpy.data.batch_remove(doomed)
+    addon.SHAKE_RIG_INDEX.invalidate()
+    addon.reset_shake_actions()
+
+
+def bench_rigs(suite, addon, camera_counts, eval_counts, shakes_per_camera, frames):
+    def rebuild_all(cameras):
+        for camera in cameras:
+            addon.rebuild_camera_shakes(camera, bpy.context)
+
+    for count in camera_counts:
+        params = {"cameras": count, "shakes": shakes_per_camera}
+        cameras = make_cameras(addon, count, shakes_per_camera)
+        suite.time("rebuild_camera_shakes", dict(params, state="cold"), lambda: rebuild_all(cameras),
+                   setup=lambda: tear_down_rigs(addon, cameras))
+        suite.time("rebuild_camera_shakes", dict(params, state="warm"), lambda: rebuild_all(cameras))
+        suite.time("fix_camera_shakes", params, lambda: addon.fix_camera_shakes_globally(bpy.context))
+        if count in eval_counts:
+            scene = bpy.context.scene
+
+            def play():
+                for frame in range(scene.frame_start, scene.frame_start + frames):
+                    scene.frame_set(frame)
+
+            suite.time("depsgraph_eval", dict(params, frames=frames), play,
+                       setup=lambda: scene.frame_set(scene.frame_start - 1))
+        remove_cameras(addon, cameras)
+
+
+def skip_rigs(suite, camera_counts, eval_counts, shakes_per_camera, frames, reason):
+    for count in camera_counts:
+        params = {"cameras": count, "shakes": shakes_per_camera}
+        suite.skip("rebuild_camera_shakes", dict(params, state="cold"), reason)
+        suite.skip("rebuild_camera_shakes", dict(params, state="warm"), reason)
+        suite.skip("fix_camera_shakes", params, reason)
+        if count in eval_counts:
+            suite.skip("depsgraph_eval", dict(params, frames=frames), reason)
+
+
+def environment():
+    import numpy as np
+    version = None
+    with open(os.path.join(ADDON_DIR, "blender_manifest.toml"), "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("version"):
+                version = line.split("=", 1)[1].strip().strip('"')
+    return {
+        "addon_version": version,
+        "blender": bpy.app.version_string if IN_BLENDER else None,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# Prints the change of every case found in both files.  Cases slower by
+# more than `threshold` are marked.
+def compare(old_path, new_path, threshold):
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+
+    def key(result):
+        return result["case"], json.dumps(result["params"], sort_keys=True)
+
+    old_results = {key(r): r for r in old["results"] if "seconds" in r}
+    regressions = 0
+    for result in new["results"]:
+        before = old_results.get(key(result))
+        if before is None or "seconds" not in result:
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] > 0.0 else float("inf")
+        slower = ratio > 1.0 + threshold
+        regressions += slower
+        print("{:<24} {:<44} {:10.2f} ms {:10.2f} ms {:6.2f}x{}".format(
+            result["case"], _format_params(result["params"]),
+            before["seconds"] * 1000.0, result["seconds"] * 1000.0, ratio, "  SLOWER" if slower else ""))
+    return regressions
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    parser = argparse.ArgumentParser(prog="suite.py")
+    parser.add_argument("--module", help="Addon module name, to run the Blender only cases")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cameras", default="1,10,100,1000", help="Comma separated camera counts")
+    parser.add_argument("--eval-cameras", default="1,10,100", help="Camera counts to time frame evaluation for")
+    parser.add_argument("--shakes", type=int, default=2, help="Shakes per camera")
+    parser.add_argument("--frames", type=int, default=100, help="Frames evaluated per depsgraph_eval run")
+    parser.add_argument("--export-frames", default="1000,10000,100000", help="Comma separated export lengths")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files instead")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Slowdown to report as a regression")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) > 0 else 0)
+
+    addon = None
+    modules = import_addon_module
+    if args.module and IN_BLENDER:
+        import addon_utils
+        addon = addon_utils.enable(args.module, default_set=False, handle_error=None)
+        if addon is None:
+            sys.exit("Couldn't enable " + args.module)
+
+        def modules(name):
+            return importlib.import_module(args.module + "." + name)
+
+    camera_counts = [int(c) for c in args.cameras.split(",")]
+    eval_counts = {int(c) for c in args.eval_cameras.split(",")}
+    suite = Suite(args.repeat)
+    print("Running in {}".format("Blender " + bpy.app.version_string if IN_BLENDER else "the bpy stand-in"))
+
+    with modules("shake_library").ShakeLibrary(os.path.join(ADDON_DIR, "shake_data.shklib")) as lib:
+        clips = list(lib.clips())
+    bench_library(suite, modules, clips)
+    bench_action_build(suite, modules, clips)
+    bench_export(suite, modules, [int(f) for f in args.export_frames.split(",")])
+    if addon is not None:
+        bench_rigs(suite, addon, camera_counts, eval_counts, args.shakes, args.frames)
+    else:
+        reason = "needs Blender" if not IN_BLENDER else "needs --module"
+        skip_rigs(suite, camera_counts, eval_counts, args.shakes, args.frames, reason)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"suite_version": SUITE_VERSION, "environment": environment(), "results": suite.results}, f, indent=1)
+        print("Wrote {}".format(args.output))
+
+
+if __name__ == "__main__":
+    main()
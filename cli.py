@@ -0,0 +1,277 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Headless batch processing of shot files.
+#
+# Applies, repairs, bakes or unbakes camera shakes in any number of .blend
+# files, each in its own background Blender, several at a time:
+#
+#   python cli.py --module bl_ext.user_default.camera_shakify_rework \
+#       --jobs 8 --report report.json repair shots/*.blend
+#   python cli.py --module ... apply --shake-type HANDYCAM_RUN --camera Camera shots/*.blend
+#   python cli.py --module ... bake --frame-start 1001 --frame-end 1100 shots/*.blend
+#
+# The Blender to run is taken from --blender, else $BLENDER, else
+# "blender" on the PATH.  It must have the addon installed; --module is
+# its module name.
+#
+# Before the workers start, one Blender enables the addon on its own, so
+# that the shake store and index it creates on first use exist before
+# several Blenders read them at once.
+#
+# Every worker Blender opens one file, runs this same script with
+# --worker, calls the addon's functions (rebuild_camera_shakes(),
+# fix_camera_shakes_globally(), bake_camera_shakes(), ...) directly, so
+# nothing depends on an active object or a UI area, and saves the file.
+# Its results are collected into one JSON report with timings per file
+# and per camera.  The exit status is 1 if any file failed.
+#
+# Only worker mode imports bpy.
+
+import argparse
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+COMMANDS = ("apply", "repair", "bake", "unbake")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="cli.py", description="Apply, repair or bake camera shakes in .blend files.")
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("files", nargs="*", help=".blend files to process")
+    parser.add_argument("--module", required=True, help="Addon module name")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of Blenders to run at once")
+    parser.add_argument("--report", help="Write the JSON report here instead of to stdout")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before a file is given up on")
+    parser.add_argument("--dry-run", action="store_true", help="Don't save the processed files")
+    parser.add_argument("--camera", action="append", default=[], help="Only process this camera (repeatable). Default: every camera")
+    parser.add_argument("--shake-type", help="apply: the shake to add")
+    parser.add_argument("--influence", type=float, help="apply: influence of the added shake")
+    parser.add_argument("--scale", type=float, help="apply: scale of the added shake")
+    parser.add_argument("--speed", type=float, help="apply: speed of the added shake")
+    parser.add_argument("--offset", type=float, help="apply: frame offset of the added shake")
+    parser.add_argument("--replace", action="store_true", help="apply: remove the cameras' other shakes first")
+    parser.add_argument("--frame-start", type=int, help="bake: first frame (default: the scene's)")
+    parser.add_argument("--frame-end", type=int, help="bake: last frame (default: the scene's)")
+    parser.add_argument("--worker", metavar="RESULT", help=argparse.SUPPRESS)
+    parser.add_argument("--prepare", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_intermixed_args(argv)
+    if args.command == "apply" and not args.shake_type:
+        parser.error("apply needs --shake-type")
+    return args
+
+
+#========================================================
+# Worker, inside Blender.
+
+# Each camera with the first scene it's in, which is the scene its rig is
+# built for, as in fix_camera_shakes_globally().
+def file_cameras(bpy, names):
+    cameras = {}
+    for scene in bpy.data.scenes:
+        for obj in scene.objects:
+            if obj.type == 'CAMERA' and obj not in cameras and (not names or obj.name in names):
+                cameras[obj] = scene
+    missing = set(names) - set(camera.name for camera in cameras)
+    if missing:
+        raise ValueError("No camera named " + ", ".join(sorted(missing)))
+    return cameras
+
+
+def apply_shake(addon, camera, context, args):
+    if args.replace:
+        camera.camera_shakes.clear()
+    settings = {"shake_type": args.shake_type}
+    for name in ("influence", "scale", "speed", "offset"):
+        if getattr(args, name) is not None:
+            settings[name] = getattr(args, name)
+    addon.add_camera_shake(camera, context, **settings)
+
+
+def process_camera(addon, camera, context, args):
+    if args.command == "apply":
+        apply_shake(addon, camera, context, args)
+    elif args.command == "bake":
+        if len(camera.camera_shakes) == 0 or camera.camera_shakes_baked:
+            return False
+        addon.bake_camera_shakes(camera, context, args.frame_start, args.frame_end)
+    elif args.command == "unbake":
+        if not camera.camera_shakes_baked:
+            return False
+        addon.unbake_camera_shakes(camera, context)
+    return True
+
+
+def run_worker(args):
+    import addon_utils
+    import bpy
+
+    result = {"file": bpy.data.filepath, "cameras": [], "timings": {}}
+    timings = result["timings"]
+    try:
+        t0 = time.perf_counter()
+        addon = addon_utils.enable(args.module, default_set=False, handle_error=None)
+        if addon is None:
+            raise RuntimeError("Couldn't enable " + args.module)
+        timings["enable"] = time.perf_counter() - t0
+        if args.prepare:
+            result["status"] = "ok"
+            return
+
+        t0 = time.perf_counter()
+        if args.command == "repair":
+            addon.fix_camera_shakes_globally(bpy.context)
+            result["cameras"] = [
+                {"name": camera.name, "shakes": len(camera.camera_shakes)}
+                for camera in file_cameras(bpy, args.camera) if len(camera.camera_shakes) > 0
+            ]
+        else:
+            for camera, scene in file_cameras(bpy, args.camera).items():
+                t1 = time.perf_counter()
+                with bpy.context.temp_override(scene=scene):
+                    changed = process_camera(addon, camera, bpy.context, args)
+                if changed:
+                    result["cameras"] += [{
+                        "name": camera.name,
+                        "shakes": len(camera.camera_shakes),
+                        "seconds": time.perf_counter() - t1,
+                    }]
+        timings[args.command] = time.perf_counter() - t0
+
+        if not args.dry_run:
+            t0 = time.perf_counter()
+            bpy.ops.wm.save_mainfile()
+            timings["save"] = time.perf_counter() - t0
+        result["status"] = "ok"
+    except Exception as exc:
+        result["status"] = "error"
+        result["error"] = "{}: {}".format(type(exc).__name__, exc)
+    finally:
+        with open(args.worker, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+
+
+#========================================================
+# Driver, outside Blender.
+
+# The worker's command line: the driver's own options, for one file, or
+# for no file with --prepare.
+def worker_command(args, argv, path, result_path):
+    files = set(args.files)
+    options = [arg for arg in argv if arg not in files]
+    if path is None:
+        return [
+            args.blender, "--background",
+            "--python", os.path.abspath(__file__),
+            "--", *options, "--worker", result_path, "--prepare",
+        ]
+    return [
+        args.blender, "--background", path,
+        "--python", os.path.abspath(__file__),
+        "--", *options, "--worker", result_path,
+    ]
+
+
+# Runs a worker Blender on `path`, or with path=None one that only
+# enables the addon, and returns its result.
+def process_file(args, argv, path, tmp_dir):
+    fd, result_path = tempfile.mkstemp(suffix=".json", dir=tmp_dir)
+    os.close(fd)
+    t0 = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            worker_command(args, argv, path, result_path),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            universal_newlines=True, timeout=args.timeout,
+        )
+        output, returncode = proc.stdout, proc.returncode
+    except subprocess.TimeoutExpired as exc:
+        output, returncode = exc.output or "", None
+    except OSError as exc:
+        output, returncode = str(exc), None
+    seconds = time.perf_counter() - t0
+
+    try:
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        result = {"status": "error", "error": "Blender didn't finish", "cameras": [], "timings": {}}
+    os.remove(result_path)
+    result["file"] = path
+    result["seconds"] = seconds
+    result["returncode"] = returncode
+    if result["status"] != "ok":
+        if isinstance(output, bytes): # TimeoutExpired doesn't decode.
+            output = output.decode("utf-8", "replace")
+        result["log"] = output[-4000:]
+    return result
+
+
+def run(args, argv):
+    t0 = time.perf_counter()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        prepare = process_file(args, argv, None, tmp_dir)
+        if prepare["status"] != "ok":
+            print("Couldn't enable the addon on its own: {}".format(prepare.get("error")), file=sys.stderr)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+            futures = [pool.submit(process_file, args, argv, os.path.abspath(path), tmp_dir) for path in args.files]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                results += [result]
+                print("{:>5} {:>8.2f} s  {}".format(result["status"], result["seconds"], result["file"]), file=sys.stderr)
+    results.sort(key=lambda result: result["file"])
+    return {
+        "command": args.command,
+        "module": args.module,
+        "jobs": args.jobs,
+        "seconds": time.perf_counter() - t0,
+        "prepare": prepare,
+        "failed": sum(1 for result in results if result["status"] != "ok"),
+        "files": results,
+    }
+
+
+def main():
+    if "--" in sys.argv:
+        argv = sys.argv[sys.argv.index("--") + 1:]
+    else:
+        argv = sys.argv[1:]
+    args = parse_args(argv)
+    if args.worker:
+        run_worker(args)
+        return
+
+    report = run(args, argv)
+    text = json.dumps(report, indent=2)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
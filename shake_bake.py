@@ -0,0 +1,194 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Evaluates a camera's shake stack with numpy, for baking it to plain
+# F-curves.
+#
+# This reproduces what the live rig computes through drivers and
+# constraints, for a whole frame range at once:
+#
+#   - A shake empty plays its loop action at a time of
+#     ((time if manual else (frame - offset) * speed) * clip fps / scene fps)
+#     wrapped to the loop length.  The loop actions use auto handles on a
+#     cyclic curve, which on evenly spaced keys is a cyclic Catmull-Rom
+#     spline through the samples.
+#   - COPY_LOCATION (local owner space, offset) adds the empty's location,
+#     weighted by its influence, to the camera's location.
+#   - COPY_ROTATION (local owner space, mix after) multiplies the
+#     camera's rotation by the empty's rotation raised to its influence.
+#
+# Rotations are handled as (w, x, y, z) quaternions.  This module doesn't
+# depend on bpy.
+
+from collections import namedtuple
+
+import numpy as np
+
+# One shake of the stack.  `time` is the position in the clip, in clip
+# samples, for every baked frame, see clip_time().  The influences are the
+# per-frame influences of the COPY_LOCATION and COPY_ROTATION constraints,
+# and loc_factor/rot_factor the factors the loop action was built with.
+ShakeLayer = namedtuple("ShakeLayer", "clip time loc_influence rot_influence loc_factor rot_factor")
+
+# (i, j, k, parity) per Euler order, as in Blender's EulerOrders table.
+_EULER_ORDERS = {
+    'XYZ': (0, 1, 2, False),
+    'XZY': (0, 2, 1, True),
+    'YXZ': (1, 0, 2, True),
+    'YZX': (1, 2, 0, False),
+    'ZXY': (2, 0, 1, False),
+    'ZYX': (2, 1, 0, True),
+}
+
+
+# Position in the clip, in samples from its first frame, at every frame of
+# `frames`.  All other arguments are per-frame arrays (or scalars) of the
+# shake item's timing properties.
+def clip_time(clip, frames, scene_fps, manual, time, speed, offset):
+    t = np.where(np.asarray(manual) > 0.5, time, (frames - offset) * speed)
+    t = t * (clip.fps / scene_fps)
+    loop_length = max(clip.frame_count - 1, 1)
+    return np.mod(t, loop_length)
+
+
+# Values of a looping channel at sample positions `t`, on the cyclic
+# Catmull-Rom spline through its samples.  The last sample closes the
+# loop, so it's taken to be equal to the first one.
+def sample_loop(samples, t):
+    values = np.asarray(samples, dtype=np.float64)
+    if len(values) < 2:
+        return np.full(np.shape(t), values[0] if len(values) else 0.0)
+    values = values[:-1]
+    count = len(values)
+    base = np.floor(t)
+    f = t - base
+    i = base.astype(np.int64)
+    p0 = values[(i - 1) % count]
+    p1 = values[i % count]
+    p2 = values[(i + 1) % count]
+    p3 = values[(i + 2) % count]
+    return 0.5 * (
+        2.0 * p1
+        + (p2 - p0) * f
+        + (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * f * f
+        + (3.0 * p1 - p0 - 3.0 * p2 + p3) * f * f * f
+    )
+
+
+def quat_multiply(a, b):
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+
+def quat_normalize(q):
+    length = np.linalg.norm(q, axis=-1, keepdims=True)
+    return np.where(length > 0.0, q / np.where(length > 0.0, length, 1.0), [1.0, 0.0, 0.0, 0.0])
+
+
+# Unit quaternions `q` raised to the per-row power `weight`, which is the
+# same as interpolating from the identity to `q` along the shortest arc.
+def quat_power(q, weight):
+    q = np.where(q[..., :1] < 0.0, -q, q)
+    half_angle = np.arccos(np.clip(q[..., 0], -1.0, 1.0))
+    sin_half = np.sin(half_angle)
+    new_half = half_angle * weight
+    scale = np.where(sin_half > 1e-12, np.sin(new_half) / np.where(sin_half > 1e-12, sin_half, 1.0), weight)
+    out = np.empty_like(q)
+    out[..., 0] = np.cos(new_half)
+    out[..., 1:] = q[..., 1:] * scale[..., None]
+    return out
+
+
+def euler_to_quat(euler, order='XYZ'):
+    euler = np.asarray(euler, dtype=np.float64)
+    q = np.zeros(euler.shape[:-1] + (4,))
+    q[..., 0] = 1.0
+    # Blender applies the axes in the order they're named.
+    for axis in (ord(c) - ord('X') for c in order):
+        half = euler[..., axis] * 0.5
+        axis_q = np.zeros_like(q)
+        axis_q[..., 0] = np.cos(half)
+        axis_q[..., 1 + axis] = np.sin(half)
+        q = quat_multiply(axis_q, q)
+    return q
+
+
+def quat_to_matrix(q):
+    w, x, y, z = np.moveaxis(quat_normalize(q), -1, 0)
+    return np.stack((
+        np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+        np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+        np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+    ), axis=-2)
+
+
+# Euler angles in the given order for quaternions `q`.  Consecutive rows
+# are kept continuous, so the result can be keyframed without flips.
+def quat_to_euler(q, order='XYZ'):
+    i, j, k, parity = _EULER_ORDERS[order]
+    m = quat_to_matrix(q)
+    # Blender's matrices are indexed [column][row].
+    def mat(a, b):
+        return m[..., b, a]
+    cy = np.hypot(mat(i, i), mat(i, j))
+    regular = cy > 16.0 * np.finfo(np.float32).eps
+    euler = np.empty(q.shape[:-1] + (3,))
+    euler[..., i] = np.where(regular, np.arctan2(mat(j, k), mat(k, k)), np.arctan2(-mat(k, j), mat(j, j)))
+    euler[..., j] = np.arctan2(-mat(i, k), cy)
+    euler[..., k] = np.where(regular, np.arctan2(mat(i, j), mat(i, i)), 0.0)
+    if parity:
+        euler = -euler
+    if euler.ndim > 1 and len(euler) > 1:
+        euler = np.unwrap(euler, axis=0)
+    return euler
+
+
+# Channel `key` of a clip, or None if the clip doesn't animate it.
+def _clip_channel(clip, key):
+    samples = clip.channels.get(key)
+    if samples is None or len(samples) == 0:
+        return None
+    return samples
+
+
+# Applies the shake layers, bottom to top, on top of the camera's own
+# per-frame location (n, 3) and rotation quaternion (n, 4).  Returns the
+# shaken location and rotation.
+def evaluate_shake_stack(location, rotation, layers):
+    location = np.array(location, dtype=np.float64)
+    rotation = quat_normalize(np.array(rotation, dtype=np.float64))
+    for layer in layers:
+        loc_weight = np.clip(layer.loc_influence, 0.0, 1.0) * layer.loc_factor
+        rot_euler = np.zeros_like(location)
+        for axis in range(3):
+            samples = _clip_channel(layer.clip, ("location", axis))
+            if samples is not None:
+                location[:, axis] += sample_loop(samples, layer.time) * loc_weight
+            samples = _clip_channel(layer.clip, ("rotation_euler", axis))
+            if samples is not None:
+                rot_euler[:, axis] = sample_loop(samples, layer.time) * layer.rot_factor
+        rot_weight = np.clip(layer.rot_influence, 0.0, 1.0)
+        shake_rotation = quat_power(euler_to_quat(rot_euler), np.broadcast_to(rot_weight, len(location)))
+        rotation = quat_multiply(rotation, shake_rotation)
+    return location, rotation
@@ -1 +0,0 @@
-SHAKE_LIST = {'PHONE_IDLE': ('Idle', 24.0, {('location', 0): [(0, -0.0005075433291494846), (1, -0.0008763335645198822), (2, -0.0002040201798081398), (3, -9.460654109716415e-05), (4, -0.00010738242417573929), (5, -0.00013126898556947708), (6, -0.00015906384214758873), (7, 0.0008855555206537247), (8, 0.0012179878540337086), (9, 0.0013269793707877398), (10, 0.001364150084555149), (11, 0.001383342081680894), (12, 0.0013866168446838856), (13, 0.0033219261094927788), (14, 0.003994322381913662), (15, 0.004298898857086897), (16, 0.00449742004275322), (17, 0.004656375385820866), (18, 0.004793247207999229), (19, 0.004855998791754246), (20, 0.004932275973260403), (21, 0.005010073073208332), (22, 0.005105680786073208), (23, 0.005231133662164211), (24, 0.005436847917735577), (25, 0.005677892826497555), (26, 0.005871187895536423), (27, 0.0060389479622244835), (28, 0.006178484298288822), (29, 0.006297057494521141), (30, 0.006180997937917709), (31, 0.005839662626385689), (32, 0.00580710731446743), (33, 0.005873821675777435), (34, 0.005989757366478443), (35, 0.0061296699568629265), (36, 0.006319140084087849), (37, 0.006530946120619774), (38, 0.006650025025010109), (39, 0.006735996343195438), (40, 0.006815014407038689), (41, 0.006892666220664978), (42, 0.006870869547128677), (43, 0.006717812269926071), (44, 0.0066332099959254265), (45, 0.006580924615263939), (46, 0.006571583449840546), (47, 0.006615195423364639), (48, 0.006893397308886051), (49, 0.007398112677037716), (50, 0.00768708810210228), (51, 0.007907219231128693), (52, 0.008086553774774075), (53, 0.008220593445003033), (54, 0.008470217697322369), (55, 0.008821030147373676), (56, 0.008957229554653168), (57, 0.009024947881698608), (58, 0.009074813686311245), (59, 0.00912309531122446), (60, 0.009053254500031471), (61, 0.008850712329149246), (62, 0.008842557668685913), (63, 0.008907089941203594), (64, 0.009008166380226612), (65, 0.009125164709985256), (66, 0.009186504408717155), (67, 0.009196420200169086), (68, 0.009335274808108807), (69, 0.009519817307591438), (70, 0.009704982861876488), (71, 0.009877611882984638), (72, 0.00997206848114729), (73, 0.01002194732427597), (74, 0.010136634111404419), (75, 0.010263041593134403), (76, 0.010382793843746185), (77, 0.010475510731339455), (78, 0.010531442239880562), (79, 0.010137699544429779), (80, 0.009961040690541267), (81, 0.009832658804953098), (82, 0.00971866026520729), (83, 0.009623520076274872), (84, 0.00921118725091219), (85, 0.008472193032503128), (86, 0.008175820112228394), (87, 0.008030429482460022), (88, 0.007936001755297184), (89, 0.007856767624616623), (90, 0.007680831477046013), (91, 0.007439952343702316), (92, 0.007349899969995022), (93, 0.007322914898395538), (94, 0.0073204124346375465), (95, 0.0073143308982253075), (96, 0.007260526530444622), (97, 0.007177748717367649), (98, 0.007095678709447384), (99, 0.006996171548962593), (100, 0.006882327608764172), (101, 0.0067679621279239655), (102, 0.0065676020458340645), (103, 0.0062759919092059135), (104, 0.006088308058679104), (105, 0.005930639803409576), (106, 0.005777671933174133), (107, 0.005614693276584148), (108, 0.005431510508060455), (109, 0.005563496612012386), (110, 0.0054858289659023285), (111, 0.005324475467205048), (112, 0.0051272036507725716), (113, 0.0049210647121071815), (114, 0.004893139936029911), (115, 0.005072114989161491), (116, 0.0050403522327542305), (117, 0.004948075860738754), (118, 0.004841295070946217), (119, 0.004740244708955288), (120, 0.004654279910027981), (121, 0.004760368727147579), (122, 0.004757235758006573), (123, 0.0047124577686190605), (124, 0.004652761854231358), (125, 0.0045941974967718124), (126, 0.004544236697256565), (127, 0.004705983214080334), (128, 0.004732656292617321), (129, 0.004715795628726482), (130, 0.004680064506828785), (131, 0.004622912034392357), (132, 0.004544260911643505), (133, 0.004216613247990608), (134, 0.004031143616884947), (135, 0.003896597307175398), (136, 0.003779455553740263), (137, 0.003663928247988224), (138, 0.003486886154860258), (139, 0.0032696626149117947), (140, 0.003157756756991148), (141, 0.003099303226917982), (142, 0.0030853799544274807), (143, 0.0031109978444874287), (144, 0.0031419130973517895), (145, 0.0031912638805806637), (146, 0.003297321032732725), (147, 0.0034237108193337917), (148, 0.003554051276296377), (149, 0.0036833127960562706), (150, 0.003477710299193859), (151, 0.002955618780106306), (152, 0.0029123923741281033), (153, 0.003050002735108137), (154, 0.0032530794851481915), (155, 0.003482137806713581), (156, 0.003609907813370228), (157, 0.0036323578096926212), (158, 0.0038203555159270763), (159, 0.004059906583279371), (160, 0.004299632739275694), (161, 0.0045278919860720634), (162, 0.004470824263989925), (163, 0.004170635249465704), (164, 0.004244066309183836), (165, 0.004447824787348509), (166, 0.004693102091550827), (167, 0.004949967376887798), (168, 0.005216087214648724), (169, 0.005112150683999062), (170, 0.0052559273317456245), (171, 0.005460105836391449), (172, 0.0056672608479857445), (173, 0.00587094109505415), (174, 0.005813606083393097), (175, 0.005486664362251759), (176, 0.0054795388132333755), (177, 0.005568699911236763), (178, 0.0056861890479922295), (179, 0.005804356187582016), (180, 0.005880578421056271), (181, 0.005926372483372688), (182, 0.005989805795252323), (183, 0.006042666733264923), (184, 0.006085380911827087), (185, 0.0061187464743852615), (186, 0.0061375973746180534), (187, 0.005546063184738159), (188, 0.005307608284056187), (189, 0.00515538826584816), (190, 0.004997824318706989), (191, 0.004803765565156937), (192, 0.00463525764644146), (193, 0.004491486586630344), (194, 0.0042158374562859535), (195, 0.0038765124045312405), (196, 0.0034963032230734825), (197, 0.0030799354426562786), (198, 0.002950844820588827), (199, 0.0030776462517678738), (200, 0.002774640452116728), (201, 0.0023553124628961086), (202, 0.0019429856911301613), (203, 0.0015929643996059895), (204, 0.0017150803469121456), (205, 0.0022959276102483273), (206, 0.0024127396754920483), (207, 0.002394455950707197), (208, 0.0023398473858833313), (209, 0.0022689993493258953), (210, 0.0025789658538997173), (211, 0.0032481220550835133), (212, 0.0033673765137791634), (213, 0.0032919584773480892), (214, 0.00314632011577487), (215, 0.002979047130793333), (216, 0.0029042097739875317), (217, 0.002889502327889204), (218, 0.0027491203509271145), (219, 0.0025646681897342205), (220, 0.002357201650738716), (221, 0.0021401303820312023), (222, 0.0018415139056742191), (223, 0.0014612558297812939), (224, 0.0011725756339728832), (225, 0.0009102548938244581), (226, 0.0006504901684820652), (227, 0.000390809029340744), (228, 0.0006215621251612902), (229, 0.001350501086562872), (230, 0.0015191766433417797), (231, 0.0015455321408808231), (232, 0.0015570551622658968), (233, 0.001594343688338995), (234, 0.0013103974051773548), (235, 0.0007510904688388109), (236, 0.0007047608960419893), (237, 0.0008422746323049068), (238, 0.0010536545887589455), (239, 0.0012963120825588703), (240, 0.0013919530902057886), (241, 0.001340256305411458), (242, 0.001446233130991459), (243, 0.0015814369544386864), (244, 0.001710131298750639), (245, 0.0018243377562612295), (246, 0.0019213207997381687), (247, 0.0020831050351262093), (248, 0.002161978278309107), (249, 0.0022019832395017147), (250, 0.0022075059823691845), (251, 0.0021662102080881596), (252, 0.002087309258058667), (253, 0.001974164042621851), (254, 0.0018203561194241047), (255, 0.0016556479968130589), (256, 0.0014859526418149471), (257, 0.001306967344135046), (258, 0.0009987934026867151), (259, 0.0005756523460149765), (260, 0.00029661389999091625), (261, 9.016366675496101e-05), (262, -5.556223914027214e-05), (263, -0.00014276476576924324), (264, -0.00023041386157274246), (265, -0.00031354231759905815), (266, -0.00031348830088973045), (267, -0.00029949750751256943), (268, -0.0002916739322245121), (269, -0.0002965047024190426), (270, -0.0002967226319015026), (271, -0.00028958264738321304), (272, -0.00029167812317609787), (273, -0.0002880892716348171), (274, -0.00028784526512026787), (275, -0.00030621467158198357), (276, -0.0003531831316649914), (277, -0.0004101572558283806), (278, -0.00047647813335061073), (279, -0.0005574086681008339), (280, -0.0006624874658882618), (281, -0.0007896255701780319), (282, -0.000852308701723814), (283, -0.0008417828939855099), (284, -0.0009094937704503536), (285, -0.0010017887689173222), (286, -0.001104723196476698), (287, -0.0012158011086285114), (288, -0.0011980566196143627), (289, -0.0010710754431784153), (290, -0.001110048033297062), (291, -0.001210788730531931), (292, -0.0013328916393220425), (293, -0.0014506694860756397), (294, -0.001389483455568552), (295, -0.0011536725796759129), (296, -0.0010907403193414211), (297, -0.0010651363991200924), (298, -0.001039112452417612), (299, -0.0010088649578392506), (300, -0.0008535333909094334), (301, -0.000573138240724802), (302, -0.0004493515007197857), (303, -0.0003857831470668316), (304, -0.0003585098311305046), (305, -0.0003522648476064205), (306, -0.00024866964668035507), (307, -6.12032599747181e-05), (308, -4.635658115148544e-06), (309, 2.0395498722791672e-05), (310, 4.1905324906110764e-05), (311, 6.95432536303997e-05), (312, 9.405147284269333e-05), (313, 0.00010679196566343307), (314, 0.0001322575844824314), (315, 0.0001779063604772091), (316, 0.00024953577667474747), (317, 0.0003442100714892149), (318, 0.00048176106065511703), (319, 0.0006247502751648426), (320, 0.0007265165913850069), (321, 0.000813658582046628), (322, 0.0009004210587590933), (323, 0.0009973621927201748), (324, 0.0010207388550043106), (325, 0.0009353787172585726), (326, 0.0009464502800256014), (327, 0.0009751818142831326), (328, 0.001002645818516612), (329, 0.0010262257419526577), (330, 0.0009294254705309868), (331, 0.0007773200049996376), (332, 0.0007159062661230564), (333, 0.0006821127608418465), (334, 0.000660852761939168), (335, 0.0006507143843919039), (336, 0.0004883960355073214), (337, 0.0002681680489331484), (338, 0.0001975006889551878), (339, 0.00018375064246356487), (340, 0.0001903371885418892), (341, 0.00020479760132730007), (342, 0.0001814323477447033), (343, 0.0001549818553030491), (344, 0.00016610976308584213), (345, 0.00018345145508646965), (346, 0.00019312906078994274), (347, 0.00018837954849004745), (348, 9.33399423956871e-05), (349, -5.661044269800186e-05), (350, -0.00014035310596227646), (351, -0.00021009286865592003), (352, -0.0002858000807464123), (353, -0.0003698868677020073), (354, -0.000519768800586462), (355, -0.0006959163583815098), (356, -0.0008096764795482159), (357, -0.0008897264488041401), (358, -0.000938881654292345), (359, -0.0009528119117021561), (360, -0.0009572864510118961), (361, -0.0009311973117291927), (362, -0.0008400916121900082), (363, -0.0007199919782578945), (364, -0.0005870903842151165), (365, -0.00044933659955859184), (366, -0.0003315773792564869), (367, -0.00023936014622449875), (368, -0.00014951592311263084), (369, -6.976118311285973e-05), (370, 1.2936070561408997e-06), (371, 6.933044642210007e-05), (372, 0.00013845926150679588), (373, 0.00019944226369261742), (374, 0.00026208418421447277), (375, 0.0003120461478829384), (376, 0.00033979001455008984), (377, 0.00034899334423244), (378, 0.00041312817484140396), (379, 0.0004959921352565289), (380, 0.00050708232447505), (381, 0.0004851750563830137), (382, 0.000435463385656476), (383, 0.00035715335980057716), (384, 0.00036282697692513466), (385, 0.0004283711314201355), (386, 0.00037597352638840675), (387, 0.0002801022492349148), (388, 0.00016189320012927055), (389, 3.938330337405205e-05), (390, 3.8277357816696167e-07), (391, 9.39471647143364e-06), (392, -3.3742282539606094e-05), (393, -9.226100519299507e-05), (394, -0.00014685746282339096), (395, -0.00018919352442026138), (396, -0.00023403624072670937), (397, -0.0002397778443992138), (398, -0.00019693700596690178), (399, -0.00013463478535413742), (400, -7.50846229493618e-05), (401, -3.3635180443525314e-05), (402, 9.829504415392876e-05), (403, 0.0003129984252154827), (404, 0.0003898991271853447), (405, 0.00042207236401736736), (406, 0.00043701636604964733), (407, 0.0004441598430275917), (408, 0.00048678042367100716), (409, 0.0005274091381579638), (410, 0.0005180805455893278), (411, 0.00048324139788746834), (412, 0.00042311777360737324), (413, 0.0003404882736504078), (414, 0.00028624641709029675), (415, 0.0002404607366770506), (416, 0.00012992601841688156), (417, 2.0028091967105865e-06), (418, -0.00011566700413823128), (419, -0.00020558154210448265), (420, -0.00019004475325345993), (421, -5.919020622968674e-05), (422, 3.6498066037893295e-05), (423, 0.00013175467029213905), (424, 0.00023299921303987503), (425, 0.00033710082061588764), (426, 0.0005565155297517776), (427, 0.0008315227460116148), (428, 0.0009509373921900988), (429, 0.000993099994957447), (430, 0.0009890731889754534), (431, 0.0009590378031134605), (432, 0.0009465694893151522), (433, 0.0009155175648629665), (434, 0.0008488104213029146), (435, 0.000767820980399847), (436, 0.0006741913966834545), (437, 0.0005671512335538864), (438, 0.000475806649774313), (439, 0.00040592532604932785), (440, 0.0003065455239266157), (441, 0.00019624736160039902), (442, 7.019843906164169e-05), (443, -7.441220805048943e-05), (444, -0.00011006603017449379), (445, -8.171703666448593e-05), (446, -0.00017605675384402275), (447, -0.0002956860698759556), (448, -0.00040686270222067833), (449, -0.0005025598220527172), (450, -0.000411144457757473), (451, -0.00018333131447434425), (452, -7.390882819890976e-05), (453, 2.620881423354149e-05), (454, 0.0001330208033323288), (455, 0.00024045887403190136), (456, 0.00026315520517528057), (457, 0.00020864116959273815), (458, 0.00023364624939858913), (459, 0.00026352028362452984), (460, 0.00027342792600393295), (461, 0.0002552596852183342), (462, 0.00031774165108799934), (463, 0.0004339336883276701), (464, 0.0004328147042542696), (465, 0.00040295999497175217), (466, 0.00037178886123001575), (467, 0.0003363066352903843), (468, 0.0002996409311890602), (469, 0.00026753032580018044), (470, 0.00020490470342338085), (471, 0.00013081636279821396), (472, 6.351852789521217e-05), (473, 8.710194379091263e-06), (474, -4.1594263166189194e-05), (475, -9.606126695871353e-05), (476, -0.0001066005788743496), (477, -8.846214041113853e-05), (478, -5.073379725217819e-05), (479, 7.497146725654602e-07), (480, 7.167784497141838e-05), (481, 0.00012874137610197067), (482, 0.00015117553994059563), (483, 0.00015715090557932854), (484, 0.0001521492376923561), (485, 0.00013713818043470383), (486, 8.041644468903542e-05), (487, -4.191882908344269e-06), (488, -7.20038078725338e-05), (489, -0.00011297408491373062), (490, -0.00012307194992899895), (491, -0.00011329865083098412), (492, -8.283648639917374e-05), (493, -4.560966044664383e-05), (494, -3.098044544458389e-05), (495, -3.9291102439165115e-05), (496, -6.387103348970413e-05), (497, -8.778320625424385e-05), (498, -0.00012069288641214371), (499, -0.00013546040281653404), (500, -0.00010856008157134056), (501, -7.140729576349258e-05), (502, -3.193458542227745e-05), (503, 2.4084467440843582e-05), (504, 8.414359763264656e-05), (505, 0.00017242389731109142), (506, 0.0003398754633963108), (507, 0.0005431591998785734), (508, 0.000743119977414608), (509, 0.0009032213129103184), (510, 0.0009596876334398985), (511, 0.0009302899707108736), (512, 0.0008701395709067583), (513, 0.0007698489353060722), (514, 0.0006381676066666842), (515, 0.0004803601186722517), (516, 0.00015607895329594612), (517, -0.0002215476706624031), (518, -0.0005060872063040733), (519, -0.000769556500017643), (520, -0.0010218839161098003), (521, -0.0012595020234584808), (522, -0.0014160526916384697), (523, -0.0015034107491374016), (524, -0.0016101566143333912), (525, -0.0017055915668606758), (526, -0.0017933682538568974), (527, -0.001874791458249092), (528, -0.0019184784032404423), (529, -0.0019170837476849556), (530, -0.001905703917145729), (531, -0.0018693911843001842), (532, -0.001813910435885191), (533, -0.0017481381073594093), (534, -0.0016405037604272366), (535, -0.0015416448004543781), (536, -0.001491560135036707), (537, -0.0014692205004394054), (538, -0.001460761297494173), (539, -0.001453664619475603), (540, -0.0014657624997198582), (541, -0.0014889012090861797), (542, -0.0014841621741652489), (543, -0.0014708871021866798), (544, -0.0014495006762444973), (545, -0.0014177518896758556), (546, -0.0014569140039384365), (547, -0.0015065139159560204), (548, -0.001471515279263258), (549, -0.0014015804044902325), (550, -0.001320496667176485), (551, -0.0012368024326860905), (552, -0.001097921747714281), (553, -0.0009393529035151005), (554, -0.0008214111439883709), (555, -0.0007188022136688232), (556, -0.0006298995576798916), (557, -0.0005525820888578892), (558, -0.00042088283225893974), (559, -0.0002934797666966915), (560, -0.0002238224260509014), (561, -0.00016340380534529686), (562, -8.868938311934471e-05), (563, 5.996320396661758e-06), (564, -4.5520253479480743e-05), (565, -0.00015486497431993484), (566, -0.00012222444638609886), (567, -3.103073686361313e-05), (568, 9.331014007329941e-05), (569, 0.00023674685508012772), (570, 0.00026344554498791695), (571, 0.00023977947421371937), (572, 0.00031684059649705887), (573, 0.00041783321648836136), (574, 0.0005077503155916929), (575, 0.0005763266235589981), (576, 0.0004647858440876007), (577, 0.0002763727679848671), (578, 0.00021623913198709488), (579, 0.00017791870050132275), (580, 0.0001258966512978077), (581, 5.680602043867111e-05), (582, -0.00012430595234036446), (583, -0.00034326082095503807), (584, -0.0005026375874876976), (585, -0.0006381249986588955), (586, -0.0007475200109183788), (587, -0.0008203345350921154), (588, -0.0007491814903914928), (589, -0.0006017494015395641), (590, -0.000506245531141758), (591, -0.0004135267809033394), (592, -0.0003103748895227909), (593, -0.0002026958391070366), (594, 0.00010568555444478989), (595, 0.00041773729026317596), (596, 0.0004818632733076811), (597, 0.0004166949074715376), (598, 0.00025663780979812145), (599, 3.0850525945425034e-05), (600, 9.712297469377518e-06), (601, 4.666158929467201e-05), (602, -0.00012077530845999718), (603, -0.0003534364514052868), (604, -0.0006075231358408928), (605, -0.0008588857017457485), (606, -0.0008968492038547993), (607, -0.0008302661590278149), (608, -0.00087728351354599), (609, -0.0009442972950637341), (610, -0.0010075769387185574), (611, -0.001053523737937212), (612, -0.0007322416640818119), (613, -0.0002874261699616909), (614, -8.508842438459396e-05), (615, 7.1775633841753e-05), (616, 0.00024477881379425526), (617, 0.0004395165015012026), (618, 0.0008811084553599358), (619, 0.0013569043949246407), (620, 0.0016163503751158714), (621, 0.0017914040945470333), (622, 0.001915631117299199), (623, 0.0020004722755402327), (624, 0.0021544857881963253), (625, 0.0022944523952901363), (626, 0.0023400462232530117), (627, 0.0023532062768936157), (628, 0.002357165329158306), (629, 0.0023748967796564102), (630, 0.002486716490238905), (631, 0.002635471522808075), (632, 0.0027634664438664913), (633, 0.0029118149541318417), (634, 0.003091252874583006), (635, 0.0032944371923804283), (636, 0.0034983688965439796), (637, 0.0036820019595324993), (638, 0.003860264550894499), (639, 0.0040093520656228065), (640, 0.004122042562812567), (641, 0.004208091646432877), (642, 0.004092065617442131), (643, 0.0039092800579965115), (644, 0.0038914806209504604), (645, 0.0039160167798399925), (646, 0.003945525269955397), (647, 0.00396611075848341), (648, 0.0038466486148536205), (649, 0.0036664200015366077), (650, 0.003577364142984152), (651, 0.0034908424131572247), (652, 0.0033843317069113255), (653, 0.003256505820900202), (654, 0.0030289203859865665), (655, 0.002782569732517004), (656, 0.0026206313632428646), (657, 0.0024977168068289757), (658, 0.002395233605057001), (659, 0.002303894143551588), (660, 0.0022000009194016457), (661, 0.002120853867381811), (662, 0.0020467613358050585), (663, 0.0019496283493936062), (664, 0.0018173474818468094), (665, 0.0016423400957137346), (666, 0.0015071514062583447), (667, 0.0013979892246425152), (668, 0.0011851307936012745), (669, 0.0009602315258234739), (670, 0.0007747085765004158), (671, 0.0006266864947974682), (672, 0.000605535227805376), (673, 0.0006482631433755159), (674, 0.0005710024852305651), (675, 0.00044362107291817665), (676, 0.00030627381056547165), (677, 0.00017655524425208569), (678, 0.00021130172535777092), (679, 0.00031448458321392536), (680, 0.00026158709079027176), (681, 0.00013790791854262352), (682, -2.7985312044620514e-05), (683, -0.00021978048607707024), (684, -0.0002686944790184498), (685, -0.0002601821906864643), (686, -0.0003910115920007229), (687, -0.0005689649842679501), (688, -0.0007680258713662624), (689, -0.0009923367761075497), (690, -0.0011346046812832355), (691, -0.0012435759417712688), (692, -0.001429287251085043), (693, -0.0016277572140097618), (694, -0.0018238648772239685), (695, -0.002014539670199156), (696, -0.0023565073497593403), (697, -0.002738193143159151), (698, -0.002967698499560356), (699, -0.0031470847316086292), (700, -0.003301058430224657), (701, -0.003435432445257902), (702, -0.0033839866518974304), (703, -0.003300052136182785), (704, -0.003400694578886032), (705, -0.0035725715570151806), (706, -0.0037660449743270874), (707, -0.003976272419095039), (708, -0.0039487192407250404), (709, -0.00383022241294384), (710, -0.00391477532684803), (711, -0.004024112597107887), (712, -0.004116116091609001), (713, -0.0041942596435546875), (714, -0.004244361072778702), (715, -0.004263687878847122), (716, -0.004287047311663628), (717, -0.004323501139879227), (718, -0.0043619610369205475), (719, -0.004390588030219078), (720, -0.004169277846813202), (721, -0.0038655903190374374), (722, -0.0037508979439735413), (723, -0.003686775453388691), (724, -0.00364537350833416), (725, -0.0036292457953095436), (726, -0.003615603782236576), (727, -0.0036346563138067722), (728, -0.0036878730170428753), (729, -0.0037628067657351494), (730, -0.0038281362503767014), (731, -0.0038735680282115936), (732, -0.0038909530267119408), (733, -0.003871629014611244), (734, -0.0038173049688339233), (735, -0.0037240739911794662), (736, -0.003589238505810499), (737, -0.0034193252213299274), (738, -0.0033233878202736378), (739, -0.003241749946027994), (740, -0.0030678119510412216), (741, -0.002864566631615162), (742, -0.002658151090145111), (743, -0.00246031628921628), (744, -0.0022762720473110676), (745, -0.0020777597092092037), (746, -0.0018851226195693016), (747, -0.0016850437968969345), (748, -0.0014759143814444542), (749, -0.0012604794465005398), (750, -0.0010425020009279251), (751, -0.0008242977783083916), (752, -0.0006265868432819843), (753, -0.0004508746787905693), (754, -0.0003001573495566845), (755, -0.0001639663241803646), (756, -0.00014103064313530922), (757, -0.0001667100004851818), (758, -7.659243419766426e-05), (759, 7.275817915797234e-05), (760, 0.00026504951529204845), (761, 0.0004932892043143511), (762, 0.0005188947543501854), (763, 0.00044921482913196087), (764, 0.0005796244367957115), (765, 0.0007694396190345287), (766, 0.0009694315958768129), (767, 0.0011602616868913174), (768, 0.0009395417291671038), (769, 0.0005516130477190018), (770, 0.0004608959425240755), (771, 0.0004423954524099827), (772, 0.00043520634062588215), (773, 0.0004424462094902992), (774, 0.0002037349622696638), (775, -0.00011668587103486061), (776, -0.0002056262455880642), (777, -0.0002141343429684639), (778, -0.00019693700596690178), (779, -0.0001742611639201641), (780, -7.827719673514366e-05), (781, 5.500763654708862e-05), (782, 0.00013195350766181946), (783, 0.00019437400624155998), (784, 0.0002415119670331478), (785, 0.0002621773164719343), (786, 0.0003953753039240837), (787, 0.0005650215316563845), (788, 0.0006087282672524452), (789, 0.000614810036495328), (790, 0.0006203413940966129), (791, 0.0006407785695046186), (792, 0.000828457297757268), (793, 0.0010666241869330406), (794, 0.0011661825701594353), (795, 0.0012143927160650492), (796, 0.0012458907440304756), (797, 0.0012750248424708843), (798, 0.0012182127684354782), (799, 0.001119281630963087), (800, 0.0010723129380494356), (801, 0.0010314136743545532), (802, 0.000986158149316907), (803, 0.0009311579633504152), (804, 0.0010634488426148891), (805, 0.0012704567052423954), (806, 0.0012948357034474611), (807, 0.0012609343975782394), (808, 0.0012021900620311499), (809, 0.0011295098811388016), (810, 0.0009719168301671743), (811, 0.0007983006071299314), (812, 0.0007072584703564644), (813, 0.0006402013823390007), (814, 0.0005665412172675133), (815, 0.00045670289546251297), (816, 0.00042361440137028694), (817, 0.00041579827666282654), (818, 0.0002839649096131325), (819, 0.00011314218863844872), (820, -6.487267091870308e-05), (821, -0.000234928447753191), (822, -0.0003976975567638874), (823, -0.0005408725701272488), (824, -0.0006562680937349796), (825, -0.0007657227106392384), (826, -0.0008807466365396976), (827, -0.001012896653264761), (828, -0.0010711010545492172), (829, -0.0010989499278366566), (830, -0.0012037376873195171), (831, -0.0013279891572892666), (832, -0.0014546425081789494), (833, -0.0015800860710442066), (834, -0.0015715654008090496), (835, -0.001478731632232666), (836, -0.0014690188691020012), (837, -0.0014629238285124302), (838, -0.0014376104809343815), (839, -0.0013847621157765388), (840, -0.0011250278912484646), (841, -0.0007806788198649883), (842, -0.0006029042415320873), (843, -0.0004988303408026695), (844, -0.00044234609231352806), (845, -0.0004307604394853115), (846, -0.0004697246477007866), (847, -0.0005731075070798397), (848, -0.0006935638375580311), (849, -0.0008316920138895512), (850, -0.0009717256762087345), (851, -0.0010936246253550053), (852, -0.0011522225104272366), (853, -0.0011962945573031902), (854, -0.0012903758324682713), (855, -0.0014231698587536812), (856, -0.0015894877724349499), (857, -0.001784500665962696), (858, -0.0018816934898495674), (859, -0.0019299862906336784), (860, -0.002087669912725687), (861, -0.0022805859334766865), (862, -0.002476898953318596), (863, -0.0026554898358881474), (864, -0.0027290512807667255), (865, -0.0027001281268894672), (866, -0.0026384908705949783), (867, -0.00253268051892519), (868, -0.0024006273597478867), (869, -0.00226232735440135), (870, -0.0021158154122531414), (871, -0.0019472381100058556), (872, -0.0017865924164652824), (873, -0.0016411012038588524), (874, -0.0015170448459684849), (875, -0.0014209458604454994), (876, -0.001494161318987608), (877, -0.0016132029704749584), (878, -0.001606781966984272), (879, -0.0015526092611253262), (880, -0.001483369618654251), (881, -0.0014142324216663837), (882, -0.001461877953261137), (883, -0.0015555769205093384), (884, -0.0015509258955717087), (885, -0.0015141298063099384), (886, -0.001463177613914013), (887, -0.001359404530376196), (888, -0.0013042665086686611), (889, -0.0013136961497366428), (890, -0.0013296282850205898), (891, -0.0013865954242646694), (892, -0.0014854720793664455), (893, -0.0016014114953577518), (894, -0.0019129342399537563), (895, -0.0022911829873919487), (896, -0.002909474540501833), (897, -0.0035274727270007133), (898, -0.003680962137877941), (899, -0.002999181393533945), (900, -0.0016266750171780586), (901, -0.0004975157789885998), (902, 0.00015286123380064964), (903, 0.00026769470423460007), (904, -6.00004568696022e-05), (905, -0.0005857581272721291), (906, -0.000912476796656847), (907, -0.0011527673341333866), (908, -0.0007393620908260345), (909, -7.162382826209068e-05), (910, 0.00047426181845366955), (911, 0.0006619796622544527), (912, 0.0005679009482264519), (913, 0.0002945451997220516), (914, -4.67388890683651e-05), (915, -0.0003530452959239483), (916, -0.0005473983474075794), (917, -0.0005959486588835716), (918, -0.0005075433291494846)], ('location', 1): [(0, -0.005325759295374155), (1, -0.0051487344317138195), (2, -0.007490346673876047), (3, -0.008330563083291054), (4, -0.008724193088710308), (5, -0.0089394710958004), (6, -0.009007539600133896), (7, -0.011577727273106575), (8, -0.012340637855231762), (9, -0.012525316327810287), (10, -0.012518228963017464), (11, -0.012439992278814316), (12, -0.012333838269114494), (13, -0.013194289058446884), (14, -0.013329477980732918), (15, -0.01322612538933754), (16, -0.013060186058282852), (17, -0.012922171503305435), (18, -0.01281491294503212), (19, -0.014947628602385521), (20, -0.015499059110879898), (21, -0.015559043735265732), (22, -0.015499237924814224), (23, -0.015451012179255486), (24, -0.015716437250375748), (25, -0.016249537467956543), (26, -0.016436010599136353), (27, -0.016483549028635025), (28, -0.016475649550557137), (29, -0.016461970284581184), (30, -0.016852084547281265), (31, -0.017609117552638054), (32, -0.017890935763716698), (33, -0.018065933138132095), (34, -0.018243614584207535), (35, -0.01843860372900963), (36, -0.018961787223815918), (37, -0.019746363162994385), (38, -0.020034583285450935), (39, -0.020174503326416016), (40, -0.020309090614318848), (41, -0.020476343110203743), (42, -0.020762979984283447), (43, -0.0210968516767025), (44, -0.021240554749965668), (45, -0.021333448588848114), (46, -0.02146526798605919), (47, -0.021663717925548553), (48, -0.022063933312892914), (49, -0.022614262998104095), (50, -0.022962503135204315), (51, -0.02324340119957924), (52, -0.02349194511771202), (53, -0.023675106465816498), (54, -0.02371453493833542), (55, -0.023583676666021347), (56, -0.023458782583475113), (57, -0.023292861878871918), (58, -0.023077990859746933), (59, -0.022830691188573837), (60, -0.021881841123104095), (61, -0.02025926113128662), (62, -0.01952221989631653), (63, -0.01908022351562977), (64, -0.018741879612207413), (65, -0.018437951803207397), (66, -0.017787281423807144), (67, -0.01682264171540737), (68, -0.016417717561125755), (69, -0.016263755038380623), (70, -0.01624930277466774), (71, -0.016317937523126602), (72, -0.01604681834578514), (73, -0.015434772707521915), (74, -0.01526123657822609), (75, -0.015217269770801067), (76, -0.015225496143102646), (77, -0.01524636521935463), (78, -0.015244845300912857), (79, -0.015229199081659317), (80, -0.015128586441278458), (81, -0.014952277764678001), (82, -0.01475614495575428), (83, -0.014605466276407242), (84, -0.014359022490680218), (85, -0.014032693579792976), (86, -0.013964954763650894), (87, -0.013952728360891342), (88, -0.013898070901632309), (89, -0.013772998005151749), (90, -0.013123450800776482), (91, -0.012044699862599373), (92, -0.011565182358026505), (93, -0.011267539113759995), (94, -0.011027663946151733), (95, -0.010819822549819946), (96, -0.010368104092776775), (97, -0.009708717465400696), (98, -0.009387146681547165), (99, -0.009158695116639137), (100, -0.008973730728030205), (101, -0.008854266256093979), (102, -0.00851064920425415), (103, -0.007985126227140427), (104, -0.007950985804200172), (105, -0.008181789889931679), (106, -0.008576182648539543), (107, -0.009020025841891766), (108, -0.00942769180983305), (109, -0.009747086092829704), (110, -0.010059620253741741), (111, -0.010360894724726677), (112, -0.010621368885040283), (113, -0.010815049521625042), (114, -0.010733301751315594), (115, -0.010406464338302612), (116, -0.010288323275744915), (117, -0.010195995680987835), (118, -0.010071779601275921), (119, -0.009915173053741455), (120, -0.00973491184413433), (121, -0.0091311726719141), (122, -0.008807893842458725), (123, -0.008582830429077148), (124, -0.00840507447719574), (125, -0.008262822404503822), (126, -0.008156415075063705), (127, -0.0072954692877829075), (128, -0.006979059427976608), (129, -0.006859626155346632), (130, -0.0067986794747412205), (131, -0.006761977914720774), (132, -0.006742875557392836), (133, -0.0061416286043822765), (134, -0.005987341515719891), (135, -0.005977909080684185), (136, -0.006009886506944895), (137, -0.006056363228708506), (138, -0.006074006203562021), (139, -0.0060573467053473), (140, -0.006107835564762354), (141, -0.006194140296429396), (142, -0.0062990435399115086), (143, -0.006418029312044382), (144, -0.006651936564594507), (145, -0.00699640205129981), (146, -0.007174486760050058), (147, -0.007250602822750807), (148, -0.007261049002408981), (149, -0.007235284429043531), (150, -0.007082994561642408), (151, -0.0068429806269705296), (152, -0.00672755716368556), (153, -0.006646344903856516), (154, -0.006563865579664707), (155, -0.006465222220867872), (156, -0.006172414403408766), (157, -0.005711566191166639), (158, -0.005492265336215496), (159, -0.0053705512546002865), (160, -0.005288223270326853), (161, -0.005203451029956341), (162, -0.004864363931119442), (163, -0.0043122125789523125), (164, -0.004073986783623695), (165, -0.003953852225095034), (166, -0.0039037573151290417), (167, -0.003927971236407757), (168, -0.0040344856679439545), (169, -0.0037476965226233006), (170, -0.003799836151301861), (171, -0.003923217300325632), (172, -0.003985075745731592), (173, -0.003953019622713327), (174, -0.0035650725476443768), (175, -0.0029458655044436455), (176, -0.00280954921618104), (177, -0.002886771224439144), (178, -0.0030465354211628437), (179, -0.003193835262209177), (180, -0.0034092762507498264), (181, -0.0037191463634371758), (182, -0.0038750870153307915), (183, -0.003976339939981699), (184, -0.004048312548547983), (185, -0.004103030078113079), (186, -0.004146406892687082), (187, -0.003838967066258192), (188, -0.0037028780207037926), (189, -0.0035960478708148003), (190, -0.0035024089738726616), (191, -0.0034348624758422375), (192, -0.003237317781895399), (193, -0.0028701378032565117), (194, -0.002701215911656618), (195, -0.0026026316918432713), (196, -0.0025218678638339043), (197, -0.0024473322555422783), (198, -0.0023728860542178154), (199, -0.002339850179851055), (200, -0.0024435026571154594), (201, -0.002676929347217083), (202, -0.0030024200677871704), (203, -0.0033674375154078007), (204, -0.0036870636977255344), (205, -0.003951068501919508), (206, -0.004232984036207199), (207, -0.004483321215957403), (208, -0.004702071659266949), (209, -0.004880632273852825), (210, -0.0052259075455367565), (211, -0.005756510887295008), (212, -0.005972082260996103), (213, -0.006022568326443434), (214, -0.005986849311739206), (215, -0.005937705282121897), (216, -0.005806695204228163), (217, -0.005631281994283199), (218, -0.005721776280552149), (219, -0.005959090776741505), (220, -0.006274218205362558), (221, -0.006599064450711012), (222, -0.007082550320774317), (223, -0.007649849634617567), (224, -0.007830675691366196), (225, -0.007860803976655006), (226, -0.007858837023377419), (227, -0.007872695103287697), (228, -0.0075910198502242565), (229, -0.007009338587522507), (230, -0.006810529623180628), (231, -0.0067221797071397305), (232, -0.006652220617979765), (233, -0.006574893835932016), (234, -0.006513962056487799), (235, -0.006477787159383297), (236, -0.006350751034915447), (237, -0.00616916548460722), (238, -0.005949283484369516), (239, -0.005711625795811415), (240, -0.0053390213288366795), (241, -0.004889248870313168), (242, -0.004651063587516546), (243, -0.004533627536147833), (244, -0.004485811106860638), (245, -0.004487701691687107), (246, -0.004539831075817347), (247, -0.005136321298778057), (248, -0.005426670424640179), (249, -0.005627657286822796), (250, -0.00579457962885499), (251, -0.005930537823587656), (252, -0.006047108676284552), (253, -0.0060865976847708225), (254, -0.006022512447088957), (255, -0.00583126675337553), (256, -0.005510310642421246), (257, -0.005083451513200998), (258, -0.0046313973143696785), (259, -0.004183945711702108), (260, -0.003642524592578411), (261, -0.003123338334262371), (262, -0.0026935567148029804), (263, -0.0023556891828775406), (264, -0.0020451201125979424), (265, -0.0017834855243563652), (266, -0.0016734106466174126), (267, -0.0016074134036898613), (268, -0.0015196315944194794), (269, -0.0013692332431674004), (270, -0.001458088867366314), (271, -0.001858632080256939), (272, -0.002011205069720745), (273, -0.002175208181142807), (274, -0.0023888153955340385), (275, -0.0026166425086557865), (276, -0.002965492196381092), (277, -0.0034177126362919807), (278, -0.003675605170428753), (279, -0.0038529778830707073), (280, -0.003988874144852161), (281, -0.004095922224223614), (282, -0.004258910659700632), (283, -0.004467214457690716), (284, -0.004536966327577829), (285, -0.0045383526012301445), (286, -0.004514703992754221), (287, -0.004494230262935162), (288, -0.004551376216113567), (289, -0.0046871257945895195), (290, -0.0047377003356814384), (291, -0.004752289038151503), (292, -0.004730234853923321), (293, -0.004667052533477545), (294, -0.004490864463150501), (295, -0.004216531757265329), (296, -0.004024634137749672), (297, -0.0038673384115099907), (298, -0.0037525701336562634), (299, -0.0036814911291003227), (300, -0.003652716986835003), (301, -0.0036557866260409355), (302, -0.003649874124675989), (303, -0.0036545940674841404), (304, -0.003677020315080881), (305, -0.0036996295675635338), (306, -0.0037170303985476494), (307, -0.0037277154624462128), (308, -0.003722602967172861), (309, -0.0037356563843786716), (310, -0.0037826551124453545), (311, -0.0038712583482265472), (312, -0.004029806237667799), (313, -0.0042197806760668755), (314, -0.004315282218158245), (315, -0.004345699213445187), (316, -0.004323344677686691), (317, -0.004264633171260357), (318, -0.004209617618471384), (319, -0.004161904565989971), (320, -0.004080603830516338), (321, -0.003978307358920574), (322, -0.003863970283418894), (323, -0.003761881962418556), (324, -0.0037096096202731133), (325, -0.003716881852596998), (326, -0.0037192367017269135), (327, -0.0037335404194891453), (328, -0.0037687518633902073), (329, -0.003807494882494211), (330, -0.003662958275526762), (331, -0.0034284242428839207), (332, -0.003333608154207468), (333, -0.003306607250124216), (334, -0.00333393644541502), (335, -0.0034054466523230076), (336, -0.003432198893278837), (337, -0.0034673321060836315), (338, -0.0036346716806292534), (339, -0.003853827714920044), (340, -0.004078174475580454), (341, -0.004277714062482119), (342, -0.004390279296785593), (343, -0.00443476065993309), (344, -0.004470298998057842), (345, -0.004458973649889231), (346, -0.004387672059237957), (347, -0.004258389584720135), (348, -0.0040775490924716), (349, -0.0038537336513400078), (350, -0.003585467115044594), (351, -0.003288788255304098), (352, -0.002979289274662733), (353, -0.0026788217946887016), (354, -0.002342056483030319), (355, -0.001990686170756817), (356, -0.0016734106466174126), (357, -0.0013710511848330498), (358, -0.001077244058251381), (359, -0.0007874472066760063), (360, -0.000590411014854908), (361, -0.0004585161805152893), (362, -0.00022851768881082535), (363, 2.400856465101242e-05), (364, 0.0002768663689494133), (365, 0.0005270158872008324), (366, 0.0006754416972398758), (367, 0.0007386282086372375), (368, 0.0008897352963685989), (369, 0.00103698018938303), (370, 0.0011431975290179253), (371, 0.0012100813910365105), (372, 0.0011776015162467957), (373, 0.0010657822713255882), (374, 0.000999155454337597), (375, 0.0009223250672221184), (376, 0.000825095921754837), (377, 0.0007035201415419579), (378, 0.0004846835508942604), (379, 0.00018492620438337326), (380, -8.536502718925476e-05), (381, -0.0003447616472840309), (382, -0.0005564382299780846), (383, -0.000697859562933445), (384, -0.0008085211738944054), (385, -0.0008735619485378265), (386, -0.0008364887908101082), (387, -0.0007314952090382576), (388, -0.0005947314202785492), (389, -0.0004552742466330528), (390, -0.0003204420208930969), (391, -0.00015363935381174088), (392, 7.569883018732071e-05), (393, 0.00041427742689847946), (394, 0.0008248137310147285), (395, 0.0012334492057561874), (396, 0.001628359779715538), (397, 0.001957584172487259), (398, 0.002122976817190647), (399, 0.0021589724346995354), (400, 0.0021001147106289864), (401, 0.0020008329302072525), (402, 0.0019389623776078224), (403, 0.0019247150048613548), (404, 0.002016846090555191), (405, 0.0021808184683322906), (406, 0.0023517338559031487), (407, 0.002492153085768223), (408, 0.002329964190721512), (409, 0.001956481486558914), (410, 0.001873278059065342), (411, 0.001903151161968708), (412, 0.001999937929213047), (413, 0.0021324073895812035), (414, 0.0019436506554484367), (415, 0.0015109395608305931), (416, 0.0013135718181729317), (417, 0.001122540794312954), (418, 0.0009026890620589256), (419, 0.0006830012425780296), (420, 0.00047077517956495285), (421, 0.0002532918006181717), (422, 1.4223158359527588e-05), (423, -0.00020788051187992096), (424, -0.00038407184183597565), (425, -0.0005005830898880959), (426, -0.0005630524829030037), (427, -0.0005496256053447723), (428, -0.00042877718806266785), (429, -0.00022871047258377075), (430, 2.1101906895637512e-05), (431, 0.00029953569173812866), (432, 0.0007010465487837791), (433, 0.0011681066825985909), (434, 0.0014852909371256828), (435, 0.0017208047211170197), (436, 0.0018991688266396523), (437, 0.002019810490310192), (438, 0.002067885361611843), (439, 0.0020451201125979424), (440, 0.0019744988530874252), (441, 0.0018663350492715836), (442, 0.001732037402689457), (443, 0.0015867864713072777), (444, 0.0013101017102599144), (445, 0.0010024206712841988), (446, 0.0008786385878920555), (447, 0.0008656308054924011), (448, 0.0009343996644020081), (449, 0.0010478822514414787), (450, 0.0010310960933566093), (451, 0.0009208181872963905), (452, 0.000924176536500454), (453, 0.0009684199467301369), (454, 0.001027904450893402), (455, 0.001081276684999466), (456, 0.0013303644955158234), (457, 0.0016609951853752136), (458, 0.0017036423087120056), (459, 0.0016177082434296608), (460, 0.0014681974425911903), (461, 0.0012941686436533928), (462, 0.0011438354849815369), (463, 0.0009870445355772972), (464, 0.0007925517857074738), (465, 0.000567680224776268), (466, 0.00031801220029592514), (467, 5.569402128458023e-05), (468, -0.00012987107038497925), (469, -0.00023292843252420425), (470, -0.00033397600054740906), (471, -0.0003727935254573822), (472, -0.00032917503267526627), (473, -0.00022096652537584305), (474, -1.0698102414608002e-05), (475, 0.0002574389800429344), (476, 0.0004408983513712883), (477, 0.0005864584818482399), (478, 0.0007164813578128815), (479, 0.0008351998403668404), (480, 0.0011372780427336693), (481, 0.001525125466287136), (482, 0.0017016706988215446), (483, 0.0017977561801671982), (484, 0.0018581105396151543), (485, 0.0019027767702937126), (486, 0.002021864987909794), (487, 0.0021451199427247047), (488, 0.0021758591756224632), (489, 0.0021643592044711113), (490, 0.0021344898268580437), (491, 0.0020774519070982933), (492, 0.0018853461369872093), (493, 0.0016219941899180412), (494, 0.0014408407732844353), (495, 0.0013018622994422913), (496, 0.0011916793882846832), (497, 0.0011158352717757225), (498, 0.0010139960795640945), (499, 0.0009096777066588402), (500, 0.000888042151927948), (501, 0.000907176174223423), (502, 0.0009428290650248528), (503, 0.0009778188541531563), (504, 0.0009611155837774277), (505, 0.0009104544296860695), (506, 0.0008500842377543449), (507, 0.0007745986804366112), (508, 0.0007132915779948235), (509, 0.0006923442706465721), (510, 0.0004613921046257019), (511, 0.00019389577209949493), (512, 0.00016555935144424438), (513, 0.00020762067288160324), (514, 0.0002611204981803894), (515, 0.00028701499104499817), (516, 0.00026308558881282806), (517, 0.00021479185670614243), (518, 0.00016026385128498077), (519, 0.00012131873518228531), (520, 0.0001017516478896141), (521, 8.608493953943253e-05), (522, 0.0001357821747660637), (523, 0.00018090568482875824), (524, 0.00012888293713331223), (525, 3.986340016126633e-05), (526, -5.12879341840744e-05), (527, -0.00012184400111436844), (528, -0.00021838583052158356), (529, -0.00029741693288087845), (530, -0.00029566604644060135), (531, -0.0002674991264939308), (532, -0.0002298746258020401), (533, -0.00018772296607494354), (534, -0.00021240953356027603), (535, -0.0002530338242650032), (536, -0.00025311950594186783), (537, -0.000262984074652195), (538, -0.00030004698783159256), (539, -0.000369243323802948), (540, -0.0005709640681743622), (541, -0.0007945410907268524), (542, -0.0009171590209007263), (543, -0.0010165376588702202), (544, -0.001131037250161171), (545, -0.0012703537940979004), (546, -0.0013375235721468925), (547, -0.0013869181275367737), (548, -0.001509559340775013), (549, -0.0016576601192355156), (550, -0.0018061501905322075), (551, -0.0019438685849308968), (552, -0.0019031558185815811), (553, -0.0017753355205059052), (554, -0.0017334939911961555), (555, -0.0016875965520739555), (556, -0.0016373200342059135), (557, -0.001598249189555645), (558, -0.0017332108691334724), (559, -0.0018997592851519585), (560, -0.0019446108490228653), (561, -0.0019676778465509415), (562, -0.001988227479159832), (563, -0.002003277651965618), (564, -0.001690874807536602), (565, -0.001304815523326397), (566, -0.0012155864387750626), (567, -0.001230577938258648), (568, -0.0012736860662698746), (569, -0.001311550848186016), (570, -0.0013074083253741264), (571, -0.0012840423732995987), (572, -0.001290109008550644), (573, -0.0013186288997530937), (574, -0.001364678144454956), (575, -0.0014139367267489433), (576, -0.0013311905786395073), (577, -0.0011880546808242798), (578, -0.00110627431422472), (579, -0.001026134006679058), (580, -0.0009483499452471733), (581, -0.000894542783498764), (582, -0.0007176203653216362), (583, -0.0005470039322972298), (584, -0.0005504600703716278), (585, -0.0006284341216087341), (586, -0.000748378224670887), (587, -0.0008961958810687065), (588, -0.0010425262153148651), (589, -0.0012073162943124771), (590, -0.0014372868463397026), (591, -0.001723836176097393), (592, -0.0020813150331377983), (593, -0.002503792755305767), (594, -0.0029636868275702), (595, -0.0034640831872820854), (596, -0.003991777542978525), (597, -0.004525910131633282), (598, -0.005048791412264109), (599, -0.0055315447971224785), (600, -0.005915373098105192), (601, -0.0061856904067099094), (602, -0.0063726999796926975), (603, -0.006503145210444927), (604, -0.006603773217648268), (605, -0.006699185818433762), (606, -0.006793702486902475), (607, -0.006902987603098154), (608, -0.0070475623942911625), (609, -0.007156401872634888), (610, -0.007161819841712713), (611, -0.007028559688478708), (612, -0.006868764292448759), (613, -0.006670828443020582), (614, -0.006361940409988165), (615, -0.0060109891928732395), (616, -0.005659515969455242), (617, -0.005356828682124615), (618, -0.005798246245831251), (619, -0.006494997534900904), (620, -0.006688531022518873), (621, -0.0067481957376003265), (622, -0.006784971337765455), (623, -0.00680769607424736), (624, -0.006848420016467571), (625, -0.006842492613941431), (626, -0.006708050612360239), (627, -0.0064641074277460575), (628, -0.0061347889713943005), (629, -0.005750175099819899), (630, -0.005384828429669142), (631, -0.005012256093323231), (632, -0.004598033614456654), (633, -0.004205686040222645), (634, -0.0038637174293398857), (635, -0.0035781809128820896), (636, -0.0033352328464388847), (637, -0.0031223688274621964), (638, -0.002929133363068104), (639, -0.002743968740105629), (640, -0.0025438787415623665), (641, -0.0023207170888781548), (642, -0.0020817024633288383), (643, -0.0018778247758746147), (644, -0.0017507374286651611), (645, -0.001688641496002674), (646, -0.0016586137935519218), (647, -0.001624847762286663), (648, -0.0018288865685462952), (649, -0.0020995400846004486), (650, -0.0021348437294363976), (651, -0.0020564012229442596), (652, -0.0018968675285577774), (653, -0.0016898326575756073), (654, -0.0010733408853411674), (655, -0.0003677746281027794), (656, -2.781488001346588e-05), (657, 0.0001742010936141014), (658, 0.00030640047043561935), (659, 0.00038706324994564056), (660, 9.230431169271469e-05), (661, -0.0003254646435379982), (662, -0.0004401588812470436), (663, -0.0004613073542714119), (664, -0.00045489706099033356), (665, -0.0004172110930085182), (666, -0.0004702592268586159), (667, -0.0005255751311779022), (668, -0.00043530669063329697), (669, -0.0003827158361673355), (670, -0.00043539050966501236), (671, -0.0005624433979392052), (672, -0.0006909025833010674), (673, -0.0007757358253002167), (674, -0.0007994426414370537), (675, -0.0008018109947443008), (676, -0.0008399300277233124), (677, -0.0009598983451724052), (678, -0.0009806714951992035), (679, -0.00101504847407341), (680, -0.001240159384906292), (681, -0.0014842525124549866), (682, -0.0016722502186894417), (683, -0.0017787320539355278), (684, -0.0015559745952486992), (685, -0.0012210113927721977), (686, -0.0010838909074664116), (687, -0.0010132892057299614), (688, -0.0009714467450976372), (689, -0.0009405426681041718), (690, -0.0007691811770200729), (691, -0.000538392923772335), (692, -0.00035285111516714096), (693, -0.00015107449144124985), (694, 7.245689630508423e-05), (695, 0.00031920522451400757), (696, 0.0008676378056406975), (697, 0.0015419907867908478), (698, 0.0019860807806253433), (699, 0.0023580528795719147), (700, 0.0026915138587355614), (701, 0.0029888516291975975), (702, 0.0034042326733469963), (703, 0.003834899514913559), (704, 0.004093889147043228), (705, 0.0042971400544047356), (706, 0.004486951045691967), (707, 0.0046552009880542755), (708, 0.004490949213504791), (709, 0.004210074432194233), (710, 0.0041668228805065155), (711, 0.004178975708782673), (712, 0.004193254746496677), (713, 0.004203892312943935), (714, 0.003957602195441723), (715, 0.0036454834043979645), (716, 0.003557596355676651), (717, 0.003502252511680126), (718, 0.003415261395275593), (719, 0.003300648182630539), (720, 0.0034777848049998283), (721, 0.003718417137861252), (722, 0.003671654500067234), (723, 0.003535318188369274), (724, 0.0033748475834727287), (725, 0.0031904904171824455), (726, 0.0027969656512141228), (727, 0.002425631508231163), (728, 0.002202184870839119), (729, 0.0021523181349039078), (730, 0.0021608369424939156), (731, 0.0021948721259832382), (732, 0.0023662177845835686), (733, 0.0025656409561634064), (734, 0.0026421891525387764), (735, 0.002675618976354599), (736, 0.0026873722672462463), (737, 0.0026928214356303215), (738, 0.0030753714963793755), (739, 0.003554706461727619), (740, 0.0036886120215058327), (741, 0.0036843791604042053), (742, 0.0036487309262156487), (743, 0.003630794584751129), (744, 0.003643282689154148), (745, 0.0037778066471219063), (746, 0.0038187867030501366), (747, 0.0037954924628138542), (748, 0.003691664896905422), (749, 0.0034889020025730133), (750, 0.003199729137122631), (751, 0.002798710949718952), (752, 0.002444627694785595), (753, 0.002174350433051586), (754, 0.0020409561693668365), (755, 0.0020447401329874992), (756, 0.001969967968761921), (757, 0.0019078142940998077), (758, 0.0020332373678684235), (759, 0.002212931402027607), (760, 0.00240322295576334), (761, 0.002583700232207775), (762, 0.0025073476135730743), (763, 0.002353273332118988), (764, 0.002391505055129528), (765, 0.0024571893736720085), (766, 0.002483154647052288), (767, 0.002457129769027233), (768, 0.0028316406533122063), (769, 0.003326314501464367), (770, 0.0034354403614997864), (771, 0.0034202709794044495), (772, 0.0033701546490192413), (773, 0.0033244267106056213), (774, 0.0034379027783870697), (775, 0.0036101071164011955), (776, 0.003621595911681652), (777, 0.003548714332282543), (778, 0.0034374045208096504), (779, 0.0033165989443659782), (780, 0.0030361758545041084), (781, 0.0026982752606272697), (782, 0.002491849474608898), (783, 0.0023237643763422966), (784, 0.0021643592044711113), (785, 0.00199816282838583), (786, 0.0019278433173894882), (787, 0.0019116019830107689), (788, 0.0018392419442534447), (789, 0.0017896927893161774), (790, 0.00176334660500288), (791, 0.0017404742538928986), (792, 0.001884731464087963), (793, 0.002090189605951309), (794, 0.0021608946844935417), (795, 0.0022041983902454376), (796, 0.0022509433329105377), (797, 0.002306644804775715), (798, 0.0024533001706004143), (799, 0.002608098089694977), (800, 0.0026343250647187233), (801, 0.002598976716399193), (802, 0.002527940087020397), (803, 0.0024347035214304924), (804, 0.0021623708307743073), (805, 0.0018712664023041725), (806, 0.0017858361825346947), (807, 0.0017651179805397987), (808, 0.0017403112724423409), (809, 0.0016796765848994255), (810, 0.0016928249970078468), (811, 0.0017176764085888863), (812, 0.0016335733234882355), (813, 0.001529158093035221), (814, 0.0014497675001621246), (815, 0.0014327233657240868), (816, 0.0013986453413963318), (817, 0.00141975749284029), (818, 0.0015849210321903229), (819, 0.00183207169175148), (820, 0.0021257558837532997), (821, 0.0024452097713947296), (822, 0.0028675608336925507), (823, 0.003308858722448349), (824, 0.0036623841151595116), (825, 0.003985532559454441), (826, 0.004296969622373581), (827, 0.004599963314831257), (828, 0.004886123351752758), (829, 0.005163496360182762), (830, 0.0054578352719545364), (831, 0.005753936246037483), (832, 0.006042281165719032), (833, 0.006323190405964851), (834, 0.006407836452126503), (835, 0.006392400711774826), (836, 0.006482400000095367), (837, 0.006552012637257576), (838, 0.006566932424902916), (839, 0.006550641730427742), (840, 0.006273247301578522), (841, 0.005918925628066063), (842, 0.005813809111714363), (843, 0.005813512951135635), (844, 0.005859252065420151), (845, 0.0059141963720321655), (846, 0.005929566919803619), (847, 0.005942171439528465), (848, 0.0060078296810388565), (849, 0.006088117137551308), (850, 0.006154010072350502), (851, 0.006184380501508713), (852, 0.006072375923395157), (853, 0.005899401381611824), (854, 0.005771134048700333), (855, 0.0056472159922122955), (856, 0.00553271546959877), (857, 0.005437882617115974), (858, 0.005330655723810196), (859, 0.005224260501563549), (860, 0.0051669348031282425), (861, 0.005147851072251797), (862, 0.005171932280063629), (863, 0.005236484110355377), (864, 0.005441566929221153), (865, 0.005688520148396492), (866, 0.005801370367407799), (867, 0.005823884159326553), (868, 0.005772655829787254), (869, 0.005674632266163826), (870, 0.0056654587388038635), (871, 0.005680004134774208), (872, 0.0056230369955301285), (873, 0.0055557843297719955), (874, 0.005491407588124275), (875, 0.00544043630361557), (876, 0.0053835418075323105), (877, 0.0053408946841955185), (878, 0.005365287885069847), (879, 0.0054233986884355545), (880, 0.00549716129899025), (881, 0.005585001781582832), (882, 0.005579443648457527), (883, 0.005532784387469292), (884, 0.005584420636296272), (885, 0.005670616403222084), (886, 0.0057569462805986404), (887, 0.00582943856716156), (888, 0.005816791206598282), (889, 0.00582759827375412), (890, 0.005855623632669449), (891, 0.005905898287892342), (892, 0.0060049742460250854), (893, 0.006129665300250053), (894, 0.00629267655313015), (895, 0.006444133818149567), (896, 0.005374317988753319), (897, 0.004153585992753506), (898, 0.0035390667617321014), (899, 0.00413826759904623), (900, 0.005734492093324661), (901, 0.00684763491153717), (902, 0.007115399464964867), (903, 0.006461421027779579), (904, 0.00504889152944088), (905, 0.0032834187150001526), (906, 0.0018148459494113922), (907, 0.00047717057168483734), (908, 0.00019270461052656174), (909, 0.0003368481993675232), (910, 0.0003220038488507271), (911, -0.00021540559828281403), (912, -0.0011386983096599579), (913, -0.0022696396335959435), (914, -0.0034154001623392105), (915, -0.004397076554596424), (916, -0.005077043082565069), (917, -0.00538666034117341), (918, -0.005325759295374155)], ('location', 2): [(0, 0.003672015853226185), (1, 0.0039503686130046844), (2, 0.003370058722794056), (3, 0.003208649344742298), (4, 0.0031277062371373177), (5, 0.003062021918594837), (6, 0.0030040862038731575), (7, 0.0027685286477208138), (8, 0.002768290229141712), (9, 0.0028693797066807747), (10, 0.00298465508967638), (11, 0.003052127081900835), (12, 0.0030750157311558723), (13, 0.0023595220409333706), (14, 0.0020784251391887665), (15, 0.0018738629296422005), (16, 0.00165213318541646), (17, 0.0014619948342442513), (18, 0.0013555409386754036), (19, 0.0016704918816685677), (20, 0.001744401641190052), (21, 0.0016968371346592903), (22, 0.0015881182625889778), (23, 0.0014530541375279427), (24, 0.0014405371621251106), (25, 0.0015512825921177864), (26, 0.0014521004632115364), (27, 0.0013142945244908333), (28, 0.001231563277542591), (29, 0.0011913897469639778), (30, 0.0008676173165440559), (31, 0.0002477287780493498), (32, -5.196337588131428e-05), (33, -0.0002629638183861971), (34, -0.00047694449312984943), (35, -0.0006968856323510408), (36, -0.0009385226294398308), (37, -0.0011614440008997917), (38, -0.0012308238074183464), (39, -0.0012504939222708344), (40, -0.001270162989385426), (41, -0.0013040188932791352), (42, -0.0012726662680506706), (43, -0.0011224625632166862), (44, -0.0010144589468836784), (45, -0.0009890676010400057), (46, -0.0010287640616297722), (47, -0.0011459467932581902), (48, -0.0015404104487970471), (49, -0.0021532655227929354), (50, -0.0025375967379659414), (51, -0.002780306152999401), (52, -0.0029282448813319206), (53, -0.002992856316268444), (54, -0.003045785240828991), (55, -0.0030735612381249666), (56, -0.0029625771567225456), (57, -0.0028318045660853386), (58, -0.0026918528601527214), (59, -0.002519238041713834), (60, -0.0025076745077967644), (61, -0.0026486990973353386), (62, -0.0025962472427636385), (63, -0.0025023100897669792), (64, -0.0024084930773824453), (65, -0.002328622154891491), (66, -0.002341019921004772), (67, -0.0024653554428368807), (68, -0.0025942211505025625), (69, -0.0027080653235316277), (70, -0.0027505038306117058), (71, -0.0027437089011073112), (72, -0.0026930449530482292), (73, -0.0026198511477559805), (74, -0.0026198511477559805), (75, -0.0026252148672938347), (76, -0.0026659846771508455), (77, -0.002748715691268444), (78, -0.0028138041961938143), (79, -0.002770054154098034), (80, -0.0026671765372157097), (81, -0.0025664446875452995), (82, -0.0025213835760951042), (83, -0.0025042176712304354), (84, -0.002416718052700162), (85, -0.002255904721096158), (86, -0.002086985157802701), (87, -0.001934516942128539), (88, -0.0018188833491876721), (89, -0.001716005615890026), (90, -0.0015929817454889417), (91, -0.001467454363591969), (92, -0.0014226316707208753), (93, -0.0014430164592340589), (94, -0.0014907001750543714), (95, -0.0015318273799493909), (96, -0.001518833450973034), (97, -0.0014557718532159925), (98, -0.0014202473685145378), (99, -0.0014045118587091565), (100, -0.0014333605067804456), (101, -0.0015438675181940198), (102, -0.0015834448859095573), (103, -0.0014608977362513542), (104, -0.0014495729701593518), (105, -0.0014605401083827019), (106, -0.0014762758510187268), (107, -0.00148593180347234), (108, -0.0014709114329889417), (109, -0.0009714246261864901), (110, -0.000722038559615612), (111, -0.000522602116689086), (112, -0.0003208999987691641), (113, -0.00012646964751183987), (114, 3.6609359085559845e-05), (115, 0.00012100907042622566), (116, 0.00018645497038960457), (117, 0.00026870984584093094), (118, 0.00039018411189317703), (119, 0.0005273940041661263), (120, 0.0006067873910069466), (121, 0.0003558516036719084), (122, 0.00019205803982913494), (123, 9.180302731692791e-05), (124, 3.0171824619174004e-05), (125, -4.361872561275959e-05), (126, -0.00013159564696252346), (127, -0.00016223196871578693), (128, -0.0002231476828455925), (129, -0.00033663492649793625), (130, -0.0004835014697164297), (131, -0.0006116514559835196), (132, -0.0007040377240628004), (133, -0.0006911635864526033), (134, -0.0007489805575460196), (135, -0.0008357649203389883), (136, -0.0009361391421407461), (137, -0.0010503409430384636), (138, -0.00112913828343153), (139, -0.001123178517445922), (140, -0.0011358140036463737), (141, -0.0011367679107934237), (142, -0.0011594181414693594), (143, -0.0012348771560937166), (144, -0.0011919615790247917), (145, -0.000957476906478405), (146, -0.0008948920294642448), (147, -0.0009128926321864128), (148, -0.0009528279770165682), (149, -0.0009630804415792227), (150, -0.0008925078436732292), (151, -0.0008064387366175652), (152, -0.0008662824984639883), (153, -0.0010341284796595573), (154, -0.0012197373434901237), (155, -0.0013569473521783948), (156, -0.0013825773494318128), (157, -0.0013538479106500745), (158, -0.0014784216182306409), (159, -0.0016497252508997917), (160, -0.0018147110240533948), (161, -0.0019597886130213737), (162, -0.001894104410894215), (163, -0.0016481756465509534), (164, -0.0016814350383356214), (165, -0.0018474935786798596), (166, -0.002050030045211315), (167, -0.0022159693762660027), (168, -0.002345907734706998), (169, -0.0016724943416193128), (170, -0.001532900263555348), (171, -0.0015581725165247917), (172, -0.0016393541591241956), (173, -0.0017833589809015393), (174, -0.0017673849361017346), (175, -0.0015616297023370862), (176, -0.0015969156520441175), (177, -0.0016559241339564323), (178, -0.001709926058538258), (179, -0.0017697691218927503), (180, -0.001839148928411305), (181, -0.0019106750842183828), (182, -0.0019644377753138542), (183, -0.002002704655751586), (184, -0.00203548651188612), (185, -0.002077448181807995), (186, -0.0021217940375208855), (187, -0.001568424515426159), (188, -0.001372682978399098), (189, -0.0012619380140677094), (190, -0.0011309264227747917), (191, -0.000965106301009655), (192, -0.0009071705862879753), (193, -0.0009634376037865877), (194, -0.0008270619437098503), (195, -0.000628340058028698), (196, -0.00046609691344201565), (197, -0.00039039854891598225), (198, -0.0006216650363057852), (199, -0.001047360710799694), (200, -0.001079547218978405), (201, -0.0009723787661641836), (202, -0.0008740304037928581), (203, -0.0008716469164937735), (204, -0.001053917221724987), (205, -0.001372682978399098), (206, -0.0016370891826227307), (207, -0.0018665676470845938), (208, -0.002087581669911742), (209, -0.00230561476200819), (210, -0.002318846993148327), (211, -0.002145993523299694), (212, -0.0021844981238245964), (213, -0.0022661571856588125), (214, -0.0023413775488734245), (215, -0.0024210093542933464), (216, -0.002390730194747448), (217, -0.0022270558401942253), (218, -0.002148616826161742), (219, -0.0020428774878382683), (220, -0.0019183037802577019), (221, -0.0018093464896082878), (222, -0.00178955786395818), (223, -0.001873123343102634), (224, -0.001957404427230358), (225, -0.0020325062796473503), (226, -0.0020804291125386953), (227, -0.0021092770621180534), (228, -0.002183425473049283), (229, -0.0023183708544820547), (230, -0.0024481890723109245), (231, -0.002601134590804577), (232, -0.0027555106207728386), (233, -0.0028656607028096914), (234, -0.0027965186163783073), (235, -0.0026318905875086784), (236, -0.0026655076071619987), (237, -0.0027390597388148308), (238, -0.002808081917464733), (239, -0.002887713722884655), (240, -0.0028706667944788933), (241, -0.0027276156470179558), (242, -0.0026497719809412956), (243, -0.0025472519919276237), (244, -0.0024469969794154167), (245, -0.002379286102950573), (246, -0.0023147945757955313), (247, -0.0018634675070643425), (248, -0.0016515133902430534), (249, -0.0015445827739313245), (250, -0.0014830706641077995), (251, -0.0014226316707208753), (252, -0.001448380877263844), (253, -0.0015487550990656018), (254, -0.0014569638296961784), (255, -0.0013042568461969495), (256, -0.0010995743796229362), (257, -0.0008247976657003164), (258, -0.0005564570892602205), (259, -0.00031863455660641193), (260, 3.230525180697441e-06), (261, 0.0003363015130162239), (262, 0.0005887863226234913), (263, 0.0006898762658238411), (264, 0.0006778358947485685), (265, 0.000647437758743763), (266, 0.0006222843658179045), (267, 0.0006123899947851896), (268, 0.0005720972549170256), (269, 0.00048793572932481766), (270, 0.0004109262954443693), (271, 0.0003512024413794279), (272, 0.0002737164031714201), (273, 0.0001741764135658741), (274, 5.6993914768099785e-05), (275, -5.53010031580925e-05), (276, -0.0001466160174459219), (277, -0.000218499219045043), (278, -0.000305521534755826), (279, -0.00038467696867883205), (280, -0.00042234640568494797), (281, -0.0003952865954488516), (282, -0.000328409718349576), (283, -0.00028942828066647053), (284, -0.0002920508850365877), (285, -0.0003150582779198885), (286, -0.00033925753086805344), (287, -0.00036548380739986897), (288, -0.0003163700457662344), (289, -0.0002165918704122305), (290, -0.00021599535830318928), (291, -0.00022088340483605862), (292, -0.0002243397757411003), (293, -0.00023697596043348312), (294, -0.00021599535830318928), (295, -0.0001506684347987175), (296, -0.00017009954899549484), (297, -0.00022946600802242756), (298, -0.0002890711184591055), (299, -0.000328409718349576), (300, -0.00021194200962781906), (301, 3.6728568375110626e-05), (302, 9.049195796251297e-05), (303, 9.25182830542326e-05), (304, 9.835953824222088e-05), (305, 0.00011886353604495525), (306, 0.00020171399228274822), (307, 0.00032414193265140057), (308, 0.0003259300719946623), (309, 0.00027490826323628426), (310, 0.00020993966609239578), (311, 0.00016154046170413494), (312, 0.00014246697537600994), (313, 0.000164044089615345), (314, 0.00017644185572862625), (315, 0.0001388906966894865), (316, 4.209275357425213e-05), (317, -6.483797915279865e-05), (318, -0.00016497354954481125), (319, -0.0002494931686669588), (320, -0.00031553558073937893), (321, -0.00040637259371578693), (322, -0.0005044816061854362), (323, -0.0006126051302999258), (324, -0.0006574273575097322), (325, -0.0005953193176537752), (326, -0.0006235719192773104), (327, -0.0006379962433129549), (328, -0.0006177304312586784), (329, -0.0005967502947896719), (330, -0.0006570701953023672), (331, -0.0007507686968892813), (332, -0.0007802126929163933), (333, -0.0007825973443686962), (334, -0.0008003595285117626), (335, -0.000842320965602994), (336, -0.000857221893966198), (337, -0.0008135915268212557), (338, -0.0007521992083638906), (339, -0.0007082109805196524), (340, -0.0006949780508875847), (341, -0.0006971238180994987), (342, -0.0007281184662133455), (343, -0.0007680535782128572), (344, -0.0007563710678368807), (345, -0.0007412310224026442), (346, -0.0007394428830593824), (347, -0.000730025814846158), (348, -0.0007239466067403555), (349, -0.0007185814902186394), (350, -0.0006822228897362947), (351, -0.0006425259634852409), (352, -0.0005609868094325066), (353, -0.00041889003477990627), (354, -0.0002745268866419792), (355, -0.00016080192290246487), (356, -1.703505404293537e-05), (357, 0.000144612742587924), (358, 0.0002914785873144865), (359, 0.00038386578671634197), (360, 0.00036336155608296394), (361, 0.00025726528838276863), (362, 0.0001630901824682951), (363, 9.466405026614666e-05), (364, 4.9245310947299004e-05), (365, -1.4769844710826874e-05), (366, -0.00014196615666151047), (367, -0.0003002763260155916), (368, -0.0004120944067835808), (369, -0.00045894435606896877), (370, -0.0004718182608485222), (371, -0.0005071044433861971), (372, -0.0005578880663961172), (373, -0.0006078362930566072), (374, -0.0007043955847620964), (375, -0.0008213403634727001), (376, -0.0009248135611414909), (377, -0.000980842625722289), (378, -0.000929701142013073), (379, -0.0008438704535365105), (380, -0.0008549569174647331), (381, -0.0009400725830346346), (382, -0.0010353205725550652), (383, -0.001072990708053112), (384, -0.0010125518310815096), (385, -0.0009403107687830925), (386, -0.0009606955572962761), (387, -0.0010075448080897331), (388, -0.001014101319015026), (389, -0.0009618876501917839), (390, -0.0008764148224145174), (391, -0.0008214595727622509), (392, -0.0008246779907494783), (393, -0.0008376715704798698), (394, -0.0008504276629537344), (395, -0.000882256543263793), (396, -0.0009413838852196932), (397, -0.001061546616256237), (398, -0.0012786268489435315), (399, -0.0014890312450006604), (400, -0.0016126511618494987), (401, -0.0016347048804163933), (402, -0.0014841436641290784), (403, -0.0012241480872035027), (404, -0.0010983829852193594), (405, -0.0010448580142110586), (406, -0.0010129092261195183), (407, -0.0009704707190394402), (408, -0.0008835678454488516), (409, -0.0007949951104819775), (410, -0.0007496948819607496), (411, -0.0007332449313253164), (412, -0.0007524376269429922), (413, -0.0007963059470057487), (414, -0.0006677990313619375), (415, -0.00043176417239010334), (416, -0.00032006483525037766), (417, -0.0002380490768700838), (418, -0.00018178229220211506), (419, -0.0001796369906514883), (420, -0.0002351878210902214), (421, -0.0003468871582299471), (422, -0.0005105615127831697), (423, -0.0006868725176900625), (424, -0.0008615134283900261), (425, -0.0010378246661275625), (426, -0.0011322377249598503), (427, -0.0011559603735804558), (428, -0.0012646792456507683), (429, -0.0013478874461725354), (430, -0.0013657688396051526), (431, -0.001331198145635426), (432, -0.001153696095570922), (433, -0.0008995411917567253), (434, -0.0007909415289759636), (435, -0.0007270451169461012), (436, -0.0006699443329125643), (437, -0.00060271006077528), (438, -0.0005148530472069979), (439, -0.0004171016626060009), (440, -0.00031887274235486984), (441, -0.0002591495867818594), (442, -0.00022064452059566975), (443, -0.0001544831320643425), (444, -0.00012503867037594318), (445, -0.0001001239288598299), (446, 1.634354703128338e-05), (447, 0.00011552567593753338), (448, 0.00018371338956058025), (449, 0.00025595445185899734), (450, 0.0002416493371129036), (451, 0.00013710255734622478), (452, 5.9974147006869316e-05), (453, -7.020239718258381e-05), (454, -0.00024305633269250393), (455, -0.0004399893805384636), (456, -0.0006134395953267813), (457, -0.0007609007880091667), (458, -0.0009723787661641836), (459, -0.0011888621374964714), (460, -0.0013697027461603284), (461, -0.001503932406194508), (462, -0.0014877199428156018), (463, -0.0013401388423517346), (464, -0.0012528776424005628), (465, -0.0011845713015645742), (466, -0.0011417744681239128), (467, -0.0010932562872767448), (468, -0.0009392385836690664), (469, -0.0007120256777852774), (470, -0.0005203364416956902), (471, -0.00034152274020016193), (472, -0.00018106750212609768), (473, -3.0744122341275215e-05), (474, -4.2426399886608124e-05), (475, -0.00015722564421594143), (476, -0.00011979346163570881), (477, -3.050547093153e-05), (478, 7.523293606936932e-05), (479, 0.00016177864745259285), (480, 8.381600491702557e-05), (481, -6.424169987440109e-05), (482, -5.3036026656627655e-05), (483, 4.780478775501251e-06), (484, 3.970833495259285e-05), (485, 3.136415034532547e-05), (486, 0.00011922093108296394), (487, 0.00029028672724962234), (488, 0.00038756150752305984), (489, 0.00043321819975972176), (490, 0.0003970980178564787), (491, 0.0002925512380897999), (492, 0.00025666970759630203), (493, 0.00028825970366597176), (494, 0.0002730011474341154), (495, 0.00025428528897464275), (496, 0.00024725194089114666), (497, 0.0002333046868443489), (498, 0.00018013711087405682), (499, 6.0093123465776443e-05), (500, -0.00013326387852430344), (501, -0.0003601193893700838), (502, -0.0005856631323695183), (503, -0.0008244393393397331), (504, -0.0010084984824061394), (505, -0.0011806373950093985), (506, -0.001469600130803883), (507, -0.001810777117498219), (508, -0.002170550636947155), (509, -0.0025027869269251823), (510, -0.002709615044295788), (511, -0.0027892468497157097), (512, -0.002840745262801647), (513, -0.002845513867214322), (514, -0.002830970101058483), (515, -0.00280152540653944), (516, -0.002711045788601041), (517, -0.0025310395285487175), (518, -0.0022842762991786003), (519, -0.0020122407004237175), (520, -0.0017440199153497815), (521, -0.0014889120357111096), (522, -0.0011086342856287956), (523, -0.0006905680056661367), (524, -0.0003948090597987175), (525, -0.00015877489931881428), (526, 5.7709403336048126e-05), (527, 0.0002921938430517912), (528, 0.00048066372983157635), (529, 0.0005918862298130989), (530, 0.0007079960778355598), (531, 0.0008033635094761848), (532, 0.0008642794564366341), (533, 0.000895393081009388), (534, 0.0008070589974522591), (535, 0.0007023932412266731), (536, 0.0007158638909459114), (537, 0.0007941843941807747), (538, 0.0009080292657017708), (539, 0.0010296227410435677), (540, 0.0009760977700352669), (541, 0.0008469941094517708), (542, 0.0008034827187657356), (543, 0.0007717730477452278), (544, 0.0007412554696202278), (545, 0.0007056118920445442), (546, 0.0004510998260229826), (547, 0.00014854641631245613), (548, 2.3853499442338943e-05), (549, -6.412249058485031e-05), (550, -0.00012921076267957687), (551, -0.00014053634367883205), (552, -0.00040720682591199875), (553, -0.0007730601355433464), (554, -0.0009283898398280144), (555, -0.0010094523895531893), (556, -0.001025068573653698), (557, -0.000965106301009655), (558, -0.001079309033229947), (559, -0.001221764599904418), (560, -0.0011348603293299675), (561, -0.0009695170447230339), (562, -0.0008046505972743034), (563, -0.0006898522842675447), (564, -0.0006652949377894402), (565, -0.0006396651733666658), (566, -0.0005364296957850456), (567, -0.00043092970736324787), (568, -0.00038467696867883205), (569, -0.0003905175253748894), (570, -0.0005005476996302605), (571, -0.0006518249865621328), (572, -0.0007617352530360222), (573, -0.0008662824984639883), (574, -0.0009409070480614901), (575, -0.0009592650458216667), (576, -0.0009448407217860222), (577, -0.0009609346743673086), (578, -0.0010515337344259024), (579, -0.0011534569784998894), (580, -0.001207578694447875), (581, -0.0012218831107020378), (582, -0.0010671494528651237), (583, -0.0008576987311244011), (584, -0.0007575636263936758), (585, -0.0007151251193135977), (586, -0.0007455234881490469), (587, -0.000878441147506237), (588, -0.001058089779689908), (589, -0.0012831572676077485), (590, -0.001600968767888844), (591, -0.0019937639590352774), (592, -0.002454507863149047), (593, -0.0029674649704247713), (594, -0.0033762333914637566), (595, -0.003672945313155651), (596, -0.003961075097322464), (597, -0.004171240609139204), (598, -0.004277336876839399), (599, -0.004290449898689985), (600, -0.004076588433235884), (601, -0.003796207718551159), (602, -0.003648388432338834), (603, -0.0034956810995936394), (604, -0.0032924292609095573), (605, -0.003058660076931119), (606, -0.002869236283004284), (607, -0.0027068734634667635), (608, -0.0025236487854272127), (609, -0.0023413775488734245), (610, -0.002173650311306119), (611, -0.0020160553976893425), (612, -0.0019183037802577019), (613, -0.0018935082480311394), (614, -0.0018890975043177605), (615, -0.001938927685841918), (616, -0.0020584939047694206), (617, -0.002242433838546276), (618, -0.002656686119735241), (619, -0.0031140921637415886), (620, -0.0033801672980189323), (621, -0.0035886643454432487), (622, -0.003747212700545788), (623, -0.003825295018032193), (624, -0.0039020658005028963), (625, -0.00393830519169569), (626, -0.0038742898032069206), (627, -0.0037412524688988924), (628, -0.0035649416968226433), (629, -0.003397691063582897), (630, -0.003229129360988736), (631, -0.003110158257186413), (632, -0.0030765412375330925), (633, -0.003077375702559948), (634, -0.0030965686310082674), (635, -0.0031332848593592644), (636, -0.0030932307709008455), (637, -0.00303136114962399), (638, -0.0030199168249964714), (639, -0.002988087944686413), (640, -0.0029286027420312166), (641, -0.0028704286087304354), (642, -0.00277541927061975), (643, -0.002687680535018444), (644, -0.0026842234656214714), (645, -0.00270079355686903), (646, -0.00270329718478024), (647, -0.0026811242569237947), (648, -0.002614128403365612), (649, -0.0025412917602807283), (650, -0.002491939114406705), (651, -0.00243221502751112), (652, -0.002335655502974987), (653, -0.0021927242632955313), (654, -0.0018095850246027112), (655, -0.0013974785106256604), (656, -0.0012193797156214714), (657, -0.001150954281911254), (658, -0.001139867352321744), (659, -0.0011576300021260977), (660, -0.001168358139693737), (661, -0.0012048364151269197), (662, -0.0012842296855524182), (663, -0.001358497072942555), (664, -0.0013944982783868909), (665, -0.0013928292319178581), (666, -0.0012875680113211274), (667, -0.0010825281497091055), (668, -0.0008902428671717644), (669, -0.000764000229537487), (670, -0.0007394428830593824), (671, -0.0008172867819666862), (672, -0.000945437466725707), (673, -0.001094209961593151), (674, -0.0012278438080102205), (675, -0.0013443110510706902), (676, -0.0014585136668756604), (677, -0.001580345444381237), (678, -0.0015425562160089612), (679, -0.00143252604175359), (680, -0.0014262079494073987), (681, -0.0014240621821954846), (682, -0.001420605112798512), (683, -0.0014171479269862175), (684, -0.0012540696188807487), (685, -0.0010197048541158438), (686, -0.0008883357513695955), (687, -0.0007885568775236607), (688, -0.0006712561007589102), (689, -0.0004761097952723503), (690, 3.6728568375110626e-05), (691, 0.0006477951537817717), (692, 0.0010520340874791145), (693, 0.0013616206124424934), (694, 0.0016478421166539192), (695, 0.0019463421776890755), (696, 0.002576124854385853), (697, 0.003238690085709095), (698, 0.003548753447830677), (699, 0.00374604482203722), (700, 0.003900658804923296), (701, 0.004019272048026323), (702, 0.004217397887259722), (703, 0.004495036322623491), (704, 0.004759799689054489), (705, 0.0050184838473796844), (706, 0.0052380673587322235), (707, 0.005458606407046318), (708, 0.005404483526945114), (709, 0.0052533261477947235), (710, 0.00535048171877861), (711, 0.005439531058073044), (712, 0.005468856543302536), (713, 0.005448115989565849), (714, 0.00513852946460247), (715, 0.004660259932279587), (716, 0.004319322295486927), (717, 0.004066360183060169), (718, 0.0038571483455598354), (719, 0.003613006789237261), (720, 0.003402602393180132), (721, 0.003229152411222458), (722, 0.002992999739944935), (723, 0.002712261863052845), (724, 0.0024128081277012825), (725, 0.0021768934093415737), (726, 0.002157699316740036), (727, 0.0022121788933873177), (728, 0.002266538329422474), (729, 0.002257716841995716), (730, 0.002268921583890915), (731, 0.002296936232596636), (732, 0.0023183939047157764), (733, 0.0023158909752964973), (734, 0.002287757582962513), (735, 0.0022492529824376106), (736, 0.002182376105338335), (737, 0.002068770118057728), (738, 0.0019904496148228645), (739, 0.0019202353432774544), (740, 0.0017738458700478077), (741, 0.0016263844445347786), (742, 0.0014929892495274544), (743, 0.0013687731698155403), (744, 0.001265060156583786), (745, 0.0015076519921422005), (746, 0.0015288712456822395), (747, 0.001436007209122181), (748, 0.001283896155655384), (749, 0.0011333348229527473), (750, 0.0010335566475987434), (751, 0.0010014893487095833), (752, 0.0009995820000767708), (753, 0.0010264040902256966), (754, 0.001085531897842884), (755, 0.001148235984146595), (756, 0.0011428715661168098), (757, 0.0010880352929234505), (758, 0.0010491730645298958), (759, 0.0010113837197422981), (760, 0.000973832793533802), (761, 0.0009160162881016731), (762, 0.0007113339379429817), (763, 0.00044907350093126297), (764, 0.00026739854365587234), (765, 0.00011409493163228035), (766, -2.2756867110729218e-05), (767, -0.0001554375048726797), (768, -0.0001389866229146719), (769, -6.126170046627522e-05), (770, -8.140783756971359e-05), (771, -9.678606875240803e-05), (772, -0.0001150248572230339), (773, -0.00017427257262170315), (774, -0.00011359434574842453), (775, 5.01866452395916e-06), (776, -4.518311470746994e-06), (777, -6.233435124158859e-05), (778, -0.00015031080693006516), (779, -0.00023733358830213547), (780, -0.00037120631895959377), (781, -0.0005227213259786367), (782, -0.0006527777295559645), (783, -0.0007990479934960604), (784, -0.0009480600710958242), (785, -0.0010665541049093008), (786, -0.0011687164660543203), (787, -0.00123594980686903), (788, -0.0012653946178033948), (789, -0.0012929324293509126), (790, -0.0013316749827936292), (791, -0.0013860344188287854), (792, -0.001450526644475758), (793, -0.0015104888007044792), (794, -0.0015317080542445183), (795, -0.0014972565695643425), (796, -0.0014421819942072034), (797, -0.0014160751597955823), (798, -0.0014504073187708855), (799, -0.00146149389911443), (800, -0.0013825773494318128), (801, -0.001282203127630055), (802, -0.0012090085074305534), (803, -0.0011638288851827383), (804, -0.0013137934729456902), (805, -0.001536714960820973), (806, -0.0016126511618494987), (807, -0.001652705599553883), (808, -0.0016590235754847527), (809, -0.0016083597438409925), (810, -0.0014749645488336682), (811, -0.0013669609325006604), (812, -0.0013736366527155042), (813, -0.0014182209270074964), (814, -0.0014318106696009636), (815, -0.0013705372111871839), (816, -0.0011539338156580925), (817, -0.0008900044485926628), (818, -0.0006788854952901602), (819, -0.00046526198275387287), (820, -0.00022326689213514328), (821, 2.897973172366619e-05), (822, 0.00012327451258897781), (823, 0.00010682339780032635), (824, 0.0001939656212925911), (825, 0.0003588318359106779), (826, 0.0005577923730015755), (827, 0.000761878676712513), (828, 0.0008036019280552864), (829, 0.0008028866723179817), (830, 0.0009553553536534309), (831, 0.0010999562218785286), (832, 0.0011754157021641731), (833, 0.0011807801201939583), (834, 0.0010868432000279427), (835, 0.0009614350274205208), (836, 0.0008760811761021614), (837, 0.0007944228127598763), (838, 0.0007099034264683723), (839, 0.0006289603188633919), (840, 0.0006220459472388029), (841, 0.0006201388314366341), (842, 0.0005202414467930794), (843, 0.0003913759719580412), (844, 0.0002868296578526497), (845, 0.00024999375455081463), (846, 0.00040866131894290447), (847, 0.0006097673904150724), (848, 0.0006636499892920256), (849, 0.0006857037078589201), (850, 0.0007102610543370247), (851, 0.0007001282647252083), (852, 0.0006731869652867317), (853, 0.0006270529702305794), (854, 0.000563514418900013), (855, 0.0005327581893652678), (856, 0.0005159496795386076), (857, 0.0005012867040932178), (858, 0.0007093073800206184), (859, 0.0009838463738560677), (860, 0.0010879160836338997), (861, 0.0011227251961827278), (862, 0.001122605986893177), (863, 0.0011005522683262825), (864, 0.0011955620720982552), (865, 0.0012600542977452278), (866, 0.001102459616959095), (867, 0.0008281590417027473), (868, 0.0005409838631749153), (869, 0.0003003000747412443), (870, 0.00025726528838276863), (871, 0.00026763672940433025), (872, 0.00012279720976948738), (873, -7.020239718258381e-05), (874, -0.00023101572878658772), (875, -0.0003212571609765291), (876, -0.00024353270418941975), (877, -0.00011323671787977219), (878, -7.139449007809162e-05), (879, -8.784537203609943e-05), (880, -0.00012503867037594318), (881, -0.00013397936709225178), (882, 9.204144589602947e-05), (883, 0.0003780245315283537), (884, 0.0004899620544165373), (885, 0.0004944922402501106), (886, 0.0004377483855932951), (887, 0.0003498911391943693), (888, 0.00019801827147603035), (889, 2.92179174721241e-05), (890, -6.972556002438068e-05), (891, -0.00011574034579098225), (892, -0.0001275420654565096), (893, -0.00014053634367883205), (894, -0.00011597899720072746), (895, -4.123430699110031e-05), (896, -0.0005638478323817253), (897, -0.001081216149032116), (898, -0.001130211865529418), (899, -0.00034068827517330647), (900, 0.0011421563103795052), (901, 0.0023828865960240364), (902, 0.0031453492119908333), (903, 0.0033722040243446827), (904, 0.0031551248393952847), (905, 0.002738368697464466), (906, 0.0025175930932164192), (907, 0.0023801447823643684), (908, 0.0028915521688759327), (909, 0.0036522261798381805), (910, 0.004284631926566362), (911, 0.004552137106657028), (912, 0.004529607482254505), (913, 0.0043190838769078255), (914, 0.004031670279800892), (915, 0.0037683360278606415), (916, 0.003605734556913376), (917, 0.003577005583792925), (918, 0.003672015853226185)], ('rotation_euler', 0): [(0, -0.03136718273162842), (1, -0.032198429107666016), (2, -0.03400528430938721), (3, -0.036524057388305664), (4, -0.0387570858001709), (5, -0.040761470794677734), (6, -0.04213905334472656), (7, -0.04314720630645752), (8, -0.043558478355407715), (9, -0.043373048305511475), (10, -0.04284107685089111), (11, -0.04227489233016968), (12, -0.04193037748336792), (13, -0.04181075096130371), (14, -0.042029738426208496), (15, -0.042499661445617676), (16, -0.04270368814468384), (17, -0.04296278953552246), (18, -0.04322981834411621), (19, -0.04307293891906738), (20, -0.04263430833816528), (21, -0.04258161783218384), (22, -0.04318881034851074), (23, -0.043851256370544434), (24, -0.04433333873748779), (25, -0.044397592544555664), (26, -0.04463052749633789), (27, -0.04481786489486694), (28, -0.044655442237854004), (29, -0.04446214437484741), (30, -0.043868839740753174), (31, -0.043537914752960205), (32, -0.04406338930130005), (33, -0.045317649841308594), (34, -0.04657942056655884), (35, -0.04774564504623413), (36, -0.04841947555541992), (37, -0.04896402359008789), (38, -0.04931288957595825), (39, -0.049416184425354004), (40, -0.04946088790893555), (41, -0.04979991912841797), (42, -0.05034148693084717), (43, -0.05074089765548706), (44, -0.05105239152908325), (45, -0.05162656307220459), (46, -0.051921725273132324), (47, -0.05188882350921631), (48, -0.05216604471206665), (49, -0.05236625671386719), (50, -0.05204665660858154), (51, -0.05156993865966797), (52, -0.05095106363296509), (53, -0.04959571361541748), (54, -0.048567354679107666), (55, -0.047844529151916504), (56, -0.04721921682357788), (57, -0.04675328731536865), (58, -0.04605168104171753), (59, -0.04504978656768799), (60, -0.0440981388092041), (61, -0.04312986135482788), (62, -0.04204702377319336), (63, -0.04078412055969238), (64, -0.039533257484436035), (65, -0.038149893283843994), (66, -0.03668433427810669), (67, -0.035708069801330566), (68, -0.035645127296447754), (69, -0.03550529479980469), (70, -0.03524768352508545), (71, -0.035291850566864014), (72, -0.03525954484939575), (73, -0.03537929058074951), (74, -0.035858213901519775), (75, -0.03596073389053345), (76, -0.03597831726074219), (77, -0.03592044115066528), (78, -0.03554058074951172), (79, -0.0351639986038208), (80, -0.03479421138763428), (81, -0.03440749645233154), (82, -0.03378993272781372), (83, -0.033277153968811035), (84, -0.03276127576828003), (85, -0.03202885389328003), (86, -0.03133547306060791), (87, -0.03035569190979004), (88, -0.029577255249023438), (89, -0.029159188270568848), (90, -0.02898550033569336), (91, -0.02844017744064331), (92, -0.02773529291152954), (93, -0.026890277862548828), (94, -0.02616971731185913), (95, -0.025578975677490234), (96, -0.024900436401367188), (97, -0.024144887924194336), (98, -0.023525714874267578), (99, -0.02351093292236328), (100, -0.023672103881835938), (101, -0.023693978786468506), (102, -0.023788869380950928), (103, -0.023971498012542725), (104, -0.024440884590148926), (105, -0.025026261806488037), (106, -0.025446951389312744), (107, -0.025607705116271973), (108, -0.025850772857666016), (109, -0.026185572147369385), (110, -0.026603400707244873), (111, -0.027176260948181152), (112, -0.027737021446228027), (113, -0.028075814247131348), (114, -0.027832746505737305), (115, -0.027270615100860596), (116, -0.026502013206481934), (117, -0.025827229022979736), (118, -0.025262892246246338), (119, -0.024498403072357178), (120, -0.023386776447296143), (121, -0.022319138050079346), (122, -0.021421730518341064), (123, -0.020394563674926758), (124, -0.019154369831085205), (125, -0.017911970615386963), (126, -0.017052769660949707), (127, -0.01615387201309204), (128, -0.015197396278381348), (129, -0.014098405838012695), (130, -0.012654304504394531), (131, -0.011444091796875), (132, -0.01036679744720459), (133, -0.009145557880401611), (134, -0.007713198661804199), (135, -0.0060329437255859375), (136, -0.004521191120147705), (137, -0.0034825801849365234), (138, -0.002580106258392334), (139, -0.0015320181846618652), (140, -0.0011835694313049316), (141, -0.0014220476150512695), (142, -0.001604318618774414), (143, -0.0018502473831176758), (144, -0.0019809603691101074), (145, -0.0018555521965026855), (146, -0.0017557144165039062), (147, -0.0017235279083251953), (148, -0.0019716620445251465), (149, -0.0025699734687805176), (150, -0.0031985044479370117), (151, -0.00369185209274292), (152, -0.003779768943786621), (153, -0.0037649869918823242), (154, -0.003930449485778809), (155, -0.004129171371459961), (156, -0.00430530309677124), (157, -0.004325449466705322), (158, -0.003989815711975098), (159, -0.0036336183547973633), (160, -0.003518998622894287), (161, -0.00357663631439209), (162, -0.0037922263145446777), (163, -0.0039501190185546875), (164, -0.0040544867515563965), (165, -0.004198670387268066), (166, -0.004277229309082031), (167, -0.004388272762298584), (168, -0.004732668399810791), (169, -0.005330979824066162), (170, -0.006218850612640381), (171, -0.007559597492218018), (172, -0.008683979511260986), (173, -0.009289681911468506), (174, -0.010023951530456543), (175, -0.011006772518157959), (176, -0.011646568775177002), (177, -0.011668264865875244), (178, -0.01156926155090332), (179, -0.011544287204742432), (180, -0.01141446828842163), (181, -0.011572837829589844), (182, -0.012034296989440918), (183, -0.012449264526367188), (184, -0.012526392936706543), (185, -0.012786507606506348), (186, -0.013171255588531494), (187, -0.01336902379989624), (188, -0.013495087623596191), (189, -0.013731956481933594), (190, -0.013702690601348877), (191, -0.013332724571228027), (192, -0.012804269790649414), (193, -0.012549638748168945), (194, -0.012769818305969238), (195, -0.012936174869537354), (196, -0.012964963912963867), (197, -0.012870728969573975), (198, -0.012738347053527832), (199, -0.012922585010528564), (200, -0.013723373413085938), (201, -0.014918148517608643), (202, -0.016232848167419434), (203, -0.017326533794403076), (204, -0.018218576908111572), (205, -0.019163131713867188), (206, -0.020393192768096924), (207, -0.021930396556854248), (208, -0.023820221424102783), (209, -0.0254213809967041), (210, -0.026217222213745117), (211, -0.0264320969581604), (212, -0.02693021297454834), (213, -0.027613401412963867), (214, -0.02815026044845581), (215, -0.028639376163482666), (216, -0.029492735862731934), (217, -0.03097224235534668), (218, -0.0330737829208374), (219, -0.035804033279418945), (220, -0.038576722145080566), (221, -0.04114699363708496), (222, -0.04329788684844971), (223, -0.04519021511077881), (224, -0.046974897384643555), (225, -0.049131929874420166), (226, -0.051585614681243896), (227, -0.05402088165283203), (228, -0.05585920810699463), (229, -0.05687212944030762), (230, -0.05748248100280762), (231, -0.05778515338897705), (232, -0.05838817358016968), (233, -0.05919927358627319), (234, -0.059840261936187744), (235, -0.060578763484954834), (236, -0.06151694059371948), (237, -0.06259304285049438), (238, -0.0635787844657898), (239, -0.06450164318084717), (240, -0.06517499685287476), (241, -0.06570547819137573), (242, -0.06626182794570923), (243, -0.06695997714996338), (244, -0.06740844249725342), (245, -0.06788003444671631), (246, -0.06836235523223877), (247, -0.06836235523223877), (248, -0.06798475980758667), (249, -0.0675918459892273), (250, -0.06701642274856567), (251, -0.06607222557067871), (252, -0.06510096788406372), (253, -0.06410270929336548), (254, -0.063590407371521), (255, -0.06409579515457153), (256, -0.06466001272201538), (257, -0.06528568267822266), (258, -0.06624442338943481), (259, -0.06763797998428345), (260, -0.06901383399963379), (261, -0.07004624605178833), (262, -0.07047808170318604), (263, -0.07013922929763794), (264, -0.06933236122131348), (265, -0.06836920976638794), (266, -0.06719416379928589), (267, -0.0662151575088501), (268, -0.065768301486969), (269, -0.0654647946357727), (270, -0.06538182497024536), (271, -0.06543993949890137), (272, -0.06538248062133789), (273, -0.06528156995773315), (274, -0.06502604484558105), (275, -0.06461197137832642), (276, -0.06431978940963745), (277, -0.06408804655075073), (278, -0.06385201215744019), (279, -0.06357645988464355), (280, -0.06349390745162964), (281, -0.06335902214050293), (282, -0.06304323673248291), (283, -0.06251829862594604), (284, -0.06188422441482544), (285, -0.06079459190368652), (286, -0.05958366394042969), (287, -0.058108508586883545), (288, -0.05623716115951538), (289, -0.054058194160461426), (290, -0.05201590061187744), (291, -0.05026876926422119), (292, -0.04849368333816528), (293, -0.04648280143737793), (294, -0.044111430644989014), (295, -0.04152637720108032), (296, -0.039428651332855225), (297, -0.0375823974609375), (298, -0.03612494468688965), (299, -0.0349576473236084), (300, -0.03350561857223511), (301, -0.03189617395401001), (302, -0.030245959758758545), (303, -0.02899014949798584), (304, -0.028191566467285156), (305, -0.027685046195983887), (306, -0.027097761631011963), (307, -0.026282787322998047), (308, -0.024880290031433105), (309, -0.0234299898147583), (310, -0.02191990613937378), (311, -0.020261943340301514), (312, -0.019086480140686035), (313, -0.018400073051452637), (314, -0.017733216285705566), (315, -0.0169295072555542), (316, -0.015772998332977295), (317, -0.014117658138275146), (318, -0.0122641921043396), (319, -0.011129200458526611), (320, -0.010814905166625977), (321, -0.011132955551147461), (322, -0.011425495147705078), (323, -0.01144254207611084), (324, -0.011186361312866211), (325, -0.010982632637023926), (326, -0.011081337928771973), (327, -0.011336147785186768), (328, -0.011654973030090332), (329, -0.011614024639129639), (330, -0.011257767677307129), (331, -0.011140048503875732), (332, -0.011103332042694092), (333, -0.01095801591873169), (334, -0.010792732238769531), (335, -0.010816037654876709), (336, -0.010988712310791016), (337, -0.011332333087921143), (338, -0.011666595935821533), (339, -0.011729001998901367), (340, -0.01150733232498169), (341, -0.011233508586883545), (342, -0.011232316493988037), (343, -0.011193037033081055), (344, -0.010956346988677979), (345, -0.010628819465637207), (346, -0.010140061378479004), (347, -0.00933772325515747), (348, -0.007784247398376465), (349, -0.005812525749206543), (350, -0.004141867160797119), (351, -0.0027326345443725586), (352, -0.0009121894836425781), (353, 0.0011649131774902344), (354, 0.002624988555908203), (355, 0.003799259662628174), (356, 0.0048413872718811035), (357, 0.005429089069366455), (358, 0.00595402717590332), (359, 0.006772756576538086), (360, 0.007809638977050781), (361, 0.008812129497528076), (362, 0.009616255760192871), (363, 0.010441482067108154), (364, 0.011503517627716064), (365, 0.01270073652267456), (366, 0.013934910297393799), (367, 0.014759182929992676), (368, 0.015218675136566162), (369, 0.01525646448135376), (370, 0.015118956565856934), (371, 0.014892041683197021), (372, 0.014602601528167725), (373, 0.014272034168243408), (374, 0.013991057872772217), (375, 0.013531923294067383), (376, 0.012900292873382568), (377, 0.011768221855163574), (378, 0.01022416353225708), (379, 0.00887155532836914), (380, 0.008320629596710205), (381, 0.00808095932006836), (382, 0.007663547992706299), (383, 0.007108509540557861), (384, 0.0064261555671691895), (385, 0.005649983882904053), (386, 0.004852414131164551), (387, 0.004081785678863525), (388, 0.003487229347229004), (389, 0.0030053257942199707), (390, 0.0026314854621887207), (391, 0.002063751220703125), (392, 0.0011580586433410645), (393, -0.0002529621124267578), (394, -0.0019333362579345703), (395, -0.003500223159790039), (396, -0.004444777965545654), (397, -0.0047792792320251465), (398, -0.004818916320800781), (399, -0.004775524139404297), (400, -0.00477445125579834), (401, -0.005148649215698242), (402, -0.005458354949951172), (403, -0.005667686462402344), (404, -0.005984246730804443), (405, -0.006200432777404785), (406, -0.006236135959625244), (407, -0.006175637245178223), (408, -0.005914926528930664), (409, -0.005562186241149902), (410, -0.00519716739654541), (411, -0.004943549633026123), (412, -0.004574596881866455), (413, -0.004122734069824219), (414, -0.003994882106781006), (415, -0.003983855247497559), (416, -0.003959536552429199), (417, -0.004238486289978027), (418, -0.004753828048706055), (419, -0.005316495895385742), (420, -0.005870342254638672), (421, -0.006329953670501709), (422, -0.006894111633300781), (423, -0.007432758808135986), (424, -0.007949769496917725), (425, -0.008286535739898682), (426, -0.008199095726013184), (427, -0.007803559303283691), (428, -0.007383823394775391), (429, -0.006800353527069092), (430, -0.006172239780426025), (431, -0.00560992956161499), (432, -0.004911303520202637), (433, -0.004005372524261475), (434, -0.003159642219543457), (435, -0.0023340582847595215), (436, -0.0014676451683044434), (437, -0.0008448362350463867), (438, -0.0006832480430603027), (439, -0.0005170702934265137), (440, 0.00011157989501953125), (441, 0.0009037256240844727), (442, 0.00150376558303833), (443, 0.0020530223846435547), (444, 0.0023936033248901367), (445, 0.00272214412689209), (446, 0.002768993377685547), (447, 0.0028488636016845703), (448, 0.002950906753540039), (449, 0.0029748082160949707), (450, 0.002869844436645508), (451, 0.002766728401184082), (452, 0.0026012063026428223), (453, 0.0022823214530944824), (454, 0.0018843412399291992), (455, 0.0014080405235290527), (456, 0.0008955001831054688), (457, 0.0007022619247436523), (458, 0.0009686946868896484), (459, 0.0012539029121398926), (460, 0.0011878013610839844), (461, 0.0008794665336608887), (462, 0.0005156397819519043), (463, -1.3232231140136719e-05), (464, -0.0005065202713012695), (465, -0.0006971359252929688), (466, -0.0006541609764099121), (467, -0.0005674958229064941), (468, -0.000451505184173584), (469, -0.0004519224166870117), (470, -0.0007091760635375977), (471, -0.0008273720741271973), (472, -0.0007447004318237305), (473, -0.00047713518142700195), (474, -0.0002219676971435547), (475, 0.00018358230590820312), (476, 0.000508725643157959), (477, 0.0006504654884338379), (478, 0.0006604790687561035), (479, 0.0007482171058654785), (480, 0.0006964206695556641), (481, 0.0004937648773193359), (482, 0.00025582313537597656), (483, 0.00016957521438598633), (484, 9.98377799987793e-05), (485, -0.00010085105895996094), (486, -0.000544130802154541), (487, -0.0013120174407958984), (488, -0.002406895160675049), (489, -0.0036363601684570312), (490, -0.004503130912780762), (491, -0.005357980728149414), (492, -0.006440281867980957), (493, -0.007406711578369141), (494, -0.00805121660232544), (495, -0.008601129055023193), (496, -0.009467542171478271), (497, -0.010556340217590332), (498, -0.011579573154449463), (499, -0.012026965618133545), (500, -0.012081265449523926), (501, -0.01230621337890625), (502, -0.012833893299102783), (503, -0.013691186904907227), (504, -0.014530539512634277), (505, -0.015056014060974121), (506, -0.015234053134918213), (507, -0.015609025955200195), (508, -0.01607370376586914), (509, -0.016294121742248535), (510, -0.016570329666137695), (511, -0.01719963550567627), (512, -0.017853915691375732), (513, -0.018007636070251465), (514, -0.01764887571334839), (515, -0.017351508140563965), (516, -0.017223238945007324), (517, -0.017262637615203857), (518, -0.0174749493598938), (519, -0.017794013023376465), (520, -0.01825803518295288), (521, -0.01907825469970703), (522, -0.019987821578979492), (523, -0.02066946029663086), (524, -0.021243035793304443), (525, -0.022023379802703857), (526, -0.0231437087059021), (527, -0.02412736415863037), (528, -0.024912238121032715), (529, -0.02559739351272583), (530, -0.026237010955810547), (531, -0.026862919330596924), (532, -0.027173280715942383), (533, -0.027463912963867188), (534, -0.027706921100616455), (535, -0.028156399726867676), (536, -0.029015421867370605), (537, -0.03023320436477661), (538, -0.031676411628723145), (539, -0.03305691480636597), (540, -0.034083425998687744), (541, -0.034708619117736816), (542, -0.03526580333709717), (543, -0.035926222801208496), (544, -0.03692054748535156), (545, -0.03813028335571289), (546, -0.039309680461883545), (547, -0.04006105661392212), (548, -0.04032433032989502), (549, -0.040802001953125), (550, -0.04131346940994263), (551, -0.041786789894104004), (552, -0.042040467262268066), (553, -0.04225468635559082), (554, -0.04240506887435913), (555, -0.042073190212249756), (556, -0.041641294956207275), (557, -0.04144024848937988), (558, -0.04153162240982056), (559, -0.041791439056396484), (560, -0.04201960563659668), (561, -0.04214566946029663), (562, -0.04206538200378418), (563, -0.041850388050079346), (564, -0.04186809062957764), (565, -0.042350172996520996), (566, -0.04316425323486328), (567, -0.04404592514038086), (568, -0.04488086700439453), (569, -0.04544949531555176), (570, -0.04565083980560303), (571, -0.04589545726776123), (572, -0.04600656032562256), (573, -0.04614853858947754), (574, -0.046390533447265625), (575, -0.04678237438201904), (576, -0.047126591205596924), (577, -0.04720330238342285), (578, -0.04721355438232422), (579, -0.04732769727706909), (580, -0.04770559072494507), (581, -0.04828310012817383), (582, -0.04898691177368164), (583, -0.049619197845458984), (584, -0.05006539821624756), (585, -0.05052053928375244), (586, -0.05110543966293335), (587, -0.05182301998138428), (588, -0.05285465717315674), (589, -0.05409407615661621), (590, -0.055696189403533936), (591, -0.05779755115509033), (592, -0.06011056900024414), (593, -0.06207650899887085), (594, -0.06377023458480835), (595, -0.06562954187393188), (596, -0.06811875104904175), (597, -0.07100296020507812), (598, -0.07363021373748779), (599, -0.07534068822860718), (600, -0.07600176334381104), (601, -0.0762675404548645), (602, -0.07679486274719238), (603, -0.07757878303527832), (604, -0.07810771465301514), (605, -0.07850974798202515), (606, -0.07963043451309204), (607, -0.08033597469329834), (608, -0.07982879877090454), (609, -0.0785820484161377), (610, -0.07709050178527832), (611, -0.07490009069442749), (612, -0.07246601581573486), (613, -0.07032978534698486), (614, -0.06830787658691406), (615, -0.06600695848464966), (616, -0.06323975324630737), (617, -0.060553550720214844), (618, -0.0581129789352417), (619, -0.05602753162384033), (620, -0.05411642789840698), (621, -0.052072107791900635), (622, -0.04974484443664551), (623, -0.047349393367767334), (624, -0.04492717981338501), (625, -0.04282486438751221), (626, -0.041058480739593506), (627, -0.03942227363586426), (628, -0.0378570556640625), (629, -0.036141276359558105), (630, -0.03412628173828125), (631, -0.032134413719177246), (632, -0.030870258808135986), (633, -0.030292630195617676), (634, -0.029634594917297363), (635, -0.029064655303955078), (636, -0.02862447500228882), (637, -0.02818518877029419), (638, -0.027563512325286865), (639, -0.027006804943084717), (640, -0.026782333850860596), (641, -0.02711254358291626), (642, -0.028003215789794922), (643, -0.028082430362701416), (644, -0.027407288551330566), (645, -0.026500821113586426), (646, -0.02622753381729126), (647, -0.026363253593444824), (648, -0.026813983917236328), (649, -0.02729952335357666), (650, -0.027540385723114014), (651, -0.027271628379821777), (652, -0.026638567447662354), (653, -0.026010751724243164), (654, -0.026043355464935303), (655, -0.026352226734161377), (656, -0.026599109172821045), (657, -0.02699100971221924), (658, -0.0273134708404541), (659, -0.027622342109680176), (660, -0.028132736682891846), (661, -0.028678297996520996), (662, -0.02960580587387085), (663, -0.030588746070861816), (664, -0.03164029121398926), (665, -0.03295964002609253), (666, -0.03406643867492676), (667, -0.03479647636413574), (668, -0.03541451692581177), (669, -0.035574495792388916), (670, -0.03510338068008423), (671, -0.03433072566986084), (672, -0.033676207065582275), (673, -0.033431053161621094), (674, -0.033719778060913086), (675, -0.03419005870819092), (676, -0.03461426496505737), (677, -0.03492748737335205), (678, -0.035080909729003906), (679, -0.03537940979003906), (680, -0.035778939723968506), (681, -0.03613841533660889), (682, -0.03666961193084717), (683, -0.03740161657333374), (684, -0.03816819190979004), (685, -0.0384519100189209), (686, -0.038372695446014404), (687, -0.038430094718933105), (688, -0.03871452808380127), (689, -0.038773417472839355), (690, -0.03890126943588257), (691, -0.039076030254364014), (692, -0.03911721706390381), (693, -0.03917950391769409), (694, -0.03877437114715576), (695, -0.03784584999084473), (696, -0.03718501329421997), (697, -0.03659212589263916), (698, -0.0359574556350708), (699, -0.03533947467803955), (700, -0.03492593765258789), (701, -0.03469645977020264), (702, -0.03427988290786743), (703, -0.03361457586288452), (704, -0.0331076979637146), (705, -0.03272372484207153), (706, -0.032520830631256104), (707, -0.03257739543914795), (708, -0.03292953968048096), (709, -0.03353506326675415), (710, -0.03412562608718872), (711, -0.03452557325363159), (712, -0.03447598218917847), (713, -0.034042954444885254), (714, -0.03342902660369873), (715, -0.03294503688812256), (716, -0.032798826694488525), (717, -0.032573819160461426), (718, -0.03239905834197998), (719, -0.032334983348846436), (720, -0.032083094120025635), (721, -0.03198051452636719), (722, -0.03216814994812012), (723, -0.03245401382446289), (724, -0.03248113393783569), (725, -0.032339632511138916), (726, -0.03234601020812988), (727, -0.03136718273162842), (728, -0.03287714719772339), (729, -0.03288769721984863), (730, -0.032801032066345215), (731, -0.0323711633682251), (732, -0.03166311979293823), (733, -0.0311204195022583), (734, -0.030710816383361816), (735, -0.030238866806030273), (736, -0.0297698974609375), (737, -0.02924370765686035), (738, -0.028493165969848633), (739, -0.028005659580230713), (740, -0.027815043926239014), (741, -0.027755439281463623), (742, -0.02736562490463257), (743, -0.026896953582763672), (744, -0.02654743194580078), (745, -0.026152968406677246), (746, -0.0256538987159729), (747, -0.02479332685470581), (748, -0.023820996284484863), (749, -0.022919297218322754), (750, -0.022096633911132812), (751, -0.02143394947052002), (752, -0.02098029851913452), (753, -0.020649731159210205), (754, -0.02045375108718872), (755, -0.020482003688812256), (756, -0.020543158054351807), (757, -0.02027297019958496), (758, -0.019855976104736328), (759, -0.019381940364837646), (760, -0.018886268138885498), (761, -0.018302619457244873), (762, -0.017611324787139893), (763, -0.017050325870513916), (764, -0.016617298126220703), (765, -0.016283273696899414), (766, -0.016093194484710693), (767, -0.016014516353607178), (768, -0.01616036891937256), (769, -0.01653122901916504), (770, -0.017043113708496094), (771, -0.017250239849090576), (772, -0.017044365406036377), (773, -0.016898155212402344), (774, -0.0169752836227417), (775, -0.017080307006835938), (776, -0.017361104488372803), (777, -0.018035054206848145), (778, -0.019031226634979248), (779, -0.01993948221206665), (780, -0.020901918411254883), (781, -0.021901071071624756), (782, -0.02263665199279785), (783, -0.023282289505004883), (784, -0.02399975061416626), (785, -0.024637997150421143), (786, -0.025228440761566162), (787, -0.025739431381225586), (788, -0.02625906467437744), (789, -0.02669626474380493), (790, -0.027091920375823975), (791, -0.02759033441543579), (792, -0.028126120567321777), (793, -0.028554916381835938), (794, -0.028917789459228516), (795, -0.029211342334747314), (796, -0.029355168342590332), (797, -0.029432296752929688), (798, -0.02958536148071289), (799, -0.02961355447769165), (800, -0.029757976531982422), (801, -0.030025899410247803), (802, -0.030194103717803955), (803, -0.03031069040298462), (804, -0.03005516529083252), (805, -0.029865801334381104), (806, -0.029944896697998047), (807, -0.03053969144821167), (808, -0.031405746936798096), (809, -0.03228425979614258), (810, -0.0328560471534729), (811, -0.033163487911224365), (812, -0.03311479091644287), (813, -0.03290081024169922), (814, -0.03284090757369995), (815, -0.032920241355895996), (816, -0.03311753273010254), (817, -0.03324604034423828), (818, -0.03288471698760986), (819, -0.03250318765640259), (820, -0.03212541341781616), (821, -0.031641602516174316), (822, -0.031000614166259766), (823, -0.030169010162353516), (824, -0.02936321496963501), (825, -0.02864372730255127), (826, -0.027848780155181885), (827, -0.02703338861465454), (828, -0.026340186595916748), (829, -0.025750458240509033), (830, -0.025132477283477783), (831, -0.024595320224761963), (832, -0.02403932809829712), (833, -0.023222386837005615), (834, -0.022614240646362305), (835, -0.0221593976020813), (836, -0.02182823419570923), (837, -0.02168726921081543), (838, -0.02211099863052368), (839, -0.022599995136260986), (840, -0.02276855707168579), (841, -0.022740423679351807), (842, -0.02263045310974121), (843, -0.022596359252929688), (844, -0.02284371852874756), (845, -0.023400604724884033), (846, -0.023715317249298096), (847, -0.02377527952194214), (848, -0.023738205432891846), (849, -0.02372688055038452), (850, -0.023773014545440674), (851, -0.023863375186920166), (852, -0.023898541927337646), (853, -0.023897111415863037), (854, -0.024045228958129883), (855, -0.024164021015167236), (856, -0.024369239807128906), (857, -0.024609625339508057), (858, -0.024700641632080078), (859, -0.024869203567504883), (860, -0.024983525276184082), (861, -0.02493453025817871), (862, -0.024759769439697266), (863, -0.024875402450561523), (864, -0.025247037410736084), (865, -0.02542567253112793), (866, -0.025452077388763428), (867, -0.02536594867706299), (868, -0.02541792392730713), (869, -0.025791943073272705), (870, -0.026284754276275635), (871, -0.02680814266204834), (872, -0.027233004570007324), (873, -0.02748286724090576), (874, -0.027776598930358887), (875, -0.028235316276550293), (876, -0.028754591941833496), (877, -0.029180049896240234), (878, -0.029340803623199463), (879, -0.029391586780548096), (880, -0.029452025890350342), (881, -0.029330313205718994), (882, -0.028995990753173828), (883, -0.028463423252105713), (884, -0.027656972408294678), (885, -0.02690178155899048), (886, -0.026493549346923828), (887, -0.025360584259033203), (888, -0.024982869625091553), (889, -0.02400076389312744), (890, -0.02348273992538452), (891, -0.023253023624420166), (892, -0.0225522518157959), (893, -0.02159672975540161), (894, -0.02091008424758911), (895, -0.02094876766204834), (896, -0.021710991859436035), (897, -0.022585630416870117), (898, -0.023097217082977295), (899, -0.022864580154418945), (900, -0.022020041942596436), (901, -0.021487891674041748), (902, -0.021491289138793945), (903, -0.022076547145843506), (904, -0.02314019203186035), (905, -0.024425387382507324), (906, -0.025524497032165527), (907, -0.026539325714111328), (908, -0.026890933513641357), (909, -0.026967942714691162), (910, -0.027135789394378662), (911, -0.027619242668151855), (912, -0.028330862522125244), (913, -0.02915734052658081), (914, -0.02997565269470215), (915, -0.030672669410705566), (916, -0.03115975856781006), (917, -0.03139197826385498), (918, -0.03136718273162842)], ('rotation_euler', 1): [(0, 0.022678405046463013), (1, 0.02528190053999424), (2, 0.027292823418974876), (3, 0.02804829739034176), (4, 0.02773532271385193), (5, 0.026919767260551453), (6, 0.02599283680319786), (7, 0.025148635730147362), (8, 0.024998445063829422), (9, 0.025247396901249886), (10, 0.025553079321980476), (11, 0.02555195428431034), (12, 0.025167319923639297), (13, 0.024095861241221428), (14, 0.02298300713300705), (15, 0.021333036944270134), (16, 0.01912410743534565), (17, 0.016917940229177475), (18, 0.015232330188155174), (19, 0.014212124049663544), (20, 0.013318565674126148), (21, 0.012196489609777927), (22, 0.010904386639595032), (23, 0.009628122672438622), (24, 0.008282771334052086), (25, 0.006923086475580931), (26, 0.005658319685608149), (27, 0.004643095191568136), (28, 0.00438650231808424), (29, 0.004682897124439478), (30, 0.0048846593126654625), (31, 0.004749847576022148), (32, 0.00447078375145793), (33, 0.0041173906065523624), (34, 0.003486423520371318), (35, 0.0025681534316390753), (36, 0.0021824308205395937), (37, 0.002489950507879257), (38, 0.0029858967754989862), (39, 0.003474307944998145), (40, 0.003727859351783991), (41, 0.0036819789092987776), (42, 0.003909659571945667), (43, 0.004603587090969086), (44, 0.005071734543889761), (45, 0.004869900178164244), (46, 0.004143221769481897), (47, 0.0028125173412263393), (48, 0.0005214789416640997), (49, -0.0023940091487020254), (50, -0.005090595688670874), (51, -0.0069573563523590565), (52, -0.00797260832041502), (53, -0.008222601376473904), (54, -0.007806570269167423), (55, -0.006582850590348244), (56, -0.004873471800237894), (57, -0.0031762830913066864), (58, -0.0015298140933737159), (59, 0.00031264792778529227), (60, 0.0022315026726573706), (61, 0.0039765299297869205), (62, 0.005403770133852959), (63, 0.006462635938078165), (64, 0.007222997955977917), (65, 0.007745770271867514), (66, 0.008057882077991962), (67, 0.007899504154920578), (68, 0.006911496166139841), (69, 0.0057734716683626175), (70, 0.005113680846989155), (71, 0.004860272631049156), (72, 0.004531449638307095), (73, 0.003804266918450594), (74, 0.0030969101935625076), (75, 0.0025712219066917896), (76, 0.0018201504135504365), (77, 0.0006961497711017728), (78, -0.00044079520739614964), (79, -0.0009297731448896229), (80, -0.0009923558682203293), (81, -0.0010405976790934801), (82, -0.0015280747320502996), (83, -0.0023528016172349453), (84, -0.0027918408159166574), (85, -0.0025783544406294823), (86, -0.0022354319225996733), (87, -0.0020880575757473707), (88, -0.002312200143933296), (89, -0.0025365417823195457), (90, -0.0026167596224695444), (91, -0.002655064919963479), (92, -0.003069797530770302), (93, -0.003923679236322641), (94, -0.004897710867226124), (95, -0.005712186452001333), (96, -0.0062970067374408245), (97, -0.0066306316293776035), (98, -0.006678195204585791), (99, -0.0065046497620642185), (100, -0.00636504590511322), (101, -0.00663866987451911), (102, -0.007231950294226408), (103, -0.007451404817402363), (104, -0.007168401964008808), (105, -0.0067369816824793816), (106, -0.006414833478629589), (107, -0.006137513089925051), (108, -0.005806391127407551), (109, -0.005490428302437067), (110, -0.00490232789888978), (111, -0.00404893746599555), (112, -0.003062595846131444), (113, -0.002178645459935069), (114, -0.0016014698194339871), (115, -0.0014705474022775888), (116, -0.0014463431434705853), (117, -0.0012605898082256317), (118, -0.0006929626106284559), (119, 0.00011696435103658587), (120, 0.0005602435558103025), (121, 0.00035843992372974753), (122, -0.0001569074229337275), (123, -0.00046804622979834676), (124, -0.0005042448174208403), (125, -0.0006722693797200918), (126, -0.0010085622780025005), (127, -0.0012043212773278356), (128, -0.001290558255277574), (129, -0.0016309495549649), (130, -0.00228054984472692), (131, -0.002800618764013052), (132, -0.002937746001407504), (133, -0.0028480077162384987), (134, -0.0028430151287466288), (135, -0.0029228690546005964), (136, -0.0030288780108094215), (137, -0.003118556924164295), (138, -0.0032551817130297422), (139, -0.0031381486915051937), (140, -0.0027589055243879557), (141, -0.00205745710991323), (142, -0.0014343408402055502), (143, -0.0013156229397282004), (144, -0.0014802514342591166), (145, -0.0015198359033092856), (146, -0.001355629414319992), (147, -0.001331551349721849), (148, -0.0013086921535432339), (149, -0.0009436792461201549), (150, -0.0001789789239410311), (151, 0.0006405788590200245), (152, 0.0008767282706685364), (153, 0.0003850593348033726), (154, -0.0002157032286049798), (155, -0.00038109137676656246), (156, -0.00034869948285631835), (157, -0.0005602752207778394), (158, -0.0011476450599730015), (159, -0.0018915452528744936), (160, -0.002520365174859762), (161, -0.0030073546804487705), (162, -0.0032362963538616896), (163, -0.003365453565493226), (164, -0.0038595888763666153), (165, -0.004800725728273392), (166, -0.0058756982907652855), (167, -0.006629352457821369), (168, -0.0070740641094744205), (169, -0.007352625485509634), (170, -0.007766059134155512), (171, -0.008126946166157722), (172, -0.008373750373721123), (173, -0.008853494189679623), (174, -0.009712031111121178), (175, -0.01068570464849472), (176, -0.011381780728697777), (177, -0.011670088395476341), (178, -0.011853097938001156), (179, -0.012092039920389652), (180, -0.012336061336100101), (181, -0.012532730586826801), (182, -0.012779406271874905), (183, -0.0130158057436347), (184, -0.013300127349793911), (185, -0.013686345890164375), (186, -0.01413777656853199), (187, -0.014482640661299229), (188, -0.014736341312527657), (189, -0.014838891103863716), (190, -0.014547972939908504), (191, -0.013956483453512192), (192, -0.013248437084257603), (193, -0.012408352456986904), (194, -0.011333961971104145), (195, -0.010000108741223812), (196, -0.008857986889779568), (197, -0.008185897953808308), (198, -0.007884429767727852), (199, -0.0073133595287799835), (200, -0.0060973395593464375), (201, -0.004470701329410076), (202, -0.003014948684722185), (203, -0.0021821490954607725), (204, -0.002152541186660528), (205, -0.0027124304324388504), (206, -0.003346115117892623), (207, -0.003853964852169156), (208, -0.004453825298696756), (209, -0.0051183076575398445), (210, -0.005700548179447651), (211, -0.00617666682228446), (212, -0.006432624999433756), (213, -0.006461313925683498), (214, -0.0063056484796106815), (215, -0.006159797310829163), (216, -0.006231904029846191), (217, -0.00630870321765542), (218, -0.005876282695680857), (219, -0.004851353820413351), (220, -0.0034994715824723244), (221, -0.0021035620011389256), (222, -0.0008857020875439048), (223, 3.289153755758889e-05), (224, 0.000722864584531635), (225, 0.001600930467247963), (226, 0.0028459636960178614), (227, 0.0043154568411409855), (228, 0.0056773461401462555), (229, 0.006758684292435646), (230, 0.007549665402621031), (231, 0.00797218456864357), (232, 0.008177734911441803), (233, 0.008553455583751202), (234, 0.009183051064610481), (235, 0.00954646710306406), (236, 0.009523536078631878), (237, 0.009478910826146603), (238, 0.00949178822338581), (239, 0.00931351725012064), (240, 0.008832491934299469), (241, 0.008269626647233963), (242, 0.008195766247808933), (243, 0.008588703349232674), (244, 0.009005232714116573), (245, 0.009145264513790607), (246, 0.009155885316431522), (247, 0.00941302441060543), (248, 0.009787872433662415), (249, 0.009917139075696468), (250, 0.00976909976452589), (251, 0.009503928944468498), (252, 0.009537736885249615), (253, 0.009993909858167171), (254, 0.010727309621870518), (255, 0.011483913287520409), (256, 0.012501823715865612), (257, 0.014029452577233315), (258, 0.01612284779548645), (259, 0.018435213714838028), (260, 0.02075505256652832), (261, 0.022990617901086807), (262, 0.024630647152662277), (263, 0.02515023946762085), (264, 0.024634214118123055), (265, 0.023741066455841064), (266, 0.02310790680348873), (267, 0.022814884781837463), (268, 0.022491073235869408), (269, 0.0219004824757576), (270, 0.021206654608249664), (271, 0.020572103559970856), (272, 0.019923100247979164), (273, 0.019102830439805984), (274, 0.01811271533370018), (275, 0.017208902165293694), (276, 0.01635647565126419), (277, 0.01545919943600893), (278, 0.014653430320322514), (279, 0.01388508826494217), (280, 0.013363360427320004), (281, 0.013281915336847305), (282, 0.0134213175624609), (283, 0.013338493183255196), (284, 0.012877089902758598), (285, 0.012193789705634117), (286, 0.011433355510234833), (287, 0.010636762715876102), (288, 0.009691414423286915), (289, 0.008687658235430717), (290, 0.0077774072997272015), (291, 0.007216149941086769), (292, 0.006844774354249239), (293, 0.006526479497551918), (294, 0.006184867583215237), (295, 0.005872074980288744), (296, 0.005439565051347017), (297, 0.004831515718251467), (298, 0.004244737792760134), (299, 0.003882304998114705), (300, 0.0036009401082992554), (301, 0.003155840327963233), (302, 0.0027456346433609724), (303, 0.0024364518467336893), (304, 0.0023918231017887592), (305, 0.002595179248601198), (306, 0.0028377023991197348), (307, 0.002838250482454896), (308, 0.002688776468858123), (309, 0.002415717113763094), (310, 0.00214609457179904), (311, 0.0020465271081775427), (312, 0.00203728792257607), (313, 0.002195304026827216), (314, 0.0025749490596354008), (315, 0.002670170506462455), (316, 0.0023340145125985146), (317, 0.002004800597205758), (318, 0.002005251357331872), (319, 0.0023173880763351917), (320, 0.0025561649817973375), (321, 0.0025542015209794044), (322, 0.002574604470282793), (323, 0.0025597603525966406), (324, 0.0023921176325529814), (325, 0.002120770514011383), (326, 0.001919531379826367), (327, 0.0020336215384304523), (328, 0.0025157358031719923), (329, 0.0030111069791018963), (330, 0.0032805348746478558), (331, 0.0034050315152853727), (332, 0.0037413949612528086), (333, 0.004304478410631418), (334, 0.004738228861242533), (335, 0.004936189856380224), (336, 0.0052683730609714985), (337, 0.005895821377635002), (338, 0.006638891529291868), (339, 0.00716914189979434), (340, 0.007394024170935154), (341, 0.007493401411920786), (342, 0.007701338268816471), (343, 0.008131556212902069), (344, 0.008641899563372135), (345, 0.009061677381396294), (346, 0.009334548376500607), (347, 0.009657567366957664), (348, 0.010113893076777458), (349, 0.010680329985916615), (350, 0.011138099245727062), (351, 0.011400171555578709), (352, 0.011824876070022583), (353, 0.01257877703756094), (354, 0.013373279944062233), (355, 0.01399167813360691), (356, 0.014658295549452305), (357, 0.015390637330710888), (358, 0.016071056947112083), (359, 0.01640961319208145), (360, 0.0162412840873003), (361, 0.01567346230149269), (362, 0.015002917498350143), (363, 0.014523613266646862), (364, 0.014295009896159172), (365, 0.013972166925668716), (366, 0.013474822044372559), (367, 0.012880401685833931), (368, 0.012469221837818623), (369, 0.012541749514639378), (370, 0.012904741801321507), (371, 0.013168628327548504), (372, 0.012954454869031906), (373, 0.012601674534380436), (374, 0.012269421480596066), (375, 0.011968367733061314), (376, 0.011840753257274628), (377, 0.012060264125466347), (378, 0.01272865105420351), (379, 0.013449176214635372), (380, 0.013762176968157291), (381, 0.013592512346804142), (382, 0.013320107012987137), (383, 0.013519404456019402), (384, 0.014217155985534191), (385, 0.014963661320507526), (386, 0.015282093547284603), (387, 0.01547784823924303), (388, 0.015981823205947876), (389, 0.016980396583676338), (390, 0.018183443695306778), (391, 0.019292939454317093), (392, 0.02041161060333252), (393, 0.02178717404603958), (394, 0.023365002125501633), (395, 0.024914463981986046), (396, 0.026111390441656113), (397, 0.026560304686427116), (398, 0.0261998288333416), (399, 0.025639871135354042), (400, 0.025469550862908363), (401, 0.025856098160147667), (402, 0.026469402015209198), (403, 0.0270327627658844), (404, 0.027382001280784607), (405, 0.02737727016210556), (406, 0.02728317119181156), (407, 0.027271192520856857), (408, 0.02729763835668564), (409, 0.027342654764652252), (410, 0.027424151077866554), (411, 0.027452394366264343), (412, 0.027307825163006783), (413, 0.026989709585905075), (414, 0.02686440758407116), (415, 0.027021905407309532), (416, 0.027405118569731712), (417, 0.02796710841357708), (418, 0.028508031740784645), (419, 0.028714509680867195), (420, 0.02834484726190567), (421, 0.027575606480240822), (422, 0.026681911200284958), (423, 0.025721291080117226), (424, 0.024718254804611206), (425, 0.023624280467629433), (426, 0.02230389416217804), (427, 0.02070797234773636), (428, 0.019084174185991287), (429, 0.017719341441988945), (430, 0.01673874445259571), (431, 0.016031937673687935), (432, 0.015335466712713242), (433, 0.014446374028921127), (434, 0.013337070122361183), (435, 0.012156975455582142), (436, 0.011002592742443085), (437, 0.009962063282728195), (438, 0.009083171375095844), (439, 0.008428589440882206), (440, 0.00785700511187315), (441, 0.00702318549156189), (442, 0.00603507598862052), (443, 0.005256486590951681), (444, 0.00496294628828764), (445, 0.005138017237186432), (446, 0.005345912650227547), (447, 0.005286098923534155), (448, 0.004982692655175924), (449, 0.004813884384930134), (450, 0.004922365769743919), (451, 0.00507690291851759), (452, 0.004876514431089163), (453, 0.004227496683597565), (454, 0.003464571898803115), (455, 0.0027108187787234783), (456, 0.0020296238362789154), (457, 0.0011605587787926197), (458, -8.131260256050155e-05), (459, -0.0013282403815537691), (460, -0.0023018699139356613), (461, -0.003039627568796277), (462, -0.0036520466674119234), (463, -0.004058237187564373), (464, -0.004218296613544226), (465, -0.0043704332783818245), (466, -0.004818272776901722), (467, -0.00533673819154501), (468, -0.00559976464137435), (469, -0.005534259136766195), (470, -0.0052542733028531075), (471, -0.0049184225499629974), (472, -0.004730626475065947), (473, -0.0045789568684995174), (474, -0.0044578611850738525), (475, -0.0043445467017591), (476, -0.004255759995430708), (477, -0.004152682144194841), (478, -0.003953916952013969), (479, -0.003877432318404317), (480, -0.004005104303359985), (481, -0.004029480740427971), (482, -0.00372124626301229), (483, -0.0032142552081495523), (484, -0.0028713755309581757), (485, -0.0028044499922543764), (486, -0.002837390173226595), (487, -0.0025312607176601887), (488, -0.0017526368610560894), (489, -0.0009536103461869061), (490, -0.0006920694722793996), (491, -0.0008937957463786006), (492, -0.0011939998948946595), (493, -0.0012445092434063554), (494, -0.0010781091405078769), (495, -0.0007890799315646291), (496, -0.00028585409745574), (497, 0.0002757743059191853), (498, 0.0006029922515153885), (499, 0.0004933922318741679), (500, -0.00012021649308735505), (501, -0.0008592024096287787), (502, -0.0013302697334438562), (503, -0.0016322473529726267), (504, -0.0021321892272681), (505, -0.0029382810462266207), (506, -0.003894830122590065), (507, -0.0050104581750929356), (508, -0.0062501379288733006), (509, -0.007335841655731201), (510, -0.008138073608279228), (511, -0.008530594408512115), (512, -0.008492791093885899), (513, -0.008230306208133698), (514, -0.008101459592580795), (515, -0.008251853287220001), (516, -0.00810757465660572), (517, -0.007429769262671471), (518, -0.00649608438834548), (519, -0.005491225980222225), (520, -0.0045578088611364365), (521, -0.0036984493490308523), (522, -0.003001251257956028), (523, -0.0022450736723840237), (524, -0.001444708788767457), (525, -0.0007516645709984004), (526, -3.587444007280283e-05), (527, 0.0009426770848222077), (528, 0.0021614290308207273), (529, 0.0032699292059987783), (530, 0.00407284265384078), (531, 0.004695000126957893), (532, 0.005046075209975243), (533, 0.00518145551905036), (534, 0.0051956488750875), (535, 0.005352955311536789), (536, 0.005808590445667505), (537, 0.006550620775669813), (538, 0.007466953247785568), (539, 0.008399424143135548), (540, 0.009191276505589485), (541, 0.009666199795901775), (542, 0.009875020012259483), (543, 0.009970932267606258), (544, 0.01007701363414526), (545, 0.010135008953511715), (546, 0.010140295140445232), (547, 0.010166549123823643), (548, 0.010187041945755482), (549, 0.00993233360350132), (550, 0.00957440584897995), (551, 0.009504184126853943), (552, 0.009731922298669815), (553, 0.009785068221390247), (554, 0.009444489143788815), (555, 0.008962095715105534), (556, 0.00871055293828249), (557, 0.008932853117585182), (558, 0.009391325525939465), (559, 0.010033611208200455), (560, 0.011000617407262325), (561, 0.0121654337272048), (562, 0.013284754939377308), (563, 0.014027737081050873), (564, 0.014648414216935635), (565, 0.015473509207367897), (566, 0.016680549830198288), (567, 0.01794835738837719), (568, 0.018810797482728958), (569, 0.019335979595780373), (570, 0.019711725413799286), (571, 0.020024683326482773), (572, 0.02017604000866413), (573, 0.02015046589076519), (574, 0.020225465297698975), (575, 0.02071019448339939), (576, 0.021521372720599174), (577, 0.022104326635599136), (578, 0.02206314541399479), (579, 0.021917328238487244), (580, 0.022211601957678795), (581, 0.022834135219454765), (582, 0.023562263697385788), (583, 0.02437296137213707), (584, 0.02538156509399414), (585, 0.02639656327664852), (586, 0.027179498225450516), (587, 0.02745797485113144), (588, 0.027119522914290428), (589, 0.02653171308338642), (590, 0.025780783966183662), (591, 0.024656537920236588), (592, 0.023017430678009987), (593, 0.02085200510919094), (594, 0.01842176541686058), (595, 0.016274992376565933), (596, 0.014735745266079903), (597, 0.013796180486679077), (598, 0.013472733087837696), (599, 0.01357349380850792), (600, 0.013607767410576344), (601, 0.0133409658446908), (602, 0.012941992841660976), (603, 0.012742680497467518), (604, 0.01287709642201662), (605, 0.013128632679581642), (606, 0.01306973583996296), (607, 0.012807106599211693), (608, 0.01254275906831026), (609, 0.012252619490027428), (610, 0.01187529880553484), (611, 0.011451941914856434), (612, 0.010852445848286152), (613, 0.01003319676965475), (614, 0.008917536586523056), (615, 0.007296524476259947), (616, 0.005140150897204876), (617, 0.002525742631405592), (618, -0.00011389049905119464), (619, -0.002561128931120038), (620, -0.004959008656442165), (621, -0.007494637742638588), (622, -0.009910954162478447), (623, -0.01192048005759716), (624, -0.013456102460622787), (625, -0.014777707867324352), (626, -0.015867983922362328), (627, -0.016512863337993622), (628, -0.0166796762496233), (629, -0.01669437065720558), (630, -0.016935167834162712), (631, -0.01748061552643776), (632, -0.018043989315629005), (633, -0.018536534160375595), (634, -0.01893394999206066), (635, -0.019271770492196083), (636, -0.01940324902534485), (637, -0.0194191113114357), (638, -0.019177069887518883), (639, -0.01842288114130497), (640, -0.017236925661563873), (641, -0.01596182771027088), (642, -0.01492051500827074), (643, -0.01414652168750763), (644, -0.013600187376141548), (645, -0.013102134689688683), (646, -0.012506106868386269), (647, -0.011861170642077923), (648, -0.011144731193780899), (649, -0.010570168495178223), (650, -0.01016330998390913), (651, -0.009777406230568886), (652, -0.009258276782929897), (653, -0.008469367399811745), (654, -0.007361296098679304), (655, -0.006256450433284044), (656, -0.005518476478755474), (657, -0.005008904729038477), (658, -0.0045883627608418465), (659, -0.004106153268367052), (660, -0.0035916317719966173), (661, -0.003245473140850663), (662, -0.0029781307093799114), (663, -0.002565420465543866), (664, -0.0017698947340250015), (665, -0.0007120153168216348), (666, 0.0006793736247345805), (667, 0.00266022770665586), (668, 0.004905662965029478), (669, 0.0066919270902872086), (670, 0.007573073264211416), (671, 0.007574739865958691), (672, 0.00705840764567256), (673, 0.0065809921361505985), (674, 0.006431051529943943), (675, 0.006477209273725748), (676, 0.006540144793689251), (677, 0.006508312188088894), (678, 0.00638657808303833), (679, 0.006284746341407299), (680, 0.006406236439943314), (681, 0.006850702688097954), (682, 0.007441158406436443), (683, 0.00808954518288374), (684, 0.008818316273391247), (685, 0.00968359038233757), (686, 0.01072054635733366), (687, 0.011756463907659054), (688, 0.012898455373942852), (689, 0.014595897868275642), (690, 0.01687566377222538), (691, 0.019305383786559105), (692, 0.02166345715522766), (693, 0.023694414645433426), (694, 0.0256312545388937), (695, 0.027652855962514877), (696, 0.029514102265238762), (697, 0.030991705134510994), (698, 0.032141949981451035), (699, 0.033169761300086975), (700, 0.03407582640647888), (701, 0.03473978862166405), (702, 0.03530817851424217), (703, 0.03627980500459671), (704, 0.03783803433179855), (705, 0.03958384320139885), (706, 0.041107844561338425), (707, 0.04273969307541847), (708, 0.04518387094140053), (709, 0.04807764291763306), (710, 0.05064348876476288), (711, 0.05244957655668259), (712, 0.053679198026657104), (713, 0.05461585521697998), (714, 0.0552489198744297), (715, 0.05520512908697128), (716, 0.054693885147571564), (717, 0.054467637091875076), (718, 0.054416824132204056), (719, 0.053932733833789825), (720, 0.05285155028104782), (721, 0.051564015448093414), (722, 0.05025605484843254), (723, 0.04869379475712776), (724, 0.04691776633262634), (725, 0.04551956057548523), (726, 0.044945769011974335), (727, 0.044864870607852936), (728, 0.04481446370482445), (729, 0.044618699699640274), (730, 0.04453001543879509), (731, 0.04454253613948822), (732, 0.044361013919115067), (733, 0.04388462379574776), (734, 0.043265920132398605), (735, 0.04268110543489456), (736, 0.042038124054670334), (737, 0.04121297225356102), (738, 0.040043286979198456), (739, 0.03868214040994644), (740, 0.03754133731126785), (741, 0.03670115768909454), (742, 0.0360059030354023), (743, 0.035370390862226486), (744, 0.03490234911441803), (745, 0.03463435173034668), (746, 0.03417171910405159), (747, 0.03320677578449249), (748, 0.03175752982497215), (749, 0.030237801373004913), (750, 0.029045816510915756), (751, 0.0281255804002285), (752, 0.02750219963490963), (753, 0.02713940292596817), (754, 0.027166947722434998), (755, 0.02732596918940544), (756, 0.027527783066034317), (757, 0.02756180241703987), (758, 0.02731064148247242), (759, 0.02698158472776413), (760, 0.026661241427063942), (761, 0.026192745193839073), (762, 0.025640850886702538), (763, 0.024891292676329613), (764, 0.023976823315024376), (765, 0.023063188418745995), (766, 0.022240139544010162), (767, 0.02150549553334713), (768, 0.020889313891530037), (769, 0.020322799682617188), (770, 0.01998232677578926), (771, 0.020019523799419403), (772, 0.02022077888250351), (773, 0.020191963762044907), (774, 0.01989365555346012), (775, 0.019604353234171867), (776, 0.019393378868699074), (777, 0.019155116751790047), (778, 0.01873127371072769), (779, 0.01831759512424469), (780, 0.018076399341225624), (781, 0.017863351851701736), (782, 0.017396535724401474), (783, 0.01658931002020836), (784, 0.015661397948861122), (785, 0.014943448826670647), (786, 0.014631973579525948), (787, 0.014490926638245583), (788, 0.0142526188865304), (789, 0.01384756900370121), (790, 0.013268441893160343), (791, 0.012485908344388008), (792, 0.011420019902288914), (793, 0.010258367285132408), (794, 0.009246796369552612), (795, 0.008649658411741257), (796, 0.00825376808643341), (797, 0.007577676326036453), (798, 0.0066888900473713875), (799, 0.006056040059775114), (800, 0.005831423215568066), (801, 0.005744405556470156), (802, 0.005538860335946083), (803, 0.00519914273172617), (804, 0.005002015735954046), (805, 0.005006756633520126), (806, 0.004993691109120846), (807, 0.004919538740068674), (808, 0.004943895619362593), (809, 0.005413391161710024), (810, 0.005973744671791792), (811, 0.006186311133205891), (812, 0.005912007298320532), (813, 0.005358946043998003), (814, 0.0049158725887537), (815, 0.004887618124485016), (816, 0.005305787082761526), (817, 0.005883869715034962), (818, 0.006378970108926296), (819, 0.00693863071501255), (820, 0.007713860832154751), (821, 0.008529608137905598), (822, 0.008950822055339813), (823, 0.00895658042281866), (824, 0.008941994048655033), (825, 0.009299524128437042), (826, 0.009814735502004623), (827, 0.010330052115023136), (828, 0.010955330915749073), (829, 0.011906626634299755), (830, 0.01304339524358511), (831, 0.013921854086220264), (832, 0.014400974847376347), (833, 0.014612396247684956), (834, 0.014577019028365612), (835, 0.014523632824420929), (836, 0.014637264423072338), (837, 0.01476914994418621), (838, 0.014977202750742435), (839, 0.015255927108228207), (840, 0.015371358953416348), (841, 0.015246703289449215), (842, 0.014968070201575756), (843, 0.014632752165198326), (844, 0.014453012496232986), (845, 0.014741947874426842), (846, 0.015445283614099026), (847, 0.015991482883691788), (848, 0.01622823439538479), (849, 0.01653975248336792), (850, 0.017056815326213837), (851, 0.017414521425962448), (852, 0.01725032739341259), (853, 0.016813719645142555), (854, 0.016631148755550385), (855, 0.016904031857848167), (856, 0.01732882298529148), (857, 0.017769722267985344), (858, 0.018302656710147858), (859, 0.018961625173687935), (860, 0.01972225122153759), (861, 0.02045198157429695), (862, 0.02115233987569809), (863, 0.021915694698691368), (864, 0.022706421092152596), (865, 0.0232558436691761), (866, 0.023141102865338326), (867, 0.022479988634586334), (868, 0.02180330827832222), (869, 0.02150391787290573), (870, 0.021527990698814392), (871, 0.021525703370571136), (872, 0.021212110295891762), (873, 0.02070436254143715), (874, 0.020366039127111435), (875, 0.02039892040193081), (876, 0.020750079303979874), (877, 0.02118753455579281), (878, 0.02139219455420971), (879, 0.021236276254057884), (880, 0.02089025266468525), (881, 0.020689966157078743), (882, 0.020880967378616333), (883, 0.02117535099387169), (884, 0.021294785663485527), (885, 0.020919742062687874), (886, 0.020185893401503563), (887, 0.0194117221981287), (888, 0.018412824720144272), (889, 0.017882760614156723), (890, 0.01756998896598816), (891, 0.017639165744185448), (892, 0.018123244866728783), (893, 0.01860085129737854), (894, 0.018937764689326286), (895, 0.019349554553627968), (896, 0.019131751731038094), (897, 0.01886058785021305), (898, 0.019003625959157944), (899, 0.01993495784699917), (900, 0.021513372659683228), (901, 0.0228081364184618), (902, 0.023587148636579514), (903, 0.02379697933793068), (904, 0.023533981293439865), (905, 0.02304595522582531), (906, 0.02273334003984928), (907, 0.02248685620725155), (908, 0.02287711203098297), (909, 0.02350807562470436), (910, 0.02400689572095871), (911, 0.024140596389770508), (912, 0.023988883942365646), (913, 0.023657605051994324), (914, 0.023261453956365585), (915, 0.02290666662156582), (916, 0.022673554718494415), (917, 0.02259930409491062), (918, 0.022678405046463013)], ('rotation_euler', 2): [(0, -3.1729743480682373), (1, -3.1715033054351807), (2, -3.1708343029022217), (3, -3.1713449954986572), (4, -3.1727991104125977), (5, -3.1744749546051025), (6, -3.175697088241577), (7, -3.176210880279541), (8, -3.1763076782226562), (9, -3.176356554031372), (10, -3.1764075756073), (11, -3.1764330863952637), (12, -3.1765012741088867), (13, -3.1765007972717285), (14, -3.1760082244873047), (15, -3.175319194793701), (16, -3.174889087677002), (17, -3.174920082092285), (18, -3.17525577545166), (19, -3.1756536960601807), (20, -3.175539255142212), (21, -3.175156831741333), (22, -3.1746597290039062), (23, -3.1745071411132812), (24, -3.1750781536102295), (25, -3.176227569580078), (26, -3.1768953800201416), (27, -3.1770341396331787), (28, -3.1768958568573), (29, -3.1766517162323), (30, -3.1765689849853516), (31, -3.176565170288086), (32, -3.176450490951538), (33, -3.1763672828674316), (34, -3.1765353679656982), (35, -3.1769511699676514), (36, -3.1772851943969727), (37, -3.17695689201355), (38, -3.1761720180511475), (39, -3.175316095352173), (40, -3.1748673915863037), (41, -3.174889326095581), (42, -3.175203323364258), (43, -3.1754965782165527), (44, -3.1752564907073975), (45, -3.1748287677764893), (46, -3.1750075817108154), (47, -3.1759917736053467), (48, -3.177333354949951), (49, -3.1789252758026123), (50, -3.180518388748169), (51, -3.181990623474121), (52, -3.1833384037017822), (53, -3.184398889541626), (54, -3.184896945953369), (55, -3.1847355365753174), (56, -3.1838836669921875), (57, -3.1825385093688965), (58, -3.1809301376342773), (59, -3.179184675216675), (60, -3.177297353744507), (61, -3.1755218505859375), (62, -3.173923969268799), (63, -3.172626256942749), (64, -3.1715495586395264), (65, -3.170487642288208), (66, -3.169400930404663), (67, -3.1681761741638184), (68, -3.167046546936035), (69, -3.166571855545044), (70, -3.1667041778564453), (71, -3.1671674251556396), (72, -3.16768479347229), (73, -3.1678271293640137), (74, -3.1677396297454834), (75, -3.1677935123443604), (76, -3.168264865875244), (77, -3.16914963722229), (78, -3.170220136642456), (79, -3.170804500579834), (80, -3.1708407402038574), (81, -3.170361042022705), (82, -3.169801712036133), (83, -3.1695311069488525), (84, -3.1697187423706055), (85, -3.17041277885437), (86, -3.171555995941162), (87, -3.172762393951416), (88, -3.17341685295105), (89, -3.1733241081237793), (90, -3.172759532928467), (91, -3.1722590923309326), (92, -3.172077178955078), (93, -3.1720588207244873), (94, -3.172034978866577), (95, -3.1720948219299316), (96, -3.1721770763397217), (97, -3.1722326278686523), (98, -3.1720197200775146), (99, -3.1712327003479004), (100, -3.170231580734253), (101, -3.169522762298584), (102, -3.1689655780792236), (103, -3.1684300899505615), (104, -3.168325662612915), (105, -3.1690406799316406), (106, -3.170681953430176), (107, -3.1725754737854004), (108, -3.1740291118621826), (109, -3.1747539043426514), (110, -3.17529296875), (111, -3.175872564315796), (112, -3.1763694286346436), (113, -3.1766903400421143), (114, -3.177093267440796), (115, -3.177703380584717), (116, -3.178342580795288), (117, -3.1787612438201904), (118, -3.178800344467163), (119, -3.1787617206573486), (120, -3.1787073612213135), (121, -3.1786582469940186), (122, -3.1784939765930176), (123, -3.1783785820007324), (124, -3.178452253341675), (125, -3.178673028945923), (126, -3.1788671016693115), (127, -3.1791179180145264), (128, -3.1794261932373047), (129, -3.180072546005249), (130, -3.1808159351348877), (131, -3.1814651489257812), (132, -3.1820502281188965), (133, -3.18270206451416), (134, -3.183638572692871), (135, -3.184781074523926), (136, -3.1858482360839844), (137, -3.1866111755371094), (138, -3.187269687652588), (139, -3.1877925395965576), (140, -3.1879124641418457), (141, -3.187772512435913), (142, -3.1876027584075928), (143, -3.187466859817505), (144, -3.187462568283081), (145, -3.18765926361084), (146, -3.187798023223877), (147, -3.187608480453491), (148, -3.187041759490967), (149, -3.1862194538116455), (150, -3.1852622032165527), (151, -3.184462070465088), (152, -3.18392276763916), (153, -3.1834876537323), (154, -3.1829378604888916), (155, -3.182192325592041), (156, -3.1812868118286133), (157, -3.180387258529663), (158, -3.1797759532928467), (159, -3.179440498352051), (160, -3.179206609725952), (161, -3.1787848472595215), (162, -3.1780953407287598), (163, -3.1772873401641846), (164, -3.176588773727417), (165, -3.1760404109954834), (166, -3.175747871398926), (167, -3.1758415699005127), (168, -3.1763880252838135), (169, -3.1771929264068604), (170, -3.1781058311462402), (171, -3.1786227226257324), (172, -3.178396463394165), (173, -3.177495241165161), (174, -3.176112413406372), (175, -3.174915075302124), (176, -3.1745519638061523), (177, -3.175133228302002), (178, -3.176145315170288), (179, -3.1769139766693115), (180, -3.177175760269165), (181, -3.177161455154419), (182, -3.177161931991577), (183, -3.177236557006836), (184, -3.177517890930176), (185, -3.17785382270813), (186, -3.178251266479492), (187, -3.1784064769744873), (188, -3.1783089637756348), (189, -3.1778337955474854), (190, -3.1774189472198486), (191, -3.1772897243499756), (192, -3.177556276321411), (193, -3.1776509284973145), (194, -3.1773452758789062), (195, -3.1770436763763428), (196, -3.1767454147338867), (197, -3.1764063835144043), (198, -3.176018714904785), (199, -3.175743341445923), (200, -3.17582106590271), (201, -3.176497459411621), (202, -3.1777138710021973), (203, -3.1792449951171875), (204, -3.1808700561523438), (205, -3.182403087615967), (206, -3.183622360229492), (207, -3.184422731399536), (208, -3.185027599334717), (209, -3.185609817504883), (210, -3.1864891052246094), (211, -3.18760347366333), (212, -3.1881701946258545), (213, -3.187927484512329), (214, -3.1871426105499268), (215, -3.1862099170684814), (216, -3.1854703426361084), (217, -3.184971809387207), (218, -3.184610605239868), (219, -3.184429407119751), (220, -3.1845250129699707), (221, -3.1846373081207275), (222, -3.1844964027404785), (223, -3.1835906505584717), (224, -3.1818289756774902), (225, -3.1795475482940674), (226, -3.1772897243499756), (227, -3.175438165664673), (228, -3.174163341522217), (229, -3.173462390899658), (230, -3.1731319427490234), (231, -3.1729953289031982), (232, -3.172698974609375), (233, -3.1722095012664795), (234, -3.1715986728668213), (235, -3.1706578731536865), (236, -3.1694772243499756), (237, -3.168009042739868), (238, -3.1662566661834717), (239, -3.1644539833068848), (240, -3.162716865539551), (241, -3.1612091064453125), (242, -3.159924030303955), (243, -3.159024238586426), (244, -3.1584150791168213), (245, -3.1579065322875977), (246, -3.1576287746429443), (247, -3.157655954360962), (248, -3.157977342605591), (249, -3.158470392227173), (250, -3.159073829650879), (251, -3.159669876098633), (252, -3.1600656509399414), (253, -3.1599481105804443), (254, -3.158961057662964), (255, -3.1566622257232666), (256, -3.1533429622650146), (257, -3.14925479888916), (258, -3.144380807876587), (259, -3.1389431953430176), (260, -3.133432388305664), (261, -3.128678321838379), (262, -3.125383138656616), (263, -3.1235556602478027), (264, -3.1231961250305176), (265, -3.1239206790924072), (266, -3.125196695327759), (267, -3.1264641284942627), (268, -3.127169609069824), (269, -3.12707257270813), (270, -3.1263484954833984), (271, -3.1258037090301514), (272, -3.126136541366577), (273, -3.127549886703491), (274, -3.12975811958313), (275, -3.1321604251861572), (276, -3.1343588829040527), (277, -3.1362688541412354), (278, -3.1380012035369873), (279, -3.1395533084869385), (280, -3.140836715698242), (281, -3.1418936252593994), (282, -3.1429078578948975), (283, -3.1438167095184326), (284, -3.144667148590088), (285, -3.1455001831054688), (286, -3.146317720413208), (287, -3.147355318069458), (288, -3.1488001346588135), (289, -3.1505391597747803), (290, -3.152207851409912), (291, -3.153693437576294), (292, -3.1548750400543213), (293, -3.155733346939087), (294, -3.156310558319092), (295, -3.156752586364746), (296, -3.1569149494171143), (297, -3.1569387912750244), (298, -3.15708327293396), (299, -3.1574647426605225), (300, -3.158153772354126), (301, -3.1591031551361084), (302, -3.160144329071045), (303, -3.1611344814300537), (304, -3.1620733737945557), (305, -3.1628315448760986), (306, -3.1634554862976074), (307, -3.1640512943267822), (308, -3.1647746562957764), (309, -3.165693759918213), (310, -3.166870355606079), (311, -3.168372869491577), (312, -3.169902801513672), (313, -3.1711249351501465), (314, -3.171745538711548), (315, -3.1718811988830566), (316, -3.1717121601104736), (317, -3.171469211578369), (318, -3.1712183952331543), (319, -3.170835256576538), (320, -3.1700806617736816), (321, -3.1689658164978027), (322, -3.1677308082580566), (323, -3.1667401790618896), (324, -3.1661198139190674), (325, -3.1657445430755615), (326, -3.165391683578491), (327, -3.1650898456573486), (328, -3.164902925491333), (329, -3.1648662090301514), (330, -3.1646766662597656), (331, -3.1641879081726074), (332, -3.1635279655456543), (333, -3.1629743576049805), (334, -3.1626486778259277), (335, -3.1624460220336914), (336, -3.162315607070923), (337, -3.162339687347412), (338, -3.162726879119873), (339, -3.163426637649536), (340, -3.1642346382141113), (341, -3.164970874786377), (342, -3.1653590202331543), (343, -3.165555953979492), (344, -3.1657462120056152), (345, -3.1658263206481934), (346, -3.1657392978668213), (347, -3.1655478477478027), (348, -3.165400981903076), (349, -3.1651649475097656), (350, -3.1646103858947754), (351, -3.163827419281006), (352, -3.1630940437316895), (353, -3.162562131881714), (354, -3.1620469093322754), (355, -3.161468029022217), (356, -3.1606838703155518), (357, -3.1597394943237305), (358, -3.158796787261963), (359, -3.1580464839935303), (360, -3.1573679447174072), (361, -3.156623601913452), (362, -3.1557939052581787), (363, -3.155043840408325), (364, -3.154477596282959), (365, -3.1540637016296387), (366, -3.153536319732666), (367, -3.1527369022369385), (368, -3.1517562866210938), (369, -3.150836706161499), (370, -3.150236129760742), (371, -3.1499621868133545), (372, -3.149768114089966), (373, -3.1496758460998535), (374, -3.1496424674987793), (375, -3.149646043777466), (376, -3.1495628356933594), (377, -3.149221181869507), (378, -3.148815393447876), (379, -3.1488261222839355), (380, -3.149500846862793), (381, -3.1505887508392334), (382, -3.151434898376465), (383, -3.151743173599243), (384, -3.1517179012298584), (385, -3.1513662338256836), (386, -3.150592088699341), (387, -3.1494646072387695), (388, -3.1482255458831787), (389, -3.147106409072876), (390, -3.1460907459259033), (391, -3.144991397857666), (392, -3.1431620121002197), (393, -3.1399800777435303), (394, -3.135885715484619), (395, -3.131800889968872), (396, -3.1284213066101074), (397, -3.1262166500091553), (398, -3.125347852706909), (399, -3.1255087852478027), (400, -3.1263084411621094), (401, -3.1272833347320557), (402, -3.12782883644104), (403, -3.127565622329712), (404, -3.126504421234131), (405, -3.1250293254852295), (406, -3.1238062381744385), (407, -3.1231584548950195), (408, -3.1230974197387695), (409, -3.1233742237091064), (410, -3.123546838760376), (411, -3.1234660148620605), (412, -3.1230709552764893), (413, -3.122417449951172), (414, -3.1216065883636475), (415, -3.1209304332733154), (416, -3.120767116546631), (417, -3.1210947036743164), (418, -3.1216940879821777), (419, -3.1221628189086914), (420, -3.1224277019500732), (421, -3.1228268146514893), (422, -3.1235804557800293), (423, -3.124354124069214), (424, -3.124997854232788), (425, -3.125580072402954), (426, -3.126160144805908), (427, -3.126584768295288), (428, -3.1266729831695557), (429, -3.1264829635620117), (430, -3.1261775493621826), (431, -3.1257734298706055), (432, -3.125527858734131), (433, -3.1255130767822266), (434, -3.1257073879241943), (435, -3.1261069774627686), (436, -3.1266767978668213), (437, -3.12731671333313), (438, -3.1279919147491455), (439, -3.12895131111145), (440, -3.130401611328125), (441, -3.132152795791626), (442, -3.133931875228882), (443, -3.1356897354125977), (444, -3.1374120712280273), (445, -3.1388823986053467), (446, -3.139859914779663), (447, -3.140315294265747), (448, -3.140310525894165), (449, -3.1399660110473633), (450, -3.139741897583008), (451, -3.1397645473480225), (452, -3.1398158073425293), (453, -3.1397387981414795), (454, -3.1395277976989746), (455, -3.1391773223876953), (456, -3.138803243637085), (457, -3.1388680934906006), (458, -3.1396021842956543), (459, -3.1407055854797363), (460, -3.1418306827545166), (461, -3.142775297164917), (462, -3.143455982208252), (463, -3.1439576148986816), (464, -3.1444766521453857), (465, -3.1453096866607666), (466, -3.1465015411376953), (467, -3.147970676422119), (468, -3.149441719055176), (469, -3.1506247520446777), (470, -3.1514198780059814), (471, -3.151862382888794), (472, -3.1518776416778564), (473, -3.151606559753418), (474, -3.151336193084717), (475, -3.15118408203125), (476, -3.1511077880859375), (477, -3.15103816986084), (478, -3.1508898735046387), (479, -3.150756359100342), (480, -3.150672435760498), (481, -3.150555372238159), (482, -3.150522232055664), (483, -3.1506621837615967), (484, -3.150914430618286), (485, -3.151116132736206), (486, -3.1511545181274414), (487, -3.151005268096924), (488, -3.1506998538970947), (489, -3.1504323482513428), (490, -3.1503398418426514), (491, -3.1504719257354736), (492, -3.1508243083953857), (493, -3.151350736618042), (494, -3.152052640914917), (495, -3.1526427268981934), (496, -3.1529836654663086), (497, -3.153008460998535), (498, -3.152914524078369), (499, -3.1529877185821533), (500, -3.15315580368042), (501, -3.1531240940093994), (502, -3.1528501510620117), (503, -3.152381181716919), (504, -3.151920795440674), (505, -3.1518185138702393), (506, -3.1522200107574463), (507, -3.152834892272949), (508, -3.1534197330474854), (509, -3.153791904449463), (510, -3.1537725925445557), (511, -3.153306245803833), (512, -3.1526403427124023), (513, -3.152229070663452), (514, -3.1521341800689697), (515, -3.1522819995880127), (516, -3.1526613235473633), (517, -3.153188705444336), (518, -3.153665781021118), (519, -3.153913736343384), (520, -3.1538407802581787), (521, -3.1535308361053467), (522, -3.1534228324890137), (523, -3.1536266803741455), (524, -3.1540286540985107), (525, -3.1544768810272217), (526, -3.1547670364379883), (527, -3.1549203395843506), (528, -3.154834032058716), (529, -3.1545000076293945), (530, -3.153991937637329), (531, -3.1535327434539795), (532, -3.1532561779022217), (533, -3.1529972553253174), (534, -3.1527388095855713), (535, -3.1523640155792236), (536, -3.151839017868042), (537, -3.1512625217437744), (538, -3.1507389545440674), (539, -3.1504275798797607), (540, -3.1504454612731934), (541, -3.150531768798828), (542, -3.150542974472046), (543, -3.150498628616333), (544, -3.1503846645355225), (545, -3.1502954959869385), (546, -3.1502537727355957), (547, -3.1504197120666504), (548, -3.150758981704712), (549, -3.1510586738586426), (550, -3.151313066482544), (551, -3.151571273803711), (552, -3.151792049407959), (553, -3.1519124507904053), (554, -3.1518309116363525), (555, -3.151630401611328), (556, -3.151393175125122), (557, -3.151102066040039), (558, -3.1507630348205566), (559, -3.1501803398132324), (560, -3.1495347023010254), (561, -3.1489901542663574), (562, -3.148517608642578), (563, -3.148012399673462), (564, -3.1472244262695312), (565, -3.1462817192077637), (566, -3.145435333251953), (567, -3.1447458267211914), (568, -3.1440868377685547), (569, -3.143389940261841), (570, -3.1425633430480957), (571, -3.1416232585906982), (572, -3.1408824920654297), (573, -3.140322208404541), (574, -3.1398677825927734), (575, -3.13936448097229), (576, -3.1388490200042725), (577, -3.1382923126220703), (578, -3.1375772953033447), (579, -3.1365857124328613), (580, -3.1353390216827393), (581, -3.13411283493042), (582, -3.132981777191162), (583, -3.132061004638672), (584, -3.131483554840088), (585, -3.131061553955078), (586, -3.1307551860809326), (587, -3.130584239959717), (588, -3.130532741546631), (589, -3.1305978298187256), (590, -3.1306827068328857), (591, -3.1307950019836426), (592, -3.1313424110412598), (593, -3.1325809955596924), (594, -3.1344635486602783), (595, -3.1366870403289795), (596, -3.1387572288513184), (597, -3.140657901763916), (598, -3.142622232437134), (599, -3.1447596549987793), (600, -3.1469385623931885), (601, -3.1486213207244873), (602, -3.1495566368103027), (603, -3.15006422996521), (604, -3.150547504425049), (605, -3.151118040084839), (606, -3.1518936157226562), (607, -3.1533145904541016), (608, -3.1554715633392334), (609, -3.1577250957489014), (610, -3.1592953205108643), (611, -3.160057783126831), (612, -3.160163402557373), (613, -3.159850835800171), (614, -3.1593806743621826), (615, -3.1590282917022705), (616, -3.1590800285339355), (617, -3.1597323417663574), (618, -3.1609575748443604), (619, -3.162632465362549), (620, -3.164501667022705), (621, -3.1666595935821533), (622, -3.169123888015747), (623, -3.1715831756591797), (624, -3.173862934112549), (625, -3.175609827041626), (626, -3.1766176223754883), (627, -3.176851511001587), (628, -3.176506757736206), (629, -3.175938844680786), (630, -3.1754541397094727), (631, -3.174767255783081), (632, -3.173701286315918), (633, -3.1725411415100098), (634, -3.1716976165771484), (635, -3.1711549758911133), (636, -3.170607805252075), (637, -3.1700499057769775), (638, -3.1694421768188477), (639, -3.168639898300171), (640, -3.1673262119293213), (641, -3.165318250656128), (642, -3.1628825664520264), (643, -3.1609370708465576), (644, -3.159916400909424), (645, -3.1595513820648193), (646, -3.1591756343841553), (647, -3.158536434173584), (648, -3.1576340198516846), (649, -3.156700372695923), (650, -3.155888080596924), (651, -3.1549880504608154), (652, -3.1538124084472656), (653, -3.1524012088775635), (654, -3.1508066654205322), (655, -3.1493377685546875), (656, -3.1480770111083984), (657, -3.1469924449920654), (658, -3.1461849212646484), (659, -3.1456806659698486), (660, -3.145219087600708), (661, -3.1445155143737793), (662, -3.1434245109558105), (663, -3.1421751976013184), (664, -3.140791416168213), (665, -3.1390063762664795), (666, -3.13667893409729), (667, -3.13395094871521), (668, -3.1312427520751953), (669, -3.1296777725219727), (670, -3.1297531127929688), (671, -3.130891799926758), (672, -3.132068395614624), (673, -3.1325342655181885), (674, -3.1321909427642822), (675, -3.131525993347168), (676, -3.13107967376709), (677, -3.1313107013702393), (678, -3.132322072982788), (679, -3.1338891983032227), (680, -3.1356310844421387), (681, -3.1371262073516846), (682, -3.1379973888397217), (683, -3.1381659507751465), (684, -3.137821674346924), (685, -3.1375255584716797), (686, -3.1373801231384277), (687, -3.1372461318969727), (688, -3.137075901031494), (689, -3.1369688510894775), (690, -3.136754035949707), (691, -3.1362879276275635), (692, -3.135258197784424), (693, -3.133943796157837), (694, -3.132737159729004), (695, -3.1317362785339355), (696, -3.1308083534240723), (697, -3.1297664642333984), (698, -3.128680944442749), (699, -3.127464771270752), (700, -3.1261603832244873), (701, -3.124933958053589), (702, -3.124037981033325), (703, -3.1234140396118164), (704, -3.1227595806121826), (705, -3.1219303607940674), (706, -3.120906114578247), (707, -3.1198456287384033), (708, -3.118788957595825), (709, -3.1177709102630615), (710, -3.1169166564941406), (711, -3.1164371967315674), (712, -3.116401433944702), (713, -3.1166186332702637), (714, -3.116715669631958), (715, -3.1164422035217285), (716, -3.116058111190796), (717, -3.1159112453460693), (718, -3.1160972118377686), (719, -3.1164066791534424), (720, -3.116945505142212), (721, -3.117652416229248), (722, -3.1183431148529053), (723, -3.1190850734710693), (724, -3.1199944019317627), (725, -3.121195077896118), (726, -3.1225199699401855), (727, -3.1235389709472656), (728, -3.1239421367645264), (729, -3.1239447593688965), (730, -3.123839855194092), (731, -3.1238436698913574), (732, -3.124101400375366), (733, -3.1244823932647705), (734, -3.1248629093170166), (735, -3.1253058910369873), (736, -3.125854969024658), (737, -3.1264328956604004), (738, -3.127046823501587), (739, -3.127667188644409), (740, -3.12827730178833), (741, -3.129143714904785), (742, -3.1300649642944336), (743, -3.1307694911956787), (744, -3.131136178970337), (745, -3.1314146518707275), (746, -3.1317522525787354), (747, -3.1324164867401123), (748, -3.1335716247558594), (749, -3.1353538036346436), (750, -3.137624979019165), (751, -3.1402065753936768), (752, -3.142564058303833), (753, -3.144296169281006), (754, -3.1449108123779297), (755, -3.144483804702759), (756, -3.1434738636016846), (757, -3.1423983573913574), (758, -3.141449213027954), (759, -3.140666961669922), (760, -3.140038251876831), (761, -3.1396780014038086), (762, -3.1393909454345703), (763, -3.1390039920806885), (764, -3.138484239578247), (765, -3.1379973888397217), (766, -3.137789011001587), (767, -3.1378848552703857), (768, -3.138049840927124), (769, -3.1380181312561035), (770, -3.137852907180786), (771, -3.1377766132354736), (772, -3.137883186340332), (773, -3.1379036903381348), (774, -3.1377334594726562), (775, -3.1375644207000732), (776, -3.137563705444336), (777, -3.1377451419830322), (778, -3.1379756927490234), (779, -3.138228416442871), (780, -3.138443946838379), (781, -3.1386301517486572), (782, -3.1388936042785645), (783, -3.139176845550537), (784, -3.1394176483154297), (785, -3.1397452354431152), (786, -3.1401519775390625), (787, -3.140564203262329), (788, -3.1408143043518066), (789, -3.1406989097595215), (790, -3.140425443649292), (791, -3.140258312225342), (792, -3.140373945236206), (793, -3.140657901763916), (794, -3.1408934593200684), (795, -3.1409778594970703), (796, -3.140946626663208), (797, -3.1407740116119385), (798, -3.1406071186065674), (799, -3.1406538486480713), (800, -3.140873670578003), (801, -3.141202926635742), (802, -3.141749858856201), (803, -3.142608880996704), (804, -3.143428087234497), (805, -3.1439049243927), (806, -3.143897533416748), (807, -3.1435353755950928), (808, -3.143123149871826), (809, -3.142923593521118), (810, -3.1431915760040283), (811, -3.1438918113708496), (812, -3.1449320316314697), (813, -3.1460838317871094), (814, -3.1470870971679688), (815, -3.1476569175720215), (816, -3.1477110385894775), (817, -3.1475467681884766), (818, -3.1474015712738037), (819, -3.1470768451690674), (820, -3.146634817123413), (821, -3.146171808242798), (822, -3.1458635330200195), (823, -3.1456780433654785), (824, -3.1455163955688477), (825, -3.1453299522399902), (826, -3.145167112350464), (827, -3.145031452178955), (828, -3.144768238067627), (829, -3.1443374156951904), (830, -3.1438419818878174), (831, -3.143357753753662), (832, -3.1429803371429443), (833, -3.142737627029419), (834, -3.142286539077759), (835, -3.1417198181152344), (836, -3.141334056854248), (837, -3.1412816047668457), (838, -3.1414806842803955), (839, -3.141840696334839), (840, -3.142194986343384), (841, -3.14251446723938), (842, -3.142756223678589), (843, -3.1427276134490967), (844, -3.1423985958099365), (845, -3.1420044898986816), (846, -3.1417930126190186), (847, -3.1416919231414795), (848, -3.141470193862915), (849, -3.141127824783325), (850, -3.1407675743103027), (851, -3.14064884185791), (852, -3.1408298015594482), (853, -3.141261339187622), (854, -3.1418440341949463), (855, -3.1425375938415527), (856, -3.1431713104248047), (857, -3.143686056137085), (858, -3.1440248489379883), (859, -3.1443164348602295), (860, -3.1446244716644287), (861, -3.1448910236358643), (862, -3.144948720932007), (863, -3.1445260047912598), (864, -3.1437466144561768), (865, -3.143007278442383), (866, -3.1426875591278076), (867, -3.1428685188293457), (868, -3.143418073654175), (869, -3.1439273357391357), (870, -3.1443097591400146), (871, -3.1445884704589844), (872, -3.1448276042938232), (873, -3.1450705528259277), (874, -3.145260810852051), (875, -3.1452829837799072), (876, -3.1451332569122314), (877, -3.1448652744293213), (878, -3.1445016860961914), (879, -3.1441564559936523), (880, -3.1439247131347656), (881, -3.1437673568725586), (882, -3.1438283920288086), (883, -3.144174575805664), (884, -3.1444814205169678), (885, -3.144714832305908), (886, -3.1448564529418945), (887, -3.145203113555908), (888, -3.145721197128296), (889, -3.1455483436584473), (890, -3.145535469055176), (891, -3.1451501846313477), (892, -3.1442275047302246), (893, -3.143192768096924), (894, -3.1418447494506836), (895, -3.140285015106201), (896, -3.1410930156707764), (897, -3.1422579288482666), (898, -3.1432812213897705), (899, -3.1437582969665527), (900, -3.1437997817993164), (901, -3.144305467605591), (902, -3.145476818084717), (903, -3.147336721420288), (904, -3.1497581005096436), (905, -3.1524627208709717), (906, -3.1550190448760986), (907, -3.1575067043304443), (908, -3.15932297706604), (909, -3.1608338356018066), (910, -3.1623823642730713), (911, -3.1641688346862793), (912, -3.1660850048065186), (913, -3.1679928302764893), (914, -3.169748544692993), (915, -3.171213388442993), (916, -3.1722774505615234), (917, -3.17287278175354), (918, -3.1729743480682373)]}), 'INVESTIGATION': ('Investigation', 24.0, {('location', 0): [(0, 0.021819), (1, 0.012368), (2, 0.003192), (3, -0.00655), (4, -0.016339), (5, -0.026018), (6, -0.034887), (7, -0.042019), (8, -0.049939), (9, -0.056172), (10, -0.061366), (11, -0.066012), (12, -0.070278), (13, -0.075834), (14, -0.080062), (15, -0.085495), (16, -0.09094), (17, -0.095961), (18, -0.101095), (19, -0.106177), (20, -0.11118), (21, -0.116064), (22, -0.120905), (23, -0.125763), (24, -0.13111), (25, -0.135837), (26, -0.140447), (27, -0.144403), (28, -0.14851), (29, -0.151668), (30, -0.152941), (31, -0.156221), (32, -0.162279), (33, -0.169061), (34, -0.176461), (35, -0.18251), (36, -0.186673), (37, -0.189361), (38, -0.191242), (39, -0.1949), (40, -0.197357), (41, -0.199245), (42, -0.20104), (43, -0.2027), (44, -0.204774), (45, -0.206178), (46, -0.207589), (47, -0.209708), (48, -0.211459), (49, -0.212665), (50, -0.213541), (51, -0.213835), (52, -0.214496), (53, -0.215382), (54, -0.21709), (55, -0.221154), (56, -0.224319), (57, -0.228769), (58, -0.231445), (59, -0.234377), (60, -0.237737), (61, -0.240104), (62, -0.242053), (63, -0.243004), (64, -0.244117), (65, -0.244425), (66, -0.243168), (67, -0.242141), (68, -0.241821), (69, -0.241773), (70, -0.242412), (71, -0.24192), (72, -0.242203), (73, -0.23948), (74, -0.236067), (75, -0.232184), (76, -0.227986), (77, -0.226187), (78, -0.223316), (79, -0.221301), (80, -0.217417), (81, -0.214397), (82, -0.210026), (83, -0.206673), (84, -0.20378), (85, -0.200372), (86, -0.196763), (87, -0.192126), (88, -0.187427), (89, -0.183385), (90, -0.179442), (91, -0.175286), (92, -0.169655), (93, -0.164775), (94, -0.159902), (95, -0.153548), (96, -0.150353), (97, -0.148575), (98, -0.147311), (99, -0.144095), (100, -0.141059), (101, -0.138495), (102, -0.136538), (103, -0.135235), (104, -0.134107), (105, -0.13289), (106, -0.130241), (107, -0.127601), (108, -0.124418), (109, -0.120474), (110, -0.116139), (111, -0.111402), (112, -0.107792), (113, -0.104194), (114, -0.100679), (115, -0.096566), (116, -0.093592), (117, -0.091974), (118, -0.091595), (119, -0.092374), (120, -0.093917), (121, -0.095131), (122, -0.095733), (123, -0.095824), (124, -0.096493), (125, -0.098141), (126, -0.100411), (127, -0.102545), (128, -0.105664), (129, -0.109149), (130, -0.113019), (131, -0.116814), (132, -0.121083), (133, -0.124707), (134, -0.127718), (135, -0.130643), (136, -0.133213), (137, -0.135697), (138, -0.137416), (139, -0.13892), (140, -0.138718), (141, -0.137933), (142, -0.136365), (143, -0.134356), (144, -0.131411), (145, -0.128308), (146, -0.124466), (147, -0.121465), (148, -0.117868), (149, -0.11564), (150, -0.11245), (151, -0.112923), (152, -0.113673), (153, -0.115733), (154, -0.115463), (155, -0.114305), (156, -0.112894), (157, -0.111642), (158, -0.110926), (159, -0.109431), (160, -0.109151), (161, -0.107809), (162, -0.108091), (163, -0.105725), (164, -0.101777), (165, -0.096781), (166, -0.091344), (167, -0.085706), (168, -0.079978), (169, -0.074584), (170, -0.068466), (171, -0.063174), (172, -0.058409), (173, -0.052818), (174, -0.046163), (175, -0.040124), (176, -0.034181), (177, -0.027608), (178, -0.022729), (179, -0.015939), (180, -0.01104), (181, -0.005775), (182, -0.001767), (183, 0.002795), (184, 0.006824), (185, 0.011953), (186, 0.016769), (187, 0.021467), (188, 0.025224), (189, 0.029206), (190, 0.033157), (191, 0.034732), (192, 0.037727), (193, 0.038889), (194, 0.040164), (195, 0.039905), (196, 0.039475), (197, 0.039377), (198, 0.03861), (199, 0.037526), (200, 0.035025), (201, 0.033177), (202, 0.031235), (203, 0.029469), (204, 0.027606), (205, 0.024406), (206, 0.021168), (207, 0.018235), (208, 0.015396), (209, 0.012284), (210, 0.008344), (211, 0.004378), (212, -0.000789), (213, -0.003943), (214, -0.006213), (215, -0.009609), (216, -0.01247), (217, -0.014667), (218, -0.01793), (219, -0.020415), (220, -0.021939), (221, -0.023782), (222, -0.024823), (223, -0.027069), (224, -0.030103), (225, -0.031093), (226, -0.032917), (227, -0.035371), (228, -0.037845), (229, -0.040165), (230, -0.042721), (231, -0.044713), (232, -0.045933), (233, -0.050767), (234, -0.050549), (235, -0.054889), (236, -0.056804), (237, -0.058702), (238, -0.06012), (239, -0.062345), (240, -0.065202), (241, -0.067013), (242, -0.070071), (243, -0.071447), (244, -0.074546), (245, -0.076468), (246, -0.077345), (247, -0.078502), (248, -0.080165), (249, -0.080317), (250, -0.086436), (251, -0.085962), (252, -0.085341), (253, -0.084204), (254, -0.08179), (255, -0.079656), (256, -0.077789), (257, -0.074561), (258, -0.070708), (259, -0.066158), (260, -0.062436), (261, -0.058702), (262, -0.054996), (263, -0.051689), (264, -0.047849), (265, -0.04381), (266, -0.039606), (267, -0.035009), (268, -0.030804), (269, -0.026571), (270, -0.0225), (271, -0.018267), (272, -0.014322), (273, -0.011338), (274, -0.006208), (275, -0.003142), (276, -0.000502), (277, 0.001287), (278, 0.003183), (279, 0.004538), (280, 0.005444), (281, 0.005567), (282, 0.005034), (283, 0.00454), (284, 0.004666), (285, 0.003491), (286, 0.003236), (287, 0.002391), (288, 0.002178), (289, 0.002222), (290, 0.002159), (291, 0.002454), (292, 0.00286), (293, 0.003124), (294, 0.003109), (295, 0.003438), (296, 0.00408), (297, 0.004269), (298, 0.005184), (299, 0.005959), (300, 0.006053), (301, 0.006896), (302, 0.007623), (303, 0.008652), (304, 0.009656), (305, 0.010911), (306, 0.011937), (307, 0.0139), (308, 0.015222), (309, 0.016509), (310, 0.018416), (311, 0.02078), (312, 0.023245), (313, 0.025865), (314, 0.028403), (315, 0.030632), (316, 0.032807), (317, 0.034764), (318, 0.037335), (319, 0.039534), (320, 0.042262), (321, 0.04565), (322, 0.049205), (323, 0.052355), (324, 0.054701), (325, 0.057475), (326, 0.060015), (327, 0.062916), (328, 0.0653), (329, 0.067722), (330, 0.070228), (331, 0.071757), (332, 0.073171), (333, 0.074482), (334, 0.075646), (335, 0.076205), (336, 0.076582), (337, 0.076681), (338, 0.076909), (339, 0.076835), (340, 0.076681), (341, 0.076818), (342, 0.077076), (343, 0.077268), (344, 0.078078), (345, 0.079215), (346, 0.079996), (347, 0.081517), (348, 0.081337), (349, 0.082381), (350, 0.081848), (351, 0.080697), (352, 0.079344), (353, 0.077664), (354, 0.075831), (355, 0.073276), (356, 0.07042), (357, 0.066948), (358, 0.062833), (359, 0.059599), (360, 0.055332), (361, 0.050333), (362, 0.045575), (363, 0.040193), (364, 0.034548), (365, 0.028773), (366, 0.022693), (367, 0.023183), (368, 0.023425), (369, 0.023147), (370, 0.021201), (371, 0.015919)], ('location', 1): [(0, 0.004563), (1, 0.0), (2, -0.004563), (3, -0.008587), (4, -0.012519), (5, -0.017078), (6, -0.021599), (7, -0.026818), (8, -0.031728), (9, -0.036636), (10, -0.041351), (11, -0.045605), (12, -0.049422), (13, -0.052272), (14, -0.05463), (15, -0.05582), (16, -0.056572), (17, -0.057333), (18, -0.057542), (19, -0.057255), (20, -0.056352), (21, -0.055004), (22, -0.053005), (23, -0.050269), (24, -0.046786), (25, -0.043059), (26, -0.038912), (27, -0.034588), (28, -0.030218), (29, -0.026238), (30, -0.021813), (31, -0.017199), (32, -0.011611), (33, -0.005447), (34, 0.000563), (35, 0.00614), (36, 0.011122), (37, 0.01548), (38, 0.020329), (39, 0.025698), (40, 0.030947), (41, 0.036048), (42, 0.041478), (43, 0.046858), (44, 0.052132), (45, 0.056985), (46, 0.061732), (47, 0.066366), (48, 0.068953), (49, 0.072635), (50, 0.075517), (51, 0.077485), (52, 0.078964), (53, 0.079619), (54, 0.079679), (55, 0.079617), (56, 0.078445), (57, 0.074942), (58, 0.071836), (59, 0.068443), (60, 0.063991), (61, 0.059588), (62, 0.054775), (63, 0.051071), (64, 0.047173), (65, 0.043409), (66, 0.040029), (67, 0.037057), (68, 0.034226), (69, 0.031547), (70, 0.028447), (71, 0.026215), (72, 0.024015), (73, 0.022841), (74, 0.022001), (75, 0.021226), (76, 0.020454), (77, 0.019774), (78, 0.018314), (79, 0.016641), (80, 0.014147), (81, 0.010553), (82, 0.0066), (83, 0.002133), (84, -0.003087), (85, -0.008636), (86, -0.014613), (87, -0.020482), (88, -0.026618), (89, -0.033029), (90, -0.039052), (91, -0.044727), (92, -0.050663), (93, -0.054914), (94, -0.05815), (95, -0.06095), (96, -0.064082), (97, -0.065681), (98, -0.065935), (99, -0.065884), (100, -0.064897), (101, -0.064156), (102, -0.063696), (103, -0.06338), (104, -0.063373), (105, -0.063483), (106, -0.063519), (107, -0.064205), (108, -0.06507), (109, -0.067426), (110, -0.069086), (111, -0.071652), (112, -0.075219), (113, -0.0792), (114, -0.083346), (115, -0.087421), (116, -0.092151), (117, -0.097071), (118, -0.102674), (119, -0.108824), (120, -0.115232), (121, -0.121546), (122, -0.12945), (123, -0.135572), (124, -0.141381), (125, -0.147423), (126, -0.153307), (127, -0.15887), (128, -0.164475), (129, -0.169794), (130, -0.174973), (131, -0.179787), (132, -0.184782), (133, -0.189209), (134, -0.193595), (135, -0.198923), (136, -0.203545), (137, -0.207536), (138, -0.211792), (139, -0.214902), (140, -0.217268), (141, -0.219655), (142, -0.221296), (143, -0.222478), (144, -0.222596), (145, -0.223442), (146, -0.223081), (147, -0.222852), (148, -0.222042), (149, -0.221626), (150, -0.221307), (151, -0.220343), (152, -0.219796), (153, -0.218446), (154, -0.216401), (155, -0.213846), (156, -0.211706), (157, -0.209673), (158, -0.207618), (159, -0.205818), (160, -0.203303), (161, -0.200124), (162, -0.19744), (163, -0.193315), (164, -0.189087), (165, -0.18501), (166, -0.181208), (167, -0.17765), (168, -0.174209), (169, -0.170776), (170, -0.167015), (171, -0.16348), (172, -0.163091), (173, -0.159128), (174, -0.155814), (175, -0.152939), (176, -0.150686), (177, -0.148418), (178, -0.147508), (179, -0.144904), (180, -0.142857), (181, -0.140104), (182, -0.136933), (183, -0.133856), (184, -0.130646), (185, -0.127406), (186, -0.124447), (187, -0.12168), (188, -0.118347), (189, -0.114947), (190, -0.111224), (191, -0.108751), (192, -0.105523), (193, -0.102368), (194, -0.099087), (195, -0.095847), (196, -0.092736), (197, -0.089742), (198, -0.087217), (199, -0.085268), (200, -0.083607), (201, -0.082499), (202, -0.081784), (203, -0.081884), (204, -0.082744), (205, -0.084354), (206, -0.08681), (207, -0.089946), (208, -0.092908), (209, -0.096809), (210, -0.100063), (211, -0.103944), (212, -0.108268), (213, -0.113144), (214, -0.118505), (215, -0.124315), (216, -0.131339), (217, -0.137796), (218, -0.14431), (219, -0.150864), (220, -0.157592), (221, -0.164649), (222, -0.172519), (223, -0.178676), (224, -0.184188), (225, -0.189226), (226, -0.19469), (227, -0.198874), (228, -0.202774), (229, -0.206464), (230, -0.209918), (231, -0.213133), (232, -0.216575), (233, -0.218739), (234, -0.221302), (235, -0.224017), (236, -0.227426), (237, -0.230605), (238, -0.233794), (239, -0.236475), (240, -0.238644), (241, -0.24033), (242, -0.241648), (243, -0.243296), (244, -0.24388), (245, -0.243665), (246, -0.243778), (247, -0.242267), (248, -0.239758), (249, -0.236825), (250, -0.231902), (251, -0.228162), (252, -0.222588), (253, -0.216535), (254, -0.209573), (255, -0.202823), (256, -0.195788), (257, -0.188942), (258, -0.181511), (259, -0.175176), (260, -0.168532), (261, -0.161802), (262, -0.155097), (263, -0.148384), (264, -0.141918), (265, -0.135521), (266, -0.129376), (267, -0.12342), (268, -0.117391), (269, -0.11133), (270, -0.105225), (271, -0.099179), (272, -0.093362), (273, -0.087301), (274, -0.082347), (275, -0.07643), (276, -0.070988), (277, -0.066397), (278, -0.061563), (279, -0.057675), (280, -0.053826), (281, -0.050376), (282, -0.047329), (283, -0.045021), (284, -0.043618), (285, -0.041753), (286, -0.041097), (287, -0.039638), (288, -0.038602), (289, -0.037422), (290, -0.036359), (291, -0.03531), (292, -0.034561), (293, -0.033878), (294, -0.033303), (295, -0.032856), (296, -0.032746), (297, -0.03213), (298, -0.032303), (299, -0.031857), (300, -0.032445), (301, -0.032673), (302, -0.033087), (303, -0.033984), (304, -0.03565), (305, -0.036979), (306, -0.037953), (307, -0.039232), (308, -0.040114), (309, -0.040876), (310, -0.041822), (311, -0.043091), (312, -0.044498), (313, -0.04684), (314, -0.048565), (315, -0.050353), (316, -0.052419), (317, -0.054495), (318, -0.056383), (319, -0.058649), (320, -0.060368), (321, -0.061872), (322, -0.063334), (323, -0.063376), (324, -0.063983), (325, -0.064505), (326, -0.064827), (327, -0.065345), (328, -0.065692), (329, -0.06619), (330, -0.066416), (331, -0.066337), (332, -0.066237), (333, -0.066012), (334, -0.065861), (335, -0.065062), (336, -0.0648), (337, -0.064207), (338, -0.063828), (339, -0.062969), (340, -0.062549), (341, -0.061674), (342, -0.060992), (343, -0.060171), (344, -0.059162), (345, -0.058022), (346, -0.056824), (347, -0.055793), (348, -0.054525), (349, -0.053179), (350, -0.051607), (351, -0.049678), (352, -0.047596), (353, -0.04522), (354, -0.042685), (355, -0.03991), (356, -0.037039), (357, -0.034098), (358, -0.030981), (359, -0.02804), (360, -0.024846), (361, -0.021543), (362, -0.017857), (363, -0.01449), (364, -0.010595), (365, -0.007343), (366, -0.003896), (367, -0.003334), (368, -0.002895), (369, -0.002581), (370, -0.002391), (371, -0.002328)], ('location', 2): [(0, -0.003604), (1, -0.003431), (2, -0.003387), (3, -0.002934), (4, -0.002923), (5, -0.004425), (6, -0.006044), (7, -0.007711), (8, -0.009409), (9, -0.011712), (10, -0.013893), (11, -0.015884), (12, -0.01814), (13, -0.020823), (14, -0.022288), (15, -0.024929), (16, -0.028371), (17, -0.031594), (18, -0.03516), (19, -0.039225), (20, -0.043799), (21, -0.048301), (22, -0.052994), (23, -0.057878), (24, -0.062249), (25, -0.067346), (26, -0.072512), (27, -0.078334), (28, -0.084834), (29, -0.090696), (30, -0.098559), (31, -0.105297), (32, -0.112096), (33, -0.118169), (34, -0.124376), (35, -0.130853), (36, -0.137413), (37, -0.143449), (38, -0.148746), (39, -0.154161), (40, -0.159059), (41, -0.16293), (42, -0.166689), (43, -0.16955), (44, -0.171877), (45, -0.173642), (46, -0.174694), (47, -0.175965), (48, -0.176382), (49, -0.17722), (50, -0.177775), (51, -0.177753), (52, -0.177711), (53, -0.176909), (54, -0.176504), (55, -0.176155), (56, -0.171741), (57, -0.169074), (58, -0.166195), (59, -0.162117), (60, -0.159144), (61, -0.155228), (62, -0.153032), (63, -0.150175), (64, -0.147588), (65, -0.146311), (66, -0.144919), (67, -0.144705), (68, -0.143973), (69, -0.144011), (70, -0.143182), (71, -0.143875), (72, -0.142733), (73, -0.142851), (74, -0.141915), (75, -0.141343), (76, -0.139793), (77, -0.138276), (78, -0.1359), (79, -0.133874), (80, -0.131321), (81, -0.129867), (82, -0.128343), (83, -0.126424), (84, -0.124874), (85, -0.123678), (86, -0.122883), (87, -0.122079), (88, -0.120859), (89, -0.118557), (90, -0.116008), (91, -0.1118), (92, -0.107878), (93, -0.103568), (94, -0.099378), (95, -0.095786), (96, -0.09295), (97, -0.08971), (98, -0.087448), (99, -0.086165), (100, -0.085617), (101, -0.084701), (102, -0.082626), (103, -0.081386), (104, -0.080311), (105, -0.079194), (106, -0.077948), (107, -0.077728), (108, -0.076876), (109, -0.077097), (110, -0.077435), (111, -0.078076), (112, -0.078254), (113, -0.077841), (114, -0.076435), (115, -0.076084), (116, -0.074345), (117, -0.072926), (118, -0.071214), (119, -0.069515), (120, -0.068266), (121, -0.066611), (122, -0.065535), (123, -0.063685), (124, -0.063267), (125, -0.062389), (126, -0.062873), (127, -0.062686), (128, -0.062393), (129, -0.062479), (130, -0.063149), (131, -0.063858), (132, -0.064822), (133, -0.066471), (134, -0.067867), (135, -0.070505), (136, -0.072934), (137, -0.075273), (138, -0.077878), (139, -0.080514), (140, -0.0823), (141, -0.083642), (142, -0.084731), (143, -0.084737), (144, -0.084371), (145, -0.084157), (146, -0.084031), (147, -0.084015), (148, -0.083573), (149, -0.083482), (150, -0.083942), (151, -0.084577), (152, -0.084261), (153, -0.085281), (154, -0.084848), (155, -0.084659), (156, -0.084522), (157, -0.084502), (158, -0.085217), (159, -0.085489), (160, -0.08646), (161, -0.088324), (162, -0.090657), (163, -0.091461), (164, -0.09336), (165, -0.095918), (166, -0.099633), (167, -0.103652), (168, -0.10762), (169, -0.112333), (170, -0.115742), (171, -0.119999), (172, -0.117645), (173, -0.122978), (174, -0.126298), (175, -0.130895), (176, -0.135572), (177, -0.139835), (178, -0.142878), (179, -0.146481), (180, -0.149262), (181, -0.150128), (182, -0.151102), (183, -0.149717), (184, -0.149501), (185, -0.148484), (186, -0.147526), (187, -0.146201), (188, -0.145922), (189, -0.14386), (190, -0.142997), (191, -0.142945), (192, -0.142688), (193, -0.142299), (194, -0.14294), (195, -0.143366), (196, -0.144003), (197, -0.144612), (198, -0.145202), (199, -0.146176), (200, -0.148269), (201, -0.149573), (202, -0.150931), (203, -0.153019), (204, -0.154563), (205, -0.156096), (206, -0.157333), (207, -0.157816), (208, -0.157934), (209, -0.157841), (210, -0.156853), (211, -0.15524), (212, -0.154249), (213, -0.152395), (214, -0.150554), (215, -0.14888), (216, -0.147122), (217, -0.145068), (218, -0.142954), (219, -0.140816), (220, -0.138276), (221, -0.135998), (222, -0.132468), (223, -0.129297), (224, -0.126206), (225, -0.122513), (226, -0.119597), (227, -0.117359), (228, -0.115663), (229, -0.114515), (230, -0.113587), (231, -0.112944), (232, -0.110363), (233, -0.110045), (234, -0.11009), (235, -0.110439), (236, -0.110336), (237, -0.110145), (238, -0.109789), (239, -0.110163), (240, -0.110368), (241, -0.110246), (242, -0.110857), (243, -0.110295), (244, -0.109649), (245, -0.108906), (246, -0.107782), (247, -0.107452), (248, -0.107152), (249, -0.10744), (250, -0.109514), (251, -0.110772), (252, -0.112183), (253, -0.113506), (254, -0.115346), (255, -0.116863), (256, -0.118343), (257, -0.119957), (258, -0.121212), (259, -0.122436), (260, -0.123247), (261, -0.124118), (262, -0.125408), (263, -0.12686), (264, -0.128373), (265, -0.130792), (266, -0.133386), (267, -0.136587), (268, -0.139846), (269, -0.143595), (270, -0.147358), (271, -0.151311), (272, -0.155256), (273, -0.159262), (274, -0.163241), (275, -0.16704), (276, -0.170381), (277, -0.173967), (278, -0.177144), (279, -0.180136), (280, -0.18366), (281, -0.187114), (282, -0.189819), (283, -0.192913), (284, -0.196269), (285, -0.199092), (286, -0.20194), (287, -0.204316), (288, -0.206427), (289, -0.208144), (290, -0.20973), (291, -0.210905), (292, -0.211834), (293, -0.212207), (294, -0.212258), (295, -0.211738), (296, -0.210305), (297, -0.208905), (298, -0.206793), (299, -0.204761), (300, -0.202104), (301, -0.20033), (302, -0.198433), (303, -0.19656), (304, -0.19521), (305, -0.193731), (306, -0.192116), (307, -0.191094), (308, -0.189667), (309, -0.188694), (310, -0.187659), (311, -0.187136), (312, -0.187384), (313, -0.187039), (314, -0.186758), (315, -0.186211), (316, -0.185278), (317, -0.184071), (318, -0.182512), (319, -0.180876), (320, -0.178721), (321, -0.17614), (322, -0.17331), (323, -0.169836), (324, -0.166006), (325, -0.161974), (326, -0.158272), (327, -0.154256), (328, -0.150254), (329, -0.1458), (330, -0.141954), (331, -0.137997), (332, -0.133824), (333, -0.130198), (334, -0.126365), (335, -0.122831), (336, -0.119385), (337, -0.115853), (338, -0.111928), (339, -0.107446), (340, -0.102448), (341, -0.0978), (342, -0.09295), (343, -0.087904), (344, -0.083108), (345, -0.078258), (346, -0.073493), (347, -0.06892), (348, -0.064349), (349, -0.05975), (350, -0.054994), (351, -0.050122), (352, -0.045588), (353, -0.040696), (354, -0.036441), (355, -0.032603), (356, -0.029037), (357, -0.025576), (358, -0.022211), (359, -0.019184), (360, -0.016366), (361, -0.013428), (362, -0.010252), (363, -0.007528), (364, -0.00473), (365, -0.002014), (366, 0.000315), (367, 0.000184), (368, 8.2e-05), (369, 9e-06), (370, -3.5e-05), (371, -5e-05)], ('rotation_euler', 0): [(0, 0.001086), (1, 0.0), (2, -0.001075), (3, -0.002893), (4, -0.005007), (5, -0.007058), (6, -0.009427), (7, -0.012662), (8, -0.015891), (9, -0.01893), (10, -0.021792), (11, -0.024398), (12, -0.026323), (13, -0.027796), (14, -0.029139), (15, -0.029992), (16, -0.030573), (17, -0.031318), (18, -0.032108), (19, -0.032828), (20, -0.033513), (21, -0.034246), (22, -0.034973), (23, -0.035479), (24, -0.036153), (25, -0.036343), (26, -0.036386), (27, -0.036306), (28, -0.035963), (29, -0.035662), (30, -0.033587), (31, -0.032713), (32, -0.031968), (33, -0.031366), (34, -0.030654), (35, -0.029818), (36, -0.028962), (37, -0.028244), (38, -0.027626), (39, -0.026832), (40, -0.026039), (41, -0.025564), (42, -0.025193), (43, -0.025012), (44, -0.024907), (45, -0.024929), (46, -0.025139), (47, -0.025234), (48, -0.025419), (49, -0.025086), (50, -0.024741), (51, -0.024573), (52, -0.024419), (53, -0.024146), (54, -0.023638), (55, -0.022881), (56, -0.023467), (57, -0.023456), (58, -0.023539), (59, -0.024264), (60, -0.025272), (61, -0.026848), (62, -0.027832), (63, -0.02885), (64, -0.029506), (65, -0.029817), (66, -0.030177), (67, -0.030456), (68, -0.030919), (69, -0.031204), (70, -0.031397), (71, -0.030731), (72, -0.030256), (73, -0.029254), (74, -0.02866), (75, -0.02838), (76, -0.028414), (77, -0.028266), (78, -0.028399), (79, -0.028477), (80, -0.029426), (81, -0.030865), (82, -0.032927), (83, -0.035659), (84, -0.038263), (85, -0.040685), (86, -0.042912), (87, -0.045534), (88, -0.048457), (89, -0.051165), (90, -0.052772), (91, -0.053632), (92, -0.053923), (93, -0.054569), (94, -0.05599), (95, -0.058112), (96, -0.059621), (97, -0.060512), (98, -0.060874), (99, -0.061443), (100, -0.06287), (101, -0.065358), (102, -0.068426), (103, -0.070848), (104, -0.072522), (105, -0.073425), (106, -0.073928), (107, -0.073808), (108, -0.073691), (109, -0.073513), (110, -0.073722), (111, -0.074326), (112, -0.075131), (113, -0.075787), (114, -0.076237), (115, -0.076211), (116, -0.076494), (117, -0.076307), (118, -0.07567), (119, -0.074385), (120, -0.072279), (121, -0.06988), (122, -0.0676), (123, -0.066283), (124, -0.065079), (125, -0.064107), (126, -0.062882), (127, -0.061842), (128, -0.060855), (129, -0.059753), (130, -0.058506), (131, -0.057747), (132, -0.057693), (133, -0.058431), (134, -0.059861), (135, -0.061441), (136, -0.063152), (137, -0.064391), (138, -0.065169), (139, -0.065444), (140, -0.066197), (141, -0.067364), (142, -0.068225), (143, -0.068858), (144, -0.068846), (145, -0.067929), (146, -0.066944), (147, -0.065526), (148, -0.063491), (149, -0.060357), (150, -0.056386), (151, -0.052839), (152, -0.050056), (153, -0.046295), (154, -0.04397), (155, -0.04272), (156, -0.042207), (157, -0.04212), (158, -0.04183), (159, -0.041446), (160, -0.039784), (161, -0.037306), (162, -0.034021), (163, -0.032342), (164, -0.031182), (165, -0.030793), (166, -0.031123), (167, -0.032741), (168, -0.035219), (169, -0.037826), (170, -0.041097), (171, -0.043726), (172, -0.048653), (173, -0.050819), (174, -0.05405), (175, -0.056913), (176, -0.059945), (177, -0.062703), (178, -0.064876), (179, -0.065331), (180, -0.063704), (181, -0.06149), (182, -0.057569), (183, -0.053609), (184, -0.048267), (185, -0.043468), (186, -0.037797), (187, -0.032504), (188, -0.026545), (189, -0.021058), (190, -0.015401), (191, -0.009841), (192, -0.005347), (193, -0.00155), (194, 0.001801), (195, 0.004395), (196, 0.00621), (197, 0.007354), (198, 0.00814), (199, 0.008931), (200, 0.010235), (201, 0.011152), (202, 0.012148), (203, 0.013456), (204, 0.014394), (205, 0.015243), (206, 0.015819), (207, 0.015704), (208, 0.0159), (209, 0.016773), (210, 0.018018), (211, 0.019382), (212, 0.02142), (213, 0.022841), (214, 0.023867), (215, 0.024802), (216, 0.02536), (217, 0.025621), (218, 0.026096), (219, 0.026649), (220, 0.026908), (221, 0.026893), (222, 0.02563), (223, 0.024392), (224, 0.023055), (225, 0.021444), (226, 0.020416), (227, 0.019701), (228, 0.018795), (229, 0.017493), (230, 0.015478), (231, 0.013001), (232, 0.00916), (233, 0.006667), (234, 0.003559), (235, 0.00077), (236, -0.002916), (237, -0.006569), (238, -0.010012), (239, -0.012298), (240, -0.013704), (241, -0.01449), (242, -0.014419), (243, -0.014738), (244, -0.014503), (245, -0.013932), (246, -0.013163), (247, -0.011508), (248, -0.009769), (249, -0.007676), (250, -0.003654), (251, -0.000727), (252, 0.002433), (253, 0.006368), (254, 0.009583), (255, 0.012641), (256, 0.015503), (257, 0.017483), (258, 0.018603), (259, 0.019125), (260, 0.019595), (261, 0.019975), (262, 0.020418), (263, 0.02077), (264, 0.020688), (265, 0.02081), (266, 0.02065), (267, 0.020614), (268, 0.020594), (269, 0.020822), (270, 0.02107), (271, 0.021398), (272, 0.02187), (273, 0.022601), (274, 0.023021), (275, 0.023498), (276, 0.023926), (277, 0.024554), (278, 0.024781), (279, 0.024748), (280, 0.025043), (281, 0.025149), (282, 0.024166), (283, 0.022816), (284, 0.021519), (285, 0.020202), (286, 0.019125), (287, 0.018546), (288, 0.018424), (289, 0.018537), (290, 0.019428), (291, 0.020581), (292, 0.022054), (293, 0.023969), (294, 0.025956), (295, 0.028332), (296, 0.030599), (297, 0.033608), (298, 0.036251), (299, 0.03927), (300, 0.041868), (301, 0.044758), (302, 0.047252), (303, 0.049287), (304, 0.051103), (305, 0.05248), (306, 0.053618), (307, 0.054623), (308, 0.054992), (309, 0.05519), (310, 0.055016), (311, 0.054779), (312, 0.054723), (313, 0.05434), (314, 0.054233), (315, 0.054002), (316, 0.053884), (317, 0.05404), (318, 0.054743), (319, 0.056103), (320, 0.057225), (321, 0.058374), (322, 0.059843), (323, 0.061357), (324, 0.062897), (325, 0.064387), (326, 0.066171), (327, 0.067794), (328, 0.069347), (329, 0.07042), (330, 0.071688), (331, 0.072799), (332, 0.073512), (333, 0.074321), (334, 0.074667), (335, 0.075076), (336, 0.075097), (337, 0.074379), (338, 0.072307), (339, 0.069235), (340, 0.065542), (341, 0.061621), (342, 0.057004), (343, 0.052409), (344, 0.047912), (345, 0.043313), (346, 0.038645), (347, 0.033709), (348, 0.028855), (349, 0.023874), (350, 0.019085), (351, 0.014703), (352, 0.010764), (353, 0.007096), (354, 0.00427), (355, 0.002079), (356, 0.000442), (357, -0.000593), (358, -0.001208), (359, -0.001696), (360, -0.001853), (361, -0.001936), (362, -0.001995), (363, -0.00162), (364, -0.000796), (365, 6.6e-05), (366, 0.001146), (367, 0.002111), (368, 0.002769), (369, 0.003011), (370, 0.002472), (371, 0.001343)], ('rotation_euler', 1): [(0, 0.003974), (1, 0.0), (2, -0.003977), (3, -0.00722), (4, -0.008964), (5, -0.009045), (6, -0.008403), (7, -0.007829), (8, -0.008275), (9, -0.008627), (10, -0.009438), (11, -0.01114), (12, -0.013551), (13, -0.016658), (14, -0.01909), (15, -0.020987), (16, -0.02207), (17, -0.022678), (18, -0.023137), (19, -0.023632), (20, -0.024325), (21, -0.02519), (22, -0.026179), (23, -0.027386), (24, -0.028402), (25, -0.028663), (26, -0.028627), (27, -0.028333), (28, -0.028286), (29, -0.028835), (30, -0.032944), (31, -0.040582), (32, -0.048855), (33, -0.053458), (34, -0.054497), (35, -0.052933), (36, -0.050939), (37, -0.050746), (38, -0.052877), (39, -0.056025), (40, -0.058265), (41, -0.060507), (42, -0.062998), (43, -0.064676), (44, -0.064998), (45, -0.063858), (46, -0.061508), (47, -0.058035), (48, -0.052998), (49, -0.047071), (50, -0.041628), (51, -0.037838), (52, -0.036211), (53, -0.036761), (54, -0.038916), (55, -0.040707), (56, -0.040501), (57, -0.039018), (58, -0.036626), (59, -0.035624), (60, -0.036972), (61, -0.039819), (62, -0.04272), (63, -0.044737), (64, -0.046403), (65, -0.048622), (66, -0.052722), (67, -0.059479), (68, -0.067968), (69, -0.075653), (70, -0.081199), (71, -0.082973), (72, -0.082553), (73, -0.080434), (74, -0.079328), (75, -0.079473), (76, -0.079926), (77, -0.079648), (78, -0.077481), (79, -0.074393), (80, -0.070945), (81, -0.069043), (82, -0.068363), (83, -0.068933), (84, -0.069367), (85, -0.068832), (86, -0.067953), (87, -0.067267), (88, -0.066929), (89, -0.065914), (90, -0.062494), (91, -0.056614), (92, -0.049262), (93, -0.043109), (94, -0.038237), (95, -0.035719), (96, -0.035906), (97, -0.033699), (98, -0.029602), (99, -0.024689), (100, -0.021622), (101, -0.02045), (102, -0.019376), (103, -0.016914), (104, -0.012479), (105, -0.006372), (106, 0.000582), (107, 0.007226), (108, 0.012984), (109, 0.017144), (110, 0.018786), (111, 0.016968), (112, 0.012329), (113, 0.007512), (114, 0.002983), (115, -0.001852), (116, -0.008101), (117, -0.014524), (118, -0.020403), (119, -0.02505), (120, -0.028165), (121, -0.02946), (122, -0.030364), (123, -0.031993), (124, -0.034635), (125, -0.037658), (126, -0.040131), (127, -0.04175), (128, -0.04295), (129, -0.043062), (130, -0.042368), (131, -0.041192), (132, -0.040015), (133, -0.038463), (134, -0.036938), (135, -0.035376), (136, -0.03336), (137, -0.030784), (138, -0.027667), (139, -0.024056), (140, -0.02033), (141, -0.018345), (142, -0.017511), (143, -0.01746), (144, -0.017808), (145, -0.019519), (146, -0.022173), (147, -0.025994), (148, -0.02939), (149, -0.032826), (150, -0.035196), (151, -0.036815), (152, -0.036172), (153, -0.032926), (154, -0.028304), (155, -0.024521), (156, -0.023207), (157, -0.024018), (158, -0.026394), (159, -0.028435), (160, -0.029374), (161, -0.028092), (162, -0.025278), (163, -0.019267), (164, -0.015332), (165, -0.014126), (166, -0.015348), (167, -0.018103), (168, -0.021749), (169, -0.025655), (170, -0.028874), (171, -0.031233), (172, -0.033322), (173, -0.032691), (174, -0.031771), (175, -0.031426), (176, -0.031582), (177, -0.031605), (178, -0.03223), (179, -0.030734), (180, -0.027872), (181, -0.021902), (182, -0.014302), (183, -0.007905), (184, -0.004239), (185, -0.003209), (186, -0.004545), (187, -0.00757), (188, -0.010539), (189, -0.012153), (190, -0.012112), (191, -0.012609), (192, -0.012703), (193, -0.013661), (194, -0.014471), (195, -0.015746), (196, -0.016878), (197, -0.017861), (198, -0.019256), (199, -0.020947), (200, -0.022905), (201, -0.023818), (202, -0.023527), (203, -0.022682), (204, -0.022295), (205, -0.023189), (206, -0.025093), (207, -0.028538), (208, -0.032794), (209, -0.035413), (210, -0.035918), (211, -0.034784), (212, -0.03299), (213, -0.030118), (214, -0.027483), (215, -0.026422), (216, -0.02624), (217, -0.025844), (218, -0.025411), (219, -0.023271), (220, -0.019516), (221, -0.016511), (222, -0.01594), (223, -0.018263), (224, -0.021677), (225, -0.02298), (226, -0.022645), (227, -0.020629), (228, -0.017487), (229, -0.014473), (230, -0.013304), (231, -0.014336), (232, -0.016389), (233, -0.019648), (234, -0.019942), (235, -0.021374), (236, -0.021351), (237, -0.021637), (238, -0.021923), (239, -0.021815), (240, -0.020933), (241, -0.019093), (242, -0.017787), (243, -0.016034), (244, -0.01487), (245, -0.012333), (246, -0.008603), (247, -0.004503), (248, -0.000602), (249, 0.004263), (250, 0.00578), (251, 0.008402), (252, 0.008916), (253, 0.008101), (254, 0.0068), (255, 0.005466), (256, 0.003896), (257, 0.002803), (258, 0.001754), (259, 0.001686), (260, 0.002701), (261, 0.005275), (262, 0.008907), (263, 0.012497), (264, 0.015998), (265, 0.018512), (266, 0.019808), (267, 0.020456), (268, 0.020742), (269, 0.021428), (270, 0.022434), (271, 0.023644), (272, 0.024451), (273, 0.02516), (274, 0.027097), (275, 0.028896), (276, 0.030521), (277, 0.031703), (278, 0.033125), (279, 0.034409), (280, 0.03581), (281, 0.037528), (282, 0.039763), (283, 0.042934), (284, 0.046437), (285, 0.049342), (286, 0.052247), (287, 0.054682), (288, 0.057164), (289, 0.058466), (290, 0.058981), (291, 0.05923), (292, 0.059011), (293, 0.058658), (294, 0.057934), (295, 0.057983), (296, 0.058201), (297, 0.058181), (298, 0.058142), (299, 0.058037), (300, 0.057791), (301, 0.058478), (302, 0.058999), (303, 0.059068), (304, 0.058646), (305, 0.057929), (306, 0.056228), (307, 0.054834), (308, 0.053212), (309, 0.052425), (310, 0.052798), (311, 0.053474), (312, 0.05337), (313, 0.052506), (314, 0.051452), (315, 0.050438), (316, 0.049723), (317, 0.049562), (318, 0.050323), (319, 0.051117), (320, 0.051378), (321, 0.050384), (322, 0.04769), (323, 0.044514), (324, 0.042037), (325, 0.041369), (326, 0.041725), (327, 0.04251), (328, 0.042874), (329, 0.042948), (330, 0.042956), (331, 0.042349), (332, 0.041982), (333, 0.041989), (334, 0.041923), (335, 0.041761), (336, 0.041665), (337, 0.041515), (338, 0.041077), (339, 0.040674), (340, 0.041114), (341, 0.042825), (342, 0.044905), (343, 0.047497), (344, 0.050514), (345, 0.053109), (346, 0.054643), (347, 0.05536), (348, 0.053552), (349, 0.051937), (350, 0.049722), (351, 0.048173), (352, 0.047073), (353, 0.046612), (354, 0.046428), (355, 0.046024), (356, 0.0453), (357, 0.043945), (358, 0.041837), (359, 0.0385), (360, 0.033004), (361, 0.027603), (362, 0.022353), (363, 0.01736), (364, 0.012614), (365, 0.009967), (366, 0.008739), (367, 0.008371), (368, 0.008307), (369, 0.007987), (370, 0.006853), (371, 0.004347)], ('rotation_euler', 2): [(0, 0.002614), (1, 0.0), (2, -0.00261), (3, -0.005844), (4, -0.009775), (5, -0.014285), (6, -0.018739), (7, -0.022587), (8, -0.02595), (9, -0.028716), (10, -0.030574), (11, -0.031568), (12, -0.031884), (13, -0.031717), (14, -0.031828), (15, -0.03226), (16, -0.032908), (17, -0.033682), (18, -0.034255), (19, -0.034364), (20, -0.033897), (21, -0.033321), (22, -0.032742), (23, -0.032786), (24, -0.033767), (25, -0.035752), (26, -0.038203), (27, -0.04112), (28, -0.043772), (29, -0.045103), (30, -0.045076), (31, -0.043076), (32, -0.041471), (33, -0.041444), (34, -0.043229), (35, -0.045818), (36, -0.04811), (37, -0.049071), (38, -0.048867), (39, -0.048418), (40, -0.048354), (41, -0.047722), (42, -0.046893), (43, -0.046211), (44, -0.046504), (45, -0.047082), (46, -0.047827), (47, -0.049216), (48, -0.051212), (49, -0.053287), (50, -0.054382), (51, -0.053787), (52, -0.051505), (53, -0.048278), (54, -0.044466), (55, -0.041005), (56, -0.037964), (57, -0.035209), (58, -0.032383), (59, -0.028813), (60, -0.023724), (61, -0.018374), (62, -0.013363), (63, -0.009382), (64, -0.006449), (65, -0.003766), (66, -0.001055), (67, 0.002125), (68, 0.004889), (69, 0.006224), (70, 0.005088), (71, 0.001145), (72, -0.004701), (73, -0.010587), (74, -0.01536), (75, -0.018105), (76, -0.019683), (77, -0.02116), (78, -0.022418), (79, -0.023049), (80, -0.023169), (81, -0.021489), (82, -0.01898), (83, -0.016396), (84, -0.01492), (85, -0.014333), (86, -0.015129), (87, -0.015968), (88, -0.016782), (89, -0.020312), (90, -0.024352), (91, -0.029823), (92, -0.03619), (93, -0.03749), (94, -0.037978), (95, -0.035587), (96, -0.032968), (97, -0.032879), (98, -0.032648), (99, -0.031323), (100, -0.028278), (101, -0.024997), (102, -0.022489), (103, -0.021623), (104, -0.021607), (105, -0.025022), (106, -0.025687), (107, -0.028648), (108, -0.027502), (109, -0.026216), (110, -0.021487), (111, -0.0171), (112, -0.01265), (113, -0.008202), (114, -0.004824), (115, -0.000335), (116, 0.003535), (117, 0.005654), (118, 0.006348), (119, 0.005306), (120, 0.00274), (121, 0.000436), (122, -0.000789), (123, -0.000738), (124, -0.000349), (125, -0.000163), (126, 0.000151), (127, 0.000542), (128, 0.000137), (129, 0.000187), (130, 0.0005), (131, 0.000391), (132, 7.7e-05), (133, 0.000334), (134, -0.000162), (135, -0.001378), (136, -0.002516), (137, -0.004847), (138, -0.006363), (139, -0.00689), (140, -0.006928), (141, -0.006853), (142, -0.006412), (143, -0.006241), (144, -0.005501), (145, -0.005166), (146, -0.005828), (147, -0.00623), (148, -0.004952), (149, -0.005582), (150, -0.007581), (151, -0.009452), (152, -0.009866), (153, -0.008837), (154, -0.005714), (155, -0.003098), (156, -0.00068), (157, -0.000376), (158, -0.002076), (159, -0.006113), (160, -0.009858), (161, -0.011482), (162, -0.011793), (163, -0.008935), (164, -0.006983), (165, -0.003877), (166, 0.000329), (167, 0.00417), (168, 0.005009), (169, 0.005429), (170, 0.004583), (171, 0.003898), (172, 0.004157), (173, 0.004281), (174, 0.003913), (175, 0.004667), (176, 0.003317), (177, -0.001183), (178, -0.004468), (179, -0.007529), (180, -0.008358), (181, -0.006864), (182, -0.004442), (183, -0.000856), (184, 0.002222), (185, 0.005748), (186, 0.005423), (187, 0.00546), (188, 0.006131), (189, 0.005557), (190, 0.005034), (191, 0.00527), (192, 0.004241), (193, 0.002756), (194, 0.00178), (195, 0.00021), (196, -0.001423), (197, -0.00434), (198, -0.008189), (199, -0.012573), (200, -0.015882), (201, -0.01769), (202, -0.01862), (203, -0.01904), (204, -0.019492), (205, -0.021913), (206, -0.02483), (207, -0.032918), (208, -0.037796), (209, -0.041964), (210, -0.045257), (211, -0.047401), (212, -0.048562), (213, -0.049785), (214, -0.05175), (215, -0.053911), (216, -0.054141), (217, -0.052474), (218, -0.050028), (219, -0.043466), (220, -0.042649), (221, -0.04206), (222, -0.04124), (223, -0.041724), (224, -0.041054), (225, -0.04029), (226, -0.037936), (227, -0.033482), (228, -0.028248), (229, -0.026261), (230, -0.023971), (231, -0.019111), (232, -0.017008), (233, -0.014843), (234, -0.013217), (235, -0.010291), (236, -0.009998), (237, -0.009597), (238, -0.009703), (239, -0.010447), (240, -0.009854), (241, -0.010463), (242, -0.011648), (243, -0.013348), (244, -0.01552), (245, -0.02022), (246, -0.024964), (247, -0.026832), (248, -0.028396), (249, -0.029228), (250, -0.028957), (251, -0.028805), (252, -0.028471), (253, -0.029082), (254, -0.029853), (255, -0.03029), (256, -0.031372), (257, -0.033898), (258, -0.036345), (259, -0.039018), (260, -0.040805), (261, -0.041634), (262, -0.041045), (263, -0.03964), (264, -0.036235), (265, -0.033247), (266, -0.0317), (267, -0.029994), (268, -0.026625), (269, -0.022728), (270, -0.020348), (271, -0.018194), (272, -0.016942), (273, -0.013506), (274, -0.009444), (275, -0.005348), (276, 0.000438), (277, 0.007067), (278, 0.009902), (279, 0.012304), (280, 0.017559), (281, 0.02145), (282, 0.024483), (283, 0.027045), (284, 0.029047), (285, 0.030092), (286, 0.031107), (287, 0.032971), (288, 0.035094), (289, 0.037186), (290, 0.038977), (291, 0.040729), (292, 0.041858), (293, 0.043408), (294, 0.044431), (295, 0.044958), (296, 0.044863), (297, 0.044104), (298, 0.043476), (299, 0.041361), (300, 0.039561), (301, 0.037406), (302, 0.034351), (303, 0.031576), (304, 0.028215), (305, 0.024555), (306, 0.02281), (307, 0.022044), (308, 0.019471), (309, 0.016815), (310, 0.012537), (311, 0.009645), (312, 0.007258), (313, 0.004587), (314, 0.0036), (315, 0.002977), (316, 0.001492), (317, 0.000242), (318, -0.001215), (319, -0.001601), (320, -0.000822), (321, 0.000892), (322, 0.004196), (323, 0.005635), (324, 0.005798), (325, 0.005928), (326, 0.00563), (327, 0.005343), (328, 0.005499), (329, 0.006249), (330, 0.007014), (331, 0.007774), (332, 0.008607), (333, 0.009505), (334, 0.010459), (335, 0.011506), (336, 0.012603), (337, 0.014379), (338, 0.015595), (339, 0.017891), (340, 0.018344), (341, 0.018409), (342, 0.01691), (343, 0.01498), (344, 0.013412), (345, 0.011253), (346, 0.010795), (347, 0.01126), (348, 0.013259), (349, 0.014816), (350, 0.015967), (351, 0.017171), (352, 0.018114), (353, 0.018118), (354, 0.017265), (355, 0.015835), (356, 0.013062), (357, 0.012092), (358, 0.011636), (359, 0.011609), (360, 0.011972), (361, 0.011968), (362, 0.011678), (363, 0.00992), (364, 0.008247), (365, 0.006687), (366, 0.00489), (367, 0.00446), (368, 0.00404), (369, 0.003572), (370, 0.003114), (371, 0.002647)]}), 'THE_CLOSEUP': ('The Closeup', 24.0, {('location', 0): [(-1, -0.000227), (0, -0.000299), (1, -0.000469), (2, -0.00066), (3, -0.000943), (4, -0.001298), (5, -0.001576), (6, -0.001864), (7, -0.002182), (8, -0.002463), (9, -0.002803), (10, -0.003173), (11, -0.003526), (12, -0.003903), (13, -0.004212), (14, -0.004474), (15, -0.004739), (16, -0.004931), (17, -0.005085), (18, -0.005182), (19, -0.005165), (20, -0.0051), (21, -0.004992), (22, -0.004857), (23, -0.004703), (24, -0.0045), (25, -0.004335), (26, -0.004187), (27, -0.004048), (28, -0.004012), (29, -0.003932), (30, -0.003799), (31, -0.003699), (32, -0.003519), (33, -0.003366), (34, -0.0033), (35, -0.003184), (36, -0.00305), (37, -0.002934), (38, -0.002782), (39, -0.002635), (40, -0.002504), (41, -0.002351), (42, -0.002221), (43, -0.002134), (44, -0.002026), (45, -0.002007), (46, -0.002064), (47, -0.002041), (48, -0.002013), (49, -0.001991), (50, -0.001909), (51, -0.001789), (52, -0.001695), (53, -0.001619), (54, -0.001486), (55, -0.00138), (56, -0.00131), (57, -0.001181), (58, -0.001039), (59, -0.000912), (60, -0.000796), (61, -0.000711), (62, -0.000694), (63, -0.000705), (64, -0.000724), (65, -0.000732), (66, -0.000695), (67, -0.000704), (68, -0.00076), (69, -0.000841), (70, -0.001008), (71, -0.001213), (72, -0.001428), (73, -0.001683), (74, -0.001994), (75, -0.002324), (76, -0.002667), (77, -0.003075), (78, -0.003516), (79, -0.003967), (80, -0.004411), (81, -0.004842), (82, -0.005177), (83, -0.0054), (84, -0.005557), (85, -0.005637), (86, -0.005717), (87, -0.005744), (88, -0.005705), (89, -0.005685), (90, -0.005657), (91, -0.005631), (92, -0.005621), (93, -0.005628), (94, -0.005617), (95, -0.00555), (96, -0.005452), (97, -0.005342), (98, -0.005212), (99, -0.005017), (100, -0.004791), (101, -0.004532), (102, -0.004241), (103, -0.003962), (104, -0.003683), (105, -0.003368), (106, -0.003032), (107, -0.002732), (108, -0.002403), (109, -0.002096), (110, -0.001815), (111, -0.001534), (112, -0.001294), (113, -0.001045), (114, -0.000836), (115, -0.000689), (116, -0.000573), (117, -0.000442), (118, -0.000313), (119, -0.0002), (120, -4.9e-05), (121, 9.2e-05), (122, 0.000213), (123, 0.000393), (124, 0.000601), (125, 0.000796), (126, 0.001073), (127, 0.001306), (128, 0.001432), (129, 0.00156), (130, 0.001602), (131, 0.001605), (132, 0.001539), (133, 0.001379), (134, 0.001242), (135, 0.00106), (136, 0.000869), (137, 0.000737), (138, 0.000632), (139, 0.000527), (140, 0.000409), (141, 0.00031), (142, 0.000203), (143, 9.3e-05), (144, -5.4e-05), (145, -0.000234), (146, -0.000393), (147, -0.00057), (148, -0.000745), (149, -0.000905), (150, -0.001067), (151, -0.001249), (152, -0.001478), (153, -0.001721), (154, -0.001959), (155, -0.002184), (156, -0.002432), (157, -0.002698), (158, -0.002946), (159, -0.003205), (160, -0.003415), (161, -0.003482), (162, -0.003484), (163, -0.003441), (164, -0.003344), (165, -0.003292), (166, -0.003274), (167, -0.003313), (168, -0.003327), (169, -0.003309), (170, -0.003321), (171, -0.003221), (172, -0.003095), (173, -0.002986), (174, -0.002817), (175, -0.00264), (176, -0.002456), (177, -0.002259), (178, -0.00214), (179, -0.002094), (180, -0.002056), (181, -0.002101), (182, -0.002123), (183, -0.002058), (184, -0.001968), (185, -0.001858), (186, -0.001705), (187, -0.001538), (188, -0.001416), (189, -0.001329), (190, -0.001296), (191, -0.001312), (192, -0.001383), (193, -0.001488), (194, -0.001567), (195, -0.001644), (196, -0.00172), (197, -0.001787), (198, -0.001857), (199, -0.001929), (200, -0.002017), (201, -0.002106), (202, -0.002195), (203, -0.002314), (204, -0.002449), (205, -0.002589), (206, -0.002717), (207, -0.002862), (208, -0.003006), (209, -0.003087), (210, -0.003189), (211, -0.003283), (212, -0.00329), (213, -0.003307), (214, -0.003342), (215, -0.003349), (216, -0.003343), (217, -0.003316), (218, -0.003255), (219, -0.003107), (220, -0.002932), (221, -0.002756), (222, -0.002493), (223, -0.002275), (224, -0.002079), (225, -0.001829), (226, -0.001647), (227, -0.001473), (228, -0.001311), (229, -0.001218), (230, -0.001126), (231, -0.001074), (232, -0.00109), (233, -0.0011), (234, -0.00115), (235, -0.001242), (236, -0.001275), (237, -0.001265), (238, -0.001197), (239, -0.001043), (240, -0.000925), (241, -0.000817), (242, -0.000665), (243, -0.000596), (244, -0.000554), (245, -0.000518), (246, -0.000549), (247, -0.000606), (248, -0.00067), (249, -0.000719), (250, -0.000758), (251, -0.000783), (252, -0.000828), (253, -0.000921), (254, -0.00099), (255, -0.001046), (256, -0.001138), (257, -0.00117), (258, -0.001182), (259, -0.00125), (260, -0.001294), (261, -0.001369), (262, -0.001466), (263, -0.001541), (264, -0.001652), (265, -0.001752), (266, -0.001834), (267, -0.001941), (268, -0.001998), (269, -0.001996), (270, -0.002005), (271, -0.002013), (272, -0.002005), (273, -0.002032), (274, -0.002075), (275, -0.002058), (276, -0.002086), (277, -0.002135), (278, -0.002145), (279, -0.002226), (280, -0.002306), (281, -0.00235), (282, -0.002354), (283, -0.002286), (284, -0.002191), (285, -0.002028), (286, -0.001854), (287, -0.001731), (288, -0.001603), (289, -0.001532), (290, -0.001542), (291, -0.001534), (292, -0.001482), (293, -0.001433), (294, -0.001327), (295, -0.001177), (296, -0.001092), (297, -0.001002), (298, -0.000907), (299, -0.000847), (300, -0.000791), (301, -0.000758), (302, -0.000752), (303, -0.000782), (304, -0.000811), (305, -0.00081), (306, -0.000766), (307, -0.00073), (308, -0.000704), (309, -0.000629), (310, -0.000541), (311, -0.000414), (312, -0.00025), (313, -0.000145), (314, -9.7e-05), (315, -9.8e-05), (316, -0.000184), (317, -0.000261), (318, -0.000332), (319, -0.00048), (320, -0.000659), (321, -0.000899), (322, -0.001227), (323, -0.001541), (324, -0.001851), (325, -0.002171), (326, -0.002467), (327, -0.002789), (328, -0.003075), (329, -0.003301), (330, -0.003512), (331, -0.003636), (332, -0.003707), (333, -0.003818), (334, -0.003917), (335, -0.00397), (336, -0.004069), (337, -0.004159), (338, -0.004201), (339, -0.004276), (340, -0.004348), (341, -0.004353), (342, -0.004341), (343, -0.004347), (344, -0.004344), (345, -0.004414), (346, -0.004517), (347, -0.004603), (348, -0.004706), (349, -0.004775), (350, -0.004812), (351, -0.004876), (352, -0.004937), (353, -0.004966), (354, -0.005044), (355, -0.005151), (356, -0.005239), (357, -0.005377), (358, -0.005522), (359, -0.005626), (360, -0.005735), (361, -0.005826), (362, -0.005872), (363, -0.005949), (364, -0.006042), (365, -0.006057), (366, -0.006047), (367, -0.006032), (368, -0.006009), (369, -0.006002), (370, -0.006024), (371, -0.006066), (372, -0.006076), (373, -0.006057), (374, -0.006003), (375, -0.005898), (376, -0.005795), (377, -0.005699), (378, -0.005544), (379, -0.005376), (380, -0.005231), (381, -0.004997), (382, -0.004755), (383, -0.004579), (384, -0.004313), (385, -0.003986), (386, -0.00367), (387, -0.003291), (388, -0.002927), (389, -0.00266), (390, -0.002413), (391, -0.002189), (392, -0.001987), (393, -0.00177), (394, -0.001574), (395, -0.001397), (396, -0.001256), (397, -0.001104), (398, -0.000913), (399, -0.000753), (400, -0.000585), (401, -0.000396), (402, -0.000208), (403, -4.6e-05), (404, 8.7e-05), (405, 0.000233), (406, 0.000339), (407, 0.000404), (408, 0.000481), (409, 0.000478), (410, 0.000419), (411, 0.000336), (412, 0.000177), (413, 3.7e-05), (414, -8.1e-05), (415, -0.000164), (416, -0.000122), (417, -3.9e-05), (418, 1.3e-05), (419, 8.1e-05), (420, 0.000107), (421, 0.0001), (422, 0.000124), (423, 0.000174), (424, 0.000213), (425, 0.000172), (426, 9.7e-05), (427, -3.7e-05), (428, -0.000191), (429, -0.000207), (430, -0.000175), (431, -0.00016), (432, -8.3e-05), (433, -6.1e-05), (434, -0.000135), (435, -0.000178), (436, -0.000213), (437, -0.000244)], ('location', 1): [(-1, 0.000344), (0, 0.000318), (1, 0.000238), (2, 0.000141), (3, 7.3e-05), (4, 4.1e-05), (5, 8.1e-05), (6, 0.000217), (7, 0.000393), (8, 0.000544), (9, 0.000654), (10, 0.000707), (11, 0.000708), (12, 0.00066), (13, 0.000555), (14, 0.000414), (15, 0.000242), (16, 5.2e-05), (17, -0.000145), (18, -0.000354), (19, -0.00053), (20, -0.000662), (21, -0.000797), (22, -0.000932), (23, -0.001097), (24, -0.001282), (25, -0.001429), (26, -0.001561), (27, -0.001614), (28, -0.001552), (29, -0.001472), (30, -0.001334), (31, -0.001138), (32, -0.000921), (33, -0.000699), (34, -0.000514), (35, -0.000377), (36, -0.00034), (37, -0.000352), (38, -0.000356), (39, -0.000345), (40, -0.000317), (41, -0.000263), (42, -0.000162), (43, -5.3e-05), (44, 7.4e-05), (45, 0.000279), (46, 0.000525), (47, 0.00075), (48, 0.00094), (49, 0.001056), (50, 0.001087), (51, 0.001033), (52, 0.000936), (53, 0.000815), (54, 0.000668), (55, 0.000555), (56, 0.000496), (57, 0.000495), (58, 0.000519), (59, 0.000601), (60, 0.000731), (61, 0.000795), (62, 0.000855), (63, 0.000929), (64, 0.000928), (65, 0.000888), (66, 0.000846), (67, 0.000812), (68, 0.000772), (69, 0.000726), (70, 0.000703), (71, 0.000693), (72, 0.000659), (73, 0.00061), (74, 0.000579), (75, 0.000553), (76, 0.000556), (77, 0.000606), (78, 0.000699), (79, 0.000818), (80, 0.000942), (81, 0.001077), (82, 0.001208), (83, 0.001319), (84, 0.001436), (85, 0.001521), (86, 0.001531), (87, 0.001494), (88, 0.001429), (89, 0.001384), (90, 0.001359), (91, 0.001344), (92, 0.001346), (93, 0.001351), (94, 0.001339), (95, 0.001289), (96, 0.00127), (97, 0.001268), (98, 0.001211), (99, 0.001199), (100, 0.001199), (101, 0.001105), (102, 0.001032), (103, 0.000966), (104, 0.000812), (105, 0.000667), (106, 0.000564), (107, 0.000425), (108, 0.000293), (109, 0.000198), (110, 0.000111), (111, 8.1e-05), (112, 0.000116), (113, 0.000171), (114, 0.000247), (115, 0.000352), (116, 0.000444), (117, 0.000509), (118, 0.000553), (119, 0.000553), (120, 0.000513), (121, 0.000446), (122, 0.00035), (123, 0.000267), (124, 0.000176), (125, 7.3e-05), (126, -4e-06), (127, -0.000105), (128, -0.000199), (129, -0.000248), (130, -0.000232), (131, -0.000134), (132, 1.9e-05), (133, 0.000241), (134, 0.00048), (135, 0.000684), (136, 0.000882), (137, 0.001038), (138, 0.001114), (139, 0.001128), (140, 0.001078), (141, 0.000932), (142, 0.000756), (143, 0.00063), (144, 0.000523), (145, 0.000453), (146, 0.000465), (147, 0.000475), (148, 0.000469), (149, 0.00051), (150, 0.000539), (151, 0.000591), (152, 0.000729), (153, 0.000886), (154, 0.00105), (155, 0.001252), (156, 0.001435), (157, 0.001603), (158, 0.001792), (159, 0.001943), (160, 0.002056), (161, 0.002146), (162, 0.002207), (163, 0.002274), (164, 0.002377), (165, 0.002531), (166, 0.002723), (167, 0.002969), (168, 0.003181), (169, 0.0033), (170, 0.003389), (171, 0.003397), (172, 0.003372), (173, 0.003355), (174, 0.003339), (175, 0.003316), (176, 0.003243), (177, 0.003175), (178, 0.003114), (179, 0.003021), (180, 0.002969), (181, 0.00293), (182, 0.002852), (183, 0.002823), (184, 0.002792), (185, 0.002729), (186, 0.002711), (187, 0.002686), (188, 0.002677), (189, 0.002751), (190, 0.002818), (191, 0.00288), (192, 0.002989), (193, 0.003059), (194, 0.0031), (195, 0.003129), (196, 0.003093), (197, 0.002986), (198, 0.002783), (199, 0.002514), (200, 0.002244), (201, 0.001967), (202, 0.001681), (203, 0.001415), (204, 0.001173), (205, 0.000967), (206, 0.000838), (207, 0.000835), (208, 0.000932), (209, 0.001068), (210, 0.001196), (211, 0.001259), (212, 0.001274), (213, 0.00124), (214, 0.001157), (215, 0.001063), (216, 0.000961), (217, 0.000877), (218, 0.000795), (219, 0.000751), (220, 0.000778), (221, 0.000804), (222, 0.000831), (223, 0.000871), (224, 0.000886), (225, 0.000877), (226, 0.000885), (227, 0.000926), (228, 0.000986), (229, 0.001058), (230, 0.0011), (231, 0.001133), (232, 0.001173), (233, 0.00119), (234, 0.001247), (235, 0.00133), (236, 0.001396), (237, 0.00149), (238, 0.001586), (239, 0.001647), (240, 0.00169), (241, 0.001686), (242, 0.001615), (243, 0.001512), (244, 0.001413), (245, 0.001325), (246, 0.001256), (247, 0.001229), (248, 0.001219), (249, 0.001224), (250, 0.00121), (251, 0.00117), (252, 0.001127), (253, 0.001066), (254, 0.001006), (255, 0.000971), (256, 0.000975), (257, 0.000982), (258, 0.001017), (259, 0.00109), (260, 0.001145), (261, 0.001191), (262, 0.001214), (263, 0.001222), (264, 0.001222), (265, 0.001265), (266, 0.001346), (267, 0.001448), (268, 0.001551), (269, 0.00159), (270, 0.001621), (271, 0.001646), (272, 0.00165), (273, 0.001671), (274, 0.001684), (275, 0.00166), (276, 0.001603), (277, 0.001515), (278, 0.001423), (279, 0.001325), (280, 0.001216), (281, 0.001117), (282, 0.001013), (283, 0.000948), (284, 0.000927), (285, 0.000894), (286, 0.00088), (287, 0.000876), (288, 0.000788), (289, 0.000698), (290, 0.000661), (291, 0.000563), (292, 0.000433), (293, 0.000309), (294, 0.00017), (295, 1.3e-05), (296, -0.000151), (297, -0.00029), (298, -0.0004), (299, -0.00049), (300, -0.000557), (301, -0.000592), (302, -0.000582), (303, -0.000571), (304, -0.000585), (305, -0.000603), (306, -0.000639), (307, -0.000692), (308, -0.000732), (309, -0.000758), (310, -0.000811), (311, -0.00088), (312, -0.000971), (313, -0.001109), (314, -0.001265), (315, -0.001444), (316, -0.001654), (317, -0.001876), (318, -0.002057), (319, -0.002173), (320, -0.002215), (321, -0.002171), (322, -0.002075), (323, -0.001944), (324, -0.001769), (325, -0.001557), (326, -0.001333), (327, -0.001104), (328, -0.000892), (329, -0.000707), (330, -0.000494), (331, -0.000275), (332, -7e-05), (333, 0.00015), (334, 0.000335), (335, 0.000473), (336, 0.000605), (337, 0.000728), (338, 0.000823), (339, 0.000909), (340, 0.000991), (341, 0.001072), (342, 0.001141), (343, 0.001202), (344, 0.001307), (345, 0.001394), (346, 0.001439), (347, 0.001486), (348, 0.001495), (349, 0.001506), (350, 0.001542), (351, 0.001563), (352, 0.001574), (353, 0.001555), (354, 0.001471), (355, 0.001355), (356, 0.001249), (357, 0.001185), (358, 0.001178), (359, 0.001205), (360, 0.00124), (361, 0.001234), (362, 0.001196), (363, 0.001127), (364, 0.00099), (365, 0.000838), (366, 0.000667), (367, 0.00048), (368, 0.000298), (369, 9.7e-05), (370, -6.3e-05), (371, -0.000193), (372, -0.000321), (373, -0.000408), (374, -0.000454), (375, -0.00046), (376, -0.000469), (377, -0.000486), (378, -0.000481), (379, -0.000463), (380, -0.000435), (381, -0.000384), (382, -0.000288), (383, -0.000186), (384, -0.000105), (385, -6.2e-05), (386, -4.9e-05), (387, -4.4e-05), (388, -6.6e-05), (389, -0.000121), (390, -0.000168), (391, -0.000189), (392, -0.000204), (393, -0.000174), (394, -8.9e-05), (395, 3.1e-05), (396, 0.000171), (397, 0.000281), (398, 0.000356), (399, 0.000404), (400, 0.000375), (401, 0.00028), (402, 0.000168), (403, 3.2e-05), (404, -0.000106), (405, -0.000232), (406, -0.000316), (407, -0.000373), (408, -0.000384), (409, -0.0003), (410, -0.000193), (411, -8.5e-05), (412, 2.7e-05), (413, 0.000116), (414, 0.000125), (415, 9.3e-05), (416, 9.4e-05), (417, 0.000147), (418, 0.000286), (419, 0.000448), (420, 0.000553), (421, 0.000622), (422, 0.000623), (423, 0.000524), (424, 0.000465), (425, 0.00055), (426, 0.000738), (427, 0.000845), (428, 0.000856), (429, 0.000775), (430, 0.000471), (431, 0.000125), (432, -8.9e-05), (433, -0.000127), (434, -3.5e-05), (435, 9.1e-05), (436, 0.000221), (437, 0.000311)], ('location', 2): [(-1, -0.001505), (0, -0.001483), (1, -0.001463), (2, -0.001461), (3, -0.001449), (4, -0.001455), (5, -0.001441), (6, -0.001392), (7, -0.001367), (8, -0.001359), (9, -0.001422), (10, -0.001563), (11, -0.001768), (12, -0.002026), (13, -0.002319), (14, -0.002642), (15, -0.002963), (16, -0.003252), (17, -0.003531), (18, -0.00386), (19, -0.004233), (20, -0.00468), (21, -0.005211), (22, -0.005755), (23, -0.006235), (24, -0.006659), (25, -0.00715), (26, -0.007656), (27, -0.008092), (28, -0.008461), (29, -0.008631), (30, -0.008571), (31, -0.008462), (32, -0.008431), (33, -0.00847), (34, -0.008656), (35, -0.008873), (36, -0.008926), (37, -0.008909), (38, -0.008842), (39, -0.008702), (40, -0.008511), (41, -0.008283), (42, -0.007899), (43, -0.007353), (44, -0.006827), (45, -0.006279), (46, -0.005734), (47, -0.005301), (48, -0.00487), (49, -0.004373), (50, -0.003801), (51, -0.003212), (52, -0.002701), (53, -0.00221), (54, -0.001823), (55, -0.001557), (56, -0.001298), (57, -0.00108), (58, -0.000866), (59, -0.000621), (60, -0.0004), (61, -0.000205), (62, -1.5e-05), (63, 0.000135), (64, 0.000213), (65, 0.00024), (66, 0.000224), (67, 0.000175), (68, 0.000124), (69, 3.9e-05), (70, -5.7e-05), (71, -0.000148), (72, -0.000271), (73, -0.000415), (74, -0.000563), (75, -0.000714), (76, -0.000884), (77, -0.001056), (78, -0.001192), (79, -0.001292), (80, -0.001377), (81, -0.001456), (82, -0.001557), (83, -0.00172), (84, -0.001915), (85, -0.002132), (86, -0.00236), (87, -0.00258), (88, -0.002773), (89, -0.002951), (90, -0.003187), (91, -0.003434), (92, -0.003711), (93, -0.004064), (94, -0.004433), (95, -0.004802), (96, -0.00516), (97, -0.005554), (98, -0.00598), (99, -0.006389), (100, -0.006816), (101, -0.007205), (102, -0.007516), (103, -0.007767), (104, -0.007964), (105, -0.008137), (106, -0.008279), (107, -0.008411), (108, -0.00853), (109, -0.008619), (110, -0.008712), (111, -0.008806), (112, -0.00887), (113, -0.008915), (114, -0.008936), (115, -0.008919), (116, -0.008975), (117, -0.009094), (118, -0.009194), (119, -0.009338), (120, -0.009446), (121, -0.00947), (122, -0.009469), (123, -0.009457), (124, -0.009445), (125, -0.009418), (126, -0.009319), (127, -0.00917), (128, -0.00901), (129, -0.00881), (130, -0.008601), (131, -0.008412), (132, -0.008204), (133, -0.00793), (134, -0.007626), (135, -0.007311), (136, -0.006986), (137, -0.006711), (138, -0.006479), (139, -0.006322), (140, -0.006217), (141, -0.006089), (142, -0.005991), (143, -0.005868), (144, -0.005703), (145, -0.005554), (146, -0.005402), (147, -0.005257), (148, -0.00512), (149, -0.004999), (150, -0.004893), (151, -0.004781), (152, -0.00468), (153, -0.00458), (154, -0.004468), (155, -0.004361), (156, -0.00426), (157, -0.004159), (158, -0.00407), (159, -0.003972), (160, -0.003854), (161, -0.003756), (162, -0.003619), (163, -0.003428), (164, -0.003208), (165, -0.002957), (166, -0.002704), (167, -0.002506), (168, -0.002467), (169, -0.002508), (170, -0.002569), (171, -0.002658), (172, -0.002665), (173, -0.002616), (174, -0.002544), (175, -0.002388), (176, -0.002203), (177, -0.002126), (178, -0.002154), (179, -0.002339), (180, -0.002678), (181, -0.003025), (182, -0.003324), (183, -0.003507), (184, -0.003596), (185, -0.00366), (186, -0.003727), (187, -0.003722), (188, -0.003655), (189, -0.003613), (190, -0.003525), (191, -0.003441), (192, -0.003405), (193, -0.003367), (194, -0.003334), (195, -0.00329), (196, -0.003247), (197, -0.003211), (198, -0.003175), (199, -0.003159), (200, -0.003165), (201, -0.003181), (202, -0.003203), (203, -0.003203), (204, -0.003165), (205, -0.003111), (206, -0.003042), (207, -0.002987), (208, -0.002968), (209, -0.002981), (210, -0.003017), (211, -0.003051), (212, -0.003106), (213, -0.003187), (214, -0.003271), (215, -0.003377), (216, -0.003483), (217, -0.003567), (218, -0.00364), (219, -0.003702), (220, -0.00375), (221, -0.00377), (222, -0.003782), (223, -0.003781), (224, -0.003759), (225, -0.003725), (226, -0.003685), (227, -0.003621), (228, -0.003509), (229, -0.003372), (230, -0.003196), (231, -0.00298), (232, -0.002736), (233, -0.002453), (234, -0.002147), (235, -0.001824), (236, -0.001492), (237, -0.001151), (238, -0.000816), (239, -0.000502), (240, -0.000198), (241, 8.7e-05), (242, 0.000346), (243, 0.000575), (244, 0.000763), (245, 0.000992), (246, 0.001212), (247, 0.001358), (248, 0.001494), (249, 0.001547), (250, 0.001485), (251, 0.001358), (252, 0.00119), (253, 0.001006), (254, 0.000797), (255, 0.000577), (256, 0.000368), (257, 0.00016), (258, -7e-05), (259, -0.000325), (260, -0.000589), (261, -0.000868), (262, -0.001143), (263, -0.001399), (264, -0.001645), (265, -0.001896), (266, -0.002161), (267, -0.002409), (268, -0.00263), (269, -0.002831), (270, -0.002987), (271, -0.003161), (272, -0.003364), (273, -0.003518), (274, -0.003675), (275, -0.003809), (276, -0.00389), (277, -0.00398), (278, -0.004083), (279, -0.004189), (280, -0.004283), (281, -0.004378), (282, -0.004455), (283, -0.004517), (284, -0.004592), (285, -0.00465), (286, -0.004721), (287, -0.004826), (288, -0.00493), (289, -0.005045), (290, -0.005171), (291, -0.005284), (292, -0.005327), (293, -0.005328), (294, -0.005382), (295, -0.00543), (296, -0.005466), (297, -0.005496), (298, -0.005487), (299, -0.005434), (300, -0.005322), (301, -0.0053), (302, -0.005359), (303, -0.005383), (304, -0.005381), (305, -0.005312), (306, -0.005184), (307, -0.005006), (308, -0.004839), (309, -0.004741), (310, -0.004713), (311, -0.004715), (312, -0.004794), (313, -0.004971), (314, -0.005081), (315, -0.005162), (316, -0.005196), (317, -0.005186), (318, -0.005217), (319, -0.005242), (320, -0.005286), (321, -0.00531), (322, -0.005251), (323, -0.005145), (324, -0.005034), (325, -0.004942), (326, -0.004881), (327, -0.004833), (328, -0.004791), (329, -0.004753), (330, -0.00472), (331, -0.0047), (332, -0.004611), (333, -0.004499), (334, -0.004368), (335, -0.004169), (336, -0.003981), (337, -0.00373), (338, -0.003492), (339, -0.003339), (340, -0.003145), (341, -0.002982), (342, -0.003018), (343, -0.003213), (344, -0.003417), (345, -0.003642), (346, -0.003866), (347, -0.004015), (348, -0.004055), (349, -0.004072), (350, -0.004173), (351, -0.004243), (352, -0.004263), (353, -0.004242), (354, -0.004185), (355, -0.004145), (356, -0.00398), (357, -0.003718), (358, -0.003465), (359, -0.003222), (360, -0.003047), (361, -0.002991), (362, -0.003059), (363, -0.003109), (364, -0.003112), (365, -0.003102), (366, -0.003036), (367, -0.003042), (368, -0.003186), (369, -0.003344), (370, -0.003521), (371, -0.003658), (372, -0.003648), (373, -0.003607), (374, -0.003526), (375, -0.003424), (376, -0.003403), (377, -0.003376), (378, -0.003333), (379, -0.003264), (380, -0.003183), (381, -0.003136), (382, -0.003056), (383, -0.002987), (384, -0.00297), (385, -0.002965), (386, -0.002975), (387, -0.003039), (388, -0.003132), (389, -0.003222), (390, -0.003331), (391, -0.003426), (392, -0.003514), (393, -0.003608), (394, -0.003692), (395, -0.003761), (396, -0.003805), (397, -0.003888), (398, -0.004001), (399, -0.004112), (400, -0.004287), (401, -0.004484), (402, -0.004657), (403, -0.00489), (404, -0.005136), (405, -0.005316), (406, -0.005484), (407, -0.005578), (408, -0.005588), (409, -0.005578), (410, -0.005533), (411, -0.00538), (412, -0.005125), (413, -0.004917), (414, -0.004747), (415, -0.004607), (416, -0.004576), (417, -0.004588), (418, -0.004548), (419, -0.004485), (420, -0.004422), (421, -0.004324), (422, -0.004179), (423, -0.004007), (424, -0.003818), (425, -0.003653), (426, -0.003552), (427, -0.003466), (428, -0.003283), (429, -0.002887), (430, -0.002357), (431, -0.001897), (432, -0.001588), (433, -0.001431), (434, -0.001459), (435, -0.001586), (436, -0.001599), (437, -0.001535)], ('rotation_euler', 0): [(-1, -0.008522), (0, -0.008502), (1, -0.008508), (2, -0.008622), (3, -0.00882), (4, -0.009033), (5, -0.009214), (6, -0.009365), (7, -0.009449), (8, -0.009435), (9, -0.009407), (10, -0.009386), (11, -0.009299), (12, -0.009143), (13, -0.009032), (14, -0.008958), (15, -0.00884), (16, -0.008731), (17, -0.008615), (18, -0.008453), (19, -0.008391), (20, -0.008379), (21, -0.008302), (22, -0.008168), (23, -0.007968), (24, -0.007806), (25, -0.007705), (26, -0.007637), (27, -0.007536), (28, -0.007277), (29, -0.0067), (30, -0.005899), (31, -0.005024), (32, -0.004002), (33, -0.002908), (34, -0.001914), (35, -0.001028), (36, -0.000353), (37, -5e-06), (38, 0.000166), (39, 0.000253), (40, 0.000353), (41, 0.000476), (42, 0.000573), (43, 0.000674), (44, 0.000689), (45, 0.000646), (46, 0.000713), (47, 0.000792), (48, 0.000758), (49, 0.000712), (50, 0.000623), (51, 0.000452), (52, 0.000246), (53, 1.6e-05), (54, -0.000263), (55, -0.000626), (56, -0.001039), (57, -0.001415), (58, -0.00177), (59, -0.002236), (60, -0.002641), (61, -0.002939), (62, -0.00337), (63, -0.003703), (64, -0.003869), (65, -0.004164), (66, -0.004554), (67, -0.004905), (68, -0.005205), (69, -0.005499), (70, -0.005763), (71, -0.005952), (72, -0.006118), (73, -0.006341), (74, -0.006572), (75, -0.006777), (76, -0.007024), (77, -0.007209), (78, -0.007323), (79, -0.007349), (80, -0.007207), (81, -0.007011), (82, -0.006813), (83, -0.006618), (84, -0.006543), (85, -0.006497), (86, -0.006367), (87, -0.006292), (88, -0.006289), (89, -0.006284), (90, -0.006248), (91, -0.006181), (92, -0.006071), (93, -0.005927), (94, -0.005747), (95, -0.005547), (96, -0.005421), (97, -0.005214), (98, -0.004868), (99, -0.004671), (100, -0.004531), (101, -0.004357), (102, -0.00433), (103, -0.004214), (104, -0.003979), (105, -0.003897), (106, -0.003851), (107, -0.003731), (108, -0.003678), (109, -0.0036), (110, -0.003419), (111, -0.003268), (112, -0.003157), (113, -0.003066), (114, -0.00299), (115, -0.002869), (116, -0.002702), (117, -0.002564), (118, -0.002407), (119, -0.002275), (120, -0.002197), (121, -0.002088), (122, -0.001995), (123, -0.001983), (124, -0.001977), (125, -0.001995), (126, -0.002071), (127, -0.002095), (128, -0.002106), (129, -0.002102), (130, -0.002101), (131, -0.002095), (132, -0.001972), (133, -0.001772), (134, -0.001456), (135, -0.001112), (136, -0.000803), (137, -0.000465), (138, -0.000252), (139, -0.000162), (140, -5.4e-05), (141, -4e-06), (142, -0.000112), (143, -0.000269), (144, -0.000328), (145, -0.000318), (146, -0.000327), (147, -0.000253), (148, -0.000124), (149, -8.8e-05), (150, -3.4e-05), (151, 5.5e-05), (152, 0.000202), (153, 0.00051), (154, 0.000797), (155, 0.00107), (156, 0.001391), (157, 0.001656), (158, 0.002115), (159, 0.002849), (160, 0.003673), (161, 0.00455), (162, 0.005283), (163, 0.005749), (164, 0.006063), (165, 0.006368), (166, 0.006801), (167, 0.007463), (168, 0.008487), (169, 0.009652), (170, 0.010713), (171, 0.01171), (172, 0.012445), (173, 0.012818), (174, 0.013019), (175, 0.013154), (176, 0.013137), (177, 0.013004), (178, 0.012915), (179, 0.012798), (180, 0.012586), (181, 0.012454), (182, 0.012333), (183, 0.012083), (184, 0.011909), (185, 0.011762), (186, 0.011446), (187, 0.011023), (188, 0.010519), (189, 0.009982), (190, 0.009569), (191, 0.009317), (192, 0.009201), (193, 0.009214), (194, 0.009197), (195, 0.009071), (196, 0.008911), (197, 0.00869), (198, 0.008382), (199, 0.007902), (200, 0.00724), (201, 0.006541), (202, 0.005815), (203, 0.005047), (204, 0.004289), (205, 0.003564), (206, 0.002901), (207, 0.002311), (208, 0.001902), (209, 0.00176), (210, 0.001757), (211, 0.001816), (212, 0.001829), (213, 0.001797), (214, 0.001753), (215, 0.001682), (216, 0.001637), (217, 0.001613), (218, 0.001656), (219, 0.00173), (220, 0.001798), (221, 0.001931), (222, 0.002101), (223, 0.002279), (224, 0.002481), (225, 0.00268), (226, 0.002805), (227, 0.002855), (228, 0.002894), (229, 0.002924), (230, 0.002948), (231, 0.002947), (232, 0.002943), (233, 0.002936), (234, 0.002884), (235, 0.002833), (236, 0.00275), (237, 0.00264), (238, 0.002529), (239, 0.002387), (240, 0.002264), (241, 0.002162), (242, 0.002), (243, 0.001765), (244, 0.001481), (245, 0.001191), (246, 0.000906), (247, 0.000654), (248, 0.0005), (249, 0.000373), (250, 0.000276), (251, 0.000184), (252, 5.6e-05), (253, -4.4e-05), (254, -0.000176), (255, -0.000339), (256, -0.000432), (257, -0.000426), (258, -0.000422), (259, -0.000361), (260, -0.000228), (261, -0.000156), (262, -9e-05), (263, 1e-05), (264, 0.000168), (265, 0.000363), (266, 0.000709), (267, 0.001112), (268, 0.001484), (269, 0.001886), (270, 0.002086), (271, 0.002208), (272, 0.002288), (273, 0.002262), (274, 0.002236), (275, 0.002142), (276, 0.001995), (277, 0.001827), (278, 0.001584), (279, 0.001372), (280, 0.001224), (281, 0.001038), (282, 0.000878), (283, 0.00071), (284, 0.000541), (285, 0.000467), (286, 0.00035), (287, 0.000197), (288, 0.000149), (289, 5.9e-05), (290, -4.3e-05), (291, 5e-06), (292, 3e-06), (293, -9.5e-05), (294, -0.000204), (295, -0.000355), (296, -0.000486), (297, -0.000631), (298, -0.000853), (299, -0.00109), (300, -0.001282), (301, -0.001437), (302, -0.001543), (303, -0.001516), (304, -0.001503), (305, -0.001608), (306, -0.001726), (307, -0.001845), (308, -0.00197), (309, -0.002054), (310, -0.002095), (311, -0.002208), (312, -0.002392), (313, -0.002603), (314, -0.002803), (315, -0.002951), (316, -0.003139), (317, -0.003348), (318, -0.003606), (319, -0.003942), (320, -0.004226), (321, -0.004385), (322, -0.004406), (323, -0.004303), (324, -0.004165), (325, -0.004043), (326, -0.003856), (327, -0.003614), (328, -0.003344), (329, -0.003044), (330, -0.002752), (331, -0.002441), (332, -0.002151), (333, -0.001903), (334, -0.001586), (335, -0.001272), (336, -0.00107), (337, -0.000872), (338, -0.000667), (339, -0.000531), (340, -0.000398), (341, -0.000261), (342, -0.000143), (343, -8.6e-05), (344, -0.00012), (345, -3.1e-05), (346, 0.000105), (347, 0.00015), (348, 0.000276), (349, 0.000362), (350, 0.000375), (351, 0.000419), (352, 0.000414), (353, 0.000379), (354, 0.000314), (355, 0.000132), (356, -9.8e-05), (357, -0.000253), (358, -0.000352), (359, -0.000408), (360, -0.000445), (361, -0.000517), (362, -0.000686), (363, -0.00086), (364, -0.000937), (365, -0.001124), (366, -0.001394), (367, -0.001713), (368, -0.002155), (369, -0.002559), (370, -0.0029), (371, -0.003172), (372, -0.003357), (373, -0.00355), (374, -0.003751), (375, -0.00392), (376, -0.004014), (377, -0.004069), (378, -0.004146), (379, -0.004217), (380, -0.004299), (381, -0.004416), (382, -0.004489), (383, -0.004452), (384, -0.004375), (385, -0.004292), (386, -0.004224), (387, -0.004209), (388, -0.004182), (389, -0.004071), (390, -0.003939), (391, -0.003836), (392, -0.003719), (393, -0.003692), (394, -0.003736), (395, -0.003695), (396, -0.003578), (397, -0.0034), (398, -0.003184), (399, -0.002984), (400, -0.002811), (401, -0.002711), (402, -0.002681), (403, -0.002644), (404, -0.002618), (405, -0.00263), (406, -0.002709), (407, -0.002803), (408, -0.002916), (409, -0.003043), (410, -0.003113), (411, -0.0032), (412, -0.003358), (413, -0.003516), (414, -0.003543), (415, -0.00364), (416, -0.003926), (417, -0.004295), (418, -0.004684), (419, -0.005038), (420, -0.005377), (421, -0.005711), (422, -0.005989), (423, -0.006154), (424, -0.006335), (425, -0.006239), (426, -0.005218), (427, -0.003595), (428, -0.002344), (429, -0.001484), (430, -0.001578), (431, -0.003107), (432, -0.005042), (433, -0.006823), (434, -0.008042), (435, -0.008506), (436, -0.008549), (437, -0.008504)], ('rotation_euler', 1): [(-1, -2e-06), (0, 6.8e-05), (1, 0.000276), (2, 0.000546), (3, 0.000952), (4, 0.001459), (5, 0.001895), (6, 0.002383), (7, 0.002838), (8, 0.003214), (9, 0.003611), (10, 0.003976), (11, 0.00431), (12, 0.004608), (13, 0.004892), (14, 0.005159), (15, 0.005417), (16, 0.005658), (17, 0.005849), (18, 0.006031), (19, 0.006205), (20, 0.00633), (21, 0.006422), (22, 0.006552), (23, 0.006637), (24, 0.006699), (25, 0.006756), (26, 0.006761), (27, 0.006756), (28, 0.00672), (29, 0.006741), (30, 0.006829), (31, 0.006941), (32, 0.007179), (33, 0.007374), (34, 0.007451), (35, 0.007561), (36, 0.007554), (37, 0.007525), (38, 0.007527), (39, 0.007492), (40, 0.007578), (41, 0.007709), (42, 0.007765), (43, 0.007816), (44, 0.007839), (45, 0.00767), (46, 0.00744), (47, 0.007257), (48, 0.007013), (49, 0.006785), (50, 0.00658), (51, 0.006335), (52, 0.006074), (53, 0.005847), (54, 0.005698), (55, 0.005547), (56, 0.005419), (57, 0.005403), (58, 0.005367), (59, 0.005305), (60, 0.005333), (61, 0.00541), (62, 0.00548), (63, 0.005566), (64, 0.005704), (65, 0.005874), (66, 0.006073), (67, 0.006268), (68, 0.006448), (69, 0.006607), (70, 0.006686), (71, 0.006768), (72, 0.006824), (73, 0.006856), (74, 0.006974), (75, 0.007047), (76, 0.007084), (77, 0.007208), (78, 0.007305), (79, 0.007329), (80, 0.007385), (81, 0.007425), (82, 0.007398), (83, 0.007399), (84, 0.007398), (85, 0.007367), (86, 0.007317), (87, 0.00722), (88, 0.007138), (89, 0.007008), (90, 0.006832), (91, 0.006713), (92, 0.006649), (93, 0.006589), (94, 0.006541), (95, 0.006539), (96, 0.006482), (97, 0.006371), (98, 0.006267), (99, 0.006127), (100, 0.005965), (101, 0.005844), (102, 0.005731), (103, 0.005611), (104, 0.005482), (105, 0.005323), (106, 0.00513), (107, 0.00489), (108, 0.004692), (109, 0.004563), (110, 0.004446), (111, 0.004282), (112, 0.004143), (113, 0.004091), (114, 0.004005), (115, 0.003994), (116, 0.004111), (117, 0.004161), (118, 0.004238), (119, 0.004382), (120, 0.004459), (121, 0.00453), (122, 0.004619), (123, 0.00469), (124, 0.004761), (125, 0.004921), (126, 0.005148), (127, 0.005388), (128, 0.005722), (129, 0.00606), (130, 0.006367), (131, 0.006731), (132, 0.007008), (133, 0.007195), (134, 0.007412), (135, 0.007571), (136, 0.007785), (137, 0.00811), (138, 0.008408), (139, 0.008714), (140, 0.008994), (141, 0.009126), (142, 0.009197), (143, 0.009268), (144, 0.009315), (145, 0.00938), (146, 0.009503), (147, 0.009702), (148, 0.009899), (149, 0.010088), (150, 0.010274), (151, 0.010383), (152, 0.010434), (153, 0.010465), (154, 0.01048), (155, 0.010529), (156, 0.010607), (157, 0.010693), (158, 0.010764), (159, 0.01081), (160, 0.010862), (161, 0.010833), (162, 0.01079), (163, 0.010735), (164, 0.010624), (165, 0.010586), (166, 0.010542), (167, 0.010467), (168, 0.010467), (169, 0.010445), (170, 0.010408), (171, 0.010428), (172, 0.010414), (173, 0.010421), (174, 0.010426), (175, 0.010433), (176, 0.010466), (177, 0.010547), (178, 0.010635), (179, 0.010634), (180, 0.010619), (181, 0.010514), (182, 0.010364), (183, 0.010238), (184, 0.010108), (185, 0.009956), (186, 0.009817), (187, 0.0097), (188, 0.009485), (189, 0.009274), (190, 0.009093), (191, 0.008857), (192, 0.008607), (193, 0.008356), (194, 0.008165), (195, 0.00803), (196, 0.007866), (197, 0.007708), (198, 0.007562), (199, 0.007371), (200, 0.007121), (201, 0.00689), (202, 0.006691), (203, 0.006427), (204, 0.006123), (205, 0.005897), (206, 0.005754), (207, 0.005581), (208, 0.005427), (209, 0.0053), (210, 0.005062), (211, 0.004755), (212, 0.004442), (213, 0.004158), (214, 0.003901), (215, 0.003654), (216, 0.003473), (217, 0.003339), (218, 0.003167), (219, 0.003004), (220, 0.002899), (221, 0.00274), (222, 0.002552), (223, 0.002397), (224, 0.002257), (225, 0.002109), (226, 0.00195), (227, 0.00184), (228, 0.001697), (229, 0.001533), (230, 0.00141), (231, 0.001284), (232, 0.001205), (233, 0.001141), (234, 0.001033), (235, 0.000913), (236, 0.000754), (237, 0.00055), (238, 0.000376), (239, 0.000222), (240, 4.1e-05), (241, -7.1e-05), (242, -0.000145), (243, -0.000276), (244, -0.000419), (245, -0.000579), (246, -0.000759), (247, -0.000941), (248, -0.001099), (249, -0.001184), (250, -0.001213), (251, -0.001197), (252, -0.001193), (253, -0.001232), (254, -0.001284), (255, -0.001398), (256, -0.001573), (257, -0.001728), (258, -0.001856), (259, -0.002008), (260, -0.00212), (261, -0.002176), (262, -0.002233), (263, -0.002287), (264, -0.002291), (265, -0.002279), (266, -0.002342), (267, -0.00244), (268, -0.002537), (269, -0.002719), (270, -0.002975), (271, -0.003238), (272, -0.003506), (273, -0.00374), (274, -0.003892), (275, -0.004003), (276, -0.004104), (277, -0.004216), (278, -0.004372), (279, -0.004539), (280, -0.004746), (281, -0.004968), (282, -0.005135), (283, -0.00532), (284, -0.005562), (285, -0.005744), (286, -0.005868), (287, -0.006047), (288, -0.006174), (289, -0.006265), (290, -0.006447), (291, -0.006575), (292, -0.006682), (293, -0.00678), (294, -0.006743), (295, -0.006675), (296, -0.006552), (297, -0.00637), (298, -0.006209), (299, -0.006072), (300, -0.006008), (301, -0.006008), (302, -0.006069), (303, -0.006163), (304, -0.006259), (305, -0.006363), (306, -0.006372), (307, -0.006377), (308, -0.006447), (309, -0.006494), (310, -0.006558), (311, -0.006605), (312, -0.006588), (313, -0.006527), (314, -0.006481), (315, -0.006464), (316, -0.006459), (317, -0.00646), (318, -0.006444), (319, -0.006446), (320, -0.006527), (321, -0.006694), (322, -0.006862), (323, -0.006964), (324, -0.006943), (325, -0.006826), (326, -0.006744), (327, -0.006716), (328, -0.006688), (329, -0.006651), (330, -0.006555), (331, -0.006352), (332, -0.006178), (333, -0.006056), (334, -0.005959), (335, -0.005939), (336, -0.005926), (337, -0.005902), (338, -0.005915), (339, -0.006013), (340, -0.006145), (341, -0.00622), (342, -0.00628), (343, -0.006299), (344, -0.006297), (345, -0.006356), (346, -0.00645), (347, -0.006603), (348, -0.006796), (349, -0.006926), (350, -0.00699), (351, -0.006994), (352, -0.006923), (353, -0.006814), (354, -0.006737), (355, -0.006792), (356, -0.006918), (357, -0.007028), (358, -0.007156), (359, -0.007314), (360, -0.007439), (361, -0.007497), (362, -0.007592), (363, -0.007706), (364, -0.007782), (365, -0.007819), (366, -0.007864), (367, -0.007966), (368, -0.007997), (369, -0.00795), (370, -0.0079), (371, -0.007793), (372, -0.007644), (373, -0.007565), (374, -0.007539), (375, -0.007486), (376, -0.007489), (377, -0.007468), (378, -0.007339), (379, -0.00721), (380, -0.007047), (381, -0.006854), (382, -0.006672), (383, -0.006546), (384, -0.006474), (385, -0.006389), (386, -0.006368), (387, -0.006335), (388, -0.006245), (389, -0.006139), (390, -0.005966), (391, -0.005748), (392, -0.005522), (393, -0.005355), (394, -0.005265), (395, -0.005214), (396, -0.005219), (397, -0.005271), (398, -0.005263), (399, -0.00524), (400, -0.005229), (401, -0.005128), (402, -0.005055), (403, -0.004983), (404, -0.004831), (405, -0.00474), (406, -0.004664), (407, -0.004542), (408, -0.004498), (409, -0.004511), (410, -0.004428), (411, -0.004274), (412, -0.004043), (413, -0.003729), (414, -0.003359), (415, -0.002944), (416, -0.002642), (417, -0.002321), (418, -0.002008), (419, -0.001792), (420, -0.0015), (421, -0.001138), (422, -0.000723), (423, -0.000332), (424, -1.3e-05), (425, 0.000316), (426, 0.000581), (427, 0.000734), (428, 0.000877), (429, 0.000921), (430, 0.000666), (431, 0.00033), (432, 7e-05), (433, -0.000166), (434, -0.000221), (435, -0.000127), (436, -2.4e-05), (437, 3.8e-05)], ('rotation_euler', 2): [(-1, 0.0), (0, 9e-06), (1, 8e-06), (2, 5.5e-05), (3, 9.9e-05), (4, 1.4e-05), (5, -2.5e-05), (6, -0.000115), (7, -0.000336), (8, -0.000436), (9, -0.000523), (10, -0.000597), (11, -0.000567), (12, -0.000533), (13, -0.000373), (14, -0.000177), (15, -5e-06), (16, 0.000313), (17, 0.000615), (18, 0.000897), (19, 0.001254), (20, 0.001488), (21, 0.00157), (22, 0.001528), (23, 0.00145), (24, 0.001411), (25, 0.001267), (26, 0.001155), (27, 0.001129), (28, 0.000992), (29, 0.001038), (30, 0.001325), (31, 0.001581), (32, 0.001895), (33, 0.002097), (34, 0.002079), (35, 0.002124), (36, 0.0022), (37, 0.002259), (38, 0.002408), (39, 0.002536), (40, 0.00264), (41, 0.002842), (42, 0.003119), (43, 0.003438), (44, 0.00387), (45, 0.004197), (46, 0.004401), (47, 0.004698), (48, 0.004925), (49, 0.005082), (50, 0.005302), (51, 0.005541), (52, 0.005703), (53, 0.005823), (54, 0.005995), (55, 0.006066), (56, 0.006), (57, 0.005978), (58, 0.005895), (59, 0.005651), (60, 0.005379), (61, 0.005117), (62, 0.00474), (63, 0.004401), (64, 0.004162), (65, 0.003934), (66, 0.003743), (67, 0.003462), (68, 0.00315), (69, 0.002857), (70, 0.002494), (71, 0.002198), (72, 0.001977), (73, 0.001702), (74, 0.001442), (75, 0.001279), (76, 0.00117), (77, 0.001095), (78, 0.00107), (79, 0.001028), (80, 0.000974), (81, 0.000856), (82, 0.000754), (83, 0.000685), (84, 0.000558), (85, 0.000427), (86, 0.000219), (87, 6.9e-05), (88, 8e-06), (89, -7.6e-05), (90, -0.000134), (91, -0.000196), (92, -0.000254), (93, -0.000349), (94, -0.00045), (95, -0.000508), (96, -0.000584), (97, -0.000714), (98, -0.000904), (99, -0.001019), (100, -0.001123), (101, -0.001254), (102, -0.001396), (103, -0.001623), (104, -0.001901), (105, -0.002148), (106, -0.002361), (107, -0.002633), (108, -0.002806), (109, -0.00296), (110, -0.003133), (111, -0.003237), (112, -0.003333), (113, -0.003355), (114, -0.003416), (115, -0.003513), (116, -0.003595), (117, -0.003669), (118, -0.003705), (119, -0.003754), (120, -0.003798), (121, -0.003849), (122, -0.003966), (123, -0.00406), (124, -0.004157), (125, -0.004364), (126, -0.004471), (127, -0.004642), (128, -0.004924), (129, -0.005035), (130, -0.005147), (131, -0.005208), (132, -0.005271), (133, -0.005425), (134, -0.005505), (135, -0.005657), (136, -0.005812), (137, -0.005898), (138, -0.006014), (139, -0.006155), (140, -0.006301), (141, -0.006393), (142, -0.006455), (143, -0.00645), (144, -0.006486), (145, -0.006608), (146, -0.006678), (147, -0.006766), (148, -0.006838), (149, -0.006826), (150, -0.006759), (151, -0.006701), (152, -0.006703), (153, -0.006705), (154, -0.006697), (155, -0.006639), (156, -0.006606), (157, -0.006601), (158, -0.006516), (159, -0.006509), (160, -0.006485), (161, -0.006281), (162, -0.006094), (163, -0.005904), (164, -0.005679), (165, -0.005563), (166, -0.005518), (167, -0.005619), (168, -0.00573), (169, -0.005827), (170, -0.006025), (171, -0.006053), (172, -0.006041), (173, -0.006097), (174, -0.006071), (175, -0.006019), (176, -0.005964), (177, -0.005821), (178, -0.005725), (179, -0.005695), (180, -0.005624), (181, -0.005697), (182, -0.005781), (183, -0.00577), (184, -0.005801), (185, -0.005875), (186, -0.005907), (187, -0.005892), (188, -0.005892), (189, -0.005871), (190, -0.005809), (191, -0.005734), (192, -0.005727), (193, -0.005759), (194, -0.005764), (195, -0.005778), (196, -0.00577), (197, -0.005704), (198, -0.005579), (199, -0.005378), (200, -0.005173), (201, -0.00496), (202, -0.004711), (203, -0.004468), (204, -0.004199), (205, -0.003868), (206, -0.003478), (207, -0.003181), (208, -0.002969), (209, -0.002756), (210, -0.002744), (211, -0.002799), (212, -0.002772), (213, -0.002846), (214, -0.002965), (215, -0.003062), (216, -0.003158), (217, -0.003256), (218, -0.003431), (219, -0.003571), (220, -0.003775), (221, -0.004163), (222, -0.004498), (223, -0.004903), (224, -0.005352), (225, -0.005684), (226, -0.006038), (227, -0.006286), (228, -0.006457), (229, -0.006635), (230, -0.00668), (231, -0.006665), (232, -0.006671), (233, -0.006593), (234, -0.006531), (235, -0.006519), (236, -0.006437), (237, -0.006378), (238, -0.006326), (239, -0.00625), (240, -0.006352), (241, -0.006491), (242, -0.006496), (243, -0.006578), (244, -0.00659), (245, -0.006474), (246, -0.006414), (247, -0.006377), (248, -0.00633), (249, -0.006279), (250, -0.006227), (251, -0.00615), (252, -0.00611), (253, -0.00614), (254, -0.006111), (255, -0.006068), (256, -0.006079), (257, -0.005955), (258, -0.005827), (259, -0.005835), (260, -0.005789), (261, -0.0058), (262, -0.005864), (263, -0.005854), (264, -0.005853), (265, -0.005831), (266, -0.005803), (267, -0.005806), (268, -0.005733), (269, -0.005614), (270, -0.005533), (271, -0.005448), (272, -0.005351), (273, -0.005282), (274, -0.005164), (275, -0.004875), (276, -0.004602), (277, -0.004328), (278, -0.003968), (279, -0.003758), (280, -0.003609), (281, -0.003486), (282, -0.003407), (283, -0.003335), (284, -0.003394), (285, -0.003437), (286, -0.003501), (287, -0.003702), (288, -0.003836), (289, -0.003982), (290, -0.004243), (291, -0.00444), (292, -0.004584), (293, -0.004801), (294, -0.004953), (295, -0.005065), (296, -0.005304), (297, -0.005451), (298, -0.005526), (299, -0.005623), (300, -0.005636), (301, -0.005644), (302, -0.005684), (303, -0.005727), (304, -0.005746), (305, -0.005698), (306, -0.005569), (307, -0.005485), (308, -0.005496), (309, -0.005526), (310, -0.005624), (311, -0.005734), (312, -0.005762), (313, -0.005841), (314, -0.005951), (315, -0.006058), (316, -0.006261), (317, -0.006405), (318, -0.006461), (319, -0.006524), (320, -0.006513), (321, -0.006492), (322, -0.00655), (323, -0.006546), (324, -0.00652), (325, -0.00652), (326, -0.006489), (327, -0.006507), (328, -0.006466), (329, -0.006405), (330, -0.006412), (331, -0.00631), (332, -0.006213), (333, -0.006233), (334, -0.006197), (335, -0.006078), (336, -0.006042), (337, -0.005967), (338, -0.005824), (339, -0.005795), (340, -0.005792), (341, -0.00573), (342, -0.005707), (343, -0.005727), (344, -0.005721), (345, -0.005787), (346, -0.00581), (347, -0.005743), (348, -0.005697), (349, -0.005591), (350, -0.005461), (351, -0.00544), (352, -0.00541), (353, -0.005224), (354, -0.005036), (355, -0.004803), (356, -0.004419), (357, -0.004106), (358, -0.003853), (359, -0.003593), (360, -0.003448), (361, -0.003315), (362, -0.00311), (363, -0.002975), (364, -0.002852), (365, -0.00262), (366, -0.002426), (367, -0.002274), (368, -0.002174), (369, -0.002153), (370, -0.002157), (371, -0.002187), (372, -0.002165), (373, -0.002137), (374, -0.002119), (375, -0.002068), (376, -0.002099), (377, -0.002178), (378, -0.002119), (379, -0.002063), (380, -0.002123), (381, -0.002097), (382, -0.002173), (383, -0.002521), (384, -0.002768), (385, -0.002948), (386, -0.0032), (387, -0.003287), (388, -0.003381), (389, -0.003695), (390, -0.004016), (391, -0.004323), (392, -0.004628), (393, -0.004798), (394, -0.004869), (395, -0.004907), (396, -0.005015), (397, -0.005144), (398, -0.005281), (399, -0.005533), (400, -0.005803), (401, -0.006047), (402, -0.006224), (403, -0.006384), (404, -0.006547), (405, -0.006574), (406, -0.006571), (407, -0.006576), (408, -0.006439), (409, -0.006279), (410, -0.006091), (411, -0.005796), (412, -0.005413), (413, -0.004773), (414, -0.003864), (415, -0.002849), (416, -0.001861), (417, -0.001026), (418, -0.000451), (419, -7e-05), (420, 0.000269), (421, 0.000877), (422, 0.001799), (423, 0.002695), (424, 0.00339), (425, 0.003694), (426, 0.003315), (427, 0.002487), (428, 0.001685), (429, 0.001096), (430, 0.000824), (431, 0.000709), (432, 0.000714), (433, 0.00061), (434, 0.000323), (435, 0.000147), (436, 1.7e-05), (437, -7e-05)]}), 'THE_WEDDING': ('The Wedding', 24.0, {('location', 0): [(-10, 0.002507), (-9, 0.002109), (-8, 0.001721), (-7, 0.001349), (-6, 0.000998), (-5, 0.000672), (-4, 0.000376), (-3, 0.000111), (-2, -0.000124), (-1, -0.000333), (0, -0.000525), (1, -0.000705), (2, -0.000879), (3, -0.001047), (4, -0.001208), (5, -0.001363), (6, -0.001508), (7, -0.001644), (8, -0.001773), (9, -0.001898), (10, -0.002023), (11, -0.002151), (12, -0.002284), (13, -0.00242), (14, -0.002554), (15, -0.002681), (16, -0.002799), (17, -0.002903), (18, -0.002996), (19, -0.003085), (20, -0.003176), (21, -0.00327), (22, -0.003372), (23, -0.003481), (24, -0.003592), (25, -0.003707), (26, -0.003826), (27, -0.003944), (28, -0.00406), (29, -0.004172), (30, -0.00427), (31, -0.004349), (32, -0.004407), (33, -0.004441), (34, -0.004452), (35, -0.004441), (36, -0.00441), (37, -0.004361), (38, -0.004297), (39, -0.00422), (40, -0.00413), (41, -0.004031), (42, -0.003924), (43, -0.003807), (44, -0.003682), (45, -0.003549), (46, -0.003404), (47, -0.003246), (48, -0.003073), (49, -0.002881), (50, -0.002668), (51, -0.002435), (52, -0.002182), (53, -0.00191), (54, -0.001621), (55, -0.001322), (56, -0.001019), (57, -0.000712), (58, -0.0004), (59, -8.8e-05), (60, 0.00022), (61, 0.000516), (62, 0.00079), (63, 0.001032), (64, 0.001237), (65, 0.001402), (66, 0.001531), (67, 0.001636), (68, 0.001729), (69, 0.001821), (70, 0.001923), (71, 0.002039), (72, 0.00217), (73, 0.002317), (74, 0.002477), (75, 0.002647), (76, 0.002824), (77, 0.003002), (78, 0.003174), (79, 0.003336), (80, 0.003485), (81, 0.003614), (82, 0.003726), (83, 0.003821), (84, 0.00389), (85, 0.003936), (86, 0.003957), (87, 0.003949), (88, 0.003918), (89, 0.003874), (90, 0.003817), (91, 0.003758), (92, 0.003706), (93, 0.003662), (94, 0.003625), (95, 0.003596), (96, 0.003573), (97, 0.003552), (98, 0.003536), (99, 0.003522), (100, 0.003505), (101, 0.00348), (102, 0.003442), (103, 0.003383), (104, 0.003303), (105, 0.003204), (106, 0.003094), (107, 0.002981), (108, 0.002876), (109, 0.002787), (110, 0.002719), (111, 0.002677), (112, 0.002664), (113, 0.002682), (114, 0.002733), (115, 0.002815), (116, 0.002924), (117, 0.003047), (118, 0.003164), (119, 0.003292), (120, 0.003422), (121, 0.003541), (122, 0.003633), (123, 0.00369), (124, 0.003738), (125, 0.003789), (126, 0.003845), (127, 0.003901), (128, 0.00395), (129, 0.003984), (130, 0.003999), (131, 0.003995), (132, 0.003973), (133, 0.003936), (134, 0.003885), (135, 0.00382), (136, 0.003759), (137, 0.0037), (138, 0.003626), (139, 0.003544), (140, 0.003458), (141, 0.003378), (142, 0.003309), (143, 0.003252), (144, 0.003203), (145, 0.00316), (146, 0.003114), (147, 0.003058), (148, 0.002988), (149, 0.002899), (150, 0.002778), (151, 0.002551)], ('location', 1): [(-10, -0.000571), (-9, -0.000643), (-8, -0.00072), (-7, -0.000804), (-6, -0.000886), (-5, -0.000959), (-4, -0.001018), (-3, -0.001053), (-2, -0.001066), (-1, -0.001059), (0, -0.001035), (1, -0.001001), (2, -0.000966), (3, -0.000933), (4, -0.000911), (5, -0.000904), (6, -0.000911), (7, -0.000936), (8, -0.000972), (9, -0.001018), (10, -0.00107), (11, -0.001127), (12, -0.001189), (13, -0.001254), (14, -0.001323), (15, -0.001395), (16, -0.001466), (17, -0.001534), (18, -0.001598), (19, -0.001649), (20, -0.001678), (21, -0.001684), (22, -0.001657), (23, -0.001594), (24, -0.0015), (25, -0.001376), (26, -0.001229), (27, -0.001073), (28, -0.000914), (29, -0.00076), (30, -0.00062), (31, -0.000498), (32, -0.000394), (33, -0.000313), (34, -0.000254), (35, -0.000217), (36, -0.000201), (37, -0.000203), (38, -0.000217), (39, -0.000239), (40, -0.000265), (41, -0.000289), (42, -0.00031), (43, -0.000326), (44, -0.000335), (45, -0.000334), (46, -0.000326), (47, -0.000311), (48, -0.000287), (49, -0.000257), (50, -0.000225), (51, -0.000189), (52, -0.000153), (53, -0.000118), (54, -8.5e-05), (55, -5.4e-05), (56, -2.4e-05), (57, 6e-06), (58, 3.5e-05), (59, 6.4e-05), (60, 9.2e-05), (61, 0.000117), (62, 0.000141), (63, 0.000167), (64, 0.000197), (65, 0.000231), (66, 0.000273), (67, 0.000322), (68, 0.000377), (69, 0.000437), (70, 0.000499), (71, 0.000559), (72, 0.000615), (73, 0.000658), (74, 0.000685), (75, 0.000697), (76, 0.000691), (77, 0.000668), (78, 0.00063), (79, 0.000577), (80, 0.000511), (81, 0.000437), (82, 0.000363), (83, 0.0003), (84, 0.000257), (85, 0.000236), (86, 0.000236), (87, 0.000251), (88, 0.000269), (89, 0.000284), (90, 0.000295), (91, 0.000297), (92, 0.000289), (93, 0.000272), (94, 0.00024), (95, 0.000191), (96, 0.000127), (97, 5.3e-05), (98, -2.7e-05), (99, -0.000102), (100, -0.000165), (101, -0.000215), (102, -0.000251), (103, -0.000274), (104, -0.000287), (105, -0.000292), (106, -0.000289), (107, -0.00028), (108, -0.000269), (109, -0.000257), (110, -0.000247), (111, -0.000239), (112, -0.000233), (113, -0.000238), (114, -0.000263), (115, -0.000319), (116, -0.000415), (117, -0.000532), (118, -0.000633), (119, -0.000688), (120, -0.000661), (121, -0.000545), (122, -0.000372), (123, -0.000174), (124, 9e-06), (125, 0.000145), (126, 0.000232), (127, 0.000279), (128, 0.000293), (129, 0.000289), (130, 0.000274), (131, 0.00025), (132, 0.000222), (133, 0.000193), (134, 0.000165), (135, 0.000139), (136, 0.000111), (137, 8.1e-05), (138, 4.7e-05), (139, 8e-06), (140, -3.3e-05), (141, -7.4e-05), (142, -0.000116), (143, -0.000159), (144, -0.000203), (145, -0.00025), (146, -0.0003), (147, -0.000353), (148, -0.000408), (149, -0.000462), (150, -0.000516), (151, -0.000567)], ('location', 2): [(-10, 0.000317), (-9, 0.000469), (-8, 0.000623), (-7, 0.000775), (-6, 0.000922), (-5, 0.001068), (-4, 0.001217), (-3, 0.00137), (-2, 0.00153), (-1, 0.001699), (0, 0.001865), (1, 0.002025), (2, 0.002174), (3, 0.002304), (4, 0.002419), (5, 0.002519), (6, 0.002606), (7, 0.002688), (8, 0.002767), (9, 0.002843), (10, 0.002923), (11, 0.003003), (12, 0.003082), (13, 0.003155), (14, 0.003223), (15, 0.003284), (16, 0.003336), (17, 0.003381), (18, 0.003416), (19, 0.003433), (20, 0.003428), (21, 0.003401), (22, 0.003351), (23, 0.003285), (24, 0.00321), (25, 0.00313), (26, 0.003045), (27, 0.002956), (28, 0.002861), (29, 0.002763), (30, 0.002666), (31, 0.002574), (32, 0.002488), (33, 0.002408), (34, 0.002335), (35, 0.002266), (36, 0.002202), (37, 0.002147), (38, 0.002097), (39, 0.002052), (40, 0.002008), (41, 0.001962), (42, 0.001909), (43, 0.00185), (44, 0.001782), (45, 0.001704), (46, 0.001618), (47, 0.001523), (48, 0.001416), (49, 0.001295), (50, 0.001159), (51, 0.001002), (52, 0.000829), (53, 0.00064), (54, 0.000439), (55, 0.000234), (56, 2.4e-05), (57, -0.000185), (58, -0.000391), (59, -0.000593), (60, -0.000789), (61, -0.000979), (62, -0.001164), (63, -0.00135), (64, -0.001537), (65, -0.001724), (66, -0.001915), (67, -0.002103), (68, -0.002283), (69, -0.00245), (70, -0.002595), (71, -0.002719), (72, -0.002823), (73, -0.00291), (74, -0.002986), (75, -0.003054), (76, -0.003116), (77, -0.003169), (78, -0.00321), (79, -0.003228), (80, -0.00322), (81, -0.003184), (82, -0.003114), (83, -0.003014), (84, -0.002889), (85, -0.002738), (86, -0.002562), (87, -0.002371), (88, -0.00217), (89, -0.001963), (90, -0.001767), (91, -0.001586), (92, -0.001422), (93, -0.001281), (94, -0.001155), (95, -0.001038), (96, -0.000928), (97, -0.000817), (98, -0.000702), (99, -0.000585), (100, -0.000472), (101, -0.00037), (102, -0.00029), (103, -0.000233), (104, -0.000199), (105, -0.000184), (106, -0.000178), (107, -0.000175), (108, -0.000169), (109, -0.00016), (110, -0.000147), (111, -0.000128), (112, -9.8e-05), (113, -3.2e-05), (114, 9.3e-05), (115, 0.000288), (116, 0.000562), (117, 0.000871), (118, 0.001145), (119, 0.001333), (120, 0.001376), (121, 0.001266), (122, 0.001059), (123, 0.000813), (124, 0.000589), (125, 0.000392), (126, 0.00022), (127, 0.000138), (128, 9.8e-05), (129, 6.9e-05), (130, 3.9e-05), (131, 5e-06), (132, -3e-05), (133, -6e-05), (134, -8.4e-05), (135, -0.0001), (136, -0.000112), (137, -0.000122), (138, -0.000132), (139, -0.000138), (140, -0.000139), (141, -0.000131), (142, -0.000109), (143, -7.5e-05), (144, -3.2e-05), (145, 1.4e-05), (146, 5.6e-05), (147, 9.5e-05), (148, 0.000131), (149, 0.000165), (150, 0.00021), (151, 0.000296)], ('rotation_euler', 0): [(-10, 0.004106), (-9, 0.00409), (-8, 0.004163), (-7, 0.004237), (-6, 0.004372), (-5, 0.004566), (-4, 0.00481), (-3, 0.005139), (-2, 0.00563), (-1, 0.006211), (0, 0.006804), (1, 0.007389), (2, 0.008002), (3, 0.008586), (4, 0.009161), (5, 0.009572), (6, 0.009981), (7, 0.010248), (8, 0.010401), (9, 0.010439), (10, 0.010349), (11, 0.010117), (12, 0.009838), (13, 0.009464), (14, 0.009022), (15, 0.008433), (16, 0.007906), (17, 0.007364), (18, 0.006659), (19, 0.005783), (20, 0.004972), (21, 0.00439), (22, 0.00398), (23, 0.003808), (24, 0.003523), (25, 0.003392), (26, 0.003282), (27, 0.003195), (28, 0.003156), (29, 0.003121), (30, 0.003071), (31, 0.003022), (32, 0.002869), (33, 0.002713), (34, 0.002524), (35, 0.00226), (36, 0.001948), (37, 0.001578), (38, 0.001126), (39, 0.000663), (40, 0.000115), (41, -0.000399), (42, -0.000843), (43, -0.001256), (44, -0.001622), (45, -0.001858), (46, -0.002099), (47, -0.002286), (48, -0.002418), (49, -0.002522), (50, -0.002613), (51, -0.002714), (52, -0.002782), (53, -0.002776), (54, -0.002801), (55, -0.002854), (56, -0.002954), (57, -0.003074), (58, -0.00315), (59, -0.003162), (60, -0.003162), (61, -0.003183), (62, -0.003212), (63, -0.003245), (64, -0.003335), (65, -0.003404), (66, -0.003538), (67, -0.003691), (68, -0.003763), (69, -0.003836), (70, -0.003861), (71, -0.003842), (72, -0.003836), (73, -0.003839), (74, -0.003851), (75, -0.003807), (76, -0.003793), (77, -0.003743), (78, -0.00369), (79, -0.003647), (80, -0.003632), (81, -0.003649), (82, -0.003647), (83, -0.003569), (84, -0.003453), (85, -0.003285), (86, -0.002811), (87, -0.002344), (88, -0.001739), (89, -0.000945), (90, -5.3e-05), (91, 0.000631), (92, 0.001102), (93, 0.001464), (94, 0.001687), (95, 0.001845), (96, 0.001822), (97, 0.001758), (98, 0.001569), (99, 0.001425), (100, 0.001325), (101, 0.001267), (102, 0.001159), (103, 0.001113), (104, 0.001104), (105, 0.001163), (106, 0.001181), (107, 0.001155), (108, 0.001141), (109, 0.00106), (110, 0.001053), (111, 0.001056), (112, 0.00113), (113, 0.001148), (114, 0.001189), (115, 0.001165), (116, 0.001206), (117, 0.001302), (118, 0.001524), (119, 0.001735), (120, 0.001951), (121, 0.002127), (122, 0.002215), (123, 0.002333), (124, 0.002425), (125, 0.002381), (126, 0.002366), (127, 0.002364), (128, 0.002391), (129, 0.002435), (130, 0.002495), (131, 0.00252), (132, 0.002638), (133, 0.002744), (134, 0.002882), (135, 0.002977), (136, 0.00305), (137, 0.003121), (138, 0.003211), (139, 0.003313), (140, 0.003356), (141, 0.003412), (142, 0.003476), (143, 0.003503), (144, 0.003537), (145, 0.003603), (146, 0.003669), (147, 0.003785), (148, 0.003836), (149, 0.003885), (150, 0.003963), (151, 0.004044)], ('rotation_euler', 1): [(-10, 0.01817), (-9, 0.018143), (-8, 0.0182), (-7, 0.01819), (-6, 0.018157), (-5, 0.018165), (-4, 0.01823), (-3, 0.018291), (-2, 0.018469), (-1, 0.018449), (0, 0.018599), (1, 0.018701), (2, 0.018859), (3, 0.018918), (4, 0.019079), (5, 0.019223), (6, 0.019269), (7, 0.019374), (8, 0.019452), (9, 0.019479), (10, 0.019539), (11, 0.019487), (12, 0.019284), (13, 0.018933), (14, 0.018507), (15, 0.018041), (16, 0.017587), (17, 0.017211), (18, 0.01662), (19, 0.015999), (20, 0.015407), (21, 0.015053), (22, 0.014645), (23, 0.014265), (24, 0.013839), (25, 0.013517), (26, 0.013247), (27, 0.012912), (28, 0.012536), (29, 0.01231), (30, 0.012103), (31, 0.012059), (32, 0.012032), (33, 0.012023), (34, 0.012056), (35, 0.012216), (36, 0.012434), (37, 0.012693), (38, 0.012955), (39, 0.013178), (40, 0.013492), (41, 0.013604), (42, 0.013777), (43, 0.013807), (44, 0.013711), (45, 0.013673), (46, 0.01361), (47, 0.01365), (48, 0.013776), (49, 0.014006), (50, 0.014156), (51, 0.014281), (52, 0.014376), (53, 0.014385), (54, 0.014374), (55, 0.014273), (56, 0.014332), (57, 0.014373), (58, 0.01444), (59, 0.014598), (60, 0.014787), (61, 0.014918), (62, 0.015012), (63, 0.015071), (64, 0.015058), (65, 0.014947), (66, 0.014801), (67, 0.014563), (68, 0.014348), (69, 0.014082), (70, 0.013871), (71, 0.013611), (72, 0.013372), (73, 0.01313), (74, 0.012916), (75, 0.012537), (76, 0.012143), (77, 0.01187), (78, 0.011528), (79, 0.011284), (80, 0.011054), (81, 0.011063), (82, 0.011311), (83, 0.01133), (84, 0.011526), (85, 0.011798), (86, 0.011956), (87, 0.012517), (88, 0.013), (89, 0.013516), (90, 0.013926), (91, 0.014253), (92, 0.014451), (93, 0.014829), (94, 0.015207), (95, 0.015625), (96, 0.015954), (97, 0.016375), (98, 0.016833), (99, 0.017178), (100, 0.017549), (101, 0.017679), (102, 0.017817), (103, 0.017722), (104, 0.017659), (105, 0.01758), (106, 0.01751), (107, 0.017336), (108, 0.01723), (109, 0.017045), (110, 0.016846), (111, 0.016698), (112, 0.016492), (113, 0.016413), (114, 0.016276), (115, 0.01617), (116, 0.016042), (117, 0.015899), (118, 0.01589), (119, 0.015875), (120, 0.016045), (121, 0.016097), (122, 0.016235), (123, 0.016422), (124, 0.016718), (125, 0.017102), (126, 0.017413), (127, 0.017723), (128, 0.017987), (129, 0.018133), (130, 0.018185), (131, 0.018099), (132, 0.017963), (133, 0.017718), (134, 0.017599), (135, 0.017348), (136, 0.017128), (137, 0.017007), (138, 0.016642), (139, 0.016379), (140, 0.016413), (141, 0.016515), (142, 0.016736), (143, 0.016846), (144, 0.017057), (145, 0.017243), (146, 0.017339), (147, 0.017601), (148, 0.017719), (149, 0.017846), (150, 0.018048), (151, 0.018103)], ('rotation_euler', 2): [(-10, 0.009756), (-9, 0.009728), (-8, 0.009699), (-7, 0.009829), (-6, 0.009911), (-5, 0.009995), (-4, 0.009963), (-3, 0.009914), (-2, 0.009819), (-1, 0.009645), (0, 0.009307), (1, 0.008845), (2, 0.008403), (3, 0.007982), (4, 0.007402), (5, 0.006859), (6, 0.006103), (7, 0.005302), (8, 0.004454), (9, 0.003457), (10, 0.002609), (11, 0.001632), (12, 0.00082), (13, -6e-06), (14, -0.00075), (15, -0.001607), (16, -0.002341), (17, -0.003086), (18, -0.00403), (19, -0.00499), (20, -0.005869), (21, -0.006467), (22, -0.006821), (23, -0.006914), (24, -0.007222), (25, -0.007388), (26, -0.007499), (27, -0.007632), (28, -0.007488), (29, -0.007401), (30, -0.006982), (31, -0.0065), (32, -0.006003), (33, -0.005487), (34, -0.005001), (35, -0.004527), (36, -0.004162), (37, -0.003724), (38, -0.0034), (39, -0.003156), (40, -0.002813), (41, -0.002533), (42, -0.002034), (43, -0.001673), (44, -0.001377), (45, -0.001079), (46, -0.000899), (47, -0.000635), (48, -0.000375), (49, -0.000223), (50, -0.000159), (51, -6.3e-05), (52, -1.2e-05), (53, 0.000103), (54, 0.000182), (55, 0.000192), (56, 0.000119), (57, -3.2e-05), (58, -0.000266), (59, -0.000514), (60, -0.000677), (61, -0.000895), (62, -0.001217), (63, -0.001413), (64, -0.001567), (65, -0.001666), (66, -0.001695), (67, -0.001531), (68, -0.001393), (69, -0.001212), (70, -0.001105), (71, -0.000936), (72, -0.00073), (73, -0.000628), (74, -0.000475), (75, -0.000423), (76, -0.000485), (77, -0.000412), (78, -0.000473), (79, -0.000598), (80, -0.000838), (81, -0.001035), (82, -0.001206), (83, -0.001347), (84, -0.001334), (85, -0.001383), (86, -0.001425), (87, -0.001169), (88, -0.000826), (89, -0.000315), (90, 0.000528), (91, 0.001163), (92, 0.001553), (93, 0.001853), (94, 0.002061), (95, 0.002334), (96, 0.002358), (97, 0.002467), (98, 0.002333), (99, 0.002338), (100, 0.002353), (101, 0.002376), (102, 0.00243), (103, 0.00251), (104, 0.002691), (105, 0.002975), (106, 0.003233), (107, 0.003505), (108, 0.003632), (109, 0.003869), (110, 0.004081), (111, 0.004287), (112, 0.004491), (113, 0.004593), (114, 0.004796), (115, 0.004827), (116, 0.004966), (117, 0.005007), (118, 0.005292), (119, 0.005656), (120, 0.005777), (121, 0.005961), (122, 0.005893), (123, 0.006019), (124, 0.006129), (125, 0.006224), (126, 0.006283), (127, 0.006394), (128, 0.006459), (129, 0.006569), (130, 0.006774), (131, 0.006977), (132, 0.007284), (133, 0.007611), (134, 0.007875), (135, 0.008177), (136, 0.008445), (137, 0.008761), (138, 0.009028), (139, 0.009312), (140, 0.00945), (141, 0.009547), (142, 0.009573), (143, 0.00964), (144, 0.009619), (145, 0.009651), (146, 0.009676), (147, 0.009722), (148, 0.009666), (149, 0.00971), (150, 0.009726), (151, 0.009716)]}), 'WALK_TO_THE_STORE': ('Walk to the Store', 24.0, {('location', 0): [(1, -0.030772), (2, -0.032342), (3, -0.034982), (4, -0.035541), (5, -0.035923), (6, -0.036059), (7, -0.036016), (8, -0.035786), (9, -0.03549), (10, -0.035015), (11, -0.034291), (12, -0.033353), (13, -0.032219), (14, -0.030937), (15, -0.029623), (16, -0.028411), (17, -0.027348), (18, -0.026413), (19, -0.025548), (20, -0.024611), (21, -0.023492), (22, -0.022142), (23, -0.020457), (24, -0.018388), (25, -0.016026), (26, -0.013393), (27, -0.01053), (28, -0.007661), (29, -0.004892), (30, -0.002122), (31, 0.000698), (32, 0.003642), (33, 0.006805), (34, 0.010197), (35, 0.013731), (36, 0.017234), (37, 0.020593), (38, 0.023723), (39, 0.026586), (40, 0.029293), (41, 0.031938), (42, 0.034586), (43, 0.037206), (44, 0.039483), (45, 0.041213), (46, 0.042252), (47, 0.042428), (48, 0.042027), (49, 0.041306), (50, 0.040382), (51, 0.039487), (52, 0.03881), (53, 0.038507), (54, 0.038545), (55, 0.039059), (56, 0.040169), (57, 0.041588), (58, 0.043339), (59, 0.045508), (60, 0.047889), (61, 0.050466), (62, 0.053188), (63, 0.055851), (64, 0.058273), (65, 0.060231), (66, 0.061543), (67, 0.06213), (68, 0.062015), (69, 0.061417), (70, 0.060614), (71, 0.059772), (72, 0.058954), (73, 0.058099), (74, 0.05705), (75, 0.055814), (76, 0.054497), (77, 0.053123), (78, 0.051869), (79, 0.05079), (80, 0.049578), (81, 0.04813), (82, 0.046468), (83, 0.044374), (84, 0.041858), (85, 0.039166), (86, 0.036314), (87, 0.033331), (88, 0.030365), (89, 0.027412), (90, 0.024428), (91, 0.02135), (92, 0.018126), (93, 0.014832), (94, 0.011484), (95, 0.008146), (96, 0.004977), (97, 0.00201), (98, -0.000785), (99, -0.003397), (100, -0.005864), (101, -0.00826), (102, -0.010577), (103, -0.012786), (104, -0.014886), (105, -0.016818), (106, -0.018559), (107, -0.020109), (108, -0.021457), (109, -0.022637), (110, -0.023668), (111, -0.024588), (112, -0.025438), (113, -0.026019), (114, -0.026373), (115, -0.026625), (116, -0.026901), (117, -0.027326), (118, -0.028025), (119, -0.029002), (120, -0.029829), (121, -0.030162), (122, -0.030138), (123, -0.030757)], ('location', 1): [(1, 0.00881), (2, 0.006461), (3, 0.00439), (4, 0.002925), (5, 0.001507), (6, 0.000524), (7, 0.000425), (8, 0.001263), (9, 0.002628), (10, 0.004369), (11, 0.006086), (12, 0.007223), (13, 0.007648), (14, 0.007295), (15, 0.006047), (16, 0.004026), (17, 0.001428), (18, -0.001639), (19, -0.004981), (20, -0.008313), (21, -0.011301), (22, -0.013559), (23, -0.014814), (24, -0.014825), (25, -0.013568), (26, -0.011304), (27, -0.008231), (28, -0.00458), (29, -0.000614), (30, 0.003364), (31, 0.006983), (32, 0.009933), (33, 0.011907), (34, 0.012683), (35, 0.012263), (36, 0.010786), (37, 0.008415), (38, 0.005438), (39, 0.002259), (40, -0.000812), (41, -0.003488), (42, -0.005531), (43, -0.006853), (44, -0.007373), (45, -0.006996), (46, -0.005682), (47, -0.00352), (48, -0.00078), (49, 0.002153), (50, 0.004759), (51, 0.006557), (52, 0.007199), (53, 0.006461), (54, 0.00442), (55, 0.001294), (56, -0.002603), (57, -0.006691), (58, -0.010478), (59, -0.013614), (60, -0.015746), (61, -0.01674), (62, -0.016585), (63, -0.015367), (64, -0.013372), (65, -0.010871), (66, -0.008173), (67, -0.005691), (68, -0.003697), (69, -0.002386), (70, -0.00201), (71, -0.002638), (72, -0.004187), (73, -0.006562), (74, -0.009383), (75, -0.012137), (76, -0.014497), (77, -0.016012), (78, -0.016345), (79, -0.015522), (80, -0.013563), (81, -0.010611), (82, -0.007014), (83, -0.003103), (84, 0.000785), (85, 0.004288), (86, 0.007095), (87, 0.009014), (88, 0.00993), (89, 0.009793), (90, 0.008668), (91, 0.006724), (92, 0.004172), (93, 0.001323), (94, -0.001428), (95, -0.003722), (96, -0.005209), (97, -0.005672), (98, -0.005105), (99, -0.003578), (100, -0.001275), (101, 0.001572), (102, 0.004782), (103, 0.008193), (104, 0.011626), (105, 0.014824), (106, 0.017495), (107, 0.019366), (108, 0.020182), (109, 0.019849), (110, 0.018443), (111, 0.016236), (112, 0.013847), (113, 0.011804), (114, 0.010392), (115, 0.009953), (116, 0.010321), (117, 0.010937), (118, 0.011546), (119, 0.011847), (120, 0.011549), (121, 0.010898), (122, 0.010213), (123, 0.009037)], ('location', 2): [(1, -0.027751), (2, -0.024322), (3, -0.018351), (4, -0.012577), (5, -0.007166), (6, -0.005179), (7, -0.003418), (8, -0.001511), (9, 0.000155), (10, 0.000969), (11, 0.001525), (12, 0.001898), (13, 0.002033), (14, 0.002278), (15, 0.002632), (16, 0.003062), (17, 0.003789), (18, 0.004496), (19, 0.004767), (20, 0.004399), (21, 0.002879), (22, 0.00052), (23, -0.000831), (24, -0.001572), (25, -0.002908), (26, -0.003166), (27, -0.002848), (28, -0.003118), (29, -0.003108), (30, -0.002442), (31, -0.001734), (32, -0.001583), (33, -0.001781), (34, -0.001996), (35, -0.002128), (36, -0.002155), (37, -0.001812), (38, -0.00102), (39, 9.7e-05), (40, 0.001393), (41, 0.002645), (42, 0.003265), (43, 0.00332), (44, 0.003052), (45, 0.003245), (46, 0.004681), (47, 0.006837), (48, 0.010002), (49, 0.013688), (50, 0.017092), (51, 0.020315), (52, 0.023341), (53, 0.026371), (54, 0.028192), (55, 0.029008), (56, 0.030014), (57, 0.030121), (58, 0.029953), (59, 0.030102), (60, 0.029838), (61, 0.029255), (62, 0.028486), (63, 0.027845), (64, 0.02743), (65, 0.027346), (66, 0.027996), (67, 0.029303), (68, 0.030985), (69, 0.032883), (70, 0.034726), (71, 0.03619), (72, 0.037263), (73, 0.038233), (74, 0.039144), (75, 0.040341), (76, 0.04167), (77, 0.042666), (78, 0.04352), (79, 0.04389), (80, 0.04324), (81, 0.042199), (82, 0.041451), (83, 0.040543), (84, 0.039639), (85, 0.03923), (86, 0.038988), (87, 0.038692), (88, 0.038421), (89, 0.038012), (90, 0.037468), (91, 0.036672), (92, 0.035658), (93, 0.034546), (94, 0.033029), (95, 0.031228), (96, 0.02924), (97, 0.027198), (98, 0.025255), (99, 0.023488), (100, 0.022137), (101, 0.020907), (102, 0.01937), (103, 0.017346), (104, 0.014308), (105, 0.00993), (106, 0.004245), (107, -0.002405), (108, -0.009523), (109, -0.016716), (110, -0.023473), (111, -0.029485), (112, -0.034344), (113, -0.037919), (114, -0.040446), (115, -0.041778), (116, -0.041827), (117, -0.041088), (118, -0.039581), (119, -0.03709), (120, -0.034402), (121, -0.031946), (122, -0.029901), (123, -0.02773)], ('rotation_euler', 0): [(1, 0.021889), (2, 0.018053), (3, 0.0155), (4, 0.014222), (5, 0.013912), (6, 0.013955), (7, 0.014104), (8, 0.014018), (9, 0.01327), (10, 0.012114), (11, 0.010706), (12, 0.009083), (13, 0.00751), (14, 0.006032), (15, 0.004687), (16, 0.003698), (17, 0.003328), (18, 0.003762), (19, 0.005237), (20, 0.007809), (21, 0.011215), (22, 0.015137), (23, 0.019128), (24, 0.023001), (25, 0.02668), (26, 0.029913), (27, 0.032466), (28, 0.034165), (29, 0.035013), (30, 0.034947), (31, 0.034232), (32, 0.033383), (33, 0.032484), (34, 0.031585), (35, 0.03086), (36, 0.03036), (37, 0.029949), (38, 0.029706), (39, 0.029738), (40, 0.02995), (41, 0.030286), (42, 0.030703), (43, 0.03109), (44, 0.031215), (45, 0.03063), (46, 0.029125), (47, 0.026505), (48, 0.02259), (49, 0.017766), (50, 0.012485), (51, 0.007198), (52, 0.002414), (53, -0.001577), (54, -0.004303), (55, -0.005399), (56, -0.00489), (57, -0.002836), (58, 0.000752), (59, 0.005371), (60, 0.010065), (61, 0.014371), (62, 0.017905), (63, 0.020035), (64, 0.020738), (65, 0.020402), (66, 0.019268), (67, 0.017721), (68, 0.016228), (69, 0.015179), (70, 0.014777), (71, 0.015041), (72, 0.015975), (73, 0.017489), (74, 0.019609), (75, 0.022618), (76, 0.026082), (77, 0.029389), (78, 0.032235), (79, 0.033797), (80, 0.03387), (81, 0.032553), (82, 0.030043), (83, 0.026735), (84, 0.022739), (85, 0.01838), (86, 0.014047), (87, 0.010097), (88, 0.00684), (89, 0.004447), (90, 0.00301), (91, 0.002583), (92, 0.003093), (93, 0.004456), (94, 0.00653), (95, 0.008832), (96, 0.011014), (97, 0.01284), (98, 0.014036), (99, 0.014695), (100, 0.014802), (101, 0.014338), (102, 0.013401), (103, 0.011914), (104, 0.010023), (105, 0.008041), (106, 0.006314), (107, 0.0052), (108, 0.004876), (109, 0.005435), (110, 0.006935), (111, 0.009346), (112, 0.012506), (113, 0.016128), (114, 0.019934), (115, 0.023479), (116, 0.0262), (117, 0.027867), (118, 0.030233), (119, 0.031906), (120, 0.031437), (121, 0.028787), (122, 0.025507), (123, 0.021906)], ('rotation_euler', 1): [(1, 0.003163), (2, 0.00311), (3, 0.00315), (4, 0.0034), (5, 0.003814), (6, 0.003861), (7, 0.003797), (8, 0.003336), (9, 0.002261), (10, 0.000818), (11, -0.000853), (12, -0.002611), (13, -0.004196), (14, -0.005614), (15, -0.006982), (16, -0.008271), (17, -0.009482), (18, -0.010545), (19, -0.01125), (20, -0.011519), (21, -0.011442), (22, -0.011022), (23, -0.0105), (24, -0.010152), (25, -0.009814), (26, -0.009365), (27, -0.008923), (28, -0.008488), (29, -0.008004), (30, -0.007647), (31, -0.007467), (32, -0.007309), (33, -0.007122), (34, -0.006945), (35, -0.006765), (36, -0.006512), (37, -0.006202), (38, -0.005819), (39, -0.005341), (40, -0.004867), (41, -0.004411), (42, -0.00391), (43, -0.003446), (44, -0.002991), (45, -0.002549), (46, -0.002222), (47, -0.002108), (48, -0.002402), (49, -0.003013), (50, -0.003869), (51, -0.004908), (52, -0.005838), (53, -0.00645), (54, -0.006735), (55, -0.006771), (56, -0.006603), (57, -0.006411), (58, -0.006278), (59, -0.005995), (60, -0.005604), (61, -0.004708), (62, -0.00304), (63, -0.001115), (64, 0.000791), (65, 0.0023), (66, 0.003207), (67, 0.003405), (68, 0.00312), (69, 0.002886), (70, 0.002772), (71, 0.002789), (72, 0.002909), (73, 0.003084), (74, 0.003362), (75, 0.003786), (76, 0.004186), (77, 0.004607), (78, 0.005106), (79, 0.005366), (80, 0.005477), (81, 0.005513), (82, 0.005421), (83, 0.005224), (84, 0.004739), (85, 0.004089), (86, 0.003479), (87, 0.00287), (88, 0.002498), (89, 0.002427), (90, 0.002488), (91, 0.002665), (92, 0.002886), (93, 0.003138), (94, 0.003436), (95, 0.003718), (96, 0.004027), (97, 0.004335), (98, 0.004598), (99, 0.004896), (100, 0.005157), (101, 0.005388), (102, 0.005532), (103, 0.005534), (104, 0.005492), (105, 0.005307), (106, 0.005), (107, 0.00478), (108, 0.004601), (109, 0.004459), (110, 0.00443), (111, 0.004501), (112, 0.004754), (113, 0.005003), (114, 0.005059), (115, 0.005076), (116, 0.004866), (117, 0.00443), (118, 0.004102), (119, 0.003828), (120, 0.003621), (121, 0.003496), (122, 0.003366), (123, 0.003167)], ('rotation_euler', 2): [(1, -0.021794), (2, -0.020714), (3, -0.02008), (4, -0.019484), (5, -0.017329), (6, -0.013735), (7, -0.009082), (8, -0.003491), (9, 0.001821), (10, 0.005862), (11, 0.009056), (12, 0.0117), (13, 0.013756), (14, 0.015384), (15, 0.016832), (16, 0.018026), (17, 0.018922), (18, 0.019607), (19, 0.019909), (20, 0.01978), (21, 0.019198), (22, 0.018342), (23, 0.01742), (24, 0.016505), (25, 0.015809), (26, 0.015805), (27, 0.017245), (28, 0.019821), (29, 0.022721), (30, 0.025567), (31, 0.027395), (32, 0.027612), (33, 0.02672), (34, 0.025267), (35, 0.023578), (36, 0.021982), (37, 0.020771), (38, 0.019991), (39, 0.01956), (40, 0.019165), (41, 0.018073), (42, 0.016), (43, 0.013668), (44, 0.011918), (45, 0.011664), (46, 0.013483), (47, 0.016689), (48, 0.020184), (49, 0.023229), (50, 0.025525), (51, 0.026993), (52, 0.027915), (53, 0.028423), (54, 0.028163), (55, 0.026935), (56, 0.024534), (57, 0.020948), (58, 0.016566), (59, 0.012074), (60, 0.00798), (61, 0.004331), (62, 0.001499), (63, -0.000533), (64, -0.002183), (65, -0.002799), (66, -0.001889), (67, 3.6e-05), (68, 0.002377), (69, 0.004449), (70, 0.005663), (71, 0.005946), (72, 0.005815), (73, 0.005823), (74, 0.006223), (75, 0.007599), (76, 0.009782), (77, 0.011791), (78, 0.0133), (79, 0.013938), (80, 0.013417), (81, 0.012229), (82, 0.010936), (83, 0.00977), (84, 0.008919), (85, 0.008355), (86, 0.007841), (87, 0.007333), (88, 0.00678), (89, 0.006159), (90, 0.005606), (91, 0.005173), (92, 0.004876), (93, 0.004717), (94, 0.004604), (95, 0.004531), (96, 0.004514), (97, 0.004597), (98, 0.004837), (99, 0.005377), (100, 0.006689), (101, 0.00885), (102, 0.01148), (103, 0.014115), (104, 0.015973), (105, 0.0163), (106, 0.015051), (107, 0.01277), (108, 0.009968), (109, 0.006931), (110, 0.003729), (111, 0.000343), (112, -0.003263), (113, -0.007145), (114, -0.011796), (115, -0.016786), (116, -0.020991), (117, -0.024555), (118, -0.026874), (119, -0.027018), (120, -0.02604), (121, -0.024719), (122, -0.023281), (123, -0.021928)]}), 'HANDYCAM_RUN': ('HandyCam Run', 24.0, {('location', 0): [(0, -0.01776), (1, -0.020441), (2, -0.02396), (3, -0.029392), (4, -0.035781), (5, -0.042153), (6, -0.047954), (7, -0.052314), (8, -0.056004), (9, -0.059061), (10, -0.060912), (11, -0.062539), (12, -0.063192), (13, -0.06135), (14, -0.057721), (15, -0.053152), (16, -0.047561), (17, -0.041731), (18, -0.037374), (19, -0.034749), (20, -0.032649), (21, -0.030528), (22, -0.028348), (23, -0.025828), (24, -0.022658), (25, -0.018748), (26, -0.014897), (27, -0.011778), (28, -0.008471), (29, -0.00457), (30, -0.001448), (31, 0.000633), (32, 0.002837), (33, 0.005068), (34, 0.007113), (35, 0.009364), (36, 0.012143), (37, 0.015852), (38, 0.018178), (39, 0.017865), (40, 0.018472), (41, 0.019394), (42, 0.017804), (43, 0.016205), (44, 0.014672), (45, 0.010634), (46, 0.005037), (47, -0.000305), (48, -0.004398), (49, -0.007329), (50, -0.009853), (51, -0.011361), (52, -0.011303), (53, -0.010754), (54, -0.01028), (55, -0.009473), (56, -0.008518), (57, -0.008666), (58, -0.01083), (59, -0.013243), (60, -0.014402), (61, -0.016053), (62, -0.017488), (63, -0.017671), (64, -0.020441)], ('location', 1): [(0, 0.0005), (1, 0.007948), (2, 0.009587), (3, 0.005775), (4, -0.00116), (5, -0.009195), (6, -0.018055), (7, -0.022637), (8, -0.021233), (9, -0.018738), (10, -0.012144), (11, -0.00371), (12, -0.002647), (13, -0.004932), (14, -0.007374), (15, -0.01581), (16, -0.023316), (17, -0.024828), (18, -0.02413), (19, -0.019167), (20, -0.008979), (21, 0.000967), (22, 0.008697), (23, 0.011537), (24, 0.009443), (25, 0.002179), (26, -0.010399), (27, -0.016652), (28, -0.01868), (29, -0.016839), (30, -0.006438), (31, 0.003816), (32, 0.015017), (33, 0.018749), (34, 0.011238), (35, 0.0032), (36, -0.012741), (37, -0.029053), (38, -0.035686), (39, -0.036209), (40, -0.025814), (41, -0.014299), (42, -0.006979), (43, -0.004961), (44, -0.01079), (45, -0.018951), (46, -0.029019), (47, -0.030864), (48, -0.026783), (49, -0.022926), (50, -0.013857), (51, -0.00297), (52, 0.001304), (53, -6.5e-05), (54, -0.001189), (55, -0.008342), (56, -0.019144), (57, -0.022374), (58, -0.022678), (59, -0.020136), (60, -0.011577), (61, -0.005809), (62, -0.001259), (63, 0.000661), (64, 0.007948)], ('location', 2): [(0, -0.005391), (1, -0.005391), (2, -0.005391), (3, -0.005391), (4, -0.005391), (5, -0.005391), (6, -0.005391), (7, -0.005391), (8, -0.005391), (9, -0.005391), (10, -0.005391), (11, -0.005391), (12, -0.005391), (13, -0.005391), (14, -0.005391), (15, -0.005391), (16, -0.005391), (17, -0.005391), (18, -0.005391), (19, -0.005391), (20, -0.005391), (21, -0.005391), (22, -0.005391), (23, -0.005391), (24, -0.005391), (25, -0.005391), (26, -0.005391), (27, -0.005391), (28, -0.005391), (29, -0.005391), (30, -0.005391), (31, -0.005391), (32, -0.005391), (33, -0.005391), (34, -0.005391), (35, -0.005391), (36, -0.005391), (37, -0.005391), (38, -0.005391), (39, -0.005391), (40, -0.005391), (41, -0.005391), (42, -0.005391), (43, -0.005391), (44, -0.005391), (45, -0.005391), (46, -0.005391), (47, -0.005391), (48, -0.005391), (49, -0.005391), (50, -0.005391), (51, -0.005391), (52, -0.005391), (53, -0.005391), (54, -0.005391), (55, -0.005391), (56, -0.005391), (57, -0.005391), (58, -0.005391), (59, -0.005391), (60, -0.005391), (61, -0.005391), (62, -0.005391), (63, -0.005391), (64, -0.005391)], ('rotation_euler', 0): [(0, -0.025596), (1, -0.036735), (2, -0.030108), (3, -0.014478), (4, 0.005734), (5, 0.01608), (6, 0.017318), (7, 0.016132), (8, 0.008823), (9, -0.00941), (10, -0.015704), (11, -0.017043), (12, -0.009645), (13, 0.011415), (14, 0.027458), (15, 0.033424), (16, 0.041844), (17, 0.049417), (18, 0.04127), (19, 0.023567), (20, -0.001007), (21, -0.015594), (22, -0.011693), (23, -0.000614), (24, 0.009784), (25, 0.022827), (26, 0.034312), (27, 0.02912), (28, 0.003863), (29, -0.018912), (30, -0.031209), (31, -0.035049), (32, -0.027213), (33, -0.012141), (34, 0.01534), (35, 0.052905), (36, 0.050837), (37, 0.043495), (38, 0.021338), (39, -0.011508), (40, -0.042248), (41, -0.062604), (42, -0.05465), (43, -0.034711), (44, -0.010179), (45, -0.001107), (46, 0.002627), (47, -0.000882), (48, -0.016582), (49, -0.025937), (50, -0.023532), (51, -0.024543), (52, -0.019414), (53, 0.012108), (54, 0.043873), (55, 0.037867), (56, 0.036217), (57, 0.029138), (58, 0.002712), (59, -0.02394), (60, -0.045936), (61, -0.054723), (62, -0.043676), (63, -0.026435), (64, -0.02642)], ('rotation_euler', 1): [(0, -0.023238), (1, -0.02643), (2, -0.023854), (3, -0.025981), (4, -0.033882), (5, -0.04793), (6, -0.049037), (7, -0.050552), (8, -0.063574), (9, -0.07181), (10, -0.069699), (11, -0.070574), (12, -0.070151), (13, -0.074938), (14, -0.082066), (15, -0.067617), (16, -0.044029), (17, -0.036039), (18, -0.029113), (19, -0.019001), (20, -0.015441), (21, -0.021264), (22, -0.026234), (23, -0.030818), (24, -0.036552), (25, -0.034998), (26, -0.028784), (27, -0.037575), (28, -0.05577), (29, -0.062489), (30, -0.05589), (31, -0.046733), (32, -0.042975), (33, -0.056436), (34, -0.072205), (35, -0.073701), (36, -0.07236), (37, -0.061041), (38, -0.050528), (39, -0.024102), (40, 0.001949), (41, 0.015498), (42, 0.018278), (43, 0.01139), (44, 0.00344), (45, -0.003694), (46, -0.005067), (47, -0.020583), (48, -0.047411), (49, -0.05938), (50, -0.050158), (51, -0.036971), (52, -0.034585), (53, -0.034205), (54, -0.029629), (55, -0.023398), (56, -0.016586), (57, -0.030123), (58, -0.032961), (59, -0.018701), (60, -0.011907), (61, -0.015034), (62, -0.02098), (63, -0.022573), (64, -0.02643)], ('rotation_euler', 2): [(0, -0.071871), (1, -0.071298), (2, -0.069715), (3, -0.068078), (4, -0.062048), (5, -0.040747), (6, -0.021076), (7, -0.004354), (8, -0.003135), (9, -0.004422), (10, -0.005421), (11, -0.005861), (12, -0.005444), (13, -0.011951), (14, -0.020798), (15, -0.021689), (16, -0.019187), (17, -0.026708), (18, -0.051748), (19, -0.062587), (20, -0.052661), (21, -0.032018), (22, -0.023176), (23, -0.013146), (24, 0.004961), (25, 0.026719), (26, 0.032956), (27, 0.037948), (28, 0.044049), (29, 0.039563), (30, 0.027857), (31, 0.019822), (32, 0.01483), (33, -0.000856), (34, -0.015537), (35, -0.005762), (36, 0.010076), (37, 0.006172), (38, -0.023949), (39, -0.03806), (40, -0.028144), (41, -0.024676), (42, -0.019484), (43, -0.000309), (44, 0.003923), (45, 0.004699), (46, 0.005128), (47, 0.018862), (48, 0.021167), (49, 0.004675), (50, -0.009374), (51, -0.008165), (52, -0.016224), (53, -0.038857), (54, -0.047585), (55, -0.044906), (56, -0.048685), (57, -0.08684), (58, -0.120676), (59, -0.11802), (60, -0.095882), (61, -0.096469), (62, -0.089472), (63, -0.072262), (64, -0.071298)]}), 'OUT_CAR_WINDOW': ('Out Car Window', 24.0, {('location', 0): [(-1, 0.009985), (0, 0.012103), (1, 0.011936), (2, 0.010596), (3, 0.010207), (4, 0.010109), (5, 0.010387), (6, 0.011021), (7, 0.010938), (8, 0.010907), (9, 0.010834), (10, 0.010901), (11, 0.011124), (12, 0.011564), (13, 0.011831), (14, 0.012136), (15, 0.011848), (16, 0.011444), (17, 0.011913), (18, 0.011699), (19, 0.011742), (20, 0.011813), (21, 0.011554), (22, 0.010921), (23, 0.010116), (24, 0.008551), (25, 0.007345), (26, 0.006583), (27, 0.005448), (28, 0.004383), (29, 0.00334), (30, 0.003317), (31, 0.003449), (32, 0.004713), (33, 0.005789), (34, 0.007833), (35, 0.010186), (36, 0.012167), (37, 0.013962), (38, 0.014537), (39, 0.015095), (40, 0.014996), (41, 0.013845), (42, 0.011558), (43, 0.008941), (44, 0.006591), (45, 0.005244), (46, 0.004128), (47, 0.004177), (48, 0.004278), (49, 0.004621), (50, 0.006247), (51, 0.008369), (52, 0.011494), (53, 0.012971), (54, 0.016548), (55, 0.019106), (56, 0.02173), (57, 0.023827), (58, 0.024763), (59, 0.024617), (60, 0.023274), (61, 0.020692), (62, 0.017841), (63, 0.015116), (64, 0.013084), (65, 0.011293), (66, 0.009612), (67, 0.008506), (68, 0.007531), (69, 0.007786), (70, 0.008322), (71, 0.009841), (72, 0.011769), (73, 0.013243), (74, 0.014214), (75, 0.015815), (76, 0.017384), (77, 0.018233), (78, 0.018593), (79, 0.018591), (80, 0.017833), (81, 0.016886), (82, 0.015071), (83, 0.013927), (84, 0.012319), (85, 0.010793), (86, 0.009688), (87, 0.008767), (88, 0.008402), (89, 0.008101), (90, 0.008507), (91, 0.008503), (92, 0.008346), (93, 0.008106), (94, 0.008636), (95, 0.00951), (96, 0.010287), (97, 0.010587), (98, 0.011214), (99, 0.012083), (100, 0.013114), (101, 0.013787), (102, 0.013975), (103, 0.01458), (104, 0.014881), (105, 0.014531), (106, 0.013785), (107, 0.012366), (108, 0.011185), (109, 0.00968), (110, 0.007415), (111, 0.004267), (112, 0.001739), (113, -0.000875), (114, -0.002272), (115, -0.002962), (116, -0.003587), (117, -0.002485), (118, -0.001256), (119, 0.000775), (120, 0.002304), (121, 0.003353), (122, 0.003526), (123, 0.004071), (124, 0.003896), (125, 0.002613), (126, 0.001718), (127, -0.000482), (128, -0.002422), (129, -0.005701), (130, -0.008357), (131, -0.01193), (132, -0.01488), (133, -0.017145), (134, -0.019821), (135, -0.020599), (136, -0.020646), (137, -0.019693), (138, -0.01876), (139, -0.017593), (140, -0.015044), (141, -0.012013), (142, -0.009387), (143, -0.007321), (144, -0.005627), (145, -0.00425), (146, -0.003187), (147, -0.003285), (148, -0.003565), (149, -0.00442), (150, -0.005105), (151, -0.003663), (152, -0.002952), (153, -0.002558), (154, -0.001537), (155, 0.000946), (156, 0.002393), (157, 0.004293), (158, 0.006374), (159, 0.010092)], ('location', 1): [(-1, -0.008317), (0, -0.008898), (1, -0.008531), (2, -0.008319), (3, -0.007873), (4, -0.007348), (5, -0.00769), (6, -0.00788), (7, -0.007245), (8, -0.005463), (9, -0.004093), (10, -0.003866), (11, -0.003994), (12, -0.004281), (13, -0.004103), (14, -0.002765), (15, -0.000893), (16, 0.000923), (17, 0.001776), (18, 0.002532), (19, 0.002835), (20, 0.001692), (21, -2.7e-05), (22, -0.002085), (23, -0.003551), (24, -0.004532), (25, -0.0038), (26, -0.002383), (27, -1.8e-05), (28, 0.003729), (29, 0.007911), (30, 0.01198), (31, 0.01486), (32, 0.015895), (33, 0.015254), (34, 0.013668), (35, 0.010749), (36, 0.006701), (37, 0.002035), (38, -0.003249), (39, -0.008258), (40, -0.01118), (41, -0.012694), (42, -0.009995), (43, -0.004983), (44, 0.001766), (45, 0.006724), (46, 0.010962), (47, 0.013295), (48, 0.014559), (49, 0.015521), (50, 0.014994), (51, 0.014382), (52, 0.012061), (53, 0.010776), (54, 0.00791), (55, 0.005144), (56, 0.001426), (57, -0.002384), (58, -0.004588), (59, -0.005326), (60, -0.002773), (61, 0.001072), (62, 0.006732), (63, 0.01239), (64, 0.018204), (65, 0.022698), (66, 0.02581), (67, 0.027134), (68, 0.026756), (69, 0.023891), (70, 0.019766), (71, 0.015021), (72, 0.010488), (73, 0.007521), (74, 0.006187), (75, 0.005523), (76, 0.005156), (77, 0.005793), (78, 0.006204), (79, 0.005819), (80, 0.006792), (81, 0.008377), (82, 0.010883), (83, 0.01261), (84, 0.013904), (85, 0.014676), (86, 0.013805), (87, 0.012945), (88, 0.01081), (89, 0.007989), (90, 0.005502), (91, 0.00343), (92, 0.001437), (93, 0.000184), (94, -0.000189), (95, 0.000893), (96, 0.001667), (97, 0.002573), (98, 0.003046), (99, 0.003345), (100, 0.003317), (101, 0.002366), (102, 0.000613), (103, -0.002042), (104, -0.004928), (105, -0.007934), (106, -0.010101), (107, -0.011437), (108, -0.01273), (109, -0.01276), (110, -0.011627), (111, -0.009464), (112, -0.00714), (113, -0.006153), (114, -0.005917), (115, -0.00602), (116, -0.006542), (117, -0.008734), (118, -0.011175), (119, -0.013073), (120, -0.015985), (121, -0.017659), (122, -0.019983), (123, -0.022311), (124, -0.023691), (125, -0.024199), (126, -0.023782), (127, -0.023294), (128, -0.022948), (129, -0.0217), (130, -0.020299), (131, -0.018189), (132, -0.016413), (133, -0.014272), (134, -0.013313), (135, -0.01187), (136, -0.011687), (137, -0.011769), (138, -0.012452), (139, -0.014302), (140, -0.015666), (141, -0.018227), (142, -0.020437), (143, -0.021995), (144, -0.023532), (145, -0.025311), (146, -0.026539), (147, -0.025013), (148, -0.023382), (149, -0.020595), (150, -0.017884), (151, -0.014254), (152, -0.010704), (153, -0.00749), (154, -0.004744), (155, -0.003315), (156, -0.004389), (157, -0.005531), (158, -0.006413), (159, -0.008312)], ('location', 2): [(-1, -0.022019), (0, -0.022234), (1, -0.021511), (2, -0.018667), (3, -0.01638), (4, -0.015092), (5, -0.014506), (6, -0.013627), (7, -0.011573), (8, -0.010045), (9, -0.009347), (10, -0.009141), (11, -0.008742), (12, -0.008536), (13, -0.008147), (14, -0.008447), (15, -0.008401), (16, -0.007965), (17, -0.006912), (18, -0.006897), (19, -0.006456), (20, -0.004841), (21, -0.002589), (22, -0.000358), (23, 0.001455), (24, 0.00294), (25, 0.003689), (26, 0.003157), (27, 0.002189), (28, 0.000784), (29, -0.000483), (30, -0.001636), (31, -0.002431), (32, -0.001374), (33, -0.000348), (34, 0.001217), (35, 0.003356), (36, 0.005813), (37, 0.008431), (38, 0.010093), (39, 0.011179), (40, 0.011609), (41, 0.011477), (42, 0.011577), (43, 0.011063), (44, 0.009396), (45, 0.006895), (46, 0.004958), (47, 0.003802), (48, 0.003265), (49, 0.002847), (50, 0.00312), (51, 0.00295), (52, 0.004182), (53, 0.006522), (54, 0.009873), (55, 0.012725), (56, 0.014945), (57, 0.016286), (58, 0.016935), (59, 0.017825), (60, 0.017857), (61, 0.016797), (62, 0.014304), (63, 0.011444), (64, 0.008055), (65, 0.004994), (66, 0.003287), (67, 0.002446), (68, 0.003296), (69, 0.004309), (70, 0.005996), (71, 0.00855), (72, 0.011302), (73, 0.01421), (74, 0.015919), (75, 0.016436), (76, 0.016333), (77, 0.017035), (78, 0.016647), (79, 0.015697), (80, 0.014428), (81, 0.014286), (82, 0.013882), (83, 0.013673), (84, 0.01409), (85, 0.014864), (86, 0.015832), (87, 0.017812), (88, 0.019629), (89, 0.021537), (90, 0.023145), (91, 0.024517), (92, 0.026051), (93, 0.027035), (94, 0.026881), (95, 0.026678), (96, 0.026331), (97, 0.026839), (98, 0.027666), (99, 0.028223), (100, 0.0286), (101, 0.029908), (102, 0.031536), (103, 0.032758), (104, 0.034147), (105, 0.035707), (106, 0.037265), (107, 0.038119), (108, 0.038416), (109, 0.037783), (110, 0.035872), (111, 0.032607), (112, 0.028745), (113, 0.024858), (114, 0.020654), (115, 0.016018), (116, 0.011828), (117, 0.008864), (118, 0.006319), (119, 0.004242), (120, 0.001535), (121, 4.7e-05), (122, -0.001158), (123, -0.002746), (124, -0.003846), (125, -0.005443), (126, -0.007439), (127, -0.009611), (128, -0.012209), (129, -0.014256), (130, -0.015752), (131, -0.01767), (132, -0.019891), (133, -0.021168), (134, -0.02153), (135, -0.022594), (136, -0.024025), (137, -0.024488), (138, -0.024693), (139, -0.024135), (140, -0.023365), (141, -0.021433), (142, -0.019315), (143, -0.016998), (144, -0.014647), (145, -0.013247), (146, -0.012632), (147, -0.012461), (148, -0.013861), (149, -0.014691), (150, -0.01712), (151, -0.016432), (152, -0.0186), (153, -0.020775), (154, -0.023754), (155, -0.024667), (156, -0.02436), (157, -0.02383), (158, -0.022855), (159, -0.022006)], ('rotation_euler', 0): [(-1, -0.015219), (0, -0.01516), (1, -0.015067), (2, -0.014754), (3, -0.015326), (4, -0.013451), (5, -0.012049), (6, -0.011697), (7, -0.011753), (8, -0.011141), (9, -0.008984), (10, -0.007039), (11, -0.00644), (12, -0.006467), (13, -0.006741), (14, -0.006858), (15, -0.006098), (16, -0.004363), (17, -0.002452), (18, -0.000777), (19, -0.000634), (20, -0.000663), (21, -0.001045), (22, -0.00185), (23, -0.003404), (24, -0.005294), (25, -0.006206), (26, -0.005624), (27, -0.004348), (28, -0.000822), (29, 0.004487), (30, 0.010348), (31, 0.015382), (32, 0.017623), (33, 0.018664), (34, 0.017924), (35, 0.015609), (36, 0.0116), (37, 0.006775), (38, 0.000204), (39, -0.006013), (40, -0.012293), (41, -0.015628), (42, -0.017048), (43, -0.015532), (44, -0.009726), (45, -0.001017), (46, 0.005321), (47, 0.009321), (48, 0.011269), (49, 0.012521), (50, 0.013759), (51, 0.013781), (52, 0.013077), (53, 0.01078), (54, 0.008036), (55, 0.002929), (56, -0.002382), (57, -0.006661), (58, -0.011817), (59, -0.013968), (60, -0.014578), (61, -0.012577), (62, -0.007219), (63, 0.001844), (64, 0.010089), (65, 0.018245), (66, 0.023153), (67, 0.025738), (68, 0.026407), (69, 0.026337), (70, 0.022059), (71, 0.016131), (72, 0.010637), (73, 0.005847), (74, 0.002147), (75, 0.001274), (76, 0.000433), (77, -0.000595), (78, -0.000782), (79, -0.000342), (80, -0.000792), (81, -0.00054), (82, 0.000715), (83, 0.003422), (84, 0.005379), (85, 0.005817), (86, 0.00695), (87, 0.007425), (88, 0.007834), (89, 0.006851), (90, 0.004309), (91, 0.001465), (92, 0.00017), (93, -0.001769), (94, -0.003342), (95, -0.004075), (96, -0.003859), (97, -0.003338), (98, -0.002952), (99, -0.002873), (100, -0.002936), (101, -0.003061), (102, -0.003472), (103, -0.004249), (104, -0.005604), (105, -0.008614), (106, -0.012312), (107, -0.014215), (108, -0.015783), (109, -0.017528), (110, -0.018372), (111, -0.01815), (112, -0.014908), (113, -0.011762), (114, -0.011861), (115, -0.011836), (116, -0.011627), (117, -0.011922), (118, -0.01338), (119, -0.016142), (120, -0.018214), (121, -0.02173), (122, -0.024561), (123, -0.029378), (124, -0.03634), (125, -0.038539), (126, -0.038737), (127, -0.038066), (128, -0.036698), (129, -0.034637), (130, -0.033194), (131, -0.033054), (132, -0.032024), (133, -0.031581), (134, -0.031047), (135, -0.030512), (136, -0.029293), (137, -0.028976), (138, -0.028864), (139, -0.029155), (140, -0.031295), (141, -0.033781), (142, -0.038678), (143, -0.043678), (144, -0.046933), (145, -0.048219), (146, -0.049996), (147, -0.051857), (148, -0.050972), (149, -0.046133), (150, -0.040489), (151, -0.034779), (152, -0.028983), (153, -0.023031), (154, -0.01958), (155, -0.016593), (156, -0.013864), (157, -0.013702), (158, -0.014602), (159, -0.015371)], ('rotation_euler', 1): [(-1, -2.9e-05), (0, 0.0), (1, -1.6e-05), (2, -0.000696), (3, -0.001462), (4, -0.002012), (5, -0.00214), (6, -0.002656), (7, -0.003342), (8, -0.003989), (9, -0.004572), (10, -0.004935), (11, -0.004892), (12, -0.005075), (13, -0.005384), (14, -0.005906), (15, -0.006134), (16, -0.006771), (17, -0.00642), (18, -0.006352), (19, -0.006518), (20, -0.006672), (21, -0.006829), (22, -0.006684), (23, -0.006812), (24, -0.007133), (25, -0.007468), (26, -0.008098), (27, -0.009119), (28, -0.010153), (29, -0.01116), (30, -0.010519), (31, -0.00905), (32, -0.007688), (33, -0.007964), (34, -0.008287), (35, -0.008417), (36, -0.008209), (37, -0.007717), (38, -0.00511), (39, -0.001622), (40, 0.001066), (41, 0.002345), (42, 0.001056), (43, -2.4e-05), (44, -0.001506), (45, -0.001554), (46, -0.001999), (47, -0.00274), (48, -0.003149), (49, -0.00284), (50, -0.002222), (51, -0.002697), (52, -0.00288), (53, -0.003402), (54, -0.003458), (55, -0.003355), (56, -0.001714), (57, 0.000496), (58, 0.002835), (59, 0.005663), (60, 0.003964), (61, 0.002341), (62, 0.000683), (63, -0.001855), (64, -0.004063), (65, -0.005748), (66, -0.006612), (67, -0.007653), (68, -0.009188), (69, -0.009799), (70, -0.010205), (71, -0.009417), (72, -0.009903), (73, -0.010722), (74, -0.009065), (75, -0.007781), (76, -0.007501), (77, -0.006805), (78, -0.005943), (79, -0.004954), (80, -0.004693), (81, -0.004155), (82, -0.004662), (83, -0.004135), (84, -0.00417), (85, -0.004301), (86, -0.003908), (87, -0.003996), (88, -0.003804), (89, -0.002981), (90, -0.002905), (91, -0.003113), (92, -0.003363), (93, -0.003393), (94, -0.003253), (95, -0.003425), (96, -0.003297), (97, -0.003799), (98, -0.003962), (99, -0.004335), (100, -0.004073), (101, -0.003834), (102, -0.003127), (103, -0.002334), (104, -0.001352), (105, -0.001276), (106, -0.000845), (107, -0.000471), (108, -0.00033), (109, -0.000385), (110, -0.000674), (111, -0.001126), (112, -0.001789), (113, -0.002407), (114, -0.00295), (115, -0.002728), (116, -0.002027), (117, -0.001253), (118, 7e-05), (119, 0.000332), (120, 0.001248), (121, 0.001325), (122, 0.002144), (123, 0.001718), (124, 0.001576), (125, 0.002084), (126, 0.003156), (127, 0.003557), (128, 0.004037), (129, 0.004358), (130, 0.004207), (131, 0.004246), (132, 0.004395), (133, 0.003792), (134, 0.003259), (135, 0.002432), (136, 0.002286), (137, 0.001947), (138, 0.001175), (139, 0.000376), (140, -0.00014), (141, -0.000211), (142, -0.00017), (143, -0.000424), (144, 8.5e-05), (145, 2.5e-05), (146, 0.0), (147, -0.000306), (148, -0.000709), (149, -0.000346), (150, -0.001067), (151, -0.001324), (152, -0.001657), (153, -0.001947), (154, -0.002137), (155, -0.002073), (156, -0.002005), (157, -0.001974), (158, -0.001039), (159, -4.9e-05)], ('rotation_euler', 2): [(-1, 7e-06), (0, 0.0), (1, 6.1e-05), (2, -0.000588), (3, -0.001006), (4, -0.002324), (5, -0.002587), (6, -0.001503), (7, -0.001568), (8, -0.001993), (9, -0.002454), (10, -0.002165), (11, -0.001512), (12, -0.000933), (13, -0.000591), (14, 0.000112), (15, 0.000461), (16, 9.5e-05), (17, -0.000253), (18, -0.000927), (19, -0.000615), (20, -0.000308), (21, -9e-06), (22, 0.000165), (23, 0.000625), (24, 0.00055), (25, 0.000778), (26, 0.001077), (27, 0.00128), (28, 0.001204), (29, 0.000437), (30, 0.000731), (31, 0.000805), (32, 0.001194), (33, 0.000496), (34, -0.000154), (35, -0.00145), (36, -0.002511), (37, -0.002468), (38, -0.002663), (39, -0.001803), (40, -0.000197), (41, 0.001374), (42, 0.001241), (43, 0.000586), (44, 0.000274), (45, 0.000926), (46, 0.000979), (47, 0.001146), (48, 0.000885), (49, 0.000213), (50, 0.000286), (51, 0.00016), (52, 0.000496), (53, -0.000805), (54, -0.00098), (55, -0.002502), (56, -0.002518), (57, -0.00182), (58, -0.001613), (59, -0.001804), (60, -0.001704), (61, -0.000662), (62, 0.00058), (63, 0.000977), (64, 0.000812), (65, 0.001649), (66, 0.002206), (67, 0.002111), (68, 0.001347), (69, 0.001311), (70, 0.001708), (71, 0.003385), (72, 0.003886), (73, 0.003097), (74, 0.001558), (75, 0.002207), (76, 0.003474), (77, 0.003983), (78, 0.00433), (79, 0.005043), (80, 0.005398), (81, 0.005715), (82, 0.005448), (83, 0.005498), (84, 0.004797), (85, 0.004624), (86, 0.00487), (87, 0.005143), (88, 0.004995), (89, 0.004235), (90, 0.004574), (91, 0.005047), (92, 0.004861), (93, 0.004089), (94, 0.0044), (95, 0.005806), (96, 0.006597), (97, 0.006064), (98, 0.005325), (99, 0.00553), (100, 0.005953), (101, 0.005651), (102, 0.004672), (103, 0.00462), (104, 0.00485), (105, 0.004554), (106, 0.003209), (107, 0.002342), (108, 0.002285), (109, 0.002719), (110, 0.002674), (111, 0.002722), (112, 0.004696), (113, 0.005828), (114, 0.00634), (115, 0.007134), (116, 0.008567), (117, 0.01042), (118, 0.010567), (119, 0.011531), (120, 0.01135), (121, 0.009416), (122, 0.006335), (123, 0.00708), (124, 0.007421), (125, 0.006994), (126, 0.007953), (127, 0.008566), (128, 0.009644), (129, 0.009602), (130, 0.009985), (131, 0.010203), (132, 0.011138), (133, 0.011484), (134, 0.010044), (135, 0.009447), (136, 0.009449), (137, 0.009935), (138, 0.0099), (139, 0.009038), (140, 0.008117), (141, 0.006803), (142, 0.004062), (143, 0.001302), (144, -0.000569), (145, -0.000729), (146, -0.001038), (147, -0.001551), (148, -0.001312), (149, -0.000269), (150, 0.000558), (151, 0.002068), (152, 0.001911), (153, 0.001469), (154, 0.001006), (155, 0.001945), (156, 0.001092), (157, -7.6e-05), (158, -0.0013), (159, 4.4e-05)]}), 'BIKE_ON_GRAVEL_2D': ('Bike On Gravel (2D)', 24.0, {('rotation_euler', 0): [(-1, -7.8e-05), (0, 0.0), (1, 8.5e-05), (2, 0.00081), (3, -0.066465), (4, -0.057542), (5, -0.033001), (6, -0.012458), (7, -0.074098), (8, -0.039907), (9, 0.015724), (10, -0.068089), (11, -0.13964), (12, -0.028404), (13, -0.041543), (14, -0.048633), (15, -0.096246), (16, -0.212581), (17, -0.157675), (18, -0.131935), (19, -0.147113), (20, -0.19916), (21, -0.269824), (22, -0.199037), (23, -0.125103), (24, -0.170847), (25, -0.192168), (26, -0.076199), (27, -0.13119), (28, -0.211039), (29, -0.149041), (30, -0.042445), (31, -0.130906), (32, -0.11213), (33, -0.02656), (34, -0.021638), (35, -0.005938), (36, -0.007441), (37, -0.068062), (38, -0.105772), (39, -0.124324), (40, 0.026162), (41, 0.000382), (42, 0.045858), (43, 0.047309), (44, -0.042892), (45, -0.036843), (46, -0.025342), (47, -0.003964), (48, -0.040739), (49, -0.082334), (50, 0.092071), (51, 0.036501), (52, -0.131504), (53, 0.025213), (54, 0.108789), (55, -0.059837), (56, 0.086976), (57, 0.129223), (58, 0.097298), (59, 0.098135), (60, -0.040527), (61, -0.09163), (62, 0.104583), (63, -0.053018), (64, -0.072825), (65, 0.048346), (66, -0.036054), (67, 0.001736), (68, 0.06619), (69, -0.061916), (70, -0.02088), (71, -0.000243), (72, -0.041029), (73, -0.055794), (74, -0.103323), (75, 0.000698), (76, 0.036851), (77, -0.119682), (78, 0.016292), (79, -0.073771), (80, 0.037467), (81, 0.00194), (82, 0.024659), (83, 0.138218), (84, 0.051696), (85, 0.139265), (86, 0.189935), (87, 0.105093), (88, 0.155971), (89, 0.163328), (90, 0.013233), (91, 0.034089), (92, 0.004731), (93, -0.133469), (94, -0.040586), (95, -0.093119), (96, -0.175385), (97, -0.003623), (98, -0.123718), (99, 0.006529), (100, 0.027292), (101, -0.097547), (102, -0.140673), (103, 0.066518), (104, 0.085386), (105, -0.05753), (106, -0.039356), (107, 0.172075), (108, 0.088864), (109, -0.046416), (110, 0.051081), (111, 0.118495), (112, -0.028568), (113, 0.001808), (114, 0.06002), (115, -0.02669), (116, -0.069613), (117, 0.013295), (118, 0.088957), (119, -0.003677), (120, -0.008877), (121, 0.062937), (122, 0.076262), (123, -0.014165), (124, -0.022118), (125, -0.021977)], ('rotation_euler', 1): [(-1, -5.1e-05), (0, 0.0), (1, 5.1e-05), (2, 0.005789), (3, 0.022931), (4, 0.014551), (5, 0.018471), (6, 0.01966), (7, 0.010913), (8, 0.014265), (9, -0.015017), (10, -0.023578), (11, -0.008681), (12, -0.022787), (13, -0.019015), (14, 0.020081), (15, 0.00092), (16, -0.040722), (17, -0.063286), (18, -0.016453), (19, -0.005134), (20, 0.022189), (21, 0.009332), (22, 0.023363), (23, 0.021832), (24, 0.053875), (25, 0.067943), (26, 0.08122), (27, 0.068997), (28, 0.080551), (29, 0.092582), (30, 0.025739), (31, 0.030359), (32, 0.069189), (33, 0.043819), (34, 0.052897), (35, 0.033502), (36, -0.006116), (37, -0.027786), (38, -0.082804), (39, -0.136983), (40, -0.139252), (41, -0.132822), (42, -0.11302), (43, -0.065593), (44, -0.029751), (45, -0.036599), (46, -0.023817), (47, -0.03096), (48, -0.039133), (49, 0.000629), (50, -0.02257), (51, 0.013025), (52, 0.011688), (53, -0.03195), (54, -0.035589), (55, -0.035869), (56, -0.038899), (57, -0.016037), (58, 0.003176), (59, -0.013861), (60, -0.028898), (61, -0.032104), (62, -0.026038), (63, -0.017471), (64, -0.023815), (65, -0.019076), (66, 0.014886), (67, 0.035025), (68, 0.00408), (69, 0.045702), (70, 0.073253), (71, 0.057753), (72, 0.016473), (73, 0.018774), (74, 0.069347), (75, 0.045695), (76, 0.033439), (77, 0.060715), (78, 0.002863), (79, 0.012014), (80, -0.005685), (81, -0.02526), (82, -0.02337), (83, -0.046605), (84, -0.061309), (85, -0.04928), (86, -0.059683), (87, -0.054441), (88, -0.030998), (89, -0.014556), (90, 0.01067), (91, 0.025175), (92, 0.035505), (93, 0.047781), (94, 0.046803), (95, 0.046871), (96, 0.069884), (97, 0.063584), (98, 0.081913), (99, 0.037987), (100, 0.018464), (101, 0.047135), (102, 0.052887), (103, 0.020454), (104, 0.006535), (105, 0.011469), (106, 0.017922), (107, -0.020735), (108, -0.014746), (109, -0.01359), (110, -0.045896), (111, -0.053825), (112, -0.030251), (113, -0.036521), (114, -0.048836), (115, -0.029618), (116, -0.008341), (117, -0.017298), (118, -0.025781), (119, -0.011496), (120, 0.013072), (121, -0.007556), (122, -0.011296), (123, -0.003484), (124, -0.000423), (125, -0.000222)], ('rotation_euler', 2): [(-1, 0.000115), (0, 0.0), (1, -0.000115), (2, 0.012355), (3, 0.007266), (4, 0.000596), (5, 0.001994), (6, -2.9e-05), (7, 7.9e-05), (8, 0.004377), (9, -0.002482), (10, 0.008551), (11, 0.008848), (12, -0.003365), (13, 0.012423), (14, 0.035599), (15, 0.010341), (16, -0.00241), (17, 0.001513), (18, 0.019245), (19, 0.022397), (20, 0.02056), (21, 0.017108), (22, 0.013478), (23, 0.012115), (24, 0.014514), (25, 0.020617), (26, 0.011193), (27, 0.0122), (28, 0.015489), (29, -0.001103), (30, -0.007525), (31, 0.000752), (32, 0.008059), (33, -0.000116), (34, 0.005341), (35, -0.007375), (36, -0.00985), (37, -0.024105), (38, -0.034448), (39, -0.043014), (40, -0.037553), (41, -0.025343), (42, -0.00614), (43, 0.018928), (44, 0.009054), (45, 0.005502), (46, 0.009183), (47, 0.006137), (48, 0.006818), (49, 0.015242), (50, 0.000257), (51, 0.018763), (52, 0.009625), (53, -0.008605), (54, -0.004001), (55, 0.012561), (56, 0.000322), (57, 0.025154), (58, 0.016492), (59, 0.005673), (60, -0.000821), (61, 0.004525), (62, -0.002299), (63, 0.009672), (64, 0.007892), (65, 0.002255), (66, 0.027348), (67, 0.019554), (68, 0.017771), (69, 0.032883), (70, 0.031821), (71, 0.026788), (72, 0.020689), (73, 0.033744), (74, 0.044025), (75, 0.021184), (76, 0.030286), (77, 0.034664), (78, 0.020513), (79, 0.022206), (80, 0.001767), (81, 0.006144), (82, 0.002578), (83, -0.014181), (84, -0.017631), (85, -0.022513), (86, -0.028638), (87, -0.017192), (88, -0.0099), (89, 0.000394), (90, 0.017831), (91, 0.022404), (92, 0.02428), (93, 0.038699), (94, 0.025923), (95, 0.040003), (96, 0.046128), (97, 0.02948), (98, 0.033547), (99, 0.000345), (100, 0.005853), (101, 0.021029), (102, 0.028148), (103, -0.017657), (104, -0.012742), (105, -0.00284), (106, 0.015936), (107, -0.057214), (108, -0.027564), (109, -0.00598), (110, -0.049766), (111, -0.054199), (112, -0.015571), (113, -0.026799), (114, -0.036355), (115, -0.025322), (116, -0.010661), (117, -0.028551), (118, -0.037166), (119, -0.015049), (120, 8.9e-05), (121, -0.029958), (122, -0.025), (123, -0.007644), (124, -3.9e-05), (125, -0.00016)]}), 'SPACESHIP_SHAKE_2D': ('Spaceship Shake (2D)', 24.0, {('rotation_euler', 0): [(1, -0.003631), (2, 0.0), (3, 0.00363), (4, 0.005901), (5, 0.004899), (6, 0.00174), (7, -0.001893), (8, -0.006758), (9, -0.012088), (10, -0.01473), (11, -0.013647), (12, -0.009205), (13, -0.004117), (14, -0.00106), (15, -0.001243), (16, -0.003038), (17, -0.002273), (18, 0.001257), (19, 0.003089), (20, 0.001158), (21, -0.001834), (22, -0.002549), (23, -0.001662), (24, -0.000478), (25, 0.001098), (26, 0.003839), (27, 0.008085), (28, 0.011954), (29, 0.012609), (30, 0.010043), (31, 0.005102), (32, -0.000892), (33, -0.004079), (34, -0.002769), (35, 3.6e-05), (36, 0.000617), (37, -0.000448), (38, -0.003229), (39, -0.008389), (40, -0.011858), (41, -0.010768), (42, -0.006234), (43, -0.002742), (44, -0.001623), (45, -0.001303), (46, -0.000824), (47, -0.001118), (48, -0.001941), (49, -0.001953), (50, -0.000368), (51, 0.001583), (52, 0.001814), (53, 0.000569), (54, -0.002643), (55, -0.006712), (56, -0.007554), (57, -0.003706), (58, 0.001612), (59, 0.003226), (60, 0.00166), (61, -0.001151), (62, -0.00597), (63, -0.009069), (64, -0.006641), (65, -0.002389), (66, -0.000769), (67, -0.001858), (68, -0.007052), (69, -0.014319), (70, -0.016641), (71, -0.01212), (72, -0.004892), (73, 0.000739), (74, 0.002262), (75, 0.001358), (76, 0.000403), (77, 0.001168), (78, 0.003718), (79, 0.005334), (80, 0.004848), (81, 0.005137), (82, 0.006897), (83, 0.007285), (84, 0.006004), (85, 0.004565), (86, 0.003094), (87, 0.002246), (88, 0.001942), (89, 0.001859), (90, 0.001308), (91, -0.001419), (92, -0.004179), (93, -0.002092), (94, 0.002248), (95, 0.004355), (96, 0.003684), (97, 0.000305), (98, -0.003592), (99, -0.005021), (100, -0.002559), (101, 0.002739), (102, 0.006845), (103, 0.005618), (104, 0.00017), (105, -0.005742), (106, -0.007775), (107, -0.005307), (108, -0.002782), (109, -0.003979), (110, -0.006334), (111, -0.004686), (112, -0.001448), (113, -0.001378), (114, -0.003596), (115, -0.005809), (116, -0.005574), (117, -0.000943), (118, 0.005563), (119, 0.007807), (120, 0.005776), (121, 0.005226), (122, 0.006875), (123, 0.005829), (124, 0.000299), (125, -0.003887), (126, -0.004391), (127, -0.003327), (128, -0.002114), (129, -0.002206), (130, -0.00589), (131, -0.010795), (132, -0.011033), (133, -0.007454), (134, -0.00445), (135, -0.00261), (136, -0.002549), (137, -0.004611), (138, -0.006274), (139, -0.005172), (140, -0.002586), (141, -0.000846), (142, -0.001358), (143, -0.003354), (144, -0.003569)], ('rotation_euler', 1): [(1, 0.000344), (2, 0.0), (3, -0.000355), (4, -0.004007), (5, -0.008947), (6, -0.012751), (7, -0.014634), (8, -0.014101), (9, -0.010429), (10, -0.004074), (11, 0.001754), (12, 0.003431), (13, 0.00221), (14, -0.00034), (15, -0.00501), (16, -0.01125), (17, -0.018633), (18, -0.024276), (19, -0.026024), (20, -0.024716), (21, -0.021369), (22, -0.017551), (23, -0.012196), (24, -0.005527), (25, 0.002148), (26, 0.008452), (27, 0.01087), (28, 0.010188), (29, 0.007542), (30, 0.002376), (31, -0.004389), (32, -0.010846), (33, -0.015339), (34, -0.016773), (35, -0.016102), (36, -0.013242), (37, -0.009126), (38, -0.006926), (39, -0.007523), (40, -0.008613), (41, -0.007771), (42, -0.004514), (43, -0.000413), (44, 0.002315), (45, 0.001541), (46, -0.002338), (47, -0.009755), (48, -0.018101), (49, -0.024504), (50, -0.028484), (51, -0.028156), (52, -0.023105), (53, -0.0179), (54, -0.017282), (55, -0.020013), (56, -0.023964), (57, -0.027865), (58, -0.030274), (59, -0.028398), (60, -0.023137), (61, -0.018565), (62, -0.016186), (63, -0.013079), (64, -0.009046), (65, -0.005069), (66, 6e-05), (67, 0.005245), (68, 0.007771), (69, 0.006907), (70, 0.003327), (71, -0.000642), (72, -0.00349), (73, -0.006051), (74, -0.010785), (75, -0.017289), (76, -0.022254), (77, -0.023226), (78, -0.020409), (79, -0.016038), (80, -0.010852), (81, -0.005655), (82, -0.002369), (83, 0.000113), (84, 0.002529), (85, 0.002759), (86, 0.00074), (87, -0.002415), (88, -0.004278), (89, -0.003723), (90, -0.000672), (91, 0.003888), (92, 0.00797), (93, 0.009256), (94, 0.006226), (95, 0.001193), (96, -0.003605), (97, -0.006414), (98, -0.00785), (99, -0.006982), (100, -0.003013), (101, 0.002482), (102, 0.0064), (103, 0.005969), (104, 0.001375), (105, -0.003439), (106, -0.007599), (107, -0.010674), (108, -0.009495), (109, -0.00455), (110, 0.000616), (111, 0.004907), (112, 0.007616), (113, 0.009257), (114, 0.010875), (115, 0.011833), (116, 0.014674), (117, 0.019964), (118, 0.024069), (119, 0.024337), (120, 0.022196), (121, 0.018387), (122, 0.014791), (123, 0.012672), (124, 0.011782), (125, 0.011792), (126, 0.011668), (127, 0.012356), (128, 0.014152), (129, 0.01489), (130, 0.013106), (131, 0.010917), (132, 0.008833), (133, 0.007221), (134, 0.007903), (135, 0.01021), (136, 0.011436), (137, 0.010453), (138, 0.006982), (139, 0.00215), (140, -0.001217), (141, -0.002648), (142, -0.002664), (143, -0.001537), (144, 0.000222)], ('rotation_euler', 2): [(1, -0.002932), (2, 0.0), (3, 0.002931), (4, 0.002776), (5, -0.000217), (6, -0.00453), (7, -0.008458), (8, -0.010412), (9, -0.0104), (10, -0.008864), (11, -0.006141), (12, -0.003665), (13, -0.001947), (14, -0.000661), (15, -0.001036), (16, -0.003134), (17, -0.00513), (18, -0.006843), (19, -0.007829), (20, -0.007286), (21, -0.006093), (22, -0.004631), (23, -0.001721), (24, 0.00377), (25, 0.009708), (26, 0.014255), (27, 0.015541), (28, 0.014101), (29, 0.011614), (30, 0.008212), (31, 0.004453), (32, 0.001959), (33, 0.000287), (34, -0.00011), (35, -4e-06), (36, 0.000273), (37, 0.003272), (38, 0.005829), (39, 0.005368), (40, 0.003048), (41, 0.002849), (42, 0.004854), (43, 0.008314), (44, 0.012435), (45, 0.014423), (46, 0.013488), (47, 0.010202), (48, 0.00514), (49, 0.002285), (50, 0.000266), (51, -0.00269), (52, -0.005167), (53, -0.006633), (54, -0.007317), (55, -0.006934), (56, -0.006086), (57, -0.005236), (58, -0.007513), (59, -0.008395), (60, -0.004792), (61, -8.2e-05), (62, 0.001287), (63, 0.00142), (64, 0.002492), (65, 0.004303), (66, 0.006114), (67, 0.008395), (68, 0.007105), (69, 0.002187), (70, -0.003055), (71, -0.005318), (72, -0.00437), (73, -0.003805), (74, -0.005359), (75, -0.007746), (76, -0.011054), (77, -0.012922), (78, -0.012644), (79, -0.010829), (80, -0.008287), (81, -0.005934), (82, -0.00517), (83, -0.006637), (84, -0.008142), (85, -0.009015), (86, -0.010082), (87, -0.011393), (88, -0.013861), (89, -0.016544), (90, -0.019479), (91, -0.020982), (92, -0.019643), (93, -0.016359), (94, -0.015503), (95, -0.017054), (96, -0.018759), (97, -0.020333), (98, -0.022106), (99, -0.024395), (100, -0.022739), (101, -0.017177), (102, -0.010967), (103, -0.006991), (104, -0.006974), (105, -0.009811), (106, -0.012154), (107, -0.013738), (108, -0.013481), (109, -0.012434), (110, -0.010963), (111, -0.008352), (112, -0.006001), (113, -0.005139), (114, -0.005446), (115, -0.007317), (116, -0.006358), (117, -0.000794), (118, 0.006454), (119, 0.009726), (120, 0.008337), (121, 0.004604), (122, 0.001486), (123, -0.001392), (124, -0.004786), (125, -0.00664), (126, -0.005917), (127, -0.004895), (128, -0.0037), (129, -0.002689), (130, -0.003634), (131, -0.004963), (132, -0.00536), (133, -0.004215), (134, -0.001849), (135, 0.001963), (136, 0.004572), (137, 0.004251), (138, 0.00256), (139, 0.001127), (140, 0.000697), (141, 0.001023), (142, 0.00061), (143, -0.000913), (144, -0.003078)]}), 'THE_ZEEK_2D': ('The Zeek (2D)', 24.0, {('rotation_euler', 0): [(0, 4e-06), (1, 0.0), (2, -4e-06), (3, 9.9e-05), (4, 0.000291), (5, 0.000413), (6, 0.00047), (7, 0.000531), (8, 0.000723), (9, 0.000864), (10, 0.000894), (11, 0.000839), (12, 0.000791), (13, 0.000733), (14, 0.00068), (15, 0.000425), (16, -4e-06), (17, -0.000395), (18, -0.000816), (19, -0.001044), (20, -0.001251), (21, -0.001502), (22, -0.001506), (23, -0.001467), (24, -0.001343), (25, -0.001227), (26, -0.001134), (27, -0.001205), (28, -0.001603), (29, -0.001973), (30, -0.002117), (31, -0.00205), (32, -0.001926), (33, -0.001917), (34, -0.002117), (35, -0.002314), (36, -0.002335), (37, -0.002347), (38, -0.002499), (39, -0.002721), (40, -0.002941), (41, -0.002918), (42, -0.002838), (43, -0.002788), (44, -0.002721), (45, -0.002763), (46, -0.002854), (47, -0.002778), (48, -0.002581), (49, -0.002255), (50, -0.002052), (51, -0.00204), (52, -0.002069), (53, -0.002005), (54, -0.001928), (55, -0.001764), (56, -0.001784), (57, -0.001788), (58, -0.001799), (59, -0.001686), (60, -0.001539), (61, -0.00132), (62, -0.001153), (63, -0.001002), (64, -0.000971), (65, -0.000863), (66, -0.000685), (67, -0.000657), (68, -0.000711), (69, -0.000953), (70, -0.001145), (71, -0.001297), (72, -0.001431), (73, -0.001735), (74, -0.002235), (75, -0.002674), (76, -0.00277), (77, -0.00265), (78, -0.002322), (79, -0.002233), (80, -0.002302), (81, -0.002309), (82, -0.002324), (83, -0.002178), (84, -0.001962), (85, -0.001984), (86, -0.002146), (87, -0.00231), (88, -0.00244), (89, -0.002547), (90, -0.002778), (91, -0.002977), (92, -0.00321), (93, -0.0034), (94, -0.003517), (95, -0.003629), (96, -0.003717), (97, -0.00377), (98, -0.003581), (99, -0.003221), (100, -0.002847), (101, -0.002693), (102, -0.002642), (103, -0.002457), (104, -0.002143), (105, -0.00191), (106, -0.001897), (107, -0.002101), (108, -0.002297), (109, -0.002357), (110, -0.002466), (111, -0.002384), (112, -0.002717), (113, -0.003), (114, -0.002959), (115, -0.00273), (116, -0.002293), (117, -0.001869), (118, -0.001588), (119, -0.001408), (120, -0.001076), (121, -0.000791), (122, -0.000589), (123, -0.000612), (124, -0.000702), (125, -0.000664), (126, -0.000662), (127, -0.000565), (128, -0.000669), (129, -0.00093), (130, -0.001135), (131, -0.001367), (132, -0.001503), (133, -0.001604), (134, -0.001791), (135, -0.00183), (136, -0.001877), (137, -0.001926), (138, -0.002022), (139, -0.002122), (140, -0.002161), (141, -0.002102), (142, -0.001796), (143, -0.00166), (144, -0.001799), (145, -0.002048), (146, -0.001988), (147, -0.001699), (148, -0.001319), (149, -0.001057), (150, -0.001246), (151, -0.001382), (152, -0.00152), (153, -0.00157), (154, -0.001593), (155, -0.001661), (156, -0.00169), (157, -0.001754), (158, -0.001691), (159, -0.001777), (160, -0.001947), (161, -0.001954), (162, -0.0019), (163, -0.001641), (164, -0.001411), (165, -0.001493), (166, -0.001541), (167, -0.001541), (168, -0.001516), (169, -0.001441), (170, -0.001462), (171, -0.001507), (172, -0.00166), (173, -0.001724), (174, -0.00175), (175, -0.001755), (176, -0.001837), (177, -0.001822), (178, -0.001649), (179, -0.001251), (180, -0.000743), (181, -0.000395), (182, -0.00027), (183, 6.3e-05), (184, 0.000339), (185, 0.000348), (186, 0.000346), (187, 0.00017), (188, 2.1e-05), (189, -0.000109), (190, -0.000506), (191, -0.001048), (192, -0.001535), (193, -0.001729), (194, -0.001705), (195, -0.001469), (196, -0.001228), (197, -0.001314), (198, -0.0014), (199, -0.001372), (200, -0.001264), (201, -0.001164), (202, -0.00116), (203, -0.001305), (204, -0.001362), (205, -0.001438), (206, -0.001425), (207, -0.001676), (208, -0.002008), (209, -0.002261), (210, -0.002165), (211, -0.001944), (212, -0.00182), (213, -0.001825), (214, -0.00184), (215, -0.00174), (216, -0.001552), (217, -0.001546), (218, -0.001594), (219, -0.001925), (220, -0.002149), (221, -0.002203), (222, -0.002225), (223, -0.002248), (224, -0.002304), (225, -0.002243), (226, -0.00222), (227, -0.002085), (228, -0.001996), (229, -0.001947), (230, -0.001878), (231, -0.001674), (232, -0.001604), (233, -0.001683), (234, -0.0017), (235, -0.001649), (236, -0.001448), (237, -0.001252), (238, -0.001127), (239, -0.001138), (240, -0.001351), (241, -0.001394), (242, -0.001255), (243, -0.001011), (244, -0.000699), (245, -0.000724), (246, -0.000805), (247, -0.000889), (248, -0.001105), (249, -0.001341), (250, -0.001493), (251, -0.001666), (252, -0.001801), (253, -0.001963), (254, -0.002069), (255, -0.00214), (256, -0.002248), (257, -0.002342), (258, -0.002243), (259, -0.002023), (260, -0.001872), (261, -0.001739), (262, -0.001828), (263, -0.001958), (264, -0.002073), (265, -0.00219), (266, -0.002273), (267, -0.002491), (268, -0.002583), (269, -0.002648), (270, -0.002808), (271, -0.00295), (272, -0.003123), (273, -0.003242), (274, -0.00325), (275, -0.003051), (276, -0.002663), (277, -0.002299), (278, -0.00216), (279, -0.002217), (280, -0.002288), (281, -0.002268), (282, -0.002216), (283, -0.002163), (284, -0.002108), (285, -0.002076), (286, -0.002044), (287, -0.002034), (288, -0.002047), (289, -0.002211), (290, -0.002238), (291, -0.001988), (292, -0.001462), (293, -0.000853), (294, -0.000391), (295, -0.00033), (296, -0.000344), (297, -0.00039), (298, -0.000389), (299, -0.000329), (300, -0.000349), (301, -0.000643), (302, -0.000923), (303, -0.00124), (304, -0.001477), (305, -0.001806), (306, -0.002114), (307, -0.002089), (308, -0.001777), (309, -0.001411), (310, -0.001159), (311, -0.001196), (312, -0.001239), (313, -0.001112), (314, -0.000888), (315, -0.000872), (316, -0.000992), (317, -0.001174), (318, -0.001493), (319, -0.001494), (320, -0.001538), (321, -0.001633), (322, -0.001666), (323, -0.001696), (324, -0.001553), (325, -0.001246), (326, -0.001056), (327, -0.001081), (328, -0.001143), (329, -0.001158), (330, -0.001146), (331, -0.001083), (332, -0.001104), (333, -0.001158), (334, -0.001213), (335, -0.001443), (336, -0.001508), (337, -0.001508), (338, -0.001381), (339, -0.001288), (340, -0.001146), (341, -0.001006), (342, -0.000787), (343, -0.000531), (344, -0.00042), (345, -0.000403), (346, -0.000375), (347, -0.000354), (348, -0.000126), (349, -2.7e-05), (350, 1.1e-05), (351, 0.00016), (352, 0.000272), (353, 0.000372), (354, 0.000323), (355, 0.00028), (356, 0.000321), (357, 0.00054), (358, 0.000883), (359, 0.001123), (360, 0.001057), (361, 0.000704), (362, 0.000477), (363, 0.000392), (364, 0.000333), (365, 0.000121), (366, -0.000215), (367, -0.000347), (368, -0.000152), (369, 5.9e-05), (370, 0.000242), (371, 1.2e-05), (372, -0.000275), (373, -0.000338), (374, -0.000226), (375, -9.4e-05), (376, 5.4e-05), (377, -8.1e-05), (378, -0.000228), (379, -0.000375), (380, -0.000535), (381, -0.000813), (382, -0.001082), (383, -0.001348), (384, -0.001508), (385, -0.001565), (386, -0.001638), (387, -0.001715), (388, -0.001887), (389, -0.001723), (390, -0.001389), (391, -0.00087), (392, -0.00055), (393, -0.000292), (394, -0.000287), (395, -0.000209), (396, -7.4e-05), (397, 5e-06), (398, 0.000115), (399, 3.7e-05), (400, -7e-06)], ('rotation_euler', 1): [(0, -9e-06), (1, 0.0), (2, 9e-06), (3, 0.000115), (4, 0.000329), (5, 0.000586), (6, 0.000568), (7, 0.000488), (8, 0.000467), (9, 0.000446), (10, 0.000452), (11, 0.000325), (12, 0.000119), (13, -3.2e-05), (14, -0.000243), (15, -0.000304), (16, -0.0002), (17, -0.000222), (18, -0.000235), (19, -0.000277), (20, -0.000448), (21, -0.000535), (22, -0.000552), (23, -0.000513), (24, -0.000247), (25, 5.7e-05), (26, 0.000309), (27, 0.000689), (28, 0.000946), (29, 0.000986), (30, 0.001), (31, 0.00118), (32, 0.001263), (33, 0.001198), (34, 0.000973), (35, 0.000668), (36, 0.000541), (37, 0.000519), (38, 0.000367), (39, 0.000245), (40, 0.000124), (41, 5.2e-05), (42, 0.000167), (43, 0.000263), (44, 0.000383), (45, 0.000486), (46, 0.000459), (47, 0.000384), (48, 0.000323), (49, 0.0003), (50, 0.000243), (51, 8.5e-05), (52, -0.000126), (53, -0.000266), (54, -0.000511), (55, -0.000678), (56, -0.00083), (57, -0.000914), (58, -0.00099), (59, -0.001009), (60, -0.001192), (61, -0.001314), (62, -0.001369), (63, -0.001316), (64, -0.001311), (65, -0.001154), (66, -0.000995), (67, -0.000904), (68, -0.000901), (69, -0.001118), (70, -0.001391), (71, -0.001542), (72, -0.001674), (73, -0.00173), (74, -0.001627), (75, -0.001472), (76, -0.001163), (77, -0.000906), (78, -0.0006), (79, -0.00027), (80, -9.6e-05), (81, 4e-06), (82, 0.000105), (83, 0.000343), (84, 0.000614), (85, 0.000951), (86, 0.000998), (87, 0.000979), (88, 0.000888), (89, 0.000679), (90, 0.000347), (91, 6e-05), (92, -0.000264), (93, -0.000548), (94, -0.000721), (95, -0.000835), (96, -0.000856), (97, -0.00087), (98, -0.000599), (99, -0.00024), (100, 0.000124), (101, 0.000661), (102, 0.001083), (103, 0.001271), (104, 0.001442), (105, 0.001458), (106, 0.001122), (107, 0.000715), (108, 0.000176), (109, -0.000348), (110, -0.000831), (111, -0.001132), (112, -0.00135), (113, -0.001652), (114, -0.00187), (115, -0.001919), (116, -0.001851), (117, -0.00176), (118, -0.001656), (119, -0.001434), (120, -0.00121), (121, -0.000918), (122, -0.000694), (123, -0.00068), (124, -0.000682), (125, -0.000869), (126, -0.001214), (127, -0.001425), (128, -0.001807), (129, -0.002291), (130, -0.002662), (131, -0.002877), (132, -0.002999), (133, -0.00302), (134, -0.002769), (135, -0.002483), (136, -0.0022), (137, -0.001909), (138, -0.001838), (139, -0.001782), (140, -0.00167), (141, -0.001545), (142, -0.001213), (143, -0.000839), (144, -0.000501), (145, -0.000482), (146, -0.000262), (147, -4.5e-05), (148, 0.000229), (149, 0.000423), (150, 0.000498), (151, 0.000511), (152, 0.000375), (153, 0.000323), (154, 0.000294), (155, 0.000297), (156, 0.00047), (157, 0.000528), (158, 0.00058), (159, 0.000542), (160, 0.000474), (161, 0.000471), (162, 0.000501), (163, 0.000572), (164, 0.00081), (165, 0.000974), (166, 0.001009), (167, 0.00101), (168, 0.000953), (169, 0.000729), (170, 0.000572), (171, 0.00041), (172, 6.3e-05), (173, -0.000248), (174, -0.000376), (175, -0.000454), (176, -0.000616), (177, -0.000652), (178, -0.000608), (179, -0.000327), (180, 8.5e-05), (181, 0.000401), (182, 0.000701), (183, 0.000861), (184, 0.001056), (185, 0.001021), (186, 0.000921), (187, 0.000575), (188, 0.000147), (189, -0.000281), (190, -0.000655), (191, -0.000853), (192, -0.000893), (193, -0.000897), (194, -0.000698), (195, -0.00044), (196, -9e-05), (197, 0.000442), (198, 0.000788), (199, 0.001159), (200, 0.001381), (201, 0.001601), (202, 0.001732), (203, 0.001724), (204, 0.001647), (205, 0.001328), (206, 0.001083), (207, 0.000744), (208, 0.00059), (209, 0.000599), (210, 0.000792), (211, 0.00101), (212, 0.001243), (213, 0.001512), (214, 0.001668), (215, 0.002001), (216, 0.002234), (217, 0.00216), (218, 0.002089), (219, 0.001761), (220, 0.00131), (221, 0.001011), (222, 0.000912), (223, 0.000848), (224, 0.000741), (225, 0.000855), (226, 0.000873), (227, 0.000919), (228, 0.000934), (229, 0.000954), (230, 0.000947), (231, 0.000949), (232, 0.000942), (233, 0.000601), (234, 0.000241), (235, -8.8e-05), (236, -0.0002), (237, -0.000283), (238, -0.000385), (239, -0.000398), (240, -0.000537), (241, -0.000779), (242, -0.000904), (243, -0.001), (244, -0.001114), (245, -0.001038), (246, -0.001024), (247, -0.001011), (248, -0.000981), (249, -0.000933), (250, -0.000909), (251, -0.000894), (252, -0.000834), (253, -0.000704), (254, -0.00062), (255, -0.000476), (256, -0.000303), (257, -0.000165), (258, -1e-06), (259, 0.000182), (260, 0.000505), (261, 0.000818), (262, 0.001141), (263, 0.001239), (264, 0.001361), (265, 0.001369), (266, 0.001291), (267, 0.001022), (268, 0.00096), (269, 0.00097), (270, 0.000952), (271, 0.001001), (272, 0.001058), (273, 0.001088), (274, 0.001074), (275, 0.001108), (276, 0.001138), (277, 0.001242), (278, 0.001529), (279, 0.001649), (280, 0.00169), (281, 0.0017), (282, 0.001407), (283, 0.001154), (284, 0.000819), (285, 0.000474), (286, 0.000249), (287, 0.000256), (288, 0.000281), (289, 0.000331), (290, 0.000361), (291, 0.000385), (292, 0.000311), (293, 0.000362), (294, 0.000377), (295, 0.000381), (296, 0.000391), (297, 0.000377), (298, 0.000337), (299, 0.000102), (300, -0.000304), (301, -0.000795), (302, -0.001133), (303, -0.001519), (304, -0.00166), (305, -0.00178), (306, -0.001625), (307, -0.001175), (308, -0.000584), (309, -8.6e-05), (310, 0.000351), (311, 0.000867), (312, 0.001192), (313, 0.001392), (314, 0.001466), (315, 0.001504), (316, 0.001467), (317, 0.00135), (318, 0.001249), (319, 0.001272), (320, 0.001366), (321, 0.00155), (322, 0.001597), (323, 0.001678), (324, 0.001838), (325, 0.002167), (326, 0.00253), (327, 0.002941), (328, 0.003048), (329, 0.00308), (330, 0.003076), (331, 0.003057), (332, 0.002919), (333, 0.002826), (334, 0.002804), (335, 0.0029), (336, 0.003066), (337, 0.003092), (338, 0.002985), (339, 0.002863), (340, 0.002686), (341, 0.002741), (342, 0.002746), (343, 0.002775), (344, 0.002849), (345, 0.002963), (346, 0.003063), (347, 0.003082), (348, 0.002959), (349, 0.00274), (350, 0.00262), (351, 0.002547), (352, 0.0024), (353, 0.002314), (354, 0.002247), (355, 0.00215), (356, 0.002073), (357, 0.002055), (358, 0.002022), (359, 0.002034), (360, 0.002111), (361, 0.002334), (362, 0.002383), (363, 0.002287), (364, 0.002199), (365, 0.002011), (366, 0.001871), (367, 0.001654), (368, 0.001365), (369, 0.001057), (370, 0.000896), (371, 0.000699), (372, 0.000709), (373, 0.000709), (374, 0.00085), (375, 0.001097), (376, 0.001358), (377, 0.001546), (378, 0.001676), (379, 0.001724), (380, 0.00155), (381, 0.001428), (382, 0.001158), (383, 0.00082), (384, 0.000459), (385, 0.00033), (386, 0.000242), (387, 0.000271), (388, 0.000373), (389, 0.000507), (390, 0.00081), (391, 0.001068), (392, 0.001208), (393, 0.001444), (394, 0.001451), (395, 0.001423), (396, 0.001267), (397, 0.001067), (398, 0.000801), (399, 0.00039), (400, 9e-06)], ('rotation_euler', 2): [(0, -6.7e-05), (1, 0.0), (2, 6.7e-05), (3, 0.0001), (4, -0.000249), (5, -0.00061), (6, -0.000531), (7, -0.000489), (8, -0.000418), (9, -0.000438), (10, -0.000583), (11, -0.000716), (12, -0.000803), (13, -0.000859), (14, -0.000947), (15, -0.001004), (16, -0.001139), (17, -0.000896), (18, -0.000478), (19, -0.000154), (20, 0.000109), (21, -0.000143), (22, -0.000132), (23, -0.000178), (24, 6.1e-05), (25, 0.000395), (26, 0.000836), (27, 0.001183), (28, 0.00137), (29, 0.001313), (30, 0.001437), (31, 0.001537), (32, 0.001452), (33, 0.001388), (34, 0.001381), (35, 0.001477), (36, 0.001335), (37, 0.001331), (38, 0.00149), (39, 0.00156), (40, 0.001674), (41, 0.00157), (42, 0.001402), (43, 0.001591), (44, 0.001643), (45, 0.001605), (46, 0.001916), (47, 0.001651), (48, 0.001702), (49, 0.001129), (50, 0.000664), (51, 0.000551), (52, 0.000218), (53, 6.1e-05), (54, -0.000132), (55, -0.000144), (56, -9.4e-05), (57, -0.000207), (58, -0.000333), (59, -0.00085), (60, -0.000929), (61, -0.000877), (62, -0.001134), (63, -0.001574), (64, -0.001505), (65, -0.001589), (66, -0.001805), (67, -0.001884), (68, -0.00225), (69, -0.002346), (70, -0.002093), (71, -0.001607), (72, -0.001267), (73, -0.001593), (74, -0.001301), (75, -0.00103), (76, -0.00096), (77, -0.00054), (78, -0.000437), (79, -0.000362), (80, -0.000424), (81, -0.000297), (82, -0.000129), (83, 0.000129), (84, 0.000545), (85, 0.000635), (86, 0.000713), (87, 0.000748), (88, 0.000535), (89, 0.000374), (90, 0.000488), (91, -0.000348), (92, -0.000468), (93, -0.000343), (94, -0.000477), (95, -0.000238), (96, -0.000141), (97, 1.4e-05), (98, 0.000142), (99, 0.000234), (100, 0.000227), (101, 0.000364), (102, 0.000672), (103, 0.000997), (104, 0.001261), (105, 0.001033), (106, 0.000877), (107, 0.00019), (108, -0.000434), (109, -0.00122), (110, -0.001524), (111, -0.002208), (112, -0.002419), (113, -0.002122), (114, -0.002397), (115, -0.002574), (116, -0.002926), (117, -0.003194), (118, -0.003222), (119, -0.002849), (120, -0.002614), (121, -0.002277), (122, -0.002304), (123, -0.002178), (124, -0.002613), (125, -0.002858), (126, -0.00287), (127, -0.003295), (128, -0.003663), (129, -0.003814), (130, -0.004117), (131, -0.004087), (132, -0.004248), (133, -0.003896), (134, -0.003775), (135, -0.003424), (136, -0.003054), (137, -0.002641), (138, -0.002398), (139, -0.002196), (140, -0.00204), (141, -0.001829), (142, -0.001778), (143, -0.001585), (144, -0.00181), (145, -0.001505), (146, -0.001432), (147, -0.000991), (148, -0.000696), (149, -0.000672), (150, -0.000289), (151, -0.0005), (152, -0.000906), (153, -0.001209), (154, -0.001338), (155, -0.001156), (156, -0.001064), (157, -0.000903), (158, -0.001301), (159, -0.001361), (160, -0.001568), (161, -0.001533), (162, -0.001572), (163, -0.001344), (164, -0.001105), (165, -0.001011), (166, -0.001084), (167, -0.001092), (168, -0.000995), (169, -0.000941), (170, -0.000997), (171, -0.001864), (172, -0.002302), (173, -0.002567), (174, -0.002725), (175, -0.002929), (176, -0.002854), (177, -0.002808), (178, -0.002602), (179, -0.00269), (180, -0.003071), (181, -0.002927), (182, -0.002499), (183, -0.002315), (184, -0.002143), (185, -0.002001), (186, -0.001933), (187, -0.001722), (188, -0.002114), (189, -0.002519), (190, -0.002444), (191, -0.002524), (192, -0.002599), (193, -0.002537), (194, -0.002391), (195, -0.00219), (196, -0.002083), (197, -0.001768), (198, -0.001535), (199, -0.001408), (200, -0.001089), (201, -0.000831), (202, -0.000784), (203, -0.000666), (204, -0.000763), (205, -0.000734), (206, -0.00103), (207, -0.001291), (208, -0.001427), (209, -0.001075), (210, -0.001239), (211, -0.001137), (212, -0.000865), (213, -0.000901), (214, -0.000802), (215, -0.000637), (216, -0.000207), (217, -0.000155), (218, -0.000206), (219, -0.000321), (220, -0.000604), (221, -0.000851), (222, -0.00102), (223, -0.001065), (224, -0.000869), (225, -0.001066), (226, -0.001041), (227, -0.001261), (228, -0.001161), (229, -0.00115), (230, -0.001084), (231, -0.001157), (232, -0.001404), (233, -0.001333), (234, -0.001836), (235, -0.002134), (236, -0.002237), (237, -0.002161), (238, -0.001964), (239, -0.001981), (240, -0.0021), (241, -0.002221), (242, -0.002363), (243, -0.00241), (244, -0.0024), (245, -0.002381), (246, -0.002526), (247, -0.002669), (248, -0.002433), (249, -0.002101), (250, -0.002121), (251, -0.002062), (252, -0.002023), (253, -0.001745), (254, -0.001472), (255, -0.001447), (256, -0.001205), (257, -0.001174), (258, -0.000912), (259, -0.000756), (260, -0.000346), (261, -0.000357), (262, -3.5e-05), (263, 0.000205), (264, 0.000332), (265, 0.000517), (266, 0.000551), (267, 0.00074), (268, 0.000282), (269, 0.000171), (270, 0.000541), (271, 0.000838), (272, 0.001029), (273, 0.000829), (274, 0.000906), (275, 0.000661), (276, 0.000673), (277, 0.000833), (278, 0.00086), (279, 0.001199), (280, 0.001549), (281, 0.001458), (282, 0.001119), (283, 0.000935), (284, 0.000446), (285, 0.000441), (286, 0.000459), (287, 0.00047), (288, 0.000451), (289, 0.00018), (290, 8.4e-05), (291, -5.5e-05), (292, -0.000326), (293, -0.000538), (294, -0.000438), (295, -0.00042), (296, -0.000462), (297, -0.000331), (298, -0.000451), (299, -0.000899), (300, -0.000998), (301, -0.001101), (302, -0.001251), (303, -0.001089), (304, -0.001158), (305, -0.000947), (306, -0.000612), (307, -0.000723), (308, -0.000606), (309, -0.000504), (310, 0.000195), (311, 0.000861), (312, 0.001119), (313, 0.001434), (314, 0.001493), (315, 0.001431), (316, 0.00196), (317, 0.001817), (318, 0.001735), (319, 0.001781), (320, 0.001887), (321, 0.002319), (322, 0.002392), (323, 0.002647), (324, 0.002771), (325, 0.002626), (326, 0.002707), (327, 0.00305), (328, 0.003435), (329, 0.00363), (330, 0.003742), (331, 0.003629), (332, 0.003582), (333, 0.003613), (334, 0.003545), (335, 0.003655), (336, 0.003489), (337, 0.003532), (338, 0.003319), (339, 0.003294), (340, 0.002998), (341, 0.003082), (342, 0.002902), (343, 0.002496), (344, 0.002442), (345, 0.002785), (346, 0.003025), (347, 0.003132), (348, 0.002904), (349, 0.002392), (350, 0.002251), (351, 0.002018), (352, 0.002003), (353, 0.002067), (354, 0.00202), (355, 0.001453), (356, 0.001233), (357, 0.00088), (358, 0.00081), (359, 0.000933), (360, 0.001197), (361, 0.001417), (362, 0.001518), (363, 0.001615), (364, 0.001598), (365, 0.001798), (366, 0.001965), (367, 0.001852), (368, 0.001581), (369, 0.001843), (370, 0.001593), (371, 0.001885), (372, 0.0017), (373, 0.002005), (374, 0.00212), (375, 0.002409), (376, 0.002123), (377, 0.002437), (378, 0.002607), (379, 0.002711), (380, 0.002699), (381, 0.002694), (382, 0.002391), (383, 0.002143), (384, 0.001922), (385, 0.001743), (386, 0.00169), (387, 0.001552), (388, 0.001805), (389, 0.001643), (390, 0.001682), (391, 0.001749), (392, 0.001968), (393, 0.001591), (394, 0.001613), (395, 0.001563), (396, 0.0013), (397, 0.001286), (398, 0.000823), (399, 0.000694), (400, 1.5e-05)]}), 'PHONE_WALK': ('Walk', 24.0, {('location', 0): [(1, 0.016153693199157715), (2, 0.014931442216038704), (3, 0.013922585174441338), (4, 0.012987048365175724), (5, 0.011748365126550198), (6, 0.010338827036321163), (7, 0.008637933060526848), (8, 0.006559636909514666), (9, 0.0042411251924932), (10, 0.0018496843986213207), (11, -0.0007770808879286051), (12, -0.003626840654760599), (13, -0.006530100479722023), (14, -0.00971982628107071), (15, -0.013259362429380417), (16, -0.016812605783343315), (17, -0.02020837739109993), (18, -0.023352622985839844), (19, -0.0260358564555645), (20, -0.028151508420705795), (21, -0.02985382452607155), (22, -0.03121894598007202), (23, -0.03221423178911209), (24, -0.032966166734695435), (25, -0.03348764032125473), (26, -0.033732153475284576), (27, -0.03375975415110588), (28, -0.03355330601334572), (29, -0.03313121199607849), (30, -0.03257597237825394), (31, -0.03190071880817413), (32, -0.031158309429883957), (33, -0.030386172235012054), (34, -0.029539290815591812), (35, -0.028599735349416733), (36, -0.027551287785172462), (37, -0.026409614831209183), (38, -0.025210335850715637), (39, -0.023938477039337158), (40, -0.022597648203372955), (41, -0.021215813234448433), (42, -0.019783755764365196), (43, -0.018340306356549263), (44, -0.016976632177829742), (45, -0.015698907896876335), (46, -0.014532137662172318), (47, -0.013510109856724739), (48, -0.012501586228609085), (49, -0.011402297765016556), (50, -0.010234076529741287), (51, -0.008875198662281036), (52, -0.007288780529052019), (53, -0.005675001069903374), (54, -0.0040705022402107716), (55, -0.0025294646620750427), (56, -0.0011602707672864199), (57, 9.089289233088493e-05), (58, 0.0012257834896445274), (59, 0.0022569785360246897), (60, 0.0032590196933597326), (61, 0.004183322656899691), (62, 0.004943564534187317), (63, 0.005544660612940788), (64, 0.005963276140391827), (65, 0.006153586320579052), (66, 0.006172727793455124), (67, 0.006114685907959938), (68, 0.006028177682310343), (69, 0.005948052741587162), (70, 0.0059159197844564915), (71, 0.005941078998148441), (72, 0.006011077202856541), (73, 0.006116030737757683), (74, 0.006229036953300238), (75, 0.0063126785680651665), (76, 0.006338200531899929), (77, 0.006277583539485931), (78, 0.006105744279921055), (79, 0.0058095501735806465), (80, 0.0053488221019506454), (81, 0.004691069945693016), (82, 0.003839803859591484), (83, 0.002766064368188381), (84, 0.0015088957734405994), (85, 0.00015985718346200883), (86, -0.0012621234636753798), (87, -0.002708801068365574), (88, -0.0041346768848598), (89, -0.005578029900789261), (90, -0.007079404778778553), (91, -0.008604411967098713), (92, -0.01011937577277422), (93, -0.011648822575807571), (94, -0.013103765435516834), (95, -0.014399154111742973), (96, -0.015640033408999443), (97, -0.016838829964399338), (98, -0.01792551577091217), (99, -0.01896597631275654), (100, -0.01993517577648163), (101, -0.02071194164454937), (102, -0.021279651671648026), (103, -0.021621111780405045), (104, -0.021725650876760483), (105, -0.021658677607774734), (106, -0.0214591883122921), (107, -0.02117094397544861), (108, -0.02085045725107193), (109, -0.020454470068216324), (110, -0.019949808716773987), (111, -0.019361689686775208), (112, -0.018688760697841644), (113, -0.017956119030714035), (114, -0.017213206738233566), (115, -0.016475746408104897), (116, -0.015706419944763184), (117, -0.014872055500745773), (118, -0.013972562737762928), (119, -0.013015180826187134), (120, -0.011987578123807907), (121, -0.010861000046133995), (122, -0.009666448459029198), (123, -0.008321511559188366), (124, -0.006764998193830252), (125, -0.005164620000869036), (126, -0.003525719977915287), (127, -0.001837539253756404), (128, -0.00024783125263638794), (129, 0.0012840843992307782), (130, 0.002857545157894492), (131, 0.004426854196935892), (132, 0.00599632877856493), (133, 0.007620638236403465), (134, 0.009255997836589813), (135, 0.0109072495251894), (136, 0.012576863169670105), (137, 0.01419774442911148), (138, 0.015713516622781754), (139, 0.01704953983426094), (140, 0.018176719546318054), (141, 0.01907515898346901), (142, 0.019775832071900368), (143, 0.020365800708532333), (144, 0.020867465063929558), (145, 0.02127794176340103), (146, 0.021598732098937035), (147, 0.021794110536575317), (148, 0.02180204913020134), (149, 0.02157028205692768), (150, 0.02096966840326786), (151, 0.019961949437856674), (152, 0.018613921478390694), (153, 0.016848431900143623), (154, 0.014769262634217739), (155, 0.012513736262917519), (156, 0.010050056502223015), (157, 0.007510318420827389), (158, 0.004946506582200527), (159, 0.002428053878247738), (160, 3.0342198442667723e-05), (161, -0.0024611882399767637), (162, -0.005204067099839449), (163, -0.008307673037052155), (164, -0.011831620708107948), (165, -0.015635058283805847), (166, -0.01945072039961815), (167, -0.02291022799909115), (168, -0.025804217904806137), (169, -0.02803013101220131), (170, -0.029522381722927094), (171, -0.030417758971452713), (172, -0.03084684908390045), (173, -0.030935212969779968), (174, -0.030852515250444412), (175, -0.030655670911073685), (176, -0.030359487980604172), (177, -0.02996959537267685), (178, -0.029459215700626373), (179, -0.028811898082494736), (180, -0.02803122252225876), (181, -0.027189653366804123), (182, -0.026352137327194214), (183, -0.025514118373394012), (184, -0.024688974022865295), (185, -0.023861614987254143), (186, -0.022954002022743225), (187, -0.021914727985858917), (188, -0.020760875195264816), (189, -0.019512154161930084), (190, -0.018188904970884323), (191, -0.01684105396270752), (192, -0.015523528680205345), (193, -0.014282898977398872), (194, -0.01308431662619114), (195, -0.011850150302052498), (196, -0.010562427341938019), (197, -0.009175451472401619), (198, -0.007584038190543652), (199, -0.005844260565936565), (200, -0.004116902593523264), (201, -0.0023780043702572584), (202, -0.0006912807584740222), (203, 0.0007418898749165237), (204, 0.001959972083568573), (205, 0.0029730265960097313), (206, 0.003697242122143507), (207, 0.004217605572193861), (208, 0.004595506936311722), (209, 0.004831252619624138), (210, 0.004975313786417246), (211, 0.005065849516540766), (212, 0.005115698091685772), (213, 0.005154796876013279), (214, 0.005229562520980835), (215, 0.0053628720343112946), (216, 0.005555507726967335), (217, 0.005807721987366676), (218, 0.0060892775654792786), (219, 0.006338007748126984), (220, 0.006483499892055988), (221, 0.00647753058001399), (222, 0.0062987967394292355), (223, 0.005897583439946175), (224, 0.005265894345939159), (225, 0.004460867028683424), (226, 0.0034758830443024635), (227, 0.0022955909371376038), (228, 0.001009222469292581), (229, -0.0003820691490545869), (230, -0.0019850300159305334), (231, -0.0037148669362068176), (232, -0.005510135553777218), (233, -0.007382563315331936), (234, -0.00914369523525238), (235, -0.010684041306376457), (236, -0.011983584612607956), (237, -0.012990104034543037), (238, -0.01374221034348011), (239, -0.014265306293964386), (240, -0.014595240354537964), (241, -0.01480801496654749), (242, -0.014937195926904678), (243, -0.015013812109827995), (244, -0.0150682982057333), (245, -0.015097776427865028), (246, -0.015067892149090767), (247, -0.014950575307011604), (248, -0.014731010422110558), (249, -0.014389395713806152), (250, -0.013947815634310246), (251, -0.01345039252191782), (252, -0.012931603007018566), (253, -0.012454688549041748), (254, -0.012060651555657387), (255, -0.011737074702978134), (256, -0.011477697640657425), (257, -0.011267110705375671), (258, -0.01105740200728178), (259, -0.010815581306815147), (260, -0.010542347095906734), (261, -0.010222532786428928), (262, -0.00984071847051382), (263, -0.009442232549190521), (264, -0.00903345551341772), (265, -0.008574790321290493), (266, -0.008069180883467197), (267, -0.007472008466720581), (268, -0.0067283399403095245), (269, -0.005838949698954821), (270, -0.0047739651054143906), (271, -0.003544022561982274), (272, -0.002154733520001173), (273, -0.0005826842389069498), (274, 0.0010324980830773711), (275, 0.0026245107874274254), (276, 0.0041643488220870495), (277, 0.005478496663272381), (278, 0.00663865078240633), (279, 0.007757402956485748), (280, 0.008776108734309673), (281, 0.009783828631043434), (282, 0.010819735005497932), (283, 0.011759444139897823), (284, 0.012579049915075302), (285, 0.01327887736260891), (286, 0.013776898384094238), (287, 0.014055119827389717), (288, 0.014155596494674683), (289, 0.01410042867064476), (290, 0.013944816775619984), (291, 0.013754693791270256), (292, 0.013552063144743443), (293, 0.013335006311535835), (294, 0.013088608160614967), (295, 0.012797120958566666), (296, 0.012457974255084991), (297, 0.012087233364582062), (298, 0.011709075421094894), (299, 0.011339997872710228), (300, 0.010949446819722652), (301, 0.01045969221740961), (302, 0.009858508594334126), (303, 0.009136750362813473), (304, 0.008234080858528614), (305, 0.007248218171298504), (306, 0.006282347720116377), (307, 0.005276696756482124), (308, 0.004264119081199169), (309, 0.003297125454992056), (310, 0.0023430006112903357), (311, 0.0014558401890099049), (312, 0.0007202699780464172), (313, 0.00018087028001900762), (314, -0.00012887352204415947), (315, -0.00020202415180392563), (316, -5.6222910643555224e-05), (317, 0.0002631139359436929), (318, 0.0007175389328040183), (319, 0.0012587299570441246), (320, 0.0018283659592270851), (321, 0.0024198153987526894), (322, 0.003023305907845497), (323, 0.003630654886364937), (324, 0.0042609260417521), (325, 0.00490932073444128), (326, 0.00556798605248332), (327, 0.006221231073141098), (328, 0.00683406088501215), (329, 0.007401308044791222), (330, 0.00792192667722702), (331, 0.00839512050151825), (332, 0.0088823726400733), (333, 0.009437398985028267), (334, 0.010045772418379784), (335, 0.010707063600420952), (336, 0.01141536794602871), (337, 0.012093089520931244), (338, 0.01270296610891819), (339, 0.013277475722134113), (340, 0.013830825686454773), (341, 0.014387920498847961), (342, 0.014974940568208694), (343, 0.015624423511326313), (344, 0.0163741298019886), (345, 0.017181213945150375), (346, 0.018040161579847336), (347, 0.018997542560100555), (348, 0.0199706070125103), (349, 0.0209007877856493), (350, 0.021812336519360542), (351, 0.022689057514071465), (352, 0.02356010302901268), (353, 0.024431105703115463), (354, 0.02531597763299942), (355, 0.026216408237814903), (356, 0.026960961520671844), (357, 0.027456142008304596), (358, 0.02769659459590912), (359, 0.027607198804616928), (360, 0.02721860446035862), (361, 0.026666786521673203), (362, 0.02604725956916809), (363, 0.025423400104045868), (364, 0.024857934564352036), (365, 0.024386808276176453), (366, 0.023988347500562668), (367, 0.023615315556526184), (368, 0.02323736622929573), (369, 0.02282235026359558), (370, 0.02234363555908203), (371, 0.02178926393389702), (372, 0.02118362858891487), (373, 0.020573671907186508), (374, 0.019964275881648064), (375, 0.019364802166819572), (376, 0.018780283629894257), (377, 0.01816244050860405), (378, 0.017461899667978287), (379, 0.016673408448696136), (380, 0.01583722233772278), (381, 0.01499953679740429), (382, 0.01423906534910202), (383, 0.013653870671987534), (384, 0.013264276087284088), (385, 0.013056764379143715), (386, 0.013009805232286453), (387, 0.013058410957455635), (388, 0.013146083801984787), (389, 0.01323435828089714), (390, 0.013274979777634144), (391, 0.013234474696218967), (392, 0.013095036149024963), (393, 0.012824833393096924), (394, 0.012416809797286987), (395, 0.011924408376216888), (396, 0.011399966664612293), (397, 0.01089327223598957), (398, 0.010488436557352543), (399, 0.01022398378700018), (400, 0.010078402236104012), (401, 0.010035747662186623), (402, 0.01006633136421442), (403, 0.010137957520782948), (404, 0.010262789204716682), (405, 0.010462557896971703), (406, 0.010741492733359337), (407, 0.011122580617666245), (408, 0.011596395634114742), (409, 0.012106716632843018), (410, 0.012632769532501698), (411, 0.013143105432391167), (412, 0.013611783273518085), (413, 0.014065438881516457), (414, 0.014516513794660568), (415, 0.014983288943767548), (416, 0.015485486947000027), (417, 0.016021352261304855), (418, 0.016640495508909225), (419, 0.017367327585816383), (420, 0.018190357834100723), (421, 0.019204307347536087), (422, 0.020379865542054176), (423, 0.021576302126049995), (424, 0.022826269268989563), (425, 0.02406812645494938), (426, 0.02516717091202736), (427, 0.026177920401096344), (428, 0.02713162638247013), (429, 0.02799219638109207), (430, 0.028797032311558723), (431, 0.029552306979894638), (432, 0.030212629586458206), (433, 0.030766543000936508), (434, 0.03117869421839714), (435, 0.031439416110515594), (436, 0.03158070519566536), (437, 0.03160346299409866), (438, 0.031533390283584595), (439, 0.03140033036470413), (440, 0.031204838305711746), (441, 0.030967429280281067), (442, 0.030700724571943283), (443, 0.030383514240384102), (444, 0.029988005757331848), (445, 0.029457245022058487), (446, 0.028749924153089523), (447, 0.027873756363987923), (448, 0.026810798794031143), (449, 0.025538822636008263), (450, 0.024083290249109268), (451, 0.022387508302927017), (452, 0.020276103168725967), (453, 0.01779065653681755), (454, 0.015103624202311039), (455, 0.012272022664546967), (456, 0.009586445987224579), (457, 0.007341987453401089), (458, 0.00548591511324048), (459, 0.003975958563387394), (460, 0.0027475894894450903), (461, 0.0016477216267958283), (462, 0.0006683825049549341), (463, -0.00014288969396147877), (464, -0.0007664056029170752), (465, -0.0011804343666881323), (466, -0.0013927469262853265), (467, -0.001423887093551457), (468, -0.0013073268346488476), (469, -0.0010734919924288988), (470, -0.0007436706218868494), (471, -0.0003902589378412813), (472, -8.188602805603296e-05), (473, 0.00018968516087625176), (474, 0.0004338953585829586), (475, 0.0006600660271942616), (476, 0.000941727717872709), (477, 0.0013154157204553485), (478, 0.001775919459760189), (479, 0.0023512467741966248), (480, 0.003023219760507345), (481, 0.0037642219103872776), (482, 0.004544171970337629), (483, 0.0053033786825835705), (484, 0.006055396515876055), (485, 0.006800223141908646), (486, 0.007506056688725948), (487, 0.008278465829789639), (488, 0.008978022262454033), (489, 0.010016560554504395)], ('location', 1): [(1, -0.009792342782020569), (2, -0.009299319237470627), (3, -0.008838243782520294), (4, -0.008396212011575699), (5, -0.00785677321255207), (6, -0.007308765314519405), (7, -0.006800576578825712), (8, -0.006390685215592384), (9, -0.00607465673238039), (10, -0.0057996660470962524), (11, -0.0055008456110954285), (12, -0.0051120491698384285), (13, -0.0045970892533659935), (14, -0.0039556981064379215), (15, -0.0032003019005060196), (16, -0.002355780452489853), (17, -0.0014480595709756017), (18, -0.000494578736834228), (19, 0.0004841094196308404), (20, 0.0014312320854514837), (21, 0.0022773398086428642), (22, 0.0029710079543292522), (23, 0.00344273098744452), (24, 0.0036495402455329895), (25, 0.003614705055952072), (26, 0.0033608623780310154), (27, 0.0029276073910295963), (28, 0.002395741641521454), (29, 0.0018020462011918426), (30, 0.0011577518889680505), (31, 0.0005002226680517197), (32, -0.00016084648086689413), (33, -0.0008261351031251252), (34, -0.0014647600473836064), (35, -0.002052942756563425), (36, -0.0025660665705800056), (37, -0.0029655087273567915), (38, -0.0032238003332167864), (39, -0.003285263432189822), (40, -0.003085474018007517), (41, -0.002597510814666748), (42, -0.0017538494430482388), (43, -0.0004434661823324859), (44, 0.0013835292775183916), (45, 0.0037459246814250946), (46, 0.0067157382145524025), (47, 0.010203023441135883), (48, 0.013880165293812752), (49, 0.0175106730312109), (50, 0.020850667729973793), (51, 0.02355334535241127), (52, 0.02552349492907524), (53, 0.026829242706298828), (54, 0.027495337650179863), (55, 0.027628246694803238), (56, 0.027377881109714508), (57, 0.02679278887808323), (58, 0.025892484933137894), (59, 0.02476760745048523), (60, 0.023382723331451416), (61, 0.021677453070878983), (62, 0.01983058452606201), (63, 0.017858121544122696), (64, 0.01570339873433113), (65, 0.013610067777335644), (66, 0.01164332777261734), (67, 0.009694259613752365), (68, 0.00787284504622221), (69, 0.006241705268621445), (70, 0.004656339529901743), (71, 0.0030768110882490873), (72, 0.0015995341818779707), (73, 0.00019289125339128077), (74, -0.001133717829361558), (75, -0.002205520635470748), (76, -0.002946421504020691), (77, -0.003367267083376646), (78, -0.0034696809016168118), (79, -0.0033049550838768482), (80, -0.0029557431116700172), (81, -0.002478783018887043), (82, -0.0018612639978528023), (83, -0.0010555734625086188), (84, -5.055905785411596e-05), (85, 0.0011882634134963155), (86, 0.0027315043844282627), (87, 0.0045739999040961266), (88, 0.006720872595906258), (89, 0.009233234450221062), (90, 0.01206936128437519), (91, 0.015134168788790703), (92, 0.018330339342355728), (93, 0.021452438086271286), (94, 0.024248633533716202), (95, 0.0265224389731884), (96, 0.02812785655260086), (97, 0.029019605368375778), (98, 0.029247354716062546), (99, 0.028927326202392578), (100, 0.02824464812874794), (101, 0.027276530861854553), (102, 0.026045802980661392), (103, 0.024692989885807037), (104, 0.02325538918375969), (105, 0.0216655433177948), (106, 0.02001722902059555), (107, 0.018417686223983765), (108, 0.016773439943790436), (109, 0.01506761834025383), (110, 0.01345196645706892), (111, 0.0119194146245718), (112, 0.010441310703754425), (113, 0.009148798882961273), (114, 0.00809564720839262), (115, 0.007266447879374027), (116, 0.00671119149774313), (117, 0.0064736464992165565), (118, 0.006535443477332592), (119, 0.006846088916063309), (120, 0.007373853586614132), (121, 0.008101226761937141), (122, 0.008970938622951508), (123, 0.00997545849531889), (124, 0.011177252046763897), (125, 0.012529794126749039), (126, 0.013932831585407257), (127, 0.015342919155955315), (128, 0.01664312183856964), (129, 0.017674122005701065), (130, 0.018350370228290558), (131, 0.01859288476407528), (132, 0.018367381766438484), (133, 0.017716147005558014), (134, 0.016655687242746353), (135, 0.015259213745594025), (136, 0.013689328916370869), (137, 0.01201244443655014), (138, 0.010247068479657173), (139, 0.008501064963638783), (140, 0.00684307049959898), (141, 0.005249022506177425), (142, 0.0037177191115915775), (143, 0.002281874418258667), (144, 0.0009547051740810275), (145, -0.00028063723584637046), (146, -0.0013986165868118405), (147, -0.002299129031598568), (148, -0.00292191281914711), (149, -0.0032568289898335934), (150, -0.003261799458414316), (151, -0.002921628300100565), (152, -0.0023075740318745375), (153, -0.0014875793131068349), (154, -0.0005002133548259735), (155, 0.0005696991574950516), (156, 0.0016758611891418695), (157, 0.002843639114871621), (158, 0.004070021212100983), (159, 0.005391789600253105), (160, 0.006877869367599487), (161, 0.008496616035699844), (162, 0.010210530832409859), (163, 0.011998217552900314), (164, 0.013692773878574371), (165, 0.015130889602005482), (166, 0.016249941661953926), (167, 0.01692718081176281), (168, 0.017112871631979942), (169, 0.01689743623137474), (170, 0.01634896546602249), (171, 0.01555679738521576), (172, 0.014622947201132774), (173, 0.013587558642029762), (174, 0.012485641054809093), (175, 0.01132962480187416), (176, 0.010132217779755592), (177, 0.008954509161412716), (178, 0.00786796398460865), (179, 0.006958494894206524), (180, 0.006279210094362497), (181, 0.0058361841365695), (182, 0.005638036876916885), (183, 0.005673026666045189), (184, 0.005908778868615627), (185, 0.006341098807752132), (186, 0.007017198950052261), (187, 0.007980435155332088), (188, 0.00924229621887207), (189, 0.010831454768776894), (190, 0.012724433094263077), (191, 0.014824278652668), (192, 0.017065079882740974), (193, 0.0193397868424654), (194, 0.021541524678468704), (195, 0.023638248443603516), (196, 0.025484010577201843), (197, 0.026926860213279724), (198, 0.027909638360142708), (199, 0.028298716992139816), (200, 0.028059065341949463), (201, 0.027318701148033142), (202, 0.026118706911802292), (203, 0.024557221680879593), (204, 0.02286800742149353), (205, 0.021070560440421104), (206, 0.01914907805621624), (207, 0.01730578951537609), (208, 0.015583883970975876), (209, 0.013930942863225937), (210, 0.012474792078137398), (211, 0.011263687163591385), (212, 0.010187825188040733), (213, 0.009227638132870197), (214, 0.008471177890896797), (215, 0.007980642840266228), (216, 0.00782542210072279), (217, 0.00812613032758236), (218, 0.0089334174990654), (219, 0.010137353092432022), (220, 0.011593887582421303), (221, 0.013218389824032784), (222, 0.014898715540766716), (223, 0.016542423516511917), (224, 0.01818656735122204), (225, 0.019890079274773598), (226, 0.021612007170915604), (227, 0.023307375609874725), (228, 0.024967242032289505), (229, 0.026462476700544357), (230, 0.02762199193239212), (231, 0.0283953994512558), (232, 0.028723645955324173), (233, 0.028561152517795563), (234, 0.028010770678520203), (235, 0.02714688330888748), (236, 0.025999493896961212), (237, 0.024706535041332245), (238, 0.023278988897800446), (239, 0.02166016772389412), (240, 0.02001289278268814), (241, 0.018344420939683914), (242, 0.016544092446565628), (243, 0.014784198254346848), (244, 0.013122588396072388), (245, 0.0114281065762043), (246, 0.009804503992199898), (247, 0.00836065225303173), (248, 0.006953185424208641), (249, 0.005543646402657032), (250, 0.004250597208738327), (251, 0.0030386722646653652), (252, 0.001900358940474689), (253, 0.0009713073959574103), (254, 0.00029879651265218854), (255, -0.00012679160863626748), (256, -0.00029815585003234446), (257, -0.00022357775014825165), (258, 9.14848133106716e-05), (259, 0.0006659547798335552), (260, 0.0015520495362579823), (261, 0.0027959728613495827), (262, 0.00437324121594429), (263, 0.006175951566547155), (264, 0.008081149309873581), (265, 0.009958022274076939), (266, 0.01167539693415165), (267, 0.013220876455307007), (268, 0.014615831896662712), (269, 0.01579851657152176), (270, 0.016727421432733536), (271, 0.01736314222216606), (272, 0.01761229708790779), (273, 0.01744932308793068), (274, 0.016920851543545723), (275, 0.01603248529136181), (276, 0.014858203008770943), (277, 0.013477196916937828), (278, 0.011825207620859146), (279, 0.009988074190914631), (280, 0.008091502822935581), (281, 0.006094616837799549), (282, 0.00413274671882391), (283, 0.0023658722639083862), (284, 0.0007470080745406449), (285, -0.0007337370770983398), (286, -0.002053186297416687), (287, -0.0032610741909593344), (288, -0.00441171508282423), (289, -0.005492879543453455), (290, -0.006441359408199787), (291, -0.007213977165520191), (292, -0.007767403032630682), (293, -0.008034126833081245), (294, -0.007961099036037922), (295, -0.007520653307437897), (296, -0.0067219845950603485), (297, -0.005568292923271656), (298, -0.0040633799508214), (299, -0.002321024890989065), (300, -0.00044732962851412594), (301, 0.0015271364245563745), (302, 0.0034702683333307505), (303, 0.005266878753900528), (304, 0.00690119806677103), (305, 0.008264001458883286), (306, 0.00923972763121128), (307, 0.009801984764635563), (308, 0.009892268106341362), (309, 0.009479494765400887), (310, 0.008637682534754276), (311, 0.007407544180750847), (312, 0.005842956714332104), (313, 0.004119532182812691), (314, 0.0023465892300009727), (315, 0.0005699783796444535), (316, -0.0010945042595267296), (317, -0.0026140245608985424), (318, -0.004050822928547859), (319, -0.005396335385739803), (320, -0.006639007478952408), (321, -0.0077870432287454605), (322, -0.008794072084128857), (323, -0.009645670652389526), (324, -0.01034198235720396), (325, -0.010836657136678696), (326, -0.011084884405136108), (327, -0.011037813499569893), (328, -0.010652348399162292), (329, -0.009923932142555714), (330, -0.008876263163983822), (331, -0.007556915748864412), (332, -0.006040690001100302), (333, -0.004374795593321323), (334, -0.0025767511688172817), (335, -0.0007523865206167102), (336, 0.0009838433470577002), (337, 0.002601760206744075), (338, 0.004018670879304409), (339, 0.00516355549916625), (340, 0.006051797419786453), (341, 0.006652134470641613), (342, 0.006899300497025251), (343, 0.006760283373296261), (344, 0.00622915755957365), (345, 0.005276316311210394), (346, 0.0039175450801849365), (347, 0.0022947723045945168), (348, 0.00040974849252961576), (349, -0.0017358374316245317), (350, -0.003912342246621847), (351, -0.006120854057371616), (352, -0.008376500569283962), (353, -0.01042180135846138), (354, -0.012277310714125633), (355, -0.01402825117111206), (356, -0.015537271276116371), (357, -0.01685403846204281), (358, -0.018051836639642715), (359, -0.019026324152946472), (360, -0.019743867218494415), (361, -0.0202043280005455), (362, -0.020363694056868553), (363, -0.020218443125486374), (364, -0.019774340093135834), (365, -0.019015146419405937), (366, -0.017955373972654343), (367, -0.01660618558526039), (368, -0.014952916651964188), (369, -0.013040980324149132), (370, -0.01091066375374794), (371, -0.008589882403612137), (372, -0.0061693331226706505), (373, -0.0037148240953683853), (374, -0.0013480748748406768), (375, 0.0007905723759904504), (376, 0.002661964390426874), (377, 0.004130060318857431), (378, 0.0050484901294112206), (379, 0.005418211221694946), (380, 0.0052272723987698555), (381, 0.004451811779290438), (382, 0.003223901614546776), (383, 0.0017562912544235587), (384, 0.00010653410572558641), (385, -0.001651373808272183), (386, -0.0033507682383060455), (387, -0.005003999453037977), (388, -0.006621642038226128), (389, -0.008132768794894218), (390, -0.009574475698173046), (391, -0.010949093848466873), (392, -0.01222364604473114), (393, -0.01342441514134407), (394, -0.014507913962006569), (395, -0.01539012510329485), (396, -0.01607406511902809), (397, -0.016537383198738098), (398, -0.016680508852005005), (399, -0.0164853073656559), (400, -0.01593014784157276), (401, -0.014891158789396286), (402, -0.013382699340581894), (403, -0.01150408573448658), (404, -0.00930050853639841), (405, -0.006986824795603752), (406, -0.004790191538631916), (407, -0.0027816586662083864), (408, -0.0010716530960053205), (409, 0.00028390242368914187), (410, 0.0013101710937917233), (411, 0.0019927886314690113), (412, 0.0023408825509250164), (413, 0.0023524221032857895), (414, 0.001989869400858879), (415, 0.001275967457331717), (416, 0.00025107801775448024), (417, -0.0011174866231158376), (418, -0.0027893686201423407), (419, -0.004606408532708883), (420, -0.006579540204256773), (421, -0.008731423877179623), (422, -0.010870853438973427), (423, -0.012960413470864296), (424, -0.015029440633952618), (425, -0.016890596598386765), (426, -0.018452022224664688), (427, -0.019780661910772324), (428, -0.020841674879193306), (429, -0.021578708663582802), (430, -0.022036056965589523), (431, -0.02221812680363655), (432, -0.02209307625889778), (433, -0.02171696349978447), (434, -0.0211322158575058), (435, -0.020308900624513626), (436, -0.01925460249185562), (437, -0.017937177792191505), (438, -0.01628115400671959), (439, -0.01439070887863636), (440, -0.012370685115456581), (441, -0.010228302329778671), (442, -0.008132841438055038), (443, -0.006195786874741316), (444, -0.004398814402520657), (445, -0.0028679734095931053), (446, -0.001701500965282321), (447, -0.00089817657135427), (448, -0.0004970842273905873), (449, -0.0005067813908681273), (450, -0.0008775121532380581), (451, -0.0015652247238904238), (452, -0.002582778688520193), (453, -0.003910104278475046), (454, -0.00543267372995615), (455, -0.007091450970619917), (456, -0.008832188323140144), (457, -0.010504025965929031), (458, -0.012047678232192993), (459, -0.01351243257522583), (460, -0.014890402555465698), (461, -0.016194593161344528), (462, -0.017468180507421494), (463, -0.018676545470952988), (464, -0.01978108659386635), (465, -0.02073589712381363), (466, -0.02147357165813446), (467, -0.0219830684363842), (468, -0.022280670702457428), (469, -0.022385094314813614), (470, -0.022321417927742004), (471, -0.022072065621614456), (472, -0.021565869450569153), (473, -0.020724382251501083), (474, -0.019472455605864525), (475, -0.017813019454479218), (476, -0.01587531901896), (477, -0.013797350227832794), (478, -0.01173556037247181), (479, -0.009863175451755524), (480, -0.00824427604675293), (481, -0.006910371594130993), (482, -0.0059246644377708435), (483, -0.005291512235999107), (484, -0.004977834410965443), (485, -0.0049809920601546764), (486, -0.005240431986749172), (487, -0.005710167810320854), (488, -0.006216526031494141), (489, -0.007078096270561218)], ('location', 2): [(1, -0.01593160629272461), (2, -0.014745871536433697), (3, -0.013734511099755764), (4, -0.012907667085528374), (5, -0.01191871240735054), (6, -0.010933952406048775), (7, -0.009977550245821476), (8, -0.009068530984222889), (9, -0.00821421667933464), (10, -0.007420784793794155), (11, -0.006670672446489334), (12, -0.0059553105384111404), (13, -0.005270496476441622), (14, -0.004604606423527002), (15, -0.003943878225982189), (16, -0.003274438437074423), (17, -0.0025860662572085857), (18, -0.001863185316324234), (19, -0.0010820847237482667), (20, -0.00023675212287344038), (21, 0.0006718139629811049), (22, 0.0016462919302284718), (23, 0.0026550707407295704), (24, 0.0036641056649386883), (25, 0.004669529385864735), (26, 0.005662602372467518), (27, 0.006635330617427826), (28, 0.007582373451441526), (29, 0.008498186245560646), (30, 0.009385915473103523), (31, 0.010241498239338398), (32, 0.011074980720877647), (33, 0.01191098801791668), (34, 0.012747973203659058), (35, 0.013574082404375076), (36, 0.014381864108145237), (37, 0.015157445333898067), (38, 0.015888651832938194), (39, 0.016574997454881668), (40, 0.017226092517375946), (41, 0.017839055508375168), (42, 0.018402211368083954), (43, 0.018906403332948685), (44, 0.019326524809002876), (45, 0.019643763080239296), (46, 0.019856275990605354), (47, 0.019977692514657974), (48, 0.02005571871995926), (49, 0.020133957266807556), (50, 0.020249057561159134), (51, 0.020447667688131332), (52, 0.02074422873556614), (53, 0.021134937182068825), (54, 0.02162688411772251), (55, 0.022217510268092155), (56, 0.022895600646734238), (57, 0.023657899349927902), (58, 0.024498257786035538), (59, 0.025394901633262634), (60, 0.026340946555137634), (61, 0.027332477271556854), (62, 0.028334416449069977), (63, 0.029338829219341278), (64, 0.03034910559654236), (65, 0.03132925555109978), (66, 0.03227367252111435), (67, 0.033210355788469315), (68, 0.03414469212293625), (69, 0.035073310136795044), (70, 0.03601585328578949), (71, 0.03698006272315979), (72, 0.03792111575603485), (73, 0.038813088089227676), (74, 0.03965660557150841), (75, 0.040420323610305786), (76, 0.04109329730272293), (77, 0.04169736057519913), (78, 0.04224125295877457), (79, 0.04273184388875961), (80, 0.043181877583265305), (81, 0.04359501600265503), (82, 0.04396336153149605), (83, 0.04427742213010788), (84, 0.04453498125076294), (85, 0.0447344146668911), (86, 0.044874031096696854), (87, 0.044965699315071106), (88, 0.045020975172519684), (89, 0.04504349082708359), (90, 0.045050643384456635), (91, 0.04506378248333931), (92, 0.04510584473609924), (93, 0.045210547745227814), (94, 0.045439738780260086), (95, 0.04592981934547424), (96, 0.04680594801902771), (97, 0.04810963571071625), (98, 0.04986771196126938), (99, 0.05198992043733597), (100, 0.05423036962747574), (101, 0.056416526436805725), (102, 0.05847267806529999), (103, 0.060338474810123444), (104, 0.06202804297208786), (105, 0.06358079612255096), (106, 0.06497637182474136), (107, 0.06614682078361511), (108, 0.06702464818954468), (109, 0.06758417189121246), (110, 0.06784994900226593), (111, 0.06786283850669861), (112, 0.06766387820243835), (113, 0.06733545660972595), (114, 0.06692351400852203), (115, 0.06643059849739075), (116, 0.06591150909662247), (117, 0.06537947058677673), (118, 0.06480613350868225), (119, 0.06419022381305695), (120, 0.06350326538085938), (121, 0.06272973865270615), (122, 0.06187368929386139), (123, 0.06093262508511543), (124, 0.059978287667036057), (125, 0.059114694595336914), (126, 0.05848328024148941), (127, 0.058305852115154266), (128, 0.05871032923460007), (129, 0.05972050130367279), (130, 0.061271730810403824), (131, 0.06310205906629562), (132, 0.06492204964160919), (133, 0.06653828918933868), (134, 0.06780366599559784), (135, 0.06866912543773651), (136, 0.06916677206754684), (137, 0.06935614347457886), (138, 0.06931298226118088), (139, 0.06909646838903427), (140, 0.06876389682292938), (141, 0.06840312480926514), (142, 0.06806103140115738), (143, 0.06770890206098557), (144, 0.0673680454492569), (145, 0.06704236567020416), (146, 0.06664439290761948), (147, 0.06617435067892075), (148, 0.06564393639564514), (149, 0.06501933932304382), (150, 0.06437906622886658), (151, 0.06380390375852585), (152, 0.06330447643995285), (153, 0.06289520859718323), (154, 0.06253115087747574), (155, 0.06208309531211853), (156, 0.06143435835838318), (157, 0.060551635921001434), (158, 0.05942085385322571), (159, 0.058046624064445496), (160, 0.056565798819065094), (161, 0.05510428920388222), (162, 0.05372283235192299), (163, 0.05257461965084076), (164, 0.05176723375916481), (165, 0.05129975825548172), (166, 0.051171451807022095), (167, 0.05135229229927063), (168, 0.0517834797501564), (169, 0.05241386964917183), (170, 0.05320810154080391), (171, 0.054133232682943344), (172, 0.055134259164333344), (173, 0.05614650249481201), (174, 0.057123951613903046), (175, 0.058043792843818665), (176, 0.058897800743579865), (177, 0.059689849615097046), (178, 0.060419514775276184), (179, 0.06106432527303696), (180, 0.06159191578626633), (181, 0.06195519119501114), (182, 0.06208842992782593), (183, 0.06194973364472389), (184, 0.06151161715388298), (185, 0.0607452355325222), (186, 0.059661321341991425), (187, 0.05833112448453903), (188, 0.05685582384467125), (189, 0.05529092997312546), (190, 0.05368815362453461), (191, 0.05208069831132889), (192, 0.050412021577358246), (193, 0.0486685149371624), (194, 0.04686782509088516), (195, 0.0450800396502018), (196, 0.043413758277893066), (197, 0.041821837425231934), (198, 0.04032525420188904), (199, 0.03899841010570526), (200, 0.03780309855937958), (201, 0.03688304126262665), (202, 0.036439672112464905), (203, 0.036501750349998474), (204, 0.037055857479572296), (205, 0.038027264177799225), (206, 0.03924863785505295), (207, 0.04059745371341705), (208, 0.042096979916095734), (209, 0.043755508959293365), (210, 0.04549986869096756), (211, 0.04733535647392273), (212, 0.04914376884698868), (213, 0.0507209487259388), (214, 0.052109912037849426), (215, 0.053341351449489594), (216, 0.05439714342355728), (217, 0.05535699799656868), (218, 0.05614455044269562), (219, 0.05665522813796997), (220, 0.05691889300942421), (221, 0.05691879242658615), (222, 0.05668492615222931), (223, 0.05631549656391144), (224, 0.0557560995221138), (225, 0.05494595319032669), (226, 0.05395188927650452), (227, 0.05281612277030945), (228, 0.05162510275840759), (229, 0.050499655306339264), (230, 0.049426741898059845), (231, 0.048357926309108734), (232, 0.047286197543144226), (233, 0.04624243080615997), (234, 0.04532289877533913), (235, 0.044686369597911835), (236, 0.04449202120304108), (237, 0.04481182619929314), (238, 0.04576318711042404), (239, 0.04738757759332657), (240, 0.04950845241546631), (241, 0.052044980227947235), (242, 0.05477991700172424), (243, 0.05739931762218475), (244, 0.05996672809123993), (245, 0.06247172877192497), (246, 0.06486959755420685), (247, 0.06727869063615799), (248, 0.06955377757549286), (249, 0.0715823620557785), (250, 0.07336989790201187), (251, 0.0748530775308609), (252, 0.0760674923658371), (253, 0.07696722447872162), (254, 0.07746025919914246), (255, 0.07757461071014404), (256, 0.07731152325868607), (257, 0.07672783732414246), (258, 0.0759802907705307), (259, 0.0751192718744278), (260, 0.0740874633193016), (261, 0.07289273291826248), (262, 0.07159939408302307), (263, 0.07019276916980743), (264, 0.06869085133075714), (265, 0.06721215695142746), (266, 0.06576122343540192), (267, 0.06431117653846741), (268, 0.06293848156929016), (269, 0.061669059097766876), (270, 0.060516975820064545), (271, 0.05953963100910187), (272, 0.05879002809524536), (273, 0.05839872360229492), (274, 0.058514855802059174), (275, 0.05916455388069153), (276, 0.06031090021133423), (277, 0.06184270232915878), (278, 0.0634862631559372), (279, 0.0649951696395874), (280, 0.06627531349658966), (281, 0.06726790964603424), (282, 0.06795500963926315), (283, 0.06837978214025497), (284, 0.06858263909816742), (285, 0.0685867965221405), (286, 0.06840488314628601), (287, 0.06808960437774658), (288, 0.06772211939096451), (289, 0.0672951489686966), (290, 0.0667802169919014), (291, 0.06617914885282516), (292, 0.06541214883327484), (293, 0.06443282216787338), (294, 0.06330492347478867), (295, 0.06205097585916519), (296, 0.06074018031358719), (297, 0.05947299301624298), (298, 0.05817831680178642), (299, 0.05682341009378433), (300, 0.05541085824370384), (301, 0.05382700264453888), (302, 0.05212444067001343), (303, 0.050389572978019714), (304, 0.04855240136384964), (305, 0.04664705693721771), (306, 0.044681478291749954), (307, 0.04259397089481354), (308, 0.04044004902243614), (309, 0.03824051842093468), (310, 0.036047711968421936), (311, 0.03394167497754097), (312, 0.03193366155028343), (313, 0.03013012558221817), (314, 0.028637295588850975), (315, 0.027481678873300552), (316, 0.026633067056536674), (317, 0.0259975828230381), (318, 0.025492332875728607), (319, 0.025027021765708923), (320, 0.02456863783299923), (321, 0.02420005202293396), (322, 0.023981081321835518), (323, 0.02390884980559349), (324, 0.023970182985067368), (325, 0.02410307712852955), (326, 0.024208765476942062), (327, 0.02422749064862728), (328, 0.024128146469593048), (329, 0.023888878524303436), (330, 0.023510772734880447), (331, 0.023012522608041763), (332, 0.022412147372961044), (333, 0.02169632539153099), (334, 0.020859435200691223), (335, 0.01991630159318447), (336, 0.018841993063688278), (337, 0.017624298110604286), (338, 0.016302892938256264), (339, 0.014941873960196972), (340, 0.013605471700429916), (341, 0.012346543371677399), (342, 0.011268360540270805), (343, 0.010420401580631733), (344, 0.00975264422595501), (345, 0.009272896684706211), (346, 0.008935084566473961), (347, 0.008620809763669968), (348, 0.008309576660394669), (349, 0.007983669638633728), (350, 0.0076182251796126366), (351, 0.0073212990537285805), (352, 0.0072129154577851295), (353, 0.007348400540649891), (354, 0.007838699966669083), (355, 0.008711924776434898), (356, 0.009827705100178719), (357, 0.011057807132601738), (358, 0.01226758025586605), (359, 0.013301661238074303), (360, 0.01411481387913227), (361, 0.014728030189871788), (362, 0.015165243297815323), (363, 0.015489088371396065), (364, 0.01575176790356636), (365, 0.015972912311553955), (366, 0.01619930937886238), (367, 0.016418328508734703), (368, 0.016528746113181114), (369, 0.01650492288172245), (370, 0.016321636736392975), (371, 0.0159290824085474), (372, 0.015444764867424965), (373, 0.01494821161031723), (374, 0.014369865879416466), (375, 0.013718709349632263), (376, 0.012976323254406452), (377, 0.012087654322385788), (378, 0.011170848272740841), (379, 0.01035818737000227), (380, 0.009636457078158855), (381, 0.0089223338291049), (382, 0.00811291579157114), (383, 0.007095233537256718), (384, 0.005828211084008217), (385, 0.004491531755775213), (386, 0.0032918439246714115), (387, 0.002298693871125579), (388, 0.001622026669792831), (389, 0.0012872364604845643), (390, 0.0012200698256492615), (391, 0.0014509223401546478), (392, 0.0020583735313266516), (393, 0.0029660086147487164), (394, 0.003945024684071541), (395, 0.004911025986075401), (396, 0.0057383133098483086), (397, 0.0062372758984565735), (398, 0.006544917821884155), (399, 0.006744876503944397), (400, 0.006696740165352821), (401, 0.006403032690286636), (402, 0.005825381726026535), (403, 0.004901695065200329), (404, 0.003833597060292959), (405, 0.0028189513832330704), (406, 0.0019232891499996185), (407, 0.0011789497220888734), (408, 0.0005268636741675436), (409, -0.000162637879839167), (410, -0.000974054157268256), (411, -0.0018537284340709448), (412, -0.002742701442912221), (413, -0.003628043457865715), (414, -0.004447237588465214), (415, -0.005216897465288639), (416, -0.005974252242594957), (417, -0.0066697304137051105), (418, -0.007325770333409309), (419, -0.008014179766178131), (420, -0.008788097649812698), (421, -0.009673664346337318), (422, -0.01069110631942749), (423, -0.011840088292956352), (424, -0.012925101444125175), (425, -0.013748754747211933), (426, -0.014310958795249462), (427, -0.01457209512591362), (428, -0.014435946941375732), (429, -0.013936701230704784), (430, -0.013159817084670067), (431, -0.012067407369613647), (432, -0.010680794715881348), (433, -0.009228304028511047), (434, -0.007902007550001144), (435, -0.0068021477200090885), (436, -0.0060203648172318935), (437, -0.0055723777040839195), (438, -0.005386708304286003), (439, -0.0053505366668105125), (440, -0.005391685292124748), (441, -0.005481535568833351), (442, -0.0055573852732777596), (443, -0.0055867694318294525), (444, -0.005643267650157213), (445, -0.005847944878041744), (446, -0.006248394027352333), (447, -0.00686975521966815), (448, -0.007716473191976547), (449, -0.008578134700655937), (450, -0.009233752265572548), (451, -0.009699338115751743), (452, -0.010047756135463715), (453, -0.010347292758524418), (454, -0.010780241340398788), (455, -0.011475803330540657), (456, -0.012329243123531342), (457, -0.013228250667452812), (458, -0.014152604155242443), (459, -0.015054503455758095), (460, -0.015976380556821823), (461, -0.017031235620379448), (462, -0.018184635788202286), (463, -0.019375581294298172), (464, -0.02050996944308281), (465, -0.021387752145528793), (466, -0.021998252719640732), (467, -0.02242257446050644), (468, -0.022729841992259026), (469, -0.023084133863449097), (470, -0.023520763963460922), (471, -0.023977983742952347), (472, -0.024430712684988976), (473, -0.02482164092361927), (474, -0.025125443935394287), (475, -0.025354202836751938), (476, -0.025484031066298485), (477, -0.025482825934886932), (478, -0.025321222841739655), (479, -0.024987060576677322), (480, -0.02454204298555851), (481, -0.024070244282484055), (482, -0.023619603365659714), (483, -0.023237306624650955), (484, -0.02295232191681862), (485, -0.02275507152080536), (486, -0.022632146254181862), (487, -0.022589344531297684), (488, -0.02259768173098564), (489, -0.022674858570098877)], ('rotation_euler', 0): [(1, -0.01706659235060215), (2, -0.018134426325559616), (3, -0.019190113991498947), (4, -0.020145360380411148), (5, -0.021270278841257095), (6, -0.022392313927412033), (7, -0.023395981639623642), (8, -0.02418067678809166), (9, -0.024706130847334862), (10, -0.024968860670924187), (11, -0.024928852915763855), (12, -0.02452876791357994), (13, -0.023783046752214432), (14, -0.02274378389120102), (15, -0.02152039110660553), (16, -0.020339205861091614), (17, -0.019502729177474976), (18, -0.019362682476639748), (19, -0.02019665017724037), (20, -0.02200218103826046), (21, -0.024568621069192886), (22, -0.027612457051873207), (23, -0.03081289678812027), (24, -0.03400598093867302), (25, -0.037112705409526825), (26, -0.04005874693393707), (27, -0.0428055003285408), (28, -0.045021556317806244), (29, -0.04638705030083656), (30, -0.04699929803609848), (31, -0.046975597739219666), (32, -0.04652853310108185), (33, -0.046121545135974884), (34, -0.046026818454265594), (35, -0.04625639319419861), (36, -0.04678812623023987), (37, -0.047578632831573486), (38, -0.0485505685210228), (39, -0.04965580254793167), (40, -0.050993382930755615), (41, -0.05274955928325653), (42, -0.05500560253858566), (43, -0.05783948302268982), (44, -0.06130955368280411), (45, -0.06518755108118057), (46, -0.06907767057418823), (47, -0.07264219224452972), (48, -0.07553693652153015), (49, -0.07738535106182098), (50, -0.0780165046453476), (51, -0.07749117910861969), (52, -0.07587961107492447), (53, -0.07340200245380402), (54, -0.07037599384784698), (55, -0.06709209084510803), (56, -0.06395182013511658), (57, -0.06116782873868942), (58, -0.05885808914899826), (59, -0.05718708783388138), (60, -0.05586355924606323), (61, -0.05446426570415497), (62, -0.052736371755599976), (63, -0.050143975764513016), (64, -0.046333007514476776), (65, -0.041394397616386414), (66, -0.03530053049325943), (67, -0.028218792751431465), (68, -0.020544981583952904), (69, -0.012455803342163563), (70, -0.004283062182366848), (71, 0.0033947250340133905), (72, 0.010255075991153717), (73, 0.01598145067691803), (74, 0.020194005221128464), (75, 0.023122061043977737), (76, 0.02514142543077469), (77, 0.02642441913485527), (78, 0.02728046476840973), (79, 0.027811897918581963), (80, 0.027871955186128616), (81, 0.027385860681533813), (82, 0.026419296860694885), (83, 0.025137504562735558), (84, 0.023778706789016724), (85, 0.02261281944811344), (86, 0.021787455305457115), (87, 0.02131231687963009), (88, 0.021086636930704117), (89, 0.020877715200185776), (90, 0.020463600754737854), (91, 0.01968519017100334), (92, 0.01841273158788681), (93, 0.01663277857005596), (94, 0.014371571131050587), (95, 0.011449037119746208), (96, 0.007292035035789013), (97, 0.0013938980409875512), (98, -0.006164098624140024), (99, -0.015054536983370781), (100, -0.024278774857521057), (101, -0.03199740871787071), (102, -0.037035830318927765), (103, -0.03914548456668854), (104, -0.03838681802153587), (105, -0.035546060651540756), (106, -0.031836241483688354), (107, -0.02791900932788849), (108, -0.02414119243621826), (109, -0.020796407014131546), (110, -0.017817091196775436), (111, -0.015111599117517471), (112, -0.012625171802937984), (113, -0.010190611705183983), (114, -0.0077965413220226765), (115, -0.00548639427870512), (116, -0.0032932639587670565), (117, -0.0013540590880438685), (118, 0.00024321343516930938), (119, 0.0015178614994511008), (120, 0.0025145718827843666), (121, 0.003325190395116806), (122, 0.0041034286841750145), (123, 0.004980148747563362), (124, 0.00603119283914566), (125, 0.007337348535656929), (126, 0.008934096433222294), (127, 0.010738756507635117), (128, 0.012649953365325928), (129, 0.01462394930422306), (130, 0.016552194952964783), (131, 0.018106933683156967), (132, 0.0186981912702322), (133, 0.017711589112877846), (134, 0.014830796048045158), (135, 0.010075673460960388), (136, 0.004282686859369278), (137, -0.0009270160226151347), (138, -0.004365919623523951), (139, -0.005303072743117809), (140, -0.0034797710832208395), (141, 0.00018280092626810074), (142, 0.004534859210252762), (143, 0.008701693266630173), (144, 0.01171189360320568), (145, 0.013138527050614357), (146, 0.01314430870115757), (147, 0.011934611946344376), (148, 0.009779899381101131), (149, 0.007079175673425198), (150, 0.004123763181269169), (151, 0.001004667952656746), (152, -0.0021088537760078907), (153, -0.005047973245382309), (154, -0.007761180400848389), (155, -0.01012042723596096), (156, -0.012044200673699379), (157, -0.01344569493085146), (158, -0.014067573472857475), (159, -0.013760335743427277), (160, -0.012560287490487099), (161, -0.010536083951592445), (162, -0.007915482856333256), (163, -0.00502106873318553), (164, -0.0020689014345407486), (165, 0.0007319116848520935), (166, 0.00320773315615952), (167, 0.005047788843512535), (168, 0.005759533494710922), (169, 0.005156604573130608), (170, 0.0032580532133579254), (171, 0.00031209923326969147), (172, -0.0028777369298040867), (173, -0.005502661690115929), (174, -0.007140140049159527), (175, -0.007628085091710091), (176, -0.007138760294765234), (177, -0.006083831191062927), (178, -0.004856634885072708), (179, -0.0037146294489502907), (180, -0.002799578011035919), (181, -0.00221047131344676), (182, -0.001967638498172164), (183, -0.0019870379474014044), (184, -0.002139139687642455), (185, -0.0022758478298783302), (186, -0.002269455697387457), (187, -0.002070455113425851), (188, -0.001693021273240447), (189, -0.0011952194618061185), (190, -0.0006697996868751943), (191, -0.00017044570995494723), (192, 0.00028077594470232725), (193, 0.0006482740864157677), (194, 0.000943629362154752), (195, 0.001222876482643187), (196, 0.0015267140697687864), (197, 0.0018667220138013363), (198, 0.002225905191153288), (199, 0.002546638948842883), (200, 0.0026423102244734764), (201, 0.002242090180516243), (202, 0.0009825393790379167), (203, -0.001728484290651977), (204, -0.005956429522484541), (205, -0.011110934428870678), (206, -0.01657525822520256), (207, -0.02099546417593956), (208, -0.02311883121728897), (209, -0.02286204695701599), (210, -0.020540807396173477), (211, -0.017157642170786858), (212, -0.013903502374887466), (213, -0.011423740535974503), (214, -0.010120867751538754), (215, -0.00979961734265089), (216, -0.009937327355146408), (217, -0.010238893330097198), (218, -0.010532550513744354), (219, -0.010758692398667336), (220, -0.01100492849946022), (221, -0.011400409042835236), (222, -0.0120033985003829), (223, -0.012752445414662361), (224, -0.013532925397157669), (225, -0.014244986698031425), (226, -0.01473304070532322), (227, -0.014813688583672047), (228, -0.014393210411071777), (229, -0.0134230125695467), (230, -0.011923052370548248), (231, -0.010106699541211128), (232, -0.008275976404547691), (233, -0.006673862226307392), (234, -0.00553649477660656), (235, -0.005090603604912758), (236, -0.005453653167933226), (237, -0.006759188137948513), (238, -0.009094462729990482), (239, -0.012131601572036743), (240, -0.01537315919995308), (241, -0.018291451036930084), (242, -0.019994713366031647), (243, -0.01991216093301773), (244, -0.01823429949581623), (245, -0.015035763382911682), (246, -0.010484343394637108), (247, -0.005382333882153034), (248, -0.00014956120867282152), (249, 0.005252948962152004), (250, 0.010457098484039307), (251, 0.015183119103312492), (252, 0.01960243657231331), (253, 0.023787466809153557), (254, 0.027605142444372177), (255, 0.030976099893450737), (256, 0.03384178876876831), (257, 0.035851337015628815), (258, 0.03654145821928978), (259, 0.03586321324110031), (260, 0.033998288214206696), (261, 0.031253524124622345), (262, 0.028298242017626762), (263, 0.025749873369932175), (264, 0.0239403136074543), (265, 0.02309594303369522), (266, 0.02319234237074852), (267, 0.023995427414774895), (268, 0.025210920721292496), (269, 0.02643023058772087), (270, 0.027250751852989197), (271, 0.027423188090324402), (272, 0.02686181478202343), (273, 0.025645580142736435), (274, 0.023907780647277832), (275, 0.02159055881202221), (276, 0.018488723784685135), (277, 0.014611519873142242), (278, 0.010181145742535591), (279, 0.005602823570370674), (280, 0.0017977699171751738), (281, -0.0002755996829364449), (282, -0.0004137455835007131), (283, 0.00123102858196944), (284, 0.004399157129228115), (285, 0.008341837674379349), (286, 0.0123611930757761), (287, 0.016286849975585938), (288, 0.019948404282331467), (289, 0.02312113717198372), (290, 0.025697270408272743), (291, 0.027419064193964005), (292, 0.028080806136131287), (293, 0.027669675648212433), (294, 0.026191432029008865), (295, 0.023962775245308876), (296, 0.021550079807639122), (297, 0.01932954043149948), (298, 0.017610330134630203), (299, 0.01664981059730053), (300, 0.01642647199332714), (301, 0.016780629754066467), (302, 0.017567310482263565), (303, 0.018657365813851357), (304, 0.019968600943684578), (305, 0.021431490778923035), (306, 0.022998366504907608), (307, 0.024734588339924812), (308, 0.026571419090032578), (309, 0.028164491057395935), (310, 0.029001815244555473), (311, 0.02816237509250641), (312, 0.02498299814760685), (313, 0.019778281450271606), (314, 0.013152837753295898), (315, 0.006394723430275917), (316, 0.0014555852394551039), (317, -0.000948514963965863), (318, -0.0011524547589942813), (319, 0.0004930072464048862), (320, 0.0030684133525937796), (321, 0.005496656522154808), (322, 0.007469968870282173), (323, 0.008976229466497898), (324, 0.009876541793346405), (325, 0.010117997415363789), (326, 0.00974139105528593), (327, 0.008847343735396862), (328, 0.007687968667596579), (329, 0.0066809263080358505), (330, 0.006202404387295246), (331, 0.0064394851215183735), (332, 0.007456531748175621), (333, 0.009088389575481415), (334, 0.010982748121023178), (335, 0.012940092012286186), (336, 0.01482526957988739), (337, 0.016409486532211304), (338, 0.017577743157744408), (339, 0.018279530107975006), (340, 0.018418826162815094), (341, 0.017940999940037727), (342, 0.01676970347762108), (343, 0.014869170263409615), (344, 0.012212645262479782), (345, 0.008760281838476658), (346, 0.00488100154325366), (347, 0.0011304159415885806), (348, -0.0019042775966227055), (349, -0.0034622447565197945), (350, -0.003320792457088828), (351, -0.0017250493401661515), (352, 0.0009510326199233532), (353, 0.003926487639546394), (354, 0.006496373564004898), (355, 0.008412845432758331), (356, 0.009654199704527855), (357, 0.010242501273751259), (358, 0.01018227357417345), (359, 0.00953054428100586), (360, 0.0082869166508317), (361, 0.0064187850803136826), (362, 0.004290787503123283), (363, 0.002484843134880066), (364, 0.001340902759693563), (365, 0.001092112623155117), (366, 0.0017956221709027886), (367, 0.00316051859408617), (368, 0.004821117036044598), (369, 0.006562494207173586), (370, 0.008218169212341309), (371, 0.009619561024010181), (372, 0.010743333026766777), (373, 0.011584964580833912), (374, 0.01210853736847639), (375, 0.012455711141228676), (376, 0.012781674042344093), (377, 0.01304161362349987), (378, 0.012888412922620773), (379, 0.011706268414855003), (380, 0.009089093655347824), (381, 0.004968883935362101), (382, -0.00018131127581000328), (383, -0.005030745640397072), (384, -0.008344268426299095), (385, -0.009344872087240219), (386, -0.007650394458323717), (387, -0.003933252301067114), (388, 0.0010269747581332922), (389, 0.0066373348236083984), (390, 0.011869840323925018), (391, 0.016355786472558975), (392, 0.020048901438713074), (393, 0.022469183430075645), (394, 0.023506883531808853), (395, 0.02325594797730446), (396, 0.021737877279520035), (397, 0.019174542278051376), (398, 0.015979602932929993), (399, 0.012727359309792519), (400, 0.009903126396238804), (401, 0.007760721258819103), (402, 0.006404124200344086), (403, 0.005719803273677826), (404, 0.005406334064900875), (405, 0.005171750672161579), (406, 0.0048492951318621635), (407, 0.0043576983734965324), (408, 0.0036671473644673824), (409, 0.002826105570420623), (410, 0.0019248686730861664), (411, 0.0009931306121870875), (412, -0.00014139676932245493), (413, -0.0017710464308038354), (414, -0.004027936607599258), (415, -0.006967451423406601), (416, -0.010462617501616478), (417, -0.01379830576479435), (418, -0.016144540160894394), (419, -0.017104497179389), (420, -0.016501812264323235), (421, -0.014426647685468197), (422, -0.011540479026734829), (423, -0.008645660243928432), (424, -0.006099522579461336), (425, -0.004134703427553177), (426, -0.002907546702772379), (427, -0.002175624016672373), (428, -0.0017306965310126543), (429, -0.0016018891474232078), (430, -0.0018732903990894556), (431, -0.0027151363901793957), (432, -0.004228598903864622), (433, -0.006342903710901737), (434, -0.0088009312748909), (435, -0.011133462190628052), (436, -0.012960299849510193), (437, -0.014129244722425938), (438, -0.014592580497264862), (439, -0.014430541545152664), (440, -0.013795344159007072), (441, -0.01276303082704544), (442, -0.011311034671962261), (443, -0.009601675905287266), (444, -0.00797889195382595), (445, -0.006530698388814926), (446, -0.005407737568020821), (447, -0.004830420948565006), (448, -0.004588223993778229), (449, -0.004800616763532162), (450, -0.006017208099365234), (451, -0.008320804685354233), (452, -0.01155773364007473), (453, -0.01538928970694542), (454, -0.018895026296377182), (455, -0.021107979118824005), (456, -0.021761534735560417), (457, -0.021197233349084854), (458, -0.01989450305700302), (459, -0.018483074381947517), (460, -0.01753821223974228), (461, -0.01727997325360775), (462, -0.01785396970808506), (463, -0.019246520474553108), (464, -0.021365370601415634), (465, -0.02415485680103302), (466, -0.02702500857412815), (467, -0.029361680150032043), (468, -0.03100881353020668), (469, -0.0316503569483757), (470, -0.03120468184351921), (471, -0.03006177581846714), (472, -0.028381168842315674), (473, -0.026246748864650726), (474, -0.02386254444718361), (475, -0.02125934511423111), (476, -0.018483225256204605), (477, -0.015666477382183075), (478, -0.012917760759592056), (479, -0.010359609499573708), (480, -0.007964137941598892), (481, -0.00571775296702981), (482, -0.003822464495897293), (483, -0.002471954794600606), (484, -0.0019679099787026644), (485, -0.0027739228680729866), (486, -0.004903407767415047), (487, -0.008525632321834564), (488, -0.012456300668418407), (489, -0.019109701737761497)], ('rotation_euler', 1): [(1, 0.02869311347603798), (2, 0.027887023985385895), (3, 0.026968296617269516), (4, 0.02588540129363537), (5, 0.02461625263094902), (6, 0.023454319685697556), (7, 0.0226353257894516), (8, 0.022322749719023705), (9, 0.02254446968436241), (10, 0.023229263722896576), (11, 0.024291783571243286), (12, 0.025685898959636688), (13, 0.02741471491754055), (14, 0.02960759773850441), (15, 0.03243967145681381), (16, 0.03577897697687149), (17, 0.03931858390569687), (18, 0.04271513596177101), (19, 0.04534321278333664), (20, 0.046726714819669724), (21, 0.04698823392391205), (22, 0.046642646193504333), (23, 0.046368323266506195), (24, 0.046925440430641174), (25, 0.04907342046499252), (26, 0.053038641810417175), (27, 0.058330386877059937), (28, 0.06439658254384995), (29, 0.07065165787935257), (30, 0.0763450413942337), (31, 0.0811333954334259), (32, 0.08507467806339264), (33, 0.08820196986198425), (34, 0.09057308733463287), (35, 0.09225382655858994), (36, 0.09322036802768707), (37, 0.09348534047603607), (38, 0.09315989911556244), (39, 0.09243524819612503), (40, 0.09154826402664185), (41, 0.09070181846618652), (42, 0.09001457691192627), (43, 0.08947370201349258), (44, 0.08892558515071869), (45, 0.0881420373916626), (46, 0.0869196206331253), (47, 0.08513490855693817), (48, 0.08259902894496918), (49, 0.07915344834327698), (50, 0.07483644038438797), (51, 0.06964538991451263), (52, 0.06370006501674652), (53, 0.057318590581417084), (54, 0.0508154034614563), (55, 0.044557083398103714), (56, 0.03871253877878189), (57, 0.03339802101254463), (58, 0.02879084274172783), (59, 0.02473367564380169), (60, 0.020885875448584557), (61, 0.016926096752285957), (62, 0.01253877580165863), (63, 0.007291874848306179), (64, 0.0010400937171652913), (65, -0.005746318958699703), (66, -0.013048745691776276), (67, -0.02083101123571396), (68, -0.028240598738193512), (69, -0.03500344604253769), (70, -0.040942009538412094), (71, -0.045229002833366394), (72, -0.04765772074460983), (73, -0.04856891930103302), (74, -0.048357050865888596), (75, -0.04770543426275253), (76, -0.047359731048345566), (77, -0.04774917662143707), (78, -0.048908062279224396), (79, -0.05063404142856598), (80, -0.05251913145184517), (81, -0.05405506491661072), (82, -0.05489969626069069), (83, -0.054890021681785583), (84, -0.05398331582546234), (85, -0.05234070122241974), (86, -0.05037485063076019), (87, -0.04845678061246872), (88, -0.04669740051031113), (89, -0.04510146379470825), (90, -0.043544232845306396), (91, -0.04176877439022064), (92, -0.039634257555007935), (93, -0.03721201792359352), (94, -0.03468218445777893), (95, -0.03224455565214157), (96, -0.030243434011936188), (97, -0.029106151312589645), (98, -0.0289091058075428), (99, -0.029570460319519043), (100, -0.03097301349043846), (101, -0.032387666404247284), (102, -0.032970450818538666), (103, -0.03227638453245163), (104, -0.029828377068042755), (105, -0.02553800493478775), (106, -0.019906220957636833), (107, -0.013513816520571709), (108, -0.0071180895902216434), (109, -0.001410754513926804), (110, 0.003366071032360196), (111, 0.00714785186573863), (112, 0.010006334632635117), (113, 0.01214456744492054), (114, 0.013672592118382454), (115, 0.014652403071522713), (116, 0.015216073952615261), (117, 0.015584945678710938), (118, 0.015968430787324905), (119, 0.01644665002822876), (120, 0.01695353165268898), (121, 0.017185743898153305), (122, 0.016723139211535454), (123, 0.015248745679855347), (124, 0.01262279599905014), (125, 0.008998974226415157), (126, 0.004643972497433424), (127, -8.039886597543955e-05), (128, -0.004658570513129234), (129, -0.008808385580778122), (130, -0.012313587591052055), (131, -0.014847679063677788), (132, -0.016411148011684418), (133, -0.017333263531327248), (134, -0.018129903823137283), (135, -0.019414572045207024), (136, -0.021616123616695404), (137, -0.024999264627695084), (138, -0.029370281845331192), (139, -0.03394076228141785), (140, -0.03807508945465088), (141, -0.04117511957883835), (142, -0.042529746890068054), (143, -0.042115554213523865), (144, -0.04047826677560806), (145, -0.03831169009208679), (146, -0.03650573268532753), (147, -0.03577745705842972), (148, -0.036311935633420944), (149, -0.037847839295864105), (150, -0.03988777846097946), (151, -0.041913360357284546), (152, -0.0435701459646225), (153, -0.04471380263566971), (154, -0.04534109681844711), (155, -0.045521143823862076), (156, -0.04535197466611862), (157, -0.0449424609541893), (158, -0.04439905285835266), (159, -0.04378841817378998), (160, -0.043118447065353394), (161, -0.04232555627822876), (162, -0.041233889758586884), (163, -0.039535969495773315), (164, -0.03694535046815872), (165, -0.03352419286966324), (166, -0.029634136706590652), (167, -0.025752026587724686), (168, -0.022647041827440262), (169, -0.020933976396918297), (170, -0.020484574139118195), (171, -0.020793316885828972), (172, -0.021202929317951202), (173, -0.02094131149351597), (174, -0.019599512219429016), (175, -0.0173127930611372), (176, -0.01450782548636198), (177, -0.01161162368953228), (178, -0.008813672699034214), (179, -0.006131417118012905), (180, -0.003514978801831603), (181, -0.0008570841164328158), (182, 0.0016842460026964545), (183, 0.003759221639484167), (184, 0.005258569493889809), (185, 0.006205905694514513), (186, 0.006715008057653904), (187, 0.007060736417770386), (188, 0.007436507381498814), (189, 0.007848517037928104), (190, 0.008215703070163727), (191, 0.008432792499661446), (192, 0.00837741233408451), (193, 0.007928106002509594), (194, 0.007030998356640339), (195, 0.005696952808648348), (196, 0.00383605994284153), (197, 0.0013074611779302359), (198, -0.0020046946592628956), (199, -0.006273110397160053), (200, -0.011534049175679684), (201, -0.01777080073952675), (202, -0.0246940478682518), (203, -0.031623803079128265), (204, -0.038385603576898575), (205, -0.04479031264781952), (206, -0.050304561853408813), (207, -0.05519544705748558), (208, -0.05982839688658714), (209, -0.06402229517698288), (210, -0.06784094125032425), (211, -0.07134222984313965), (212, -0.07410304248332977), (213, -0.07575534284114838), (214, -0.07633483409881592), (215, -0.07593710720539093), (216, -0.07484415173530579), (217, -0.07366111874580383), (218, -0.07280746102333069), (219, -0.07246577739715576), (220, -0.07278746366500854), (221, -0.0738094300031662), (222, -0.07540450990200043), (223, -0.07741095870733261), (224, -0.07964222133159637), (225, -0.08167335391044617), (226, -0.08295279741287231), (227, -0.08315062522888184), (228, -0.0822654515504837), (229, -0.08051580935716629), (230, -0.07834886014461517), (231, -0.07636728882789612), (232, -0.07486984133720398), (233, -0.07378439605236053), (234, -0.07293983548879623), (235, -0.0720665454864502), (236, -0.07096398621797562), (237, -0.06955672055482864), (238, -0.06771726906299591), (239, -0.06546808779239655), (240, -0.06283923983573914), (241, -0.05961312726140022), (242, -0.055653490126132965), (243, -0.05060017481446266), (244, -0.04395667463541031), (245, -0.035812858492136), (246, -0.026396173983812332), (247, -0.01642105169594288), (248, -0.007394641637802124), (249, -0.00016552279703319073), (250, 0.0051064034923911095), (251, 0.008455355651676655), (252, 0.0106769148260355), (253, 0.012816259637475014), (254, 0.015347788110375404), (255, 0.018439283594489098), (256, 0.022065330296754837), (257, 0.025768645107746124), (258, 0.029042212292551994), (259, 0.03158175200223923), (260, 0.033061493188142776), (261, 0.03332701325416565), (262, 0.03255630284547806), (263, 0.031044267117977142), (264, 0.029141215607523918), (265, 0.02725575678050518), (266, 0.025638295337557793), (267, 0.02422109991312027), (268, 0.02277427166700363), (269, 0.02101622149348259), (270, 0.01868869736790657), (271, 0.015812499448657036), (272, 0.012679941952228546), (273, 0.009634071961045265), (274, 0.006961483508348465), (275, 0.004805253818631172), (276, 0.0031421405728906393), (277, 0.0018346698489040136), (278, 0.000885394518263638), (279, 0.0005144450697116554), (280, 0.0008543870644643903), (281, 0.002008700743317604), (282, 0.003892143489792943), (283, 0.005931331776082516), (284, 0.007507839240133762), (285, 0.008199309930205345), (286, 0.007823701947927475), (287, 0.006602702662348747), (288, 0.004957430064678192), (289, 0.003290579654276371), (290, 0.0018371627666056156), (291, 0.0005691025871783495), (292, -0.00062754430109635), (293, -0.0018220815109089017), (294, -0.003060048446059227), (295, -0.0043213097378611565), (296, -0.005530539434403181), (297, -0.006662842817604542), (298, -0.007747172378003597), (299, -0.008777283132076263), (300, -0.009679606184363365), (301, -0.010327668860554695), (302, -0.010548865422606468), (303, -0.010093236342072487), (304, -0.008670139126479626), (305, -0.006203570403158665), (306, -0.002761359792202711), (307, 0.001720961183309555), (308, 0.007008676417171955), (309, 0.01253463327884674), (310, 0.018068481236696243), (311, 0.023369476199150085), (312, 0.027979763224720955), (313, 0.031938571482896805), (314, 0.035507556051015854), (315, 0.038711871951818466), (316, 0.04163700342178345), (317, 0.044310860335826874), (318, 0.046637944877147675), (319, 0.048733800649642944), (320, 0.0508555993437767), (321, 0.05325280874967575), (322, 0.05617184191942215), (323, 0.059536851942539215), (324, 0.0628962442278862), (325, 0.06581395864486694), (326, 0.06791982054710388), (327, 0.06897777318954468), (328, 0.06904514133930206), (329, 0.06828030943870544), (330, 0.06684881448745728), (331, 0.0649663507938385), (332, 0.06272196769714355), (333, 0.060128360986709595), (334, 0.05729125440120697), (335, 0.05416059494018555), (336, 0.05063670873641968), (337, 0.04689224809408188), (338, 0.04311274364590645), (339, 0.039379313588142395), (340, 0.03590100631117821), (341, 0.03286921977996826), (342, 0.030156787484884262), (343, 0.027538757771253586), (344, 0.02481464482843876), (345, 0.021715421229600906), (346, 0.018095988780260086), (347, 0.013848544098436832), (348, 0.009125552140176296), (349, 0.004527759272605181), (350, 0.0004946074914187193), (351, -0.0024833139032125473), (352, -0.0037674899213016033), (353, -0.0033603457268327475), (354, -0.0017639268189668655), (355, 0.00041404308285564184), (356, 0.002444860525429249), (357, 0.003728254232555628), (358, 0.004053058568388224), (359, 0.003537673270329833), (360, 0.0024189224932342768), (361, 0.0009072531829588115), (362, -0.0008822696399874985), (363, -0.002883997978642583), (364, -0.005002790130674839), (365, -0.007067931815981865), (366, -0.008805952034890652), (367, -0.0099012590944767), (368, -0.010070564225316048), (369, -0.009125642478466034), (370, -0.007004197221249342), (371, -0.003781776875257492), (372, 0.00032160780392587185), (373, 0.005212624557316303), (374, 0.010925277136266232), (375, 0.017145667225122452), (376, 0.023594729602336884), (377, 0.03014683909714222), (378, 0.03604666143655777), (379, 0.040778353810310364), (380, 0.044705428183078766), (381, 0.04807830974459648), (382, 0.05142417550086975), (383, 0.05572553724050522), (384, 0.06123964488506317), (385, 0.06773407757282257), (386, 0.07498032599687576), (387, 0.08237133920192719), (388, 0.08928829431533813), (389, 0.0953703224658966), (390, 0.10031989961862564), (391, 0.10392321646213531), (392, 0.10595321655273438), (393, 0.10645361244678497), (394, 0.10579699277877808), (395, 0.10424935072660446), (396, 0.10212784260511398), (397, 0.09982313215732574), (398, 0.0973881408572197), (399, 0.09473419189453125), (400, 0.09190848469734192), (401, 0.08887074887752533), (402, 0.08560129255056381), (403, 0.08217412233352661), (404, 0.07843376696109772), (405, 0.07432595640420914), (406, 0.0700632706284523), (407, 0.06566973030567169), (408, 0.0612863264977932), (409, 0.057214587926864624), (410, 0.05333884805440903), (411, 0.04943612962961197), (412, 0.045499928295612335), (413, 0.04144755005836487), (414, 0.03702215477824211), (415, 0.03211989998817444), (416, 0.02694854512810707), (417, 0.021549195051193237), (418, 0.01600784622132778), (419, 0.011140840128064156), (420, 0.007795616053044796), (421, 0.006210297346115112), (422, 0.006635812111198902), (423, 0.00912841409444809), (424, 0.012826312333345413), (425, 0.0166959036141634), (426, 0.0201129000633955), (427, 0.022449005395174026), (428, 0.023304617032408714), (429, 0.022812850773334503), (430, 0.021336298435926437), (431, 0.019276443868875504), (432, 0.017056811600923538), (433, 0.015056891366839409), (434, 0.013486039824783802), (435, 0.012333893217146397), (436, 0.011469735763967037), (437, 0.010734668001532555), (438, 0.00995480827987194), (439, 0.009133147075772285), (440, 0.008662995882332325), (441, 0.009008238092064857), (442, 0.01062160823494196), (443, 0.01412769965827465), (444, 0.01957082934677601), (445, 0.026499338448047638), (446, 0.034615300595760345), (447, 0.04307611286640167), (448, 0.05104986950755119), (449, 0.05843096971511841), (450, 0.06510870158672333), (451, 0.07125808298587799), (452, 0.07722871750593185), (453, 0.08294473588466644), (454, 0.0881049633026123), (455, 0.09205813705921173), (456, 0.09425798058509827), (457, 0.09476399421691895), (458, 0.09382638335227966), (459, 0.0919615775346756), (460, 0.08988624811172485), (461, 0.08796011656522751), (462, 0.08633002638816833), (463, 0.0851319208741188), (464, 0.08437862992286682), (465, 0.08403418958187103), (466, 0.08396103978157043), (467, 0.08386571705341339), (468, 0.08344314992427826), (469, 0.08244429528713226), (470, 0.08072501420974731), (471, 0.07832327485084534), (472, 0.07546664774417877), (473, 0.07244108617305756), (474, 0.06942857056856155), (475, 0.0665954053401947), (476, 0.06404578685760498), (477, 0.0616140179336071), (478, 0.05917826294898987), (479, 0.05678822100162506), (480, 0.05439965799450874), (481, 0.052019767463207245), (482, 0.049773313105106354), (483, 0.04764866083860397), (484, 0.04536032676696777), (485, 0.0428222231566906), (486, 0.040289506316185), (487, 0.0375150665640831), (488, 0.03499320149421692), (489, 0.03165169805288315)], ('rotation_euler', 2): [(1, 3.1300694942474365), (2, 3.127272367477417), (3, 3.1252195835113525), (4, 3.124272584915161), (5, 3.123497486114502), (6, 3.123196601867676), (7, 3.1232447624206543), (8, 3.1233208179473877), (9, 3.1231565475463867), (10, 3.122727870941162), (11, 3.1220340728759766), (12, 3.121211528778076), (13, 3.1205453872680664), (14, 3.120231866836548), (15, 3.1203207969665527), (16, 3.1207709312438965), (17, 3.1214566230773926), (18, 3.122195243835449), (19, 3.1228690147399902), (20, 3.1235594749450684), (21, 3.1244916915893555), (22, 3.125899314880371), (23, 3.1278576850891113), (24, 3.1302127838134766), (25, 3.132676124572754), (26, 3.1348366737365723), (27, 3.1363861560821533), (28, 3.1374239921569824), (29, 3.1382393836975098), (30, 3.139009714126587), (31, 3.1398696899414062), (32, 3.1408684253692627), (33, 3.1417393684387207), (34, 3.14211368560791), (35, 3.141875743865967), (36, 3.1410722732543945), (37, 3.1397643089294434), (38, 3.1380887031555176), (39, 3.1362576484680176), (40, 3.1344194412231445), (41, 3.1325998306274414), (42, 3.1308093070983887), (43, 3.1291251182556152), (44, 3.1275744438171387), (45, 3.126070499420166), (46, 3.124594211578369), (47, 3.1232242584228516), (48, 3.121995449066162), (49, 3.1209754943847656), (50, 3.1203317642211914), (51, 3.1201834678649902), (52, 3.120506763458252), (53, 3.1211791038513184), (54, 3.122035026550293), (55, 3.122826099395752), (56, 3.123288631439209), (57, 3.1233205795288086), (58, 3.1229348182678223), (59, 3.122194290161133), (60, 3.121213674545288), (61, 3.120070695877075), (62, 3.118807792663574), (63, 3.1174240112304688), (64, 3.115849018096924), (65, 3.114053726196289), (66, 3.112022638320923), (67, 3.1097774505615234), (68, 3.1075196266174316), (69, 3.1054739952087402), (70, 3.1038055419921875), (71, 3.102640151977539), (72, 3.10176682472229), (73, 3.100794792175293), (74, 3.0994796752929688), (75, 3.0975050926208496), (76, 3.094816207885742), (77, 3.091710090637207), (78, 3.088439464569092), (79, 3.0854129791259766), (80, 3.082965850830078), (81, 3.0812292098999023), (82, 3.08027982711792), (83, 3.079928398132324), (84, 3.079836368560791), (85, 3.079698324203491), (86, 3.0792832374572754), (87, 3.0784804821014404), (88, 3.0773539543151855), (89, 3.0761001110076904), (90, 3.074885606765747), (91, 3.073823928833008), (92, 3.072964668273926), (93, 3.0723133087158203), (94, 3.0719757080078125), (95, 3.072233200073242), (96, 3.074355125427246), (97, 3.0804696083068848), (98, 3.0909533500671387), (99, 3.105266571044922), (100, 3.122969150543213), (101, 3.1403422355651855), (102, 3.1536293029785156), (103, 3.1627349853515625), (104, 3.167585849761963), (105, 3.168590545654297), (106, 3.167985677719116), (107, 3.1671767234802246), (108, 3.1662862300872803), (109, 3.165372371673584), (110, 3.1646182537078857), (111, 3.1640212535858154), (112, 3.1634607315063477), (113, 3.162890911102295), (114, 3.1622328758239746), (115, 3.16140079498291), (116, 3.1604342460632324), (117, 3.1594133377075195), (118, 3.158390760421753), (119, 3.157423496246338), (120, 3.156480312347412), (121, 3.155463695526123), (122, 3.154351234436035), (123, 3.153090000152588), (124, 3.151632785797119), (125, 3.150099754333496), (126, 3.148578405380249), (127, 3.1471519470214844), (128, 3.146059513092041), (129, 3.145402669906616), (130, 3.145111560821533), (131, 3.1451590061187744), (132, 3.1453795433044434), (133, 3.1454849243164062), (134, 3.1454408168792725), (135, 3.1453418731689453), (136, 3.1451680660247803), (137, 3.1449527740478516), (138, 3.144695997238159), (139, 3.1441006660461426), (140, 3.1428959369659424), (141, 3.1410775184631348), (142, 3.1386606693267822), (143, 3.1357600688934326), (144, 3.132608413696289), (145, 3.1293153762817383), (146, 3.1259539127349854), (147, 3.122586250305176), (148, 3.1192471981048584), (149, 3.1160941123962402), (150, 3.1132469177246094), (151, 3.110685348510742), (152, 3.108433723449707), (153, 3.106484889984131), (154, 3.104719638824463), (155, 3.1030936241149902), (156, 3.101602792739868), (157, 3.1001362800598145), (158, 3.09863543510437), (159, 3.097087860107422), (160, 3.095430374145508), (161, 3.0938103199005127), (162, 3.092566728591919), (163, 3.0919747352600098), (164, 3.092306613922119), (165, 3.094074249267578), (166, 3.0978269577026367), (167, 3.103328227996826), (168, 3.1100354194641113), (169, 3.1176090240478516), (170, 3.1247591972351074), (171, 3.1302595138549805), (172, 3.1341586112976074), (173, 3.136472225189209), (174, 3.1373093128204346), (175, 3.1373019218444824), (176, 3.136733055114746), (177, 3.1357297897338867), (178, 3.134613037109375), (179, 3.1335811614990234), (180, 3.1328487396240234), (181, 3.1326212882995605), (182, 3.1327435970306396), (183, 3.132915496826172), (184, 3.132976531982422), (185, 3.13285493850708), (186, 3.1325979232788086), (187, 3.1324000358581543), (188, 3.1324357986450195), (189, 3.1327199935913086), (190, 3.133110523223877), (191, 3.1333956718444824), (192, 3.1334028244018555), (193, 3.133025646209717), (194, 3.132282018661499), (195, 3.1313343048095703), (196, 3.130319595336914), (197, 3.129342555999756), (198, 3.1285462379455566), (199, 3.128026008605957), (200, 3.127805709838867), (201, 3.127875804901123), (202, 3.128173828125), (203, 3.1284356117248535), (204, 3.128293514251709), (205, 3.1274938583374023), (206, 3.125781536102295), (207, 3.1231119632720947), (208, 3.1197357177734375), (209, 3.115934133529663), (210, 3.1120169162750244), (211, 3.1082868576049805), (212, 3.1050164699554443), (213, 3.1022539138793945), (214, 3.0998964309692383), (215, 3.097930908203125), (216, 3.096153736114502), (217, 3.094237804412842), (218, 3.092165231704712), (219, 3.090066432952881), (220, 3.0880703926086426), (221, 3.086822032928467), (222, 3.0869879722595215), (223, 3.0885653495788574), (224, 3.0915465354919434), (225, 3.095491409301758), (226, 3.0992431640625), (227, 3.1021885871887207), (228, 3.1041769981384277), (229, 3.105146884918213), (230, 3.105508327484131), (231, 3.105802536010742), (232, 3.1062941551208496), (233, 3.107100486755371), (234, 3.108315944671631), (235, 3.1102375984191895), (236, 3.113797664642334), (237, 3.1200947761535645), (238, 3.1293458938598633), (239, 3.1411828994750977), (240, 3.1546120643615723), (241, 3.1672158241271973), (242, 3.1770851612091064), (243, 3.184206485748291), (244, 3.1888587474823), (245, 3.1916661262512207), (246, 3.19382381439209), (247, 3.195638656616211), (248, 3.1967344284057617), (249, 3.196908950805664), (250, 3.196180820465088), (251, 3.1949357986450195), (252, 3.1936731338500977), (253, 3.19281005859375), (254, 3.1926755905151367), (255, 3.193164110183716), (256, 3.1938624382019043), (257, 3.1943814754486084), (258, 3.194364309310913), (259, 3.1935629844665527), (260, 3.1920623779296875), (261, 3.1901564598083496), (262, 3.1879429817199707), (263, 3.1855309009552), (264, 3.1831765174865723), (265, 3.180881977081299), (266, 3.1787497997283936), (267, 3.177257537841797), (268, 3.1765809059143066), (269, 3.176581382751465), (270, 3.1771788597106934), (271, 3.177915096282959), (272, 3.1780896186828613), (273, 3.177382707595825), (274, 3.1757330894470215), (275, 3.1733598709106445), (276, 3.170687675476074), (277, 3.1681573390960693), (278, 3.166226387023926), (279, 3.164975881576538), (280, 3.16422176361084), (281, 3.163787364959717), (282, 3.1633620262145996), (283, 3.1625778675079346), (284, 3.1612606048583984), (285, 3.1595115661621094), (286, 3.157378673553467), (287, 3.1549320220947266), (288, 3.152494430541992), (289, 3.1501870155334473), (290, 3.14797306060791), (291, 3.145998954772949), (292, 3.144348621368408), (293, 3.142984390258789), (294, 3.1420013904571533), (295, 3.1415605545043945), (296, 3.1416475772857666), (297, 3.142184257507324), (298, 3.143101215362549), (299, 3.144165515899658), (300, 3.1451478004455566), (301, 3.1459946632385254), (302, 3.146756410598755), (303, 3.1476333141326904), (304, 3.1488699913024902), (305, 3.1506552696228027), (306, 3.1530632972717285), (307, 3.155820369720459), (308, 3.1585140228271484), (309, 3.16074275970459), (310, 3.1621131896972656), (311, 3.162869691848755), (312, 3.163621664047241), (313, 3.164626121520996), (314, 3.1662960052490234), (315, 3.168778657913208), (316, 3.1712353229522705), (317, 3.172995090484619), (318, 3.1739258766174316), (319, 3.1738619804382324), (320, 3.172954797744751), (321, 3.171692371368408), (322, 3.170365333557129), (323, 3.169034481048584), (324, 3.1677308082580566), (325, 3.166391372680664), (326, 3.16502046585083), (327, 3.1638307571411133), (328, 3.162965774536133), (329, 3.162548780441284), (330, 3.1627304553985596), (331, 3.1634068489074707), (332, 3.164217472076416), (333, 3.1647729873657227), (334, 3.1647939682006836), (335, 3.164111614227295), (336, 3.1626992225646973), (337, 3.160795211791992), (338, 3.1587648391723633), (339, 3.156829833984375), (340, 3.155186653137207), (341, 3.154029369354248), (342, 3.1533203125), (343, 3.152846097946167), (344, 3.152390480041504), (345, 3.151726245880127), (346, 3.1505818367004395), (347, 3.148810386657715), (348, 3.1464624404907227), (349, 3.1436264514923096), (350, 3.1404213905334473), (351, 3.137012481689453), (352, 3.1336326599121094), (353, 3.1303772926330566), (354, 3.127232789993286), (355, 3.1242904663085938), (356, 3.121455192565918), (357, 3.1185879707336426), (358, 3.115699291229248), (359, 3.112867593765259), (360, 3.110260009765625), (361, 3.108029842376709), (362, 3.106398105621338), (363, 3.1054792404174805), (364, 3.105238914489746), (365, 3.1057183742523193), (366, 3.106879949569702), (367, 3.1086106300354004), (368, 3.110837459564209), (369, 3.1133687496185303), (370, 3.11600399017334), (371, 3.118734836578369), (372, 3.12151837348938), (373, 3.1243162155151367), (374, 3.1276025772094727), (375, 3.132626533508301), (376, 3.1402711868286133), (377, 3.150639533996582), (378, 3.164203643798828), (379, 3.1794991493225098), (380, 3.193232297897339), (381, 3.2042126655578613), (382, 3.2115721702575684), (383, 3.2146358489990234), (384, 3.2150328159332275), (385, 3.214210033416748), (386, 3.212857246398926), (387, 3.211604595184326), (388, 3.210453987121582), (389, 3.2092700004577637), (390, 3.2080564498901367), (391, 3.2067582607269287), (392, 3.205559730529785), (393, 3.2049741744995117), (394, 3.205192804336548), (395, 3.206113815307617), (396, 3.207613945007324), (397, 3.2090487480163574), (398, 3.20969820022583), (399, 3.209351062774658), (400, 3.208038330078125), (401, 3.206003427505493), (402, 3.2034921646118164), (403, 3.2007036209106445), (404, 3.1978402137756348), (405, 3.1947884559631348), (406, 3.1915793418884277), (407, 3.1885409355163574), (408, 3.185698986053467), (409, 3.18314266204834), (410, 3.181145191192627), (411, 3.179625988006592), (412, 3.178439140319824), (413, 3.177515983581543), (414, 3.1764986515045166), (415, 3.175078868865967), (416, 3.173158645629883), (417, 3.170687198638916), (418, 3.1678810119628906), (419, 3.1649742126464844), (420, 3.1621227264404297), (421, 3.1596031188964844), (422, 3.157464027404785), (423, 3.155601739883423), (424, 3.154035806655884), (425, 3.1526951789855957), (426, 3.151329517364502), (427, 3.149787425994873), (428, 3.148106098175049), (429, 3.1462621688842773), (430, 3.1443023681640625), (431, 3.142442226409912), (432, 3.1407361030578613), (433, 3.1391568183898926), (434, 3.1377196311950684), (435, 3.1364102363586426), (436, 3.13529634475708), (437, 3.1345622539520264), (438, 3.1345443725585938), (439, 3.1355390548706055), (440, 3.1374974250793457), (441, 3.140298843383789), (442, 3.1436963081359863), (443, 3.147049903869629), (444, 3.149933338165283), (445, 3.1524252891540527), (446, 3.154691696166992), (447, 3.156859874725342), (448, 3.1591272354125977), (449, 3.161595344543457), (450, 3.163952350616455), (451, 3.1658425331115723), (452, 3.167358636856079), (453, 3.168761968612671), (454, 3.170212745666504), (455, 3.171875238418579), (456, 3.173754930496216), (457, 3.1754446029663086), (458, 3.1765482425689697), (459, 3.1771352291107178), (460, 3.1774532794952393), (461, 3.1776881217956543), (462, 3.1780929565429688), (463, 3.1787421703338623), (464, 3.179213047027588), (465, 3.1791858673095703), (466, 3.178755283355713), (467, 3.1779918670654297), (468, 3.1770896911621094), (469, 3.1764283180236816), (470, 3.176149845123291), (471, 3.1761460304260254), (472, 3.176218032836914), (473, 3.176133155822754), (474, 3.17568302154541), (475, 3.1746206283569336), (476, 3.1728320121765137), (477, 3.1704468727111816), (478, 3.1674680709838867), (479, 3.163984775543213), (480, 3.1603024005889893), (481, 3.1565141677856445), (482, 3.152684211730957), (483, 3.148932933807373), (484, 3.145219087600708), (485, 3.1414904594421387), (486, 3.137878894805908), (487, 3.1342101097106934), (488, 3.1310415267944336), (489, 3.1266167163848877)]}), 'PHONE_FREAKED_OUT': ('Freaked Out', 24.0, {('location', 0): [(1, -0.0017909705638885498), (2, -0.0018591135740280151), (3, -0.0018118172883987427), (4, -0.001723945140838623), (5, -0.001585543155670166), (6, -0.0014089792966842651), (7, -0.001256704330444336), (8, -0.0010966211557388306), (9, -0.0008652359247207642), (10, -0.0006074085831642151), (11, -0.0003363490104675293), (12, -4.626810550689697e-05), (13, 0.00019647181034088135), (14, 0.0004089772701263428), (15, 0.0006468892097473145), (16, 0.0008691921830177307), (17, 0.0010592266917228699), (18, 0.0012197941541671753), (19, 0.0013127028942108154), (20, 0.0013904273509979248), (21, 0.0015178322792053223), (22, 0.001627996563911438), (23, 0.0016835182905197144), (24, 0.0016765594482421875), (25, 0.001548871397972107), (26, 0.0013679713010787964), (27, 0.0012357532978057861), (28, 0.0011131465435028076), (29, 0.0009863823652267456), (30, 0.0008503347635269165), (31, 0.0006332919001579285), (32, 0.0003580451011657715), (33, 8.623301982879639e-05), (34, -0.00020174682140350342), (35, -0.0005189031362533569), (36, -0.0008587092161178589), (37, -0.0012254118919372559), (38, -0.0015475079417228699), (39, -0.0017518773674964905), (40, -0.0018862038850784302), (41, -0.001978948712348938), (42, -0.002044886350631714), (43, -0.0021514147520065308), (44, -0.002201557159423828), (45, -0.0020751953125), (46, -0.0018789172172546387), (47, -0.00163327157497406), (48, -0.0013141632080078125), (49, -0.0010521858930587769), (50, -0.0008449256420135498), (51, -0.0006235316395759583), (52, -0.0004447847604751587), (53, -0.0003386363387107849), (54, -0.0002749413251876831), (55, -0.00023192167282104492), (56, -0.00013874471187591553), (57, 4.6566128730773926e-05), (58, 0.0002209097146987915), (59, 0.0003105923533439636), (60, 0.00029140710830688477), (61, 0.00011409074068069458), (62, -0.0001790747046470642), (63, -0.0005131438374519348), (64, -0.0008807703852653503), (65, -0.001282624900341034), (66, -0.001696273684501648), (67, -0.002097204327583313), (68, -0.0024229735136032104), (69, -0.0026139169931411743), (70, -0.002699710428714752), (71, -0.002712339162826538), (72, -0.0026841163635253906), (73, -0.002688869833946228), (74, -0.002686329185962677), (75, -0.0025905370712280273), (76, -0.0024567916989326477), (77, -0.0023195892572402954), (78, -0.002204298973083496), (79, -0.002223491668701172), (80, -0.00234869122505188), (81, -0.0024701207876205444), (82, -0.0025820136070251465), (83, -0.002683088183403015), (84, -0.0027767568826675415), (85, -0.0029130205512046814), (86, -0.002961292862892151), (87, -0.002941116690635681), (88, -0.0027906671166419983), (89, -0.002627551555633545), (90, -0.00240209698677063), (91, -0.002193853259086609), (92, -0.00214405357837677), (93, -0.0021169334650039673), (94, -0.0020639970898628235), (95, -0.001997038722038269), (96, -0.001915961503982544), (97, -0.0018811151385307312), (98, -0.001834094524383545), (99, -0.001692846417427063), (100, -0.0015298500657081604), (101, -0.001351289451122284), (102, -0.0011227130889892578), (103, -0.0009184032678604126), (104, -0.0007174313068389893), (105, -0.0004612654447555542), (106, -0.00022192299365997314), (107, -3.9711594581604e-06), (108, 0.00026281923055648804), (109, 0.0005830526351928711), (110, 0.0009294375777244568), (111, 0.0012501031160354614), (112, 0.0015112310647964478), (113, 0.0016768425703048706), (114, 0.0017472058534622192), (115, 0.001818828284740448), (116, 0.0018849223852157593), (117, 0.0018596351146697998), (118, 0.0017630457878112793), (119, 0.0016087442636489868), (120, 0.001407921314239502), (121, 0.001248389482498169), (122, 0.0011337101459503174), (123, 0.0010217055678367615), (124, 0.0009584426879882812), (125, 0.0009493455290794373), (126, 0.0009699761867523193), (127, 0.0010470971465110779), (128, 0.0010434910655021667), (129, 0.0009263455867767334), (130, 0.0008126869797706604), (131, 0.0006525218486785889), (132, 0.0005344003438949585), (133, 0.0005352944135665894), (134, 0.0005518421530723572), (135, 0.0005457252264022827), (136, 0.0005203038454055786), (137, 0.00046847015619277954), (138, 0.0004152357578277588), (139, 0.00039743632078170776), (140, 0.0003723651170730591), (141, 0.00033326447010040283), (142, 0.0003112703561782837), (143, 0.0002641454339027405), (144, 0.0002133101224899292), (145, 0.00018284469842910767), (146, 0.00011357665061950684), (147, 3.889203071594238e-06), (148, -0.00012612342834472656), (149, -0.0003006458282470703), (150, -0.000493466854095459), (151, -0.000672556459903717), (152, -0.000835910439491272), (153, -0.000976666808128357), (154, -0.001106366515159607), (155, -0.00124262273311615), (156, -0.0014119148254394531), (157, -0.0016232281923294067), (158, -0.0019101053476333618), (159, -0.002253979444503784), (160, -0.00259535014629364), (161, -0.002826094627380371), (162, -0.0029638558626174927), (163, -0.003332085907459259), (164, -0.003661610186100006), (165, -0.003989264369010925), (166, -0.004293456673622131), (167, -0.004539161920547485), (168, -0.004754096269607544), (169, -0.004941612482070923), (170, -0.005101203918457031), (171, -0.005271598696708679), (172, -0.005447275936603546), (173, -0.005609199404716492), (174, -0.005784280598163605), (175, -0.005974479019641876), (176, -0.0061775073409080505), (177, -0.006333999335765839), (178, -0.006451278924942017), (179, -0.006590560078620911), (180, -0.006684906780719757), (181, -0.006797283887863159), (182, -0.006995037198066711), (183, -0.007046729326248169), (184, -0.006964817643165588), (185, -0.006930559873580933), (186, -0.006820112466812134), (187, -0.006760910153388977), (188, -0.006881982088088989), (189, -0.006853044033050537), (190, -0.006658077239990234), (191, -0.00648517906665802), (192, -0.006202384829521179), (193, -0.005965180695056915), (194, -0.005932457745075226), (195, -0.005772992968559265), (196, -0.005484715104103088), (197, -0.0052597373723983765), (198, -0.004947379231452942), (199, -0.004696473479270935), (200, -0.004656195640563965), (201, -0.004589267075061798), (202, -0.004465386271476746), (203, -0.004369333386421204), (204, -0.004246965050697327), (205, -0.004158109426498413), (206, -0.004169642925262451), (207, -0.004099264740943909), (208, -0.003944702446460724), (209, -0.0038282573223114014), (210, -0.003665819764137268), (211, -0.0035613924264907837), (212, -0.003612205386161804), (213, -0.0036540180444717407), (214, -0.0036418884992599487), (215, -0.0035910382866859436), (216, -0.0034049898386001587), (217, -0.0031212568283081055), (218, -0.0028045326471328735), (219, -0.0024321526288986206), (220, -0.0020472854375839233), (221, -0.001669660210609436), (222, -0.0013205558061599731), (223, -0.001012355089187622), (224, -0.0007507503032684326), (225, -0.0005333870649337769), (226, -0.0003416687250137329), (227, -0.0001946091651916504), (228, -7.53551721572876e-05), (229, 3.775209188461304e-05), (230, 0.00011628866195678711), (231, 0.00016439706087112427), (232, 0.00021173059940338135), (233, 0.0002545863389968872), (234, 0.00029931217432022095), (235, 0.0003475099802017212), (236, 0.00037432461977005005), (237, 0.0003769099712371826), (238, 0.0003719255328178406), (239, 0.0003804117441177368), (240, 0.0004288703203201294), (241, 0.0005124062299728394), (242, 0.000547945499420166), (243, 0.000499136745929718), (244, 0.00039440393447875977), (245, 0.00023256242275238037), (246, 7.783621549606323e-05), (247, -1.420825719833374e-05), (248, -5.4955482482910156e-05), (249, -7.614493370056152e-05), (250, -0.00010474026203155518), (251, -0.00012007355690002441), (252, -0.00011928379535675049), (253, -0.00010883063077926636), (254, -0.000131949782371521), (255, -0.0001893267035484314), (256, -0.00024040788412094116), (257, -0.00030768662691116333), (258, -0.00032866746187210083), (259, -0.00026410073041915894), (260, -0.00019741058349609375), (261, -0.00016361474990844727), (262, -0.00016304850578308105), (263, -0.0002178400754928589), (264, -0.000289231538772583), (265, -0.00031754374504089355), (266, -0.00031954795122146606), (267, -0.0003061369061470032), (268, -0.00027342885732650757), (269, -0.00025650858879089355), (270, -0.00024552643299102783), (271, -0.0002182498574256897), (272, -0.0001951754093170166), (273, -0.00018458813428878784), (274, -0.00019407272338867188), (275, -0.0002322867512702942), (276, -0.0002761855721473694), (277, -0.0003102123737335205), (278, -0.0003174245357513428), (279, -0.00033468008041381836), (280, -0.0004339739680290222), (281, -0.0006028413772583008), (282, -0.0008386969566345215), (283, -0.0011258646845817566), (284, -0.0013091117143630981), (285, -0.0013783052563667297), (286, -0.0014326497912406921), (287, -0.0014109611511230469), (288, -0.0013843998312950134), (289, -0.0014162808656692505), (290, -0.0013239085674285889), (291, -0.0011196136474609375), (292, -0.0009302645921707153), (293, -0.000689089298248291), (294, -0.0004833713173866272), (295, -0.0003983601927757263), (296, -0.00026150792837142944), (297, -6.015598773956299e-05), (298, 0.00011896342039108276), (299, 0.0003368258476257324), (300, 0.0005231946706771851), (301, 0.0006052553653717041), (302, 0.0007982999086380005), (303, 0.0010869503021240234), (304, 0.0013176724314689636), (305, 0.0016148686408996582), (306, 0.0018747597932815552), (307, 0.0020022988319396973), (308, 0.0022338926792144775), (309, 0.002590179443359375), (310, 0.0029630735516548157), (311, 0.003403186798095703), (312, 0.0038188397884368896), (313, 0.004123076796531677), (314, 0.004370182752609253), (315, 0.00457986444234848), (316, 0.004773586988449097), (317, 0.004958286881446838), (318, 0.005158945918083191), (319, 0.005405142903327942), (320, 0.005736410617828369), (321, 0.006129935383796692), (322, 0.006517946720123291), (323, 0.00689677894115448), (324, 0.0072524696588516235), (325, 0.00738988071680069), (326, 0.0073156654834747314), (327, 0.007414676249027252), (328, 0.007181398570537567), (329, 0.006796039640903473), (330, 0.006176859140396118), (331, 0.005331933498382568), (332, 0.004053831100463867), (333, 0.002387814223766327), (334, 0.00046034157276153564), (335, -0.0015408843755722046), (336, -0.0026772916316986084), (337, -0.0033371448516845703), (338, -0.004763275384902954), (339, -0.005889773368835449), (340, -0.006764531135559082), (341, -0.0074065253138542175), (342, -0.007974833250045776), (343, -0.008452601730823517), (344, -0.008776776492595673), (345, -0.00893034040927887), (346, -0.008906908333301544), (347, -0.008757807314395905), (348, -0.00846773386001587), (349, -0.008121401071548462), (350, -0.0078112781047821045), (351, -0.00749477744102478), (352, -0.0072014182806015015), (353, -0.0069893598556518555), (354, -0.0068135857582092285), (355, -0.006690084934234619), (356, -0.006632715463638306), (357, -0.0062898024916648865), (358, -0.0056941211223602295), (359, -0.005163043737411499), (360, -0.004520341753959656), (361, -0.00402725487947464), (362, -0.00392942875623703), (363, -0.003837481141090393), (364, -0.0037066489458084106), (365, -0.003678753972053528), (366, -0.003602832555770874), (367, -0.0035941898822784424), (368, -0.00373975932598114), (369, -0.003879249095916748), (370, -0.004041999578475952), (371, -0.004244513809680939), (372, -0.0044794827699661255), (373, -0.004798233509063721), (374, -0.005079053342342377), (375, -0.005175210535526276), (376, -0.005201034247875214), (377, -0.005209594964981079), (378, -0.005223587155342102), (379, -0.0054142773151397705), (380, -0.005706086754798889), (381, -0.00592099130153656), (382, -0.006128579378128052), (383, -0.006349280476570129), (384, -0.00658087432384491), (385, -0.006949514150619507), (386, -0.007447868585586548), (387, -0.007835641503334045), (388, -0.008104562759399414), (389, -0.008397944271564484), (390, -0.008620694279670715), (391, -0.008887052536010742), (392, -0.009309887886047363), (393, -0.00959555059671402), (394, -0.009725607931613922), (395, -0.00986570119857788), (396, -0.009877264499664307), (397, -0.009886115789413452), (398, -0.010023936629295349), (399, -0.009966783225536346), (400, -0.009712651371955872), (401, -0.009462699294090271), (402, -0.009105958044528961), (403, -0.008813068270683289), (404, -0.008748210966587067), (405, -0.008571118116378784), (406, -0.00827169418334961), (407, -0.008043363690376282), (408, -0.007723897695541382), (409, -0.0074577853083610535), (410, -0.007391646504402161), (411, -0.007356628775596619), (412, -0.00732160359621048), (413, -0.0072981566190719604), (414, -0.0072751641273498535), (415, -0.007256239652633667), (416, -0.0072334036231040955), (417, -0.007214173674583435), (418, -0.007188588380813599), (419, -0.007126316428184509), (420, -0.007059544324874878), (421, -0.006978020071983337), (422, -0.006863236427307129), (423, -0.006834119558334351), (424, -0.006888814270496368), (425, -0.006942138075828552), (426, -0.007070302963256836), (427, -0.007212013006210327), (428, -0.007300995290279388), (429, -0.007515579462051392), (430, -0.007845982909202576), (431, -0.008160792291164398), (432, -0.00851796567440033), (433, -0.008821830153465271), (434, -0.008984342217445374), (435, -0.009105943143367767), (436, -0.009217455983161926), (437, -0.009315930306911469), (438, -0.00941544771194458), (439, -0.009503886103630066), (440, -0.009567320346832275), (441, -0.00960591435432434), (442, -0.009620964527130127), (443, -0.009619347751140594), (444, -0.009592533111572266), (445, -0.009541049599647522), (446, -0.009464845061302185), (447, -0.009399741888046265), (448, -0.009338334202766418), (449, -0.009239822626113892), (450, -0.009144768118858337), (451, -0.009030334651470184), (452, -0.008871287107467651), (453, -0.008661359548568726), (454, -0.00842180848121643), (455, -0.008201904594898224), (456, -0.007965624332427979), (457, -0.007734701037406921), (458, -0.0075286030769348145), (459, -0.007320381700992584), (460, -0.007098063826560974), (461, -0.006856143474578857), (462, -0.0066237300634384155), (463, -0.006407417356967926), (464, -0.006211906671524048), (465, -0.006077907979488373), (466, -0.006016671657562256), (467, -0.0060158222913742065), (468, -0.006080292165279388), (469, -0.006185121834278107), (470, -0.006294243037700653), (471, -0.006292134523391724), (472, -0.0061879754066467285), (473, -0.00609627366065979), (474, -0.005973502993583679), (475, -0.005922883749008179), (476, -0.006037041544914246), (477, -0.006182089447975159), (478, -0.006331317126750946), (479, -0.006524607539176941), (480, -0.006699800491333008), (481, -0.006875559687614441), (482, -0.007085829973220825), (483, -0.00726868212223053), (484, -0.007425412535667419), (485, -0.007600679993629456), (486, -0.007801637053489685), (487, -0.008050531148910522), (488, -0.008348003029823303), (489, -0.00866023451089859), (490, -0.008954659104347229), (491, -0.009203046560287476), (492, -0.009410321712493896), (493, -0.009573012590408325), (494, -0.009690836071968079), (495, -0.009717151522636414), (496, -0.009660288691520691), (497, -0.009571224451065063), (498, -0.009395800530910492), (499, -0.0091710165143013), (500, -0.008940264582633972), (501, -0.008597314357757568), (502, -0.008154578506946564), (503, -0.007700592279434204), (504, -0.007212616503238678), (505, -0.006769821047782898), (506, -0.00644974410533905), (507, -0.006215199828147888), (508, -0.006061293184757233), (509, -0.005986884236335754), (510, -0.005968458950519562), (511, -0.005975082516670227), (512, -0.005973853170871735), (513, -0.005920320749282837), (514, -0.005793973803520203), (515, -0.005606569349765778), (516, -0.0053699687123298645), (517, -0.005109056830406189), (518, -0.0048524439334869385), (519, -0.004579603672027588), (520, -0.004316568374633789), (521, -0.004116609692573547), (522, -0.003952726721763611), (523, -0.0038458779454231262), (524, -0.0038077086210250854), (525, -0.0038052350282669067), (526, -0.0038251280784606934), (527, -0.003855757415294647), (528, -0.003910169005393982), (529, -0.003980711102485657), (530, -0.004055529832839966), (531, -0.004071846604347229), (532, -0.0040459781885147095), (533, -0.004056602716445923), (534, -0.004058606922626495), (535, -0.004102185368537903), (536, -0.004228696227073669), (537, -0.004406645894050598), (538, -0.004599958658218384), (539, -0.004760622978210449), (540, -0.004917427897453308), (541, -0.005055040121078491), (542, -0.0051713138818740845), (543, -0.005299001932144165), (544, -0.005481302738189697), (545, -0.005772300064563751), (546, -0.006163455545902252), (547, -0.006667174398899078), (548, -0.007276773452758789), (549, -0.00790165364742279), (550, -0.008494541049003601), (551, -0.00903455913066864), (552, -0.009452879428863525), (553, -0.00973714143037796), (554, -0.00989358127117157), (555, -0.00975482165813446), (556, -0.009381361305713654), (557, -0.008991554379463196), (558, -0.008536547422409058), (559, -0.008183322846889496), (560, -0.008075430989265442), (561, -0.007972292602062225), (562, -0.007850192487239838), (563, -0.007824279367923737), (564, -0.007803916931152344), (565, -0.007882505655288696), (566, -0.008153095841407776), (567, -0.008410438895225525), (568, -0.008618086576461792), (569, -0.008842140436172485), (570, -0.008981414139270782), (571, -0.00909145176410675), (572, -0.009238824248313904), (573, -0.009460017085075378), (574, -0.009712152183055878), (575, -0.009875237941741943), (576, -0.010038003325462341), (577, -0.010122373700141907), (578, -0.010058209300041199), (579, -0.009948328137397766), (580, -0.009844474494457245), (581, -0.009775936603546143), (582, -0.009735919535160065), (583, -0.009721241891384125), (584, -0.009720295667648315), (585, -0.009654738008975983), (586, -0.009531363844871521), (587, -0.009423978626728058), (588, -0.009321920573711395), (589, -0.009287513792514801), (590, -0.009371638298034668), (591, -0.009492188692092896), (592, -0.00962325930595398), (593, -0.009775891900062561), (594, -0.009903773665428162), (595, -0.010012678802013397), (596, -0.01011192798614502), (597, -0.010140374302864075), (598, -0.010111421346664429), (599, -0.010088257491588593), (600, -0.010086417198181152), (601, -0.010151669383049011), (602, -0.010300934314727783), (603, -0.010457351803779602), (604, -0.010572925209999084), (605, -0.010639086365699768), (606, -0.010639794170856476), (607, -0.010602593421936035), (608, -0.010540060698986053), (609, -0.010436244308948517), (610, -0.010318934917449951), (611, -0.01019478589296341), (612, -0.010068133473396301), (613, -0.009975947439670563), (614, -0.009911701083183289), (615, -0.00986066460609436), (616, -0.009818732738494873), (617, -0.009772859513759613), (618, -0.009739786386489868), (619, -0.009724274277687073), (620, -0.009721033275127411), (621, -0.009770140051841736), (622, -0.00986257940530777), (623, -0.009951278567314148), (624, -0.01004675030708313), (625, -0.010122895240783691), (626, -0.010162904858589172), (627, -0.010229647159576416), (628, -0.010340012609958649), (629, -0.010474205017089844), (630, -0.010638788342475891), (631, -0.010792180895805359), (632, -0.010890595614910126), (633, -0.010933682322502136), (634, -0.010925978422164917), (635, -0.010879114270210266), (636, -0.01080571860074997), (637, -0.010726377367973328), (638, -0.01065470278263092), (639, -0.010632887482643127), (640, -0.010648190975189209), (641, -0.010652720928192139), (642, -0.010679498314857483), (643, -0.010707676410675049), (644, -0.01072770357131958), (645, -0.010780230164527893), (646, -0.010853320360183716), (647, -0.010905444622039795), (648, -0.010878339409828186), (649, -0.010725028812885284), (650, -0.010426118969917297), (651, -0.010045483708381653), (652, -0.009616285562515259), (653, -0.00912947952747345), (654, -0.008654549717903137), (655, -0.008180119097232819), (656, -0.007714122533798218), (657, -0.0073327720165252686), (658, -0.007018581032752991), (659, -0.006767585873603821), (660, -0.006591722369194031), (661, -0.006452031433582306), (662, -0.006434544920921326), (663, -0.00664927065372467), (664, -0.006999187171459198), (665, -0.007438763976097107), (666, -0.007949292659759521), (667, -0.008382350206375122), (668, -0.008708231151103973), (669, -0.008970379829406738), (670, -0.009162776172161102), (671, -0.009273573756217957), (672, -0.00928226113319397), (673, -0.009195253252983093), (674, -0.009034350514411926), (675, -0.008824750781059265), (676, -0.008597142994403839), (677, -0.00837823748588562), (678, -0.008197024464607239), (679, -0.008067607879638672), (680, -0.007988780736923218), (681, -0.007899463176727295), (682, -0.0077957883477211), (683, -0.0077219158411026), (684, -0.007640078663825989), (685, -0.007601574063301086), (686, -0.007656604051589966), (687, -0.007731452584266663), (688, -0.007829174399375916), (689, -0.007987365126609802), (690, -0.008159354329109192), (691, -0.008349545300006866), (692, -0.008470475673675537), (693, -0.00837409496307373), (694, -0.008118554949760437), (695, -0.00774894654750824), (696, -0.007329568266868591), (697, -0.007079526782035828), (698, -0.007105037569999695), (699, -0.00735059380531311), (700, -0.007830247282981873), (701, -0.00857468694448471), (702, -0.00950070470571518), (703, -0.010581865906715393), (704, -0.011756733059883118), (705, -0.012406587600708008), (706, -0.012896589934825897), (707, -0.013977866619825363), (708, -0.01497315987944603), (709, -0.01585504412651062), (710, -0.016655616462230682), (711, -0.017369359731674194), (712, -0.017717380076646805), (713, -0.017724275588989258), (714, -0.017642013728618622), (715, -0.017321165651082993), (716, -0.01697292923927307), (717, -0.016814902424812317), (718, -0.016590435057878494), (719, -0.01629970222711563), (720, -0.016073882579803467), (721, -0.015842683613300323), (722, -0.015694521367549896), (723, -0.01570386439561844), (724, -0.015767179429531097), (725, -0.01584426313638687), (726, -0.015909112989902496), (727, -0.0159473679959774), (728, -0.015961647033691406), (729, -0.015914544463157654), (730, -0.01577562838792801), (731, -0.015608254820108414), (732, -0.015448600053787231), (733, -0.015318110585212708), (734, -0.015291176736354828), (735, -0.015376746654510498), (736, -0.01559307798743248), (737, -0.015910916030406952), (738, -0.016258273273706436), (739, -0.016663633286952972), (740, -0.01707201823592186), (741, -0.017428964376449585), (742, -0.017733134329319), (743, -0.017995737493038177), (744, -0.01825576275587082), (745, -0.018499184399843216), (746, -0.018755987286567688), (747, -0.019053436815738678), (748, -0.019306868314743042), (749, -0.01951294019818306), (750, -0.019724443554878235), (751, -0.019891899079084396), (752, -0.020057644695043564), (753, -0.020236704498529434), (754, -0.020358607172966003), (755, -0.020454861223697662), (756, -0.02053985744714737), (757, -0.020620077848434448), (758, -0.020753998309373856), (759, -0.020945876836776733), (760, -0.021106265485286713), (761, -0.02124406397342682), (762, -0.021423935890197754), (763, -0.021601594984531403), (764, -0.021820835769176483), (765, -0.02212841436266899), (766, -0.022171106189489365), (767, -0.0219840407371521), (768, -0.021880265325307846), (769, -0.021638356149196625), (770, -0.02147521823644638), (771, -0.021605782210826874), (772, -0.021831512451171875), (773, -0.02206294983625412), (774, -0.022227950394153595), (775, -0.022340402007102966), (776, -0.02234651893377304), (777, -0.022195622324943542), (778, -0.021968670189380646), (779, -0.021673016250133514), (780, -0.02127639204263687), (781, -0.02085733413696289), (782, -0.020421259105205536), (783, -0.019976884126663208), (784, -0.01966005563735962), (785, -0.019497253000736237), (786, -0.019443288445472717), (787, -0.019520752131938934), (788, -0.01965492218732834), (789, -0.019761990755796432), (790, -0.01981266587972641), (791, -0.01978449523448944), (792, -0.019679326564073563), (793, -0.019474703818559647), (794, -0.019198637455701828), (795, -0.018879961222410202), (796, -0.018411673605442047), (797, -0.017815515398979187), (798, -0.017195619642734528), (799, -0.016474463045597076), (800, -0.0157134048640728), (801, -0.014831528067588806), (802, -0.013633765280246735), (803, -0.012336783111095428), (804, -0.011020675301551819), (805, -0.009700112044811249), (806, -0.008669301867485046), (807, -0.00800052285194397), (808, -0.0075273215770721436), (809, -0.0071620941162109375), (810, -0.006932437419891357), (811, -0.0067495256662368774), (812, -0.006502710282802582), (813, -0.006125122308731079), (814, -0.0055998265743255615), (815, -0.004979915916919708), (816, -0.004248559474945068), (817, -0.003515087068080902), (818, -0.002921685576438904), (819, -0.0024909749627113342), (820, -0.002273164689540863), (821, -0.0022241324186325073), (822, -0.002374976873397827)], ('location', 1): [(1, 0.0009369142353534698), (2, 0.0008419696241617203), (3, 0.0007693283259868622), (4, 0.0007597599178552628), (5, 0.0007856041193008423), (6, 0.000787513330578804), (7, 0.0008796509355306625), (8, 0.0011129993945360184), (9, 0.0013703741133213043), (10, 0.001709936186671257), (11, 0.0020658206194639206), (12, 0.002260589972138405), (13, 0.0023255832493305206), (14, 0.0023236889392137527), (15, 0.0022590458393096924), (16, 0.002141019329428673), (17, 0.0020035039633512497), (18, 0.0019109658896923065), (19, 0.0018945634365081787), (20, 0.0018810201436281204), (21, 0.0018345993012189865), (22, 0.0017481613904237747), (23, 0.0015700142830610275), (24, 0.001444302499294281), (25, 0.001403598114848137), (26, 0.001305464655160904), (27, 0.0012036636471748352), (28, 0.0011707320809364319), (29, 0.0012102331966161728), (30, 0.001173652708530426), (31, 0.0011223964393138885), (32, 0.0010686945170164108), (33, 0.001020483672618866), (34, 0.0009438935667276382), (35, 0.0008166171610355377), (36, 0.0006042793393135071), (37, 0.0003736354410648346), (38, 0.00021082721650600433), (39, 8.677318692207336e-05), (40, -1.7305836081504822e-05), (41, -0.00011356174945831299), (42, -0.0002511851489543915), (43, -0.0003598574548959732), (44, -0.0003609657287597656), (45, -0.000295860692858696), (46, -0.00013270042836666107), (47, 0.00016045570373535156), (48, 0.000551905483007431), (49, 0.0010021161288022995), (50, 0.00141819566488266), (51, 0.0017775855958461761), (52, 0.002061121165752411), (53, 0.0021852869540452957), (54, 0.0023027118295431137), (55, 0.002438157796859741), (56, 0.0025290660560131073), (57, 0.0025324467569589615), (58, 0.002467559650540352), (59, 0.0023350808769464493), (60, 0.002191605046391487), (61, 0.0020897462964057922), (62, 0.001996368169784546), (63, 0.0018836688250303268), (64, 0.0017353221774101257), (65, 0.0015209652483463287), (66, 0.001380009576678276), (67, 0.001303384080529213), (68, 0.001131722703576088), (69, 0.0010321903973817825), (70, 0.0009807553142309189), (71, 0.0009671691805124283), (72, 0.0009136684238910675), (73, 0.0009644236415624619), (74, 0.0011999011039733887), (75, 0.0014288648962974548), (76, 0.0016703922301530838), (77, 0.0018683038651943207), (78, 0.0018770918250083923), (79, 0.0018833018839359283), (80, 0.0019309855997562408), (81, 0.0020101889967918396), (82, 0.002087945118546486), (83, 0.002093389630317688), (84, 0.002120915800333023), (85, 0.0023038219660520554), (86, 0.002535024657845497), (87, 0.0027344562113285065), (88, 0.003088010475039482), (89, 0.0029515083879232407), (90, 0.0029904115945100784), (91, 0.002913115546107292), (92, 0.0028439555317163467), (93, 0.0027878936380147934), (94, 0.002750284969806671), (95, 0.0027107447385787964), (96, 0.0027289073914289474), (97, 0.002847515046596527), (98, 0.0030258484184741974), (99, 0.0033081043511629105), (100, 0.0036408230662345886), (101, 0.003891054540872574), (102, 0.004046512767672539), (103, 0.004138298332691193), (104, 0.004242515191435814), (105, 0.004459882155060768), (106, 0.004777001217007637), (107, 0.005175812169909477), (108, 0.0056219641119241714), (109, 0.005951490253210068), (110, 0.006110839545726776), (111, 0.006182864308357239), (112, 0.006188990548253059), (113, 0.006108324974775314), (114, 0.0059681423008441925), (115, 0.005780456587672234), (116, 0.0055367182940244675), (117, 0.005275711417198181), (118, 0.005038361996412277), (119, 0.00485687330365181), (120, 0.004731442779302597), (121, 0.004650004208087921), (122, 0.004598693922162056), (123, 0.004576543346047401), (124, 0.00461091473698616), (125, 0.0045538488775491714), (126, 0.004681957885622978), (127, 0.004694273695349693), (128, 0.004693733528256416), (129, 0.0046682171523571014), (130, 0.004644656553864479), (131, 0.00465775839984417), (132, 0.0046331752091646194), (133, 0.0045774467289447784), (134, 0.004656795412302017), (135, 0.004524921998381615), (136, 0.004400979727506638), (137, 0.004348525777459145), (138, 0.0043967776000499725), (139, 0.004436388611793518), (140, 0.004517056047916412), (141, 0.004545366391539574), (142, 0.004434436559677124), (143, 0.004403134807944298), (144, 0.0044660791754722595), (145, 0.004473919048905373), (146, 0.004515171051025391), (147, 0.0045052506029605865), (148, 0.00435241125524044), (149, 0.004178449511528015), (150, 0.004038270562887192), (151, 0.003918347880244255), (152, 0.0037947986274957657), (153, 0.003649301826953888), (154, 0.0034812726080417633), (155, 0.0032388176769018173), (156, 0.003173835575580597), (157, 0.0030089281499385834), (158, 0.0027558375149965286), (159, 0.0024866312742233276), (160, 0.0022374168038368225), (161, 0.002087865024805069), (162, 0.0020386017858982086), (163, 0.001821110025048256), (164, 0.0015998780727386475), (165, 0.0014215018600225449), (166, 0.0012351367622613907), (167, 0.001050477847456932), (168, 0.0009418632835149765), (169, 0.0009160097688436508), (170, 0.0009286738932132721), (171, 0.000920373946428299), (172, 0.0009035058319568634), (173, 0.0008232630789279938), (174, 0.000653877854347229), (175, 0.0005148109048604965), (176, 0.0003984682261943817), (177, 0.0002590809017419815), (178, 0.00017769448459148407), (179, 8.142180740833282e-05), (180, -6.970390677452087e-05), (181, -7.718801498413086e-05), (182, 3.392808139324188e-05), (183, 0.00013061799108982086), (184, 0.00030188262462615967), (185, 0.00044178590178489685), (186, 0.00043044984340667725), (187, 0.0005371328443288803), (188, 0.0007845032960176468), (189, 0.0009924191981554031), (190, 0.0012800637632608414), (191, 0.001511596143245697), (192, 0.001581316813826561), (193, 0.001677563413977623), (194, 0.001759793609380722), (195, 0.0018333140760660172), (196, 0.0019646119326353073), (197, 0.0020245015621185303), (198, 0.002093745395541191), (199, 0.0022370517253875732), (200, 0.0023396573960781097), (201, 0.002469075843691826), (202, 0.0025657154619693756), (203, 0.0026265792548656464), (204, 0.002807825803756714), (205, 0.003003392368555069), (206, 0.0031407680362462997), (207, 0.0032463278621435165), (208, 0.003158608451485634), (209, 0.0029764417558908463), (210, 0.0027697253972291946), (211, 0.0028159916400909424), (212, 0.002700716257095337), (213, 0.002714168280363083), (214, 0.002781493589282036), (215, 0.002946089953184128), (216, 0.003225024789571762), (217, 0.0034987125545740128), (218, 0.0038568004965782166), (219, 0.004192257300019264), (220, 0.004464004188776016), (221, 0.004759017378091812), (222, 0.0050330571830272675), (223, 0.005243629217147827), (224, 0.005425073206424713), (225, 0.0055257901549339294), (226, 0.005554297938942909), (227, 0.005584262311458588), (228, 0.005627801641821861), (229, 0.005694027990102768), (230, 0.005767589434981346), (231, 0.005829682573676109), (232, 0.005895532667636871), (233, 0.005950942635536194), (234, 0.005961989983916283), (235, 0.005984092131257057), (236, 0.006031490862369537), (237, 0.006073273718357086), (238, 0.006138643249869347), (239, 0.006179029121994972), (240, 0.006128018721938133), (241, 0.006043439731001854), (242, 0.005926573649048805), (243, 0.005774315446615219), (244, 0.005624596029520035), (245, 0.005463555455207825), (246, 0.005296990275382996), (247, 0.005151757970452309), (248, 0.00505472719669342), (249, 0.005024265497922897), (250, 0.005054885521531105), (251, 0.0051258280873298645), (252, 0.005225628614425659), (253, 0.005374891683459282), (254, 0.00560549832880497), (255, 0.005910025909543037), (256, 0.006236402317881584), (257, 0.00648452527821064), (258, 0.006622867658734322), (259, 0.0066665057092905045), (260, 0.006622320041060448), (261, 0.00655401311814785), (262, 0.006486127153038979), (263, 0.006412865594029427), (264, 0.006327733397483826), (265, 0.006196899339556694), (266, 0.006039783358573914), (267, 0.005897782742977142), (268, 0.005784174427390099), (269, 0.005678262561559677), (270, 0.0055483244359493256), (271, 0.005408363416790962), (272, 0.0052841827273368835), (273, 0.0051765404641628265), (274, 0.005155432969331741), (275, 0.0051407162100076675), (276, 0.005011590197682381), (277, 0.0048220232129096985), (278, 0.004776235669851303), (279, 0.004500614479184151), (280, 0.0040192678570747375), (281, 0.00360880047082901), (282, 0.0032971780747175217), (283, 0.0029857922345399857), (284, 0.0027238186448812485), (285, 0.0024354327470064163), (286, 0.0022649914026260376), (287, 0.0020633842796087265), (288, 0.0017687845975160599), (289, 0.0015468746423721313), (290, 0.0012474525719881058), (291, 0.001210806891322136), (292, 0.0010078996419906616), (293, 0.0006846878677606583), (294, 0.0002424679696559906), (295, -0.00015861168503761292), (296, -0.00045655108988285065), (297, -0.0006918329745531082), (298, -0.0008027497678995132), (299, -0.0008243471384048462), (300, -0.0008269045501947403), (301, -0.0008319094777107239), (302, -0.0008976627141237259), (303, -0.001082034781575203), (304, -0.0014127809554338455), (305, -0.001601438969373703), (306, -0.0019218288362026215), (307, -0.0025407355278730392), (308, -0.0030403900891542435), (309, -0.0033840686082839966), (310, -0.0037038009613752365), (311, -0.003933630883693695), (312, -0.0040224213153123856), (313, -0.004197068512439728), (314, -0.004460405558347702), (315, -0.0047182850539684296), (316, -0.00465557724237442), (317, -0.004902515560388565), (318, -0.005198244005441666), (319, -0.005440831184387207), (320, -0.0055695828050374985), (321, -0.005440987646579742), (322, -0.005106277763843536), (323, -0.004778355360031128), (324, -0.004290753975510597), (325, -0.003714941442012787), (326, -0.0028372444212436676), (327, -0.0016258955001831055), (328, -0.0005211587995290756), (329, 0.000502217561006546), (330, 0.001274310052394867), (331, 0.0014742650091648102), (332, 0.0012898985296487808), (333, 0.0009402669966220856), (334, 0.00036371685564517975), (335, 2.7127563953399658e-05), (336, -0.00010899826884269714), (337, -0.0005413293838500977), (338, -0.0009007416665554047), (339, -0.001115528866648674), (340, -0.001445818692445755), (341, -0.0017843525856733322), (342, -0.0023086443543434143), (343, -0.002579895779490471), (344, -0.0029366295784711838), (345, -0.003586219623684883), (346, -0.004179133102297783), (347, -0.0046674106270074844), (348, -0.005080042406916618), (349, -0.005522632971405983), (350, -0.0055892933160066605), (351, -0.0056464783847332), (352, -0.005790408700704575), (353, -0.00623876228928566), (354, -0.006634093821048737), (355, -0.007068844512104988), (356, -0.007519818842411041), (357, -0.007971331477165222), (358, -0.008213002234697342), (359, -0.008318755775690079), (360, -0.008489644154906273), (361, -0.008484749123454094), (362, -0.008435219526290894), (363, -0.008211392909288406), (364, -0.008070575073361397), (365, -0.008126797154545784), (366, -0.008164258673787117), (367, -0.008233021944761276), (368, -0.00833948701620102), (369, -0.008366730064153671), (370, -0.008372746407985687), (371, -0.008340725675225258), (372, -0.008189328014850616), (373, -0.007981423288583755), (374, -0.00778597965836525), (375, -0.007589004933834076), (376, -0.007418645545840263), (377, -0.007261777296662331), (378, -0.00710717961192131), (379, -0.006948972120881081), (380, -0.0067789144814014435), (381, -0.006673404946923256), (382, -0.006619436666369438), (383, -0.006572918966412544), (384, -0.0065604448318481445), (385, -0.006561776623129845), (386, -0.006568543612957001), (387, -0.006592823192477226), (388, -0.006613645702600479), (389, -0.006590032950043678), (390, -0.0065423548221588135), (391, -0.006520923227071762), (392, -0.006508195772767067), (393, -0.006538102403283119), (394, -0.006635146215558052), (395, -0.006676776334643364), (396, -0.006665760651230812), (397, -0.006679169833660126), (398, -0.006641760468482971), (399, -0.006610449403524399), (400, -0.00663108192384243), (401, -0.006440075114369392), (402, -0.0060581546276807785), (403, -0.005701437592506409), (404, -0.005267065018415451), (405, -0.004853840917348862), (406, -0.004638008773326874), (407, -0.004527611657977104), (408, -0.004378184676170349), (409, -0.004230313003063202), (410, -0.004194794222712517), (411, -0.004046471789479256), (412, -0.0038539860397577286), (413, -0.0037307478487491608), (414, -0.0036789700388908386), (415, -0.0037462804466485977), (416, -0.003924012184143066), (417, -0.003976050764322281), (418, -0.0039036720991134644), (419, -0.003819091245532036), (420, -0.003649115562438965), (421, -0.0035262741148471832), (422, -0.0035550855100154877), (423, -0.003536604344844818), (424, -0.003437541425228119), (425, -0.0033695995807647705), (426, -0.0033108796924352646), (427, -0.0033382289111614227), (428, -0.003562210127711296), (429, -0.0038403142243623734), (430, -0.004142839461565018), (431, -0.004471059888601303), (432, -0.00475195050239563), (433, -0.004987282678484917), (434, -0.0052201952785253525), (435, -0.005329953506588936), (436, -0.005340307950973511), (437, -0.005358343943953514), (438, -0.0053139328956604), (439, -0.005282174795866013), (440, -0.0053103528916835785), (441, -0.005243783816695213), (442, -0.005082733929157257), (443, -0.004908859729766846), (444, -0.004690088331699371), (445, -0.004490969702601433), (446, -0.004372069612145424), (447, -0.004307972267270088), (448, -0.004274360835552216), (449, -0.004236951470375061), (450, -0.004222255200147629), (451, -0.004229534417390823), (452, -0.004239873960614204), (453, -0.004238996654748917), (454, -0.004210921004414558), (455, -0.004144482314586639), (456, -0.003979146480560303), (457, -0.0036940574645996094), (458, -0.003349458798766136), (459, -0.002976486459374428), (460, -0.0026489458978176117), (461, -0.0023801289498806), (462, -0.0022294502705335617), (463, -0.002186201512813568), (464, -0.002171216532588005), (465, -0.0021981969475746155), (466, -0.0023338403552770615), (467, -0.002513233572244644), (468, -0.002765825018286705), (469, -0.0030071306973695755), (470, -0.00320608913898468), (471, -0.003042249009013176), (472, -0.0029394980520009995), (473, -0.002820536494255066), (474, -0.0026838164776563644), (475, -0.002715138718485832), (476, -0.002887340262532234), (477, -0.003158504143357277), (478, -0.003105638548731804), (479, -0.0033608749508857727), (480, -0.003376474604010582), (481, -0.003565588966012001), (482, -0.00377524271607399), (483, -0.003952831029891968), (484, -0.0040384456515312195), (485, -0.004080459475517273), (486, -0.004051528871059418), (487, -0.004008155316114426), (488, -0.004006322473287582), (489, -0.003946145996451378), (490, -0.0038099903613328934), (491, -0.0036476124078035355), (492, -0.0034594424068927765), (493, -0.0033153798431158066), (494, -0.003246596083045006), (495, -0.0031518079340457916), (496, -0.003058435395359993), (497, -0.0029630903154611588), (498, -0.0028225257992744446), (499, -0.0026892870664596558), (500, -0.00258723646402359), (501, -0.002466833218932152), (502, -0.002290438860654831), (503, -0.0020901933312416077), (504, -0.0018810667097568512), (505, -0.0016580130904912949), (506, -0.001438455656170845), (507, -0.0012795813381671906), (508, -0.0012671742588281631), (509, -0.0013562440872192383), (510, -0.0015925373882055283), (511, -0.0019998569041490555), (512, -0.002481069415807724), (513, -0.003009205684065819), (514, -0.0033089816570281982), (515, -0.0036108829081058502), (516, -0.004168543964624405), (517, -0.004662172868847847), (518, -0.005098419263958931), (519, -0.005330804735422134), (520, -0.005360011011362076), (521, -0.00529729388654232), (522, -0.005089700222015381), (523, -0.004811502993106842), (524, -0.004477158188819885), (525, -0.0039957445114851), (526, -0.0035043489187955856), (527, -0.003058379516005516), (528, -0.0026807785034179688), (529, -0.002505756914615631), (530, -0.0025010984390974045), (531, -0.0025688372552394867), (532, -0.002685345709323883), (533, -0.002832207828760147), (534, -0.002998795360326767), (535, -0.0031602997332811356), (536, -0.0033062174916267395), (537, -0.0034384727478027344), (538, -0.003500843420624733), (539, -0.00351874902844429), (540, -0.003579346463084221), (541, -0.003616422414779663), (542, -0.003621349111199379), (543, -0.0036171749234199524), (544, -0.0036692097783088684), (545, -0.003669215366244316), (546, -0.0038071144372224808), (547, -0.004021374508738518), (548, -0.0043410565704107285), (549, -0.004752574488520622), (550, -0.0052145663648843765), (551, -0.0057135410606861115), (552, -0.006225205957889557), (553, -0.006708534434437752), (554, -0.0068967826664447784), (555, -0.0070929937064647675), (556, -0.007312161847949028), (557, -0.007319185882806778), (558, -0.00745747797191143), (559, -0.007571730762720108), (560, -0.007654406130313873), (561, -0.007714675739407539), (562, -0.00781349465250969), (563, -0.007721127942204475), (564, -0.007467508316040039), (565, -0.0073128920048475266), (566, -0.007163036614656448), (567, -0.007020536810159683), (568, -0.007283717393875122), (569, -0.007507875561714172), (570, -0.007728539407253265), (571, -0.007983557879924774), (572, -0.008091514930129051), (573, -0.008163953199982643), (574, -0.008314946666359901), (575, -0.00841577723622322), (576, -0.008407525718212128), (577, -0.008149690926074982), (578, -0.0075533706694841385), (579, -0.006725752726197243), (580, -0.00580948032438755), (581, -0.0049518682062625885), (582, -0.004350617527961731), (583, -0.0040806494653224945), (584, -0.004035420715808868), (585, -0.00399119034409523), (586, -0.003928292542695999), (587, -0.003959333524107933), (588, -0.004011617973446846), (589, -0.0041780658066272736), (590, -0.004527337849140167), (591, -0.0048370398581027985), (592, -0.005060175433754921), (593, -0.005257079377770424), (594, -0.005344415083527565), (595, -0.005393968895077705), (596, -0.00546625442802906), (597, -0.005384402349591255), (598, -0.005169091746211052), (599, -0.004978718236088753), (600, -0.004828218370676041), (601, -0.004844281822443008), (602, -0.00508003868162632), (603, -0.005326425656676292), (604, -0.005469189956784248), (605, -0.005506066605448723), (606, -0.005425054579973221), (607, -0.005332903936505318), (608, -0.005312647670507431), (609, -0.005330909043550491), (610, -0.005377527326345444), (611, -0.0054288990795612335), (612, -0.0054688602685928345), (613, -0.005536340177059174), (614, -0.005644369870424271), (615, -0.005693219602108002), (616, -0.005686011165380478), (617, -0.005688773468136787), (618, -0.005665833130478859), (619, -0.005676399916410446), (620, -0.005792422220110893), (621, -0.0059523917734622955), (622, -0.006144829094409943), (623, -0.006379406899213791), (624, -0.0065937284380197525), (625, -0.006685508415102959), (626, -0.006803549826145172), (627, -0.006992269307374954), (628, -0.0070615895092487335), (629, -0.007045896723866463), (630, -0.007035341113805771), (631, -0.0069932714104652405), (632, -0.006918366998434067), (633, -0.00667695514857769), (634, -0.006303006783127785), (635, -0.0059020426124334335), (636, -0.005389634519815445), (637, -0.004974329844117165), (638, -0.004658414050936699), (639, -0.004202183336019516), (640, -0.003642333671450615), (641, -0.0029949378222227097), (642, -0.002295656129717827), (643, -0.0017596818506717682), (644, -0.001543983817100525), (645, -0.001586446538567543), (646, -0.0017578322440385818), (647, -0.002024509012699127), (648, -0.0022389162331819534), (649, -0.002278955653309822), (650, -0.0022071022540330887), (651, -0.0020733699202537537), (652, -0.001907186582684517), (653, -0.00175449438393116), (654, -0.0016426537185907364), (655, -0.0015658866614103317), (656, -0.001519354060292244), (657, -0.0015161558985710144), (658, -0.0015654712915420532), (659, -0.0016767829656600952), (660, -0.0018774773925542831), (661, -0.0021910984069108963), (662, -0.0026114825159311295), (663, -0.0031186342239379883), (664, -0.0033738724887371063), (665, -0.0036709774285554886), (666, -0.004288129508495331), (667, -0.004925502464175224), (668, -0.005562637001276016), (669, -0.006082493811845779), (670, -0.006409035995602608), (671, -0.0064598191529512405), (672, -0.006819300353527069), (673, -0.007037976756691933), (674, -0.007191082462668419), (675, -0.007314940914511681), (676, -0.007267866283655167), (677, -0.007199449464678764), (678, -0.007126683369278908), (679, -0.007038837298750877), (680, -0.007026338949799538), (681, -0.007000040262937546), (682, -0.007147481665015221), (683, -0.00731552392244339), (684, -0.007307372987270355), (685, -0.007466565817594528), (686, -0.007533932104706764), (687, -0.007467474788427353), (688, -0.007152542471885681), (689, -0.006736652925610542), (690, -0.006402594968676567), (691, -0.006061552092432976), (692, -0.005952823907136917), (693, -0.006155870854854584), (694, -0.006475329399108887), (695, -0.006559623405337334), (696, -0.006869737058877945), (697, -0.007154384627938271), (698, -0.007301928475499153), (699, -0.007759463042020798), (700, -0.00820593535900116), (701, -0.008547522127628326), (702, -0.008801000192761421), (703, -0.009045002982020378), (704, -0.009173806756734848), (705, -0.009259546175599098), (706, -0.009394027292728424), (707, -0.009468642994761467), (708, -0.009537355974316597), (709, -0.009665204212069511), (710, -0.009806577116250992), (711, -0.009972138330340385), (712, -0.010176435112953186), (713, -0.010408496484160423), (714, -0.010578108951449394), (715, -0.01068161427974701), (716, -0.010791383683681488), (717, -0.010837897658348083), (718, -0.010892793536186218), (719, -0.011038431897759438), (720, -0.011179767549037933), (721, -0.011293422430753708), (722, -0.011410420760512352), (723, -0.01147322915494442), (724, -0.011460570618510246), (725, -0.011351978406310081), (726, -0.011104973033070564), (727, -0.010812951251864433), (728, -0.010500086471438408), (729, -0.010166976600885391), (730, -0.00986308604478836), (731, -0.009488916024565697), (732, -0.009053701534867287), (733, -0.008633984252810478), (734, -0.00819472037255764), (735, -0.007848720997571945), (736, -0.007610484957695007), (737, -0.007426660507917404), (738, -0.007324801757931709), (739, -0.007291777059435844), (740, -0.0073547400534152985), (741, -0.007490379735827446), (742, -0.007650798186659813), (743, -0.007842419669032097), (744, -0.008019309490919113), (745, -0.00812453217804432), (746, -0.008208384737372398), (747, -0.008250726386904716), (748, -0.00824674591422081), (749, -0.00827551819384098), (750, -0.008338190615177155), (751, -0.008408742025494576), (752, -0.008485222235321999), (753, -0.008557524532079697), (754, -0.008646069094538689), (755, -0.008783427998423576), (756, -0.008985260501503944), (757, -0.009266091510653496), (758, -0.009491188451647758), (759, -0.009684430435299873), (760, -0.010054020211100578), (761, -0.01040477491915226), (762, -0.010533832013607025), (763, -0.010469255968928337), (764, -0.010432746261358261), (765, -0.010319624096155167), (766, -0.01031549833714962), (767, -0.010579889640212059), (768, -0.010731453076004982), (769, -0.010722296312451363), (770, -0.010712146759033203), (771, -0.01045110821723938), (772, -0.010038109496235847), (773, -0.009576566517353058), (774, -0.008994745090603828), (775, -0.008449692279100418), (776, -0.007953142747282982), (777, -0.007615445181727409), (778, -0.007302472367882729), (779, -0.006829714402556419), (780, -0.006295599043369293), (781, -0.005621751770377159), (782, -0.004830669611692429), (783, -0.0040712859481573105), (784, -0.003462664783000946), (785, -0.0030190255492925644), (786, -0.002727799117565155), (787, -0.002684440463781357), (788, -0.002691103145480156), (789, -0.002608947455883026), (790, -0.002494603395462036), (791, -0.002228492870926857), (792, -0.0018836986273527145), (793, -0.0014606639742851257), (794, -0.0008471217006444931), (795, -0.0001958366483449936), (796, 0.00044911354780197144), (797, 0.0010456182062625885), (798, 0.0013986080884933472), (799, 0.0017596520483493805), (800, 0.0021036453545093536), (801, 0.0023946836590766907), (802, 0.002818770706653595), (803, 0.0032990388572216034), (804, 0.0036831460893154144), (805, 0.004041498526930809), (806, 0.0042900387197732925), (807, 0.004302758723497391), (808, 0.004044694826006889), (809, 0.0036443471908569336), (810, 0.0034765582531690598), (811, 0.003317473456263542), (812, 0.0032001789659261703), (813, 0.00276842899620533), (814, 0.0024511925876140594), (815, 0.002256300300359726), (816, 0.002121618017554283), (817, 0.0020135175436735153), (818, 0.001879112794995308), (819, 0.0017521493136882782), (820, 0.001459440216422081), (821, 0.0015454832464456558), (822, 0.0015454832464456558)], ('location', 2): [(1, -0.0018374621868133545), (2, -0.0018986761569976807), (3, -0.00191575288772583), (4, -0.0019568800926208496), (5, -0.002108961343765259), (6, -0.002275705337524414), (7, -0.0024478137493133545), (8, -0.0026496946811676025), (9, -0.0027613043785095215), (10, -0.002782166004180908), (11, -0.002769172191619873), (12, -0.0026738643646240234), (13, -0.0024982690811157227), (14, -0.00230252742767334), (15, -0.002130657434463501), (16, -0.002121865749359131), (17, -0.002361893653869629), (18, -0.002686142921447754), (19, -0.0029928982257843018), (20, -0.0032464265823364258), (21, -0.0033412277698516846), (22, -0.0033302009105682373), (23, -0.0033248066902160645), (24, -0.0033432841300964355), (25, -0.0033604204654693604), (26, -0.003332465887069702), (27, -0.0032421350479125977), (28, -0.0031193792819976807), (29, -0.002960503101348877), (30, -0.002665996551513672), (31, -0.0022042393684387207), (32, -0.002043694257736206), (33, -0.001613914966583252), (34, -0.0009563565254211426), (35, -0.00037026405334472656), (36, 3.454089164733887e-05), (37, 0.0002993345260620117), (38, 0.0004862546920776367), (39, 0.0006402730941772461), (40, 0.0007983744144439697), (41, 0.0008256435394287109), (42, 0.0006146430969238281), (43, 0.00031116604804992676), (44, -8.434057235717773e-05), (45, -0.0005876719951629639), (46, -0.0009639263153076172), (47, -0.001151353120803833), (48, -0.0011397302150726318), (49, -0.0007202625274658203), (50, 7.280707359313965e-05), (51, 0.0009339451789855957), (52, 0.0016794800758361816), (53, 0.0014841854572296143), (54, 0.001339644193649292), (55, 0.0005772709846496582), (56, -0.0006074905395507812), (57, -0.0020591914653778076), (58, -0.0033026039600372314), (59, -0.004223257303237915), (60, -0.004814654588699341), (61, -0.004982441663742065), (62, -0.004778146743774414), (63, -0.00428694486618042), (64, -0.0036620795726776123), (65, -0.003065764904022217), (66, -0.002638787031173706), (67, -0.0024117231369018555), (68, -0.002356499433517456), (69, -0.002183973789215088), (70, -0.0021778345108032227), (71, -0.0023436248302459717), (72, -0.002617776393890381), (73, -0.002970874309539795), (74, -0.003290414810180664), (75, -0.0034483373165130615), (76, -0.003312021493911743), (77, -0.0028068125247955322), (78, -0.0026845037937164307), (79, -0.0021601319313049316), (80, -0.001475900411605835), (81, -0.000755608081817627), (82, -0.00023299455642700195), (83, 0.00018978118896484375), (84, 0.0007104575634002686), (85, 0.001150965690612793), (86, 0.001457303762435913), (87, 0.0014744400978088379), (88, 0.001774430274963379), (89, 0.0019508600234985352), (90, 0.0017888545989990234), (91, 0.0013543963432312012), (92, 0.0008994042873382568), (93, 0.00038164854049682617), (94, -0.00018486380577087402), (95, -0.0006859004497528076), (96, -0.0012210309505462646), (97, -0.0017011463642120361), (98, -0.002227872610092163), (99, -0.003001779317855835), (100, -0.003617584705352783), (101, -0.0039014220237731934), (102, -0.004111886024475098), (103, -0.004195481538772583), (104, -0.004273027181625366), (105, -0.004644811153411865), (106, -0.005323171615600586), (107, -0.006116747856140137), (108, -0.0067729949951171875), (109, -0.0072667598724365234), (110, -0.007753849029541016), (111, -0.008214294910430908), (112, -0.00864991545677185), (113, -0.009105324745178223), (114, -0.009382933378219604), (115, -0.00946548581123352), (116, -0.009582191705703735), (117, -0.009788095951080322), (118, -0.01002529263496399), (119, -0.010287195444107056), (120, -0.010547667741775513), (121, -0.010744839906692505), (122, -0.010853826999664307), (123, -0.010603249073028564), (124, -0.010053277015686035), (125, -0.009549498558044434), (126, -0.009026944637298584), (127, -0.008648544549942017), (128, -0.008538544178009033), (129, -0.008452832698822021), (130, -0.008259415626525879), (131, -0.008143097162246704), (132, -0.007919996976852417), (133, -0.007506340742111206), (134, -0.007106512784957886), (135, -0.00676196813583374), (136, -0.006511420011520386), (137, -0.006327420473098755), (138, -0.006161987781524658), (139, -0.0059580206871032715), (140, -0.005691826343536377), (141, -0.005359262228012085), (142, -0.005068004131317139), (143, -0.004871964454650879), (144, -0.00470694899559021), (145, -0.004596799612045288), (146, -0.004467427730560303), (147, -0.0042410194873809814), (148, -0.004073977470397949), (149, -0.003832012414932251), (150, -0.0033176839351654053), (151, -0.002810835838317871), (152, -0.0021770596504211426), (153, -0.0014867782592773438), (154, -0.0008774697780609131), (155, -0.0004146397113800049), (156, 2.4974346160888672e-05), (157, 0.0010952651500701904), (158, 0.0019572973251342773), (159, 0.0029021799564361572), (160, 0.003736257553100586), (161, 0.003947466611862183), (162, 0.004231631755828857), (163, 0.004985898733139038), (164, 0.005949497222900391), (165, 0.006749063730239868), (166, 0.007699251174926758), (167, 0.00819125771522522), (168, 0.00861281156539917), (169, 0.009223461151123047), (170, 0.009624272584915161), (171, 0.009857982397079468), (172, 0.010049253702163696), (173, 0.010117441415786743), (174, 0.010220050811767578), (175, 0.010481983423233032), (176, 0.01044359803199768), (177, 0.010087072849273682), (178, 0.009658336639404297), (179, 0.008907854557037354), (180, 0.008228093385696411), (181, 0.0075254738330841064), (182, 0.006610065698623657), (183, 0.0058990418910980225), (184, 0.00510677695274353), (185, 0.004456043243408203), (186, 0.0039751529693603516), (187, 0.0030986666679382324), (188, 0.0021691322326660156), (189, 0.0013262629508972168), (190, 0.00040847063064575195), (191, -0.00021952390670776367), (192, -0.0007114410400390625), (193, -0.0012654364109039307), (194, -0.0018610060214996338), (195, -0.002550840377807617), (196, -0.0030656754970550537), (197, -0.0034776926040649414), (198, -0.003981888294219971), (199, -0.0044959187507629395), (200, -0.004998207092285156), (201, -0.005442559719085693), (202, -0.005722403526306152), (203, -0.005872935056686401), (204, -0.006001919507980347), (205, -0.006108880043029785), (206, -0.006204515695571899), (207, -0.006306290626525879), (208, -0.006520986557006836), (209, -0.006835669279098511), (210, -0.007163137197494507), (211, -0.007665485143661499), (212, -0.008168905973434448), (213, -0.00852176547050476), (214, -0.008789420127868652), (215, -0.008990883827209473), (216, -0.009182214736938477), (217, -0.009358853101730347), (218, -0.009530127048492432), (219, -0.00979846715927124), (220, -0.009796619415283203), (221, -0.01006937026977539), (222, -0.010200858116149902), (223, -0.010298669338226318), (224, -0.010317325592041016), (225, -0.010218560695648193), (226, -0.010125279426574707), (227, -0.010033726692199707), (228, -0.010163307189941406), (229, -0.010303884744644165), (230, -0.010482817888259888), (231, -0.010749995708465576), (232, -0.011043012142181396), (233, -0.011309951543807983), (234, -0.011693865060806274), (235, -0.012206494808197021), (236, -0.012732505798339844), (237, -0.013221442699432373), (238, -0.013572126626968384), (239, -0.013720959424972534), (240, -0.013787776231765747), (241, -0.013841450214385986), (242, -0.01397523283958435), (243, -0.014310389757156372), (244, -0.014714986085891724), (245, -0.015120983123779297), (246, -0.015568464994430542), (247, -0.015963762998580933), (248, -0.01632624864578247), (249, -0.016718417406082153), (250, -0.017119556665420532), (251, -0.017633646726608276), (252, -0.01831987500190735), (253, -0.018972188234329224), (254, -0.0194186270236969), (255, -0.019558608531951904), (256, -0.01926732063293457), (257, -0.019029974937438965), (258, -0.01869755983352661), (259, -0.018146663904190063), (260, -0.017719626426696777), (261, -0.01746472716331482), (262, -0.01741236448287964), (263, -0.017403066158294678), (264, -0.017441600561141968), (265, -0.01757904887199402), (266, -0.017794132232666016), (267, -0.018022775650024414), (268, -0.018172532320022583), (269, -0.018381237983703613), (270, -0.018758326768875122), (271, -0.019190579652786255), (272, -0.019497454166412354), (273, -0.01951378583908081), (274, -0.019146502017974854), (275, -0.018897712230682373), (276, -0.018423646688461304), (277, -0.017567574977874756), (278, -0.01708996295928955), (279, -0.017002105712890625), (280, -0.016965538263320923), (281, -0.017088234424591064), (282, -0.01713612675666809), (283, -0.01692277193069458), (284, -0.01680588722229004), (285, -0.016775041818618774), (286, -0.01665768027305603), (287, -0.016533255577087402), (288, -0.01626574993133545), (289, -0.01573142409324646), (290, -0.015431642532348633), (291, -0.015016913414001465), (292, -0.014201074838638306), (293, -0.013353943824768066), (294, -0.012547791004180908), (295, -0.011842548847198486), (296, -0.011225223541259766), (297, -0.011017531156539917), (298, -0.010793924331665039), (299, -0.010428965091705322), (300, -0.00985381007194519), (301, -0.00926518440246582), (302, -0.008663922548294067), (303, -0.008060038089752197), (304, -0.007971912622451782), (305, -0.008332371711730957), (306, -0.00863388180732727), (307, -0.00888127088546753), (308, -0.008764594793319702), (309, -0.008088409900665283), (310, -0.0067494213581085205), (311, -0.006474733352661133), (312, -0.005045771598815918), (313, -0.004159450531005859), (314, -0.003562062978744507), (315, -0.0020295381546020508), (316, -0.0007516145706176758), (317, -2.2411346435546875e-05), (318, 0.0005404353141784668), (319, 0.001101762056350708), (320, 0.001355975866317749), (321, 0.0016421079635620117), (322, 0.002500474452972412), (323, 0.0038797855377197266), (324, 0.00475504994392395), (325, 0.005380302667617798), (326, 0.006937175989151001), (327, 0.008178085088729858), (328, 0.008747875690460205), (329, 0.008897542953491211), (330, 0.009602963924407959), (331, 0.01054033637046814), (332, 0.012094706296920776), (333, 0.014686375856399536), (334, 0.015169471502304077), (335, 0.016292601823806763), (336, 0.018096446990966797), (337, 0.02040553092956543), (338, 0.021833479404449463), (339, 0.024522602558135986), (340, 0.025357037782669067), (341, 0.027977168560028076), (342, 0.029498755931854248), (343, 0.029501348733901978), (344, 0.03024923801422119), (345, 0.030663102865219116), (346, 0.031054019927978516), (347, 0.031860023736953735), (348, 0.033150285482406616), (349, 0.033787548542022705), (350, 0.034784555435180664), (351, 0.03662538528442383), (352, 0.03773346543312073), (353, 0.03848755359649658), (354, 0.04011237621307373), (355, 0.04146656394004822), (356, 0.04218798875808716), (357, 0.04264712333679199), (358, 0.04374462366104126), (359, 0.04488182067871094), (360, 0.04621747136116028), (361, 0.04684263467788696), (362, 0.047848641872406006), (363, 0.04958942532539368), (364, 0.05050745606422424), (365, 0.051358968019485474), (366, 0.05304527282714844), (367, 0.05402675271034241), (368, 0.05430424213409424), (369, 0.05505141615867615), (370, 0.055427223443984985), (371, 0.055432796478271484), (372, 0.05528002977371216), (373, 0.0550684928894043), (374, 0.054650843143463135), (375, 0.05418553948402405), (376, 0.05372738838195801), (377, 0.053232550621032715), (378, 0.05253627896308899), (379, 0.051692187786102295), (380, 0.051097214221954346), (381, 0.05048239231109619), (382, 0.04993763566017151), (383, 0.049367666244506836), (384, 0.04830479621887207), (385, 0.04704362154006958), (386, 0.045540839433670044), (387, 0.04394876956939697), (388, 0.04273083806037903), (389, 0.04181632399559021), (390, 0.04098445177078247), (391, 0.04018056392669678), (392, 0.03951495885848999), (393, 0.03894305229187012), (394, 0.038432180881500244), (395, 0.03788501024246216), (396, 0.037239283323287964), (397, 0.03666108846664429), (398, 0.0360681414604187), (399, 0.03547525405883789), (400, 0.03498676419258118), (401, 0.034447550773620605), (402, 0.03368443250656128), (403, 0.03258034586906433), (404, 0.031065404415130615), (405, 0.029219627380371094), (406, 0.027266353368759155), (407, 0.02553841471672058), (408, 0.024757295846939087), (409, 0.02484831213951111), (410, 0.024496465921401978), (411, 0.025249391794204712), (412, 0.02612823247909546), (413, 0.0268632173538208), (414, 0.02666759490966797), (415, 0.025590240955352783), (416, 0.024236947298049927), (417, 0.02281135320663452), (418, 0.021235883235931396), (419, 0.02007189393043518), (420, 0.019323289394378662), (421, 0.018642425537109375), (422, 0.01794534921646118), (423, 0.017160624265670776), (424, 0.01666530966758728), (425, 0.016453474760055542), (426, 0.016124188899993896), (427, 0.01614341139793396), (428, 0.01612168550491333), (429, 0.01626768708229065), (430, 0.016289860010147095), (431, 0.016186922788619995), (432, 0.01598256826400757), (433, 0.015773862600326538), (434, 0.015290021896362305), (435, 0.014410436153411865), (436, 0.013117462396621704), (437, 0.011688292026519775), (438, 0.010298371315002441), (439, 0.009009689092636108), (440, 0.00829470157623291), (441, 0.008028417825698853), (442, 0.0079079270362854), (443, 0.007946282625198364), (444, 0.007995665073394775), (445, 0.008058816194534302), (446, 0.008165895938873291), (447, 0.008175909519195557), (448, 0.008081316947937012), (449, 0.007945030927658081), (450, 0.0076958537101745605), (451, 0.007319718599319458), (452, 0.006870388984680176), (453, 0.00638154149055481), (454, 0.005944877862930298), (455, 0.005690723657608032), (456, 0.005728304386138916), (457, 0.006056249141693115), (458, 0.0064141154289245605), (459, 0.006813526153564453), (460, 0.006705224514007568), (461, 0.007053643465042114), (462, 0.007250577211380005), (463, 0.007389575242996216), (464, 0.007589668035507202), (465, 0.007714003324508667), (466, 0.007759183645248413), (467, 0.00775754451751709), (468, 0.007696360349655151), (469, 0.007598876953125), (470, 0.007378041744232178), (471, 0.006900310516357422), (472, 0.006417006254196167), (473, 0.00604170560836792), (474, 0.005770266056060791), (475, 0.005776703357696533), (476, 0.0059645771980285645), (477, 0.006338894367218018), (478, 0.006264805793762207), (479, 0.006643563508987427), (480, 0.006671488285064697), (481, 0.006955236196517944), (482, 0.007321834564208984), (483, 0.007532268762588501), (484, 0.007594466209411621), (485, 0.007892221212387085), (486, 0.00831979513168335), (487, 0.009012192487716675), (488, 0.009998172521591187), (489, 0.010601073503494263), (490, 0.010850608348846436), (491, 0.011376231908798218), (492, 0.01152878999710083), (493, 0.011313647031784058), (494, 0.010871529579162598), (495, 0.01033356785774231), (496, 0.00975888967514038), (497, 0.00923869013786316), (498, 0.0087432861328125), (499, 0.008228898048400879), (500, 0.007505208253860474), (501, 0.00638541579246521), (502, 0.005185574293136597), (503, 0.004029780626296997), (504, 0.002928018569946289), (505, 0.002254962921142578), (506, 0.002017587423324585), (507, 0.002081841230392456), (508, 0.0020544826984405518), (509, 0.0024378299713134766), (510, 0.0029736757278442383), (511, 0.003600388765335083), (512, 0.004118561744689941), (513, 0.004374861717224121), (514, 0.004355877637863159), (515, 0.004131674766540527), (516, 0.0038390755653381348), (517, 0.003584235906600952), (518, 0.003304123878479004), (519, 0.003037095069885254), (520, 0.002894788980484009), (521, 0.00273093581199646), (522, 0.0025777816772460938), (523, 0.0024910271167755127), (524, 0.0024339258670806885), (525, 0.0023759007453918457), (526, 0.0022673606872558594), (527, 0.0021839439868927), (528, 0.0020787417888641357), (529, 0.0019167661666870117), (530, 0.0017541348934173584), (531, 0.0016095340251922607), (532, 0.0015044808387756348), (533, 0.001430809497833252), (534, 0.001361459493637085), (535, 0.001435011625289917), (536, 0.0016223490238189697), (537, 0.001645594835281372), (538, 0.0017619431018829346), (539, 0.0019703209400177), (540, 0.0021665096282958984), (541, 0.002238631248474121), (542, 0.002067476511001587), (543, 0.0017792582511901855), (544, 0.001645505428314209), (545, 0.001221686601638794), (546, 0.0014543533325195312), (547, 0.00139617919921875), (548, 0.0015491247177124023), (549, 0.0016593337059020996), (550, 0.0017181038856506348), (551, 0.0017107129096984863), (552, 0.0017175674438476562), (553, 0.0018290281295776367), (554, 0.002125650644302368), (555, 0.0026185214519500732), (556, 0.0032164156436920166), (557, 0.003922551870346069), (558, 0.004629790782928467), (559, 0.0049852728843688965), (560, 0.0052131712436676025), (561, 0.005972474813461304), (562, 0.00684019923210144), (563, 0.007468044757843018), (564, 0.008067339658737183), (565, 0.008457392454147339), (566, 0.00818142294883728), (567, 0.007186591625213623), (568, 0.0060485005378723145), (569, 0.004937648773193359), (570, 0.003685295581817627), (571, 0.0028274357318878174), (572, 0.0026535391807556152), (573, 0.0027180910110473633), (574, 0.0027337968349456787), (575, 0.0029806792736053467), (576, 0.0032604336738586426), (577, 0.003345966339111328), (578, 0.0031781792640686035), (579, 0.002822667360305786), (580, 0.002521008253097534), (581, 0.0020477771759033203), (582, 0.0015780627727508545), (583, 0.0012839436531066895), (584, 0.0009653866291046143), (585, 0.0005494356155395508), (586, 8.01384449005127e-05), (587, -0.0003343820571899414), (588, -0.0006904900074005127), (589, -0.0010475218296051025), (590, -0.001395195722579956), (591, -0.001716524362564087), (592, -0.002106308937072754), (593, -0.0024995505809783936), (594, -0.0029112696647644043), (595, -0.003461092710494995), (596, -0.003980129957199097), (597, -0.004415601491928101), (598, -0.004767179489135742), (599, -0.0048400163650512695), (600, -0.0046832263469696045), (601, -0.004447281360626221), (602, -0.00429302453994751), (603, -0.004150837659835815), (604, -0.0039030611515045166), (605, -0.003724724054336548), (606, -0.003580152988433838), (607, -0.003414750099182129), (608, -0.003222733736038208), (609, -0.0029608309268951416), (610, -0.0025776922702789307), (611, -0.002126157283782959), (612, -0.0016511976718902588), (613, -0.0013244450092315674), (614, -0.0011293888092041016), (615, -0.0008997917175292969), (616, -0.0007326602935791016), (617, -0.0004716217517852783), (618, -0.0002827644348144531), (619, -1.1980533599853516e-05), (620, 0.00048172473907470703), (621, 0.0008882284164428711), (622, 0.0011147856712341309), (623, 0.0011597275733947754), (624, 0.0010593533515930176), (625, 0.0008900463581085205), (626, 0.0006702244281768799), (627, 0.0004958510398864746), (628, 0.000486522912979126), (629, 0.0005404055118560791), (630, 0.000654071569442749), (631, 0.0005527138710021973), (632, -4.291534423828125e-06), (633, -0.00077095627784729), (634, -0.0017617344856262207), (635, -0.0028207004070281982), (636, -0.0036025643348693848), (637, -0.004202991724014282), (638, -0.004708707332611084), (639, -0.0051586925983428955), (640, -0.005624502897262573), (641, -0.0060370564460754395), (642, -0.006429433822631836), (643, -0.006853342056274414), (644, -0.0072702765464782715), (645, -0.007673442363739014), (646, -0.008008420467376709), (647, -0.008206933736801147), (648, -0.008245021104812622), (649, -0.008116960525512695), (650, -0.007860422134399414), (651, -0.007562041282653809), (652, -0.007316529750823975), (653, -0.007196098566055298), (654, -0.00723719596862793), (655, -0.007400095462799072), (656, -0.007593393325805664), (657, -0.0077214837074279785), (658, -0.007699429988861084), (659, -0.007457941770553589), (660, -0.006994903087615967), (661, -0.006425052881240845), (662, -0.005829662084579468), (663, -0.005418181419372559), (664, -0.005218386650085449), (665, -0.004681318998336792), (666, -0.004160076379776001), (667, -0.0036183595657348633), (668, -0.0030705034732818604), (669, -0.0025792717933654785), (670, -0.002161741256713867), (671, -0.0018296241760253906), (672, -0.0016123950481414795), (673, -0.0014749765396118164), (674, -0.0015572905540466309), (675, -0.0015027821063995361), (676, -0.00135764479637146), (677, -0.0011314153671264648), (678, -0.0010381340980529785), (679, -0.0006813704967498779), (680, 0.0002123117446899414), (681, 0.0013248920440673828), (682, 0.0018686354160308838), (683, 0.0023563802242279053), (684, 0.0033954381942749023), (685, 0.0042678117752075195), (686, 0.004777491092681885), (687, 0.004663556814193726), (688, 0.0040628015995025635), (689, 0.0034641921520233154), (690, 0.002562880516052246), (691, 0.0017981529235839844), (692, 0.0016254186630249023), (693, 0.0016612708568572998), (694, 0.0018489360809326172), (695, 0.0022073984146118164), (696, 0.002354174852371216), (697, 0.002675563097000122), (698, 0.003184676170349121), (699, 0.0038467049598693848), (700, 0.004571467638015747), (701, 0.005223959684371948), (702, 0.005762577056884766), (703, 0.006097942590713501), (704, 0.006207317113876343), (705, 0.006162434816360474), (706, 0.005947887897491455), (707, 0.005625337362289429), (708, 0.005295246839523315), (709, 0.004984945058822632), (710, 0.004777342081069946), (711, 0.004449963569641113), (712, 0.004052996635437012), (713, 0.0038799941539764404), (714, 0.0036866068840026855), (715, 0.003655076026916504), (716, 0.003982722759246826), (717, 0.004342913627624512), (718, 0.004672139883041382), (719, 0.0050453245639801025), (720, 0.005406081676483154), (721, 0.0058088600635528564), (722, 0.006063610315322876), (723, 0.006304115056991577), (724, 0.006789207458496094), (725, 0.007225006818771362), (726, 0.0076056718826293945), (727, 0.007956147193908691), (728, 0.00830310583114624), (729, 0.008669048547744751), (730, 0.009048819541931152), (731, 0.009400933980941772), (732, 0.009687989950180054), (733, 0.009885430335998535), (734, 0.009972631931304932), (735, 0.009943157434463501), (736, 0.010133922100067139), (737, 0.010423600673675537), (738, 0.010459721088409424), (739, 0.010591596364974976), (740, 0.010806769132614136), (741, 0.010926097631454468), (742, 0.010746806859970093), (743, 0.010390907526016235), (744, 0.009981870651245117), (745, 0.00956699252128601), (746, 0.009165763854980469), (747, 0.00888603925704956), (748, 0.008732378482818604), (749, 0.008644849061965942), (750, 0.008597642183303833), (751, 0.008540362119674683), (752, 0.008430540561676025), (753, 0.008176535367965698), (754, 0.00762060284614563), (755, 0.00678059458732605), (756, 0.005810946226119995), (757, 0.004776626825332642), (758, 0.003661930561065674), (759, 0.002473890781402588), (760, 0.0014209449291229248), (761, 0.0004614889621734619), (762, -0.000501096248626709), (763, -0.0011369287967681885), (764, -0.0013339519500732422), (765, -0.0013036131858825684), (766, -0.0011462569236755371), (767, -0.0008755624294281006), (768, -0.0007009804248809814), (769, -0.0007985830307006836), (770, -0.0012267231941223145), (771, -0.00192946195602417), (772, -0.0026641786098480225), (773, -0.003360152244567871), (774, -0.003910958766937256), (775, -0.004252791404724121), (776, -0.0044907331466674805), (777, -0.004667103290557861), (778, -0.004861354827880859), (779, -0.005060046911239624), (780, -0.005215585231781006), (781, -0.005368620157241821), (782, -0.005535811185836792), (783, -0.005713343620300293), (784, -0.005895823240280151), (785, -0.006095409393310547), (786, -0.006313979625701904), (787, -0.006559789180755615), (788, -0.006830692291259766), (789, -0.007094323635101318), (790, -0.007355630397796631), (791, -0.007633805274963379), (792, -0.007951408624649048), (793, -0.008293449878692627), (794, -0.008625805377960205), (795, -0.00889742374420166), (796, -0.009002327919006348), (797, -0.009078443050384521), (798, -0.009320974349975586), (799, -0.008846908807754517), (800, -0.009431302547454834), (801, -0.009239643812179565), (802, -0.008903294801712036), (803, -0.008684813976287842), (804, -0.008149504661560059), (805, -0.007279455661773682), (806, -0.006703734397888184), (807, -0.006299883127212524), (808, -0.006235092878341675), (809, -0.006311267614364624), (810, -0.0063211023807525635), (811, -0.0063169896602630615), (812, -0.006283313035964966), (813, -0.006177544593811035), (814, -0.00595170259475708), (815, -0.005586296319961548), (816, -0.005096703767776489), (817, -0.004783511161804199), (818, -0.004278898239135742), (819, -0.003249257802963257), (820, -0.002377420663833618), (821, -0.0008977353572845459), (822, -0.0008977353572845459)], ('rotation_euler', 0): [(1, -0.03886175900697708), (2, -0.03911847621202469), (3, -0.039102062582969666), (4, -0.039380788803100586), (5, -0.03894931823015213), (6, -0.03889884799718857), (7, -0.03868026286363602), (8, -0.0383145697414875), (9, -0.038680143654346466), (10, -0.03813944756984711), (11, -0.03827328979969025), (12, -0.03859559819102287), (13, -0.03919185325503349), (14, -0.0397120863199234), (15, -0.03977414593100548), (16, -0.039167795330286026), (17, -0.03886181488633156), (18, -0.037905093282461166), (19, -0.036777954548597336), (20, -0.03616996109485626), (21, -0.03590666130185127), (22, -0.03594135865569115), (23, -0.03606924042105675), (24, -0.03604980558156967), (25, -0.035822462290525436), (26, -0.03544681891798973), (27, -0.034821245819330215), (28, -0.03377298638224602), (29, -0.03373192623257637), (30, -0.03325141221284866), (31, -0.0325007438659668), (32, -0.031189117580652237), (33, -0.03011917509138584), (34, -0.029550835490226746), (35, -0.029472850263118744), (36, -0.02949216403067112), (37, -0.029345685616135597), (38, -0.028946662321686745), (39, -0.028515467420220375), (40, -0.028349842876195908), (41, -0.028601983562111855), (42, -0.029485709965229034), (43, -0.031368207186460495), (44, -0.03295068070292473), (45, -0.03306858614087105), (46, -0.03265999257564545), (47, -0.032534096390008926), (48, -0.032298628240823746), (49, -0.03229823336005211), (50, -0.0297129787504673), (51, -0.03166475147008896), (52, -0.030934536829590797), (53, -0.030806928873062134), (54, -0.03178340196609497), (55, -0.030676212161779404), (56, -0.029627174139022827), (57, -0.02922622114419937), (58, -0.030115941539406776), (59, -0.03109334222972393), (60, -0.032245539128780365), (61, -0.0332755409181118), (62, -0.03284706920385361), (63, -0.032615918666124344), (64, -0.03238627314567566), (65, -0.031318508088588715), (66, -0.030110714957118034), (67, -0.028503498062491417), (68, -0.027519261464476585), (69, -0.026663634926080704), (70, -0.024705780670046806), (71, -0.02295607514679432), (72, -0.02170250378549099), (73, -0.021694911643862724), (74, -0.02096678502857685), (75, -0.02075757458806038), (76, -0.020656220614910126), (77, -0.020510002970695496), (78, -0.020683301612734795), (79, -0.021451659500598907), (80, -0.02215838059782982), (81, -0.022584758698940277), (82, -0.02303510159254074), (83, -0.022867372259497643), (84, -0.021853240206837654), (85, -0.02195299230515957), (86, -0.021508609876036644), (87, -0.020953770726919174), (88, -0.019946672022342682), (89, -0.019164644181728363), (90, -0.018678318709135056), (91, -0.01915765553712845), (92, -0.02043941617012024), (93, -0.021658381447196007), (94, -0.02304599992930889), (95, -0.023577140644192696), (96, -0.02394372783601284), (97, -0.023928288370370865), (98, -0.02406388707458973), (99, -0.024100681766867638), (100, -0.025057131424546242), (101, -0.025797661393880844), (102, -0.02569427900016308), (103, -0.025714270770549774), (104, -0.025827117264270782), (105, -0.026772702112793922), (106, -0.027723804116249084), (107, -0.027914607897400856), (108, -0.029095834121108055), (109, -0.030078232288360596), (110, -0.0298923347145319), (111, -0.029489869251847267), (112, -0.0297931507229805), (113, -0.03084852546453476), (114, -0.03205845504999161), (115, -0.03292647376656532), (116, -0.03297844156622887), (117, -0.0327397957444191), (118, -0.03248848766088486), (119, -0.03226009011268616), (120, -0.0321163609623909), (121, -0.03187503293156624), (122, -0.031380072236061096), (123, -0.030853204429149628), (124, -0.03026379831135273), (125, -0.028716085478663445), (126, -0.027247097343206406), (127, -0.02568495273590088), (128, -0.024545125663280487), (129, -0.024117184802889824), (130, -0.022930650040507317), (131, -0.021572154015302658), (132, -0.0198501069098711), (133, -0.01778884418308735), (134, -0.016791047528386116), (135, -0.01574365422129631), (136, -0.01420074887573719), (137, -0.012906048446893692), (138, -0.012134337797760963), (139, -0.011908985674381256), (140, -0.011556850746273994), (141, -0.010794362053275108), (142, -0.01094102580100298), (143, -0.00985597725957632), (144, -0.008802843280136585), (145, -0.007883677259087563), (146, -0.007433128543198109), (147, -0.007546369917690754), (148, -0.007983068935573101), (149, -0.008359265513718128), (150, -0.008643124252557755), (151, -0.008854400366544724), (152, -0.008933440782129765), (153, -0.008989032357931137), (154, -0.009010307490825653), (155, -0.008783642202615738), (156, -0.008254685439169407), (157, -0.007550546899437904), (158, -0.006805726792663336), (159, -0.0060500348918139935), (160, -0.005651739425957203), (161, -0.005187434609979391), (162, -0.0037925096694380045), (163, -0.0019575846381485462), (164, -6.6837169470090885e-06), (165, 0.0011427432764321566), (166, 0.0017917888471856713), (167, 0.0030607811640948057), (168, 0.003559163073077798), (169, 0.0037349574267864227), (170, 0.0039131068624556065), (171, 0.004107441287487745), (172, 0.004248648416250944), (173, 0.004217169713228941), (174, 0.004091509617865086), (175, 0.003939120564609766), (176, 0.003916947171092033), (177, 0.004095966462045908), (178, 0.004165546968579292), (179, 0.004002650734037161), (180, 0.003252319758757949), (181, 0.0019311744254082441), (182, 0.0006579366163350642), (183, -0.0004062515508849174), (184, -0.0013893566792830825), (185, -0.0021319270599633455), (186, -0.0028453196864575148), (187, -0.0038839157205075026), (188, -0.005379897076636553), (189, -0.006965604145079851), (190, -0.008368396200239658), (191, -0.009603877551853657), (192, -0.01053309254348278), (193, -0.011186785064637661), (194, -0.011552954092621803), (195, -0.011463054455816746), (196, -0.010936789214611053), (197, -0.010056729428470135), (198, -0.008945218287408352), (199, -0.007772648707032204), (200, -0.007271011359989643), (201, -0.006723308935761452), (202, -0.005956660956144333), (203, -0.005421752575784922), (204, -0.0049083963967859745), (205, -0.004431969951838255), (206, -0.003908975515514612), (207, -0.003135738195851445), (208, -0.0021871342323720455), (209, -0.001739840256050229), (210, -0.0011861162493005395), (211, 5.160227738087997e-05), (212, 0.0015555459540337324), (213, 0.003239378798753023), (214, 0.0040238588117063046), (215, 0.005031861364841461), (216, 0.006665579974651337), (217, 0.007945365272462368), (218, 0.008780749514698982), (219, 0.009308014065027237), (220, 0.009873737581074238), (221, 0.009725954383611679), (222, 0.010340511798858643), (223, 0.010679465718567371), (224, 0.01081728097051382), (225, 0.011444590985774994), (226, 0.011891703121364117), (227, 0.012184247374534607), (228, 0.01247521210461855), (229, 0.012555832974612713), (230, 0.012082435190677643), (231, 0.010996845550835133), (232, 0.009243105538189411), (233, 0.0066367569379508495), (234, 0.003739415667951107), (235, 0.0007770718075335026), (236, -0.0019539669156074524), (237, -0.004437892232090235), (238, -0.007612894754856825), (239, -0.01138094812631607), (240, -0.014834651723504066), (241, -0.01800575852394104), (242, -0.021065907552838326), (243, -0.021330751478672028), (244, -0.023675808683037758), (245, -0.024900048971176147), (246, -0.02597549743950367), (247, -0.0266021266579628), (248, -0.026596451178193092), (249, -0.026535123586654663), (250, -0.026778001338243484), (251, -0.02756630629301071), (252, -0.028569301590323448), (253, -0.02922065556049347), (254, -0.029681695625185966), (255, -0.02992207556962967), (256, -0.03005313314497471), (257, -0.030750088393688202), (258, -0.03541066125035286), (259, -0.042829547077417374), (260, -0.049103446304798126), (261, -0.05605411157011986), (262, -0.0611976683139801), (263, -0.06205965578556061), (264, -0.0617193728685379), (265, -0.0613049678504467), (266, -0.06044551730155945), (267, -0.05939270928502083), (268, -0.05785372853279114), (269, -0.055755965411663055), (270, -0.05493498221039772), (271, -0.05307895317673683), (272, -0.04985693097114563), (273, -0.04839381203055382), (274, -0.0463763065636158), (275, -0.044483814388513565), (276, -0.043590303510427475), (277, -0.042284201830625534), (278, -0.042370155453681946), (279, -0.04291030392050743), (280, -0.04388706758618355), (281, -0.04475860670208931), (282, -0.04496735334396362), (283, -0.04461658000946045), (284, -0.044151369482278824), (285, -0.04339448735117912), (286, -0.04309304803609848), (287, -0.041945889592170715), (288, -0.03989252820611), (289, -0.03751154616475105), (290, -0.03671332448720932), (291, -0.035010386258363724), (292, -0.033651482313871384), (293, -0.032549597322940826), (294, -0.03082110360264778), (295, -0.03039313666522503), (296, -0.028414126485586166), (297, -0.026109404861927032), (298, -0.02492878958582878), (299, -0.023020941764116287), (300, -0.018342366442084312), (301, -0.016471775248646736), (302, -0.011756233870983124), (303, -0.009762530215084553), (304, -0.007253265008330345), (305, -0.0035152751952409744), (306, -0.00010973308235406876), (307, 0.00460889283567667), (308, 0.00732093770056963), (309, 0.009315269999206066), (310, 0.010502309538424015), (311, 0.01108420081436634), (312, 0.013724985532462597), (313, 0.012968195602297783), (314, 0.010726796463131905), (315, 0.007316689006984234), (316, 0.004593117628246546), (317, 0.003396243555471301), (318, 0.002140715019777417), (319, 0.00037303107092157006), (320, -0.0012918872525915504), (321, -0.0029618903063237667), (322, -0.0042866431176662445), (323, -0.004899433348327875), (324, -0.004491921979933977), (325, -0.005142184905707836), (326, -0.003478842321783304), (327, -0.0020272149704396725), (328, -0.00089499686146155), (329, -0.0003285899292677641), (330, 0.0012440324062481523), (331, 0.002597577404230833), (332, -0.00028039957396686077), (333, -0.004950280301272869), (334, -0.005895721260458231), (335, -0.004039140418171883), (336, -0.010324818082153797), (337, -0.01771850697696209), (338, -0.014611932449042797), (339, -0.020762823522090912), (340, -0.015154779888689518), (341, -0.017549362033605576), (342, -0.014032048173248768), (343, -0.011302711442112923), (344, -0.00891296286135912), (345, -0.006055526901036501), (346, -0.0019198631634935737), (347, 0.0003942488110624254), (348, 0.0035512291360646486), (349, 0.005165635142475367), (350, 0.008240782655775547), (351, 0.009455351158976555), (352, 0.010612484999001026), (353, 0.011946963146328926), (354, 0.013017816469073296), (355, 0.015750814229249954), (356, 0.01740960031747818), (357, 0.018833061680197716), (358, 0.02194242924451828), (359, 0.023901844397187233), (360, 0.0245211198925972), (361, 0.02582361362874508), (362, 0.025471020489931107), (363, 0.02419978380203247), (364, 0.022705769166350365), (365, 0.021525107324123383), (366, 0.021437598392367363), (367, 0.022490011528134346), (368, 0.023990865796804428), (369, 0.024677561596035957), (370, 0.02528788335621357), (371, 0.025782180950045586), (372, 0.025319647043943405), (373, 0.024325121194124222), (374, 0.023304864764213562), (375, 0.022699741646647453), (376, 0.022601431235671043), (377, 0.023149002343416214), (378, 0.021982088685035706), (379, 0.020497767254710197), (380, 0.01852729357779026), (381, 0.016104742884635925), (382, 0.014112005941569805), (383, 0.013358056545257568), (384, 0.013483695685863495), (385, 0.014120124280452728), (386, 0.015022121369838715), (387, 0.015888404101133347), (388, 0.016610492020845413), (389, 0.016428429633378983), (390, 0.016429860144853592), (391, 0.01605997607111931), (392, 0.015538123436272144), (393, 0.01510647777467966), (394, 0.015053081326186657), (395, 0.015394872054457664), (396, 0.01602886989712715), (397, 0.016358595341444016), (398, 0.01683785207569599), (399, 0.01769084297120571), (400, 0.01835663430392742), (401, 0.018579866737127304), (402, 0.01808893494307995), (403, 0.016392096877098083), (404, 0.013745921663939953), (405, 0.011187570169568062), (406, 0.009019415825605392), (407, 0.0074561722576618195), (408, 0.006805377546697855), (409, 0.006390205584466457), (410, 0.005443808622658253), (411, 0.003984889015555382), (412, 0.0025496557354927063), (413, 0.0014680532040074468), (414, 0.0009913949761539698), (415, 0.0013957107439637184), (416, 0.0024782055988907814), (417, 0.0027795983478426933), (418, 0.003871246473863721), (419, 0.005277647636830807), (420, 0.006416901480406523), (421, 0.0070560588501393795), (422, 0.006959924474358559), (423, 0.0059518758207559586), (424, 0.003674539737403393), (425, 0.0005023029516451061), (426, -0.0025754154194146395), (427, -0.005164009518921375), (428, -0.006661932449787855), (429, -0.006581724621355534), (430, -0.005611033644527197), (431, -0.004995262250304222), (432, -0.004824443720281124), (433, -0.0045863790437579155), (434, -0.004827318713068962), (435, -0.0054727219976484776), (436, -0.006184818688780069), (437, -0.006503906566649675), (438, -0.006421598140150309), (439, -0.006204541306942701), (440, -0.006184298545122147), (441, -0.006658334285020828), (442, -0.007909893989562988), (443, -0.010012674145400524), (444, -0.01274809893220663), (445, -0.015729708597064018), (446, -0.018237721174955368), (447, -0.019891265779733658), (448, -0.02073664590716362), (449, -0.020790424197912216), (450, -0.020363593474030495), (451, -0.01988374814391136), (452, -0.019618147984147072), (453, -0.019662106409668922), (454, -0.02010917291045189), (455, -0.021246198564767838), (456, -0.02291412279009819), (457, -0.02448495477437973), (458, -0.025861360132694244), (459, -0.026853127405047417), (460, -0.027076873928308487), (461, -0.026744557544589043), (462, -0.026031985878944397), (463, -0.02564305067062378), (464, -0.024764418601989746), (465, -0.02301689051091671), (466, -0.020925503224134445), (467, -0.01960883103311062), (468, -0.018591955304145813), (469, -0.016205638647079468), (470, -0.013653408735990524), (471, -0.012680910527706146), (472, -0.01082596369087696), (473, -0.007713662460446358), (474, -0.006410283502191305), (475, -0.0041545722633600235), (476, -0.00010402688349131495), (477, 0.0009826866444200277), (478, 0.004005254711955786), (479, 0.005461452063173056), (480, 0.006738126743584871), (481, 0.007875901646912098), (482, 0.01068620104342699), (483, 0.01102331094443798), (484, 0.013084338046610355), (485, 0.014154035598039627), (486, 0.014403877779841423), (487, 0.014092056080698967), (488, 0.013551926240324974), (489, 0.013215973973274231), (490, 0.013242064975202084), (491, 0.013535191304981709), (492, 0.013951746746897697), (493, 0.013133671134710312), (494, 0.010454263538122177), (495, 0.00747351860627532), (496, 0.004368878901004791), (497, 0.001487871864810586), (498, 0.0004088620189577341), (499, 0.00038948591100052), (500, 5.208254879107699e-05), (501, -0.0008579381974413991), (502, -0.0021986868232488632), (503, -0.00390793289989233), (504, -0.005707651376724243), (505, -0.006966231856495142), (506, -0.007596238516271114), (507, -0.008024225942790508), (508, -0.007638069335371256), (509, -0.00709666358307004), (510, -0.006520147901028395), (511, -0.0064166635274887085), (512, -0.007281423546373844), (513, -0.008700228296220303), (514, -0.010133491829037666), (515, -0.011212523095309734), (516, -0.011280977167189121), (517, -0.010206244885921478), (518, -0.009358750656247139), (519, -0.008437279611825943), (520, -0.006251415237784386), (521, -0.003739521373063326), (522, -0.002853953279554844), (523, -0.0009187891846522689), (524, 0.002153146080672741), (525, 0.003458539955317974), (526, 0.005069703329354525), (527, 0.006940895691514015), (528, 0.007366403006017208), (529, 0.008629078045487404), (530, 0.008694368414580822), (531, 0.0077939704060554504), (532, 0.006015566177666187), (533, 0.003838764037936926), (534, 0.0017194412648677826), (535, -0.00038859175401739776), (536, -0.002157737733796239), (537, -0.003488074289634824), (538, -0.0046327258460223675), (539, -0.0056721181608736515), (540, -0.006671195384114981), (541, -0.007526859641075134), (542, -0.008101443760097027), (543, -0.00835597887635231), (544, -0.008373258635401726), (545, -0.008406137116253376), (546, -0.008505919016897678), (547, -0.00857351440936327), (548, -0.00897266622632742), (549, -0.008696296252310276), (550, -0.008764260448515415), (551, -0.00882098637521267), (552, -0.009046109393239021), (553, -0.009496282786130905), (554, -0.010127260349690914), (555, -0.010610618628561497), (556, -0.01063162088394165), (557, -0.01010731142014265), (558, -0.009980496019124985), (559, -0.008983888663351536), (560, -0.007422395050525665), (561, -0.005531508009880781), (562, -0.003271739464253187), (563, -0.002788467798382044), (564, -0.0009670517174527049), (565, 0.0012857982655987144), (566, 0.002470217412337661), (567, 0.0031514919828623533), (568, 0.003958662040531635), (569, 0.003575874026864767), (570, 0.0025782028678804636), (571, 0.0006475207046605647), (572, -0.0018359243404120207), (573, -0.0040910555981099606), (574, -0.0063138697296381), (575, -0.008309374563395977), (576, -0.009512037970125675), (577, -0.009915410540997982), (578, -0.009539291262626648), (579, -0.008705968968570232), (580, -0.007701763417571783), (581, -0.007133484818041325), (582, -0.006327938288450241), (583, -0.008107628673315048), (584, -0.011567658744752407), (585, -0.016680534929037094), (586, -0.02273925580084324), (587, -0.028752852231264114), (588, -0.03282846510410309), (589, -0.034778889268636703), (590, -0.03539974242448807), (591, -0.03511720523238182), (592, -0.035068731755018234), (593, -0.03452138230204582), (594, -0.034100912511348724), (595, -0.033579565584659576), (596, -0.03249608725309372), (597, -0.030701622366905212), (598, -0.02981726825237274), (599, -0.028278665617108345), (600, -0.026420459151268005), (601, -0.02543213777244091), (602, -0.022255921736359596), (603, -0.01861877739429474), (604, -0.017455704510211945), (605, -0.014613366685807705), (606, -0.012839092873036861), (607, -0.010450336150825024), (608, -0.007921081967651844), (609, -0.006289689335972071), (610, -0.002702481811866164), (611, -0.0009477231069467962), (612, -5.280695404508151e-06), (613, 0.0020257006399333477), (614, 0.003545180894434452), (615, 0.004781829658895731), (616, 0.0054144952446222305), (617, 0.005740323103964329), (618, 0.006223038304597139), (619, 0.00572256650775671), (620, 0.004613466095179319), (621, 0.003210806054994464), (622, 0.0014982519205659628), (623, -0.00023820114438422024), (624, -0.0023479291703552008), (625, -0.005043917801231146), (626, -0.007788568269461393), (627, -0.010423407889902592), (628, -0.012589365243911743), (629, -0.013725729659199715), (630, -0.01415710337460041), (631, -0.01460334938019514), (632, -0.015465877018868923), (633, -0.01666908711194992), (634, -0.018278853967785835), (635, -0.02011866681277752), (636, -0.02143275737762451), (637, -0.02218644693493843), (638, -0.022481461986899376), (639, -0.022484049201011658), (640, -0.022009054198861122), (641, -0.022644802927970886), (642, -0.023087136447429657), (643, -0.023589937016367912), (644, -0.024031059816479683), (645, -0.024129632860422134), (646, -0.024216456338763237), (647, -0.024350406602025032), (648, -0.024702010676264763), (649, -0.025164227932691574), (650, -0.025445565581321716), (651, -0.025189146399497986), (652, -0.024428829550743103), (653, -0.023330936208367348), (654, -0.022163959220051765), (655, -0.021130995824933052), (656, -0.020707951858639717), (657, -0.01906661130487919), (658, -0.017155438661575317), (659, -0.014646404422819614), (660, -0.013627602718770504), (661, -0.011499113403260708), (662, -0.009739229455590248), (663, -0.00795359630137682), (664, -0.004440360702574253), (665, -0.002741210162639618), (666, -0.001325353397987783), (667, 0.0008073176722973585), (668, 0.001869074534624815), (669, 0.00192612549290061), (670, 0.0010448349639773369), (671, -0.00047043015365488827), (672, -0.002234023530036211), (673, -0.004123086109757423), (674, -0.005760537460446358), (675, -0.0065340013243258), (676, -0.006181828211992979), (677, -0.00497940881177783), (678, -0.003077746368944645), (679, -0.002139198360964656), (680, -0.0010652152122929692), (681, 0.0009008623892441392), (682, 0.0025955582968890667), (683, 0.0033581918105483055), (684, 0.004241642542183399), (685, 0.00572883989661932), (686, 0.0069982511922717094), (687, 0.007423789240419865), (688, 0.007667647209018469), (689, 0.00815772544592619), (690, 0.008763646706938744), (691, 0.009588370099663734), (692, 0.009843334555625916), (693, 0.010721263475716114), (694, 0.012118369340896606), (695, 0.013652698136866093), (696, 0.014682543464004993), (697, 0.01533623319119215), (698, 0.014670144766569138), (699, 0.014219834469258785), (700, 0.01363592129200697), (701, 0.012857970781624317), (702, 0.012520060874521732), (703, 0.012741311453282833), (704, 0.013163723982870579), (705, 0.013717730529606342), (706, 0.01437136810272932), (707, 0.015484767965972424), (708, 0.015901116654276848), (709, 0.017232773825526237), (710, 0.019435444846749306), (711, 0.020886098966002464), (712, 0.022157378494739532), (713, 0.025309190154075623), (714, 0.0268294345587492), (715, 0.028129400685429573), (716, 0.03037618100643158), (717, 0.03206419572234154), (718, 0.03330431506037712), (719, 0.03338300436735153), (720, 0.03398924320936203), (721, 0.03419042006134987), (722, 0.03372384235262871), (723, 0.03268064931035042), (724, 0.031332191079854965), (725, 0.029609760269522667), (726, 0.027994906529784203), (727, 0.02695053070783615), (728, 0.026129351928830147), (729, 0.02528603933751583), (730, 0.02449280396103859), (731, 0.023787548765540123), (732, 0.02315281331539154), (733, 0.022694628685712814), (734, 0.02240939997136593), (735, 0.02227144129574299), (736, 0.022432073950767517), (737, 0.02272999845445156), (738, 0.022811217233538628), (739, 0.022837365046143532), (740, 0.022813089191913605), (741, 0.02226979471743107), (742, 0.020963242277503014), (743, 0.018985670059919357), (744, 0.01529592927545309), (745, 0.009639776311814785), (746, 0.0042483569122850895), (747, -0.0006259286310523748), (748, -0.005133759696036577), (749, -0.007742623332887888), (750, -0.0093615697696805), (751, -0.011666940525174141), (752, -0.01444900594651699), (753, -0.017161335796117783), (754, -0.019597189500927925), (755, -0.021668534725904465), (756, -0.023043282330036163), (757, -0.02382071688771248), (758, -0.024504533037543297), (759, -0.025028439238667488), (760, -0.02501666732132435), (761, -0.024230115115642548), (762, -0.022785097360610962), (763, -0.02087743952870369), (764, -0.019463298842310905), (765, -0.01875859871506691), (766, -0.01672935299575329), (767, -0.014951501041650772), (768, -0.013231764547526836), (769, -0.012428692542016506), (770, -0.011401381343603134), (771, -0.009962670505046844), (772, -0.008905300870537758), (773, -0.008277622982859612), (774, -0.007994679734110832), (775, -0.008056674152612686), (776, -0.008413058705627918), (777, -0.008768170140683651), (778, -0.009086438454687595), (779, -0.009620310738682747), (780, -0.010457712225615978), (781, -0.011685804463922977), (782, -0.0128957973793149), (783, -0.013776248320937157), (784, -0.014041543006896973), (785, -0.01319900806993246), (786, -0.012725895270705223), (787, -0.011516734957695007), (788, -0.00942386593669653), (789, -0.007273205555975437), (790, -0.006371562369167805), (791, -0.00555954547598958), (792, -0.004358035512268543), (793, -0.0035142397973686457), (794, -0.003087100572884083), (795, -0.0028978418558835983), (796, -0.0027412460185587406), (797, -0.0026133146602660418), (798, -0.002403518185019493), (799, -0.001998945139348507), (800, -0.0013902629725635052), (801, -0.0012765427818521857), (802, -0.00044295573025010526), (803, 0.0007719012210145593), (804, 0.0017552871722728014), (805, 0.0023345323279500008), (806, 0.0017793684964999557), (807, -0.00037229974986985326), (808, -0.00448018591850996), (809, -0.010284516960382462), (810, -0.016420815140008926), (811, -0.02218801900744438), (812, -0.027611559256911278), (813, -0.03208855912089348), (814, -0.03520728647708893), (815, -0.037873994559049606), (816, -0.04003028944134712), (817, -0.04125890135765076), (818, -0.04207589477300644), (819, -0.042390428483486176), (820, -0.04205762967467308), (821, -0.04291290044784546), (822, -0.041595008224248886)], ('rotation_euler', 1): [(1, 0.07690072059631348), (2, 0.07726658880710602), (3, 0.07735542207956314), (4, 0.07737211138010025), (5, 0.07719734311103821), (6, 0.07681942731142044), (7, 0.07630333304405212), (8, 0.07582175731658936), (9, 0.07556416839361191), (10, 0.07575783133506775), (11, 0.07622136175632477), (12, 0.07655593752861023), (13, 0.07672900706529617), (14, 0.07687807083129883), (15, 0.07733137160539627), (16, 0.07863892614841461), (17, 0.07903352379798889), (18, 0.08053135126829147), (19, 0.08239451050758362), (20, 0.08317194879055023), (21, 0.08223085850477219), (22, 0.0806058943271637), (23, 0.07924283295869827), (24, 0.0785323828458786), (25, 0.07810208946466446), (26, 0.07850389927625656), (27, 0.07845524698495865), (28, 0.07806620746850967), (29, 0.07709500938653946), (30, 0.07526014745235443), (31, 0.07312717288732529), (32, 0.07099400460720062), (33, 0.06917394697666168), (34, 0.06845684349536896), (35, 0.06934984028339386), (36, 0.07164180278778076), (37, 0.07435789704322815), (38, 0.07634046673774719), (39, 0.07718446850776672), (40, 0.07731420546770096), (41, 0.07752171158790588), (42, 0.07827688008546829), (43, 0.07875928282737732), (44, 0.07948958873748779), (45, 0.08085955679416656), (46, 0.08245670050382614), (47, 0.08422382175922394), (48, 0.08428779244422913), (49, 0.08159478008747101), (50, 0.07903289794921875), (51, 0.0782446563243866), (52, 0.07974446564912796), (53, 0.0791759341955185), (54, 0.08521755039691925), (55, 0.09201159328222275), (56, 0.09925741702318192), (57, 0.09569387882947922), (58, 0.09659641236066818), (59, 0.09508220106363297), (60, 0.09250710904598236), (61, 0.09101885557174683), (62, 0.0901719331741333), (63, 0.08817116171121597), (64, 0.0852239727973938), (65, 0.08270710706710815), (66, 0.08185286074876785), (67, 0.08287792652845383), (68, 0.08522718399763107), (69, 0.08738655596971512), (70, 0.08824866265058517), (71, 0.08770144730806351), (72, 0.08653905987739563), (73, 0.08546452224254608), (74, 0.0849146693944931), (75, 0.08477355539798737), (76, 0.08438635617494583), (77, 0.08339249342679977), (78, 0.0821957215666771), (79, 0.0819142609834671), (80, 0.08319979161024094), (81, 0.08541614562273026), (82, 0.08759716898202896), (83, 0.0891440138220787), (84, 0.08985494822263718), (85, 0.090092234313488), (86, 0.09056241810321808), (87, 0.0911947563290596), (88, 0.0914936289191246), (89, 0.09110048413276672), (90, 0.09017491340637207), (91, 0.08972576260566711), (92, 0.09045229107141495), (93, 0.09170042723417282), (94, 0.09271831810474396), (95, 0.0930032953619957), (96, 0.09275921434164047), (97, 0.09222976118326187), (98, 0.09133485704660416), (99, 0.09028816968202591), (100, 0.09009876102209091), (101, 0.09123633056879044), (102, 0.09268181025981903), (103, 0.09287853538990021), (104, 0.09121707081794739), (105, 0.08855146169662476), (106, 0.08688684552907944), (107, 0.08783938735723495), (108, 0.0900563970208168), (109, 0.09626179933547974), (110, 0.09070881456136703), (111, 0.09022556990385056), (112, 0.0885360985994339), (113, 0.08581235259771347), (114, 0.08560431748628616), (115, 0.08773045986890793), (116, 0.088874451816082), (117, 0.08814967423677444), (118, 0.08616281300783157), (119, 0.08415010571479797), (120, 0.08287632465362549), (121, 0.08226631581783295), (122, 0.08196157217025757), (123, 0.08157829940319061), (124, 0.08051779121160507), (125, 0.07863245159387589), (126, 0.07671455293893814), (127, 0.07536257803440094), (128, 0.07485587149858475), (129, 0.075147345662117), (130, 0.07583707571029663), (131, 0.07478971779346466), (132, 0.07346959412097931), (133, 0.07202019542455673), (134, 0.07044021040201187), (135, 0.06986482441425323), (136, 0.07087714970111847), (137, 0.07264552265405655), (138, 0.07416387647390366), (139, 0.07465733587741852), (140, 0.07405034452676773), (141, 0.07276419550180435), (142, 0.07152359187602997), (143, 0.07090539485216141), (144, 0.07116836309432983), (145, 0.07226750254631042), (146, 0.07364924997091293), (147, 0.07471924275159836), (148, 0.07533527910709381), (149, 0.07566433399915695), (150, 0.07591264694929123), (151, 0.07602116465568542), (152, 0.07602347433567047), (153, 0.07557043433189392), (154, 0.07471735775470734), (155, 0.0740516409277916), (156, 0.07376743108034134), (157, 0.07380858063697815), (158, 0.0736250951886177), (159, 0.07258255034685135), (160, 0.07071062922477722), (161, 0.06871365755796432), (162, 0.06751925498247147), (163, 0.06750389188528061), (164, 0.06800130754709244), (165, 0.06799086928367615), (166, 0.0671611949801445), (167, 0.06609155982732773), (168, 0.06564201414585114), (169, 0.06602868437767029), (170, 0.06683149188756943), (171, 0.06739050894975662), (172, 0.06725659966468811), (173, 0.06671745330095291), (174, 0.06632835417985916), (175, 0.06645295768976212), (176, 0.06718071550130844), (177, 0.06799142807722092), (178, 0.06814353913068771), (179, 0.06730153411626816), (180, 0.06578558683395386), (181, 0.0640912875533104), (182, 0.06264928728342056), (183, 0.06181954964995384), (184, 0.0618213452398777), (185, 0.06230328604578972), (186, 0.06273972988128662), (187, 0.0629655122756958), (188, 0.0631885975599289), (189, 0.06358995288610458), (190, 0.06421682238578796), (191, 0.06491942703723907), (192, 0.065467968583107), (193, 0.06576728075742722), (194, 0.0658814013004303), (195, 0.0659429207444191), (196, 0.06593713909387589), (197, 0.06577388197183609), (198, 0.06547684222459793), (199, 0.06482619792222977), (200, 0.06361337006092072), (201, 0.062020473182201385), (202, 0.06032212823629379), (203, 0.05861658602952957), (204, 0.05691405385732651), (205, 0.055442266166210175), (206, 0.05416514724493027), (207, 0.05264139920473099), (208, 0.05111730843782425), (209, 0.05004061013460159), (210, 0.04934575781226158), (211, 0.0493728443980217), (212, 0.04993828758597374), (213, 0.050134673714637756), (214, 0.04935441538691521), (215, 0.04796113818883896), (216, 0.04653390869498253), (217, 0.04552987217903137), (218, 0.04508553445339203), (219, 0.04486244544386864), (220, 0.0446200929582119), (221, 0.044485606253147125), (222, 0.04477324336767197), (223, 0.04555234685540199), (224, 0.04676808789372444), (225, 0.04834035038948059), (226, 0.050060857087373734), (227, 0.052042268216609955), (228, 0.05250086635351181), (229, 0.05449870601296425), (230, 0.05743999779224396), (231, 0.060422468930482864), (232, 0.06271339952945709), (233, 0.0640396699309349), (234, 0.06488750874996185), (235, 0.06596057116985321), (236, 0.06761851161718369), (237, 0.06977439671754837), (238, 0.07133491337299347), (239, 0.07352147996425629), (240, 0.07082764059305191), (241, 0.06890609860420227), (242, 0.06713107228279114), (243, 0.06609437614679337), (244, 0.06668927520513535), (245, 0.06839392334222794), (246, 0.06952818483114243), (247, 0.0695117712020874), (248, 0.06885411590337753), (249, 0.06848043948411942), (250, 0.06874041259288788), (251, 0.06911180913448334), (252, 0.06877541542053223), (253, 0.06724546104669571), (254, 0.0648125633597374), (255, 0.06186366081237793), (256, 0.05826264247298241), (257, 0.053146667778491974), (258, 0.04740414023399353), (259, 0.042548391968011856), (260, 0.03944558650255203), (261, 0.039894938468933105), (262, 0.04391065612435341), (263, 0.04675527662038803), (264, 0.04898554086685181), (265, 0.052189022302627563), (266, 0.05232081934809685), (267, 0.0501253604888916), (268, 0.04585685208439827), (269, 0.040925364941358566), (270, 0.037075117230415344), (271, 0.03422291949391365), (272, 0.03200344368815422), (273, 0.030206866562366486), (274, 0.027267826721072197), (275, 0.02269641123712063), (276, 0.018015293404459953), (277, 0.014336635358631611), (278, 0.01395250204950571), (279, 0.017301572486758232), (280, 0.022479919716715813), (281, 0.027967389672994614), (282, 0.02740546315908432), (283, 0.030557993799448013), (284, 0.03175285458564758), (285, 0.03181333839893341), (286, 0.03166783228516579), (287, 0.03138517215847969), (288, 0.030217180028557777), (289, 0.027892334386706352), (290, 0.025263730436563492), (291, 0.022750796750187874), (292, 0.02045508846640587), (293, 0.01878940686583519), (294, 0.01764569617807865), (295, 0.016313346102833748), (296, 0.013699356466531754), (297, 0.009155329316854477), (298, 0.004458567127585411), (299, 0.0014414381003007293), (300, 0.001044598175212741), (301, 0.004726475570350885), (302, 0.006942227948457003), (303, 0.011767814867198467), (304, 0.018539492040872574), (305, 0.024119839072227478), (306, 0.022184882313013077), (307, 0.02284965291619301), (308, 0.021796269342303276), (309, 0.020374031737446785), (310, 0.020828939974308014), (311, 0.02379710227251053), (312, 0.025926316156983376), (313, 0.027789611369371414), (314, 0.031241847202181816), (315, 0.033336542546749115), (316, 0.034016698598861694), (317, 0.033726949244737625), (318, 0.033183902502059937), (319, 0.0333763025701046), (320, 0.035235483199357986), (321, 0.0402567982673645), (322, 0.048057641834020615), (323, 0.051421791315078735), (324, 0.05763212963938713), (325, 0.06505286693572998), (326, 0.07181049883365631), (327, 0.06680858880281448), (328, 0.06451643258333206), (329, 0.062313422560691833), (330, 0.0634189248085022), (331, 0.05880213528871536), (332, 0.07294850051403046), (333, 0.0769505426287651), (334, 0.09143110364675522), (335, 0.10041389614343643), (336, 0.11308314651250839), (337, 0.12344294041395187), (338, 0.12729723751544952), (339, 0.12448619306087494), (340, 0.11959651112556458), (341, 0.10850025713443756), (342, 0.09253536909818649), (343, 0.0750882476568222), (344, 0.06795927882194519), (345, 0.0667312741279602), (346, 0.06267792731523514), (347, 0.055401112884283066), (348, 0.047447722405195236), (349, 0.040755495429039), (350, 0.037563879042863846), (351, 0.039060357958078384), (352, 0.04437115043401718), (353, 0.04786669462919235), (354, 0.05026809126138687), (355, 0.05509775131940842), (356, 0.05762186273932457), (357, 0.05686802789568901), (358, 0.05323817580938339), (359, 0.048763226717710495), (360, 0.04451993107795715), (361, 0.04109523445367813), (362, 0.039374444633722305), (363, 0.0384504459798336), (364, 0.03697313740849495), (365, 0.03497612476348877), (366, 0.033540017902851105), (367, 0.033873364329338074), (368, 0.0367429181933403), (369, 0.0421040840446949), (370, 0.045849401503801346), (371, 0.04870036989450455), (372, 0.054597314447164536), (373, 0.05822836980223656), (374, 0.0590997189283371), (375, 0.057408448308706284), (376, 0.05391967296600342), (377, 0.05011501535773277), (378, 0.046884242445230484), (379, 0.04476848989725113), (380, 0.04402846470475197), (381, 0.044125404208898544), (382, 0.04439716041088104), (383, 0.04433745890855789), (384, 0.04359922930598259), (385, 0.04209575802087784), (386, 0.03991657868027687), (387, 0.03720204532146454), (388, 0.034166060388088226), (389, 0.03144514188170433), (390, 0.029741616919636726), (391, 0.02945917658507824), (392, 0.030676469206809998), (393, 0.03308570012450218), (394, 0.03587741032242775), (395, 0.03807291388511658), (396, 0.03882654383778572), (397, 0.03707247972488403), (398, 0.03270426392555237), (399, 0.027325903996825218), (400, 0.021964889019727707), (401, 0.01786603406071663), (402, 0.016585569828748703), (403, 0.01778520457446575), (404, 0.020316537469625473), (405, 0.023338908329606056), (406, 0.025306830182671547), (407, 0.02600172348320484), (408, 0.027073970064520836), (409, 0.02622414194047451), (410, 0.024569984525442123), (411, 0.022863034158945084), (412, 0.021634787321090698), (413, 0.02199837937951088), (414, 0.02398763783276081), (415, 0.02511417493224144), (416, 0.026954591274261475), (417, 0.03044658713042736), (418, 0.033962126821279526), (419, 0.03693506866693497), (420, 0.03861258178949356), (421, 0.038278233259916306), (422, 0.03555108979344368), (423, 0.031430434435606), (424, 0.02792096883058548), (425, 0.025811685249209404), (426, 0.02591124176979065), (427, 0.02637721411883831), (428, 0.028412191197276115), (429, 0.03162666782736778), (430, 0.034076426178216934), (431, 0.0349498949944973), (432, 0.033430345356464386), (433, 0.029577018693089485), (434, 0.025106672197580338), (435, 0.020985586568713188), (436, 0.018130751326680183), (437, 0.017864307388663292), (438, 0.01988282799720764), (439, 0.023150868713855743), (440, 0.025011608377099037), (441, 0.0269806869328022), (442, 0.030471593141555786), (443, 0.03313224017620087), (444, 0.03469579666852951), (445, 0.03531576320528984), (446, 0.03537030890583992), (447, 0.03527877852320671), (448, 0.03523934632539749), (449, 0.0350860059261322), (450, 0.034502625465393066), (451, 0.03336571156978607), (452, 0.031863030046224594), (453, 0.030460277572274208), (454, 0.029815278947353363), (455, 0.030421961098909378), (456, 0.03237070143222809), (457, 0.035285063087940216), (458, 0.03850068151950836), (459, 0.04129756614565849), (460, 0.04318362474441528), (461, 0.04395037144422531), (462, 0.0436873584985733), (463, 0.042748719453811646), (464, 0.04146132245659828), (465, 0.03992420434951782), (466, 0.03811982646584511), (467, 0.03597702085971832), (468, 0.032953131943941116), (469, 0.028932509943842888), (470, 0.025083983317017555), (471, 0.022048337385058403), (472, 0.02012694627046585), (473, 0.019989382475614548), (474, 0.021365342661738396), (475, 0.023704893887043), (476, 0.02468271739780903), (477, 0.026683077216148376), (478, 0.029618846252560616), (479, 0.031478360295295715), (480, 0.03204122558236122), (481, 0.03198731318116188), (482, 0.03231404721736908), (483, 0.03451814875006676), (484, 0.03981168568134308), (485, 0.04750107228755951), (486, 0.05155389755964279), (487, 0.05595475435256958), (488, 0.06255535781383514), (489, 0.06748790293931961), (490, 0.06547125428915024), (491, 0.0649230107665062), (492, 0.062154632061719894), (493, 0.05814438685774803), (494, 0.05481398105621338), (495, 0.052942898124456406), (496, 0.05189920589327812), (497, 0.05075721815228462), (498, 0.04849899932742119), (499, 0.045210100710392), (500, 0.04109432175755501), (501, 0.03584953024983406), (502, 0.030530331656336784), (503, 0.026672421023249626), (504, 0.024735096842050552), (505, 0.02525920607149601), (506, 0.024975089356303215), (507, 0.028803976252675056), (508, 0.03462233021855354), (509, 0.04093595966696739), (510, 0.045021310448646545), (511, 0.046239279210567474), (512, 0.048823654651641846), (513, 0.04756545275449753), (514, 0.04360605776309967), (515, 0.03780655562877655), (516, 0.03165518119931221), (517, 0.02770918793976307), (518, 0.024771831929683685), (519, 0.02589377574622631), (520, 0.02566179819405079), (521, 0.02651708386838436), (522, 0.027335496619343758), (523, 0.027691492810845375), (524, 0.02767317183315754), (525, 0.027497392147779465), (526, 0.02727450430393219), (527, 0.027009397745132446), (528, 0.026700321584939957), (529, 0.02642553672194481), (530, 0.02634827420115471), (531, 0.026562923565506935), (532, 0.02718183398246765), (533, 0.028028126806020737), (534, 0.02859550528228283), (535, 0.028649387881159782), (536, 0.02811427041888237), (537, 0.02702818438410759), (538, 0.025782564654946327), (539, 0.02472352422773838), (540, 0.023983752354979515), (541, 0.023560142144560814), (542, 0.023370392620563507), (543, 0.023433489724993706), (544, 0.023964595049619675), (545, 0.02495565079152584), (546, 0.0261508971452713), (547, 0.027223413810133934), (548, 0.02779756300151348), (549, 0.02764386683702469), (550, 0.026836110278964043), (551, 0.025733958929777145), (552, 0.024828534573316574), (553, 0.02450619451701641), (554, 0.025011952966451645), (555, 0.026365475729107857), (556, 0.02839273028075695), (557, 0.030773622915148735), (558, 0.0331774577498436), (559, 0.03531559929251671), (560, 0.036904431879520416), (561, 0.03774070739746094), (562, 0.03782572224736214), (563, 0.03744058310985565), (564, 0.037131067365407944), (565, 0.03734889253973961), (566, 0.038295917212963104), (567, 0.03976794332265854), (568, 0.04105589911341667), (569, 0.04137306660413742), (570, 0.040242135524749756), (571, 0.03769901394844055), (572, 0.03388207405805588), (573, 0.029823318123817444), (574, 0.027073852717876434), (575, 0.02588726580142975), (576, 0.0244942344725132), (577, 0.026469575241208076), (578, 0.028979085385799408), (579, 0.03244011104106903), (580, 0.03572547063231468), (581, 0.03835131973028183), (582, 0.039780184626579285), (583, 0.03980525955557823), (584, 0.03859787806868553), (585, 0.036581795662641525), (586, 0.03433428332209587), (587, 0.03230910003185272), (588, 0.0309742484241724), (589, 0.03023814782500267), (590, 0.029771465808153152), (591, 0.02927369996905327), (592, 0.028020426630973816), (593, 0.025436924770474434), (594, 0.022181328386068344), (595, 0.018819667398929596), (596, 0.015583950094878674), (597, 0.01329820603132248), (598, 0.012180814519524574), (599, 0.0118806017562747), (600, 0.012338616885244846), (601, 0.013514427468180656), (602, 0.01515056099742651), (603, 0.01691538840532303), (604, 0.01821248047053814), (605, 0.0189646165817976), (606, 0.019139645621180534), (607, 0.019356632605195045), (608, 0.02000012807548046), (609, 0.021527322009205818), (610, 0.02203221060335636), (611, 0.02419459819793701), (612, 0.027238842099905014), (613, 0.03035740740597248), (614, 0.03328651562333107), (615, 0.03606460243463516), (616, 0.0392117016017437), (617, 0.0431891493499279), (618, 0.04499080777168274), (619, 0.04793185368180275), (620, 0.052824947983026505), (621, 0.05702048912644386), (622, 0.05975393205881119), (623, 0.06066710129380226), (624, 0.060255296528339386), (625, 0.05948196351528168), (626, 0.059283532202243805), (627, 0.060371845960617065), (628, 0.06293230503797531), (629, 0.06663323193788528), (630, 0.06874909996986389), (631, 0.07064532488584518), (632, 0.0735986977815628), (633, 0.07421082258224487), (634, 0.07201335579156876), (635, 0.06809917837381363), (636, 0.06348604708909988), (637, 0.059337593615055084), (638, 0.05694789066910744), (639, 0.05595792457461357), (640, 0.05532180890440941), (641, 0.05457157641649246), (642, 0.053392454981803894), (643, 0.05175469070672989), (644, 0.04956112429499626), (645, 0.04629068076610565), (646, 0.04243430867791176), (647, 0.03812282532453537), (648, 0.03389117866754532), (649, 0.030809493735432625), (650, 0.029171651229262352), (651, 0.02834000065922737), (652, 0.027500348165631294), (653, 0.02518634684383869), (654, 0.021600225940346718), (655, 0.016998007893562317), (656, 0.012064656242728233), (657, 0.008618127554655075), (658, 0.007590502500534058), (659, 0.00858663022518158), (660, 0.011343227699398994), (661, 0.014990895055234432), (662, 0.01886492595076561), (663, 0.020891228690743446), (664, 0.022635385394096375), (665, 0.02669287845492363), (666, 0.03089088760316372), (667, 0.03472426161170006), (668, 0.03775578737258911), (669, 0.039535533636808395), (670, 0.0398557111620903), (671, 0.039021749049425125), (672, 0.0375484824180603), (673, 0.03595258668065071), (674, 0.034573428332805634), (675, 0.03392302244901657), (676, 0.0342702753841877), (677, 0.0359666645526886), (678, 0.03889622539281845), (679, 0.04248726740479469), (680, 0.044686511158943176), (681, 0.0462321862578392), (682, 0.04922914505004883), (683, 0.05117432028055191), (684, 0.05239934101700783), (685, 0.053124137222766876), (686, 0.05366317555308342), (687, 0.0541863776743412), (688, 0.05449069291353226), (689, 0.05419677123427391), (690, 0.05306665226817131), (691, 0.05066227167844772), (692, 0.04707029461860657), (693, 0.0435212068259716), (694, 0.04068935289978981), (695, 0.038868505507707596), (696, 0.03849704936146736), (697, 0.039097078144550323), (698, 0.039744481444358826), (699, 0.03993041440844536), (700, 0.039507701992988586), (701, 0.0383308082818985), (702, 0.03615263104438782), (703, 0.03228526934981346), (704, 0.027013426646590233), (705, 0.021900571882724762), (706, 0.017369261011481285), (707, 0.014366521500051022), (708, 0.01396032702177763), (709, 0.015401401557028294), (710, 0.017893724143505096), (711, 0.020850054919719696), (712, 0.022284524515271187), (713, 0.023875022307038307), (714, 0.026676131412386894), (715, 0.029151437804102898), (716, 0.03126426413655281), (717, 0.033217962831258774), (718, 0.03512032702565193), (719, 0.036939915269613266), (720, 0.03855965659022331), (721, 0.039699070155620575), (722, 0.0401802584528923), (723, 0.040195465087890625), (724, 0.04010393097996712), (725, 0.04028989002108574), (726, 0.04116060212254524), (727, 0.0428486093878746), (728, 0.043694257736206055), (729, 0.04498957097530365), (730, 0.04738801717758179), (731, 0.04966993257403374), (732, 0.05176670476794243), (733, 0.05367536470293999), (734, 0.05543461814522743), (735, 0.057102371007204056), (736, 0.0586513876914978), (737, 0.06000564619898796), (738, 0.0610298253595829), (739, 0.06157205253839493), (740, 0.061511244624853134), (741, 0.060807809233665466), (742, 0.059653639793395996), (743, 0.0583968460559845), (744, 0.05742878094315529), (745, 0.05712990462779999), (746, 0.057628802955150604), (747, 0.05870113521814346), (748, 0.059919316321611404), (749, 0.06083596125245094), (750, 0.06101095676422119), (751, 0.0601385161280632), (752, 0.058190807700157166), (753, 0.054508596658706665), (754, 0.04856518656015396), (755, 0.04119601473212242), (756, 0.033176444470882416), (757, 0.02549685537815094), (758, 0.0192464180290699), (759, 0.014398978091776371), (760, 0.010514384135603905), (761, 0.00723067345097661), (762, 0.004692125134170055), (763, 0.0034431791864335537), (764, 0.0035806121304631233), (765, 0.004475747235119343), (766, 0.00518130324780941), (767, 0.004450764507055283), (768, 0.0017139333067461848), (769, -0.0018094830447807908), (770, -0.00527068180963397), (771, -0.00787543784826994), (772, -0.008670066483318806), (773, -0.00821719504892826), (774, -0.007524593733251095), (775, -0.00742546608671546), (776, -0.007907134480774403), (777, -0.009341234341263771), (778, -0.011512848548591137), (779, -0.013935647904872894), (780, -0.016310907900333405), (781, -0.018655985593795776), (782, -0.020711423829197884), (783, -0.022647151723504066), (784, -0.024541739374399185), (785, -0.02627693861722946), (786, -0.028097614645957947), (787, -0.029919596388936043), (788, -0.031790707260370255), (789, -0.03388746455311775), (790, -0.03650948777794838), (791, -0.039249569177627563), (792, -0.04165162146091461), (793, -0.04294075816869736), (794, -0.04254692420363426), (795, -0.040360014885663986), (796, -0.036596544086933136), (797, -0.031068233773112297), (798, -0.028493741527199745), (799, -0.023987464606761932), (800, -0.015316881239414215), (801, -0.004988834261894226), (802, -0.0005620227311737835), (803, 0.0059045301750302315), (804, 0.016486961394548416), (805, 0.02185617759823799), (806, 0.025585614144802094), (807, 0.03270406275987625), (808, 0.03808113560080528), (809, 0.04049742594361305), (810, 0.04208347201347351), (811, 0.04525128751993179), (812, 0.047774702310562134), (813, 0.04989686980843544), (814, 0.0518474318087101), (815, 0.053911466151475906), (816, 0.05667863413691521), (817, 0.06039329618215561), (818, 0.06237921863794327), (819, 0.06477855145931244), (820, 0.06916674226522446), (821, 0.07269841432571411), (822, 0.07678423821926117)], ('rotation_euler', 2): [(1, 3.1269450187683105), (2, 3.1263322830200195), (3, 3.1263234615325928), (4, 3.126265048980713), (5, 3.1270906925201416), (6, 3.1281042098999023), (7, 3.1288795471191406), (8, 3.1292905807495117), (9, 3.1304595470428467), (10, 3.1315441131591797), (11, 3.1320996284484863), (12, 3.1325881481170654), (13, 3.1334621906280518), (14, 3.134279251098633), (15, 3.135253429412842), (16, 3.135530471801758), (17, 3.1363866329193115), (18, 3.1373093128204346), (19, 3.1383109092712402), (20, 3.1379928588867188), (21, 3.1383121013641357), (22, 3.1383721828460693), (23, 3.1382839679718018), (24, 3.1382675170898438), (25, 3.138457775115967), (26, 3.1390151977539062), (27, 3.1394660472869873), (28, 3.1393918991088867), (29, 3.138827323913574), (30, 3.138219118118286), (31, 3.137570858001709), (32, 3.136876344680786), (33, 3.136500835418701), (34, 3.1364586353302), (35, 3.136639356613159), (36, 3.1370975971221924), (37, 3.1372735500335693), (38, 3.137697219848633), (39, 3.137787342071533), (40, 3.1376326084136963), (41, 3.137225866317749), (42, 3.136613368988037), (43, 3.1361842155456543), (44, 3.136033535003662), (45, 3.1359424591064453), (46, 3.1357996463775635), (47, 3.135690927505493), (48, 3.1355998516082764), (49, 3.135396957397461), (50, 3.1352896690368652), (51, 3.135659694671631), (52, 3.13690185546875), (53, 3.1389734745025635), (54, 3.139662742614746), (55, 3.140963315963745), (56, 3.142882823944092), (57, 3.1444344520568848), (58, 3.1454150676727295), (59, 3.147488594055176), (60, 3.1471941471099854), (61, 3.1481850147247314), (62, 3.148681640625), (63, 3.1492486000061035), (64, 3.1501083374023438), (65, 3.1506738662719727), (66, 3.1509997844696045), (67, 3.152503252029419), (68, 3.151808023452759), (69, 3.1518139839172363), (70, 3.151158571243286), (71, 3.1501593589782715), (72, 3.1491332054138184), (73, 3.148139238357544), (74, 3.14721417427063), (75, 3.146273374557495), (76, 3.1454150676727295), (77, 3.145022392272949), (78, 3.1450722217559814), (79, 3.1453542709350586), (80, 3.145737409591675), (81, 3.1461308002471924), (82, 3.146519899368286), (83, 3.14686918258667), (84, 3.146697521209717), (85, 3.1463828086853027), (86, 3.14505934715271), (87, 3.143930435180664), (88, 3.142056941986084), (89, 3.139702558517456), (90, 3.1385297775268555), (91, 3.137946367263794), (92, 3.1370697021484375), (93, 3.137429714202881), (94, 3.136242389678955), (95, 3.1355509757995605), (96, 3.134622097015381), (97, 3.1334075927734375), (98, 3.132478713989258), (99, 3.1320393085479736), (100, 3.1317083835601807), (101, 3.130983829498291), (102, 3.130293846130371), (103, 3.130298376083374), (104, 3.129798412322998), (105, 3.129254102706909), (106, 3.1282362937927246), (107, 3.1289138793945312), (108, 3.1281816959381104), (109, 3.1290488243103027), (110, 3.127286672592163), (111, 3.1288976669311523), (112, 3.1293609142303467), (113, 3.129704475402832), (114, 3.131206750869751), (115, 3.131411552429199), (116, 3.1324448585510254), (117, 3.1327106952667236), (118, 3.132629632949829), (119, 3.1326587200164795), (120, 3.1328697204589844), (121, 3.133115291595459), (122, 3.1332833766937256), (123, 3.133388042449951), (124, 3.1334433555603027), (125, 3.133486747741699), (126, 3.1338069438934326), (127, 3.1340391635894775), (128, 3.1349141597747803), (129, 3.136667490005493), (130, 3.137277364730835), (131, 3.138392925262451), (132, 3.139626979827881), (133, 3.1401617527008057), (134, 3.1416983604431152), (135, 3.1424503326416016), (136, 3.1428589820861816), (137, 3.1440629959106445), (138, 3.1452488899230957), (139, 3.145700216293335), (140, 3.146437644958496), (141, 3.1476898193359375), (142, 3.1483314037323), (143, 3.1487181186676025), (144, 3.149515151977539), (145, 3.15004563331604), (146, 3.1501779556274414), (147, 3.150001287460327), (148, 3.149958848953247), (149, 3.1502861976623535), (150, 3.150834321975708), (151, 3.151196241378784), (152, 3.1513850688934326), (153, 3.1517560482025146), (154, 3.1518046855926514), (155, 3.1514599323272705), (156, 3.1508114337921143), (157, 3.149977207183838), (158, 3.1490418910980225), (159, 3.1481101512908936), (160, 3.1472253799438477), (161, 3.1466825008392334), (162, 3.146646499633789), (163, 3.146787166595459), (164, 3.146759510040283), (165, 3.1465036869049072), (166, 3.14607310295105), (167, 3.14548921585083), (168, 3.1447510719299316), (169, 3.144031047821045), (170, 3.1434733867645264), (171, 3.143000841140747), (172, 3.142875909805298), (173, 3.143249034881592), (174, 3.143887996673584), (175, 3.144411325454712), (176, 3.1447269916534424), (177, 3.145636558532715), (178, 3.1465561389923096), (179, 3.147522211074829), (180, 3.147860050201416), (181, 3.14843487739563), (182, 3.149338483810425), (183, 3.150010108947754), (184, 3.1500120162963867), (185, 3.1504533290863037), (186, 3.150545358657837), (187, 3.150408983230591), (188, 3.1503021717071533), (189, 3.15035343170166), (190, 3.1505255699157715), (191, 3.1507463455200195), (192, 3.1510121822357178), (193, 3.15124773979187), (194, 3.1514077186584473), (195, 3.151596784591675), (196, 3.151817798614502), (197, 3.152036428451538), (198, 3.152296304702759), (199, 3.1525790691375732), (200, 3.1526169776916504), (201, 3.1527953147888184), (202, 3.1531553268432617), (203, 3.153491258621216), (204, 3.1537230014801025), (205, 3.153770923614502), (206, 3.1534392833709717), (207, 3.1529760360717773), (208, 3.1527631282806396), (209, 3.15214467048645), (210, 3.1526076793670654), (211, 3.1527488231658936), (212, 3.153247594833374), (213, 3.1537435054779053), (214, 3.154106616973877), (215, 3.1544246673583984), (216, 3.1545886993408203), (217, 3.154630184173584), (218, 3.154860734939575), (219, 3.1549835205078125), (220, 3.1548240184783936), (221, 3.1538219451904297), (222, 3.15218448638916), (223, 3.150811195373535), (224, 3.149623394012451), (225, 3.14894700050354), (226, 3.1490159034729004), (227, 3.1494431495666504), (228, 3.150198459625244), (229, 3.15102219581604), (230, 3.1519696712493896), (231, 3.152327537536621), (232, 3.153188705444336), (233, 3.154273509979248), (234, 3.155057907104492), (235, 3.1553943157196045), (236, 3.1564037799835205), (237, 3.1572659015655518), (238, 3.1578152179718018), (239, 3.158050775527954), (240, 3.1577062606811523), (241, 3.157257080078125), (242, 3.1567041873931885), (243, 3.156200885772705), (244, 3.1559898853302), (245, 3.15602707862854), (246, 3.1560983657836914), (247, 3.155902624130249), (248, 3.155236005783081), (249, 3.1545073986053467), (250, 3.1540825366973877), (251, 3.154029130935669), (252, 3.154015302658081), (253, 3.154536485671997), (254, 3.153336763381958), (255, 3.152773380279541), (256, 3.1521060466766357), (257, 3.150921106338501), (258, 3.1502151489257812), (259, 3.1500356197357178), (260, 3.149930000305176), (261, 3.150160789489746), (262, 3.1509180068969727), (263, 3.151285171508789), (264, 3.1522092819213867), (265, 3.153747081756592), (266, 3.154557704925537), (267, 3.155156373977661), (268, 3.1565628051757812), (269, 3.1569459438323975), (270, 3.157876968383789), (271, 3.1588118076324463), (272, 3.159850835800171), (273, 3.161163091659546), (274, 3.1622214317321777), (275, 3.163356065750122), (276, 3.1636765003204346), (277, 3.1653974056243896), (278, 3.1640982627868652), (279, 3.164215326309204), (280, 3.163778305053711), (281, 3.162885904312134), (282, 3.16226863861084), (283, 3.1624951362609863), (284, 3.1626906394958496), (285, 3.1628153324127197), (286, 3.1629834175109863), (287, 3.1633358001708984), (288, 3.1637558937072754), (289, 3.164041757583618), (290, 3.1638855934143066), (291, 3.1641550064086914), (292, 3.1646828651428223), (293, 3.1655187606811523), (294, 3.165539503097534), (295, 3.1655852794647217), (296, 3.1642544269561768), (297, 3.1622705459594727), (298, 3.1594431400299072), (299, 3.1562511920928955), (300, 3.15470290184021), (301, 3.1547107696533203), (302, 3.15461802482605), (303, 3.155550718307495), (304, 3.1569013595581055), (305, 3.157958507537842), (306, 3.1581945419311523), (307, 3.1593215465545654), (308, 3.160346746444702), (309, 3.1607425212860107), (310, 3.1613705158233643), (311, 3.1627955436706543), (312, 3.163727283477783), (313, 3.164628028869629), (314, 3.1666603088378906), (315, 3.167628526687622), (316, 3.168738603591919), (317, 3.169614553451538), (318, 3.1688318252563477), (319, 3.167245864868164), (320, 3.169475555419922), (321, 3.16379714012146), (322, 3.1581978797912598), (323, 3.1537086963653564), (324, 3.1495909690856934), (325, 3.146979331970215), (326, 3.146752119064331), (327, 3.1455206871032715), (328, 3.144319772720337), (329, 3.143268585205078), (330, 3.1426095962524414), (331, 3.142118453979492), (332, 3.1439125537872314), (333, 3.144099712371826), (334, 3.1479673385620117), (335, 3.148556709289551), (336, 3.1493327617645264), (337, 3.150031089782715), (338, 3.153179168701172), (339, 3.1536831855773926), (340, 3.15205979347229), (341, 3.1483571529388428), (342, 3.1497251987457275), (343, 3.1480371952056885), (344, 3.1483001708984375), (345, 3.1539793014526367), (346, 3.1549320220947266), (347, 3.1526598930358887), (348, 3.152238607406616), (349, 3.1522393226623535), (350, 3.147552013397217), (351, 3.149164915084839), (352, 3.146697759628296), (353, 3.147625684738159), (354, 3.1482927799224854), (355, 3.1493780612945557), (356, 3.149930238723755), (357, 3.1506757736206055), (358, 3.1517531871795654), (359, 3.1524085998535156), (360, 3.152130126953125), (361, 3.1519100666046143), (362, 3.1506245136260986), (363, 3.148587465286255), (364, 3.146402597427368), (365, 3.144486665725708), (366, 3.143284559249878), (367, 3.143010139465332), (368, 3.1433162689208984), (369, 3.1438405513763428), (370, 3.144216537475586), (371, 3.144411087036133), (372, 3.1445887088775635), (373, 3.1445887088775635), (374, 3.144545555114746), (375, 3.144158124923706), (376, 3.144183874130249), (377, 3.1439945697784424), (378, 3.1439409255981445), (379, 3.143871545791626), (380, 3.1437673568725586), (381, 3.143730878829956), (382, 3.143883228302002), (383, 3.1442363262176514), (384, 3.1447460651397705), (385, 3.145371198654175), (386, 3.1457760334014893), (387, 3.145843029022217), (388, 3.1463241577148438), (389, 3.146644353866577), (390, 3.146853446960449), (391, 3.1470446586608887), (392, 3.147294521331787), (393, 3.147679567337036), (394, 3.148247003555298), (395, 3.1484882831573486), (396, 3.1489973068237305), (397, 3.1496098041534424), (398, 3.1501247882843018), (399, 3.150491714477539), (400, 3.1505374908447266), (401, 3.1504030227661133), (402, 3.1504263877868652), (403, 3.150200128555298), (404, 3.149714708328247), (405, 3.148909568786621), (406, 3.148007392883301), (407, 3.1473445892333984), (408, 3.1470913887023926), (409, 3.1471874713897705), (410, 3.147254705429077), (411, 3.147526741027832), (412, 3.148158073425293), (413, 3.1488242149353027), (414, 3.149399518966675), (415, 3.1496407985687256), (416, 3.149475574493408), (417, 3.1491074562072754), (418, 3.1487863063812256), (419, 3.148576021194458), (420, 3.148206949234009), (421, 3.148522138595581), (422, 3.148510456085205), (423, 3.1483635902404785), (424, 3.1479170322418213), (425, 3.1473190784454346), (426, 3.146765947341919), (427, 3.1462323665618896), (428, 3.145838975906372), (429, 3.1455447673797607), (430, 3.145373821258545), (431, 3.145294189453125), (432, 3.1448376178741455), (433, 3.1449923515319824), (434, 3.144927978515625), (435, 3.1447510719299316), (436, 3.1436173915863037), (437, 3.1416118144989014), (438, 3.1396305561065674), (439, 3.137556314468384), (440, 3.1356515884399414), (441, 3.134735345840454), (442, 3.1342735290527344), (443, 3.1336567401885986), (444, 3.1330764293670654), (445, 3.1325924396514893), (446, 3.1322226524353027), (447, 3.132037878036499), (448, 3.1319637298583984), (449, 3.131939649581909), (450, 3.13197660446167), (451, 3.132075548171997), (452, 3.132284641265869), (453, 3.1325039863586426), (454, 3.132615327835083), (455, 3.1331005096435547), (456, 3.1335036754608154), (457, 3.1337642669677734), (458, 3.1338202953338623), (459, 3.13370418548584), (460, 3.133513927459717), (461, 3.1333203315734863), (462, 3.133272171020508), (463, 3.1335065364837646), (464, 3.1340115070343018), (465, 3.1347129344940186), (466, 3.1350550651550293), (467, 3.1353890895843506), (468, 3.1361327171325684), (469, 3.136742353439331), (470, 3.1371917724609375), (471, 3.1372873783111572), (472, 3.1372852325439453), (473, 3.1373307704925537), (474, 3.13727068901062), (475, 3.1371452808380127), (476, 3.1370487213134766), (477, 3.1375913619995117), (478, 3.1377806663513184), (479, 3.1390433311462402), (480, 3.1407556533813477), (481, 3.1415646076202393), (482, 3.1424810886383057), (483, 3.1439719200134277), (484, 3.143991470336914), (485, 3.144401788711548), (486, 3.143444061279297), (487, 3.1417672634124756), (488, 3.1402385234832764), (489, 3.1390504837036133), (490, 3.137798309326172), (491, 3.1367363929748535), (492, 3.135560989379883), (493, 3.1342544555664062), (494, 3.1330857276916504), (495, 3.132535457611084), (496, 3.1325628757476807), (497, 3.132638692855835), (498, 3.132749080657959), (499, 3.1330666542053223), (500, 3.1333529949188232), (501, 3.1335628032684326), (502, 3.133786678314209), (503, 3.1342358589172363), (504, 3.1344106197357178), (505, 3.1350510120391846), (506, 3.136260986328125), (507, 3.137089252471924), (508, 3.138500690460205), (509, 3.1410083770751953), (510, 3.142080783843994), (511, 3.1438119411468506), (512, 3.1450958251953125), (513, 3.1465537548065186), (514, 3.1475977897644043), (515, 3.148542642593384), (516, 3.149538516998291), (517, 3.150156259536743), (518, 3.151329278945923), (519, 3.1517059803009033), (520, 3.1526482105255127), (521, 3.1529042720794678), (522, 3.1526222229003906), (523, 3.152116537094116), (524, 3.151636838912964), (525, 3.1515510082244873), (526, 3.1520144939422607), (527, 3.152219295501709), (528, 3.1529316902160645), (529, 3.154332160949707), (530, 3.155024528503418), (531, 3.156123638153076), (532, 3.157243013381958), (533, 3.158148765563965), (534, 3.160031318664551), (535, 3.1611766815185547), (536, 3.161550998687744), (537, 3.1626226902008057), (538, 3.1633124351501465), (539, 3.1635208129882812), (540, 3.163761615753174), (541, 3.1642463207244873), (542, 3.164729356765747), (543, 3.1650784015655518), (544, 3.1651909351348877), (545, 3.1650662422180176), (546, 3.164684772491455), (547, 3.164043664932251), (548, 3.16326904296875), (549, 3.1624746322631836), (550, 3.161651372909546), (551, 3.16096568107605), (552, 3.1606385707855225), (553, 3.1606624126434326), (554, 3.1606462001800537), (555, 3.1611013412475586), (556, 3.161839246749878), (557, 3.162787675857544), (558, 3.163372755050659), (559, 3.16384220123291), (560, 3.1641182899475098), (561, 3.162771463394165), (562, 3.15964937210083), (563, 3.155872106552124), (564, 3.1520779132843018), (565, 3.1489124298095703), (566, 3.1473259925842285), (567, 3.146458387374878), (568, 3.1453635692596436), (569, 3.1442384719848633), (570, 3.1430039405822754), (571, 3.1404402256011963), (572, 3.136108636856079), (573, 3.131889820098877), (574, 3.1276776790618896), (575, 3.1236398220062256), (576, 3.1221749782562256), (577, 3.1230111122131348), (578, 3.1246016025543213), (579, 3.1253561973571777), (580, 3.12709379196167), (581, 3.1282105445861816), (582, 3.1297707557678223), (583, 3.1309893131256104), (584, 3.1320126056671143), (585, 3.1333258152008057), (586, 3.1335511207580566), (587, 3.1345436573028564), (588, 3.1349549293518066), (589, 3.135026454925537), (590, 3.1351099014282227), (591, 3.1355113983154297), (592, 3.1361870765686035), (593, 3.1363933086395264), (594, 3.1366665363311768), (595, 3.1371207237243652), (596, 3.1371822357177734), (597, 3.1367757320404053), (598, 3.136096715927124), (599, 3.1353938579559326), (600, 3.1347856521606445), (601, 3.134511709213257), (602, 3.1347250938415527), (603, 3.133852481842041), (604, 3.1344680786132812), (605, 3.1328184604644775), (606, 3.1313393115997314), (607, 3.128425121307373), (608, 3.1270103454589844), (609, 3.127135753631592), (610, 3.126084804534912), (611, 3.1253325939178467), (612, 3.1258490085601807), (613, 3.126174211502075), (614, 3.126514196395874), (615, 3.1269683837890625), (616, 3.1272592544555664), (617, 3.127669095993042), (618, 3.1279923915863037), (619, 3.128279685974121), (620, 3.128633737564087), (621, 3.128955841064453), (622, 3.129032850265503), (623, 3.128563642501831), (624, 3.127487897872925), (625, 3.1260058879852295), (626, 3.1243932247161865), (627, 3.123107433319092), (628, 3.122351884841919), (629, 3.1216983795166016), (630, 3.1207690238952637), (631, 3.119892120361328), (632, 3.1191885471343994), (633, 3.1186389923095703), (634, 3.118590831756592), (635, 3.11896014213562), (636, 3.11946177482605), (637, 3.1195530891418457), (638, 3.1199076175689697), (639, 3.12077260017395), (640, 3.1218371391296387), (641, 3.122157573699951), (642, 3.1231162548065186), (643, 3.1249966621398926), (644, 3.1254189014434814), (645, 3.1273608207702637), (646, 3.127981662750244), (647, 3.129852294921875), (648, 3.1307461261749268), (649, 3.1313869953155518), (650, 3.131786346435547), (651, 3.1340174674987793), (652, 3.13313889503479), (653, 3.133645534515381), (654, 3.1334095001220703), (655, 3.1328890323638916), (656, 3.133136510848999), (657, 3.134477376937866), (658, 3.134777545928955), (659, 3.1366474628448486), (660, 3.1377010345458984), (661, 3.139662504196167), (662, 3.141160488128662), (663, 3.142932653427124), (664, 3.1443896293640137), (665, 3.146204710006714), (666, 3.1477460861206055), (667, 3.149472951889038), (668, 3.15089750289917), (669, 3.1524202823638916), (670, 3.1537234783172607), (671, 3.154853343963623), (672, 3.156202793121338), (673, 3.156796455383301), (674, 3.158210515975952), (675, 3.1583309173583984), (676, 3.159278631210327), (677, 3.159210205078125), (678, 3.157254934310913), (679, 3.1535637378692627), (680, 3.1497421264648438), (681, 3.146256923675537), (682, 3.1431326866149902), (683, 3.143984079360962), (684, 3.1435835361480713), (685, 3.1441636085510254), (686, 3.144726037979126), (687, 3.1435272693634033), (688, 3.141031265258789), (689, 3.1382076740264893), (690, 3.1351640224456787), (691, 3.132300853729248), (692, 3.131147623062134), (693, 3.1309714317321777), (694, 3.1306357383728027), (695, 3.130159854888916), (696, 3.129544734954834), (697, 3.1286540031433105), (698, 3.127794027328491), (699, 3.1273093223571777), (700, 3.127210855484009), (701, 3.1274259090423584), (702, 3.1278324127197266), (703, 3.128105878829956), (704, 3.1282527446746826), (705, 3.1277341842651367), (706, 3.127581834793091), (707, 3.1274406909942627), (708, 3.1272101402282715), (709, 3.1276557445526123), (710, 3.127122640609741), (711, 3.1269757747650146), (712, 3.126549005508423), (713, 3.125946283340454), (714, 3.1251726150512695), (715, 3.1243162155151367), (716, 3.123574733734131), (717, 3.1228041648864746), (718, 3.1223232746124268), (719, 3.122222900390625), (720, 3.122147798538208), (721, 3.1219379901885986), (722, 3.1216819286346436), (723, 3.121608018875122), (724, 3.1218390464782715), (725, 3.122152090072632), (726, 3.122544527053833), (727, 3.1224734783172607), (728, 3.122844934463501), (729, 3.1232986450195312), (730, 3.1231210231781006), (731, 3.1237330436706543), (732, 3.124084234237671), (733, 3.1245439052581787), (734, 3.124894142150879), (735, 3.125257968902588), (736, 3.1258411407470703), (737, 3.126582384109497), (738, 3.127045154571533), (739, 3.127321720123291), (740, 3.1277973651885986), (741, 3.127563238143921), (742, 3.1264705657958984), (743, 3.1253013610839844), (744, 3.124185085296631), (745, 3.1230356693267822), (746, 3.1222732067108154), (747, 3.1215016841888428), (748, 3.1201775074005127), (749, 3.11858868598938), (750, 3.1172070503234863), (751, 3.1161961555480957), (752, 3.1153531074523926), (753, 3.1144471168518066), (754, 3.1134188175201416), (755, 3.1120476722717285), (756, 3.110679864883423), (757, 3.1099846363067627), (758, 3.109790325164795), (759, 3.1096408367156982), (760, 3.1095612049102783), (761, 3.1095452308654785), (762, 3.1089494228363037), (763, 3.1074469089508057), (764, 3.105679988861084), (765, 3.1044106483459473), (766, 3.1035611629486084), (767, 3.102726936340332), (768, 3.102856397628784), (769, 3.102354049682617), (770, 3.1016173362731934), (771, 3.1004958152770996), (772, 3.0995707511901855), (773, 3.0996975898742676), (774, 3.0992836952209473), (775, 3.101182699203491), (776, 3.101633071899414), (777, 3.103807210922241), (778, 3.1047239303588867), (779, 3.107250690460205), (780, 3.1082587242126465), (781, 3.1093032360076904), (782, 3.111018180847168), (783, 3.1126761436462402), (784, 3.1138112545013428), (785, 3.1148617267608643), (786, 3.117234230041504), (787, 3.118422269821167), (788, 3.120290994644165), (789, 3.1211555004119873), (790, 3.1227736473083496), (791, 3.1227755546569824), (792, 3.1235828399658203), (793, 3.1237709522247314), (794, 3.123709201812744), (795, 3.1234540939331055), (796, 3.124027729034424), (797, 3.1249468326568604), (798, 3.1264967918395996), (799, 3.127243757247925), (800, 3.1293463706970215), (801, 3.131009817123413), (802, 3.132779359817505), (803, 3.134620428085327), (804, 3.1364121437072754), (805, 3.138413429260254), (806, 3.1392557621002197), (807, 3.1415226459503174), (808, 3.1426284313201904), (809, 3.1432712078094482), (810, 3.1438088417053223), (811, 3.143404722213745), (812, 3.1424217224121094), (813, 3.141273021697998), (814, 3.1400959491729736), (815, 3.139486312866211), (816, 3.139585256576538), (817, 3.1387977600097656), (818, 3.1373002529144287), (819, 3.135279655456543), (820, 3.1323561668395996), (821, 3.130688428878784), (822, 3.129126787185669)]}), 'DOWN_STAIRS': ('Down Stairs', 24.0, {('location', 0): [(1, 0.13334132730960846), (2, 0.13075996935367584), (3, 0.12843535840511322), (4, 0.12572480738162994), (5, 0.12185640633106232), (6, 0.11929570138454437), (7, 0.11681051552295685), (8, 0.11454208195209503), (9, 0.11224068701267242), (10, 0.10661937296390533), (11, 0.09899561107158661), (12, 0.09262697398662567), (13, 0.08414764702320099), (14, 0.07669220864772797), (15, 0.07283641397953033), (16, 0.06908424198627472), (17, 0.06557820737361908), (18, 0.0643526166677475), (19, 0.06303392350673676), (20, 0.059947431087493896), (21, 0.056989893317222595), (22, 0.05433999001979828), (23, 0.05205349624156952), (24, 0.0499444305896759), (25, 0.047890350222587585), (26, 0.045703113079071045), (27, 0.04324069619178772), (28, 0.040527597069740295), (29, 0.03767383098602295), (30, 0.03455294668674469), (31, 0.03100810945034027), (32, 0.027482956647872925), (33, 0.02420946955680847), (34, 0.021160349249839783), (35, 0.018633097410202026), (36, 0.016658663749694824), (37, 0.014872461557388306), (38, 0.013201415538787842), (39, 0.011606872081756592), (40, 0.01008366048336029), (41, 0.00883185863494873), (42, 0.007747739553451538), (43, 0.006873071193695068), (44, 0.006394490599632263), (45, 0.005969613790512085), (46, 0.005519121885299683), (47, 0.005290314555168152), (48, 0.005047202110290527), (49, 0.004927083849906921), (50, 0.005183488130569458), (51, 0.005669340491294861), (52, 0.006371721625328064), (53, 0.007315397262573242), (54, 0.008468180894851685), (55, 0.009802296757698059), (56, 0.011282801628112793), (57, 0.012660965323448181), (58, 0.013898372650146484), (59, 0.015153452754020691), (60, 0.01630707085132599), (61, 0.017486199736595154), (62, 0.01869286596775055), (63, 0.019714415073394775), (64, 0.020518526434898376), (65, 0.020696446299552917), (66, 0.019538193941116333), (67, 0.01909758150577545), (68, 0.017690718173980713), (69, 0.015681609511375427), (70, 0.013567984104156494), (71, 0.011648908257484436), (72, 0.010210558772087097), (73, 0.009070590138435364), (74, 0.007866695523262024), (75, 0.0064171552658081055), (76, 0.004675447940826416), (77, 0.002971142530441284), (78, 0.0016680508852005005), (79, 0.0009405612945556641), (80, 0.0008666068315505981), (81, 0.0013408809900283813), (82, 0.002073138952255249), (83, 0.002888411283493042), (84, 0.0037087947130203247), (85, 0.004376858472824097), (86, 0.004816979169845581), (87, 0.0050449371337890625), (88, 0.005229443311691284), (89, 0.005380377173423767), (90, 0.005459964275360107), (91, 0.005667880177497864), (92, 0.005864962935447693), (93, 0.005863934755325317), (94, 0.005651518702507019), (95, 0.005236640572547913), (96, 0.004671767354011536), (97, 0.003965824842453003), (98, 0.003200814127922058), (99, 0.0023390352725982666), (100, 0.0012854933738708496), (101, 0.0001500546932220459), (102, -0.0004964917898178101), (103, -0.0012630671262741089), (104, -0.0023609399795532227), (105, -0.0033416450023651123), (106, -0.004025354981422424), (107, -0.004595935344696045), (108, -0.005320161581039429), (109, -0.006076648831367493), (110, -0.007078036665916443), (111, -0.008385971188545227), (112, -0.00957651436328888), (113, -0.010375216603279114), (114, -0.010641559958457947), (115, -0.01029135286808014), (116, -0.009460344910621643), (117, -0.008421435952186584), (118, -0.007359430193901062), (119, -0.006444230675697327), (120, -0.005815759301185608), (121, -0.00541803240776062), (122, -0.0051383376121521), (123, -0.004863038659095764), (124, -0.0044794827699661255), (125, -0.0039329081773757935), (126, -0.0031835585832595825), (127, -0.0022733211517333984), (128, -0.0013019740581512451), (129, -0.000348016619682312), (130, 0.0005427002906799316), (131, 0.0013503432273864746), (132, 0.0021001696586608887), (133, 0.0029024332761764526), (134, 0.0038861334323883057), (135, 0.005173742771148682), (136, 0.006835952401161194), (137, 0.008898571133613586), (138, 0.011402010917663574), (139, 0.014312729239463806), (140, 0.01753029227256775), (141, 0.020949244499206543), (142, 0.024518519639968872), (143, 0.0281362384557724), (144, 0.03164501488208771), (145, 0.03497117757797241), (146, 0.03797560930252075), (147, 0.040471941232681274), (148, 0.042290329933166504), (149, 0.04336091876029968), (150, 0.04382689297199249), (151, 0.04387712478637695), (152, 0.04366791248321533), (153, 0.0433182567358017), (154, 0.042916297912597656), (155, 0.04248283803462982), (156, 0.041969090700149536), (157, 0.04142919182777405), (158, 0.04098843038082123), (159, 0.040712594985961914), (160, 0.04066230356693268), (161, 0.04091811180114746), (162, 0.04149855673313141), (163, 0.042343735694885254), (164, 0.0429760217666626), (165, 0.04356791079044342), (166, 0.04409433901309967), (167, 0.04436430335044861), (168, 0.0444125235080719), (169, 0.044142186641693115), (170, 0.04369102418422699), (171, 0.043224647641181946), (172, 0.04261527955532074), (173, 0.04188317060470581), (174, 0.04117812216281891), (175, 0.04034779965877533), (176, 0.039419546723365784), (177, 0.03845866024494171), (178, 0.037281498312950134), (179, 0.03592972457408905), (180, 0.034454211592674255), (181, 0.03276775777339935), (182, 0.03092212975025177), (183, 0.028980299830436707), (184, 0.026981472969055176), (185, 0.024630576372146606), (186, 0.02161012589931488), (187, 0.018226057291030884), (188, 0.014634236693382263), (189, 0.011006832122802734), (190, 0.007914021611213684), (191, 0.005601227283477783), (192, 0.003996729850769043), (193, 0.0029747337102890015), (194, 0.0023750215768814087), (195, 0.002053573727607727), (196, 0.001953691244125366), (197, 0.0019956380128860474), (198, 0.0020832568407058716), (199, 0.0022934824228286743), (200, 0.0026890933513641357), (201, 0.0030639469623565674), (202, 0.0034501105546951294), (203, 0.004048362374305725), (204, 0.004715397953987122), (205, 0.005557402968406677), (206, 0.006673038005828857), (207, 0.007871508598327637), (208, 0.009107336401939392), (209, 0.010371699929237366), (210, 0.01165829598903656), (211, 0.013030409812927246), (212, 0.014564648270606995), (213, 0.01633031666278839), (214, 0.018345966935157776), (215, 0.020602554082870483), (216, 0.0230875164270401), (217, 0.025728866457939148), (218, 0.02847355604171753), (219, 0.03130717575550079), (220, 0.034239932894706726), (221, 0.037284865975379944), (222, 0.040440917015075684), (223, 0.04370371997356415), (224, 0.04692937433719635), (225, 0.04982215166091919), (226, 0.05213548243045807), (227, 0.053839609026908875), (228, 0.05516771972179413), (229, 0.05646955966949463), (230, 0.05809244513511658), (231, 0.06057438254356384), (232, 0.06236666440963745), (233, 0.0646291971206665), (234, 0.06724895536899567), (235, 0.07005739212036133), (236, 0.07268144190311432), (237, 0.07471504807472229), (238, 0.07611975073814392), (239, 0.07714785635471344), (240, 0.07812412083148956), (241, 0.0793531984090805), (242, 0.08088564872741699), (243, 0.08252459764480591), (244, 0.08418507874011993), (245, 0.0857604593038559), (246, 0.08709408342838287), (247, 0.08823983371257782), (248, 0.08920490741729736), (249, 0.08997233211994171), (250, 0.08983463048934937), (251, 0.08970125019550323), (252, 0.09003156423568726), (253, 0.09032486379146576), (254, 0.09059585630893707), (255, 0.09083724021911621), (256, 0.09099352359771729), (257, 0.09104564785957336), (258, 0.09101366996765137), (259, 0.09083452820777893), (260, 0.09052842855453491), (261, 0.09013009071350098), (262, 0.08970071375370026), (263, 0.08924783766269684), (264, 0.0885983556509018), (265, 0.08782336115837097), (266, 0.08696311712265015), (267, 0.08584189414978027), (268, 0.08428467810153961), (269, 0.08226680755615234), (270, 0.0799359530210495), (271, 0.07733173668384552), (272, 0.0748702883720398), (273, 0.07307897508144379), (274, 0.07204203307628632), (275, 0.07179804146289825), (276, 0.07228563725948334), (277, 0.07327879965305328), (278, 0.07313774526119232), (279, 0.07403571903705597), (280, 0.07570852339267731), (281, 0.07774747908115387), (282, 0.08022405207157135), (283, 0.08298344910144806), (284, 0.08599294722080231), (285, 0.08920834958553314), (286, 0.092471644282341), (287, 0.09579958021640778), (288, 0.09924526512622833), (289, 0.10283531248569489), (290, 0.10662735998630524), (291, 0.11062555015087128), (292, 0.11478771269321442), (293, 0.1191026121377945), (294, 0.12276078760623932), (295, 0.12804411351680756)], ('location', 1): [(1, 0.049134254455566406), (2, 0.048311054706573486), (3, 0.047706782817840576), (4, 0.04820781946182251), (5, 0.04895758628845215), (6, 0.04833841323852539), (7, 0.04839056730270386), (8, 0.04897940158843994), (9, 0.04932963848114014), (10, 0.05271446704864502), (11, 0.057850420475006104), (12, 0.06141245365142822), (13, 0.06758737564086914), (14, 0.07285737991333008), (15, 0.07460880279541016), (16, 0.0766262412071228), (17, 0.07834851741790771), (18, 0.07997620105743408), (19, 0.0816640853881836), (20, 0.08299177885055542), (21, 0.08442926406860352), (22, 0.08580124378204346), (23, 0.08705258369445801), (24, 0.08824348449707031), (25, 0.0893557071685791), (26, 0.0903785228729248), (27, 0.09129548072814941), (28, 0.09214913845062256), (29, 0.09298312664031982), (30, 0.09367895126342773), (31, 0.09422004222869873), (32, 0.09496104717254639), (33, 0.0959123969078064), (34, 0.09690064191818237), (35, 0.09823960065841675), (36, 0.09994634985923767), (37, 0.10145711898803711), (38, 0.10260501503944397), (39, 0.10352379083633423), (40, 0.10394614934921265), (41, 0.10384476184844971), (42, 0.1036127507686615), (43, 0.10332220792770386), (44, 0.10275626182556152), (45, 0.10181429982185364), (46, 0.10042521357536316), (47, 0.09855392575263977), (48, 0.09632721543312073), (49, 0.09379550814628601), (50, 0.09092822670936584), (51, 0.08770173788070679), (52, 0.08643299341201782), (53, 0.08379584550857544), (54, 0.07965609431266785), (55, 0.07702308893203735), (56, 0.07551413774490356), (57, 0.07078707218170166), (58, 0.06559967994689941), (59, 0.06009778380393982), (60, 0.054315268993377686), (61, 0.04831981658935547), (62, 0.04244518280029297), (63, 0.03667101263999939), (64, 0.03093278408050537), (65, 0.025522679090499878), (66, 0.02042233943939209), (67, 0.016591668128967285), (68, 0.014344871044158936), (69, 0.01390773057937622), (70, 0.015017271041870117), (71, 0.01743757724761963), (72, 0.020688951015472412), (73, 0.024383544921875), (74, 0.028576195240020752), (75, 0.03324079513549805), (76, 0.0382731556892395), (77, 0.043559372425079346), (78, 0.048781752586364746), (79, 0.05371367931365967), (80, 0.05841076374053955), (81, 0.0628545880317688), (82, 0.06689751148223877), (83, 0.07048046588897705), (84, 0.07342812418937683), (85, 0.07553297281265259), (86, 0.07685214281082153), (87, 0.07746180891990662), (88, 0.0774882435798645), (89, 0.07714143395423889), (90, 0.07645717263221741), (91, 0.07545691728591919), (92, 0.07397356629371643), (93, 0.07196062803268433), (94, 0.06951877474784851), (95, 0.06645616888999939), (96, 0.06280431151390076), (97, 0.058573246002197266), (98, 0.05358681082725525), (99, 0.04778963327407837), (100, 0.04114043712615967), (101, 0.03370538353919983), (102, 0.02511376142501831), (103, 0.016246795654296875), (104, 0.007754027843475342), (105, 0.0040084123611450195), (106, 0.0008113980293273926), (107, -0.006814122200012207), (108, -0.01330655813217163), (109, -0.0180894136428833), (110, -0.020832598209381104), (111, -0.02134561538696289), (112, -0.019729971885681152), (113, -0.016638338565826416), (114, -0.01274019479751587), (115, -0.008289873600006104), (116, -0.00340878963470459), (117, 0.0018157660961151123), (118, 0.007312774658203125), (119, 0.013288617134094238), (120, 0.0195920467376709), (121, 0.02539879083633423), (122, 0.030553549528121948), (123, 0.035062700510025024), (124, 0.038442462682724), (125, 0.040768057107925415), (126, 0.04248592257499695), (127, 0.04343953728675842), (128, 0.04341438412666321), (129, 0.0426485538482666), (130, 0.04125896096229553), (131, 0.03921934962272644), (132, 0.037851184606552124), (133, 0.03620883822441101), (134, 0.03313565254211426), (135, 0.029513299465179443), (136, 0.025263279676437378), (137, 0.020297706127166748), (138, 0.01469564437866211), (139, 0.008400946855545044), (140, 0.0013249516487121582), (141, -0.006531238555908203), (142, -0.015267282724380493), (143, -0.024866819381713867), (144, -0.03508096933364868), (145, -0.045537203550338745), (146, -0.055663079023361206), (147, -0.06480726599693298), (148, -0.07248607277870178), (149, -0.07796818017959595), (150, -0.0802847146987915), (151, -0.07898229360580444), (152, -0.07427182793617249), (153, -0.06710261106491089), (154, -0.059154242277145386), (155, -0.05184197425842285), (156, -0.04566118121147156), (157, -0.04040169715881348), (158, -0.035398900508880615), (159, -0.030157148838043213), (160, -0.024705350399017334), (161, -0.019345074892044067), (162, -0.01433408260345459), (163, -0.00969812273979187), (164, -0.005530655384063721), (165, -0.002064645290374756), (166, 0.0004755258560180664), (167, 0.0019333958625793457), (168, 0.0020318031311035156), (169, 0.0009579658508300781), (170, -0.0008739829063415527), (171, -0.0033406615257263184), (172, -0.006309449672698975), (173, -0.009684979915618896), (174, -0.013515949249267578), (175, -0.017810434103012085), (176, -0.022379159927368164), (177, -0.027077674865722656), (178, -0.03214007616043091), (179, -0.03775811195373535), (180, -0.044051527976989746), (181, -0.05141448974609375), (182, -0.059801459312438965), (183, -0.06874445080757141), (184, -0.07257813215255737), (185, -0.07783156633377075), (186, -0.0856989324092865), (187, -0.09191977977752686), (188, -0.0961868166923523), (189, -0.09833908081054688), (190, -0.09859192371368408), (191, -0.09751331806182861), (192, -0.09535020589828491), (193, -0.09207570552825928), (194, -0.08768504858016968), (195, -0.08219781517982483), (196, -0.07527360320091248), (197, -0.06719532608985901), (198, -0.05952832102775574), (199, -0.05283600091934204), (200, -0.047412335872650146), (201, -0.04401203989982605), (202, -0.04220959544181824), (203, -0.04129236936569214), (204, -0.04096224904060364), (205, -0.04114082455635071), (206, -0.041650354862213135), (207, -0.04213327169418335), (208, -0.04260900616645813), (209, -0.04323846101760864), (210, -0.04417559504508972), (211, -0.045762330293655396), (212, -0.04825872182846069), (213, -0.049878329038619995), (214, -0.05268976092338562), (215, -0.056896090507507324), (216, -0.06151413917541504), (217, -0.06663519144058228), (218, -0.07201296091079712), (219, -0.07747778296470642), (220, -0.08337545394897461), (221, -0.08981472253799438), (222, -0.09673133492469788), (223, -0.10429280996322632), (224, -0.1123059093952179), (225, -0.12022873759269714), (226, -0.12756258249282837), (227, -0.13397276401519775), (228, -0.13924062252044678), (229, -0.1431509256362915), (230, -0.14398184418678284), (231, -0.14493989944458008), (232, -0.1456209421157837), (233, -0.14371460676193237), (234, -0.13971039652824402), (235, -0.1339293122291565), (236, -0.12681123614311218), (237, -0.11986634135246277), (238, -0.1135534942150116), (239, -0.1076815128326416), (240, -0.1023159921169281), (241, -0.09728565812110901), (242, -0.09248882532119751), (243, -0.08791306614875793), (244, -0.083548903465271), (245, -0.07946482300758362), (246, -0.07578331232070923), (247, -0.07257896661758423), (248, -0.06988120079040527), (249, -0.0676838755607605), (250, -0.06632646918296814), (251, -0.0655205249786377), (252, -0.0649619996547699), (253, -0.06484264135360718), (254, -0.06495457887649536), (255, -0.06506210565567017), (256, -0.06510978937149048), (257, -0.0651354193687439), (258, -0.06530189514160156), (259, -0.06571877002716064), (260, -0.0665917694568634), (261, -0.0680740475654602), (262, -0.07002580165863037), (263, -0.07247823476791382), (264, -0.07562962174415588), (265, -0.07929417490959167), (266, -0.0830920934677124), (267, -0.08656027913093567), (268, -0.08534914255142212), (269, -0.08508867025375366), (270, -0.0864863395690918), (271, -0.08603513240814209), (272, -0.0841485857963562), (273, -0.08495193719863892), (274, -0.0846472978591919), (275, -0.08228981494903564), (276, -0.0770905613899231), (277, -0.0692020058631897), (278, -0.05928242206573486), (279, -0.04788708686828613), (280, -0.03657948970794678), (281, -0.025864779949188232), (282, -0.016260743141174316), (283, -0.007856488227844238), (284, -0.00013107061386108398), (285, 0.006947159767150879), (286, 0.01325613260269165), (287, 0.018831074237823486), (288, 0.02379530668258667), (289, 0.028303086757659912), (290, 0.032482028007507324), (291, 0.03647422790527344), (292, 0.04041135311126709), (293, 0.044225871562957764), (294, 0.04732471704483032), (295, 0.051569581031799316)], ('location', 2): [(1, -0.0780717134475708), (2, -0.0705956220626831), (3, -0.0626935362815857), (4, -0.05667757987976074), (5, -0.05173391103744507), (6, -0.04513484239578247), (7, -0.039344072341918945), (8, -0.03409016132354736), (9, -0.02905195951461792), (10, -0.02910768985748291), (11, -0.031700730323791504), (12, -0.032082200050354004), (13, -0.036041319370269775), (14, -0.038163185119628906), (15, -0.03499835729598999), (16, -0.03227353096008301), (17, -0.0293123722076416), (18, -0.02618849277496338), (19, -0.023225486278533936), (20, -0.0198211669921875), (21, -0.016427159309387207), (22, -0.013090014457702637), (23, -0.00958704948425293), (24, -0.00580519437789917), (25, -0.0019111037254333496), (26, 0.0020308494567871094), (27, 0.005988597869873047), (28, 0.00992441177368164), (29, 0.013769924640655518), (30, 0.01768392324447632), (31, 0.021702349185943604), (32, 0.02548772096633911), (33, 0.02916651964187622), (34, 0.03291285037994385), (35, 0.03666645288467407), (36, 0.04077178239822388), (37, 0.045160114765167236), (38, 0.04961353540420532), (39, 0.05404043197631836), (40, 0.05797839164733887), (41, 0.06140094995498657), (42, 0.06446462869644165), (43, 0.06703341007232666), (44, 0.06916749477386475), (45, 0.07104551792144775), (46, 0.07251250743865967), (47, 0.07348752021789551), (48, 0.07406508922576904), (49, 0.07406312227249146), (50, 0.07344728708267212), (51, 0.07231396436691284), (52, 0.07218480110168457), (53, 0.0708913803100586), (54, 0.06825953722000122), (55, 0.0661361813545227), (56, 0.06419593095779419), (57, 0.059636831283569336), (58, 0.05420190095901489), (59, 0.04790902137756348), (60, 0.040930986404418945), (61, 0.03333777189254761), (62, 0.025116682052612305), (63, 0.016773581504821777), (64, 0.008928656578063965), (65, 0.0016216039657592773), (66, -0.004724323749542236), (67, -0.01097947359085083), (68, -0.01695239543914795), (69, -0.022399306297302246), (70, -0.026482582092285156), (71, -0.028792619705200195), (72, -0.028827548027038574), (73, -0.026478826999664307), (74, -0.022516191005706787), (75, -0.017746806144714355), (76, -0.012755751609802246), (77, -0.007949233055114746), (78, -0.0034336447715759277), (79, 0.0009086132049560547), (80, 0.00518345832824707), (81, 0.009390294551849365), (82, 0.01343083381652832), (83, 0.017107605934143066), (84, 0.02015441656112671), (85, 0.022471904754638672), (86, 0.02405381202697754), (87, 0.02504599094390869), (88, 0.025681495666503906), (89, 0.0261690616607666), (90, 0.026764869689941406), (91, 0.027496755123138428), (92, 0.028205513954162598), (93, 0.028733134269714355), (94, 0.028856396675109863), (95, 0.028227806091308594), (96, 0.02667909860610962), (97, 0.024213314056396484), (98, 0.020777344703674316), (99, 0.01630258560180664), (100, 0.010850965976715088), (101, 0.004565536975860596), (102, -0.0016273260116577148), (103, -0.008451700210571289), (104, -0.01619631052017212), (105, -0.02124011516571045), (106, -0.02593410015106201), (107, -0.03321295976638794), (108, -0.039692461490631104), (109, -0.04502838850021362), (110, -0.04876488447189331), (111, -0.05072969198226929), (112, -0.050756752490997314), (113, -0.048583149909973145), (114, -0.04418814182281494), (115, -0.03807234764099121), (116, -0.030826687812805176), (117, -0.023046374320983887), (118, -0.01569056510925293), (119, -0.009117960929870605), (120, -0.0033411383628845215), (121, 0.0011522769927978516), (122, 0.004673600196838379), (123, 0.007542431354522705), (124, 0.009850561618804932), (125, 0.012136638164520264), (126, 0.014437854290008545), (127, 0.016715288162231445), (128, 0.018764138221740723), (129, 0.020189225673675537), (130, 0.020952343940734863), (131, 0.02101421356201172), (132, 0.021208226680755615), (133, 0.021126985549926758), (134, 0.0201532244682312), (135, 0.01822596788406372), (136, 0.015534281730651855), (137, 0.012865424156188965), (138, 0.009887158870697021), (139, 0.007014274597167969), (140, 0.004578292369842529), (141, 0.0019383430480957031), (142, -0.0013564825057983398), (143, -0.005546271800994873), (144, -0.010632872581481934), (145, -0.016461730003356934), (146, -0.022571444511413574), (147, -0.028398513793945312), (148, -0.03348594903945923), (149, -0.03771108388900757), (150, -0.041158974170684814), (151, -0.043479859828948975), (152, -0.0441705584526062), (153, -0.0427556037902832), (154, -0.03856980800628662), (155, -0.03166550397872925), (156, -0.02313065528869629), (157, -0.014201164245605469), (158, -0.00594937801361084), (159, 0.0009902715682983398), (160, 0.006653308868408203), (161, 0.011467576026916504), (162, 0.015841186046600342), (163, 0.019850730895996094), (164, 0.02348315715789795), (165, 0.026113271713256836), (166, 0.027574360370635986), (167, 0.028187990188598633), (168, 0.02791661024093628), (169, 0.027207791805267334), (170, 0.026403307914733887), (171, 0.02547776699066162), (172, 0.02451169490814209), (173, 0.02347385883331299), (174, 0.02239459753036499), (175, 0.02126067876815796), (176, 0.020052433013916016), (177, 0.018858730792999268), (178, 0.01742541790008545), (179, 0.015467226505279541), (180, 0.01290440559387207), (181, 0.009465157985687256), (182, 0.005124270915985107), (183, 0.00015681982040405273), (184, -0.0017238259315490723), (185, -0.004925131797790527), (186, -0.010566651821136475), (187, -0.01597893238067627), (188, -0.020698726177215576), (189, -0.024007737636566162), (190, -0.024923503398895264), (191, -0.02294832468032837), (192, -0.018291592597961426), (193, -0.01156681776046753), (194, -0.004039108753204346), (195, 0.003015756607055664), (196, 0.009372174739837646), (197, 0.015206456184387207), (198, 0.020348548889160156), (199, 0.02515798807144165), (200, 0.029837965965270996), (201, 0.034699320793151855), (202, 0.03972893953323364), (203, 0.04436969757080078), (204, 0.049029767513275146), (205, 0.053010404109954834), (206, 0.05556285381317139), (207, 0.05707383155822754), (208, 0.05782878398895264), (209, 0.05806165933609009), (210, 0.05792844295501709), (211, 0.05782473087310791), (212, 0.05778837203979492), (213, 0.05865544080734253), (214, 0.059070467948913574), (215, 0.05877256393432617), (216, 0.05802297592163086), (217, 0.056776344776153564), (218, 0.05497318506240845), (219, 0.0522579550743103), (220, 0.04863154888153076), (221, 0.044250547885894775), (222, 0.039119839668273926), (223, 0.03354126214981079), (224, 0.027761399745941162), (225, 0.021667957305908203), (226, 0.015100181102752686), (227, 0.007972896099090576), (228, 0.00045675039291381836), (229, -0.006766378879547119), (230, -0.01139897108078003), (231, -0.013721048831939697), (232, -0.016767561435699463), (233, -0.016434013843536377), (234, -0.013579308986663818), (235, -0.009390056133270264), (236, -0.004840373992919922), (237, -0.0010203719139099121), (238, 0.002003788948059082), (239, 0.004826724529266357), (240, 0.00771254301071167), (241, 0.010670065879821777), (242, 0.013665258884429932), (243, 0.016635477542877197), (244, 0.019374489784240723), (245, 0.021725058555603027), (246, 0.02357429265975952), (247, 0.02472054958343506), (248, 0.025058984756469727), (249, 0.024604320526123047), (250, 0.023572921752929688), (251, 0.02182680368423462), (252, 0.019613206386566162), (253, 0.017107605934143066), (254, 0.014466524124145508), (255, 0.01178354024887085), (256, 0.008785486221313477), (257, 0.005336284637451172), (258, 0.0013824701309204102), (259, -0.0030791759490966797), (260, -0.008069872856140137), (261, -0.013648927211761475), (262, -0.019910752773284912), (263, -0.02688312530517578), (264, -0.03446418046951294), (265, -0.04259991645812988), (266, -0.05128735303878784), (267, -0.060551583766937256), (268, -0.0678485631942749), (269, -0.07655245065689087), (270, -0.08641928434371948), (271, -0.0942908525466919), (272, -0.09948974847793579), (273, -0.10452437400817871), (274, -0.10738617181777954), (275, -0.10794395208358765), (276, -0.1063385009765625), (277, -0.10326898097991943), (278, -0.09837418794631958), (279, -0.0933876633644104), (280, -0.08918476104736328), (281, -0.08548235893249512), (282, -0.08231204748153687), (283, -0.07984215021133423), (284, -0.07784813642501831), (285, -0.0763964056968689), (286, -0.07567870616912842), (287, -0.07569056749343872), (288, -0.07629632949829102), (289, -0.07735729217529297), (290, -0.07893139123916626), (291, -0.08099144697189331), (292, -0.08330190181732178), (293, -0.08570700883865356), (294, -0.08775979280471802), (295, -0.09035873413085938)], ('rotation_euler', 0): [(1, 0.045456841588020325), (2, 0.04824548587203026), (3, 0.04976297914981842), (4, 0.05032709613442421), (5, 0.049245718866586685), (6, 0.04755518212914467), (7, 0.046774428337812424), (8, 0.04725850746035576), (9, 0.04870900139212608), (10, 0.05036060884594917), (11, 0.05281822010874748), (12, 0.054826315492391586), (13, 0.055146750062704086), (14, 0.057220179587602615), (15, 0.05968312919139862), (16, 0.0609758198261261), (17, 0.06331397593021393), (18, 0.06507517397403717), (19, 0.064969502389431), (20, 0.06408845633268356), (21, 0.06314561516046524), (22, 0.0625658631324768), (23, 0.06241975724697113), (24, 0.0623541921377182), (25, 0.061867814511060715), (26, 0.06045537441968918), (27, 0.05813704803586006), (28, 0.055423613637685776), (29, 0.0523863285779953), (30, 0.04899122565984726), (31, 0.045351602137088776), (32, 0.04146993160247803), (33, 0.037565313279628754), (34, 0.034011438488960266), (35, 0.03093455545604229), (36, 0.028367016464471817), (37, 0.02629067376255989), (38, 0.024622689932584763), (39, 0.02339845709502697), (40, 0.022727198898792267), (41, 0.02251187339425087), (42, 0.022567275911569595), (43, 0.02262164279818535), (44, 0.022371789440512657), (45, 0.021831505000591278), (46, 0.02089742198586464), (47, 0.019277924671769142), (48, 0.017364362254738808), (49, 0.015776092186570168), (50, 0.014965089969336987), (51, 0.015556161291897297), (52, 0.017872687429189682), (53, 0.02168125845491886), (54, 0.02635294198989868), (55, 0.0309628676623106), (56, 0.035079654306173325), (57, 0.03873897343873978), (58, 0.041751958429813385), (59, 0.0442153699696064), (60, 0.04642932489514351), (61, 0.04832201823592186), (62, 0.04937554523348808), (63, 0.049759410321712494), (64, 0.05025577172636986), (65, 0.05032193288207054), (66, 0.04654315114021301), (67, 0.03644275292754173), (68, 0.018872231245040894), (69, -0.006314993370324373), (70, -0.03311148285865784), (71, -0.05511095002293587), (72, -0.0702281966805458), (73, -0.07703840732574463), (74, -0.07816961407661438), (75, -0.07830382883548737), (76, -0.07848359644412994), (77, -0.07832296937704086), (78, -0.0768628790974617), (79, -0.07372929900884628), (80, -0.07159585505723953), (81, -0.06989855319261551), (82, -0.06673817336559296), (83, -0.06543650478124619), (84, -0.06580381840467453), (85, -0.06655701249837875), (86, -0.06646596640348434), (87, -0.06485848128795624), (88, -0.061871450394392014), (89, -0.05810082331299782), (90, -0.05370441451668739), (91, -0.04847992956638336), (92, -0.042228758335113525), (93, -0.03495815396308899), (94, -0.02709197625517845), (95, -0.019313503056764603), (96, -0.012258043512701988), (97, -0.006418001372367144), (98, -0.002246113959699869), (99, -2.5459497919655405e-05), (100, 0.00034901394974440336), (101, -0.00071368069620803), (102, -0.0028371172957122326), (103, -0.005975791253149509), (104, -0.009621359407901764), (105, -0.012605424039065838), (106, -0.013638281263411045), (107, -0.012663706205785275), (108, -0.012378622777760029), (109, -0.014119425788521767), (110, -0.01818852499127388), (111, -0.026390207931399345), (112, -0.036406729370355606), (113, -0.04493171349167824), (114, -0.051565542817115784), (115, -0.05524993687868118), (116, -0.05574221909046173), (117, -0.05446568503975868), (118, -0.052654050290584564), (119, -0.051448430866003036), (120, -0.05190230533480644), (121, -0.05363723263144493), (122, -0.054601553827524185), (123, -0.05353124067187309), (124, -0.05076231062412262), (125, -0.047366391867399216), (126, -0.044850241392850876), (127, -0.04400334507226944), (128, -0.0442998893558979), (129, -0.04438524320721626), (130, -0.04313337802886963), (131, -0.0409366674721241), (132, -0.038720306009054184), (133, -0.037300970405340195), (134, -0.03617805615067482), (135, -0.03430169075727463), (136, -0.0312500074505806), (137, -0.027020324021577835), (138, -0.022698763757944107), (139, -0.019882045686244965), (140, -0.01848304644227028), (141, -0.017634183168411255), (142, -0.016401425004005432), (143, -0.014731165021657944), (144, -0.013998803682625294), (145, -0.014620809815824032), (146, -0.013309752568602562), (147, -0.005951456725597382), (148, 0.00691278325393796), (149, 0.01925496570765972), (150, 0.023324275389313698), (151, 0.016402101144194603), (152, 0.0005896827788092196), (153, -0.019080875441432), (154, -0.03406151384115219), (155, -0.038695912808179855), (156, -0.03576556593179703), (157, -0.029572609812021255), (158, -0.02217883989214897), (159, -0.014280117116868496), (160, -0.005870192777365446), (161, 0.0032930420711636543), (162, 0.011864121071994305), (163, 0.019145581871271133), (164, 0.024450063705444336), (165, 0.028236178681254387), (166, 0.03178180009126663), (167, 0.03598586097359657), (168, 0.04082004353404045), (169, 0.04550217092037201), (170, 0.04886524751782417), (171, 0.05050431564450264), (172, 0.05107607692480087), (173, 0.05182095989584923), (174, 0.053591229021549225), (175, 0.05646655708551407), (176, 0.059966735541820526), (177, 0.06348280608654022), (178, 0.0665886178612709), (179, 0.06910312175750732), (180, 0.07077363133430481), (181, 0.07141720503568649), (182, 0.07103646546602249), (183, 0.07041509449481964), (184, 0.07170076668262482), (185, 0.07343626767396927), (186, 0.06899110972881317), (187, 0.07623564451932907), (188, 0.05986776575446129), (189, 0.05104221776127815), (190, 0.04023627191781998), (191, 0.03368179872632027), (192, 0.03722201660275459), (193, 0.04603619873523712), (194, 0.05531102791428566), (195, 0.06281520426273346), (196, 0.06642503291368484), (197, 0.06577786058187485), (198, 0.062305301427841187), (199, 0.057422272861003876), (200, 0.05273497477173805), (201, 0.04885517433285713), (202, 0.045285921543836594), (203, 0.04185844585299492), (204, 0.03900023549795151), (205, 0.036928460001945496), (206, 0.03560379520058632), (207, 0.03487248718738556), (208, 0.03428065404295921), (209, 0.033762749284505844), (210, 0.03362489491701126), (211, 0.034409359097480774), (212, 0.037027716636657715), (213, 0.041892748326063156), (214, 0.04852503165602684), (215, 0.05616014823317528), (216, 0.06371305137872696), (217, 0.0701311007142067), (218, 0.07513957470655441), (219, 0.07874587923288345), (220, 0.08028898388147354), (221, 0.08111855387687683), (222, 0.08249761909246445), (223, 0.08297637850046158), (224, 0.08284393697977066), (225, 0.08197277784347534), (226, 0.07674027234315872), (227, 0.0658954381942749), (228, 0.052526649087667465), (229, 0.03767479211091995), (230, 0.023798629641532898), (231, 0.014869951643049717), (232, 0.00914793461561203), (233, 0.0053458441980183125), (234, 0.000941040285397321), (235, -0.0036318255588412285), (236, -0.008097179234027863), (237, -0.012450198642909527), (238, -0.01577477902173996), (239, -0.017253030091524124), (240, -0.016374120488762856), (241, -0.013066031970083714), (242, -0.007908973842859268), (243, -0.0021123411133885384), (244, 0.0033186597283929586), (245, 0.007822164334356785), (246, 0.011343893595039845), (247, 0.014183093793690205), (248, 0.016832418739795685), (249, 0.019794106483459473), (250, 0.022976817563176155), (251, 0.025998689234256744), (252, 0.028536828234791756), (253, 0.0308407973498106), (254, 0.03317643702030182), (255, 0.03603380173444748), (256, 0.039553504437208176), (257, 0.0432622954249382), (258, 0.04695253446698189), (259, 0.05052761733531952), (260, 0.0538591630756855), (261, 0.0573420412838459), (262, 0.06136706843972206), (263, 0.06582096964120865), (264, 0.07083777338266373), (265, 0.07257336378097534), (266, 0.07337076961994171), (267, 0.07105351239442825), (268, 0.06573110818862915), (269, 0.056003715842962265), (270, 0.042112648487091064), (271, 0.02924356795847416), (272, 0.018344946205615997), (273, 0.0096060736104846), (274, 0.004123811610043049), (275, 0.001073964755050838), (276, -0.00042598662548698485), (277, -0.0005205493653193116), (278, 0.0006758184172213078), (279, 0.0027824887074530125), (280, 0.005391563754528761), (281, 0.008590199053287506), (282, 0.011972968466579914), (283, 0.015601975843310356), (284, 0.02021651901304722), (285, 0.02596709132194519), (286, 0.0324123241007328), (287, 0.03924012556672096), (288, 0.04536617174744606), (289, 0.04934430867433548), (290, 0.05091901123523712), (291, 0.050707779824733734), (292, 0.04818623885512352), (293, 0.04463858902454376), (294, 0.03943297266960144), (295, 0.03941982239484787)], ('rotation_euler', 1): [(1, 0.0025389348156750202), (2, 0.003625964978709817), (3, 0.005190593656152487), (4, 0.006452448666095734), (5, 0.006329101510345936), (6, 0.0041315373964607716), (7, 0.00047405718942172825), (8, -0.00371945952065289), (9, -0.007707240525633097), (10, -0.0150168277323246), (11, -0.024477288126945496), (12, -0.028392309322953224), (13, -0.03436316177248955), (14, -0.04587964713573456), (15, -0.05581367388367653), (16, -0.060656558722257614), (17, -0.06585023552179337), (18, -0.06844919919967651), (19, -0.06971300393342972), (20, -0.0731545239686966), (21, -0.07698359340429306), (22, -0.08162263035774231), (23, -0.08683697134256363), (24, -0.09167390316724777), (25, -0.09506936371326447), (26, -0.0964302122592926), (27, -0.09591809660196304), (28, -0.09455873817205429), (29, -0.09359893947839737), (30, -0.09372004121541977), (31, -0.09493212401866913), (32, -0.09664299339056015), (33, -0.09816868603229523), (34, -0.10009850561618805), (35, -0.10154203325510025), (36, -0.10236944258213043), (37, -0.10240540653467178), (38, -0.10171476006507874), (39, -0.1008043959736824), (40, -0.09992261976003647), (41, -0.09938666224479675), (42, -0.09960373491048813), (43, -0.10028694570064545), (44, -0.10097004473209381), (45, -0.10141361504793167), (46, -0.10138095170259476), (47, -0.1006689965724945), (48, -0.09929777681827545), (49, -0.09757488965988159), (50, -0.09596504271030426), (51, -0.09493093192577362), (52, -0.09469984471797943), (53, -0.09471369534730911), (54, -0.09410061687231064), (55, -0.09246570616960526), (56, -0.08959613740444183), (57, -0.08564312011003494), (58, -0.08176644146442413), (59, -0.0793021023273468), (60, -0.07828724384307861), (61, -0.07839513570070267), (62, -0.07923605293035507), (63, -0.0778556764125824), (64, -0.0771123394370079), (65, -0.06663040071725845), (66, -0.05101645365357399), (67, -0.035336799919605255), (68, -0.024003412574529648), (69, -0.01981998048722744), (70, -0.015591325238347054), (71, -0.018916748464107513), (72, -0.02239878848195076), (73, -0.021458175033330917), (74, -0.016583425924181938), (75, -0.00925254262983799), (76, -0.00271381763741374), (77, -0.0009903163881972432), (78, -0.0032046192791312933), (79, -0.006371928844600916), (80, -0.008572305552661419), (81, -0.008493312634527683), (82, -0.005733323749154806), (83, -0.0012691545998677611), (84, 0.0029324698261916637), (85, 0.0041465554386377335), (86, 0.0013657012023031712), (87, 0.00042190405656583607), (88, -0.0038371600676327944), (89, -0.012006972916424274), (90, -0.02064501866698265), (91, -0.027153607457876205), (92, -0.030292633920907974), (93, -0.030492374673485756), (94, -0.028675450012087822), (95, -0.026135554537177086), (96, -0.024097362533211708), (97, -0.023191725835204124), (98, -0.023618819192051888), (99, -0.025560693815350533), (100, -0.029117295518517494), (101, -0.03437723219394684), (102, -0.041186604648828506), (103, -0.048836760222911835), (104, -0.05683679133653641), (105, -0.06519851088523865), (106, -0.07111165672540665), (107, -0.0765402615070343), (108, -0.0819237157702446), (109, -0.08606783300638199), (110, -0.09001865237951279), (111, -0.09354989230632782), (112, -0.097791887819767), (113, -0.10221109539270401), (114, -0.10319465398788452), (115, -0.0975889042019844), (116, -0.08672480285167694), (117, -0.07510601729154587), (118, -0.06505154818296432), (119, -0.05952955409884453), (120, -0.06073283031582832), (121, -0.066321462392807), (122, -0.07085531204938889), (123, -0.0757800042629242), (124, -0.08074317127466202), (125, -0.08259418606758118), (126, -0.0798434391617775), (127, -0.07267989218235016), (128, -0.06504584103822708), (129, -0.05788571387529373), (130, -0.04899580776691437), (131, -0.04311269521713257), (132, -0.03983059525489807), (133, -0.03800744190812111), (134, -0.03758789598941803), (135, -0.03829933702945709), (136, -0.038932252675294876), (137, -0.038166169077157974), (138, -0.034746959805488586), (139, -0.02962665818631649), (140, -0.0210789255797863), (141, -0.012514269910752773), (142, -0.0049774558283388615), (143, 9.287148714065552e-06), (144, 0.0015545791247859597), (145, 0.0013363403268158436), (146, 0.00022085013915784657), (147, -0.0023547173477709293), (148, -0.004791687708348036), (149, -0.006929977796971798), (150, -0.019109878689050674), (151, -0.0219474695622921), (152, -0.021252943202853203), (153, -0.013356725685298443), (154, -0.0017652930691838264), (155, 0.018845606595277786), (156, 0.0392562597990036), (157, 0.055644690990448), (158, 0.05741938203573227), (159, 0.04996196925640106), (160, 0.04250028729438782), (161, 0.03967346251010895), (162, 0.035758957266807556), (163, 0.03443959727883339), (164, 0.034222476184368134), (165, 0.033518001437187195), (166, 0.02993602678179741), (167, 0.02358183264732361), (168, 0.0198228619992733), (169, 0.014737231656908989), (170, 0.011283636093139648), (171, 0.0071409959346055984), (172, 0.0008739159675315022), (173, -0.004654262214899063), (174, -0.00946732796728611), (175, -0.01376383937895298), (176, -0.017752492800354958), (177, -0.0215192548930645), (178, -0.024917401373386383), (179, -0.02784110978245735), (180, -0.030188508331775665), (181, -0.03016144596040249), (182, -0.03158922120928764), (183, -0.0326109416782856), (184, -0.03450130671262741), (185, -0.03728502616286278), (186, -0.04147667810320854), (187, -0.04839020594954491), (188, -0.05727497115731239), (189, -0.06751056015491486), (190, -0.07670664042234421), (191, -0.08262615650892258), (192, -0.07854021340608597), (193, -0.0737273320555687), (194, -0.06564231961965561), (195, -0.05487537384033203), (196, -0.047285351902246475), (197, -0.046210143715143204), (198, -0.0505688339471817), (199, -0.055907685309648514), (200, -0.05868856981396675), (201, -0.05946384370326996), (202, -0.058336976915597916), (203, -0.05575766786932945), (204, -0.052124522626399994), (205, -0.047798264771699905), (206, -0.043460581451654434), (207, -0.039817944169044495), (208, -0.03726673126220703), (209, -0.036019522696733475), (210, -0.0360390767455101), (211, -0.03666127473115921), (212, -0.037059541791677475), (213, -0.036739531904459), (214, -0.03522765636444092), (215, -0.03178376331925392), (216, -0.026536591351032257), (217, -0.02088674157857895), (218, -0.015603999607264996), (219, -0.011094063520431519), (220, -0.007882577367126942), (221, -0.005867411848157644), (222, -0.004884878173470497), (223, -0.004577867221087217), (224, -0.00451963534578681), (225, -0.005630778148770332), (226, -0.012522822245955467), (227, -0.026351524516940117), (228, -0.04284306988120079), (229, -0.060851190239191055), (230, -0.07522346079349518), (231, -0.07421296089887619), (232, -0.07388501614332199), (233, -0.06770162284374237), (234, -0.05960168316960335), (235, -0.045579396188259125), (236, -0.033807139843702316), (237, -0.03456241637468338), (238, -0.03593601658940315), (239, -0.038807131350040436), (240, -0.03951023891568184), (241, -0.038199618458747864), (242, -0.035305965691804886), (243, -0.0315837636590004), (244, -0.027967657893896103), (245, -0.0244709774851799), (246, -0.021473878994584084), (247, -0.01994408667087555), (248, -0.02057923562824726), (249, -0.023190699517726898), (250, -0.02642826735973358), (251, -0.028684064745903015), (252, -0.030829304829239845), (253, -0.0291054155677557), (254, -0.028631335124373436), (255, -0.027678314596414566), (256, -0.025230256840586662), (257, -0.02595992013812065), (258, -0.027365710586309433), (259, -0.027761155739426613), (260, -0.028116730973124504), (261, -0.028630679473280907), (262, -0.029638327658176422), (263, -0.03157126531004906), (264, -0.03456490859389305), (265, -0.037171997129917145), (266, -0.03874652832746506), (267, -0.04189762845635414), (268, -0.0486895926296711), (269, -0.05867032706737518), (270, -0.07043097168207169), (271, -0.08158552646636963), (272, -0.08761108666658401), (273, -0.08396049588918686), (274, -0.07212574034929276), (275, -0.05832221731543541), (276, -0.04541328549385071), (277, -0.03506261855363846), (278, -0.029253896325826645), (279, -0.025223838165402412), (280, -0.023505261167883873), (281, -0.017617376521229744), (282, -0.008226480334997177), (283, 0.0008250122191384435), (284, 0.006093387492001057), (285, 0.006948227062821388), (286, 0.008430545218288898), (287, 0.007899686694145203), (288, 0.006593828089535236), (289, 0.0050626154989004135), (290, 0.003097739303484559), (291, 0.0009569210815243423), (292, 4.4119544327259064e-05), (293, 0.00038132350891828537), (294, 0.0021329193841665983), (295, 0.004660597536712885)], ('rotation_euler', 2): [(1, 0.014690498821437359), (2, 0.015397061593830585), (3, 0.016506537795066833), (4, 0.01858399622142315), (5, 0.021131081506609917), (6, 0.023309778422117233), (7, 0.024435799568891525), (8, 0.024292876943945885), (9, 0.023397915065288544), (10, 0.019885798916220665), (11, 0.016750618815422058), (12, 0.018749836832284927), (13, 0.01902378536760807), (14, 0.015677833929657936), (15, 0.011384728364646435), (16, 0.00798352062702179), (17, 0.003327846061438322), (18, 6.357567326631397e-05), (19, -0.002094707451760769), (20, -0.005998407956212759), (21, -0.01083961222320795), (22, -0.016983283683657646), (23, -0.024245072156190872), (24, -0.03171170502901077), (25, -0.03820601850748062), (26, -0.043028175830841064), (27, -0.04609926417469978), (28, -0.04780932143330574), (29, -0.04855141416192055), (30, -0.04857553914189339), (31, -0.047953732311725616), (32, -0.04657801240682602), (33, -0.04461890831589699), (34, -0.04311269149184227), (35, -0.04188819229602814), (36, -0.040930215269327164), (37, -0.03977596387267113), (38, -0.03793927654623985), (39, -0.035484783351421356), (40, -0.03266182914376259), (41, -0.029941288754343987), (42, -0.028028234839439392), (43, -0.027151543647050858), (44, -0.027073267847299576), (45, -0.027492452412843704), (46, -0.02810610458254814), (47, -0.02845209836959839), (48, -0.02800082415342331), (49, -0.026287129148840904), (50, -0.023000702261924744), (51, -0.018345579504966736), (52, -0.012734157964587212), (53, -0.006985649466514587), (54, -0.0017414669273421168), (55, 0.0034623341634869576), (56, 0.008920107036828995), (57, 0.015070048160851002), (58, 0.022207196801900864), (59, 0.029343275353312492), (60, 0.035454459488391876), (61, 0.03964386135339737), (62, 0.04133441299200058), (63, 0.04202953726053238), (64, 0.03929707407951355), (65, 0.039963074028491974), (66, 0.042561355978250504), (67, 0.04491795226931572), (68, 0.04698493331670761), (69, 0.047445010393857956), (70, 0.044072214514017105), (71, 0.03800545260310173), (72, 0.03370768576860428), (73, 0.033466748893260956), (74, 0.03648921847343445), (75, 0.041516419500112534), (76, 0.046110816299915314), (77, 0.04771099239587784), (78, 0.047407105565071106), (79, 0.04688124731183052), (80, 0.046179644763469696), (81, 0.04475976526737213), (82, 0.0416143424808979), (83, 0.03617208078503609), (84, 0.029187306761741638), (85, 0.023585587739944458), (86, 0.020757749676704407), (87, 0.018386004492640495), (88, 0.019267749041318893), (89, 0.021847570315003395), (90, 0.02669539861381054), (91, 0.03151942417025566), (92, 0.035462941974401474), (93, 0.03883429989218712), (94, 0.04125137999653816), (95, 0.04244118928909302), (96, 0.04248003289103508), (97, 0.04160957783460617), (98, 0.040136147290468216), (99, 0.03832424432039261), (100, 0.03638556972146034), (101, 0.03460763394832611), (102, 0.03345489129424095), (103, 0.032905153930187225), (104, 0.032840702682733536), (105, 0.03407902643084526), (106, 0.03821505233645439), (107, 0.0422954186797142), (108, 0.04494347423315048), (109, 0.046747852116823196), (110, 0.04617287963628769), (111, 0.04221024364233017), (112, 0.03547990694642067), (113, 0.027943436056375504), (114, 0.02172577567398548), (115, 0.019584327936172485), (116, 0.022154757753014565), (117, 0.02716916613280773), (118, 0.0334860160946846), (119, 0.039392806589603424), (120, 0.043277282267808914), (121, 0.04595906287431717), (122, 0.049665216356515884), (123, 0.05160678178071976), (124, 0.05006682127714157), (125, 0.04619210958480835), (126, 0.04147440567612648), (127, 0.037418533116579056), (128, 0.036512404680252075), (129, 0.0385085791349411), (130, 0.03786364570260048), (131, 0.0380411259829998), (132, 0.03905583173036575), (133, 0.04107453674077988), (134, 0.04396775737404823), (135, 0.04728113114833832), (136, 0.05020091310143471), (137, 0.052531879395246506), (138, 0.054068852216005325), (139, 0.05786105990409851), (140, 0.05941469967365265), (141, 0.06049172207713127), (142, 0.06252668797969818), (143, 0.06572483479976654), (144, 0.06895682215690613), (145, 0.0728045105934143), (146, 0.07993889600038528), (147, 0.09082672744989395), (148, 0.10016463696956635), (149, 0.10211197286844254), (150, 0.10642976313829422), (151, 0.08698039501905441), (152, 0.07240225374698639), (153, 0.06431719660758972), (154, 0.06413553655147552), (155, 0.05988399684429169), (156, 0.06471604853868484), (157, 0.07557404041290283), (158, 0.08191005140542984), (159, 0.08437442779541016), (160, 0.0871894359588623), (161, 0.09150112420320511), (162, 0.09134438633918762), (163, 0.08755628019571304), (164, 0.07906928658485413), (165, 0.06692913919687271), (166, 0.05617419257760048), (167, 0.04914286732673645), (168, 0.03978144749999046), (169, 0.035126060247421265), (170, 0.035090576857328415), (171, 0.03634098544716835), (172, 0.03598174452781677), (173, 0.03438107669353485), (174, 0.03223266452550888), (175, 0.030092382803559303), (176, 0.027681469917297363), (177, 0.02453724667429924), (178, 0.020368723198771477), (179, 0.015426808968186378), (180, 0.012248548679053783), (181, 0.010581443086266518), (182, 0.006949993781745434), (183, 0.005419094115495682), (184, 0.006167593877762556), (185, 0.008004087023437023), (186, 0.009736751206219196), (187, 0.011414149776101112), (188, 0.01173772569745779), (189, 0.008969578891992569), (190, 0.005536013748496771), (191, 0.0027774518821388483), (192, 0.004099056124687195), (193, 0.004574224352836609), (194, 0.0070498110726475716), (195, 0.010753321461379528), (196, 0.011252467520534992), (197, 0.006410533096641302), (198, 0.0006916498532518744), (199, -0.005492907948791981), (200, -0.01152460090816021), (201, -0.014366415329277515), (202, -0.01415341068059206), (203, -0.011573362164199352), (204, -0.007948879152536392), (205, -0.004213244188576937), (206, -0.0004828792007174343), (207, 0.002560544991865754), (208, 0.0037576714530587196), (209, 0.002856395673006773), (210, 0.0004159305535722524), (211, -0.002560041844844818), (212, -0.004601011518388987), (213, -0.00471799960359931), (214, -0.003071957966312766), (215, -0.0001498686906415969), (216, 0.0032546347938477993), (217, 0.00610375078395009), (218, 0.008194533176720142), (219, 0.00954829715192318), (220, 0.010188366286456585), (221, 0.010733217932283878), (222, 0.011765697039663792), (223, 0.01387959998100996), (224, 0.01818908005952835), (225, 0.025425918400287628), (226, 0.039760880172252655), (227, 0.0587010532617569), (228, 0.0707056075334549), (229, 0.07546157389879227), (230, 0.08603446930646896), (231, 0.072727732360363), (232, 0.060460906475782394), (233, 0.05269734561443329), (234, 0.04880167543888092), (235, 0.03952496126294136), (236, 0.03517957031726837), (237, 0.030278710648417473), (238, 0.03109160251915455), (239, 0.0343780592083931), (240, 0.03977040946483612), (241, 0.04483053460717201), (242, 0.048133447766304016), (243, 0.04916016757488251), (244, 0.04793018847703934), (245, 0.045605145394802094), (246, 0.043429356068372726), (247, 0.04197849705815315), (248, 0.04114159196615219), (249, 0.04052369296550751), (250, 0.040048081427812576), (251, 0.03972941264510155), (252, 0.038380566984415054), (253, 0.03832413628697395), (254, 0.036143865436315536), (255, 0.0330301858484745), (256, 0.03006528504192829), (257, 0.026978595182299614), (258, 0.02387530915439129), (259, 0.01914227567613125), (260, 0.01539247203618288), (261, 0.012978607788681984), (262, 0.011734054423868656), (263, 0.012041944079101086), (264, 0.01501369383186102), (265, 0.020341258496046066), (266, 0.026664160192012787), (267, 0.03286581113934517), (268, 0.039008162915706635), (269, 0.04492875933647156), (270, 0.04941288009285927), (271, 0.054014481604099274), (272, 0.059061449021101), (273, 0.0635562539100647), (274, 0.06905018538236618), (275, 0.07526382803916931), (276, 0.08107160031795502), (277, 0.08498993515968323), (278, 0.084328792989254), (279, 0.07905135303735733), (280, 0.0773969441652298), (281, 0.07222148776054382), (282, 0.064430370926857), (283, 0.057102397084236145), (284, 0.05250735580921173), (285, 0.05072742700576782), (286, 0.044961124658584595), (287, 0.040833376348018646), (288, 0.03772331401705742), (289, 0.034775327891111374), (290, 0.03142930194735527), (291, 0.02794644795358181), (292, 0.02477625198662281), (293, 0.02162613347172737), (294, 0.019994385540485382), (295, 0.016127584502100945)]})}
\ No newline at end of file
@@ -0,0 +1,307 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Streaming shake exporters.
+#
+# A shake is exported from a sampler, which hands out its samples one
+# window of frames at a time, to a writer for one of the EXPORT_FORMATS.
+# Samples and text only ever exist for one chunk of frames, so exporting
+# an hours-long take doesn't need more memory than exporting a short one.
+# The exceptions are ActionSampler, which keeps curves keyed on every
+# frame as float32, and key reduction, see _write_reduced_channel().
+#
+# A sampler is any object with:
+#
+#   keys         list of (data_path, array_index), one per channel
+#   frame_start  first frame, inclusive
+#   frame_end    last frame, inclusive
+#   sample(frame_start, frame_end, columns=None)
+#                float32 array of shape (frames, len(columns)) holding the
+#                requested channels (all of them for None)
+#
+# action_utils.ActionSampler samples an action, ClipSampler a ShakeClip.
+#
+# Formats that can hold keys on arbitrary frames (`sparse` writers) can be
+# given tolerances, and then get each channel reduced with shake_reduce
+# instead of one key per frame.
+#
+# This module doesn't depend on bpy.
+
+import json
+import math
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from .shake_library import (
+    CHANNEL_END, SHAKE_LIST_BEGIN, SHAKE_LIST_END,
+    format_channel_begin, format_points, format_shake_begin, format_shake_end,
+)
+from .shake_metrics import timed_function
+from .shake_reduce import reduce_channel
+
+EXPORT_CHUNK_SIZE = 4096
+
+
+class ClipSampler:
+    """Sampler over the channel arrays of a ShakeClip"""
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.keys = list(clip.channels)
+        self.frame_start = clip.frame_start
+        self.frame_end = clip.frame_start + clip.frame_count - 1
+
+    def sample(self, frame_start, frame_end, columns=None):
+        if columns is None:
+            columns = range(len(self.keys))
+        begin = frame_start - self.clip.frame_start
+        end = frame_end - self.clip.frame_start + 1
+        out = np.empty((end - begin, len(columns)), dtype=np.float32)
+        for out_column, column in enumerate(columns):
+            samples = self.clip.channels[self.keys[column]]
+            out[:, out_column] = np.frombuffer(samples, dtype=np.float32)[begin:end]
+        return out
+
+
+class ShakeWriter:
+    """Base class of the export formats"""
+
+    label = ""
+    extension = ""
+    # "rows" writers get every channel of a window of frames at a time,
+    # "channels" writers get one channel of a window at a time, channel
+    # after channel.
+    layout = "rows"
+    # Whether the format can hold keys on arbitrary frames.  Only "channels"
+    # writers can be.
+    sparse = False
+
+    def __init__(self, f, sampler, shake_id, shake_name, fps, tags=None):
+        self.f = f
+        self.sampler = sampler
+        self.shake_id = shake_id
+        self.shake_name = shake_name
+        self.fps = fps
+        self.tags = dict(tags) if tags else {}
+        # Indices into sampler.keys of the channels this writer exports.
+        self.columns = list(range(len(sampler.keys)))
+
+    def begin(self):
+        pass
+
+    def end(self):
+        pass
+
+    # Rows layout.
+    def write_rows(self, frames, values):
+        raise NotImplementedError
+
+    # Channels layout.
+    def begin_channel(self, key):
+        pass
+
+    def write_channel(self, frames, values):
+        raise NotImplementedError
+
+    def end_channel(self):
+        pass
+
+
+# Writes the SHAKE_LIST Python format read by the shake importer, with the
+# pieces of shake_library.format_shake_list().
+class PythonShakeWriter(ShakeWriter):
+    label = "Python (SHAKE_LIST)"
+    extension = ".py"
+    layout = "channels"
+    sparse = True
+
+    def begin(self):
+        self.f.write(SHAKE_LIST_BEGIN)
+        self.f.write(format_shake_begin(self.shake_id, self.shake_name, self.fps))
+
+    def begin_channel(self, key):
+        self.f.write(format_channel_begin(key))
+        self.first = True
+
+    def write_channel(self, frames, values):
+        if not self.first:
+            self.f.write(", ")
+        self.f.write(format_points(frames.tolist(), values.tolist()))
+        self.first = False
+
+    def end_channel(self):
+        self.f.write(CHANNEL_END)
+
+    def end(self):
+        self.f.write(format_shake_end(self.tags))
+        self.f.write(SHAKE_LIST_END)
+
+
+# One JSON object per line: a header describing the shake, then one
+# {"frame": ..., "values": [...]} line per frame with the values in the
+# order of the header's "channels".
+class JsonLinesShakeWriter(ShakeWriter):
+    label = "JSON Lines"
+    extension = ".jsonl"
+
+    def begin(self):
+        header = {
+            "id": self.shake_id,
+            "name": self.shake_name,
+            "fps": float(self.fps),
+            "tags": self.tags,
+            "frame_start": self.sampler.frame_start,
+            "frame_end": self.sampler.frame_end,
+            "channels": [list(self.sampler.keys[column]) for column in self.columns],
+        }
+        self.f.write(json.dumps(header) + "\n")
+        self.row_format = '{"frame": %d, "values": [' + ", ".join(["%.6f"] * len(self.columns)) + "]}"
+
+    def write_rows(self, frames, values):
+        _write_table(self.f, self.row_format, frames, values)
+
+
+# Comma separated, with a header row of "frame" and one column per channel
+# named like "location[0]".
+class CsvShakeWriter(ShakeWriter):
+    label = "CSV"
+    extension = ".csv"
+
+    def begin(self):
+        names = ["{}[{}]".format(*self.sampler.keys[column]) for column in self.columns]
+        self.f.write(",".join(["frame"] + names) + "\n")
+        self.row_format = ",".join(["%d"] + ["%.6f"] * len(self.columns))
+
+    def write_rows(self, frames, values):
+        _write_table(self.f, self.row_format, frames, values)
+
+
+# Nuke .chan: one line per frame of "frame tx ty tz rx ry rz", rotations in
+# degrees.  Channels the shake doesn't animate are written as 0.
+class NukeChanShakeWriter(ShakeWriter):
+    label = "Nuke .chan"
+    extension = ".chan"
+
+    CHANNELS = (
+        ("location", 0), ("location", 1), ("location", 2),
+        ("rotation_euler", 0), ("rotation_euler", 1), ("rotation_euler", 2),
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        keys = self.sampler.keys
+        # (output column, sampler column) of every channel that exists.
+        self.mapping = [
+            (out_column, keys.index(key))
+            for out_column, key in enumerate(self.CHANNELS) if key in keys
+        ]
+        self.columns = [column for _, column in self.mapping]
+        self.row_format = " ".join(["%d"] + ["%.6f"] * len(self.CHANNELS))
+
+    def write_rows(self, frames, values):
+        table = np.zeros((len(frames), len(self.CHANNELS)), dtype=np.float64)
+        for i, (out_column, _) in enumerate(self.mapping):
+            table[:, out_column] = values[:, i]
+        table[:, 3:] *= 180.0 / math.pi
+        _write_table(self.f, self.row_format, frames, table)
+
+
+EXPORT_FORMATS = OrderedDict((
+    ('PY', PythonShakeWriter),
+    ('JSONL', JsonLinesShakeWriter),
+    ('CSV', CsvShakeWriter),
+    ('CHAN', NukeChanShakeWriter),
+))
+
+
+def _write_table(f, row_format, frames, values):
+    table = np.empty((len(frames), values.shape[1] + 1), dtype=np.float64)
+    table[:, 0] = frames
+    table[:, 1:] = values
+    np.savetxt(f, table, fmt=row_format)
+
+
+# Windows of at most chunk_size frames covering frame_start..frame_end.
+def _chunks(frame_start, frame_end, chunk_size):
+    for start in range(frame_start, frame_end + 1, chunk_size):
+        yield start, min(start + chunk_size - 1, frame_end)
+
+
+# Writes one channel reduced to the keys that keep it within `tolerance`.
+# Reduction needs the whole channel, so it's sampled in one go; that's one
+# float32 per frame, for a single channel.  Returns the number of keys.
+def _write_reduced_channel(writer, sampler, column, tolerance):
+    values = sampler.sample(sampler.frame_start, sampler.frame_end, [column])[:, 0]
+    keep = reduce_channel(values, tolerance)
+    writer.write_channel(keep + sampler.frame_start, values[keep])
+    return len(keep)
+
+
+# Writes the shake in `sampler` to the text file object `f` in the format
+# `format_id` (a key of EXPORT_FORMATS), see export_shake().
+def write_shake(f, format_id, sampler, shake_id, shake_name, fps, chunk_size=EXPORT_CHUNK_SIZE, tolerances=None, tags=None):
+    frame_count = sampler.frame_end - sampler.frame_start + 1
+    key_count = 0
+    writer = EXPORT_FORMATS[format_id](f, sampler, shake_id, shake_name, fps, tags)
+    writer.begin()
+    if writer.layout == "channels":
+        for column in writer.columns:
+            key = sampler.keys[column]
+            tolerance = (tolerances or {}).get(key[0], 0.0) if writer.sparse else 0.0
+            writer.begin_channel(key)
+            if tolerance > 0.0:
+                key_count += _write_reduced_channel(writer, sampler, column, tolerance)
+            else:
+                for start, end in _chunks(sampler.frame_start, sampler.frame_end, chunk_size):
+                    values = sampler.sample(start, end, [column])
+                    writer.write_channel(np.arange(start, end + 1), values[:, 0])
+                key_count += frame_count
+            writer.end_channel()
+    else:
+        for start, end in _chunks(sampler.frame_start, sampler.frame_end, chunk_size):
+            values = sampler.sample(start, end, writer.columns)
+            writer.write_rows(np.arange(start, end + 1), values)
+        key_count = frame_count * len(writer.columns)
+    writer.end()
+    return key_count, frame_count * len(writer.columns)
+
+
+# Exports the shake in `sampler` to `path` in the format `format_id` (a key
+# of EXPORT_FORMATS), at `fps` frames per second.  The file is written
+# next to `path` and then moved into place, so a failed export never
+# leaves a truncated file behind.
+#
+# `tolerances` optionally maps data paths (e.g. "location") to the largest
+# error allowed when reducing their channels, for sparse formats.  `tags`
+# is a {str: str} dict of metadata such as the author, written by the
+# formats that can hold it.  Returns the number of keys written and of
+# samples they stand for.
+@timed_function()
+def export_shake(path, format_id, sampler, shake_id, shake_name, fps, chunk_size=EXPORT_CHUNK_SIZE, tolerances=None, tags=None):
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            counts = write_shake(f, format_id, sampler, shake_id, shake_name, fps, chunk_size, tolerances, tags)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return counts
@@ -0,0 +1,260 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Searchable index of a shake library.
+#
+# For every shake the index holds what shakes are filtered and sorted on:
+# name, the "author" and "type" tags, whether the shake moves the camera
+# (3D) or only turns it (2D), its duration and fps, and per channel the
+# RMS amplitude and dominant frequency.
+#
+# The statistics need channel data, so ShakeIndex.update() only computes
+# them for shakes that are new or changed since the last update, and the
+# index is saved as JSON next to the library.  The bundled library ships
+# with its index, made with:
+#
+#   python shake_index.py shake_data.shklib shake_data.index.json
+#
+# and a new store takes its statistics from there with ShakeIndex.seed(),
+# so none are computed when the addon is first enabled.  Queries then never touch
+# channel data, and their results are kept until the next update, so a
+# list redrawing with the same filter costs a dict lookup.
+#
+# This module doesn't depend on bpy.
+
+import json
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+INDEX_VERSION = 2
+
+# Most query results kept between updates.
+QUERY_CACHE_SIZE = 64
+
+# Location RMS, in scene units, below which a shake counts as not moving
+# the camera.
+LOCATION_RMS_MIN = 1e-6
+
+# Statistics of one shake.  `content_hash` is ShakeClip.content_hash(),
+# and `channels` a tuple of (data_path, array_index, rms, frequency) with
+# the frequency in Hz.  `location_rms`
+# and `rotation_rms` are the RMS lengths of the location and rotation
+# motion, and `frequency` is the RMS-weighted mean dominant frequency of
+# the channels.
+ShakeStats = namedtuple(
+    "ShakeStats",
+    "id name author type dimensions duration fps channels location_rms rotation_rms frequency content_hash",
+)
+
+# Sort keys of ShakeIndex.query(), by name.
+SORT_KEYS = {
+    "name": lambda stats: stats.name.lower(),
+    "author": lambda stats: (stats.author.lower(), stats.name.lower()),
+    "duration": lambda stats: stats.duration,
+    "location_rms": lambda stats: stats.location_rms,
+    "rotation_rms": lambda stats: stats.rotation_rms,
+    "frequency": lambda stats: stats.frequency,
+}
+
+
+# Computes the statistics of a ShakeClip.
+def shake_stats(clip):
+    channels = []
+    location_power = 0.0
+    rotation_power = 0.0
+    weighted_frequency = 0.0
+    for (data_path, array_index), samples in clip.channels.items():
+        data = np.frombuffer(samples, dtype=np.float32).astype(np.float64)
+        data -= data.mean() if len(data) > 0 else 0.0
+        rms = float(np.sqrt(np.mean(data**2))) if len(data) > 0 else 0.0
+        frequency = 0.0
+        if len(data) > 2 and rms > 0.0:
+            spectrum = np.abs(np.fft.rfft(data))
+            frequency = float(np.argmax(spectrum[1:]) + 1) * clip.fps / len(data)
+        channels.append((data_path, array_index, rms, frequency))
+        if data_path.startswith("location"):
+            location_power += rms**2
+        elif data_path.startswith("rotation"):
+            rotation_power += rms**2
+        weighted_frequency += rms * frequency
+    total_rms = sum(channel[2] for channel in channels)
+    location_rms = float(np.sqrt(location_power))
+    return ShakeStats(
+        clip.id,
+        clip.name,
+        clip.tags.get("author", ""),
+        clip.tags.get("type", ""),
+        "3D" if location_rms > LOCATION_RMS_MIN else "2D",
+        clip.frame_count / clip.fps,
+        clip.fps,
+        tuple(channels),
+        location_rms,
+        float(np.sqrt(rotation_power)),
+        weighted_frequency / total_rms if total_rms > 0.0 else 0.0,
+        clip.content_hash(),
+    )
+
+
+# Reads the (revision, ShakeStats) entries of an index file.  A missing or
+# unreadable file, or one of another INDEX_VERSION, has none.
+def _read_entries(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            return []
+        entries = []
+        for revision, fields in data["shakes"]:
+            fields["channels"] = tuple(tuple(channel) for channel in fields["channels"])
+            entries.append((revision, ShakeStats(**fields)))
+        return entries
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return []
+
+
+class ShakeIndex:
+    """Shake statistics of a library, saved to a JSON file"""
+
+    def __init__(self, path):
+        self.path = path
+        # {shake id: (revision, ShakeStats)}, in library order.
+        self._entries = {}
+        self._search_text = {}
+        self._queries = {}
+        self._load()
+
+    # If the file is missing or unreadable, update() rebuilds the index.
+    def _load(self):
+        for entry in _read_entries(self.path):
+            self._set(*entry)
+
+    def _save(self):
+        data = {
+            "version": INDEX_VERSION,
+            "shakes": [[revision, stats._asdict()] for revision, stats in self._entries.values()],
+        }
+        # Named after the process, as Blenders may save the index at once.
+        tmp_path = "{}.{}.tmp".format(self.path, os.getpid())
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    def _set(self, revision, stats):
+        self._entries[stats.id] = (revision, stats)
+        self._search_text[stats.id] = " ".join((stats.name, stats.id, stats.author, stats.type)).lower()
+
+    # Brings the index in line with `library` (a ShakeLibrary or
+    # ShakeStore).  `revision(shake_id)` identifies a shake's content;
+    # only shakes whose revision changed are read.  Saves the index if
+    # anything changed.
+    def update(self, library, revision):
+        old_entries = self._entries
+        self._entries = {}
+        self._search_text = {}
+        self._queries.clear()
+        changed = len(old_entries) != len(library)
+        for shake_id in library.keys():
+            shake_revision = revision(shake_id)
+            entry = old_entries.get(shake_id)
+            if entry is not None and entry[0] == shake_revision:
+                self._set(*entry)
+                continue
+            self._set(shake_revision, shake_stats(library.clip(shake_id)))
+            changed = True
+        if changed or list(old_entries) != list(self._entries):
+            self._save()
+
+    # Takes the statistics of `library`'s shakes from the index file `path`,
+    # made for another copy of the same shakes, such as the index shipped
+    # with the bundled library.  Shakes the file doesn't have, or has with
+    # another name, fps or duration, are left to update().  Saves the index
+    # if it took any.
+    def seed(self, path, library, revision):
+        self._queries.clear()
+        seeded = False
+        for _, stats in _read_entries(path):
+            if stats.id not in library:
+                continue
+            info = library.info(stats.id)
+            if (info.name, info.fps, info.frame_count / info.fps) == (stats.name, stats.fps, stats.duration):
+                self._set(revision(stats.id), stats)
+                seeded = True
+        if seeded:
+            self._save()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, shake_id):
+        return shake_id in self._entries
+
+    def __getitem__(self, shake_id) -> ShakeStats:
+        return self._entries[shake_id][1]
+
+    def get(self, shake_id, default=None):
+        entry = self._entries.get(shake_id)
+        return default if entry is None else entry[1]
+
+    # Returns the ShakeStats of the shakes matching all given filters,
+    # sorted by one of SORT_KEYS.  `text` is matched case-insensitively
+    # against the name, id, author and type; `author`, `type` and
+    # `dimensions` ("2D" or "3D") must match exactly.
+    def query(self, *args, **kwargs):
+        return self._query(*args, **kwargs)[0]
+
+    # Like query(), but returns a {shake id: position} dict of the matches.
+    def ranks(self, *args, **kwargs):
+        return self._query(*args, **kwargs)[1]
+
+    def _query(self, text="", author=None, type=None, dimensions=None,
+               min_duration=None, max_duration=None, sort="name", reverse=False):
+        key = (text, author, type, dimensions, min_duration, max_duration, sort, reverse)
+        result = self._queries.get(key)
+        if result is not None:
+            return result
+        text = text.lower()
+        matches = [
+            stats for shake_id, (_, stats) in self._entries.items()
+            if (not text or text in self._search_text[shake_id])
+            and (author is None or stats.author == author)
+            and (type is None or stats.type == type)
+            and (dimensions is None or stats.dimensions == dimensions)
+            and (min_duration is None or stats.duration >= min_duration)
+            and (max_duration is None or stats.duration <= max_duration)
+        ]
+        matches.sort(key=SORT_KEYS[sort], reverse=reverse)
+        if len(self._queries) >= QUERY_CACHE_SIZE:
+            self._queries.clear()
+        result = self._queries[key] = (matches, {stats.id: i for i, stats in enumerate(matches)})
+        return result
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python shake_index.py <library.shklib> <index.json>")
+        sys.exit(1)
+    from shake_library import ShakeLibrary
+    with ShakeLibrary(sys.argv[1]) as library:
+        if os.path.exists(sys.argv[2]):
+            os.remove(sys.argv[2])
+        index = ShakeIndex(sys.argv[2])
+        index.update(library, lambda shake_id: os.path.basename(sys.argv[1]))
+    print("Wrote the statistics of {} shakes to {}".format(len(index), sys.argv[2]))
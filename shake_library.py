@@ -0,0 +1,784 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Binary shake library format.
+#
+# A library file holds any number of shakes.  Every channel of a shake is
+# stored as a contiguous little-endian float32 array, and all channels of a
+# shake share one implicit frame axis (frame_start, frame_start + 1, ...).
+# The file is memory-mapped read-only when loaded, so several Blender
+# processes reading the same library share its pages.
+#
+# Layout:
+#
+#   header  magic, version, shake count, index offset, index size
+#   data    float32 channel arrays, each aligned to DATA_ALIGN bytes
+#   index   one record per shake:
+#             id, name, tags, fps, frame_start, frame_count, channel
+#             count, and per channel: data_path, array_index, data offset
+#
+# The index sits after the data so a library can be written in one pass.
+# Strings are stored as a u16 byte length followed by UTF-8 bytes.  Tags
+# are a JSON object of strings, e.g. {"author": ..., "type": ...}, and
+# were added in version 2; version 1 files are still read.
+#
+# This module doesn't depend on bpy, so it can also be used from plain
+# Python, e.g. to convert a SHAKE_LIST file:
+#
+#   python shake_library.py shake_data.py shake_data.shklib
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict, namedtuple
+
+MAGIC = b"SHKLIB\0\0"
+VERSION = 2
+READ_VERSIONS = (1, 2)
+DATA_ALIGN = 16
+
+_HEADER = struct.Struct("<8sIIQQ")
+_STR_LEN = struct.Struct("<H")
+_SHAKE = struct.Struct("<diIH")
+_CHANNEL = struct.Struct("<iQ")
+
+# Index record of a single shake.  `channels` is a tuple of
+# (data_path, array_index, data_offset) triples.
+ShakeInfo = namedtuple("ShakeInfo", "id name fps frame_start frame_count channels tags")
+
+
+class ShakeLibraryError(Exception):
+    pass
+
+
+class ShakeClip:
+    """A shake held in memory: one float32 array per channel on a shared frame axis"""
+
+    __slots__ = ("id", "name", "fps", "frame_start", "channels", "tags")
+
+    def __init__(self, id, name, fps, frame_start, channels, tags=None):
+        self.id = id
+        self.name = name
+        self.fps = float(fps)
+        self.frame_start = int(frame_start)
+        # {(data_path, array_index): array('f')}, all of the same length.
+        self.channels = channels
+        # Descriptive {str: str} metadata, e.g. "author" and "type".
+        self.tags = dict(tags) if tags else {}
+
+    @property
+    def frame_count(self):
+        for samples in self.channels.values():
+            return len(samples)
+        return 0
+
+    @property
+    def frames(self):
+        return range(self.frame_start, self.frame_start + self.frame_count)
+
+    @property
+    def nbytes(self):
+        return sum(samples.itemsize * len(samples) for samples in self.channels.values())
+
+    # A hex digest of the motion: fps, frames and samples, but not the id,
+    # name or tags.
+    def content_hash(self):
+        import hashlib
+        digest = hashlib.sha1("{!r} {}".format(self.fps, self.frame_start).encode("utf-8"))
+        for key in sorted(self.channels):
+            samples = self.channels[key]
+            if not isinstance(samples, array) or samples.typecode != "f":
+                samples = array("f", samples)
+            if sys.byteorder != "little":
+                samples = array("f", samples)
+                samples.byteswap()
+            digest.update("{}[{}]".format(*key).encode("utf-8"))
+            digest.update(samples.tobytes())
+        return digest.hexdigest()
+
+    def renamed(self, id, name=None):
+        return ShakeClip(id, self.name if name is None else name, self.fps, self.frame_start, self.channels, self.tags)
+
+    # Builds a clip from a shake in the legacy SHAKE_LIST layout:
+    # (name, fps, {(data_path, array_index): [(frame, value), ...]}),
+    # optionally followed by a {str: str} dict of tags.
+    #
+    # All channels must cover the same range of integer frames.  Channels
+    # with a key on every frame are taken as they are, which is what Camera
+    # Shakify itself produces.  Reduced channels, with keys on only some
+    # frames, are expanded back to one sample per frame, see shake_reduce.
+    @classmethod
+    def from_shake_list_entry(cls, shake_id, entry):
+        clip = cls.from_channel_points(entry[2], shake_id)
+        clip.id = shake_id
+        clip.name = entry[0]
+        clip.fps = float(entry[1])
+        if len(entry) > 3:
+            clip.tags = {str(k): str(v) for k, v in entry[3].items()}
+        return clip
+
+    # Builds an unnamed 24 fps clip from a {key: [(frame, value), ...]} dict.
+    @classmethod
+    def from_channel_points(cls, channel_points, shake_id=""):
+        frame_range = None
+        channels = {}
+        for key, points in channel_points.items():
+            if len(points) == 0:
+                raise ShakeLibraryError("Shake {} has an empty channel {}".format(shake_id, key))
+            frames = [point[0] for point in points]
+            if any(frame != int(frame) for frame in frames) or any(b <= a for a, b in zip(frames, frames[1:])):
+                raise ShakeLibraryError(
+                    "Shake {} channel {} is not keyed on increasing whole frames".format(shake_id, key)
+                )
+            if frame_range is None:
+                frame_range = (int(frames[0]), int(frames[-1]))
+            elif (int(frames[0]), int(frames[-1])) != frame_range:
+                raise ShakeLibraryError(
+                    "Shake {} channels don't share the same frame range".format(shake_id)
+                )
+            if len(points) == frame_range[1] - frame_range[0] + 1:
+                samples = array("f", [point[1] for point in points])
+            else:
+                try:
+                    from .shake_reduce import densify
+                except ImportError: # Run as a script.
+                    from shake_reduce import densify
+                samples = array("f", densify(frames, [point[1] for point in points]).astype("f").tobytes())
+            channels[(str(key[0]), int(key[1]))] = samples
+        return cls(shake_id, shake_id, 24.0, frame_range[0] if frame_range else 0, channels)
+
+    def to_shake_list_entry(self):
+        frames = self.frames
+        entry = (
+            self.name,
+            self.fps,
+            {key: list(zip(frames, samples.tolist())) for key, samples in self.channels.items()},
+        )
+        if self.tags:
+            entry += (dict(self.tags),)
+        return entry
+
+
+class ShakeLibrary:
+    """A read-only, memory-mapped shake library file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._shakes = {}
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_index(self):
+        buf = self._map
+        if len(buf) < _HEADER.size:
+            raise ShakeLibraryError("{} is not a shake library".format(self.path))
+        magic, version, count, index_offset, index_size = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ShakeLibraryError("{} is not a shake library".format(self.path))
+        if version not in READ_VERSIONS:
+            raise ShakeLibraryError(
+                "{} has unsupported shake library version {}".format(self.path, version)
+            )
+        if index_offset + index_size > len(buf):
+            raise ShakeLibraryError("{} is truncated".format(self.path))
+
+        pos = index_offset
+        for _ in range(count):
+            shake_id, pos = _unpack_str(buf, pos)
+            name, pos = _unpack_str(buf, pos)
+            tags = {}
+            if version >= 2:
+                tags_text, pos = _unpack_str(buf, pos)
+                tags = _parse_tags(tags_text, self.path)
+            fps, frame_start, frame_count, channel_count = _SHAKE.unpack_from(buf, pos)
+            pos += _SHAKE.size
+            channels = []
+            for _ in range(channel_count):
+                data_path, pos = _unpack_str(buf, pos)
+                array_index, offset = _CHANNEL.unpack_from(buf, pos)
+                pos += _CHANNEL.size
+                if offset + frame_count * 4 > index_offset:
+                    raise ShakeLibraryError("{} is truncated".format(self.path))
+                channels.append((data_path, array_index, offset))
+            self._shakes[shake_id] = ShakeInfo(
+                shake_id, name, fps, frame_start, frame_count, tuple(channels), tags
+            )
+
+    def close(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Channel views are still alive; the mapping is released
+                # once they are garbage collected.
+                pass
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._shakes)
+
+    def __iter__(self):
+        return iter(self._shakes)
+
+    def __contains__(self, shake_id):
+        return shake_id in self._shakes
+
+    def keys(self):
+        return self._shakes.keys()
+
+    def info(self, shake_id) -> ShakeInfo:
+        return self._shakes[shake_id]
+
+    # Returns the float32 samples of one channel.  On little-endian
+    # machines this is a zero-copy view into the mapped file.
+    def channel(self, shake_id, key):
+        info = self._shakes[shake_id]
+        for data_path, array_index, offset in info.channels:
+            if (data_path, array_index) == key:
+                return self._channel_view(offset, info.frame_count)
+        raise KeyError(key)
+
+    # Returns a {(data_path, array_index): samples} dict for a shake.
+    def channels(self, shake_id):
+        info = self._shakes[shake_id]
+        return {
+            (data_path, array_index): self._channel_view(offset, info.frame_count)
+            for data_path, array_index, offset in info.channels
+        }
+
+    def _channel_view(self, offset, frame_count):
+        view = memoryview(self._map)[offset:offset + frame_count * 4].cast("f")
+        if sys.byteorder != "little":
+            samples = array("f", view)
+            samples.byteswap()
+            return samples
+        return view
+
+    # Returns a shake as a ShakeClip.  Its channels are copies, so the
+    # clip stays valid after the library is closed or replaced.
+    def clip(self, shake_id) -> ShakeClip:
+        info = self._shakes[shake_id]
+        channels = {}
+        for key, view in self.channels(shake_id).items():
+            if isinstance(view, array):
+                channels[key] = view
+            else:
+                samples = array("f")
+                samples.frombytes(view.cast("B"))
+                channels[key] = samples
+        return ShakeClip(info.id, info.name, info.fps, info.frame_start, channels, info.tags)
+
+    def clips(self):
+        for shake_id in self._shakes:
+            yield self.clip(shake_id)
+
+
+def _unpack_str(buf, pos):
+    (length,) = _STR_LEN.unpack_from(buf, pos)
+    pos += _STR_LEN.size
+    return bytes(buf[pos:pos + length]).decode("utf-8"), pos + length
+
+
+def _parse_tags(text, path):
+    import json
+    try:
+        tags = json.loads(text)
+    except ValueError:
+        tags = None
+    if not isinstance(tags, dict) or not all(isinstance(v, str) for v in tags.values()):
+        raise ShakeLibraryError("{} has invalid shake tags {!r}".format(path, text))
+    return tags
+
+
+def _pack_str(text):
+    data = text.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ShakeLibraryError("String too long for shake library: {!r}...".format(text[:32]))
+    return _STR_LEN.pack(len(data)) + data
+
+
+# Returns Python source defining a SHAKE_LIST with the given clips, in
+# the format that the exporter writes and the importer reads.
+def format_shake_list(clips, value_format="{:.6f}"):
+    parts = [SHAKE_LIST_BEGIN]
+    for clip in clips:
+        parts.append(format_shake_begin(clip.id, clip.name, clip.fps))
+        for key, samples in clip.channels.items():
+            parts += [format_channel_begin(key), format_points(clip.frames, samples.tolist(), value_format), CHANNEL_END]
+        parts.append(format_shake_end(clip.tags))
+    parts.append(SHAKE_LIST_END)
+    return "".join(parts)
+
+
+# The pieces format_shake_list() is made of, which shake_export's
+# PythonShakeWriter also streams a shake with, a window at a time.
+SHAKE_LIST_BEGIN = "SHAKE_LIST = {\n"
+SHAKE_LIST_END = "}\n"
+CHANNEL_END = "],\n"
+
+
+def format_shake_begin(shake_id, name, fps):
+    return "    {!r}: ({!r}, {!r}, {{\n".format(shake_id, name, float(fps))
+
+
+def format_channel_begin(key):
+    return "        {!r}: [".format(key)
+
+
+# (frame, value) pairs, without the brackets around them.
+def format_points(frames, values, value_format="{:.6f}"):
+    return ", ".join("({}, {})".format(frame, value_format.format(value)) for frame, value in zip(frames, values))
+
+
+def format_shake_end(tags):
+    if tags:
+        return "    }}, {!r}),\n".format(dict(tags))
+    return "    }),\n"
+
+
+# The temporary file that `path` is written to before it's moved into
+# place.  Named after the process, so that Blenders writing the same file
+# at once, e.g. the workers of cli.py, don't write into each other's.
+def _tmp_path(path):
+    return "{}.{}.tmp".format(path, os.getpid())
+
+
+# Writes a library file from an iterable of ShakeClips.  The file is
+# written next to `path` and then moved into place, so readers never
+# see a half-written library.
+def write_library(path, clips):
+    import json
+    tmp_path = _tmp_path(path)
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(b"", 0, 0, 0, 0))  # Placeholder, patched below.
+        records = []
+        for clip in clips:
+            channel_records = []
+            for (data_path, array_index), samples in clip.channels.items():
+                if len(samples) != clip.frame_count:
+                    raise ShakeLibraryError(
+                        "Shake {} channels don't share the same frame range".format(clip.id)
+                    )
+                f.write(b"\0" * (-f.tell() % DATA_ALIGN))
+                offset = f.tell()
+                if not isinstance(samples, array) or samples.typecode != "f":
+                    samples = array("f", samples)
+                if sys.byteorder != "little":
+                    samples = array("f", samples)
+                    samples.byteswap()
+                samples.tofile(f)
+                channel_records.append(_pack_str(data_path) + _CHANNEL.pack(array_index, offset))
+            records.append(
+                _pack_str(clip.id)
+                + _pack_str(clip.name)
+                + _pack_str(json.dumps(clip.tags, sort_keys=True))
+                + _SHAKE.pack(clip.fps, clip.frame_start, clip.frame_count, len(channel_records))
+                + b"".join(channel_records)
+            )
+        index_offset = f.tell()
+        index_data = b"".join(records)
+        f.write(index_data)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, len(records), index_offset, len(index_data)))
+    os.replace(tmp_path, path)
+
+
+# A shake library directory: a manifest plus payload files.
+#
+#   manifest.json   {"version": 2, "next_payload": n,
+#                    "shakes": [[id, payload file, name, fps, frame_start,
+#                                frame_count, [[data_path, array_index,
+#                                data offset], ...], tags], ...]}
+#   <n>.shklib      payloads, shake library files as written by
+#                   write_library()
+#
+# Payloads are never changed once written.  Adding a shake writes it to
+# a new payload of its own and removing one only drops it from the
+# manifest, so both cost the same however big the library is.  The
+# manifest is replaced with write-temp-then-rename after every change,
+# and payloads are written the same way, so an interrupted change leaves
+# the previous library intact.  compact() packs the shakes into a single
+# payload and deletes the rest.
+#
+# A payload is only mapped once one of its shakes is read, so opening a
+# store reads just the manifest.
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+# Version 1 manifests have no tags.
+MANIFEST_READ_VERSIONS = (1, 2)
+
+
+class ShakeStore:
+    """A shake library directory of payload files listed in a manifest"""
+
+    def __init__(self, path):
+        self.path = path
+        self._shakes = {}
+        self._files = {}
+        self._payloads = {}
+        self._next_payload = 0
+        self._read_manifest()
+
+    # Creates a store at `path`, seeded with the shakes of the library
+    # file `seed_path`, if given.  The seed is copied in as one payload.
+    @classmethod
+    def create(cls, path, seed_path=None):
+        import json
+        os.makedirs(path, exist_ok=True)
+        manifest_path = os.path.join(path, MANIFEST_NAME)
+        with open(_tmp_path(manifest_path), "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "next_payload": 0, "shakes": []}, f)
+        os.replace(_tmp_path(manifest_path), manifest_path)
+        store = cls(path)
+        if seed_path is not None:
+            import shutil
+            name = store._new_payload_name()
+            shutil.copyfile(seed_path, _tmp_path(os.path.join(path, name)))
+            os.replace(_tmp_path(os.path.join(path, name)), os.path.join(path, name))
+            store._add_payload(name)
+            store._write_manifest()
+        return store
+
+    def _read_manifest(self):
+        import json
+        try:
+            with open(os.path.join(self.path, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as exc:
+            raise ShakeLibraryError("Can't read shake store {}: {}".format(self.path, exc))
+        if not isinstance(manifest, dict) or manifest.get("version") not in MANIFEST_READ_VERSIONS:
+            raise ShakeLibraryError("{} has an unsupported shake store manifest".format(self.path))
+        try:
+            self._next_payload = int(manifest["next_payload"])
+            for shake_id, file, name, fps, frame_start, frame_count, channels, *tags in manifest["shakes"]:
+                self._shakes[shake_id] = ShakeInfo(
+                    shake_id, name, fps, frame_start, frame_count,
+                    tuple((data_path, array_index, offset) for data_path, array_index, offset in channels),
+                    dict(tags[0]) if tags else {},
+                )
+                self._files[shake_id] = file
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ShakeLibraryError("{} has a malformed shake store manifest: {}".format(self.path, exc))
+
+    def _write_manifest(self):
+        import json
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "next_payload": self._next_payload,
+            "shakes": [
+                [info.id, self._files[info.id], info.name, info.fps, info.frame_start, info.frame_count,
+                 [list(channel) for channel in info.channels], info.tags]
+                for info in self._shakes.values()
+            ],
+        }
+        manifest_path = os.path.join(self.path, MANIFEST_NAME)
+        with open(_tmp_path(manifest_path), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(_tmp_path(manifest_path), manifest_path)
+
+    def _new_payload_name(self):
+        name = "{:08d}.shklib".format(self._next_payload)
+        self._next_payload += 1
+        return name
+
+    # Lists the shakes of a payload file.
+    def _add_payload(self, name):
+        with ShakeLibrary(os.path.join(self.path, name)) as payload:
+            for shake_id in payload:
+                self._shakes[shake_id] = payload.info(shake_id)
+                self._files[shake_id] = name
+
+    def _payload(self, shake_id):
+        name = self._files[shake_id]
+        payload = self._payloads.get(name)
+        if payload is None:
+            payload = ShakeLibrary(os.path.join(self.path, name))
+            self._payloads[name] = payload
+        return payload
+
+    def close(self):
+        for payload in self._payloads.values():
+            payload.close()
+        self._payloads.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._shakes)
+
+    def __iter__(self):
+        return iter(self._shakes)
+
+    def __contains__(self, shake_id):
+        return shake_id in self._shakes
+
+    def keys(self):
+        return self._shakes.keys()
+
+    def info(self, shake_id) -> ShakeInfo:
+        return self._shakes[shake_id]
+
+    # The payload file a shake is stored in.  Payloads never change, so
+    # this also identifies the shake's content.
+    def payload_name(self, shake_id):
+        return self._files[shake_id]
+
+    def channel(self, shake_id, key):
+        return self._payload(shake_id).channel(shake_id, key)
+
+    def channels(self, shake_id):
+        return self._payload(shake_id).channels(shake_id)
+
+    def clip(self, shake_id) -> ShakeClip:
+        return self._payload(shake_id).clip(shake_id)
+
+    def clips(self):
+        for shake_id in self._shakes:
+            yield self.clip(shake_id)
+
+    # Adds ShakeClips to the store, one payload file each.  Shakes with the
+    # id of an existing one replace it, in its place in the order.
+    def add(self, clips):
+        replaced = set()
+        for clip in clips:
+            name = self._new_payload_name()
+            write_library(os.path.join(self.path, name), [clip])
+            with ShakeLibrary(os.path.join(self.path, name)) as payload:
+                info = payload.info(clip.id)
+            if clip.id in self._shakes:
+                replaced.add(self._files[clip.id])
+            self._shakes[clip.id] = info
+            self._files[clip.id] = name
+        self._write_manifest()
+        self._delete_unused(replaced)
+
+    # Removes shakes from the store.  Unknown ids are ignored.
+    def remove(self, shake_ids):
+        removed = set()
+        for shake_id in shake_ids:
+            if shake_id in self._shakes:
+                del self._shakes[shake_id]
+                removed.add(self._files.pop(shake_id))
+        if len(removed) > 0:
+            self._write_manifest()
+            self._delete_unused(removed)
+
+    # Rewrites all shakes into one payload, and deletes every other
+    # payload of the store, including ones left behind by interrupted
+    # changes.  Other files, e.g. an index kept next to the manifest, are
+    # left alone.
+    def compact(self):
+        name = self._new_payload_name()
+        write_library(os.path.join(self.path, name), self.clips())
+        self.close()
+        self._shakes.clear()
+        self._files.clear()
+        self._add_payload(name)
+        self._write_manifest()
+        self._delete_unused([
+            file for file in os.listdir(self.path)
+            if file.endswith(".shklib") or _is_tmp_file(file)
+        ])
+
+    # Deletes payload files that no shake is stored in anymore.  Files
+    # that can't be deleted yet, e.g. because they're still mapped on
+    # Windows, are left for compact().
+    def _delete_unused(self, names):
+        used = set(self._files.values())
+        for name in names:
+            if name in used:
+                continue
+            payload = self._payloads.pop(name, None)
+            if payload is not None:
+                payload.close()
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                pass
+
+
+# Whether a file of a store is a payload or manifest temporary file, see
+# _tmp_path().
+def _is_tmp_file(name):
+    parts = name.split(".")
+    return (len(parts) >= 3 and parts[-1] == "tmp" and parts[-2].isdigit()
+            and (".".join(parts[:-2]).endswith(".shklib") or ".".join(parts[:-2]) == MANIFEST_NAME))
+
+
+class ShakeCache:
+    """A least-recently-used cache of decoded shakes, bounded by an approximate memory budget"""
+
+    def __init__(self, max_bytes, size_of):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._size_of = size_of
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # Returns the cached value for `key`, calling `load(key)` on a miss.
+    # Values bigger than the whole budget are returned but not kept.
+    def get(self, key, load):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        value = load(key)
+        size = self._size_of(value)
+        if size <= self.max_bytes:
+            self._entries[key] = (value, size)
+            self.bytes += size
+            self._evict()
+        return value
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.bytes -= size
+
+
+# Reads the shakes of a SHAKE_LIST Python source file as ShakeClips,
+# without executing it, see shake_parse.py.
+def read_shake_list_source(path):
+    return _read_shake_file(path)[0]
+
+
+def _read_shake_file(path):
+    try:
+        from .shake_parse import read_shake_file
+    except ImportError: # Run as a script.
+        from shake_parse import read_shake_file
+    return read_shake_file(path)
+
+
+# Result of reading one file with read_shake_list_sources().  `key_count`
+# is the number of (frame, value) keys in the file, `error` the reason a
+# file couldn't be read (its clips are then empty), and `seconds` how long
+# reading it took.
+ShakeSource = namedtuple("ShakeSource", "path clips key_count error seconds")
+
+
+def _read_shake_source(path):
+    import time
+    t0 = time.perf_counter()
+    try:
+        clips, key_count = _read_shake_file(path)
+        return ShakeSource(path, clips, key_count, None, time.perf_counter() - t0)
+    except (OSError, ValueError, ShakeLibraryError) as exc:
+        return ShakeSource(path, [], 0, "{}: {}".format(type(exc).__name__, exc), time.perf_counter() - t0)
+
+
+# Reads several SHAKE_LIST files concurrently, in up to `jobs` worker
+# processes (one per CPU for None).  Parsing is pure Python and holds the
+# GIL, so threads wouldn't read files in parallel.  A single file, or
+# jobs=1, is read in this process, since starting a worker costs more
+# than reading a typical file.  Returns a ShakeSource per path, in the
+# order of `paths`.  `progress(done, total)` is called on the calling
+# thread whenever a file is done.
+def read_shake_list_sources(paths, jobs=None, progress=None):
+    results = {}
+
+    def finish(source):
+        results[source.path] = source
+        if progress is not None:
+            progress(len(results), len(paths))
+
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs > 1:
+        try:
+            _read_in_workers(paths, jobs, finish)
+        except (OSError, RuntimeError) as exc:
+            # E.g. when the main script can't be imported without bpy,
+            # see the multiprocessing docs on the "spawn" start method.
+            print("Couldn't start shake reading processes, reading here: {}".format(exc))
+    for path in paths:
+        if path not in results:
+            finish(_read_shake_source(path))
+    return [results[path] for path in paths]
+
+
+# Reads `paths` in `jobs` worker processes, calling finish(ShakeSource)
+# for each file as it's done.
+def _read_in_workers(paths, jobs, finish):
+    import multiprocessing
+    import runpy
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    try:
+        from .shake_metrics import count, is_enabled, record
+    except ImportError: # Run as a script.
+        from shake_metrics import count, is_enabled, record
+    # Forking Blender isn't safe, workers are started as fresh processes.
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=runpy.run_path,
+        initargs=(os.path.join(os.path.dirname(os.path.abspath(__file__)), "shake_worker.py"), {"PACKAGE": __package__}),
+    ) as pool:
+        futures = [pool.submit(_read_shake_source, path) for path in paths]
+        for future in as_completed(futures):
+            source = future.result()
+            # Workers don't record timings, see shake_metrics.
+            if is_enabled():
+                record("parse_shake_file", source.seconds)
+                if source.error is None:
+                    count("bytes_parsed", os.path.getsize(source.path))
+            finish(source)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python shake_library.py <shake_data.py> <output.shklib>")
+        sys.exit(1)
+    source = read_shake_list_source(sys.argv[1])
+    write_library(sys.argv[2], source)
+    with ShakeLibrary(sys.argv[2]) as lib:
+        print("Wrote {} shakes to {}".format(len(lib), sys.argv[2]))
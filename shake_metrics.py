@@ -0,0 +1,118 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Opt-in timings and counters of addon operations.
+#
+# Functions wrapped with @timed_function() record their call count, total
+# and longest duration, and count() adds to named counters (empties
+# created, drivers added, ...).  Nested timers each count their full
+# time, so a rebuild's time includes the actions it built.
+#
+# Nothing is recorded until set_enabled(True), and while disabled a
+# wrapped function costs one extra call and a flag check.  Recording is
+# thread safe.  Worker processes have recording disabled, and what they
+# time is passed to record() by the process that started them.
+#
+# This module doesn't depend on bpy.
+
+import functools
+import json
+import os
+import threading
+import time
+
+_enabled = False
+_lock = threading.Lock()
+# {name: [calls, total seconds, longest seconds]}
+_timers = {}
+_counters = {}
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def reset():
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def count(name, amount=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+# Records one call of `name` that took `seconds`.
+def record(name, seconds):
+    with _lock:
+        timer = _timers.get(name)
+        if timer is None:
+            _timers[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+
+# Decorator recording every call of the function under `name`, by default
+# the function's own name.
+def timed_function(name=None):
+    def decorate(function):
+        timer_name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(timer_name, time.perf_counter() - t0)
+
+        return wrapper
+    return decorate
+
+
+# Returns everything recorded so far as a JSON-serializable dict, timers
+# by total time, longest first.
+def snapshot():
+    with _lock:
+        timers = sorted(_timers.items(), key=lambda item: -item[1][1])
+        return {
+            "timers": {
+                name: {"calls": calls, "seconds": seconds, "max_seconds": longest}
+                for name, (calls, seconds, longest) in timers
+            },
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def write_json(path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=1)
+    os.replace(tmp_path, path)
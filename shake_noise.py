@@ -0,0 +1,108 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Procedural camera shakes from seeded fractal noise.
+#
+# Every channel is a sum of octaves of 1D value noise.  Octave k has
+# round(cycles * 2**k) lattice cells per loop, so each octave repeats
+# exactly over the loop, and so does their sum.  The lattice is
+# interpolated with a cyclic Catmull-Rom spline, which keeps the curve
+# smooth across the loop point too.  All channels of an octave are
+# computed in one NumPy pass.
+#
+# The result is a ShakeClip like the ones in the shake library, so it goes
+# through the same loop action, export and bake code.  This module doesn't
+# depend on bpy.
+
+from array import array
+
+import numpy as np
+
+from .shake_library import ShakeClip
+
+# Frame rate of generated clips.
+NOISE_FPS = 24.0
+
+# Most octaves a noise shake can have.
+NOISE_OCTAVES_MAX = 8
+
+LOCATION_CHANNELS = [("location", i) for i in range(3)]
+ROTATION_CHANNELS = [("rotation_euler", i) for i in range(3)]
+
+
+# Periodic fractal noise: an array of shape (channel_count, frame_count)
+# with unit RMS per channel, that repeats every frame_count samples.
+# `cycles` is how often the lowest octave's features repeat per loop,
+# and each further octave has twice as many, weighted by `roughness`
+# relative to the one before.
+def fractal_noise(rng, channel_count, frame_count, cycles, octaves, roughness):
+    t = np.arange(frame_count, dtype=np.float64) / frame_count
+    out = np.zeros((channel_count, frame_count), dtype=np.float64)
+    weight = 1.0
+    for octave in range(octaves):
+        cells = max(1, int(round(cycles * 2.0**octave)))
+        lattice = rng.standard_normal((channel_count, cells))
+        x = t * cells
+        i = np.floor(x).astype(np.int64)
+        f = x - i
+        p0 = lattice[:, (i - 1) % cells]
+        p1 = lattice[:, i % cells]
+        p2 = lattice[:, (i + 1) % cells]
+        p3 = lattice[:, (i + 2) % cells]
+        out += weight * 0.5 * (
+            2.0 * p1
+            + (p2 - p0) * f
+            + (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * f**2
+            + (3.0 * p1 - p0 - 3.0 * p2 + p3) * f**3
+        )
+        weight *= roughness
+    out -= out.mean(axis=1, keepdims=True)
+    rms = np.sqrt(np.mean(out**2, axis=1, keepdims=True))
+    return out / np.where(rms > 0.0, rms, 1.0)
+
+
+# Generates a looping noise shake of `duration` frames at NOISE_FPS.  The
+# clip has duration + 1 samples, the last one equal to the first, as loop
+# actions expect.  `frequency` is in cycles per second, the amplitudes
+# are the RMS of each location (in meters) and rotation (in radians)
+# channel, scaled per axis by the weights.  The same arguments always
+# give the same clip.
+def noise_shake_clip(seed, duration, frequency, octaves, roughness,
+                     location_amplitude, rotation_amplitude,
+                     location_weights=(1.0, 1.0, 1.0), rotation_weights=(1.0, 1.0, 1.0)):
+    if duration < 2:
+        raise ValueError("Noise shakes need a duration of at least 2 frames")
+    rng = np.random.default_rng(seed)
+    cycles = max(frequency * duration / NOISE_FPS, 1.0)
+    octaves = min(max(int(octaves), 1), NOISE_OCTAVES_MAX)
+    noise = fractal_noise(rng, 6, duration, cycles, octaves, roughness)
+    scale = np.array(
+        [location_amplitude * w for w in location_weights]
+        + [rotation_amplitude * w for w in rotation_weights],
+        dtype=np.float64,
+    )
+    samples = np.empty((6, duration + 1), dtype=np.float32)
+    samples[:, :duration] = noise * scale[:, np.newaxis]
+    samples[:, duration] = samples[:, 0]
+
+    channels = {}
+    for row, key in enumerate(LOCATION_CHANNELS + ROTATION_CHANNELS):
+        channel = array('f')
+        channel.frombytes(samples[row].tobytes())
+        channels[key] = channel
+    return ShakeClip("NOISE_{}".format(seed), "Noise {}".format(seed), NOISE_FPS, 0, channels)
@@ -0,0 +1,324 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Streaming parser for SHAKE_LIST Python files:
+#
+#   SHAKE_LIST = {
+#       'ID': ('Name', 24.0, {
+#           ('location', 0): [(1, 0.012), (2, 0.013), ...],
+#           ...
+#       }, {'author': 'Name', 'type': 'Handheld'}),
+#   }
+#
+# The trailing dict of tags is optional.
+#
+# Nothing is executed.  Only the SHAKE_LIST assignment and literals
+# (strings, numbers, True/False/None, tuples, lists and dicts) are
+# accepted, and anything else is a ShakeParseError.
+#
+# The file is read a chunk at a time and the shakes are handed out one by
+# one, so only one shake's text is in memory at once.  A channel's list
+# of (frame, value) pairs is checked with a single regular expression and
+# converted straight to a numpy array, instead of becoming a Python
+# tuple per key.
+#
+# This module doesn't depend on bpy.
+
+import ast
+import math
+import os
+import re
+from array import array
+
+import numpy as np
+
+try:
+    from .shake_library import ShakeClip, ShakeLibraryError
+    from .shake_metrics import count, timed_function
+    from .shake_reduce import densify
+except ImportError: # Run as a script, see shake_library.py.
+    from shake_library import ShakeClip, ShakeLibraryError
+    from shake_metrics import count, timed_function
+    from shake_reduce import densify
+
+PARSE_CHUNK_SIZE = 1 << 20
+
+# Deepest nesting of tuples, lists and dicts accepted.  Shake files nest
+# four deep.
+PARSE_DEPTH_MAX = 32
+
+_SPACE = re.compile(r"(?:\s+|#[^\n]*\n)*")
+_NAME = re.compile(r"[A-Za-z_][A-Za-z_0-9]*")
+_NUMBER_TEXT = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+_NUMBER = re.compile(_NUMBER_TEXT)
+_STRING = re.compile(r"""'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*\"""")
+_PAIR_TEXT = r"\(\s*{0}\s*,\s*{0}\s*,?\s*\)".format(_NUMBER_TEXT)
+# The inside of a list holding nothing but (number, number) pairs.
+_PAIRS = re.compile(r"\s*(?:{0}\s*,\s*)*(?:{0}\s*)?".format(_PAIR_TEXT))
+_PAIR_PUNCTUATION = str.maketrans("(),", "   ")
+_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+class ShakeParseError(ShakeLibraryError):
+    pass
+
+
+class _Scanner:
+    """Reads a text file chunk by chunk, dropping what's been consumed"""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.line = 1 # Line at the start of buf.
+        self.depth = 0 # Containers being parsed.
+
+    # Appends the next chunk, returns False at the end of the file.
+    def fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > 0:
+            self.line += self.buf.count("\n", 0, self.pos)
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += chunk
+        return True
+
+    def error(self, message):
+        line = self.line + self.buf.count("\n", 0, self.pos)
+        return ShakeParseError("{} on line {}".format(message, line))
+
+    # Skips whitespace and comments, and returns the next character, or ""
+    # at the end of the file.
+    def peek(self):
+        while True:
+            self.pos = _SPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) and self.buf[self.pos] != "#":
+                return self.buf[self.pos]
+            # Out of text, or in a comment that runs past it.
+            if not self.fill():
+                self.pos = len(self.buf)
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error("Expected {!r}".format(char))
+        self.pos += 1
+
+    # Matches `pattern` at the next token.  Tokens don't span lines, so
+    # more text is read while the match runs into the end of the text read
+    # so far, or fails without a line break to stop it.
+    def match(self, pattern):
+        self.peek()
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m is None:
+                if self.buf.find("\n", self.pos) >= 0:
+                    break
+            elif m.end() < len(self.buf):
+                break
+            if not self.fill():
+                break
+        if m is None or m.end() == self.pos:
+            return None
+        self.pos = m.end()
+        return m.group()
+
+    # Returns the text up to (not including) the next `char`, and moves
+    # past it.
+    def until(self, char):
+        end = self.buf.find(char, self.pos)
+        while end < 0:
+            start = len(self.buf) - self.pos
+            if not self.fill():
+                raise self.error("Expected {!r}".format(char))
+            end = self.buf.find(char, self.pos + start)
+        text = self.buf[self.pos:end]
+        self.pos = end + 1
+        return text
+
+
+def _parse_value(scanner):
+    char = scanner.peek()
+    if char == "":
+        raise scanner.error("Unexpected end of file")
+    if char in _CONTAINERS:
+        if scanner.depth >= PARSE_DEPTH_MAX:
+            raise scanner.error("Values nested too deeply")
+        scanner.depth += 1
+        value = _CONTAINERS[char](scanner)
+        scanner.depth -= 1
+        return value
+    if char in "'\"":
+        token = scanner.match(_STRING)
+        if token is None:
+            raise scanner.error("Unterminated string")
+        try:
+            return ast.literal_eval(token)
+        except (SyntaxError, ValueError):
+            raise scanner.error("Invalid string")
+    if char in "+-." or char.isdigit():
+        token = scanner.match(_NUMBER)
+        if token is None:
+            raise scanner.error("Invalid number")
+        try:
+            return float(token) if any(c in token for c in ".eE") else int(token)
+        except ValueError: # Integers too long to convert.
+            raise scanner.error("Invalid number")
+    token = scanner.match(_NAME)
+    if token in _CONSTANTS:
+        return _CONSTANTS[token]
+    raise scanner.error("Expected a literal")
+
+
+# Comma separated values up to `close`, allowing a trailing comma.  Also
+# returns whether there was a comma at all.
+def _parse_items(scanner, close, parse_item):
+    items = []
+    comma = False
+    while scanner.peek() != close:
+        items.append(parse_item(scanner))
+        if scanner.peek() != ",":
+            break
+        scanner.pos += 1
+        comma = True
+    scanner.expect(close)
+    return items, comma
+
+
+def _parse_tuple(scanner):
+    scanner.expect("(")
+    items, comma = _parse_items(scanner, ")", _parse_value)
+    if len(items) == 1 and not comma:
+        return items[0]
+    return tuple(items)
+
+
+def _parse_dict(scanner):
+    def parse_item(scanner):
+        key = _parse_value(scanner)
+        scanner.expect(":")
+        return key, _parse_value(scanner)
+
+    scanner.expect("{")
+    items, _ = _parse_items(scanner, "}", parse_item)
+    try:
+        return dict(items)
+    except TypeError:
+        raise scanner.error("Unhashable dict key")
+
+
+# Lists of (number, number) pairs become float64 arrays of shape (n, 2),
+# other lists are parsed item by item.
+def _parse_list(scanner):
+    scanner.expect("[")
+    text = scanner.until("]")
+    if _PAIRS.fullmatch(text):
+        values = np.fromstring(text.translate(_PAIR_PUNCTUATION), dtype=np.float64, sep=" ")
+        return values.reshape(-1, 2)
+    scanner.pos -= len(text) + 1
+    items, _ = _parse_items(scanner, "]", _parse_value)
+    return items
+
+
+_CONTAINERS = {"{": _parse_dict, "[": _parse_list, "(": _parse_tuple}
+
+
+# Parses a SHAKE_LIST file from the text file object `f`, and yields its
+# (shake id, (name, fps, channels[, tags])) entries one at a time.  Channels map
+# (data_path, array_index) keys to whatever their value parsed to,
+# normally an (n, 2) array of (frame, value) rows.
+def iter_shake_list(f, chunk_size=PARSE_CHUNK_SIZE):
+    scanner = _Scanner(f, chunk_size)
+    if scanner.match(_NAME) != "SHAKE_LIST":
+        raise scanner.error("Expected 'SHAKE_LIST ='")
+    scanner.expect("=")
+    scanner.expect("{")
+    while scanner.peek() != "}":
+        shake_id = _parse_value(scanner)
+        if not isinstance(shake_id, str):
+            raise scanner.error("Shake ids must be strings")
+        scanner.expect(":")
+        yield shake_id, _parse_value(scanner)
+        if scanner.peek() != ",":
+            break
+        scanner.pos += 1
+    scanner.expect("}")
+    if scanner.peek() != "":
+        raise scanner.error("Unexpected text after SHAKE_LIST")
+
+
+# A ShakeClip from a parsed (name, fps, channels[, tags]) entry.  Like
+# ShakeClip.from_shake_list_entry(), reduced channels are expanded to one
+# sample per frame.
+def clip_from_entry(shake_id, entry):
+    if not (isinstance(entry, tuple) and len(entry) in (3, 4) and isinstance(entry[0], str)
+            and isinstance(entry[1], (int, float)) and isinstance(entry[2], dict)):
+        raise ShakeParseError("Shake {} is not a (name, fps, channels) tuple".format(shake_id))
+    if not (math.isfinite(entry[1]) and entry[1] > 0):
+        raise ShakeParseError("Shake {} has an invalid fps {!r}".format(shake_id, entry[1]))
+    tags = entry[3] if len(entry) > 3 else {}
+    if not (isinstance(tags, dict) and all(isinstance(k, str) and isinstance(v, str) for k, v in tags.items())):
+        raise ShakeParseError("Shake {} tags are not a dict of strings".format(shake_id))
+    frame_range = None
+    channels = {}
+    for key, points in entry[2].items():
+        if not (isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], str) and isinstance(key[1], int)):
+            raise ShakeParseError("Shake {} has an invalid channel key {!r}".format(shake_id, key))
+        try:
+            points = np.asarray(points, dtype=np.float64)
+        except (TypeError, ValueError):
+            points = None
+        if points is None or points.ndim != 2 or points.shape[1] != 2:
+            raise ShakeParseError("Shake {} channel {} is not a list of (frame, value) pairs".format(shake_id, key))
+        if len(points) == 0:
+            raise ShakeParseError("Shake {} has an empty channel {}".format(shake_id, key))
+        frames = points[:, 0]
+        if np.any(frames != np.round(frames)) or np.any(np.diff(frames) <= 0.0):
+            raise ShakeParseError("Shake {} channel {} is not keyed on increasing whole frames".format(shake_id, key))
+        if frame_range is None:
+            frame_range = (int(frames[0]), int(frames[-1]))
+        elif (int(frames[0]), int(frames[-1])) != frame_range:
+            raise ShakeParseError("Shake {} channels don't share the same frame range".format(shake_id))
+        if len(points) == frame_range[1] - frame_range[0] + 1:
+            samples = points[:, 1]
+        else:
+            samples = densify(frames, points[:, 1])
+        channels[key] = array("f", samples.astype(np.float32).tobytes())
+    return ShakeClip(shake_id, entry[0], entry[1], frame_range[0] if frame_range else 0, channels, tags)
+
+
+# Reads the shakes of a SHAKE_LIST file as ShakeClips.  Also returns the
+# number of (frame, value) keys the file holds.
+@timed_function("parse_shake_file")
+def read_shake_file(path, chunk_size=PARSE_CHUNK_SIZE):
+    clips = []
+    key_count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for shake_id, entry in iter_shake_list(f, chunk_size):
+            clip = clip_from_entry(shake_id, entry)
+            clips.append(clip)
+            key_count += sum(len(points) for points in entry[2].values())
+    count("bytes_parsed", os.path.getsize(path))
+    return clips, key_count
@@ -0,0 +1,198 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Waveform thumbnails of shakes.
+#
+# render_waveform() draws a shake's channels into an RGBA image with
+# numpy: location channels in the top half and rotation channels in the
+# bottom half, each half scaled to its largest excursion, so the relative
+# size of the axes is kept.  Long shakes are drawn as the min/max envelope
+# of the frames behind each pixel column.
+#
+# PreviewCache renders thumbnails on a background thread and keeps them as
+# PNG files named by the shake's content hash, so a shake is only ever
+# rendered once, whatever it's called and however often the library is
+# rebuilt.  Thumbnails are loaded into Blender by the caller, from the
+# main thread.
+#
+# This module doesn't depend on bpy.
+
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+PREVIEW_SIZE = 64
+
+# RGB per axis, for location and rotation channels.
+_LOCATION_COLORS = ((0.95, 0.35, 0.35), (0.45, 0.85, 0.35), (0.35, 0.55, 0.95))
+_ROTATION_COLORS = ((1.0, 0.65, 0.45), (0.7, 0.95, 0.5), (0.5, 0.8, 1.0))
+_AXIS_ALPHA = 0.25
+
+
+# Lowest and highest value under each of `width` pixel columns, widened
+# so that neighbouring columns touch and the line stays connected.
+def _column_spans(data, width):
+    if len(data) >= width:
+        edges = np.linspace(0, len(data), width + 1).astype(np.intp)[:-1]
+        lo = np.minimum.reduceat(data, edges)
+        hi = np.maximum.reduceat(data, edges)
+    else:
+        lo = hi = np.interp(np.linspace(0, len(data) - 1, width), np.arange(len(data)), data)
+    lo_connected = lo.copy()
+    hi_connected = hi.copy()
+    lo_connected[1:] = np.minimum(lo[1:], hi[:-1])
+    hi_connected[1:] = np.maximum(hi[1:], lo[:-1])
+    return lo_connected, hi_connected
+
+
+# Draws `channels`, a list of (samples, rgb), into rows [top, top + height)
+# of `image`, centered on their means.
+def _draw_panel(image, top, height, channels):
+    width = image.shape[1]
+    center = top + (height - 1) / 2.0
+    center_row = int(round(center))
+    image[center_row, :, :3] = 1.0
+    image[center_row, :, 3] = _AXIS_ALPHA
+    if len(channels) == 0:
+        return
+    centered = [(data - data.mean(), rgb) for data, rgb in channels]
+    extent = max(float(np.abs(data).max()) for data, _ in centered)
+    if extent <= 0.0:
+        return
+    scale = (height - 1) / 2.0 / extent
+    rows = np.arange(top, top + height)[:, np.newaxis]
+    for data, rgb in centered:
+        lo, hi = _column_spans(data, width)
+        # Higher values are drawn further up.
+        row_lo = np.rint(center - hi * scale)
+        row_hi = np.rint(center - lo * scale)
+        mask = (rows >= row_lo[np.newaxis, :]) & (rows <= row_hi[np.newaxis, :])
+        panel = image[top:top + height]
+        panel[mask, :3] = rgb
+        panel[mask, 3] = 1.0
+
+
+# Renders a ShakeClip as a (size, size, 4) uint8 RGBA image, top row
+# first.
+def render_waveform(clip, size=PREVIEW_SIZE):
+    image = np.zeros((size, size, 4), dtype=np.float32)
+    location = []
+    rotation = []
+    for (data_path, array_index), samples in sorted(clip.channels.items()):
+        data = np.frombuffer(samples, dtype=np.float32).astype(np.float64)
+        if len(data) == 0:
+            continue
+        if data_path.startswith("location"):
+            location.append((data, _LOCATION_COLORS[array_index % 3]))
+        elif data_path.startswith("rotation"):
+            rotation.append((data, _ROTATION_COLORS[array_index % 3]))
+    half = size // 2
+    _draw_panel(image, 0, half, location)
+    _draw_panel(image, half, size - half, rotation)
+    return (np.clip(image, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+
+# Writes a (height, width, 4) uint8 RGBA image as a PNG, atomically.
+def write_png(path, pixels):
+    height, width = pixels.shape[:2]
+    rows = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    rows[:, 1:] = pixels.reshape(height, width * 4)
+    data = (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))
+        + _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 6))
+        + _png_chunk(b"IEND", b"")
+    )
+    # Named after the process, as Blenders may render the same thumbnail
+    # at once.
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class PreviewCache:
+    """Waveform thumbnails on disk, rendered on a background thread"""
+
+    def __init__(self, directory, size=PREVIEW_SIZE):
+        self.directory = directory
+        self.size = size
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._failed = set()
+        self._finished = []
+
+    def path(self, key):
+        return os.path.join(self.directory, "{}_{}.png".format(key, self.size))
+
+    @property
+    def pending(self):
+        return len(self._pending) > 0
+
+    # Returns the thumbnail file of the content hash `key` if it has been
+    # rendered.  Otherwise queues it for rendering, from the ShakeClip that
+    # `load_clip()` returns, and returns None.  `load_clip` is called right
+    # away, so the background thread never reads the library.
+    def request(self, key, load_clip):
+        path = self.path(key)
+        if os.path.isfile(path):
+            return path
+        if key in self._pending or key in self._failed:
+            return None
+        if self._executor is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shake_preview")
+        self._pending.add(key)
+        self._executor.submit(self._render, key, load_clip(), path)
+        return None
+
+    def _render(self, key, clip, path):
+        try:
+            write_png(path, render_waveform(clip, self.size))
+        except Exception as exc:
+            print("Couldn't render the preview of shake {}: {}".format(clip.id, exc))
+            path = None
+        with self._lock:
+            self._finished.append((key, path))
+
+    # Returns the (key, path) of every thumbnail rendered since the last
+    # call.  The path is None if rendering failed.
+    def take_finished(self):
+        with self._lock:
+            finished = self._finished
+            self._finished = []
+        for key, path in finished:
+            self._pending.discard(key)
+            if path is None:
+                self._failed.add(key)
+        return finished
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
@@ -0,0 +1,126 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Error-bounded keyframe reduction for densely sampled shake channels.
+#
+# A reduced channel is a sparse set of (frame, value) keys.  Between keys
+# the curve is the cubic Hermite spline whose slope at each key is the
+# Catmull-Rom one, (next value - previous value) / (next frame - previous
+# frame).  That only depends on the keys themselves, so the same curve is
+# rebuilt from a SHAKE_LIST file that holds just the keys (densify()), and
+# on an F-curve by giving each key free handles a third of the way to its
+# neighbours (bezier_handles()), which makes Blender's Bezier segments
+# exactly these Hermite segments.
+#
+# reduce_channel() picks the keys greedily: starting from the ends, it
+# adds the worst sample of every segment that's off by more than the
+# tolerance, until none is.  Every pass works on all segments at once.
+#
+# Cyclic channels are loops whose last sample repeats the first, as in
+# loop actions.  Their end slopes wrap around.  This module doesn't
+# depend on bpy.
+
+import numpy as np
+
+
+# Catmull-Rom slopes at keys (frames, values).  For cyclic keys, the last
+# key is the first one a period later.
+def key_slopes(frames, values, cyclic=False):
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(frames)
+    if count < 2:
+        return np.zeros(count)
+    slopes = np.empty(count)
+    if count > 2:
+        slopes[1:-1] = (values[2:] - values[:-2]) / (frames[2:] - frames[:-2])
+    if cyclic:
+        period = frames[-1] - frames[0]
+        slopes[0] = slopes[-1] = (values[1] - values[-2]) / (frames[1] - frames[-2] + period)
+    else:
+        slopes[0] = (values[1] - values[0]) / (frames[1] - frames[0])
+        slopes[-1] = (values[-1] - values[-2]) / (frames[-1] - frames[-2])
+    return slopes
+
+
+# Values of the curve through keys (frames, values, slopes) at `at`, which
+# must lie within the keys' frame range.
+def evaluate_keys(frames, values, slopes, at):
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    at = np.asarray(at, dtype=np.float64)
+    segment = np.clip(np.searchsorted(frames, at, side="right") - 1, 0, len(frames) - 2)
+    x0 = frames[segment]
+    width = frames[segment + 1] - x0
+    t = (at - x0) / width
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        (2.0 * t3 - 3.0 * t2 + 1.0) * values[segment]
+        + (t3 - 2.0 * t2 + t) * width * slopes[segment]
+        + (-2.0 * t3 + 3.0 * t2) * values[segment + 1]
+        + (t3 - t2) * width * slopes[segment + 1]
+    )
+
+
+# Indices of the samples of `values` (one per frame) to keep as keys so
+# that the curve through them is within `tolerance` of every sample.
+def reduce_channel(values, tolerance, cyclic=False):
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values)
+    if count <= 2 or tolerance <= 0.0:
+        return np.arange(count)
+    frames = np.arange(count, dtype=np.float64)
+    keep = np.array([0, count - 1])
+    while True:
+        slopes = key_slopes(keep, values[keep], cyclic)
+        error = np.abs(evaluate_keys(keep, values[keep], slopes, frames) - values)
+        segment = np.clip(np.searchsorted(keep, frames, side="right") - 1, 0, len(keep) - 2)
+        worst = np.maximum.reduceat(error, keep[:-1])
+        bad = worst[segment] > tolerance
+        if not np.any(bad):
+            return keep
+        # The first frame of every bad segment where its error peaks.
+        peak = bad & (error == worst[segment])
+        _, first = np.unique(segment[peak], return_index=True)
+        keep = np.union1d(keep, np.flatnonzero(peak)[first])
+
+
+# One sample per frame from the first key's frame to the last one's, of
+# the curve through the keys.
+def densify(frames, values, cyclic=False):
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(frames) < 2:
+        return values.copy()
+    slopes = key_slopes(frames, values, cyclic)
+    return evaluate_keys(frames, values, slopes, np.arange(frames[0], frames[-1] + 1.0))
+
+
+# Left and right Bezier handles, as (frame, value) arrays of shape
+# (count, 2), that make Blender's F-curve through the keys the curve
+# described above.  Handles of the end keys mirror the other one.
+def bezier_handles(frames, values, slopes):
+    frames = np.asarray(frames, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    gaps = np.diff(frames) / 3.0
+    left_gap = np.concatenate(([gaps[0]], gaps))
+    right_gap = np.concatenate((gaps, [gaps[-1]]))
+    left = np.stack((frames - left_gap, values - slopes * left_gap), axis=-1)
+    right = np.stack((frames + right_gap, values + slopes * right_gap), axis=-1)
+    return left, right
@@ -0,0 +1,158 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+
+# Index from cameras to the shake empties of their rigs.
+#
+# Shake empties are found by the custom properties below rather than by
+# name, and looking them up in bpy.data on every rebuild would cost a
+# pass over every object in the file, so ShakeRigIndex keeps them by
+# camera uid and pool key.
+#
+# This module doesn't depend on bpy: the index reads the file through
+# the `data` callable it's given, which returns the current bpy.data.
+
+from itertools import chain
+
+# Custom properties on shake empties holding the uid of the
+# CameraShakeInstance they belong to, the camera_shakes_uid of its
+# camera, and the index in the shake list they were last built for.
+# Names of shake empties are only cosmetic, these are what identify them.
+SHAKE_UID_PROP = "camera_shakify_uid"
+SHAKE_CAMERA_PROP = "camera_shakify_camera"
+SHAKE_SLOT_PROP = "camera_shakify_slot"
+
+# Custom properties on pooled shake empties, which are shared by every
+# camera shake with the same type and timing: the pool key, and the
+# "<camera uid>:<shake uid>" of every shake item using the empty.
+SHAKE_POOL_KEY_PROP = "camera_shakify_pool_key"
+SHAKE_POOL_USERS_PROP = "camera_shakify_pool_users"
+
+
+# Whether a Python reference to an ID still points at live data.
+def _is_alive(id):
+    try:
+        id.name
+    except ReferenceError:
+        return False
+    return True
+
+
+class ShakeRigIndex:
+    """Per-session index from cameras to the shake objects of their rigs"""
+
+    # Built with one pass over the cameras and the shake collection named
+    # `collection_name` the first time it's needed, then kept up to date
+    # by the functions that create and remove shake objects.  Invalidated
+    # whenever Python references into the file may have gone stale (file
+    # load, undo, redo), and rebuilt if an entry turns out to be dead
+    # anyway, e.g. after the user deleted a shake empty by hand.
+    def __init__(self, data, collection_name):
+        self.data = data
+        self.collection_name = collection_name
+        self.valid = False
+        self.cameras = {} # Cameras by camera_shakes_uid.
+        self.private = {} # Private shake objects by camera uid, then shake uid.
+        self.pooled = {} # Pooled shake objects by pool key.
+
+    # Drops everything, so nothing of a previous file outlives it.
+    def invalidate(self):
+        self.valid = False
+        self.cameras = {}
+        self.private = {}
+        self.pooled = {}
+
+    def ensure(self):
+        if self.valid:
+            return
+        self.invalidate()
+        data = self.data()
+        for obj in data.objects:
+            if obj.type == 'CAMERA' and obj.camera_shakes_uid > 0:
+                self.cameras.setdefault(obj.camera_shakes_uid, obj)
+        collection = data.collections.get(self.collection_name)
+        for obj in (collection.objects if collection is not None else ()):
+            self.add(obj)
+        self.valid = True
+
+    def add(self, obj):
+        pool_key = obj.get(SHAKE_POOL_KEY_PROP)
+        if pool_key is not None:
+            self.pooled[pool_key] = obj
+        elif obj.get(SHAKE_CAMERA_PROP) is not None and obj.get(SHAKE_UID_PROP) is not None:
+            self.private.setdefault(obj[SHAKE_CAMERA_PROP], {})[obj[SHAKE_UID_PROP]] = obj
+
+    def discard(self, obj):
+        pool_key = obj.get(SHAKE_POOL_KEY_PROP)
+        if pool_key is not None:
+            if self.pooled.get(pool_key) == obj:
+                del self.pooled[pool_key]
+        else:
+            objects = self.private.get(obj.get(SHAKE_CAMERA_PROP), {})
+            if objects.get(obj.get(SHAKE_UID_PROP)) == obj:
+                del objects[obj[SHAKE_UID_PROP]]
+
+    # Gives the camera a camera_shakes_uid that no other camera has, and
+    # fetches it.  Duplicating a camera copies its uid, so the copy gets a
+    # new one the first time its shakes are rebuilt.  New uids are above
+    # those of private shake objects too, so a camera never takes over the
+    # empties a deleted camera left behind.
+    def ensure_camera_uid(self, camera):
+        self.ensure()
+        camera_uid = camera.camera_shakes_uid
+        owner = self.camera(camera_uid) if camera_uid > 0 else None
+        if camera_uid <= 0 or (owner is not None and owner != camera):
+            camera_uid = max(chain(self.cameras, self.private), default=0) + 1
+            camera.camera_shakes_uid = camera_uid
+        self.cameras[camera_uid] = camera
+        return camera_uid
+
+    # The camera with the given camera_shakes_uid, if it's still around.
+    def camera(self, camera_uid):
+        self.ensure()
+        camera = self.cameras.get(camera_uid)
+        if camera is not None and (not _is_alive(camera) or camera.camera_shakes_uid != camera_uid):
+            del self.cameras[camera_uid]
+            camera = None
+        return camera
+
+    # The private shake objects of a camera, by shake uid.
+    def private_objects(self, camera_uid):
+        self.ensure()
+        objects = self.private.get(camera_uid, {})
+        if not all(_is_alive(obj) for obj in objects.values()):
+            self.invalidate()
+            self.ensure()
+            objects = self.private.get(camera_uid, {})
+        return dict(objects)
+
+    def pooled_object(self, pool_key):
+        self.ensure()
+        obj = self.pooled.get(pool_key)
+        if obj is not None and not _is_alive(obj):
+            self.invalidate()
+            self.ensure()
+            obj = self.pooled.get(pool_key)
+        return obj
+
+    def pooled_objects(self):
+        self.ensure()
+        if not all(_is_alive(obj) for obj in self.pooled.values()):
+            self.invalidate()
+            self.ensure()
+        return list(self.pooled.values())
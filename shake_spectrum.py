@@ -0,0 +1,137 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Spectral resynthesis of captured shakes.
+#
+# analyze_clip() takes the FFT of one loop of each channel of a shake.
+# synthesize_clip() builds a new loop of any length from that: the power
+# spectrum is interpolated onto the new length's frequency bins, and the
+# phases are drawn at random from a seed.  The result has the same
+# frequency content and per-channel RMS as the capture but none of its
+# actual motion, so a variant as long as the shot never visibly repeats.
+#
+# To keep channels moving together the way they do in the capture (e.g.
+# sideways sway and roll), all channels share the random phases, offset by
+# the phase differences between them in the capture.
+#
+# resample_clip() converts a clip to another frame rate the same way, by
+# zero-padding or truncating its spectrum, which for a loop is an ideal
+# band-limited resampler.  This module doesn't depend on bpy.
+
+from array import array
+from collections import namedtuple
+
+import numpy as np
+
+from .shake_library import ShakeClip
+
+# FFT of one loop of a clip.  `magnitude` and `phase` have a row per
+# channel in `keys` and a column per frequency bin of a loop of `length`
+# samples.  `reference` is the row of the strongest channel, which the
+# other channels' phases are taken relative to.
+ShakeSpectrum = namedtuple("ShakeSpectrum", "keys fps frame_start length mean rms magnitude phase reference")
+
+
+# One loop of every channel of a clip, as float64 rows in the order of
+# `keys`.  Loop actions replace the last sample of a clip with a copy of
+# its first, so the loop is all samples but the last.
+def _loop_data(clip, keys):
+    data = np.stack([np.frombuffer(clip.channels[key], dtype=np.float32) for key in keys]).astype(np.float64)
+    if data.shape[1] > 2:
+        data = data[:, :-1]
+    return data
+
+
+# Builds a loop clip from rows of samples, appending the closing copy of
+# the first sample.
+def _loop_clip(data, keys, shake_id, name, fps, frame_start):
+    samples = np.empty((len(keys), data.shape[1] + 1), dtype=np.float32)
+    samples[:, :-1] = data
+    samples[:, -1] = samples[:, 0]
+    channels = {}
+    for row, key in enumerate(keys):
+        channel = array('f')
+        channel.frombytes(samples[row].tobytes())
+        channels[key] = channel
+    return ShakeClip(shake_id, name, fps, frame_start, channels)
+
+
+def analyze_clip(clip):
+    keys = list(clip.channels)
+    data = _loop_data(clip, keys)
+    mean = data.mean(axis=1)
+    data -= mean[:, np.newaxis]
+    rms = np.sqrt(np.mean(data**2, axis=1))
+    spectrum = np.fft.rfft(data, axis=1)
+    return ShakeSpectrum(
+        keys, clip.fps, clip.frame_start, data.shape[1], mean, rms,
+        np.abs(spectrum), np.angle(spectrum), int(np.argmax(rms)),
+    )
+
+
+# Generates a loop of `frame_count` frames from `spectrum`, as a clip with
+# frame_count + 1 samples whose last one equals the first.  The same seed
+# always gives the same clip.
+def synthesize_clip(spectrum, seed, frame_count, shake_id, name):
+    if frame_count < 2:
+        raise ValueError("Shake variants need a length of at least 2 frames")
+    source_freqs = np.fft.rfftfreq(spectrum.length)
+    freqs = np.fft.rfftfreq(frame_count)
+
+    power = np.stack([np.interp(freqs, source_freqs, row) for row in spectrum.magnitude**2])
+    nearest = np.clip(np.rint(freqs * spectrum.length).astype(np.int64), 0, len(source_freqs) - 1)
+    phase_offsets = spectrum.phase[:, nearest] - spectrum.phase[spectrum.reference, nearest]
+
+    rng = np.random.default_rng(seed)
+    phases = rng.uniform(-np.pi, np.pi, len(freqs)) + phase_offsets
+    coefficients = np.sqrt(power) * np.exp(1j * phases)
+    coefficients[:, 0] = 0.0
+    if frame_count % 2 == 0:
+        coefficients[:, -1] = coefficients[:, -1].real
+    data = np.fft.irfft(coefficients, n=frame_count, axis=1)
+
+    rms = np.sqrt(np.mean(data**2, axis=1))
+    data *= np.where(rms > 0.0, spectrum.rms / np.where(rms > 0.0, rms, 1.0), 0.0)[:, np.newaxis]
+    data += spectrum.mean[:, np.newaxis]
+    return _loop_clip(data, spectrum.keys, shake_id, name, spectrum.fps, spectrum.frame_start)
+
+
+# Resamples a loop clip to `fps`.  The loop keeps its length in seconds,
+# rounded to whole frames at the new rate.  Going down in rate, frequencies
+# above the new Nyquist limit are dropped instead of aliasing; going up,
+# the curve between the original samples is the band-limited one rather
+# than a Bezier between keys.
+def resample_clip(clip, fps):
+    keys = list(clip.channels)
+    data = _loop_data(clip, keys)
+    length = data.shape[1]
+    new_length = max(int(round(length * fps / clip.fps)), 2)
+    spectrum = np.fft.rfft(data, axis=1)
+
+    bins = new_length // 2 + 1
+    kept = min(bins, spectrum.shape[1])
+    new_spectrum = np.zeros((len(keys), bins), dtype=np.complex128)
+    new_spectrum[:, :kept] = spectrum[:, :kept]
+    if new_length > length and length % 2 == 0:
+        # The old Nyquist bin stands for a cosine that's split between a
+        # positive and a negative frequency once there's room for both.
+        new_spectrum[:, length // 2] *= 0.5
+    elif new_length < length and new_length % 2 == 0:
+        new_spectrum[:, -1] = new_spectrum[:, -1].real
+    resampled = np.fft.irfft(new_spectrum, n=new_length, axis=1) * (new_length / length)
+    return _loop_clip(resampled, keys, clip.id, clip.name, float(fps), clip.frame_start)
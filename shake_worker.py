@@ -0,0 +1,46 @@
+#====================== BEGIN GPL LICENSE BLOCK ======================
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+#======================= END GPL LICENSE BLOCK ========================
+
+# Set-up of the worker processes that read shake files for
+# shake_library.read_shake_list_sources().  Run with runpy.run_path()
+# when a worker starts, before it imports anything of the addon.
+#
+# Workers import the addon's modules by their full name, but the addon's
+# __init__.py, and Blender's bl_ext package above it, need bpy, which
+# workers don't have.  So the packages above the modules are replaced by
+# bare ones that only know where to find their modules, as in
+# benchmarks/suite.py.  PACKAGE is given by the caller, and empty when
+# the modules are top-level ones (shake_library.py run as a script).
+
+import os
+import sys
+import types
+
+_package = globals().get("PACKAGE") or ""
+_directory = os.path.dirname(os.path.abspath(__file__))
+
+if not _package:
+    sys.path.insert(0, _directory)
+else:
+    _parts = _package.split(".")
+    for _i in range(1, len(_parts) + 1):
+        _name = ".".join(_parts[:_i])
+        if _name not in sys.modules:
+            _module = types.ModuleType(_name)
+            _module.__path__ = [_directory] if _i == len(_parts) else []
+            sys.modules[_name] = _module
@@ -0,0 +1,68 @@
+# Tests of the rotation math in shake_bake.py.  Run from the addon
+# directory with:
+#
+#   python -m pytest
+
+import math
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shake_bake import euler_to_quat, quat_multiply, quat_power, quat_to_euler, quat_to_matrix
+
+ORDERS = ['XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX']
+
+
+def axis_matrix(axis, angle):
+    c, s = math.cos(angle), math.sin(angle)
+    i, j = [(1, 2), (2, 0), (0, 1)][axis]
+    m = np.eye(3)
+    m[i, i] = m[j, j] = c
+    m[j, i] = s
+    m[i, j] = -s
+    return m
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_euler_round_trip(order):
+    rng = np.random.default_rng(ORDERS.index(order))
+    euler = rng.uniform(-1.2, 1.2, (200, 3))
+    assert np.allclose(quat_to_euler(euler_to_quat(euler, order), order), euler, atol=1e-9)
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_euler_axes_apply_in_order(order):
+    euler = np.array([0.3, -0.5, 0.7])
+    expected = np.eye(3)
+    for c in order:
+        axis = ord(c) - ord('X')
+        expected = axis_matrix(axis, euler[axis]) @ expected
+    assert np.allclose(quat_to_matrix(euler_to_quat(euler, order)), expected)
+
+
+@pytest.mark.parametrize("order", ORDERS)
+def test_gimbal_lock_gives_the_same_rotation(order):
+    euler = np.zeros(3)
+    euler[ord(order[1]) - ord('X')] = math.pi / 2
+    euler[ord(order[0]) - ord('X')] = 0.4
+    q = euler_to_quat(euler, order)
+    back = euler_to_quat(quat_to_euler(q, order), order)
+    assert np.allclose(quat_to_matrix(back), quat_to_matrix(q), atol=1e-6)
+
+
+def test_euler_rows_stay_continuous():
+    angles = np.linspace(0.0, 4.0 * math.pi, 100)
+    euler = np.stack((np.zeros(100), np.zeros(100), angles), axis=-1)
+    assert np.allclose(quat_to_euler(euler_to_quat(euler)), euler)
+
+
+def test_quat_power():
+    q = euler_to_quat(np.array([[0.0, 0.0, 1.0]]))
+    assert np.allclose(quat_power(q, np.array([0.5])), euler_to_quat(np.array([[0.0, 0.0, 0.5]])))
+    assert np.allclose(quat_power(q, np.array([0.0])), [[1.0, 0.0, 0.0, 0.0]])
+    assert np.allclose(quat_multiply(quat_power(q, np.array([0.5])), quat_power(q, np.array([0.5]))), q)
@@ -0,0 +1,52 @@
+# Tests of the shake index in shake_index.py.  Run from the addon
+# directory with:
+#
+#   python -m pytest
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from shake_index import ShakeIndex
+from shake_library import ShakeLibrary, ShakeStore
+
+LIBRARY_PATH = os.path.join(ROOT, "shake_data.shklib")
+LIBRARY_INDEX_PATH = os.path.join(ROOT, "shake_data.index.json")
+
+
+def test_shipped_index_is_current(tmp_path):
+    with ShakeLibrary(LIBRARY_PATH) as library:
+        index = ShakeIndex(str(tmp_path / "index.json"))
+        index.update(library, lambda shake_id: "")
+        shipped = ShakeIndex(LIBRARY_INDEX_PATH)
+        assert list(shipped.query()) == list(index.query())
+
+
+def test_seeded_store_computes_nothing(tmp_path, monkeypatch):
+    store = ShakeStore.create(str(tmp_path / "store"), LIBRARY_PATH)
+    index = ShakeIndex(str(tmp_path / "store" / "index.json"))
+    index.seed(LIBRARY_INDEX_PATH, store, store.payload_name)
+    monkeypatch.setattr(store, "clip", lambda shake_id: pytest.fail("Read " + shake_id))
+    index.update(store, store.payload_name)
+    assert len(index) == len(store)
+    assert os.path.isfile(index.path)
+    store.close()
+
+
+def test_seed_skips_changed_shakes(tmp_path):
+    store = ShakeStore.create(str(tmp_path / "store"), LIBRARY_PATH)
+    shake_id = next(iter(store.keys()))
+    store.add([store.clip(shake_id).renamed(shake_id, "Renamed")])
+    index = ShakeIndex(str(tmp_path / "store" / "index.json"))
+    index.seed(LIBRARY_INDEX_PATH, store, store.payload_name)
+    assert shake_id not in index
+    assert len(index) == len(store) - 1
+    index.update(store, store.payload_name)
+    assert index[shake_id].name == "Renamed"
+    store.close()
@@ -0,0 +1,180 @@
+# Tests of the SHAKE_LIST parser in shake_parse.py.  Run from the addon
+# directory with:
+#
+#   python -m pytest
+
+import io
+import os
+import sys
+from array import array
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shake_library import ShakeClip, ShakeLibraryError, format_shake_list, read_shake_list_sources
+from shake_parse import PARSE_DEPTH_MAX, ShakeParseError, clip_from_entry, iter_shake_list, read_shake_file
+
+SOURCE = """\
+# A comment before the assignment.
+SHAKE_LIST = {
+    'WALK': ('Walk', 24.0, {
+        ('location', 0): [(1, 0.5), (2, -0.25), (3, 1e-3),],  # Trailing comma.
+        ('rotation_euler', 2): [(1, 0), (2, .5), (3, -1.5E+1)],
+    }, {'author': 'Someone', 'type': 'Handheld'}),
+    "RUN": ("Run", 30, {
+        ('location', 1): [
+            (10, 1.0),
+            # A comment between keys.
+            (11, 2.0),
+        ],
+    },),
+}
+"""
+
+
+def parse(text, chunk_size=1 << 20):
+    return list(iter_shake_list(io.StringIO(text), chunk_size))
+
+
+def test_pairs_become_arrays():
+    shakes = dict(parse(SOURCE))
+    assert list(shakes) == ["WALK", "RUN"]
+    name, fps, channels, tags = shakes["WALK"]
+    assert (name, fps, tags) == ("Walk", 24.0, {"author": "Someone", "type": "Handheld"})
+    points = channels[("location", 0)]
+    assert isinstance(points, np.ndarray) and points.shape == (3, 2)
+    assert points.tolist() == [[1.0, 0.5], [2.0, -0.25], [3.0, 0.001]]
+    assert channels[("rotation_euler", 2)].tolist() == [[1.0, 0.0], [2.0, 0.5], [3.0, -15.0]]
+    # Comments take the list off the fast path, it's read pair by pair.
+    assert shakes["RUN"][2][("location", 1)] == [(10, 1.0), (11, 2.0)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 16, 64])
+def test_chunk_boundaries(chunk_size):
+    expected = parse(SOURCE)
+    shakes = parse(SOURCE, chunk_size)
+    assert [shake_id for shake_id, _ in shakes] == [shake_id for shake_id, _ in expected]
+    for (_, entry), (_, expected_entry) in zip(shakes, expected):
+        assert entry[:2] == expected_entry[:2]
+        for key, points in expected_entry[2].items():
+            assert np.array_equal(entry[2][key], points)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 20])
+def test_comment_at_end_of_file(chunk_size):
+    assert parse("SHAKE_LIST = {}\n# No newline after this comment", chunk_size) == []
+
+
+def test_literals():
+    text = "SHAKE_LIST = {'A': (('x',), ('y'), [1, 'two', None], {True: False}, (), -2, +3.5)}"
+    (_, entry), = parse(text)
+    assert entry == (("x",), "y", [1, "two", None], {True: False}, (), -2, 3.5)
+
+
+def test_mixed_list_is_parsed_item_by_item():
+    (_, entry), = parse("SHAKE_LIST = {'A': [(1, 2), (3, 'x')]}")
+    assert entry == [(1, 2), (3, "x")]
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "SHAKE = {}",
+    "SHAKE_LIST {}",
+    "SHAKE_LIST = {",
+    "SHAKE_LIST = {'A': (1, 2}",
+    "SHAKE_LIST = {'A': 'unterminated}",
+    "SHAKE_LIST = {'A': '\\N{NOT A CHARACTER NAME}'}",
+    "SHAKE_LIST = {'A': " + "1" * 5000 + "}",
+    "SHAKE_LIST = {'A': __import__('os')}",
+    "SHAKE_LIST = {'A': [1, 2] + [3]}",
+    "SHAKE_LIST = {1: ()}",
+    "SHAKE_LIST = {'A': {[1]: 2}}",
+    "SHAKE_LIST = {}\nprint('hi')",
+    "SHAKE_LIST = {'A': " + "(" * 5000 + ")" * 5000 + "}",
+    "SHAKE_LIST = {'A': " + "[" * 5000,
+])
+def test_malformed(text):
+    with pytest.raises(ShakeParseError):
+        parse(text)
+
+
+def test_nesting_limit():
+    nested = "[" * PARSE_DEPTH_MAX + "]" * PARSE_DEPTH_MAX
+    parse("SHAKE_LIST = {'A': " + nested + "}")
+    with pytest.raises(ShakeParseError):
+        parse("SHAKE_LIST = {'A': [" + nested + "]}")
+
+
+def test_clip_from_entry():
+    shakes = dict(parse(SOURCE))
+    clip = clip_from_entry("WALK", shakes["WALK"])
+    assert (clip.id, clip.name, clip.fps, clip.frame_start, clip.frame_count) == ("WALK", "Walk", 24.0, 1, 3)
+    assert clip.tags == {"author": "Someone", "type": "Handheld"}
+    assert clip.channels[("location", 0)].tolist() == pytest.approx([0.5, -0.25, 0.001])
+
+
+def test_reduced_channel_is_densified():
+    points = np.array([[1, 0.0], [5, 4.0]])
+    clip = clip_from_entry("A", ("A", 24.0, {("location", 0): points}))
+    assert clip.frame_count == 5
+
+
+@pytest.mark.parametrize("entry", [
+    ("A", 24.0),
+    ("A", "24", {}),
+    ("A", 0, {}),
+    ("A", -24.0, {}),
+    ("A", float("nan"), {}),
+    ("A", float("inf"), {}),
+    ("A", 24.0, {}, {"author": 1}),
+    ("A", 24.0, {"location": np.array([[1, 0.0]])}),
+    ("A", 24.0, {("location", 0): np.array([[1, 0.0], [1, 1.0]])}),
+    ("A", 24.0, {("location", 0): np.array([[1.5, 0.0]])}),
+    ("A", 24.0, {("location", 0): np.array([[1, 0.0]]), ("location", 1): np.array([[2, 0.0]])}),
+    ("A", 24.0, {("location", 0): [1, 2, 3]}),
+])
+def test_invalid_entries(entry):
+    with pytest.raises(ShakeParseError):
+        clip_from_entry("A", entry)
+
+
+def test_parse_errors_are_library_errors():
+    assert issubclass(ShakeParseError, ShakeLibraryError)
+
+
+def test_read_shake_file_round_trip(tmp_path):
+    samples = np.sin(np.arange(100) * 0.1)
+    clip = ShakeClip("A", "A shake", 25.0, 3, {
+        ("location", 0): array("f", samples),
+        ("rotation_euler", 1): array("f", -samples),
+    }, {"author": "Someone"})
+    path = tmp_path / "shakes.py"
+    path.write_text(format_shake_list([clip]), encoding="utf-8")
+    (read,), key_count = read_shake_file(str(path), chunk_size=100)
+    assert key_count == 200
+    assert (read.id, read.name, read.fps, read.frame_start, read.tags) == ("A", "A shake", 25.0, 3, {"author": "Someone"})
+    for key, channel in clip.channels.items():
+        assert np.allclose(np.asarray(read.channels[key]), channel, atol=1e-6)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_read_shake_list_sources(tmp_path, jobs):
+    paths = []
+    for i in range(3):
+        clip = ShakeClip("S{}".format(i), "Shake", 24.0, 1, {("location", 0): array("f", [0.0, float(i)])})
+        path = tmp_path / "shake{}.py".format(i)
+        path.write_text(format_shake_list([clip]), encoding="utf-8")
+        paths.append(str(path))
+    bad_path = tmp_path / "bad.py"
+    bad_path.write_text("SHAKE_LIST = {'A': (", encoding="utf-8")
+    paths.insert(1, str(bad_path))
+    progress = []
+    sources = read_shake_list_sources(paths, jobs=jobs, progress=lambda done, total: progress.append((done, total)))
+    assert [source.path for source in sources] == paths
+    assert [[clip.id for clip in source.clips] for source in sources] == [["S0"], [], ["S1"], ["S2"]]
+    assert sources[1].error.startswith("ShakeParseError")
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+    assert sources[3].clips[0].channels[("location", 0)].tolist() == [0.0, 2.0]
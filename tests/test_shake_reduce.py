@@ -0,0 +1,55 @@
+# Tests of the keyframe reduction in shake_reduce.py.  Run from the addon
+# directory with:
+#
+#   python -m pytest
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shake_reduce import densify, reduce_channel
+
+
+def shake(frame_count, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(frame_count)
+    return np.sin(t * 0.07) * 0.02 + np.sin(t * 0.31 + 1.0) * 0.005 + rng.normal(0.0, 0.001, frame_count)
+
+
+@pytest.mark.parametrize("tolerance", [1e-4, 5e-4, 2e-3])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_error_within_tolerance(tolerance, seed):
+    values = shake(2000, seed)
+    keep = reduce_channel(values, tolerance)
+    assert keep[0] == 0 and keep[-1] == len(values) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert np.max(np.abs(densify(keep, values[keep]) - values)) <= tolerance
+    assert len(keep) < len(values)
+
+
+def test_cyclic_error_within_tolerance():
+    values = shake(500)
+    values[-1] = values[0]
+    keep = reduce_channel(values, 5e-4, cyclic=True)
+    assert np.max(np.abs(densify(keep, values[keep], cyclic=True) - values)) <= 5e-4
+
+
+def test_float32_samples():
+    values = shake(1000).astype(np.float32)
+    keep = reduce_channel(values, 1e-4)
+    assert np.max(np.abs(densify(keep, values[keep]) - values)) <= 1e-4
+
+
+def test_smooth_curve_needs_few_keys():
+    values = np.linspace(0.0, 1.0, 1000)
+    assert reduce_channel(values, 1e-6).tolist() == [0, 999]
+
+
+@pytest.mark.parametrize("values, tolerance", [([], 0.1), ([1.0], 0.1), ([1.0, 2.0], 0.1), ([1.0, 5.0, 2.0], 0.0)])
+def test_everything_is_kept_when_nothing_can_go(values, tolerance):
+    assert reduce_channel(values, tolerance).tolist() == list(range(len(values)))
@@ -0,0 +1,85 @@
+# Tests of the camera and shake empty index in shake_rig_index.py.  Run
+# from the addon directory with:
+#
+#   python -m pytest
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shake_rig_index import SHAKE_CAMERA_PROP, SHAKE_POOL_KEY_PROP, SHAKE_UID_PROP, ShakeRigIndex
+
+COLLECTION_NAME = "Shakes"
+
+
+class Object:
+    """Stands in for a bpy object, with `props` as its custom properties"""
+
+    def __init__(self, name, type='EMPTY', camera_shakes_uid=0, **props):
+        self.name = name
+        self.type = type
+        self.camera_shakes_uid = camera_shakes_uid
+        self.props = props
+
+    def get(self, key, default=None):
+        return self.props.get(key, default)
+
+    def __getitem__(self, key):
+        return self.props[key]
+
+
+def blend_data(*objects):
+    collection = SimpleNamespace(objects=[obj for obj in objects if obj.type == 'EMPTY'])
+    return SimpleNamespace(objects=list(objects), collections={COLLECTION_NAME: collection})
+
+
+def shake_empty(name, camera_uid, shake_uid):
+    return Object(name, **{SHAKE_CAMERA_PROP: camera_uid, SHAKE_UID_PROP: shake_uid})
+
+
+def test_objects_are_indexed():
+    camera = Object("Camera", 'CAMERA', 3)
+    private = shake_empty("Private", 3, 1)
+    pooled = Object("Pooled", **{SHAKE_POOL_KEY_PROP: "key"})
+    index = ShakeRigIndex(lambda: blend_data(camera, private, pooled), COLLECTION_NAME)
+    assert index.camera(3) is camera
+    assert index.private_objects(3) == {1: private}
+    assert index.pooled_object("key") is pooled
+
+
+def test_duplicated_camera_gets_a_new_uid():
+    camera = Object("Camera", 'CAMERA', 1)
+    copy = Object("Camera.001", 'CAMERA', 1)
+    index = ShakeRigIndex(lambda: blend_data(camera, copy), COLLECTION_NAME)
+    assert index.ensure_camera_uid(camera) == 1
+    assert index.ensure_camera_uid(copy) == 2
+
+
+def test_new_camera_uid_is_unused_after_loading_a_file():
+    # The index still holds the cameras of the previous file when another
+    # is loaded, in which uid 1 is taken.
+    data = blend_data(Object("Old", 'CAMERA', 5))
+    index = ShakeRigIndex(lambda: data, COLLECTION_NAME)
+    index.ensure()
+    data = blend_data(Object("Camera", 'CAMERA', 1), shake_empty("Empty", 1, 1), Object("New", 'CAMERA'))
+    index.invalidate()
+    assert index.cameras == {} and index.private == {} and index.pooled == {}
+    assert index.ensure_camera_uid(data.objects[2]) == 2
+    assert index.private_objects(2) == {}
+
+
+def test_new_camera_uid_skips_orphaned_empties():
+    orphan = shake_empty("Orphan", 4, 1)
+    camera = Object("Camera", 'CAMERA')
+    index = ShakeRigIndex(lambda: blend_data(Object("Other", 'CAMERA', 1), orphan, camera), COLLECTION_NAME)
+    assert index.ensure_camera_uid(camera) == 5
+    assert index.private_objects(5) == {}
+    assert index.private_objects(4) == {1: orphan}
+
+
+def test_new_camera_uid_is_unused_in_a_fresh_session():
+    camera = Object("New", 'CAMERA')
+    index = ShakeRigIndex(lambda: blend_data(Object("Camera", 'CAMERA', 1), shake_empty("Empty", 1, 1), camera), COLLECTION_NAME)
+    assert index.ensure_camera_uid(camera) == 2
@@ -0,0 +1,111 @@
+# Tests of the shake store in shake_library.py.  Run from the addon
+# directory with:
+#
+#   python -m pytest
+
+import os
+import sys
+from array import array
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shake_library import MANIFEST_NAME, ShakeClip, ShakeLibraryError, ShakeStore, write_library
+
+
+def make_clip(shake_id, value=0.0, frame_count=4):
+    return ShakeClip(shake_id, shake_id.title(), 24.0, 1, {
+        ("location", 0): array("f", [value + i for i in range(frame_count)]),
+        ("rotation_euler", 2): array("f", [-value] * frame_count),
+    }, {"author": "Someone"})
+
+
+def samples(store, shake_id):
+    return {key: list(channel) for key, channel in store.clip(shake_id).channels.items()}
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    seed_path = str(tmp_path / "seed.shklib")
+    write_library(seed_path, [make_clip("A"), make_clip("B", 1.0)])
+    path = str(tmp_path / "store")
+    ShakeStore.create(path, seed_path).close()
+    return path
+
+
+def test_create_from_seed(store_path):
+    with ShakeStore(store_path) as store:
+        assert list(store.keys()) == ["A", "B"]
+        assert store.info("B").tags == {"author": "Someone"}
+        assert samples(store, "B")[("location", 0)] == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_add_remove_reopen(store_path):
+    with ShakeStore(store_path) as store:
+        store.add([make_clip("C", 2.0), make_clip("A", 5.0)])
+        store.remove(["B", "unknown"])
+        assert list(store.keys()) == ["A", "C"]
+    with ShakeStore(store_path) as store:
+        # A replaced shake keeps its place.
+        assert list(store.keys()) == ["A", "C"]
+        assert samples(store, "A")[("location", 0)] == [5.0, 6.0, 7.0, 8.0]
+        assert samples(store, "C")[("rotation_euler", 2)] == [-2.0] * 4
+
+
+def test_replaced_payloads_are_deleted(store_path):
+    with ShakeStore(store_path) as store:
+        store.add([make_clip("C")])
+        payload = store.payload_name("C")
+        store.add([make_clip("C", 1.0)])
+        assert store.payload_name("C") != payload
+        assert not os.path.exists(os.path.join(store_path, payload))
+
+
+def test_compact(store_path):
+    with ShakeStore(store_path) as store:
+        store.add([make_clip("C", 2.0)])
+        store.add([make_clip("D", 3.0)])
+        store.remove(["A"])
+        expected = {shake_id: samples(store, shake_id) for shake_id in store.keys()}
+        store.compact()
+        assert len(set(store.payload_name(shake_id) for shake_id in store.keys())) == 1
+    payloads = [name for name in os.listdir(store_path) if name.endswith(".shklib")]
+    assert len(payloads) == 1
+    with ShakeStore(store_path) as store:
+        assert list(store.keys()) == ["B", "C", "D"]
+        assert {shake_id: samples(store, shake_id) for shake_id in store.keys()} == expected
+
+
+def test_interrupted_add_keeps_the_previous_library(store_path, monkeypatch):
+    store = ShakeStore(store_path)
+
+    def fail():
+        raise OSError("Disk full")
+    monkeypatch.setattr(store, "_write_manifest", fail)
+    with pytest.raises(OSError):
+        store.add([make_clip("C")])
+    store.close()
+    with ShakeStore(store_path) as store:
+        assert list(store.keys()) == ["A", "B"]
+        assert samples(store, "A")[("location", 0)] == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_compact_deletes_leftovers(store_path):
+    leftovers = ["00000099.shklib", "00000005.shklib.1234.tmp", MANIFEST_NAME + ".1234.tmp"]
+    for name in leftovers + ["index.json", "notes.txt.tmp"]:
+        with open(os.path.join(store_path, name), "w") as f:
+            f.write("partial")
+    with ShakeStore(store_path) as store:
+        assert list(store.keys()) == ["A", "B"]
+        store.compact()
+    names = os.listdir(store_path)
+    assert not any(name in names for name in leftovers)
+    assert "index.json" in names and "notes.txt.tmp" in names
+
+
+def test_unreadable_manifest(store_path):
+    with open(os.path.join(store_path, MANIFEST_NAME), "w") as f:
+        f.write("{")
+    with pytest.raises(ShakeLibraryError, match="Can't read shake store"):
+        ShakeStore(store_path)